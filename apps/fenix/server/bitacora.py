@@ -29,21 +29,54 @@ la bitácora la puede leer cualquiera del mostrador.
 Cabe en el mismo Azure Files que ya está montado, se lee con `tail`, sobrevive
 al redeploy y no agrega una dependencia para escribir una línea por turno. Rota
 sola al pasar de `MAX_BYTES` para no llenar el disco del negocio; se conserva
-UNA generación anterior, que es lo que se necesita para investigar algo que
-pasó ayer.
+UNA generación anterior por defecto, que es lo que se necesita para investigar
+algo que pasó ayer (`generaciones=` conserva más).
+
+## Leer sin cargar el archivo
+
+La vista del mostrador pide una página — los últimos 200 turnos, o los de una
+IP, o los de anoche. Leerla con `readlines()` costaba el archivo entero por
+página, y lo rotado (`.jsonl.1`) no se podía ver. Ahora:
+
+- El lector camina el archivo **de atrás hacia adelante** en bloques de
+  `_BLOQUE_LECTURA`: una página cuesta lo que mide, no lo que mide el log.
+- Junto a cada segmento vive un índice chico (`bitacora.jsonl.idx`, una línea
+  por cada `BLOQUE_LINEAS` turnos: offsets, primer y último `cuando`, roles e
+  IPs del bloque — o una huella de ellas si son muchas). Con filtro por rol, IP o rango de tiempo el lector salta los
+  bloques que no pueden tener nada, y se detiene en cuanto pasa del `desde`.
+- Las páginas cruzan segmentos con un **cursor** `<segmento>:<offset>`. El
+  segmento se nombra por un hash de su primera línea, no por su número: una
+  rotación entre página y página no cambia a qué apunta el cursor.
+
+El escritor conserva el archivo abierto y cuenta los bytes que escribe (sin
+`stat()` ni `open()` por turno). Al abrir re-indexa lo que el índice no cubre —
+el bloque que quedó a medias si el proceso murió, o un log de antes del índice.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import threading
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import IO
 
 LIMITE_TEXTO = 300
 MAX_BYTES = 5 * 1024 * 1024
 
+# Turnos por entrada del índice: con ~200 bytes por turno, ~50 KB de log por
+# bloque — un bloque descartado es una lectura que no se hace.
+BLOQUE_LINEAS = 256
+# Hasta tantas IPs distintas un bloque las lista; con más (un ataque desde
+# muchas direcciones) guarda en su lugar una huella de `_BITS_HUELLA` bits —
+# un filtro de Bloom: "seguro no está" o "quizá está".
+_MAX_IPS_POR_BLOQUE = 64
+_BITS_HUELLA = 1024
+_BLOQUE_LECTURA = 64 * 1024
+
 
 def ruta_por_defecto() -> Path:
     declarada = os.getenv("FENIX_BITACORA_PATH")
@@ -52,18 +85,143 @@ def ruta_por_defecto() -> Path:
     return Path(os.getenv("FENIX_EXPEDIENTES_PATH") or Path.home() / ".fenix-data" / "x").parent / "bitacora.jsonl"
 
 
+def _ruta_indice(segmento: Path) -> Path:
+    return segmento.with_name(segmento.name + ".idx")
+
+
+def _bits_ip(ip: str) -> int:
+    h = int.from_bytes(hashlib.blake2b(ip.encode("utf-8"), digest_size=4).digest(), "big")
+    return (1 << (h % _BITS_HUELLA)) | (1 << ((h >> 12) % _BITS_HUELLA))
+
+
+def _parsear_bloques(crudo: bytes, previos: list[dict]) -> list[dict] | None:
+    """Los bloques de `crudo` (líneas completas del índice) a continuación de
+    `previos`. None si no encadenan: el índice no corresponde al archivo."""
+    bloques = list(previos)
+    for linea in crudo.splitlines():
+        try:
+            b = json.loads(linea)
+            b["o"], b["f"]  # noqa: B018 — la forma mínima
+        except (json.JSONDecodeError, KeyError, TypeError):
+            continue  # la cola a medio escribir
+        if bloques and b["o"] != bloques[-1]["f"]:
+            return None
+        if "ipf" in b:
+            b["ipf"] = int(b["ipf"], 16)
+        bloques.append(b)
+    return bloques
+
+
+def _leer_indice(ruta: Path, tamano: int) -> list[dict]:
+    """Los bloques del índice que caben en un segmento de `tamano` bytes.
+
+    Un índice que describe más de lo que el archivo tiene (el log se truncó o
+    se reemplazó a mano) no sirve: se ignora entero y el segmento se lee sin él.
+    """
+    try:
+        bloques = _parsear_bloques(ruta.read_bytes(), [])
+    except OSError:
+        return []
+    if not bloques or bloques[-1]["f"] > tamano:
+        return []
+    return bloques
+
+
+def _linea_indice(b: dict) -> str:
+    if "ipf" in b:
+        b = {**b, "ipf": format(b["ipf"], "x")}
+    return json.dumps(b, ensure_ascii=False) + "\n"
+
+
+def _lineas_al_reves(f: IO[bytes], inicio: int, fin: int) -> Iterator[tuple[int, bytes]]:
+    """(offset, línea) de `[inicio, fin)`, de la última a la primera."""
+    pos, resto = fin, b""
+    while pos > inicio:
+        paso = min(_BLOQUE_LECTURA, pos - inicio)
+        pos -= paso
+        f.seek(pos)
+        trozo = f.read(paso) + resto
+        partes = trozo.split(b"\n")
+        # partes[0] puede ser el final de una línea que empieza antes de `pos`.
+        resto = partes[0]
+        offset = pos + len(trozo)
+        for parte in reversed(partes[1:]):
+            offset -= len(parte) + 1
+            if parte:
+                yield offset + 1, parte
+    if resto:
+        yield inicio, resto
+
+
+class _Filtro:
+    def __init__(self, rol: str | None, ip: str | None, desde: str | None, hasta: str | None) -> None:
+        self.rol, self.ip, self.desde, self.hasta = rol, ip, desde, hasta
+        self._bits_ip = _bits_ip(ip) if ip is not None else 0
+
+    def descarta_bloque(self, b: dict) -> bool:
+        if self.rol is not None and self.rol not in b.get("roles", ()):
+            return True
+        if self.ip is not None:
+            if b.get("ips") is not None and self.ip not in b["ips"]:
+                return True
+            if "ipf" in b and b["ipf"] & self._bits_ip != self._bits_ip:
+                return True
+        return self.hasta is not None and (b.get("desde") or "") > self.hasta
+
+    def antes_del_rango(self, cuando: str) -> bool:
+        """Todo lo que sigue (hacia atrás) es más viejo: se puede parar."""
+        return self.desde is not None and cuando < self.desde
+
+    def acepta(self, t: dict) -> bool:
+        cuando = t.get("cuando") or ""
+        return (
+            (self.rol is None or t.get("rol") == self.rol)
+            and (self.ip is None or t.get("ip") == self.ip)
+            and (self.hasta is None or cuando <= self.hasta)
+            and (self.desde is None or cuando >= self.desde)
+        )
+
+
+def normalizar_cuando(valor: str) -> str:
+    """Una fecha ISO cualquiera → el formato de `cuando` (UTC, segundos), que
+    es el que se compara como texto. Sin zona se asume UTC."""
+    fecha = datetime.fromisoformat(valor)
+    if fecha.tzinfo is None:
+        fecha = fecha.replace(tzinfo=timezone.utc)
+    return fecha.astimezone(timezone.utc).isoformat(timespec="seconds")
+
+
 class Bitacora:
     """Append-only, con un candado porque el servidor corre en una sola réplica
     pero con varios hilos atendiendo."""
 
-    def __init__(self, path: str | os.PathLike | None = None) -> None:
+    def __init__(
+        self,
+        path: str | os.PathLike | None = None,
+        *,
+        max_bytes: int = MAX_BYTES,
+        generaciones: int = 1,
+    ) -> None:
         self._path = Path(path) if path else ruta_por_defecto()
         self._candado = threading.Lock()
+        self.max_bytes = max_bytes
+        self.generaciones = max(0, generaciones)
+        self._f: IO[bytes] | None = None
+        self._idx: IO[str] | None = None
+        self._bytes = 0
+        self._bloque: dict | None = None
+        # segmento → ((dev, inode) del índice, bytes leídos, bloques): ver `_indice`.
+        self._indices: dict[Path, tuple[tuple[int, int], int, list[dict]]] = {}
 
     @property
     def path(self) -> Path:
         return self._path
 
+    def _segmento(self, generacion: int) -> Path:
+        return self._path if generacion == 0 else self._path.with_name(f"{self._path.name}.{generacion}")
+
+    # -- escritura ------------------------------------------------------------
+
     def anotar(
         self,
         *,
@@ -94,37 +252,240 @@ class Bitacora:
             linea.update(extra)
         try:
             with self._candado:
-                self._rotar_si_toca()
-                self._path.parent.mkdir(parents=True, exist_ok=True)
-                with self._path.open("a", encoding="utf-8") as f:
-                    f.write(json.dumps(linea, ensure_ascii=False) + "\n")
+                if self._f is None:
+                    self._abrir()
+                elif self._bytes >= self.max_bytes:
+                    self._rotar()
+                crudo = (json.dumps(linea, ensure_ascii=False) + "\n").encode("utf-8")
+                self._f.write(crudo)
+                self._f.flush()
+                self._sumar(self._bytes, len(crudo), linea)
+                self._bytes += len(crudo)
         except Exception:  # noqa: BLE001 — ver el docstring
-            pass
+            # El handle puede haber quedado inservible (el volumen se remontó):
+            # el siguiente turno lo vuelve a abrir.
+            self._cerrar()
 
-    def _rotar_si_toca(self) -> None:
-        try:
-            if self._path.exists() and self._path.stat().st_size >= MAX_BYTES:
-                self._path.replace(self._path.with_suffix(".jsonl.1"))
-        except OSError:
-            pass
+    def _abrir(self) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = open(self._path, "ab")  # noqa: SIM115 — vive lo que vive la bitácora
+        self._bytes = self._f.tell()
+        ruta_idx = _ruta_indice(self._path)
+        bloques = _leer_indice(ruta_idx, self._bytes)
+        cubierto = bloques[-1]["f"] if bloques else 0
+        # Reescrito desde lo que se pudo leer: sin cola a medias a la que el
+        # siguiente bloque quedaría pegado.
+        ruta_idx.write_text("".join(_linea_indice(b) for b in bloques), "utf-8")
+        self._idx = open(ruta_idx, "a", encoding="utf-8")  # noqa: SIM115
+        self._bloque = None
+        # Lo que el índice no cubre: el bloque abierto de un proceso anterior,
+        # o un log de antes del índice.
+        with open(self._path, "rb") as r:
+            r.seek(cubierto)
+            offset = cubierto
+            for cruda in r:
+                cortada = not cruda.endswith(b"\n")
+                if cortada:
+                    # Una línea cortada a medias: se cierra para que la
+                    # siguiente no quede pegada a ella.
+                    self._f.write(b"\n")
+                    self._f.flush()
+                    self._bytes += 1
+                    cruda += b"\n"
+                try:
+                    t = json.loads(cruda)
+                except json.JSONDecodeError:
+                    t = {}
+                self._sumar(offset, len(cruda), t if isinstance(t, dict) else {})
+                offset += len(cruda)
+                if cortada:
+                    break  # lo que siga en `r` es el "\n" que se acaba de escribir
 
-    def leer(self, limite: int = 200) -> list[dict]:
-        """Los últimos `limite` turnos, del más reciente al más viejo."""
-        try:
-            with self._path.open(encoding="utf-8") as f:
-                lineas = f.readlines()[-limite:]
-        except FileNotFoundError:
-            return []
-        except OSError:
-            return []
+    def _sumar(self, offset: int, largo: int, t: dict) -> None:
+        """Agrega un turno al bloque abierto; lo escribe al índice al llenarse."""
+        b = self._bloque
+        if b is None:
+            b = self._bloque = {"o": offset, "f": offset, "n": 0, "desde": None, "hasta": None, "roles": [], "ips": []}
+        cuando = t.get("cuando")
+        b["f"] = offset + largo
+        b["n"] += 1
+        if cuando:
+            b["desde"] = b["desde"] or cuando
+            b["hasta"] = cuando
+        if t.get("rol") and t["rol"] not in b["roles"]:
+            b["roles"].append(t["rol"])
+        ip = t.get("ip")
+        if ip and b["ips"] is None:
+            b["ipf"] |= _bits_ip(ip)
+        elif ip and ip not in b["ips"]:
+            b["ips"].append(ip)
+            if len(b["ips"]) > _MAX_IPS_POR_BLOQUE:
+                b["ipf"] = 0
+                for vista in b["ips"]:
+                    b["ipf"] |= _bits_ip(vista)
+                b["ips"] = None
+        if b["n"] >= BLOQUE_LINEAS:
+            self._cerrar_bloque()
+
+    def _cerrar_bloque(self) -> None:
+        if self._bloque is not None and self._idx is not None:
+            self._idx.write(_linea_indice(self._bloque))
+            self._idx.flush()
+        self._bloque = None
+
+    def _cerrar(self) -> None:
+        for f in (self._f, self._idx):
+            try:
+                if f is not None:
+                    f.close()
+            except OSError:
+                pass
+        self._f = self._idx = None
+        self._bloque = None
+
+    def _rotar(self) -> None:
+        """La activa pasa a `.1`, `.1` a `.2`… y lo que pasa de `generaciones` se borra."""
+        self._cerrar_bloque()
+        self._cerrar()
+        for g in range(self.generaciones, 0, -1):
+            for viejo, nuevo in (
+                (self._segmento(g - 1), self._segmento(g)),
+                (_ruta_indice(self._segmento(g - 1)), _ruta_indice(self._segmento(g))),
+            ):
+                try:
+                    viejo.replace(nuevo)
+                except FileNotFoundError:
+                    pass
+        if self.generaciones == 0:
+            for ruta in (self._path, _ruta_indice(self._path)):
+                ruta.unlink(missing_ok=True)
+        self._abrir()
+
+    # -- lectura --------------------------------------------------------------
+
+    def _segmentos(self) -> list[tuple[Path, str]]:
+        """(ruta, id) del más nuevo al más viejo. El id es el hash de la primera
+        línea — estable aunque el segmento cambie de número al rotar."""
         salida = []
-        for cruda in reversed(lineas):
+        for g in range(self.generaciones + 1):
+            ruta = self._segmento(g)
             try:
-                salida.append(json.loads(cruda))
-            except json.JSONDecodeError:
+                with open(ruta, "rb") as f:
+                    primera = f.readline()
+            except OSError:
                 continue
+            if primera:
+                salida.append((ruta, hashlib.sha1(primera).hexdigest()[:12]))
         return salida
 
+    def _indice(self, segmento: Path, tamano: int) -> list[dict]:
+        """`_leer_indice`, pero leyendo sólo lo que el índice creció desde la
+        última página: en un log de 1 GB el índice ya pesa megas."""
+        ruta = _ruta_indice(segmento)
+        try:
+            st = ruta.stat()
+            clave = (st.st_dev, st.st_ino)
+            previa = self._indices.get(segmento)
+            if previa is None or previa[0] != clave or previa[1] > st.st_size:
+                previa = (clave, 0, [])  # otro archivo (rotó) o se reescribió
+            _, leido, bloques = previa
+            if leido < st.st_size:
+                with open(ruta, "rb") as f:
+                    f.seek(leido)
+                    crudo = f.read(st.st_size - leido)
+                completo = crudo.rfind(b"\n") + 1
+                nuevos = _parsear_bloques(crudo[:completo], bloques)
+                if nuevos is None:
+                    self._indices.pop(segmento, None)
+                    return []
+                bloques, leido = nuevos, leido + completo
+                self._indices[segmento] = (clave, leido, bloques)
+        except OSError:
+            return []
+        if bloques and bloques[-1]["f"] > tamano:
+            return []
+        return bloques
+
+    def _al_reves(self, ruta: Path, antes: int | None, filtro: _Filtro) -> Iterator[tuple[int, dict | None]]:
+        """(offset, turno) de un segmento, del más nuevo al más viejo, antes del
+        offset `antes`. `turno` None = el rango de tiempo ya quedó atrás: parar."""
+        try:
+            f = open(ruta, "rb")  # noqa: SIM115 — se cierra en el finally
+        except OSError:
+            return
+        try:
+            tamano = os.fstat(f.fileno()).st_size
+            fin = tamano if antes is None else min(antes, tamano)
+            bloques = self._indice(ruta, tamano)
+            cubierto = bloques[-1]["f"] if bloques else 0
+            tramos: list[tuple[int, int]] = []
+            if fin > cubierto:
+                tramos.append((cubierto, fin))
+            for b in reversed(bloques):
+                if b["o"] >= fin:
+                    continue
+                if filtro.desde is not None and b.get("hasta") and b["hasta"] < filtro.desde:
+                    break
+                if not filtro.descarta_bloque(b):
+                    tramos.append((b["o"], min(b["f"], fin)))
+            for inicio, final in tramos:
+                for offset, cruda in _lineas_al_reves(f, inicio, final):
+                    try:
+                        t = json.loads(cruda)
+                    except json.JSONDecodeError:
+                        continue
+                    if not isinstance(t, dict):
+                        continue
+                    if filtro.antes_del_rango(t.get("cuando") or ""):
+                        yield offset, None
+                        return
+                    if filtro.acepta(t):
+                        yield offset, t
+        finally:
+            f.close()
+
+    def paginar(
+        self,
+        *,
+        limite: int = 200,
+        cursor: str | None = None,
+        rol: str | None = None,
+        ip: str | None = None,
+        desde: str | None = None,
+        hasta: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """Una página de turnos, del más reciente al más viejo, y el cursor de la
+        siguiente (None si no hay más). `desde`/`hasta` en el formato de `cuando`
+        (ver `normalizar_cuando`); ambos inclusivos.
+
+        Un cursor mal formado es ValueError. Uno que apunta a un segmento que ya
+        se descartó al rotar da una página vacía: lo que había ahí ya no existe.
+        """
+        filtro = _Filtro(rol, ip, desde, hasta)
+        segmentos = self._segmentos()
+        inicio, antes = 0, None
+        if cursor:
+            seg_id, _, offset = cursor.partition(":")
+            antes = int(offset)
+            ids = [i for _, i in segmentos]
+            if seg_id not in ids:
+                return [], None
+            inicio = ids.index(seg_id)
+        salida: list[dict] = []
+        for ruta, seg_id in segmentos[inicio:]:
+            for offset, t in self._al_reves(ruta, antes, filtro):
+                if t is None:
+                    return salida, None
+                salida.append(t)
+                if len(salida) >= limite:
+                    return salida, f"{seg_id}:{offset}"
+            antes = None
+        return salida, None
+
+    def leer(self, limite: int = 200) -> list[dict]:
+        """Los últimos `limite` turnos, del más reciente al más viejo."""
+        return self.paginar(limite=limite)[0]
+
     def resumen(self, limite: int = 2000) -> dict:
         """Lo que se mira primero: cuánto se usó y desde cuántos lugares.
 
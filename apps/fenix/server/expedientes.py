@@ -10,6 +10,17 @@ se mutila para salvar otro no es un expediente.
 Aquí el expediente tiene campos propios y el título del chat se DERIVA de él.
 Sigue el molde de `og118/server/projects.py`: JSON en disco, un solo escritor,
 escritura atómica (temp + os.replace) bajo lock, y todo scoped por dueño.
+
+Ese molde tiene un techo: cada `listar`/`obtener` relee y parsea el archivo
+entero, y cada `guardar` lo relee, busca la conversación recorriéndolo y lo
+reescribe completo, todo bajo un lock global — O(expedientes) por operación y
+en serie. Además el lock es de proceso, y el MCP de expedientes corre en OTRO
+proceso que escribe el mismo archivo. `SQLiteExpedienteStore` es el segundo
+motor, con la misma interfaz: un renglón por expediente, índices por
+(dueño, actualizado) y (dueño, conversación), y WAL — los lectores no esperan
+al escritor y el bloqueo entre procesos lo pone SQLite. `abrir_store` elige el
+motor por la extensión de la ruta (`.db`/`.sqlite`/`.sqlite3` → SQLite), y
+`SQLiteExpedienteStore.importar_json` migra el JSON de una vez.
 """
 
 from __future__ import annotations
@@ -18,8 +29,11 @@ import datetime as _dt
 import json
 import os
 import re
+import sqlite3
 import threading
 import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
@@ -58,6 +72,78 @@ def _ahora() -> str:
     return _dt.datetime.now(_dt.timezone.utc).isoformat()
 
 
+def _construir(owner: str, eid: str, datos: dict[str, Any], anterior: dict | None) -> dict:
+    """El registro que se guarda: validación y campos derivados, sin I/O.
+
+    Compartido por los dos motores para que un expediente sea idéntico venga
+    del JSON o de SQLite.
+    """
+    estado = str(datos.get("estado") or "nueva")
+    if estado not in ESTADOS:
+        estado = "nueva"
+
+    # `bloqueada` es una CONSECUENCIA de que falten datos, no una etiqueta
+    # que alguien mantiene a mano. Si se deja manual, el tablero miente en
+    # cuanto alguien completa el expediente y no se acuerda de cambiar el
+    # estado — y el filtro "Falta info" es justo el que se usa para saber
+    # qué cotización está detenida.
+    completo = bool(str(datos.get("alumno") or "").strip()) and bool(
+        str(datos.get("whatsapp") or "").strip()
+    )
+    if not completo and estado in ("nueva", "cotizando"):
+        estado = "bloqueada"
+    elif completo and estado == "bloqueada":
+        estado = "cotizando"
+
+    # Un desglose que no llega al total que se le dio al cliente es una
+    # trampa: el Excel saldría con una cifra menor y parecería correcto.
+    # Se marca para que la UI lo advierta en vez de dejar mandar el
+    # archivo a ciegas.
+    declarado = datos.get("totalDeclarado")
+    items_norm = _renglones(datos.get("items"))
+    forrado_norm = _renglones(datos.get("forrado"))
+    suma = sum(r["cantidad"] * r["precio"] for r in [*items_norm, *forrado_norm])
+    try:
+        descuento = float(datos.get("descuento"))
+    except (TypeError, ValueError):
+        descuento = 0.15
+    calculado = round(suma * (1 - descuento), 2)
+    incompleto = False
+    if declarado:
+        try:
+            incompleto = abs(float(declarado) - calculado) > 1.0
+        except (TypeError, ValueError):
+            incompleto = False
+
+    return {
+        "id": eid,
+        "ownerId": owner,
+        "conversacionId": (datos.get("conversacionId") or None),
+        "alumno": (datos.get("alumno") or "").strip(),
+        "escuela": (datos.get("escuela") or "").strip(),
+        "grado": (datos.get("grado") or "").strip(),
+        "tutor": (datos.get("tutor") or "").strip(),
+        "whatsapp": (datos.get("whatsapp") or "").strip(),
+        "folio": (datos.get("folio") or "").strip(),
+        "estado": estado,
+        "total": datos.get("total"),
+        "descuento": descuento,
+        # Los renglones de la cotización. Viven aquí y no sólo en el
+        # hilo porque el Excel se genera del expediente: si el dato
+        # está únicamente en la conversación, el entregable depende de
+        # volver a pedírselo al modelo cada vez.
+        "items": items_norm,
+        "forrado": forrado_norm,
+        "opcionales": _renglones(datos.get("opcionales")),
+        "fuera": [str(x).strip() for x in (datos.get("fuera") or []) if str(x).strip()],
+        "notas": (datos.get("notas") or "").strip(),
+        "totalDeclarado": declarado,
+        "desgloseIncompleto": incompleto,
+        "creado": (anterior or {}).get("creado") or _ahora(),
+        "actualizado": _ahora(),
+    }
+
+
 class ExpedienteStore:
     def __init__(self, path: str | os.PathLike) -> None:
         self._path = Path(path)
@@ -125,70 +211,7 @@ class ExpedienteStore:
             if anterior and anterior.get("ownerId") != owner:
                 raise PermissionError("expediente ajeno")
 
-            estado = str(datos.get("estado") or "nueva")
-            if estado not in ESTADOS:
-                estado = "nueva"
-
-            # `bloqueada` es una CONSECUENCIA de que falten datos, no una etiqueta
-            # que alguien mantiene a mano. Si se deja manual, el tablero miente en
-            # cuanto alguien completa el expediente y no se acuerda de cambiar el
-            # estado — y el filtro "Falta info" es justo el que se usa para saber
-            # qué cotización está detenida.
-            completo = bool(str(datos.get("alumno") or "").strip()) and bool(
-                str(datos.get("whatsapp") or "").strip()
-            )
-            if not completo and estado in ("nueva", "cotizando"):
-                estado = "bloqueada"
-            elif completo and estado == "bloqueada":
-                estado = "cotizando"
-
-            # Un desglose que no llega al total que se le dio al cliente es una
-            # trampa: el Excel saldría con una cifra menor y parecería correcto.
-            # Se marca para que la UI lo advierta en vez de dejar mandar el
-            # archivo a ciegas.
-            declarado = datos.get("totalDeclarado")
-            items_norm = _renglones(datos.get("items"))
-            forrado_norm = _renglones(datos.get("forrado"))
-            suma = sum(r["cantidad"] * r["precio"] for r in [*items_norm, *forrado_norm])
-            try:
-                descuento = float(datos.get("descuento"))
-            except (TypeError, ValueError):
-                descuento = 0.15
-            calculado = round(suma * (1 - descuento), 2)
-            incompleto = False
-            if declarado:
-                try:
-                    incompleto = abs(float(declarado) - calculado) > 1.0
-                except (TypeError, ValueError):
-                    incompleto = False
-
-            expediente = {
-                "id": eid,
-                "ownerId": owner,
-                "conversacionId": (datos.get("conversacionId") or None),
-                "alumno": (datos.get("alumno") or "").strip(),
-                "escuela": (datos.get("escuela") or "").strip(),
-                "grado": (datos.get("grado") or "").strip(),
-                "tutor": (datos.get("tutor") or "").strip(),
-                "whatsapp": (datos.get("whatsapp") or "").strip(),
-                "folio": (datos.get("folio") or "").strip(),
-                "estado": estado,
-                "total": datos.get("total"),
-                "descuento": descuento,
-                # Los renglones de la cotización. Viven aquí y no sólo en el
-                # hilo porque el Excel se genera del expediente: si el dato
-                # está únicamente en la conversación, el entregable depende de
-                # volver a pedírselo al modelo cada vez.
-                "items": items_norm,
-                "forrado": forrado_norm,
-                "opcionales": _renglones(datos.get("opcionales")),
-                "fuera": [str(x).strip() for x in (datos.get("fuera") or []) if str(x).strip()],
-                "notas": (datos.get("notas") or "").strip(),
-                "totalDeclarado": declarado,
-                "desgloseIncompleto": incompleto,
-                "creado": (anterior or {}).get("creado") or _ahora(),
-                "actualizado": _ahora(),
-            }
+            expediente = _construir(owner, eid, datos, anterior)
             data[eid] = expediente
             self._save(data)
         return expediente
@@ -200,3 +223,149 @@ class ExpedienteStore:
             if e and e.get("ownerId") == owner:
                 del data[expediente_id]
                 self._save(data)
+
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS expedientes (
+    id TEXT PRIMARY KEY,
+    owner_id TEXT NOT NULL,
+    conversacion_id TEXT,
+    actualizado TEXT NOT NULL DEFAULT '',
+    datos TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS expedientes_owner_actualizado
+    ON expedientes (owner_id, actualizado DESC);
+CREATE INDEX IF NOT EXISTS expedientes_owner_conversacion
+    ON expedientes (owner_id, conversacion_id);
+"""
+
+
+class SQLiteExpedienteStore:
+    """El mismo contrato que `ExpedienteStore`, sobre SQLite en modo WAL.
+
+    El expediente completo viaja como JSON en `datos` (la forma la sigue
+    decidiendo `_construir`, no el esquema); las columnas sueltas existen sólo
+    para los índices. Como en el JSON, `_completo` se aplica al LEER en
+    `listar`: un renglón importado de los 33 viejos sigue sin `items` en disco
+    y sale con la forma completa.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._db().executescript(_ESQUEMA)
+
+    def _db(self) -> sqlite3.Connection:
+        """Una conexión por hilo (sqlite3 no las comparte entre hilos)."""
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self._path, timeout=10.0, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            # Con WAL, NORMAL sólo arriesga la última transacción ante un corte
+            # de luz, nunca la integridad del archivo.
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    @contextmanager
+    def _tx(self) -> Iterator[sqlite3.Connection]:
+        """Transacción de escritura. IMMEDIATE toma el candado ANTES de leer:
+        la búsqueda por conversación y la escritura no pueden intercalarse con
+        otro escritor (p. ej. el proceso del MCP)."""
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def listar(self, owner: str) -> list[dict]:
+        filas = self._db().execute(
+            "SELECT datos FROM expedientes WHERE owner_id = ? ORDER BY actualizado DESC",
+            (owner,),
+        )
+        return [ExpedienteStore._completo(json.loads(d)) for (d,) in filas]
+
+    def obtener(self, owner: str, expediente_id: str) -> dict | None:
+        fila = self._db().execute(
+            "SELECT datos FROM expedientes WHERE id = ? AND owner_id = ?",
+            (expediente_id, owner),
+        ).fetchone()
+        return json.loads(fila[0]) if fila else None
+
+    def guardar(self, owner: str, datos: dict[str, Any]) -> dict:
+        """Alta o actualización — mismas reglas que `ExpedienteStore.guardar`."""
+        with self._tx() as db:
+            eid = str(datos.get("id") or "").strip()
+            if not eid or not id_valido(eid):
+                conv = str(datos.get("conversacionId") or "").strip()
+                previo = (
+                    db.execute(
+                        "SELECT id FROM expedientes WHERE owner_id = ? AND conversacion_id = ?"
+                        " ORDER BY rowid LIMIT 1",
+                        (owner, conv),
+                    ).fetchone()
+                    if conv
+                    else None
+                )
+                eid = previo[0] if previo else f"exp-{uuid.uuid4()}"
+
+            fila = db.execute(
+                "SELECT owner_id, datos FROM expedientes WHERE id = ?", (eid,)
+            ).fetchone()
+            if fila and fila[0] != owner:
+                raise PermissionError("expediente ajeno")
+            anterior = json.loads(fila[1]) if fila else None
+
+            expediente = _construir(owner, eid, datos, anterior)
+            self._escribir(db, expediente)
+        return expediente
+
+    @staticmethod
+    def _escribir(db: sqlite3.Connection, e: dict) -> None:
+        db.execute(
+            "INSERT INTO expedientes (id, owner_id, conversacion_id, actualizado, datos)"
+            " VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT (id) DO UPDATE SET owner_id = excluded.owner_id,"
+            " conversacion_id = excluded.conversacion_id,"
+            " actualizado = excluded.actualizado, datos = excluded.datos",
+            (
+                e["id"],
+                e.get("ownerId") or "",
+                e.get("conversacionId") or None,
+                e.get("actualizado") or "",
+                json.dumps(e, ensure_ascii=False),
+            ),
+        )
+
+    def borrar(self, owner: str, expediente_id: str) -> None:
+        with self._tx() as db:
+            db.execute(
+                "DELETE FROM expedientes WHERE id = ? AND owner_id = ?", (expediente_id, owner)
+            )
+
+    def importar_json(self, ruta_json: str | os.PathLike) -> int:
+        """Copia un `expedientes.json` tal cual (una sola transacción).
+
+        Re-ejecutable: un id que ya existe se sobrescribe con la versión del
+        JSON. Los registros NO se completan al importar — igual que en el JSON,
+        el relleno de `_completo` ocurre al leer. Devuelve cuántos importó.
+        """
+        data = json.loads(Path(ruta_json).read_text("utf-8"))
+        with self._tx() as db:
+            for eid, e in data.items():
+                self._escribir(db, {**e, "id": e.get("id") or eid})
+        return len(data)
+
+
+_EXTENSIONES_SQLITE = (".db", ".sqlite", ".sqlite3")
+
+
+def abrir_store(path: str | os.PathLike) -> ExpedienteStore | SQLiteExpedienteStore:
+    """El motor según la ruta: `.db`/`.sqlite`/`.sqlite3` → SQLite; lo demás, JSON."""
+    if Path(path).suffix.lower() in _EXTENSIONES_SQLITE:
+        return SQLiteExpedienteStore(path)
+    return ExpedienteStore(path)
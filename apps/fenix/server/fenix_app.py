@@ -67,10 +67,10 @@ from app import (  # noqa: E402  (el runtime de og118)
 from fi_runner import load_prompt  # noqa: E402
 from runner import build_runner  # noqa: E402
 
-from expedientes import ESTADOS, ExpedienteStore, id_valido  # noqa: E402
+from expedientes import ESTADOS, ExpedienteStore, SQLiteExpedienteStore, abrir_store, id_valido  # noqa: E402
 from presupuesto import Presupuesto, Renglon, a_vista, generar, nombre_archivo  # noqa: E402
 from cuota import CuotaAgotada, clave_de, cuota_publica  # noqa: E402
-from bitacora import Bitacora  # noqa: E402
+from bitacora import Bitacora, normalizar_cuando  # noqa: E402
 from regularizacion import Cuadernillo, Ejemplo, Ejercicio, Paso  # noqa: E402
 from regularizacion import generar as generar_pdf  # noqa: E402
 from regularizacion import nombre_archivo as nombre_pdf  # noqa: E402
@@ -81,17 +81,18 @@ from rbac import acceso_valido, correo_conocido, es_admin, hay_contrasena, modo_
 # con la suscripción personal. Revientan aquí, donde se ven.
 exigir_config()
 
-_store: ExpedienteStore | None = None
+_store: ExpedienteStore | SQLiteExpedienteStore | None = None
 
 
-def get_store() -> ExpedienteStore:
+def get_store() -> ExpedienteStore | SQLiteExpedienteStore:
     global _store
     if _store is None:
         ruta = os.getenv("FENIX_EXPEDIENTES_PATH") or str(
             Path(os.getenv("OG118_PROJECT_REGISTRY_PATH", "expedientes.json")).parent
             / "expedientes.json"
         )
-        _store = ExpedienteStore(ruta)
+        # `.db` en la ruta enciende el motor SQLite (ver expedientes.py).
+        _store = abrir_store(ruta)
     return _store
 
 
@@ -226,16 +227,36 @@ async def regularizacion_pdf(req: CuadernilloRequest) -> Response:
 @router.get("/bitacora")
 async def bitacora(
     limite: int = 200,
+    cursor: str | None = None,
+    rol: str | None = None,
+    ip: str | None = None,
+    desde: str | None = None,
+    hasta: str | None = None,
     _: None = Depends(solo_admin),
 ) -> dict:
     """Qué se ha preguntado en el cibercafé. Sólo desde el mostrador.
 
     El resumen va primero a propósito: lo que se mira al abrir esto no es la
     lista de preguntas, es si hay una IP desconocida acumulando turnos.
+
+    `siguiente` es el cursor de la página que sigue (más vieja), también a
+    través de lo ya rotado; `rol`, `ip`, `desde` y `hasta` (ISO) filtran.
     """
+    try:
+        turnos, siguiente = _BITACORA.paginar(
+            limite=max(1, min(limite, 2000)),
+            cursor=cursor,
+            rol=rol,
+            ip=ip,
+            desde=normalizar_cuando(desde) if desde else None,
+            hasta=normalizar_cuando(hasta) if hasta else None,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=f"parámetro inválido: {exc}") from exc
     return {
         "resumen": _BITACORA.resumen(),
-        "turnos": _BITACORA.leer(limite),
+        "turnos": turnos,
+        "siguiente": siguiente,
         "archivo": str(_BITACORA.path),
     }
 
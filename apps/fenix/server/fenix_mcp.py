@@ -25,7 +25,7 @@ from typing import Annotated, Any
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 
-from expedientes import ExpedienteStore
+from expedientes import ExpedienteStore, SQLiteExpedienteStore, abrir_store
 
 MCP_SERVER_NAME = "fenix-expedientes"
 MCP_TOOLS = ("guardar_cotizacion",)
@@ -33,9 +33,9 @@ MCP_TOOLS = ("guardar_cotizacion",)
 mcp = FastMCP(MCP_SERVER_NAME)
 
 
-def _store() -> ExpedienteStore:
+def _store() -> ExpedienteStore | SQLiteExpedienteStore:
     ruta = os.getenv("FENIX_EXPEDIENTES_PATH") or str(Path.home() / ".fenix-data" / "expedientes.json")
-    return ExpedienteStore(ruta)
+    return abrir_store(ruta)
 
 
 @mcp.tool()
@@ -0,0 +1,140 @@
+"""Benchmark: leer la bitácora de 1 GB, `readlines()` de antes vs lectura al revés + índice.
+
+Genera un log sintético del tamaño pedido (por defecto 1 GB, ~5 millones de
+turnos, una semana de `cuando`, unas cien IPs y una sola IP rara), lo indexa
+abriéndolo con `Bitacora` (lo mismo que pasa la primera vez que el servidor
+arranca sobre un log de antes del índice) y mide la latencia de:
+
+- la primera página (200 turnos), como la pide el mostrador;
+- una página profunda (la 51, con el cursor que dejó la 50);
+- la IP rara (filtro que el índice resuelve saltando bloques);
+- una hora de hace tres días (rango de tiempo).
+
+La columna "antes" es la lectura de siempre: `readlines()` del archivo entero y
+filtrar en memoria. Con `--mb 1024` pide ~1 GB de disco y, para la columna
+"antes", otro tanto de RAM.
+
+USO
+    python3 scripts/bench_bitacora.py
+    python3 scripts/bench_bitacora.py --mb 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bitacora import Bitacora  # noqa: E402
+
+_INICIO = datetime(2026, 8, 1, tzinfo=timezone.utc)
+_IP_RARA = "203.0.113.66"
+
+
+def _generar(ruta: Path, mb: int) -> int:
+    rng = random.Random(7)
+    objetivo = mb * 1024 * 1024
+    ips = [f"192.168.1.{i}" for i in range(100)]
+    textos = [
+        "¿cuánto es 7 por 8?",
+        "explícame la fotosíntesis para un niño de tercero",
+        "¿quién fue Benito Juárez?",
+        "ayúdame con la tarea de fracciones: 3/4 + 1/8",
+    ]
+    escritos = n = 0
+    with open(ruta, "w", encoding="utf-8") as f:
+        while escritos < objetivo:
+            paso = 7 * 24 * 3600 * escritos / objetivo
+            linea = {
+                "cuando": (_INICIO + timedelta(seconds=int(paso))).isoformat(timespec="seconds"),
+                "ip": _IP_RARA if n == 1234 else rng.choice(ips),
+                "rol": "admin" if rng.random() < 0.02 else "publico",
+                "cortado": False,
+                "texto": rng.choice(textos),
+            }
+            crudo = json.dumps(linea, ensure_ascii=False) + "\n"
+            f.write(crudo)
+            escritos += len(crudo.encode("utf-8"))
+            n += 1
+    return n
+
+
+def _antes(ruta: Path, limite: int, *, ip=None, desde=None, hasta=None, saltar=0) -> list[dict]:
+    with open(ruta, encoding="utf-8") as f:
+        lineas = f.readlines()
+    salida = []
+    for cruda in reversed(lineas):
+        t = json.loads(cruda)
+        if ip and t["ip"] != ip or desde and t["cuando"] < desde or hasta and t["cuando"] > hasta:
+            continue
+        if saltar:
+            saltar -= 1
+            continue
+        salida.append(t)
+        if len(salida) >= limite:
+            break
+    return salida
+
+
+def _mide(fn) -> tuple[float, object]:
+    t0 = time.perf_counter()
+    r = fn()
+    return (time.perf_counter() - t0) * 1000, r
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--mb", type=int, default=1024)
+    ap.add_argument("--sin-antes", action="store_true", help="no medir readlines() (ahorra RAM)")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = Path(tmp) / "bitacora.jsonl"
+        ms, n = _mide(lambda: _generar(ruta, args.mb))
+        print(f"log: {ruta.stat().st_size / 1e6:.0f} MB, {n} turnos (generado en {ms / 1000:.1f} s)")
+        b = Bitacora(ruta, max_bytes=2 * args.mb * 1024 * 1024)
+        ms, _ = _mide(lambda: b.anotar(ip="127.0.0.1", rol="admin", texto="primer turno con índice"))
+        print(f"indexar al abrir: {ms / 1000:.1f} s (una vez); índice {(Path(tmp) / 'bitacora.jsonl.idx').stat().st_size / 1e3:.0f} KB")
+        ms, _ = _mide(lambda: [b.anotar(ip="127.0.0.1", rol="publico", texto="x") for _ in range(1000)])
+        print(f"anotar: {ms:.2f} µs/turno\n")
+
+        ms, _ = _mide(lambda: Bitacora(ruta).leer(200))
+        print(f"primera página en frío (proceso nuevo, lee el índice entero): {ms:.1f} ms")
+
+        hace_3 = _INICIO + timedelta(days=4)
+        hora = (hace_3.isoformat(timespec="seconds"), (hace_3 + timedelta(hours=1)).isoformat(timespec="seconds"))
+
+        cursor = None
+        for _ in range(50):
+            _, cursor = b.paginar(limite=200, cursor=cursor)
+
+        def profunda():
+            return b.paginar(limite=200, cursor=cursor)[0]
+
+        casos = [
+            ("primera página", lambda: b.leer(200), lambda: _antes(ruta, 200)),
+            ("página 51 (cursor)", profunda, lambda: _antes(ruta, 200, saltar=50 * 200)),
+            ("IP rara", lambda: b.paginar(ip=_IP_RARA)[0], lambda: _antes(ruta, 200, ip=_IP_RARA)),
+            (
+                "una hora, hace 3 días",
+                lambda: b.paginar(limite=5000, desde=hora[0], hasta=hora[1])[0],
+                lambda: _antes(ruta, 5000, desde=hora[0], hasta=hora[1]),
+            ),
+        ]
+        print(f"{'consulta':24s} {'antes ms':>10s} {'ahora ms':>10s} {'turnos':>7s}")
+        for nombre, ahora, antes in casos:
+            ms_ahora, r = _mide(ahora)
+            ms_antes = _mide(antes)[0] if not args.sin_antes else float("nan")
+            print(f"{nombre:24s} {ms_antes:>10.0f} {ms_ahora:>10.1f} {len(r):>7d}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,126 @@
+"""Benchmark: guardar/listar concurrentes, motor JSON vs SQLite (WAL).
+
+Siembra N expedientes (por defecto 50 000) repartidos en D dueños y luego corre
+T hilos a la vez: cada uno alterna `guardar` (la mitad actualizaciones por
+`conversacionId`, la mitad altas) con `listar` de su dueño — el patrón del
+mostrador con varias PC abiertas más el MCP guardando cotizaciones. Reporta
+operaciones por segundo y p50/p95 por operación.
+
+El JSON reescribe el archivo entero en cada `guardar`; con 50k su corrida usa
+pocas operaciones (`--ops-json`) o tardaría minutos.
+
+USO
+    python3 scripts/bench_expedientes.py
+    python3 scripts/bench_expedientes.py --expedientes 5000 --hilos 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from expedientes import ExpedienteStore, SQLiteExpedienteStore  # noqa: E402
+
+_AHORA = "2026-08-01T00:00:00+00:00"
+
+
+def _semilla(n: int, duenos: int) -> dict[str, dict]:
+    data = {}
+    for i in range(n):
+        eid = f"exp-{uuid.UUID(int=i)}"
+        data[eid] = {
+            "id": eid,
+            "ownerId": f"dueno-{i % duenos}",
+            "conversacionId": f"conv-{i}",
+            "alumno": f"Alumno {i}",
+            "escuela": "Primaria Benito Juárez",
+            "whatsapp": "55 1234 5678",
+            "estado": "cotizando",
+            "items": [{"descripcion": "Cuaderno profesional", "cantidad": 2, "precio": 38.5}] * 6,
+            "descuento": 0.15,
+            "creado": _AHORA,
+            "actualizado": _AHORA,
+        }
+    return data
+
+
+def _corre(store, ops: int, hilos: int, n: int, duenos: int) -> dict:
+    tiempos: dict[str, list[float]] = {"guardar": [], "listar": []}
+    candado = threading.Lock()
+
+    def trabajador(h: int) -> None:
+        for k in range(ops // hilos):
+            dueno = f"dueno-{(h + k) % duenos}"
+            if k % 2:
+                t0 = time.perf_counter()
+                store.listar(dueno)
+                op = "listar"
+            else:
+                i = (h * 7919 + k) % n
+                conv = f"conv-{i - i % duenos + (h + k) % duenos}" if k % 4 == 0 else f"conv-nueva-{h}-{k}"
+                t0 = time.perf_counter()
+                store.guardar(dueno, {"alumno": "Ana", "whatsapp": "55", "conversacionId": conv})
+                op = "guardar"
+            with candado:
+                tiempos[op].append((time.perf_counter() - t0) * 1000)
+
+    t0 = time.perf_counter()
+    trabajadores = [threading.Thread(target=trabajador, args=(h,)) for h in range(hilos)]
+    for t in trabajadores:
+        t.start()
+    for t in trabajadores:
+        t.join()
+    total = time.perf_counter() - t0
+    hechas = sum(len(v) for v in tiempos.values())
+
+    def pct(v: list[float], q: float) -> float:
+        return statistics.quantiles(v, n=100)[q - 1] if len(v) > 1 else (v[0] if v else 0.0)
+
+    return {
+        "ops_s": hechas / total,
+        **{f"{op}_p50": pct(v, 50) for op, v in tiempos.items()},
+        **{f"{op}_p95": pct(v, 95) for op, v in tiempos.items()},
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--expedientes", type=int, default=50_000)
+    ap.add_argument("--duenos", type=int, default=20)
+    ap.add_argument("--hilos", type=int, default=4)
+    ap.add_argument("--ops", type=int, default=2000)
+    ap.add_argument("--ops-json", type=int, default=16)
+    args = ap.parse_args()
+
+    data = _semilla(args.expedientes, args.duenos)
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta_json = Path(tmp) / "expedientes.json"
+        ruta_json.write_text(json.dumps(data, ensure_ascii=False), "utf-8")
+        sqlite = SQLiteExpedienteStore(Path(tmp) / "expedientes.db")
+        t0 = time.perf_counter()
+        sqlite.importar_json(ruta_json)
+        importar = time.perf_counter() - t0
+        print(f"{args.expedientes} expedientes, {args.duenos} dueños, {args.hilos} hilos; "
+              f"JSON {ruta_json.stat().st_size / 1e6:.1f} MB; importar a SQLite {importar:.1f} s")
+        print(f"{'motor':8s} {'ops':>5s} {'ops/s':>8s} {'guardar p50':>11s} {'p95':>8s} {'listar p50':>10s} {'p95':>8s}  (ms)")
+        for nombre, store, ops in (
+            ("json", ExpedienteStore(ruta_json), args.ops_json),
+            ("sqlite", sqlite, args.ops),
+        ):
+            r = _corre(store, ops, args.hilos, args.expedientes, args.duenos)
+            print(f"{nombre:8s} {ops:>5d} {r['ops_s']:>8.1f} {r['guardar_p50']:>11.1f} {r['guardar_p95']:>8.1f} "
+                  f"{r['listar_p50']:>10.1f} {r['listar_p95']:>8.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Migra `expedientes.json` al motor SQLite, de una vez.
+
+Copia cada expediente tal cual a un `.db` nuevo (o existente: re-ejecutable, un
+id repetido se sobrescribe con la versión del JSON) y verifica que cada dueño
+quede con el mismo número de expedientes. El JSON no se toca — queda como
+respaldo hasta que alguien lo borre a mano.
+
+Después, apuntar `FENIX_EXPEDIENTES_PATH` al `.db` (servidor y MCP leen la misma
+variable) y reiniciar. Con el servidor ABAJO: mientras corre el JSON sigue
+recibiendo escrituras que el `.db` no vería.
+
+USO
+    python3 scripts/importar_expedientes.py ~/.fenix-data/expedientes.json ~/.fenix-data/expedientes.db
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from expedientes import SQLiteExpedienteStore  # noqa: E402
+
+
+def main() -> int:
+    if len(sys.argv) != 3:
+        print(__doc__, file=sys.stderr)
+        return 2
+    origen, destino = Path(sys.argv[1]), Path(sys.argv[2])
+    if not origen.is_file():
+        print(f"no existe {origen}", file=sys.stderr)
+        return 2
+    store = SQLiteExpedienteStore(destino)
+    n = store.importar_json(origen)
+    por_dueno = Counter(e.get("ownerId") for e in json.loads(origen.read_text("utf-8")).values())
+    faltan = {d: c for d, c in por_dueno.items() if len(store.listar(d or "")) < c}
+    if faltan:
+        print(f"importados {n}, pero faltan expedientes para: {sorted(faltan)}", file=sys.stderr)
+        return 1
+    print(f"importados {n} expedientes de {len(por_dueno)} dueños → {destino}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""La bitácora se lee de atrás hacia adelante, por páginas, a través de lo rotado.
+
+Lo que importa del índice no es que exista sino que nunca cambie la respuesta:
+con o sin él, con un bloque a medias o con un log de antes de que existiera,
+una página devuelve los mismos turnos que leer el archivo entero.
+"""
+
+import json
+
+import pytest
+
+import bitacora as modulo
+from bitacora import Bitacora, normalizar_cuando
+
+
+def _llenar(b: Bitacora, n: int, *, cada_ip: int = 3) -> None:
+    for i in range(n):
+        b.anotar(ip=f"10.0.0.{i % cada_ip}", rol="admin" if i % 10 == 0 else "publico", texto=f"turno {i}")
+
+
+def _todos(b: Bitacora, **filtro) -> list[dict]:
+    salida, cursor = [], None
+    while True:
+        pagina, cursor = b.paginar(limite=7, cursor=cursor, **filtro)
+        salida += pagina
+        if cursor is None:
+            return salida
+
+
+@pytest.fixture(autouse=True)
+def _bloques_chicos(monkeypatch):
+    # Con bloques de 5 turnos un par de cientos de turnos ya ejercitan el índice.
+    monkeypatch.setattr(modulo, "BLOQUE_LINEAS", 5)
+    monkeypatch.setattr(modulo, "_BLOQUE_LECTURA", 64)
+
+
+def test_leer_va_del_mas_reciente_al_mas_viejo(tmp_path):
+    b = Bitacora(tmp_path / "bitacora.jsonl")
+    _llenar(b, 12)
+    assert [t["texto"] for t in b.leer(3)] == ["turno 11", "turno 10", "turno 9"]
+    assert len(b.leer()) == 12
+
+
+def test_el_cursor_recorre_todo_sin_repetir(tmp_path):
+    b = Bitacora(tmp_path / "bitacora.jsonl")
+    _llenar(b, 53)
+    assert [t["texto"] for t in _todos(b)] == [f"turno {i}" for i in reversed(range(53))]
+
+
+def test_las_paginas_cruzan_lo_rotado(tmp_path):
+    b = Bitacora(tmp_path / "bitacora.jsonl", max_bytes=2_000, generaciones=3)
+    _llenar(b, 60)
+    assert (tmp_path / "bitacora.jsonl.1").exists() and (tmp_path / "bitacora.jsonl.1.idx").exists()
+    assert not (tmp_path / "bitacora.jsonl.4").exists()
+    textos = [t["texto"] for t in _todos(b)]
+    assert textos[0] == "turno 59"
+    # Lo que sobrevive a la rotación es una cola contigua del historial.
+    assert textos == [f"turno {i}" for i in range(59, 59 - len(textos), -1)]
+    assert len(textos) > 30
+
+
+def test_una_rotacion_entre_paginas_no_mueve_el_cursor(tmp_path):
+    b = Bitacora(tmp_path / "bitacora.jsonl", max_bytes=2_000, generaciones=5)
+    _llenar(b, 20)
+    pagina, cursor = b.paginar(limite=5)
+    _llenar(b, 40)  # rota: el segmento del cursor ahora es `.1` o `.2`
+    siguiente, _ = b.paginar(limite=3, cursor=cursor)
+    assert [t["texto"] for t in pagina + siguiente] == [f"turno {i}" for i in range(19, 11, -1)]
+
+
+def test_filtros_por_rol_ip_y_tiempo(tmp_path):
+    b = Bitacora(tmp_path / "bitacora.jsonl")
+    _llenar(b, 40)
+    b.anotar(ip="203.0.113.9", rol="publico", texto="la rara")
+    _llenar(b, 40)
+    assert [t["texto"] for t in _todos(b, ip="203.0.113.9")] == ["la rara"]
+    admins = _todos(b, rol="admin")
+    assert len(admins) == 8 and all(t["rol"] == "admin" for t in admins)
+    # Se reescriben las fechas para tener un rango que probar.
+    ruta = tmp_path / "bitacora.jsonl"
+    lineas = [json.loads(x) for x in ruta.read_text("utf-8").splitlines()]
+    for i, t in enumerate(lineas):
+        t["cuando"] = f"2026-10-{1 + i // 27:02d}T12:00:00+00:00"
+    ruta.write_text("".join(json.dumps(t) + "\n" for t in lineas), "utf-8")
+    (tmp_path / "bitacora.jsonl.idx").unlink()
+    b = Bitacora(ruta)
+    b.anotar(ip="x", rol="publico")  # re-indexa al abrir
+    dia_2 = _todos(b, desde="2026-10-02T00:00:00+00:00", hasta="2026-10-02T23:59:59+00:00")
+    assert len(dia_2) == 27 and {t["cuando"][:10] for t in dia_2} == {"2026-10-02"}
+
+
+def test_muchas_ips_en_un_bloque_usan_huella(tmp_path, monkeypatch):
+    monkeypatch.setattr(modulo, "BLOQUE_LINEAS", 80)
+    b = Bitacora(tmp_path / "bitacora.jsonl")
+    _llenar(b, 200, cada_ip=100)
+    b.anotar(ip="203.0.113.9", rol="publico", texto="la rara")
+    _llenar(b, 200, cada_ip=100)
+    bloques = [json.loads(x) for x in (tmp_path / "bitacora.jsonl.idx").read_text().splitlines()]
+    assert all(x["ips"] is None and x["ipf"] for x in bloques)
+    assert [t["texto"] for t in _todos(b, ip="203.0.113.9")] == ["la rara"]
+    assert len(_todos(b, ip="10.0.0.42")) == 4
+
+
+def test_el_indice_no_cambia_la_respuesta(tmp_path):
+    """Un log de antes del índice, un índice borrado o uno que no corresponde
+    al archivo: siempre la misma respuesta que leer todo."""
+    b = Bitacora(tmp_path / "bitacora.jsonl")
+    _llenar(b, 33)
+    esperado = _todos(b, ip="10.0.0.1")
+    (tmp_path / "bitacora.jsonl.idx").write_text('{"o": 0, "f": 999999999, "n": 1}\n', "utf-8")
+    assert _todos(b, ip="10.0.0.1") == esperado
+    (tmp_path / "bitacora.jsonl.idx").unlink()
+    assert _todos(b, ip="10.0.0.1") == esperado
+
+
+def test_al_reabrir_se_reindexa_la_cola_y_se_cierra_la_linea_cortada(tmp_path):
+    ruta = tmp_path / "bitacora.jsonl"
+    _llenar(Bitacora(ruta), 12)
+    with open(ruta, "ab") as f:
+        f.write(b'{"cuando": "2026-')  # el proceso murió a media línea
+    b = Bitacora(ruta)
+    b.anotar(ip="10.9.9.9", rol="publico", texto="despues")
+    assert b.leer(1)[0]["texto"] == "despues"
+    assert len(b.leer()) == 13
+    assert [t["texto"] for t in _todos(b, ip="10.9.9.9")] == ["despues"]
+    bloques = [json.loads(x) for x in (tmp_path / "bitacora.jsonl.idx").read_text().splitlines()]
+    assert bloques[0]["o"] == 0 and all(a["f"] == c["o"] for a, c in zip(bloques, bloques[1:]))
+    assert bloques[-1]["f"] <= ruta.stat().st_size
+
+
+def test_cursor_invalido_o_de_un_segmento_descartado(tmp_path):
+    b = Bitacora(tmp_path / "bitacora.jsonl", max_bytes=1_000)
+    _llenar(b, 4)
+    _, cursor = b.paginar(limite=1)
+    with pytest.raises(ValueError):
+        b.paginar(cursor="sin-offset")
+    _llenar(b, 40)  # una sola generación: el segmento del cursor ya se borró
+    assert b.paginar(cursor=cursor) == ([], None)
+
+
+def test_normalizar_cuando():
+    assert normalizar_cuando("2026-10-02") == "2026-10-02T00:00:00+00:00"
+    assert normalizar_cuando("2026-10-02T06:00:00-06:00") == "2026-10-02T12:00:00+00:00"
+    with pytest.raises(ValueError):
+        normalizar_cuando("ayer")
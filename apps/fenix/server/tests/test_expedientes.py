@@ -0,0 +1,116 @@
+"""Los dos motores de expedientes cumplen el MISMO contrato.
+
+El JSON es el de siempre; SQLite (WAL) es el que aguanta miles de expedientes y
+un segundo proceso escribiendo (el MCP). Todo lo que el servidor y el MCP dan
+por hecho se prueba contra ambos.
+"""
+
+import json
+import threading
+
+import pytest
+
+from expedientes import ExpedienteStore, SQLiteExpedienteStore, abrir_store
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "json":
+        return ExpedienteStore(tmp_path / "expedientes.json")
+    return SQLiteExpedienteStore(tmp_path / "expedientes.db")
+
+
+def _datos(**extra):
+    return {"alumno": "Ana", "whatsapp": "55 1234 5678", "escuela": "Benito Juárez", **extra}
+
+
+def test_alta_obtener_y_listar(store):
+    e = store.guardar("lidia", _datos(items=[{"descripcion": "Cuaderno", "cantidad": 2, "precio": 30}]))
+    assert e["id"].startswith("exp-")
+    assert e["estado"] == "nueva"
+    assert store.guardar("lidia", {"alumno": "Sin teléfono"})["estado"] == "bloqueada"
+    assert store.obtener("lidia", e["id"]) == e
+    assert store.listar("lidia")[-1] == e
+
+
+def test_la_conversacion_no_duplica_el_expediente(store):
+    primero = store.guardar("lidia", _datos(conversacionId="conv-1"))
+    segundo = store.guardar("lidia", _datos(conversacionId="conv-1", folio="F-9"))
+    assert segundo["id"] == primero["id"]
+    assert segundo["creado"] == primero["creado"]
+    assert [e["folio"] for e in store.listar("lidia")] == ["F-9"]
+    # La misma conversación en OTRA cuenta es otro expediente.
+    assert store.guardar("ximena", _datos(conversacionId="conv-1"))["id"] != primero["id"]
+
+
+def test_lo_ajeno_no_se_ve_ni_se_toca(store):
+    e = store.guardar("lidia", _datos())
+    assert store.obtener("ximena", e["id"]) is None
+    assert store.listar("ximena") == []
+    with pytest.raises(PermissionError):
+        store.guardar("ximena", _datos(id=e["id"]))
+    store.borrar("ximena", e["id"])
+    assert store.obtener("lidia", e["id"]) is not None
+    store.borrar("lidia", e["id"])
+    assert store.obtener("lidia", e["id"]) is None
+
+
+def test_listar_va_del_mas_reciente_al_mas_viejo(store):
+    ids = [store.guardar("lidia", _datos(alumno=f"A{i}"))["id"] for i in range(3)]
+    store.guardar("lidia", _datos(id=ids[0], alumno="A0 bis"))
+    assert [e["id"] for e in store.listar("lidia")] == [ids[0], ids[2], ids[1]]
+
+
+def test_importar_json_conserva_el_relleno_al_leer(tmp_path):
+    """Los 33 migrados no tienen renglones en disco: el importador los copia
+    tal cual y `listar` sigue devolviendo la forma completa."""
+    viejo = {
+        "exp-viejo": {
+            "id": "exp-viejo",
+            "ownerId": "lidia",
+            "conversacionId": "conv-7",
+            "alumno": "Beto",
+            "estado": "entregada",
+            "actualizado": "2026-07-27T00:00:00+00:00",
+        }
+    }
+    origen = tmp_path / "expedientes.json"
+    origen.write_text(json.dumps(viejo), "utf-8")
+    sqlite = SQLiteExpedienteStore(tmp_path / "expedientes.db")
+    assert sqlite.importar_json(origen) == 1
+    assert sqlite.importar_json(origen) == 1  # re-ejecutable, sin duplicar
+    assert sqlite.obtener("lidia", "exp-viejo") == viejo["exp-viejo"]
+    (listado,) = sqlite.listar("lidia")
+    assert listado == ExpedienteStore(origen).listar("lidia")[0]
+    assert listado["items"] == [] and listado["descuento"] == 0.15
+    # Y la conversación importada sigue resolviendo al mismo expediente.
+    assert sqlite.guardar("lidia", _datos(conversacionId="conv-7"))["id"] == "exp-viejo"
+
+
+def test_abrir_store_elige_motor_por_extension(tmp_path):
+    assert isinstance(abrir_store(tmp_path / "e.json"), ExpedienteStore)
+    assert isinstance(abrir_store(tmp_path / "e.db"), SQLiteExpedienteStore)
+    assert isinstance(abrir_store(tmp_path / "e.SQLITE3"), SQLiteExpedienteStore)
+
+
+def test_sqlite_aguanta_escritores_concurrentes(tmp_path):
+    """Hilos con su propia conexión, más un segundo store sobre el mismo
+    archivo (como el proceso del MCP): ninguna alta se pierde."""
+    ruta = tmp_path / "expedientes.db"
+    stores = [SQLiteExpedienteStore(ruta), SQLiteExpedienteStore(ruta)]
+    errores = []
+
+    def escribe(n: int) -> None:
+        try:
+            for i in range(25):
+                stores[n % 2].guardar("lidia", _datos(conversacionId=f"conv-{n}-{i}"))
+        except Exception as exc:  # noqa: BLE001 - se reporta abajo
+            errores.append(exc)
+
+    hilos = [threading.Thread(target=escribe, args=(n,)) for n in range(6)]
+    for h in hilos:
+        h.start()
+    for h in hilos:
+        h.join()
+    assert errores == []
+    assert len(stores[0].listar("lidia")) == 150
@@ -392,6 +392,24 @@ def test_la_bitacora_solo_se_lee_desde_el_mostrador(app_fenix):
     assert c.get("/expedientes/bitacora", headers=ADMIN).status_code == 200
 
 
+def test_la_bitacora_pagina_con_cursor_y_filtros(app_fenix, monkeypatch, tmp_path):
+    import fenix_app
+    from bitacora import Bitacora
+
+    monkeypatch.setattr(fenix_app, "_BITACORA", Bitacora(tmp_path / "bitacora.jsonl"))
+    for i in range(3):
+        fenix_app._BITACORA.anotar(ip=f"10.0.0.{i}", rol="publico", texto=f"turno {i}")
+    c = _cliente(app_fenix)
+    r = c.get("/expedientes/bitacora", params={"limite": 2}, headers=ADMIN).json()
+    assert [t["texto"] for t in r["turnos"]] == ["turno 2", "turno 1"]
+    r = c.get("/expedientes/bitacora", params={"cursor": r["siguiente"]}, headers=ADMIN).json()
+    assert [t["texto"] for t in r["turnos"]] == ["turno 0"] and r["siguiente"] is None
+    r = c.get("/expedientes/bitacora", params={"ip": "10.0.0.1", "desde": "2000-01-01"}, headers=ADMIN).json()
+    assert [t["texto"] for t in r["turnos"]] == ["turno 1"]
+    assert c.get("/expedientes/bitacora", params={"cursor": "basura"}, headers=ADMIN).status_code == 400
+    assert c.get("/expedientes/bitacora", params={"desde": "ayer"}, headers=ADMIN).status_code == 400
+
+
 def test_el_arranque_exige_la_contrasena_del_ciber(monkeypatch):
     from arranque import ConfiguracionInsegura, exigir_contrasena_publica
 
@@ -0,0 +1,173 @@
+"""Concurrent-query benchmark: legacy per-document loop vs. batched index.
+
+Runs without torch or a GPU. The model is replaced by a deterministic
+hash-seeded encoder whose cost is simulated with ``time.sleep`` (fixed
+per-call overhead + per-text cost), which — like a real CUDA forward pass —
+releases the GIL. Scoring uses the real code paths on random embeddings.
+
+Usage:
+    cd apps/fi-monitor/rag_service
+    python bench_query.py                        # defaults
+    python bench_query.py --docs 200 --chunks 100 --concurrency 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from index_store import DocumentIndex
+from query_batcher import QueryBatcher
+
+DIM = 384
+
+
+def make_encoder(call_ms: float, per_text_ms: float):
+    def encode(texts: list[str]) -> np.ndarray:
+        time.sleep((call_ms + per_text_ms * len(texts)) / 1000.0)
+        rows = []
+        for text in texts:
+            seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+            rows.append(np.random.default_rng(seed).standard_normal(DIM, dtype=np.float32))
+        return np.stack(rows)
+
+    return encode
+
+
+def legacy_query(encode, store: dict[str, dict], text: str, top_k: int) -> list[dict]:
+    """The pre-index /rag/query body, verbatim in behaviour."""
+    query_embedding = encode([text])[0]
+    all_results = []
+    for filename, doc in store.items():
+        embeddings = doc["embeddings"]
+        query_norm = query_embedding / np.linalg.norm(query_embedding)
+        embeddings_norm = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+        similarities = embeddings_norm @ query_norm
+        for idx in np.argsort(similarities)[::-1][:top_k]:
+            all_results.append(
+                {"filename": filename, "chunk": doc["chunks"][idx], "similarity": float(similarities[idx])}
+            )
+    all_results.sort(key=lambda x: x["similarity"], reverse=True)
+    return all_results[:top_k]
+
+
+async def run_clients(
+    call, queries: list[str], concurrency: int
+) -> tuple[float, list[float], float]:
+    """Closed-loop clients; also samples event-loop lag with a 1 ms heartbeat.
+
+    Returns:
+        (wall seconds, per-query latencies in ms, worst event-loop stall in ms)
+    """
+    latencies: list[float] = []
+    pending = iter(queries)
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def heartbeat() -> None:
+        nonlocal max_lag
+        loop = asyncio.get_running_loop()
+        while not done.is_set():
+            t0 = loop.time()
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, (loop.time() - t0 - 0.001) * 1000)
+
+    async def client() -> None:
+        for q in pending:
+            t0 = time.perf_counter()
+            await call(q)
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    wall = time.perf_counter() - t0
+    done.set()
+    await beat
+    return wall, latencies, max_lag
+
+
+def report(label: str, wall: float, latencies: list[float], max_lag: float) -> None:
+    latencies.sort()
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    print(
+        f"{label:<10} {len(latencies) / wall:>9.1f} q/s   "
+        f"p50 {statistics.median(latencies):>8.1f} ms   p95 {p95:>8.1f} ms   "
+        f"max loop stall {max_lag:>7.1f} ms"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=50)
+    parser.add_argument("--chunks", type=int, default=200, help="chunks per document")
+    parser.add_argument("--queries", type=int, default=256)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--call-ms", type=float, default=8.0, help="simulated encode overhead per call")
+    parser.add_argument("--per-text-ms", type=float, default=0.3, help="simulated encode cost per text")
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-batch", type=int, default=32)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    encode = make_encoder(args.call_ms, args.per_text_ms)
+    queries = [f"query {i} about glucose" for i in range(args.queries)]
+
+    store = {}
+    for d in range(args.docs):
+        store[f"doc{d}.pdf"] = {
+            "chunks": [f"doc{d} chunk {c}" for c in range(args.chunks)],
+            "embeddings": rng.standard_normal((args.chunks, DIM), dtype=np.float32),
+        }
+
+    print(
+        f"{args.docs} docs x {args.chunks} chunks = {args.docs * args.chunks} rows, "
+        f"{args.queries} queries, concurrency {args.concurrency}"
+    )
+
+    async def legacy(q: str):
+        # Old handler: everything inline in the async function.
+        return legacy_query(encode, store, q, args.top_k)
+
+    report("legacy", *await run_clients(legacy, queries, args.concurrency))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = DocumentIndex(tmp)
+        t0 = time.perf_counter()
+        for filename, doc in store.items():
+            index.add(filename, doc["chunks"], doc["embeddings"])
+        build_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        reopened = DocumentIndex(tmp)
+        open_ms = (time.perf_counter() - t0) * 1000
+
+        batcher = QueryBatcher(
+            encode,
+            reopened,
+            workers=args.workers,
+            max_batch=args.max_batch,
+            max_wait_ms=args.max_wait_ms,
+        )
+        await batcher.start()
+        try:
+            result = await run_clients(
+                lambda q: batcher.search(q, args.top_k), queries, args.concurrency
+            )
+        finally:
+            await batcher.stop()
+        report("batched", *result)
+        print(f"index: build {build_s:.2f}s ({args.docs} uploads), reopen {open_ms:.1f} ms (mmap)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
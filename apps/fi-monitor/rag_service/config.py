@@ -13,3 +13,11 @@ RAG_API_KEY = os.getenv("RAG_API_KEY", "change-me-in-production")
 
 # GPU Requirement: Fail-hard if no GPU (override: RAG_REQUIRE_GPU=false)
 RAG_REQUIRE_GPU = os.getenv("RAG_REQUIRE_GPU", "true").lower() in ("true", "1", "yes")
+
+# Persistent document index (embeddings-<gen>.npy + manifest.json, loaded via mmap)
+RAG_INDEX_DIR = os.getenv("RAG_INDEX_DIR", os.path.expanduser("~/.fi-monitor/rag_index"))
+
+# Query micro-batching: worker threads, max queries per batch, max wait to fill a batch
+RAG_QUERY_WORKERS = int(os.getenv("RAG_QUERY_WORKERS", "2"))
+RAG_QUERY_MAX_BATCH = int(os.getenv("RAG_QUERY_MAX_BATCH", "32"))
+RAG_QUERY_MAX_WAIT_MS = float(os.getenv("RAG_QUERY_MAX_WAIT_MS", "2"))
@@ -0,0 +1,328 @@
+"""Persistent document index for the RAG service.
+
+Replaces the in-memory ``{filename: {"chunks", "embeddings"}}`` dict with a
+single stacked, pre-normalized embedding matrix that survives restarts.
+
+On-disk layout (``RAG_INDEX_DIR``)::
+
+    manifest.json          {"version", "generation", "dim", "documents": [
+                               {"filename", "chunks": [...]}, ...]}
+    embeddings-<gen>.npy   float32[n_chunks, dim], L2-normalized rows,
+                           documents stored contiguously in manifest order
+
+The matrix is opened with ``np.load(mmap_mode="r")`` so startup cost is
+independent of corpus size; pages are faulted in by the first queries.
+
+Writes are copy-on-write: a mutation writes ``embeddings-<gen+1>.npy``,
+then atomically replaces ``manifest.json`` to point at it, then removes the
+previous generation. A crash at any point leaves a consistent index.
+
+Readers never take the lock: ``search`` grabs the current immutable
+``_Snapshot`` once and works on it, so mutations don't stall queries.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+MANIFEST_NAME = "manifest.json"
+INDEX_VERSION = 1
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    """One scored chunk."""
+
+    filename: str
+    chunk_index: int
+    chunk: str
+    similarity: float
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """Immutable view of the index at one generation."""
+
+    generation: int = 0
+    dim: int | None = None
+    matrix: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=np.float32))
+    filenames: tuple[str, ...] = ()
+    chunks: dict[str, list[str]] = field(default_factory=dict)
+    spans: dict[str, tuple[int, int]] = field(default_factory=dict)
+    row_doc: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+    row_chunk: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int32))
+
+
+class DocumentIndex:
+    """Stacked, persistent, mmap-backed embedding index."""
+
+    def __init__(self, directory: str | Path | None) -> None:
+        """Open (or create) the index.
+
+        Args:
+            directory: Index directory. ``None`` keeps the index in memory only.
+        """
+        self.directory = Path(directory) if directory is not None else None
+        self._lock = threading.Lock()
+        self._snap = _Snapshot()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._snap = self._load()
+
+    # ------------------------------------------------------------------
+    # Read API
+    # ------------------------------------------------------------------
+
+    def __contains__(self, filename: str) -> bool:
+        return filename in self._snap.spans
+
+    def __len__(self) -> int:
+        return len(self._snap.filenames)
+
+    @property
+    def filenames(self) -> list[str]:
+        return list(self._snap.filenames)
+
+    @property
+    def total_chunks(self) -> int:
+        return int(self._snap.matrix.shape[0])
+
+    def chunks(self, filename: str) -> list[str]:
+        """Chunk texts of a document (KeyError if absent)."""
+        return self._snap.chunks[filename]
+
+    def search(
+        self,
+        queries: np.ndarray,
+        top_k: int,
+        filenames: list[str | None] | None = None,
+    ) -> list[list[SearchHit]]:
+        """Score a batch of query embeddings against the stacked matrix.
+
+        Unfiltered queries share one ``[b, dim] @ [dim, n]`` product; queries
+        restricted to one document only touch that document's contiguous rows.
+
+        Args:
+            queries: float array of shape [b, dim] (need not be normalized)
+            top_k: Results per query
+            filenames: Optional per-query document filter (``None`` = all)
+
+        Returns:
+            One best-first hit list per query
+        """
+        snap = self._snap
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        filters = filenames if filenames is not None else [None] * len(queries)
+        results: list[list[SearchHit]] = [[] for _ in range(len(queries))]
+
+        if top_k <= 0 or snap.matrix.shape[0] == 0:
+            return results
+        if queries.shape[1] != snap.dim:
+            raise ValueError(f"Query dim {queries.shape[1]} != index dim {snap.dim}")
+
+        queries = _normalize_rows(queries)
+
+        global_rows = [i for i, f in enumerate(filters) if f is None]
+        if global_rows:
+            scores = queries[global_rows] @ snap.matrix.T
+            for qi, row_scores in zip(global_rows, scores, strict=True):
+                results[qi] = _top_hits(snap, row_scores, top_k, offset=0)
+
+        for qi, filename in enumerate(filters):
+            if filename is None or filename not in snap.spans:
+                continue
+            start, end = snap.spans[filename]
+            row_scores = snap.matrix[start:end] @ queries[qi]
+            results[qi] = _top_hits(snap, row_scores, top_k, offset=start)
+
+        return results
+
+    # ------------------------------------------------------------------
+    # Write API (serialized, copy-on-write)
+    # ------------------------------------------------------------------
+
+    def add(self, filename: str, chunks: list[str], embeddings: np.ndarray) -> None:
+        """Insert or replace a document."""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if embeddings.ndim != 2 or embeddings.shape[0] != len(chunks):
+            raise ValueError(
+                f"Expected {len(chunks)} embeddings, got shape {embeddings.shape}"
+            )
+        with self._lock:
+            snap = self._snap
+            if snap.dim is not None and snap.matrix.shape[0] and embeddings.shape[1] != snap.dim:
+                raise ValueError(f"Embedding dim {embeddings.shape[1]} != index dim {snap.dim}")
+
+            docs = [(f, snap.chunks[f], self._rows(snap, f)) for f in snap.filenames if f != filename]
+            docs.append((filename, list(chunks), _normalize_rows(embeddings)))
+            self._commit(docs, dim=int(embeddings.shape[1]))
+
+    def remove(self, filename: str) -> bool:
+        """Delete a document. Returns False if it was not indexed."""
+        with self._lock:
+            snap = self._snap
+            if filename not in snap.spans:
+                return False
+            docs = [(f, snap.chunks[f], self._rows(snap, f)) for f in snap.filenames if f != filename]
+            self._commit(docs, dim=snap.dim)
+            return True
+
+    def clear(self) -> int:
+        """Delete every document. Returns how many were removed."""
+        with self._lock:
+            count = len(self._snap.filenames)
+            self._commit([], dim=self._snap.dim)
+            return count
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _rows(snap: _Snapshot, filename: str) -> np.ndarray:
+        start, end = snap.spans[filename]
+        return snap.matrix[start:end]
+
+    def _commit(self, docs: list[tuple[str, list[str], np.ndarray]], dim: int | None) -> None:
+        """Build the next generation, persist it, then publish it to readers."""
+        width = dim or 0
+        matrix = (
+            np.ascontiguousarray(np.vstack([rows for _, _, rows in docs]), dtype=np.float32)
+            if docs
+            else np.zeros((0, width), dtype=np.float32)
+        )
+        generation = self._snap.generation + 1
+        manifest = {
+            "version": INDEX_VERSION,
+            "generation": generation,
+            "dim": dim,
+            "documents": [{"filename": f, "chunks": c} for f, c, _ in docs],
+        }
+
+        previous = self._snap.generation
+        if self.directory is not None:
+            np.save(self._matrix_path(generation), matrix)
+            matrix = np.load(self._matrix_path(generation), mmap_mode="r")
+            _atomic_write_json(self.directory / MANIFEST_NAME, manifest)
+
+        self._snap = _build_snapshot(manifest, matrix)
+
+        if self.directory is not None:
+            _unlink_quietly(self._matrix_path(previous))
+
+    def _load(self) -> _Snapshot:
+        assert self.directory is not None
+        manifest_path = self.directory / MANIFEST_NAME
+        if not manifest_path.exists():
+            return _Snapshot()
+
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            matrix = np.load(self._matrix_path(manifest["generation"]), mmap_mode="r")
+            snap = _build_snapshot(manifest, matrix)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[RAG Service] Index at {self.directory} unreadable ({e}), starting empty")
+            return _Snapshot()
+
+        self._remove_stale_generations(snap.generation)
+        print(
+            f"[RAG Service] Index loaded: {len(snap.filenames)} documents, "
+            f"{snap.matrix.shape[0]} chunks (mmap)"
+        )
+        return snap
+
+    def _remove_stale_generations(self, keep: int) -> None:
+        """Drop matrices orphaned by a crash between save and manifest swap."""
+        assert self.directory is not None
+        for path in self.directory.glob("embeddings-*.npy"):
+            if path != self._matrix_path(keep):
+                _unlink_quietly(path)
+
+    def _matrix_path(self, generation: int) -> Path:
+        assert self.directory is not None
+        return self.directory / f"embeddings-{generation}.npy"
+
+
+def _build_snapshot(manifest: dict, matrix: np.ndarray) -> _Snapshot:
+    filenames: list[str] = []
+    chunks: dict[str, list[str]] = {}
+    spans: dict[str, tuple[int, int]] = {}
+    row_doc: list[np.ndarray] = []
+    row_chunk: list[np.ndarray] = []
+
+    start = 0
+    for pos, doc in enumerate(manifest["documents"]):
+        n = len(doc["chunks"])
+        filenames.append(doc["filename"])
+        chunks[doc["filename"]] = doc["chunks"]
+        spans[doc["filename"]] = (start, start + n)
+        row_doc.append(np.full(n, pos, dtype=np.int32))
+        row_chunk.append(np.arange(n, dtype=np.int32))
+        start += n
+
+    if start != matrix.shape[0]:
+        raise ValueError(f"Manifest lists {start} chunks but matrix has {matrix.shape[0]} rows")
+
+    return _Snapshot(
+        generation=int(manifest["generation"]),
+        dim=manifest["dim"],
+        matrix=matrix,
+        filenames=tuple(filenames),
+        chunks=chunks,
+        spans=spans,
+        row_doc=np.concatenate(row_doc) if row_doc else np.zeros(0, dtype=np.int32),
+        row_chunk=np.concatenate(row_chunk) if row_chunk else np.zeros(0, dtype=np.int32),
+    )
+
+
+def _top_hits(snap: _Snapshot, scores: np.ndarray, top_k: int, offset: int) -> list[SearchHit]:
+    k = min(top_k, scores.shape[0])
+    if k == 0:
+        return []
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top], kind="stable")]
+    hits = []
+    for i in top:
+        filename = snap.filenames[snap.row_doc[offset + i]]
+        chunk_index = int(snap.row_chunk[offset + i])
+        hits.append(
+            SearchHit(
+                filename=filename,
+                chunk_index=chunk_index,
+                chunk=snap.chunks[filename][chunk_index],
+                similarity=float(scores[i]),
+            )
+        )
+    return hits
+
+
+def _normalize_rows(block: np.ndarray) -> np.ndarray:
+    """L2-normalize rows; zero vectors stay zero instead of becoming NaN."""
+    block = np.asarray(block, dtype=np.float32)
+    norms = np.linalg.norm(block, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return (block / norms).astype(np.float32, copy=False)
+
+
+def _unlink_quietly(path: Path) -> None:
+    # Windows refuses to delete a file that is still mapped; leftovers are
+    # swept by _remove_stale_generations on the next startup.
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def _atomic_write_json(path: Path, payload: dict) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
@@ -8,6 +8,7 @@ Architecture:
 - Fail-hard on startup if no GPU available (override: RAG_REQUIRE_GPU=false)
 - API key authentication for security
 - Batch embedding support
+- Persistent mmap-backed document index, micro-batched queries
 - Health check endpoint
 
 Author: Bernard Uriza Orozco
@@ -28,8 +29,16 @@ from fastapi.middleware.cors import CORSMiddleware
 from sentence_transformers import SentenceTransformer
 
 import state
-from config import EMBEDDING_MODEL
+from config import (
+    EMBEDDING_MODEL,
+    RAG_INDEX_DIR,
+    RAG_QUERY_MAX_BATCH,
+    RAG_QUERY_MAX_WAIT_MS,
+    RAG_QUERY_WORKERS,
+)
 from gpu import DEVICE
+from index_store import DocumentIndex
+from query_batcher import QueryBatcher
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -81,10 +90,33 @@ async def lifespan(app: FastAPI):
         reserved_mb = torch.cuda.memory_reserved(0) / (1024**2)
         print(f"[RAG Service] GPU Memory: {allocated_mb:.0f}MB allocated, {reserved_mb:.0f}MB reserved")
 
+    # Persistent index (mmap) + micro-batched query executor
+    state._document_index = DocumentIndex(RAG_INDEX_DIR)
+    model = state._model
+    state._query_batcher = QueryBatcher(
+        encode=lambda texts: model.encode(
+            texts,
+            batch_size=len(texts),
+            convert_to_numpy=True,
+            show_progress_bar=False,
+            device=DEVICE,
+        ),
+        index=state._document_index,
+        workers=RAG_QUERY_WORKERS,
+        max_batch=RAG_QUERY_MAX_BATCH,
+        max_wait_ms=RAG_QUERY_MAX_WAIT_MS,
+    )
+    await state._query_batcher.start()
+    print(
+        f"[RAG Service] Query batcher ready ({RAG_QUERY_WORKERS} workers, "
+        f"batch<={RAG_QUERY_MAX_BATCH}, wait<={RAG_QUERY_MAX_WAIT_MS}ms)"
+    )
+
     yield
 
     # Cleanup
     print("[RAG Service] Shutting down...")
+    await state._query_batcher.stop()
     if DEVICE == "cuda":
         torch.cuda.empty_cache()
         print("[RAG Service] GPU memory cleared")
@@ -0,0 +1,158 @@
+"""Micro-batching query executor for the RAG service.
+
+``/rag/query`` used to call ``model.encode`` and score every document inside
+the ``async def`` handler, so one query blocked the event loop for every other
+caller. Now handlers only enqueue their query text and await a future:
+
+    handler ──► asyncio.Queue ──► dispatcher ──► ThreadPoolExecutor
+                                   (collects up to      (one encode for the
+                                    max_batch within     whole batch, one
+                                    max_wait_ms)         stacked matmul)
+
+Under load, N concurrent queries cost one forward pass and one
+``[N, dim] @ [dim, n_chunks]`` product instead of N of each. A lone query
+waits at most ``max_wait_ms`` extra.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from index_store import DocumentIndex, SearchHit
+
+# Encodes a list of texts into a float array of shape [len(texts), dim]
+EncodeFn = Callable[[list[str]], np.ndarray]
+
+
+@dataclass
+class _Pending:
+    text: str
+    top_k: int
+    filename: str | None
+    future: asyncio.Future = field(repr=False)
+
+
+class QueryBatcher:
+    """Collects concurrent queries and runs them as batches off the event loop."""
+
+    def __init__(
+        self,
+        encode: EncodeFn,
+        index: DocumentIndex,
+        workers: int = 2,
+        max_batch: int = 32,
+        max_wait_ms: float = 2.0,
+    ) -> None:
+        self.encode = encode
+        self.index = index
+        self.workers = max(1, workers)
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: asyncio.Queue[_Pending] | None = None
+        self._pool: ThreadPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._dispatcher: asyncio.Task | None = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        if self._dispatcher is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="rag-query")
+        self._slots = asyncio.Semaphore(self.workers)
+        self._dispatcher = asyncio.create_task(self._dispatch_loop())
+
+    async def stop(self) -> None:
+        if self._dispatcher is None:
+            return
+        self._dispatcher.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._dispatcher
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        assert self._queue is not None and self._pool is not None
+        while not self._queue.empty():
+            pending = self._queue.get_nowait()
+            if not pending.future.done():
+                pending.future.set_exception(RuntimeError("Query batcher stopped"))
+        self._pool.shutdown(wait=True)
+        self._dispatcher = None
+        self._queue = None
+        self._pool = None
+
+    async def search(self, text: str, top_k: int, filename: str | None = None) -> list[SearchHit]:
+        """Queue one query and wait for its batch to finish."""
+        if self._queue is None:
+            raise RuntimeError("Query batcher not started")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Pending(text, top_k, filename, future))
+        return await future
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    async def _dispatch_loop(self) -> None:
+        assert self._queue is not None and self._slots is not None
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except TimeoutError:
+                    break
+
+            # Bound in-flight batches to the pool size so the queue (not the
+            # executor backlog) absorbs bursts and keeps batches large.
+            await self._slots.acquire()
+            task = asyncio.create_task(self._execute(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _execute(self, batch: list[_Pending]) -> None:
+        assert self._slots is not None
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(
+                self._pool, self._run_batch, batch
+            )
+        except Exception as e:
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+        else:
+            for pending, hits in zip(batch, results, strict=True):
+                if not pending.future.done():
+                    pending.future.set_result(hits)
+        finally:
+            self._slots.release()
+
+    def _run_batch(self, batch: list[_Pending]) -> list[list[SearchHit]]:
+        """Worker-thread body: one encode, then one stacked search per top_k."""
+        embeddings = np.asarray(self.encode([p.text for p in batch]), dtype=np.float32)
+        results: list[list[SearchHit]] = [[] for _ in batch]
+
+        by_top_k: dict[int, list[int]] = {}
+        for i, pending in enumerate(batch):
+            by_top_k.setdefault(pending.top_k, []).append(i)
+
+        for top_k, rows in by_top_k.items():
+            hits = self.index.search(
+                embeddings[rows], top_k, filenames=[batch[i].filename for i in rows]
+            )
+            for i, row_hits in zip(rows, hits, strict=True):
+                results[i] = row_hits
+        return results
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
 
 import state
 from auth import verify_api_key
@@ -17,13 +18,13 @@ async def delete_document(
 ) -> dict:
     """Delete a specific document from the store.
 
-    Phase 3: Cleanup endpoint to remove old documents from memory.
+    Phase 3: Cleanup endpoint to remove old documents from the index.
     Prevents confusion when switching between different PDFs.
     """
-    if filename not in state._document_store:
+    removed = await run_in_threadpool(state._document_index.remove, filename)
+    if not removed:
         raise HTTPException(status_code=404, detail=f"Document '{filename}' not found")
 
-    del state._document_store[filename]
     print(f"[RAG Service] Deleted document: {filename}")
 
     return {"status": "deleted", "filename": filename}
@@ -38,8 +39,7 @@ async def clear_all_documents(
     Phase 3: Nuclear option - wipe entire document store.
     Useful for resetting state or clearing accumulated old docs.
     """
-    count = len(state._document_store)
-    state._document_store.clear()
+    count = await run_in_threadpool(state._document_index.clear)
     print(f"[RAG Service] Cleared {count} documents from store")
 
     return {"status": "cleared", "count": count}
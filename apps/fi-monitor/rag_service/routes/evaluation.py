@@ -4,13 +4,11 @@ from __future__ import annotations
 
 import time
 
-import numpy as np
 from fastapi import APIRouter, Depends, HTTPException
 
 import state
 from annotations import generate_annotations_for_document
 from auth import verify_api_key
-from gpu import DEVICE
 from metrics import compute_all_metrics
 from schemas import (
     AnnotationEntry,
@@ -48,13 +46,13 @@ async def generate_annotations(
              -H "Content-Type: application/json" \\
              -d '{"filename":"diabetes.pdf","questions_per_chunk":2}'
     """
-    if request.filename not in state._document_store:
+    if request.filename not in state._document_index:
         raise HTTPException(status_code=404, detail=f"Document '{request.filename}' not found")
 
     try:
         start_time = time.time()
 
-        chunks = state._document_store[request.filename]["chunks"]
+        chunks = state._document_index.chunks(request.filename)
 
         # Generate annotations with LLM
         annotations = await generate_annotations_for_document(
@@ -182,7 +180,7 @@ async def evaluate_query(
              -H "Content-Type: application/json" \\
              -d '{"query":"What is blood sugar?","filename":"diabetes.pdf","top_k":3}'
     """
-    if request.filename not in state._document_store:
+    if request.filename not in state._document_index:
         raise HTTPException(status_code=404, detail=f"Document '{request.filename}' not found")
 
     if request.filename not in state._ground_truth_store:
@@ -196,24 +194,11 @@ async def evaluate_query(
         raise HTTPException(status_code=503, detail="Model not loaded yet")
 
     try:
-        # Get query embedding
-        query_embedding = state._model.encode(
-            [request.query], convert_to_numpy=True, show_progress_bar=False, device=DEVICE
-        )[0]
-
-        # Search in document
-        doc_data = state._document_store[request.filename]
-        chunks = doc_data["chunks"]
-        embeddings = doc_data["embeddings"]
-
-        # Compute similarities
-        query_norm = query_embedding / np.linalg.norm(query_embedding)
-        embeddings_norm = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
-        similarities = embeddings_norm @ query_norm
-
-        # Get top-k chunk indices
-        top_indices = np.argsort(similarities)[::-1][: request.top_k]
-        retrieved_chunks = top_indices.tolist()
+        # Search in document (batched encode + scoring, off the event loop)
+        hits = await state._query_batcher.search(
+            request.query, top_k=request.top_k, filename=request.filename
+        )
+        retrieved_chunks = [hit.chunk_index for hit in hits]
 
         # 2. Find ground truth for this query
         ground_truth_annotations = state._ground_truth_store[request.filename]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, status
 
 import state
@@ -41,7 +40,7 @@ async def query_documents(
             detail="Model not loaded yet",
         )
 
-    if not state._document_store:
+    if len(state._document_index) == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No documents uploaded yet. Upload a PDF first.",
@@ -51,48 +50,16 @@ async def query_documents(
         # 1. Preprocess query (remove filler words for better matching)
         processed_query = preprocess_query(request.query)
 
-        # 2. Generate query embedding (use processed query)
-        query_embedding = state._model.encode(
-            [processed_query],
-            convert_to_numpy=True,
-            show_progress_bar=False,
-            device=DEVICE,
-        )[0]  # Get first (and only) embedding
-
-        # 3. Search all documents (or only the specified one)
-        all_results = []
-
-        docs_to_search = [request.filename] if request.filename else list(state._document_store.keys())
-
-        for filename in docs_to_search:
-            if filename not in state._document_store:
-                continue
-
-            doc_data = state._document_store[filename]
-            chunks = doc_data["chunks"]
-            embeddings = doc_data["embeddings"]
-
-            # 4. Compute cosine similarity
-            # Normalize vectors
-            query_norm = query_embedding / np.linalg.norm(query_embedding)
-            embeddings_norm = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
-
-            # Compute similarities
-            similarities = embeddings_norm @ query_norm
-
-            # 5. Get top-K results for this document
-            top_indices = np.argsort(similarities)[::-1][:request.top_k]
-
-            for idx in top_indices:
-                all_results.append({
-                    "filename": filename,
-                    "chunk": chunks[idx],
-                    "similarity": float(similarities[idx]),
-                })
+        # 2. Encode + score off the event loop; concurrent queries share a batch
+        #    and are scored against all documents in one stacked matrix.
+        hits = await state._query_batcher.search(
+            processed_query, top_k=request.top_k, filename=request.filename
+        )
 
-        # 6. Sort all results by similarity and get top-K
-        all_results.sort(key=lambda x: x["similarity"], reverse=True)
-        top_results = all_results[:request.top_k]
+        top_results = [
+            {"filename": hit.filename, "chunk": hit.chunk, "similarity": hit.similarity}
+            for hit in hits
+        ]
 
         print(f"[RAG Service] Query: '{request.query}' -> {len(top_results)} results")
 
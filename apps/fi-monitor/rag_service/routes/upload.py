@@ -5,6 +5,7 @@ from __future__ import annotations
 import base64
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from starlette.concurrency import run_in_threadpool
 
 import state
 from auth import verify_api_key
@@ -61,7 +62,8 @@ async def upload_pdf(
         print(f"[RAG Service] Text chunked: {len(chunks)} chunks")
 
         # 4. Generate embeddings
-        embeddings = state._model.encode(
+        embeddings = await run_in_threadpool(
+            state._model.encode,
             chunks,
             batch_size=32,
             convert_to_numpy=True,
@@ -70,11 +72,8 @@ async def upload_pdf(
         )
         print(f"[RAG Service] Embeddings generated: {embeddings.shape}")
 
-        # 5. Store in document store
-        state._document_store[request.filename] = {
-            "chunks": chunks,
-            "embeddings": embeddings,
-        }
+        # 5. Store in the persistent index (normalized once, here)
+        await run_in_threadpool(state._document_index.add, request.filename, chunks, embeddings)
         print(f"[RAG Service] Document stored: {request.filename}")
 
         return PDFUploadResponse(
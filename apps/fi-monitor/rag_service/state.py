@@ -7,6 +7,10 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
+    from index_store import DocumentIndex
+    from query_batcher import QueryBatcher
+
 _model: SentenceTransformer | None = None
-_document_store: dict[str, dict] = {}
+_document_index: DocumentIndex | None = None
+_query_batcher: QueryBatcher | None = None
 _ground_truth_store: dict[str, list[dict[str, Any]]] = {}
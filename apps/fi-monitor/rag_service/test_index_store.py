@@ -0,0 +1,162 @@
+"""
+Unit tests for the persistent document index and the query batcher.
+
+Covers:
+- Stacked search matches the old per-document loop
+- Per-query filename filter
+- Persistence across reopen (mmap) and copy-on-write generations
+- Micro-batching of concurrent queries
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from index_store import DocumentIndex
+from query_batcher import QueryBatcher
+
+DIM = 16
+
+
+def _docs(rng, n_docs=3, n_chunks=6):
+    return {
+        f"doc{d}.pdf": (
+            [f"doc{d}-{c}" for c in range(n_chunks)],
+            rng.standard_normal((n_chunks, DIM)).astype(np.float32),
+        )
+        for d in range(n_docs)
+    }
+
+
+def _legacy(docs, query, top_k):
+    """Reference: the pre-index per-document scoring loop."""
+    results = []
+    q = query / np.linalg.norm(query)
+    for filename, (chunks, emb) in docs.items():
+        sims = (emb / np.linalg.norm(emb, axis=1, keepdims=True)) @ q
+        for idx in np.argsort(sims)[::-1][:top_k]:
+            results.append((filename, int(idx), float(sims[idx])))
+    results.sort(key=lambda x: x[2], reverse=True)
+    return results[:top_k]
+
+
+class TestDocumentIndex:
+    def test_search_matches_legacy_loop(self, tmp_path):
+        rng = np.random.default_rng(0)
+        docs = _docs(rng)
+        index = DocumentIndex(tmp_path)
+        for filename, (chunks, emb) in docs.items():
+            index.add(filename, chunks, emb)
+
+        queries = rng.standard_normal((4, DIM)).astype(np.float32)
+        for query, hits in zip(queries, index.search(queries, top_k=5)):
+            expected = _legacy(docs, query, 5)
+            assert [(h.filename, h.chunk_index) for h in hits] == [(f, i) for f, i, _ in expected]
+            assert [h.similarity for h in hits] == pytest.approx([s for _, _, s in expected], abs=1e-5)
+            assert all(h.chunk == f"{h.filename[:-4]}-{h.chunk_index}" for h in hits)
+
+    def test_filename_filter(self, tmp_path):
+        rng = np.random.default_rng(1)
+        index = DocumentIndex(tmp_path)
+        for filename, (chunks, emb) in _docs(rng).items():
+            index.add(filename, chunks, emb)
+
+        queries = rng.standard_normal((3, DIM)).astype(np.float32)
+        hits = index.search(queries, top_k=10, filenames=["doc1.pdf", None, "missing.pdf"])
+        assert {h.filename for h in hits[0]} == {"doc1.pdf"}
+        assert len(hits[0]) == 6
+        assert len(hits[1]) == 10
+        assert hits[2] == []
+
+    def test_persists_and_reopens(self, tmp_path):
+        rng = np.random.default_rng(2)
+        docs = _docs(rng)
+        index = DocumentIndex(tmp_path)
+        for filename, (chunks, emb) in docs.items():
+            index.add(filename, chunks, emb)
+        assert index.remove("doc0.pdf")
+        assert not index.remove("doc0.pdf")
+
+        reopened = DocumentIndex(tmp_path)
+        assert reopened.filenames == ["doc1.pdf", "doc2.pdf"]
+        assert reopened.chunks("doc2.pdf") == docs["doc2.pdf"][0]
+        assert isinstance(reopened._snap.matrix, np.memmap)
+        # Only the live generation remains on disk.
+        assert len(list(tmp_path.glob("embeddings-*.npy"))) == 1
+
+        query = rng.standard_normal((1, DIM)).astype(np.float32)
+        assert reopened.search(query, 3) == index.search(query, 3)
+
+    def test_replace_and_clear(self, tmp_path):
+        index = DocumentIndex(tmp_path)
+        index.add("a.pdf", ["x", "y"], np.eye(2, DIM, dtype=np.float32))
+        index.add("a.pdf", ["z"], np.eye(1, DIM, k=3, dtype=np.float32))
+        assert index.total_chunks == 1
+        assert index.chunks("a.pdf") == ["z"]
+        assert index.clear() == 1
+        assert len(DocumentIndex(tmp_path)) == 0
+
+    def test_orphaned_generation_is_ignored(self, tmp_path):
+        index = DocumentIndex(tmp_path)
+        index.add("a.pdf", ["x"], np.ones((1, DIM), dtype=np.float32))
+        # Simulate a crash after writing the next matrix but before the manifest swap.
+        np.save(tmp_path / "embeddings-99.npy", np.zeros((5, DIM), dtype=np.float32))
+
+        reopened = DocumentIndex(tmp_path)
+        assert reopened.filenames == ["a.pdf"]
+        assert not (tmp_path / "embeddings-99.npy").exists()
+
+
+class TestQueryBatcher:
+    def test_concurrent_queries_share_batches(self, tmp_path):
+        rng = np.random.default_rng(3)
+        index = DocumentIndex(tmp_path)
+        for filename, (chunks, emb) in _docs(rng).items():
+            index.add(filename, chunks, emb)
+
+        vectors = {f"q{i}": rng.standard_normal(DIM).astype(np.float32) for i in range(20)}
+        batch_sizes = []
+
+        def encode(texts):
+            batch_sizes.append(len(texts))
+            return np.stack([vectors[t] for t in texts])
+
+        async def run():
+            batcher = QueryBatcher(encode, index, workers=1, max_batch=8, max_wait_ms=20)
+            await batcher.start()
+            try:
+                return await asyncio.gather(
+                    *(batcher.search(t, top_k=3, filename="doc2.pdf" if i % 2 else None)
+                      for i, t in enumerate(vectors))
+                )
+            finally:
+                await batcher.stop()
+
+        results = asyncio.run(run())
+
+        assert sum(batch_sizes) == 20
+        assert max(batch_sizes) > 1
+        for i, (text, hits) in enumerate(zip(vectors, results)):
+            expected = index.search(vectors[text][None, :], 3, ["doc2.pdf" if i % 2 else None])[0]
+            assert [(h.filename, h.chunk_index) for h in hits] == [
+                (h.filename, h.chunk_index) for h in expected
+            ]
+            assert [h.similarity for h in hits] == pytest.approx([h.similarity for h in expected])
+
+    def test_encode_error_propagates(self, tmp_path):
+        index = DocumentIndex(tmp_path)
+        index.add("a.pdf", ["x"], np.ones((1, DIM), dtype=np.float32))
+
+        def encode(texts):
+            raise RuntimeError("CUDA out of memory")
+
+        async def run():
+            batcher = QueryBatcher(encode, index)
+            await batcher.start()
+            try:
+                await batcher.search("q", top_k=1)
+            finally:
+                await batcher.stop()
+
+        with pytest.raises(RuntimeError, match="out of memory"):
+            asyncio.run(run())
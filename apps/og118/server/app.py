@@ -12,6 +12,7 @@ from __future__ import annotations
 import asyncio
 import base64
 import binascii
+import contextlib
 import dataclasses
 import hmac
 import json
@@ -21,9 +22,10 @@ import uuid
 from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
 
-from fastapi import APIRouter, Depends, FastAPI, File, Header, HTTPException, Request, UploadFile
+from fastapi import APIRouter, Depends, FastAPI, File, Header, HTTPException, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.requests import ClientDisconnect
 from pydantic import BaseModel, Field, field_validator
 
 from fi_runner.auth import (
@@ -34,8 +36,16 @@ from fi_runner.auth import (
     make_auth_dependency,
 )
 from fi_runner import MAX_OWNER_INSTRUCTIONS_CHARS
-from fi_runner.rag_store import RagStoreClient
+from fi_runner.rag_store import QuotaExceeded, RagStoreClient
 from conversations import ConversationStore, valid_conversation_id
+from ingest_jobs import (
+    DEFAULT_MAX_PENDING,
+    DEFAULT_MAX_RUNNING,
+    IngestFailure,
+    IngestJob,
+    IngestJobs,
+    JobQueueFull,
+)
 from projects import ProjectRegistry
 from runner import AIRE_CHAT_PROJECT, aire_project_for_chat, build_runner
 from external_engine import stream_external_turn
@@ -61,6 +71,14 @@ from tts import (
     validate_request,
 )
 from tts import build_provider as build_tts_provider
+from tts_stream import (
+    AudioCache,
+    chat_sse_segments,
+    stream_speech,
+    synthesize_cached,
+    text_segments,
+    validate_stream_request,
+)
 
 logger = logging.getLogger("og118")
 
@@ -288,6 +306,21 @@ def get_tts_provider() -> TTSProvider | None:
     return _tts_provider
 
 
+# Content-addressed audio cache shared by both TTS routes. OG118_TTS_CACHE_MB=0
+# turns it off.
+_tts_cache = (
+    AudioCache(int(float(os.getenv("OG118_TTS_CACHE_MB", "64")) * 1024 * 1024))
+    if float(os.getenv("OG118_TTS_CACHE_MB", "64")) > 0
+    else None
+)
+
+
+def get_tts_cache() -> AudioCache | None:
+    """Dependency seam for the TTS audio cache (None = disabled). Overridable in
+    tests so each one starts cold."""
+    return _tts_cache
+
+
 def get_stt_provider() -> STTProvider | None:
     """Dependency seam for STT: returns the configured provider (or None).
     Overridable in tests via app.dependency_overrides, exactly like its TTS
@@ -310,6 +343,21 @@ def get_rag_store() -> RagStoreClient:
     return _rag_store
 
 
+_ingest_jobs = IngestJobs(
+    max_running=int(os.getenv("OG118_INGEST_MAX_RUNNING", str(DEFAULT_MAX_RUNNING))),
+    max_pending=int(os.getenv("OG118_INGEST_MAX_PENDING", str(DEFAULT_MAX_PENDING))),
+)
+
+# How the inline upload maps an ingest failure code to a status.
+_INGEST_FAILURE_STATUS = {"TOO_SHORT_TO_INDEX": 422, "QUOTA_EXCEEDED": 429}
+
+
+def get_ingest_jobs() -> IngestJobs:
+    """Dependency seam for the background-upload jobs (in-memory, see
+    ingest_jobs.py). Overridable in tests so each one starts empty."""
+    return _ingest_jobs
+
+
 _project_registry: ProjectRegistry | None = None
 
 
@@ -656,11 +704,49 @@ async def chat_stream(
     )
 
 
+def _require_tts(provider: TTSProvider | None) -> None:
+    if provider is None:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "code": "TTS_NOT_CONFIGURED",
+                "message": (
+                    "TTS is not configured on this deployment. Set "
+                    "OG118_TTS_ENDPOINT, OG118_TTS_API_KEY and OG118_TTS_DEPLOYMENT."
+                ),
+            },
+        )
+
+
+@contextlib.contextmanager
+def _tts_errors():
+    """Provider failures → the TTS routes' explicit, secret-free HTTP errors."""
+    try:
+        yield
+    except TTSNotConfiguredError as exc:
+        raise HTTPException(
+            status_code=503,
+            detail={"code": "TTS_NOT_CONFIGURED", "message": str(exc)},
+        ) from None
+    except TTSValidationError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "TTS_INVALID_REQUEST", "message": str(exc)},
+        ) from None
+    except TTSUpstreamError as exc:
+        # str(exc) is status-only / type-only by construction (see tts.py) — safe.
+        raise HTTPException(
+            status_code=502,
+            detail={"code": "TTS_UPSTREAM_ERROR", "message": str(exc)},
+        ) from None
+
+
 @router.post("/tts/synthesize")
 async def tts_synthesize(
     req: TTSRequest,
     _: Principal = Depends(get_principal),
     provider: TTSProvider | None = Depends(get_tts_provider),
+    cache: AudioCache | None = Depends(get_tts_cache),
 ) -> Response:
     """Synthesize speech for `text` and return the raw audio blob.
 
@@ -674,17 +760,7 @@ async def tts_synthesize(
       - provider/network error -> 502 TTS_UPSTREAM_ERROR
     No request/response carries any secret value.
     """
-    if provider is None:
-        raise HTTPException(
-            status_code=503,
-            detail={
-                "code": "TTS_NOT_CONFIGURED",
-                "message": (
-                    "TTS is not configured on this deployment. Set "
-                    "OG118_TTS_ENDPOINT, OG118_TTS_API_KEY and OG118_TTS_DEPLOYMENT."
-                ),
-            },
-        )
+    _require_tts(provider)
 
     try:
         validate_request(req.text, req.response_format, req.speed)
@@ -694,24 +770,15 @@ async def tts_synthesize(
             detail={"code": "TTS_INVALID_REQUEST", "message": str(exc)},
         ) from None
 
-    try:
-        audio = await provider.synthesize(
+    with _tts_errors():
+        audio = await synthesize_cached(
+            provider,
+            cache,
             req.text,
             voice=req.voice or "",
             response_format=req.response_format,
             speed=req.speed,
         )
-    except TTSNotConfiguredError as exc:
-        raise HTTPException(
-            status_code=503,
-            detail={"code": "TTS_NOT_CONFIGURED", "message": str(exc)},
-        ) from None
-    except TTSUpstreamError as exc:
-        # str(exc) is status-only / type-only by construction (see tts.py) — safe.
-        raise HTTPException(
-            status_code=502,
-            detail={"code": "TTS_UPSTREAM_ERROR", "message": str(exc)},
-        ) from None
 
     return Response(
         content=audio,
@@ -720,6 +787,141 @@ async def tts_synthesize(
     )
 
 
+class _DuplexStreamingResponse(StreamingResponse):
+    """A StreamingResponse that listens for a disconnect only after the body is read.
+
+    Under ASGI spec < 2.4 (uvicorn says 2.3) Starlette's StreamingResponse runs
+    a disconnect listener that pulls — and DISCARDS — request-body messages
+    while the response streams. /tts/stream with a piped chat SSE body is still
+    reading its request while it answers, so that listener would eat the rest
+    of the answer. This one waits for ``body_done`` (the endpoint stopped
+    reading its body) before it reads ``receive``; an ``http.disconnect`` then
+    cancels the stream, and with it the synthesis still in flight. A client
+    that goes away while the body is still being read surfaces as
+    ClientDisconnect from ``request.stream()`` instead.
+    """
+
+    def __init__(self, content, *, body_done: asyncio.Event, **kwargs) -> None:  # noqa: ANN001, ANN003
+        super().__init__(content, **kwargs)
+        self.body_done = body_done
+
+    async def __call__(self, scope, receive, send) -> None:  # noqa: ANN001
+        async def listen() -> None:
+            await self.body_done.wait()
+            while (await receive())["type"] != "http.disconnect":
+                pass  # the rest of a body the endpoint stopped reading early
+
+        listener = asyncio.create_task(listen())
+        streamer = asyncio.create_task(self.stream_response(send))
+        try:
+            await asyncio.wait((listener, streamer), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            listener.cancel()
+            streamer.cancel()
+            await asyncio.gather(listener, streamer, return_exceptions=True)
+        if streamer.cancelled():
+            logger.info("tts stream: client disconnected, synthesis cancelled")
+            return
+        streamer.result()
+
+
+@router.post("/tts/stream")
+async def tts_stream(
+    request: Request,
+    voice: str | None = None,
+    response_format: str = DEFAULT_FORMAT,
+    speed: float = 1.0,
+    _: Principal = Depends(get_principal),
+    provider: TTSProvider | None = Depends(get_tts_provider),
+    cache: AudioCache | None = Depends(get_tts_cache),
+) -> Response:
+    """Speak text sentence by sentence: audio starts after the FIRST sentence.
+
+    Two bodies:
+      - ``application/json`` — a TTSRequest (``text`` up to
+        tts_stream.MAX_STREAM_TEXT_CHARS; its fields win over the query).
+      - ``text/event-stream`` — a /chat/stream response piped straight in; the
+        answer is spoken while it is still being generated. Voice, format and
+        speed come from the query string.
+
+    Segments are synthesized concurrently and streamed in order as one audio
+    body (streamable formats only: mp3/aac/opus/pcm), through the shared audio
+    cache. The first segment is synthesized before the response starts, so
+    configuration/input/provider failures keep /tts/synthesize's explicit
+    503/400/502; a provider failure LATER can only end the audio early (logged).
+    Nothing speakable in the body → 204.
+    """
+    _require_tts(provider)
+    body_done = asyncio.Event()
+    if request.headers.get("content-type", "").startswith("text/event-stream"):
+
+        async def sse_segments() -> AsyncIterator[str]:
+            try:
+                async with contextlib.aclosing(chat_sse_segments(request.stream())) as segments:
+                    async for segment in segments:
+                        yield segment
+            finally:
+                body_done.set()
+
+        segments = sse_segments()
+    else:
+        try:
+            req = TTSRequest.model_validate(await request.json())
+        except ValueError as exc:  # malformed JSON or a pydantic ValidationError
+            raise HTTPException(
+                status_code=400,
+                detail={"code": "TTS_INVALID_REQUEST", "message": f"invalid body: {type(exc).__name__}"},
+            ) from None
+        if not req.text.strip():
+            raise HTTPException(
+                status_code=400,
+                detail={"code": "TTS_INVALID_REQUEST", "message": "text cannot be empty"},
+            )
+        voice, response_format, speed = req.voice, req.response_format, req.speed
+        segments = text_segments(req.text)
+        body_done.set()
+
+    try:
+        validate_stream_request(response_format, speed)
+    except TTSValidationError as exc:
+        raise HTTPException(
+            status_code=400,
+            detail={"code": "TTS_INVALID_REQUEST", "message": str(exc)},
+        ) from None
+
+    audio = stream_speech(
+        segments,
+        provider,
+        voice=voice or "",
+        response_format=response_format,
+        speed=speed,
+        cache=cache,
+    )
+    with _tts_errors():
+        first = await anext(audio, None)
+    if first is None:
+        return Response(status_code=204)
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            yield first
+            async for chunk in audio:
+                yield chunk
+        except (TTSNotConfiguredError, TTSUpstreamError, TTSValidationError) as exc:
+            logger.warning("tts stream ended early: %s", exc)
+        except ClientDisconnect:
+            logger.info("tts stream: client disconnected while its body was being read")
+        finally:
+            await audio.aclose()
+
+    return _DuplexStreamingResponse(
+        body(),
+        body_done=body_done,
+        media_type=content_type_for(response_format),
+        headers={"Cache-Control": "private, max-age=0, no-store", "X-Accel-Buffering": "no"},
+    )
+
+
 class TranscriptResponse(BaseModel):
     text: str
 
@@ -956,21 +1158,28 @@ async def delete_project(
     return {"deleted": project_id}
 
 
-@router.post("/projects/{project_id}/upload")
+@router.post("/projects/{project_id}/upload", response_model=None)
 async def upload_project_document(
     project_id: str,
     file: UploadFile = File(...),
+    background: bool = Query(False),
     principal: Principal = Depends(get_principal),
     registry: ProjectRegistry = Depends(get_project_registry),
     rag: RagStoreClient = Depends(get_rag_store),
-) -> dict:
+    jobs: IngestJobs = Depends(get_ingest_jobs),
+) -> dict | JSONResponse:
     """Ingest a text document into the project's corpus (corpus_id=project_id).
 
     The caller must OWN the project (404 otherwise — no existence probing). Plain
     text in (txt/md): the bytes are decoded as UTF-8, chunked + persisted under the
     file's name. Binary/non-UTF-8 or empty → 400 (PDF/DOCX extraction is the
     caller's job). The agent's rag_store tools then search this corpus when the
-    project is the active corpus (see fi_runner.active_corpus_binding)."""
+    project is the active corpus (see fi_runner.active_corpus_binding).
+
+    ``?background=1`` validates the same way, then answers 202 with a job
+    (``GET .../uploads/{jobId}`` / ``.../events``) instead of waiting for the
+    embedding — see ingest_jobs.py. Failures that the inline path reports as
+    4xx (too short, over quota) end the job as ``failed`` with the same code."""
     # Ownership enforced for real accounts; the legacy single shared account
     # (bearer mode) skips it so pre-registry corpora keep working.
     if not principal.is_legacy_bearer and not registry.owns(project_id, principal.sub):
@@ -1002,27 +1211,81 @@ async def upload_project_document(
             status_code=400, detail={"code": "EMPTY_FILE", "message": "uploaded file has no text"}
         )
     doc_id = file.filename or "document.txt"
-    # min_chunk_size lowered from fi-core's default (100 TOKENS): papelería docs
-    # (inventory lists, short notes) are short and would otherwise yield 0 chunks.
-    chunks = await rag.ingest(project_id, doc_id, text, min_chunk_size=20)
-    if chunks == 0:
-        # Non-empty text that produced no chunks = below the chunker's floor (a
-        # one-line note). Nothing was indexed, so the doc is unsearchable. Fail
-        # LOUD instead of a silent 200 that looks ingested but answers nothing.
+
+    async def ingest(progress: Callable[[dict], None] | None = None) -> int:
+        # min_chunk_size lowered from fi-core's default (100 TOKENS): papelería docs
+        # (inventory lists, short notes) are short and would otherwise yield 0 chunks.
+        try:
+            chunks = await rag.ingest(project_id, doc_id, text, min_chunk_size=20, on_progress=progress)
+        except QuotaExceeded as exc:
+            raise IngestFailure("QUOTA_EXCEEDED", str(exc)) from exc
+        if chunks == 0:
+            # Non-empty text that produced no chunks = below the chunker's floor (a
+            # one-line note). Nothing was indexed, so the doc is unsearchable. Fail
+            # LOUD instead of a silent 200 that looks ingested but answers nothing.
+            raise IngestFailure("TOO_SHORT_TO_INDEX", "document is too short to index; add more text and re-upload")
+        # Adding knowledge IS activity on the project: without this the index page
+        # would sort a project someone just fed to the bottom, under ones untouched
+        # for weeks.
+        registry.touch(project_id, principal.sub)
+        return chunks
+
+    if background:
+        try:
+            job = jobs.submit(owner=principal.sub, project_id=project_id, doc_id=doc_id, run=ingest)
+        except JobQueueFull:
+            raise HTTPException(
+                status_code=429,
+                detail={"code": "INGEST_QUEUE_FULL", "message": "too many documents being indexed; retry shortly"},
+            ) from None
+        return JSONResponse(status_code=202, content={"corpus_id": project_id, "doc_id": doc_id, "job": job.snapshot()})
+    try:
+        chunks = await ingest()
+    except IngestFailure as exc:
         raise HTTPException(
-            status_code=422,
-            detail={
-                "code": "TOO_SHORT_TO_INDEX",
-                "message": "document is too short to index; add more text and re-upload",
-            },
-        )
-    # Adding knowledge IS activity on the project: without this the index page
-    # would sort a project someone just fed to the bottom, under ones untouched
-    # for weeks.
-    registry.touch(project_id, principal.sub)
+            status_code=_INGEST_FAILURE_STATUS.get(exc.code, 500),
+            detail={"code": exc.code, "message": exc.message},
+        ) from None
     return {"corpus_id": project_id, "doc_id": doc_id, "chunks": chunks}
 
 
+def _owned_job(project_id: str, job_id: str, principal: Principal, jobs: IngestJobs) -> IngestJob:
+    job = jobs.get(job_id, principal.sub)
+    if job is None or job.project_id != project_id:
+        raise HTTPException(status_code=404, detail="upload job not found")
+    return job
+
+
+@router.get("/projects/{project_id}/uploads/{job_id}")
+async def get_upload_job(
+    project_id: str,
+    job_id: str,
+    principal: Principal = Depends(get_principal),
+    jobs: IngestJobs = Depends(get_ingest_jobs),
+) -> dict:
+    """A background upload's state (`?background=1` on the upload). Only the
+    account that submitted it sees it — 404 otherwise, like the projects."""
+    return {"job": _owned_job(project_id, job_id, principal, jobs).snapshot()}
+
+
+@router.get("/projects/{project_id}/uploads/{job_id}/events")
+async def stream_upload_job(
+    project_id: str,
+    job_id: str,
+    principal: Principal = Depends(get_principal),
+    jobs: IngestJobs = Depends(get_ingest_jobs),
+) -> StreamingResponse:
+    """The job as SSE: one `data:` snapshot now and one per change (chunked,
+    each bulk write, done/failed). The stream ends with the final state."""
+    job = _owned_job(project_id, job_id, principal, jobs)
+
+    async def events() -> AsyncIterator[str]:
+        async for snapshot in jobs.watch(job):
+            yield _sse(snapshot)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 # Hard ceiling on one persisted conversation (sanitized transcript JSON). A
 # runaway thread gets rejected loud instead of growing an unbounded file on the
 # single-replica volume. 16 MB (was 4): attached images persist base64-inline in
@@ -1030,6 +1293,9 @@ async def upload_project_document(
 # hundred KB, so this holds dozens of images before a thread hits the wall.
 MAX_CONVERSATION_BYTES = 16 * 1024 * 1024
 
+# Largest ``?limit=`` page of GET /conversations.
+MAX_CONVERSATION_PAGE = 500
+
 
 class ConversationRecordRequest(BaseModel):
     """The core ConversationRecord shape (fi-glass sanitizes upstream: messages
@@ -1061,6 +1327,8 @@ class ConversationRecordRequest(BaseModel):
 @router.get("/conversations")
 async def list_conversations(
     projectId: str | None = None,
+    offset: int = Query(0, ge=0),
+    limit: int | None = Query(None, ge=1, le=MAX_CONVERSATION_PAGE),
     principal: Principal = Depends(get_principal),
     store: ConversationStore = Depends(get_conversation_store),
 ) -> dict:
@@ -1070,11 +1338,20 @@ async def list_conversations(
     detail page. Filtered here rather than in the client because the client would
     otherwise download every conversation in the account to show the handful that
     belong to the project it is looking at.
+
+    ``?limit=`` (with ``?offset=``) pages the list; the response then carries
+    ``nextOffset`` (null on the last page). Without ``limit`` the whole list is
+    returned, as before — the summary index makes that one small read either way.
     """
-    conversations = store.list_for(principal.sub)
-    if projectId is not None:
-        conversations = [c for c in conversations if c.get("projectId") == projectId]
-    return {"conversations": conversations}
+    if limit is None:
+        return {"conversations": store.list_for(principal.sub, project_id=projectId, offset=offset)}
+    # One extra row tells "last page" apart from "exactly full page".
+    page = store.list_for(principal.sub, project_id=projectId, offset=offset, limit=limit + 1)
+    more = len(page) > limit
+    return {
+        "conversations": page[:limit],
+        "nextOffset": offset + limit if more else None,
+    }
 
 
 @router.get("/conversations/{conversation_id}")
@@ -12,6 +12,21 @@ turn). Ownership is structural: a caller can only ever read its own directory,
 so cross-account ids resolve to "missing" (404, never 403 — no existence
 probing, same invariant as projects). Writes are atomic (temp + os.replace)
 under an in-process lock; single replica = single writer.
+
+Listing reads a per-owner SUMMARY INDEX (``<owner_dir>/.summaries.jsonl``),
+never the records: the sidebar asks for the light list on every load, and
+globbing + parsing every transcript made that cost grow with the account's
+total message volume (~1k conversations = hundreds of MB read per listing).
+The index is an append-only journal of summary lines — ``put`` appends the new
+summary, ``delete`` a ``{"id", "deleted": true}`` tombstone — folded last-wins
+on read. Appending keeps the per-turn write O(1) (the property above: no
+monolithic rewrite per turn); the journal is compacted (temp + os.replace) by
+the listing that finds it more than half dead. A torn final line (crash mid-
+append) is skipped. The record is written BEFORE its index line, so a crash in
+between leaves a stale summary, never a summary without a record; a missing
+index (first listing after upgrade, or a deliberate repair) is rebuilt from the
+records — :meth:`ConversationStore.rebuild_index` /
+``scripts/rebuild_conversation_index.py`` force that.
 """
 
 from __future__ import annotations
@@ -25,6 +40,12 @@ from pathlib import Path
 
 _ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
 
+# Leading dot + ``.jsonl``: never matches a record path (ids have no dots) nor
+# the ``*.json`` record glob.
+INDEX_NAME = ".summaries.jsonl"
+# A journal with more than (2 × live + this) lines is compacted on listing.
+_COMPACT_SLACK = 64
+
 SUMMARY_FIELDS = (
     "id",
     "title",
@@ -41,6 +62,14 @@ SUMMARY_FIELDS = (
 )
 
 
+def _summary(record: dict) -> dict:
+    return {k: record[k] for k in SUMMARY_FIELDS if record.get(k) is not None}
+
+
+def _newest_first(summaries) -> list[dict]:
+    return sorted(summaries, key=lambda s: s.get("updatedAt") or "", reverse=True)
+
+
 def valid_conversation_id(conversation_id: str) -> bool:
     """True for filesystem-safe ids (UUIDs qualify). Anything else — path
     separators, dots, empty — is rejected before it ever touches a Path."""
@@ -61,24 +90,121 @@ class ConversationStore:
             raise ValueError(f"invalid conversation id: {conversation_id!r}")
         return self._owner_dir(owner) / f"{conversation_id}.json"
 
-    def list_for(self, owner: str) -> list[dict]:
-        """The owner's conversations as light summaries (no messages), newest
-        ``updatedAt`` first."""
-        owner_dir = self._owner_dir(owner)
-        if not owner_dir.is_dir():
-            return []
-        summaries: list[dict] = []
+    # -- summary index ------------------------------------------------------
+
+    def _append_index(self, owner_dir: Path, entry: dict) -> None:
+        """Journal one summary / tombstone (caller holds the lock).
+
+        With no index yet the owner may still have records from before it
+        existed — rebuild (which already sees the record just written) instead
+        of starting a journal that would hide them.
+        """
+        path = owner_dir / INDEX_NAME
+        if not path.exists():
+            self._rebuild(owner_dir)
+            return
+        with open(path, "a+b") as fh:
+            line = json.dumps(entry).encode("utf-8") + b"\n"
+            if fh.tell():
+                fh.seek(-1, os.SEEK_END)
+                if fh.read(1) != b"\n":
+                    line = b"\n" + line  # fence off a torn tail
+            fh.write(line)
+
+    @staticmethod
+    def _read_index(owner_dir: Path) -> tuple[dict[str, dict], int] | None:
+        """Fold the journal: ``({id: summary}, line_count)``, None if absent."""
+        try:
+            text = (owner_dir / INDEX_NAME).read_text("utf-8")
+        except FileNotFoundError:
+            return None
+        summaries: dict[str, dict] = {}
+        lines = 0
+        for line in text.splitlines():
+            if not line:
+                continue
+            lines += 1
+            try:
+                entry = json.loads(line)
+                cid = entry["id"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue  # torn tail of an interrupted append
+            if entry.get("deleted"):
+                summaries.pop(cid, None)
+            else:
+                summaries[cid] = entry
+        return summaries, lines
+
+    @staticmethod
+    def _write_index(owner_dir: Path, summaries: dict[str, dict]) -> None:
+        path = owner_dir / INDEX_NAME
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text("".join(json.dumps(s) + "\n" for s in summaries.values()), "utf-8")
+        os.replace(tmp, path)
+
+    def _rebuild(self, owner_dir: Path) -> dict[str, dict]:
+        """Re-derive the index from the records (caller holds the lock)."""
+        summaries: dict[str, dict] = {}
         for path in owner_dir.glob("*.json"):
             try:
                 record = json.loads(path.read_text("utf-8"))
             except (json.JSONDecodeError, OSError):
                 continue
-            summaries.append(
-                {k: record[k] for k in SUMMARY_FIELDS if record.get(k) is not None}
-            )
-        summaries.sort(key=lambda s: s.get("updatedAt") or "", reverse=True)
+            summaries[path.stem] = _summary(record)
+        self._write_index(owner_dir, summaries)
         return summaries
 
+    def rebuild_index(self, owner: str) -> int:
+        """Rebuild one owner's index from its records (repair). Returns how many
+        conversations it lists."""
+        owner_dir = self._owner_dir(owner)
+        if not owner_dir.is_dir():
+            return 0
+        with self._lock:
+            return len(self._rebuild(owner_dir))
+
+    def rebuild_all(self) -> dict[str, int]:
+        """Rebuild every owner's index — ``{owner_dir_name: conversations}``.
+        Owners are only known by their hashed directory here, hence the keys."""
+        rebuilt: dict[str, int] = {}
+        with self._lock:
+            for owner_dir in sorted(p for p in self._root.iterdir() if p.is_dir()):
+                rebuilt[owner_dir.name] = len(self._rebuild(owner_dir))
+        return rebuilt
+
+    # -- records --------------------------------------------------------------
+
+    def list_for(
+        self,
+        owner: str,
+        *,
+        project_id: str | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """The owner's conversations as light summaries (no messages), newest
+        ``updatedAt`` first — read from the summary index, never the records.
+
+        ``project_id`` filters BEFORE ``offset``/``limit`` slice, so pages of a
+        project's list are pages of that list.
+        """
+        owner_dir = self._owner_dir(owner)
+        if not owner_dir.is_dir():
+            return []
+        with self._lock:
+            folded = self._read_index(owner_dir)
+            if folded is None:
+                summaries = self._rebuild(owner_dir)
+            else:
+                summaries, lines = folded
+                if lines > 2 * len(summaries) + _COMPACT_SLACK:
+                    self._write_index(owner_dir, summaries)
+        listed = summaries.values()
+        if project_id is not None:
+            listed = [s for s in listed if s.get("projectId") == project_id]
+        ordered = _newest_first(listed)
+        return ordered[offset : None if limit is None else offset + limit]
+
     def get(self, owner: str, conversation_id: str) -> dict | None:
         try:
             path = self._record_path(owner, conversation_id)
@@ -96,6 +222,7 @@ class ConversationStore:
             tmp = path.with_suffix(path.suffix + ".tmp")
             tmp.write_text(json.dumps(record), "utf-8")
             os.replace(tmp, path)
+            self._append_index(path.parent, _summary(record))
 
     def delete(self, owner: str, conversation_id: str) -> None:
         """Remove the record (no-op if absent — mirrors the client contract)."""
@@ -107,7 +234,8 @@ class ConversationStore:
             try:
                 path.unlink()
             except FileNotFoundError:
-                pass
+                return
+            self._append_index(path.parent, {"id": conversation_id, "deleted": True})
 
     def clear_for(self, owner: str) -> int:
         """Remove every conversation the owner has. Returns how many."""
@@ -122,4 +250,5 @@ class ConversationStore:
                     removed += 1
                 except FileNotFoundError:
                     pass
+            self._write_index(owner_dir, {})
         return removed
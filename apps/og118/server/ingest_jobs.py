@@ -0,0 +1,197 @@
+"""og118 background document ingestion — job ids, progress events, bounded work.
+
+`POST /projects/{id}/upload` used to chunk, embed and persist the document
+INSIDE the request: a long document (or a batch of files dropped on the
+knowledge rail) held each request open for the whole pipeline, one embedding
+call per chunk. Now the request only does the cheap, fail-fast part — size cap,
+UTF-8 decode, emptiness — and, with `?background=1`, hands the rest to a job
+and answers 202 with a job id:
+
+  * the job runs `RagStoreClient.ingest`, which embeds chunks in batches and
+    writes each batch while the next one embeds (fi-core's
+    `fi_core.rag.ingest` pipeline); its progress callbacks update the job;
+  * `GET /projects/{id}/uploads/{job}` returns the job, and `.../events`
+    streams every change as SSE until it is done or failed;
+  * at most `max_running` jobs embed at once and at most `max_pending` are
+    unfinished — past that `submit` raises `JobQueueFull` (the route turns it
+    into a 429) instead of queueing unbounded text in RAM;
+  * jobs for the SAME document run in submission order (a re-upload must not
+    race the replace of the one before it);
+  * re-uploading unchanged content finishes as `unchanged` without embedding
+    anything (chunk-hash check in fi-core).
+
+Jobs live in memory: og118 is a single replica, and a job lost to a restart
+is a re-upload — the corpus itself is on the volume. Finished jobs are kept
+(`keep_finished`) so a client polling late still gets the outcome.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+logger = logging.getLogger("og118.ingest")
+
+DEFAULT_MAX_RUNNING = 2
+DEFAULT_MAX_PENDING = 32
+DEFAULT_KEEP_FINISHED = 200
+
+TERMINAL = frozenset({"done", "failed"})
+
+
+class JobQueueFull(RuntimeError):
+    """Too many ingestion jobs already queued — retry later."""
+
+
+class IngestFailure(RuntimeError):
+    """A job failure with a client-facing code (the same codes as the
+    synchronous upload's 4xx `detail.code`)."""
+
+    def __init__(self, code: str, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class IngestJob:
+    """One upload being ingested. `stage` follows fi-core's progress events
+    (`queued` → `chunked` → `stored`…, or `unchanged`)."""
+
+    id: str
+    owner: str
+    project_id: str
+    doc_id: str
+    status: str = "queued"
+    stage: str = "queued"
+    chunks: int | None = None
+    chunks_stored: int = 0
+    duplicates: int = 0
+    error: dict | None = None
+    created_at: str = field(default_factory=_now)
+    finished_at: str | None = None
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in TERMINAL
+
+    def snapshot(self) -> dict:
+        return {
+            "jobId": self.id,
+            "projectId": self.project_id,
+            "docId": self.doc_id,
+            "status": self.status,
+            "stage": self.stage,
+            "chunks": self.chunks,
+            "chunksStored": self.chunks_stored,
+            "duplicates": self.duplicates,
+            "error": self.error,
+            "createdAt": self.created_at,
+            "finishedAt": self.finished_at,
+        }
+
+    def _update(self, **changes) -> None:
+        for key, value in changes.items():
+            setattr(self, key, value)
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+
+# What a job runs: the ingest itself, given the progress callback to report
+# through. Returns the chunk count.
+IngestRun = Callable[[Callable[[dict], None]], Awaitable[int]]
+
+
+class IngestJobs:
+    """In-memory job registry + bounded background runner (see module docstring)."""
+
+    def __init__(
+        self,
+        *,
+        max_running: int = DEFAULT_MAX_RUNNING,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        keep_finished: int = DEFAULT_KEEP_FINISHED,
+    ) -> None:
+        self._running = asyncio.Semaphore(max(1, max_running))
+        self._max_pending = max_pending
+        self._keep_finished = keep_finished
+        self._jobs: OrderedDict[str, IngestJob] = OrderedDict()
+        # (project, doc) → [lock, jobs using it]; dropped when the last one ends.
+        self._doc_locks: dict[tuple[str, str], list] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def submit(self, *, owner: str, project_id: str, doc_id: str, run: IngestRun) -> IngestJob:
+        """Queue `run` as a job and return it at once. Raises `JobQueueFull`."""
+        if sum(1 for j in self._jobs.values() if not j.finished) >= self._max_pending:
+            raise JobQueueFull(f"{self._max_pending} ingestion jobs already pending")
+        job = IngestJob(id=uuid.uuid4().hex, owner=owner, project_id=project_id, doc_id=doc_id)
+        self._jobs[job.id] = job
+        task = asyncio.get_running_loop().create_task(self._run(job, run))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return job
+
+    def get(self, job_id: str, owner: str) -> IngestJob | None:
+        """The job, only for the account that submitted it."""
+        job = self._jobs.get(job_id)
+        return job if job is not None and job.owner == owner else None
+
+    async def watch(self, job: IngestJob) -> AsyncIterator[dict]:
+        """A snapshot now and after every change, ending with the final one."""
+        while True:
+            changed = job._changed
+            yield job.snapshot()
+            if job.finished:
+                return
+            await changed.wait()
+
+    async def drain(self) -> None:
+        """Wait for every submitted job (tests, shutdown)."""
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def _run(self, job: IngestJob, run: IngestRun) -> None:
+        key = (job.project_id, job.doc_id)
+        entry = self._doc_locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        lock = entry[0]
+        try:
+            async with lock, self._running:
+                job._update(status="running")
+
+                def progress(p: dict) -> None:
+                    job._update(
+                        stage=p["stage"], chunks=p["total"], chunks_stored=p["stored"], duplicates=p["duplicates"]
+                    )
+
+                chunks = await run(progress)
+                job._update(status="done", chunks=chunks, chunks_stored=chunks, finished_at=_now())
+        except IngestFailure as exc:
+            job._update(status="failed", error={"code": exc.code, "message": exc.message}, finished_at=_now())
+        except Exception:
+            logger.exception("ingestion job %s (%s/%s) failed", job.id, job.project_id, job.doc_id)
+            job._update(
+                status="failed",
+                error={"code": "INGEST_FAILED", "message": "the document could not be indexed; try again"},
+                finished_at=_now(),
+            )
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                self._doc_locks.pop(key, None)
+            self._forget_old()
+
+    def _forget_old(self) -> None:
+        finished = [j.id for j in self._jobs.values() if j.finished]
+        for job_id in finished[: max(0, len(finished) - self._keep_finished)]:
+            del self._jobs[job_id]
@@ -0,0 +1,88 @@
+"""Benchmark: listing an account's conversations — record scan vs summary index.
+
+Seeds one owner with N conversations (default 1000) of M messages each into a
+temp dir, then times:
+
+- ``scan``  — the pre-index listing: glob + parse every record (what
+  ``ConversationStore._rebuild`` still does, so it is timed through it);
+- ``index`` — ``list_for`` reading the folded summary index;
+- ``page``  — ``list_for(limit=50)``, the first sidebar page.
+
+Local disk; on the Azure Files volume the scan's per-file round-trips make the
+gap far wider.
+
+Usage: bench_conversation_list.py [--conversations N] [--messages M] [--runs R]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from conversations import ConversationStore  # noqa: E402
+
+_OWNER = "bench-owner"
+
+
+def _seed(store: ConversationStore, conversations: int, messages: int) -> None:
+    body = "lorem ipsum dolor sit amet " * 20
+    for i in range(conversations):
+        stamp = f"2026-07-{1 + i % 28:02d}T{i % 24:02d}:{i % 60:02d}:00Z"
+        store.put(
+            _OWNER,
+            {
+                "id": f"conv-{i:05d}",
+                "title": f"Conversación {i}",
+                "createdAt": stamp,
+                "updatedAt": stamp,
+                "messages": [
+                    {"role": "user" if m % 2 else "assistant", "content": body}
+                    for m in range(messages)
+                ],
+                "preview": body[:80],
+                "schemaVersion": 1,
+            },
+        )
+
+
+def _time(fn, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--conversations", type=int, default=1000)
+    ap.add_argument("--messages", type=int, default=40)
+    ap.add_argument("--runs", type=int, default=5)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        store = ConversationStore(root)
+        _seed(store, args.conversations, args.messages)
+        owner_dir = store._owner_dir(_OWNER)
+        records_mb = sum(p.stat().st_size for p in owner_dir.glob("*.json")) / 1e6
+        index_kb = (owner_dir / ".summaries.jsonl").stat().st_size / 1e3
+        print(f"{args.conversations} conversations × {args.messages} messages: "
+              f"records {records_mb:.1f} MB, index {index_kb:.0f} KB")
+        scan = _time(lambda: store._rebuild(owner_dir), args.runs)
+        index = _time(lambda: store.list_for(_OWNER), args.runs)
+        page = _time(lambda: store.list_for(_OWNER, limit=50), args.runs)
+        print(f"scan  {scan:8.1f} ms")
+        print(f"index {index:8.1f} ms  ({scan / index:.0f}× faster)")
+        print(f"page  {page:8.1f} ms  (limit=50)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Benchmark: time-to-first-audio — one-shot /tts/synthesize vs /tts/stream.
+
+A local fake provider models synthesis latency as a fixed floor plus a per-
+character cost (defaults shaped like Azure OpenAI tts-1: ~350 ms + ~4 ms/char);
+a fake chat stream emits the answer as token deltas at a fixed rate. Measured,
+with real sleeps, on the actual pipeline (tts_stream.chat_sse_segments +
+stream_speech) — no network, no key:
+
+- ``one-shot`` — the pre-stream flow: wait for the whole answer, then one
+  synthesize call for all of it; first audio = generation + synthesis.
+- ``stream``   — the chat SSE piped through the sentence pipeline; first audio
+  = first sentence generated + one short synthesis.
+- ``stream (cached)`` — the same answer again (replay): every segment a cache hit.
+
+Usage: bench_tts_stream.py [--sentences N] [--tok-s R] [--concurrency C]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tts_stream import AudioCache, chat_sse_segments, stream_speech  # noqa: E402
+
+_SENTENCE = "Punto {}: el paciente refiere dolor torácico de inicio súbito, sin irradiación."
+
+
+class _FakeProvider:
+    default_voice = "nova"
+
+    def __init__(self, floor_ms: float, ms_per_char: float) -> None:
+        self.floor_ms = floor_ms
+        self.ms_per_char = ms_per_char
+        self.calls = 0
+
+    async def synthesize(self, text: str, *, voice: str, response_format: str, speed: float) -> bytes:
+        self.calls += 1
+        await asyncio.sleep((self.floor_ms + self.ms_per_char * len(text)) / 1000)
+        return b"\xff\xfb" + text.encode()[:16]
+
+
+async def _chat_sse(answer: str, tok_s: float):
+    """``answer`` as /chat/stream SSE bytes, ~4 chars per token at ``tok_s``."""
+    yield b'data: {"type": "open", "request_id": "bench"}\n\n'
+    for i in range(0, len(answer), 4):
+        await asyncio.sleep(1 / tok_s)
+        yield f"data: {json.dumps({'type': 'text', 'text': answer[i : i + 4]})}\n\n".encode()
+    yield b'data: {"type": "done"}\n\n'
+
+
+async def _one_shot(answer: str, provider: _FakeProvider, tok_s: float) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    async for _ in _chat_sse(answer, tok_s):
+        pass
+    await provider.synthesize(answer, voice="", response_format="mp3", speed=1.0)
+    done = time.perf_counter() - t0
+    return done, done
+
+
+async def _streamed(answer: str, provider: _FakeProvider, tok_s: float, cache, concurrency: int) -> tuple[float, float]:
+    t0 = time.perf_counter()
+    first = None
+    async for _ in stream_speech(
+        chat_sse_segments(_chat_sse(answer, tok_s)),
+        provider,
+        voice="",
+        response_format="mp3",
+        speed=1.0,
+        cache=cache,
+        max_concurrency=concurrency,
+    ):
+        first = first or time.perf_counter() - t0
+    return first or 0.0, time.perf_counter() - t0
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    answer = " ".join(_SENTENCE.format(i + 1) for i in range(args.sentences))
+    provider = _FakeProvider(args.floor_ms, args.ms_per_char)
+    cache = AudioCache(64 * 1024 * 1024)
+    print(f"answer: {args.sentences} sentences, {len(answer)} chars @ {args.tok_s:.0f} tok/s; "
+          f"provider {args.floor_ms:.0f} ms + {args.ms_per_char:g} ms/char; concurrency {args.concurrency}")
+    print(f"{'flow':18s} {'first audio s':>13s} {'last audio s':>12s} {'calls':>5s}")
+    rows = [
+        ("one-shot", lambda: _one_shot(answer, provider, args.tok_s)),
+        ("stream", lambda: _streamed(answer, provider, args.tok_s, cache, args.concurrency)),
+        ("stream (cached)", lambda: _streamed(answer, provider, args.tok_s, cache, args.concurrency)),
+    ]
+    for name, run in rows:
+        before = provider.calls
+        first, last = await run()
+        print(f"{name:18s} {first:>13.2f} {last:>12.2f} {provider.calls - before:>5d}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sentences", type=int, default=8)
+    ap.add_argument("--tok-s", type=float, default=60.0)
+    ap.add_argument("--floor-ms", type=float, default=350.0)
+    ap.add_argument("--ms-per-char", type=float, default=4.0)
+    ap.add_argument("--concurrency", type=int, default=3)
+    asyncio.run(main_async(ap.parse_args()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
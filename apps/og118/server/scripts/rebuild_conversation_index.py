@@ -0,0 +1,39 @@
+"""Rebuild the conversation summary indexes from the records, in place.
+
+Repair for ConversationStore's per-owner ``.summaries.jsonl``: a crash between a
+record write and its index append leaves one stale summary until the next save
+of that conversation; records copied onto the volume by hand are invisible to
+listing until the index knows them. This re-derives every owner's index from
+its ``*.json`` records (the records are the source of truth; the index is
+derived). Safe to run against a live volume only with the app scaled to zero —
+the store's lock is in-process.
+
+Usage: rebuild_conversation_index.py [conversations_root]
+       (default: $OG118_CONVERSATIONS_PATH)
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from conversations import ConversationStore  # noqa: E402
+
+
+def main() -> int:
+    root = sys.argv[1] if len(sys.argv) > 1 else os.getenv("OG118_CONVERSATIONS_PATH")
+    if not root or not Path(root).is_dir():
+        print(__doc__, file=sys.stderr)
+        return 2
+    rebuilt = ConversationStore(root).rebuild_all()
+    for owner_dir, count in rebuilt.items():
+        print(f"{owner_dir}  {count} conversations")
+    print(f"rebuilt {len(rebuilt)} owner indexes, {sum(rebuilt.values())} conversations")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,11 +8,13 @@ another account's id is indistinguishable from a missing one.
 
 from __future__ import annotations
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
 import app as app_module
-from conversations import ConversationStore, valid_conversation_id
+from conversations import INDEX_NAME, ConversationStore, valid_conversation_id
 
 
 @pytest.fixture
@@ -187,3 +189,105 @@ def test_unpin_upsert_drops_the_stored_flag(client: TestClient, as_account) -> N
     assert "pinnedAt" not in client.get("/conversations/conv-1").json()
     convs = client.get("/conversations").json()["conversations"]
     assert "pinnedAt" not in convs[0]
+
+
+# -- summary index -------------------------------------------------------------
+
+
+def _index_lines(store: ConversationStore, owner: str) -> list[str]:
+    path = store._owner_dir(owner) / INDEX_NAME
+    return path.read_text("utf-8").splitlines()
+
+
+def test_listing_reads_the_index_not_the_records(conversation_store) -> None:
+    """Once indexed, a record's body is never opened to list it — a record
+    corrupted on disk still lists from its summary."""
+    conversation_store.put("u1", _record("conv-1"))
+    (conversation_store._owner_dir("u1") / "conv-1.json").write_text("{not json", "utf-8")
+    assert [c["id"] for c in conversation_store.list_for("u1")] == ["conv-1"]
+
+
+def test_index_tracks_put_delete_and_clear(conversation_store) -> None:
+    store = conversation_store
+    store.put("u1", _record("conv-1", title="v1"))
+    store.put("u1", _record("conv-2", updated="2026-07-09T00:00:00Z"))
+    store.put("u1", _record("conv-1", title="v2"))
+    assert [(c["id"], c["title"]) for c in store.list_for("u1")] == [
+        ("conv-2", "Hola"),
+        ("conv-1", "v2"),
+    ]
+    store.delete("u1", "conv-2")
+    store.delete("u1", "conv-2")  # absent: no tombstone journaled
+    assert [c["id"] for c in store.list_for("u1")] == ["conv-1"]
+    assert len(_index_lines(store, "u1")) == 4
+    assert store.clear_for("u1") == 1
+    assert store.list_for("u1") == []
+
+
+def test_missing_index_is_rebuilt_from_existing_records(conversation_store, tmp_path) -> None:
+    """Accounts written before the index existed: the first listing — or the
+    first save — derives it from the records instead of hiding them."""
+    owner_dir = conversation_store._owner_dir("u1")
+    owner_dir.mkdir(parents=True)
+    for cid in ("conv-a", "conv-b"):
+        (owner_dir / f"{cid}.json").write_text(json.dumps(_record(cid)), "utf-8")
+    fresh = ConversationStore(tmp_path / "conversations")
+    fresh.put("u1", _record("conv-c", updated="2026-07-09T00:00:00Z"))
+    assert {c["id"] for c in fresh.list_for("u1")} == {"conv-a", "conv-b", "conv-c"}
+    (owner_dir / INDEX_NAME).unlink()
+    assert len(fresh.list_for("u1")) == 3
+    assert (owner_dir / INDEX_NAME).exists()
+
+
+def test_torn_index_tail_is_skipped_and_fenced(conversation_store) -> None:
+    store = conversation_store
+    store.put("u1", _record("conv-1"))
+    with open(store._owner_dir("u1") / INDEX_NAME, "a", encoding="utf-8") as fh:
+        fh.write('{"id": "conv-9", "tit')  # crash mid-append
+    assert [c["id"] for c in store.list_for("u1")] == ["conv-1"]
+    store.put("u1", _record("conv-2", updated="2026-07-09T00:00:00Z"))
+    assert [c["id"] for c in store.list_for("u1")] == ["conv-2", "conv-1"]
+
+
+def test_journal_is_compacted_by_listing(conversation_store) -> None:
+    store = conversation_store
+    for i in range(100):
+        store.put("u1", _record("conv-1", title=f"v{i}"))
+    assert len(_index_lines(store, "u1")) == 100
+    assert store.list_for("u1")[0]["title"] == "v99"
+    assert len(_index_lines(store, "u1")) == 1
+
+
+def test_rebuild_index_repairs_a_stale_summary(conversation_store) -> None:
+    """A crash between the record write and its index append leaves the old
+    summary; the repair command re-derives it from the record."""
+    store = conversation_store
+    store.put("u1", _record("conv-1", title="old"))
+    path = store._owner_dir("u1") / "conv-1.json"
+    path.write_text(json.dumps(_record("conv-1", title="new")), "utf-8")
+    assert store.list_for("u1")[0]["title"] == "old"
+    assert store.rebuild_index("u1") == 1
+    assert store.list_for("u1")[0]["title"] == "new"
+    store.put("u2", _record("conv-2"))
+    assert sorted(store.rebuild_all().values()) == [1, 1]
+
+
+def test_list_paginates_with_next_offset(client: TestClient, as_account) -> None:
+    for i in range(5):
+        record = _record(f"conv-{i}", updated=f"2026-07-0{i + 1}T00:00:00Z")
+        if i % 2:
+            record["projectId"] = "proj-1"
+        _put(client, record)
+    first = client.get("/conversations?limit=2").json()
+    assert [c["id"] for c in first["conversations"]] == ["conv-4", "conv-3"]
+    assert first["nextOffset"] == 2
+    last = client.get("/conversations?limit=2&offset=4").json()
+    assert [c["id"] for c in last["conversations"]] == ["conv-0"]
+    assert last["nextOffset"] is None
+    # The project filter applies before the page is cut.
+    proj = client.get("/conversations?projectId=proj-1&limit=1&offset=1").json()
+    assert [c["id"] for c in proj["conversations"]] == ["conv-1"]
+    assert proj["nextOffset"] is None
+    # Unpaged listing keeps its old shape.
+    assert "nextOffset" not in client.get("/conversations").json()
+    assert client.get("/conversations?limit=0").status_code == 422
@@ -12,6 +12,8 @@ from __future__ import annotations
 
 import asyncio
 import io
+import json
+import time
 
 import pytest
 from fastapi.testclient import TestClient
@@ -105,6 +107,84 @@ def test_upload_too_large_returns_413(client: TestClient, monkeypatch) -> None:
     assert resp.json()["detail"]["code"] == "FILE_TOO_LARGE"
 
 
+# --- background uploads (?background=1): 202 + job id, progress over SSE.
+
+_LONG = "\n\n".join(
+    f"Sección {i}: la papelería vende cuadernos, lápices y mochilas; el margen de la sección {i} "
+    f"depende de la temporada escolar y del proveedor número {i}."
+    for i in range(30)
+)
+
+
+@pytest.fixture
+def jobs():
+    from ingest_jobs import IngestJobs
+
+    fresh = IngestJobs(max_running=1, max_pending=2)
+    app_module.app.dependency_overrides[app_module.get_ingest_jobs] = lambda: fresh
+    return fresh
+
+
+def _wait_job(client: TestClient, pid: str, job_id: str) -> dict:
+    for _ in range(200):
+        job = client.get(f"/projects/{pid}/uploads/{job_id}").json()["job"]
+        if job["status"] in ("done", "failed"):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} never finished: {job}")
+
+
+def test_background_upload_returns_a_job_and_becomes_searchable(store: RagStoreClient, jobs) -> None:
+    with TestClient(app_module.app) as client:
+        pid = _create(client, "Papelería")
+        resp = _upload(client, pid, "secciones.md", _LONG, params={"background": "1"})
+        assert resp.status_code == 202
+        job = resp.json()["job"]
+        assert job["status"] in ("queued", "running") and job["docId"] == "secciones.md"
+        done = _wait_job(client, pid, job["jobId"])
+        assert done["status"] == "done" and done["chunks"] == done["chunksStored"] > 0
+        # The SSE stream of a finished job replays its final state and ends.
+        events = client.get(f"/projects/{pid}/uploads/{job['jobId']}/events")
+        assert events.headers["content-type"].startswith("text/event-stream")
+        assert json.loads(events.text.strip().split("data: ")[-1])["status"] == "done"
+        # Re-uploading the same content is recognised and costs no embedding.
+        again = _upload(client, pid, "secciones.md", _LONG, params={"background": "1"}).json()["job"]
+        assert _wait_job(client, pid, again["jobId"])["stage"] == "unchanged"
+    hits = asyncio.run(store.search(pid, "proveedor número 7"))
+    assert hits and hits[0]["doc_id"] == "secciones.md"
+
+
+def test_background_upload_failures_end_the_job_with_the_inline_code(jobs) -> None:
+    with TestClient(app_module.app) as client:
+        pid = _create(client)
+        job = _upload(client, pid, "nota.md", "Hola mundo", params={"background": "1"}).json()["job"]
+        failed = _wait_job(client, pid, job["jobId"])
+        assert failed["status"] == "failed" and failed["error"]["code"] == "TOO_SHORT_TO_INDEX"
+        # Validation still fails fast, in the request.
+        assert _upload(client, pid, "empty.md", "", params={"background": "1"}).status_code == 400
+
+
+def test_background_jobs_are_private_and_bounded(store: RagStoreClient, jobs, monkeypatch) -> None:
+    gate = asyncio.Event()
+    real_ingest = store.ingest
+
+    async def held(*args, **kwargs):
+        await gate.wait()
+        return await real_ingest(*args, **kwargs)
+
+    monkeypatch.setattr(store, "ingest", held)
+    with TestClient(app_module.app) as client:
+        pid = _create(client)
+        first = _upload(client, pid, "a.md", _LONG, params={"background": "1"}).json()["job"]
+        _upload(client, pid, "b.md", _LONG, params={"background": "1"})
+        full = _upload(client, pid, "c.md", _LONG, params={"background": "1"})
+        assert full.status_code == 429 and full.json()["detail"]["code"] == "INGEST_QUEUE_FULL"
+        assert client.get(f"/projects/{pid}/uploads/nope").status_code == 404
+        assert client.get(f"/projects/other/uploads/{first['jobId']}").status_code == 404
+        client.portal.call(gate.set)
+        assert _wait_job(client, pid, first["jobId"])["status"] == "done"
+
+
 def test_delete_keeps_project_when_corpus_purge_fails(
     client: TestClient, store: RagStoreClient, monkeypatch
 ) -> None:
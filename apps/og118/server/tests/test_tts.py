@@ -1,12 +1,15 @@
 """Tests for the og118 TTS foundation (B3-VOICE-BACKEND-1).
 
-Two layers:
+Three layers:
   * Provider unit tests (tts.py) — validation, config-from-env, request
     construction and secret hygiene, driven by httpx.MockTransport so NOTHING
     touches the network and NO real key is ever needed.
   * Route contract tests (app.py) — the /tts/synthesize HTTP surface: explicit
     503 when unconfigured, 400 on bad input, 200 + audio on success, 401 behind
     the bearer gate, and the invariant that error bodies never echo a secret.
+  * Streaming (tts_stream.py + /tts/stream) — sentence segmentation, ordered
+    bounded-concurrency synthesis, the audio cache, and the route over both a
+    JSON text body and a piped /chat/stream SSE body.
 
 The fake provider deliberately does NOT mask the fact that a real Azure OpenAI
 deployment is required in staging: `test_unconfigured_returns_503` proves the
@@ -16,6 +19,7 @@ gate, and the provider-construction tests prove the real call shape.
 from __future__ import annotations
 
 import asyncio
+import json
 
 import httpx
 import pytest
@@ -23,6 +27,7 @@ from fastapi.testclient import TestClient
 
 import app as app_module
 import tts as tts_module
+import tts_stream
 
 FAKE_AUDIO = b"ID3\x03fake-mp3-payload\x00\x01"
 FAKE_KEY = "sk-test-do-not-leak-1234567890"
@@ -172,6 +177,9 @@ def client() -> TestClient:
 def _clean_state(monkeypatch: pytest.MonkeyPatch):
     # Default: no access token (open) unless a test sets one. Reset overrides after.
     monkeypatch.setattr(app_module, "_ACCESS_TOKEN", None)
+    # Each test starts with a cold audio cache (the app's is process-wide).
+    cache = tts_stream.AudioCache(1 << 20)
+    app_module.app.dependency_overrides[app_module.get_tts_cache] = lambda: cache
     yield
     app_module.app.dependency_overrides.clear()
 
@@ -267,3 +275,247 @@ def test_upstream_error_maps_to_502_without_secret(client: TestClient) -> None:
     body = resp.text
     assert FAKE_KEY not in body
     assert resp.json()["detail"]["code"] == "TTS_UPSTREAM_ERROR"
+
+
+# --- Streaming TTS (tts_stream.py + /tts/stream) --------------------------------
+
+
+class _SegmentProvider:
+    """Echoes each segment as ``<text>`` after ``delay`` s, tracking concurrency."""
+
+    default_voice = "nova"
+
+    def __init__(self, delay: float = 0.0, fail_on: str | None = None) -> None:
+        self.delay = delay
+        self.fail_on = fail_on
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def synthesize(self, text, *, voice, response_format, speed) -> bytes:
+        self.calls.append(text)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.fail_on and self.fail_on in text:
+                raise tts_module.TTSUpstreamError("tts provider returned HTTP 500")
+            return f"<{text}>".encode()
+        finally:
+            self.active -= 1
+
+
+def _override_cache(cache) -> None:
+    app_module.app.dependency_overrides[app_module.get_tts_cache] = lambda: cache
+
+
+def test_splitter_segments_at_confirmed_boundaries() -> None:
+    splitter = tts_stream.SentenceSplitter()
+    assert splitter.feed("La dosis es 2.") == []  # "2." may still become "2.5"
+    assert splitter.feed("5 mg al día. Sí. ") == ["La dosis es 2.5 mg al día."]
+    assert splitter.feed("Dr. Pérez lo confirma.\n- **Nota**: revisar") == [
+        "Sí. Dr. Pérez lo confirma."
+    ]
+    assert splitter.flush() == ["Nota: revisar"]
+
+
+def test_splitter_hard_splits_runs_over_the_provider_cap() -> None:
+    text = ("palabra " * 1200).strip()
+    segments = tts_stream.split_sentences(text)
+    assert len(segments) > 1
+    assert all(len(s) <= tts_module.MAX_TEXT_CHARS for s in segments)
+    assert " ".join(segments) == text
+
+
+def test_stream_speech_is_ordered_and_bounded() -> None:
+    provider = _SegmentProvider(delay=0.02)
+    segments = [f"Frase número {i}." for i in range(8)]
+
+    async def run() -> list[bytes]:
+        return [
+            chunk
+            async for chunk in tts_stream.stream_speech(
+                segments, provider, voice="", response_format="mp3", speed=1.0, max_concurrency=3
+            )
+        ]
+
+    assert asyncio.run(run()) == [f"<{s}>".encode() for s in segments]
+    assert provider.peak == 3
+
+
+def test_cache_skips_repeated_phrases_and_shares_in_flight_calls() -> None:
+    provider = _SegmentProvider(delay=0.01)
+    cache = tts_stream.AudioCache(1 << 20)
+
+    async def run() -> list[bytes]:
+        return [
+            chunk
+            async for chunk in tts_stream.stream_speech(
+                ["¡Claro que sí!", "¡Claro que sí!", "Otra cosa distinta."],
+                provider, voice="", response_format="mp3", speed=1.0, cache=cache,
+            )
+        ]
+
+    assert asyncio.run(run())[0] == asyncio.run(run())[1]
+    assert provider.calls == ["¡Claro que sí!", "Otra cosa distinta."]
+    assert cache.stats()["hits"] == 4
+
+
+def test_cache_is_bounded_by_bytes() -> None:
+    cache = tts_stream.AudioCache(10)
+    cache.put("a", b"123456")
+    cache.put("b", b"123456")
+    assert cache.get("a") is None and cache.get("b") == b"123456"
+    cache.put("huge", b"x" * 11)
+    assert cache.get("huge") is None
+
+
+def test_stream_route_speaks_json_text_in_order(client: TestClient) -> None:
+    provider = _SegmentProvider()
+    _override_provider(provider)
+    _override_cache(tts_stream.AudioCache(1 << 20))
+    resp = client.post(
+        "/tts/stream", json={"text": "Hola, ¿cómo estás hoy? Esto es una prueba.", "response_format": "opus"}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "audio/opus"
+    assert resp.content == "<Hola, ¿cómo estás hoy?><Esto es una prueba.>".encode()
+
+
+def test_stream_route_consumes_chat_sse(client: TestClient) -> None:
+    provider = _SegmentProvider()
+    _override_provider(provider)
+    _override_cache(None)
+    events = [
+        {"type": "open", "request_id": "r1"},
+        {"type": "text", "text": "Un intento que se "},
+        {"type": "retry", "data": {"attempt": 1}},
+        {"type": "text", "text": "Primera frase completa. Segunda "},
+        {"type": "ping"},
+        {"type": "text", "text": "frase final"},
+        {"type": "result", "result": {"text": "ignorado: ya hubo deltas"}},
+        {"type": "done"},
+    ]
+
+    def body():
+        for event in events:
+            yield f"data: {json.dumps(event)}\n\n".encode()
+
+    resp = client.post(
+        "/tts/stream?response_format=mp3",
+        content=body(),
+        headers={"content-type": "text/event-stream"},
+    )
+    assert resp.status_code == 200
+    assert provider.calls == ["Primera frase completa.", "Segunda frase final"]
+
+
+def test_stream_route_errors_stay_explicit(client: TestClient) -> None:
+    _override_provider(None)
+    assert client.post("/tts/stream", json={"text": "hola"}).status_code == 503
+    _override_provider(_SegmentProvider(fail_on="Hola"))
+    _override_cache(None)
+    resp = client.post("/tts/stream", json={"text": "Hola a todos."})
+    assert resp.status_code == 502
+    assert resp.json()["detail"]["code"] == "TTS_UPSTREAM_ERROR"
+    bad = client.post("/tts/stream", json={"text": "hola", "response_format": "wav"})
+    assert bad.status_code == 400
+    assert client.post("/tts/stream", json={"text": "---"}).status_code == 204
+
+
+def test_stream_route_ends_early_on_a_later_failure(client: TestClient) -> None:
+    _override_provider(_SegmentProvider(fail_on="Segunda"))
+    _override_cache(None)
+    resp = client.post("/tts/stream", json={"text": "Primera frase aquí. Segunda frase aquí."})
+    assert resp.status_code == 200
+    assert resp.content == "<Primera frase aquí.>".encode()
+
+
+def test_cancelled_caller_does_not_cancel_other_waiters() -> None:
+    provider = _SegmentProvider(delay=0.05)
+    cache = tts_stream.AudioCache(1 << 20)
+    key = cache.key("Hola.", voice="nova", response_format="mp3", speed=1.0)
+
+    async def call() -> bytes:
+        return await provider.synthesize("Hola.", voice="nova", response_format="mp3", speed=1.0)
+
+    async def run() -> bytes:
+        first = asyncio.create_task(cache.get_or_synthesize(key, call))
+        second = asyncio.create_task(cache.get_or_synthesize(key, call))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == b"<Hola.>"
+    assert provider.calls == ["Hola."]
+    assert cache.get(key) == b"<Hola.>"
+
+
+def test_synthesis_is_cancelled_when_every_waiter_leaves() -> None:
+    provider = _SegmentProvider(delay=0.05)
+    cache = tts_stream.AudioCache(1 << 20)
+
+    async def call() -> bytes:
+        return await provider.synthesize("Hola.", voice="nova", response_format="mp3", speed=1.0)
+
+    async def run() -> bytes:
+        waiters = [asyncio.create_task(cache.get_or_synthesize("k", call)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert provider.active == 0  # the provider call was cancelled, not left running
+        return await cache.get_or_synthesize("k", call)  # a later caller starts afresh
+
+    assert asyncio.run(run()) == b"<Hola.>"
+    assert provider.calls == ["Hola.", "Hola."]
+
+
+def test_stream_route_cancels_synthesis_on_client_disconnect() -> None:
+    cancelled: list[str] = []
+
+    class _Provider(_SegmentProvider):
+        async def synthesize(self, text, **kwargs) -> bytes:
+            try:
+                return await super().synthesize(text, **kwargs)
+            except asyncio.CancelledError:
+                cancelled.append(text)
+                raise
+
+    provider = _Provider(delay=0.05)
+    _override_provider(provider)
+    _override_cache(None)
+    text = " ".join(f"Frase número {i}." for i in range(20))
+    body = json.dumps({"text": text}).encode()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0", "spec_version": "2.3"}, "http_version": "1.1",
+        "method": "POST", "scheme": "http", "path": "/tts/stream", "raw_path": b"/tts/stream",
+        "root_path": "", "query_string": b"", "server": ("test", 80), "client": ("test", 1),
+        "headers": [(b"content-type", b"application/json"), (b"host", b"test")],
+    }
+
+    async def run() -> list[bytes]:
+        chunks: list[bytes] = []
+        first_chunk = asyncio.Event()
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+
+        async def receive() -> dict:
+            if messages:
+                return messages.pop(0)
+            await first_chunk.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict) -> None:
+            if message["type"] == "http.response.body" and message.get("body"):
+                chunks.append(message["body"])
+                first_chunk.set()
+
+        await asyncio.wait_for(app_module.app(scope, receive, send), timeout=2)
+        await asyncio.sleep(0.01)  # cancelled synthesis tasks unwind
+        return chunks
+
+    chunks = asyncio.run(run())
+    assert chunks[0] == "<Frase número 0.>".encode()
+    assert len(chunks) < 5 and len(provider.calls) < 20
+    assert cancelled and provider.active == 0  # in-flight synthesis was cancelled, not finished
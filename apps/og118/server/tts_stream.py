@@ -0,0 +1,380 @@
+"""og118 streaming TTS — sentence-pipelined synthesis + a content-addressed audio cache.
+
+`/tts/synthesize` is one provider call for the whole text: with `/chat/stream`
+the voice starts only after the ENTIRE answer has been generated AND
+synthesized — seconds of silence on a long answer, though the first sentence
+was ready almost immediately. This module cuts that to roughly "first sentence
+generated + one short synthesis":
+
+  * `SentenceSplitter` turns text (whole, or arriving as deltas) into speakable
+    segments at sentence boundaries. Tiny fragments ("Sí.", "Dr.") are merged
+    into the next segment; an unbroken run is hard-split at whitespace so no
+    segment exceeds the provider cap (`tts.MAX_TEXT_CHARS`).
+  * `stream_speech` synthesizes segments concurrently (bounded by a semaphore)
+    while more text keeps arriving, and yields each segment's audio IN ORDER the
+    moment it and everything before it are done.
+  * `chat_sse_segments` consumes the `/chat/stream` SSE wire format directly —
+    `text` deltas feed the splitter, `retry` discards what is not yet spoken,
+    a lone `result` (non-streaming backend) supplies the whole text.
+  * `AudioCache` keys audio by sha256(text, voice, format, speed): a repeated
+    phrase ("¡Claro!", a greeting, a replayed answer) is never re-billed. Two
+    requests for the same key in flight share one provider call.
+
+Only formats whose byte streams concatenate into a playable stream are offered
+(mp3 / aac ADTS frames, chained ogg/opus pages, raw pcm); wav and flac carry a
+per-file header, so they stay on `/tts/synthesize`.
+
+Like tts.py this stays provider-agnostic (any `TTSProvider`) and side-effect
+free; the route in app.py only validates, maps errors and wires the cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import hashlib
+import json
+import re
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+from tts import MAX_TEXT_CHARS, TTSProvider, TTSValidationError, validate_request
+
+# Formats whose segment audio can simply be concatenated (see module docstring).
+STREAMABLE_FORMATS = frozenset({"mp3", "aac", "opus", "pcm"})
+
+# Total spoken text one stream may carry (a long chat answer; the per-call cap
+# is per SEGMENT here, not per request).
+MAX_STREAM_TEXT_CHARS = 8 * MAX_TEXT_CHARS
+
+# Raw SSE bytes read from a piped chat stream before giving up — tool_call
+# events can be large, but a chat turn is nowhere near this.
+MAX_SSE_BODY_BYTES = 8 * 1024 * 1024
+
+DEFAULT_MAX_CONCURRENCY = 3
+
+# Segments shorter than this are merged into the next one: each provider call
+# has a fixed latency floor, and "Dr." alone is not a sentence.
+MIN_SEGMENT_CHARS = 12
+
+# Sentence end: terminal punctuation (plus closing quotes/brackets) CONFIRMED by
+# the whitespace after it — "3." is not a boundary until the next char shows it
+# is not "3.5" — or a line break (paragraphs, list items).
+_BOUNDARY = re.compile(r"[.!?…]+[\"'”’»)\]]*(?=\s)|\n+")
+
+# Markdown the chat renders but a voice must not read out loud.
+_MD_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_MD_MARKUP = re.compile(r"```[^\n]*|`|\*\*|__|(?<!\w)[*_](?=\S)|(?<=\S)[*_](?!\w)|^\s*(?:#{1,6}|[-*+•>])\s+", re.M)
+
+
+def speakable(segment: str) -> str:
+    """Strip markdown markup (emphasis, headings, bullets, code ticks, link
+    targets) from a segment. Empty when nothing speakable is left ("---")."""
+    text = _MD_MARKUP.sub("", _MD_LINK.sub(r"\1", segment))
+    text = " ".join(text.split())
+    return text if any(ch.isalnum() for ch in text) else ""
+
+
+class SentenceSplitter:
+    """Incremental sentence segmentation (see module docstring)."""
+
+    def __init__(self, *, min_chars: int = MIN_SEGMENT_CHARS, max_chars: int = MAX_TEXT_CHARS) -> None:
+        self._min = min_chars
+        self._max = max_chars
+        self._buf = ""
+
+    def feed(self, delta: str) -> list[str]:
+        """Add text; return the segments it completed (possibly none)."""
+        self._buf += delta
+        out: list[str] = []
+        start = 0
+        for m in _BOUNDARY.finditer(self._buf):
+            segment = speakable(self._buf[start : m.end()])
+            if len(segment) < self._min:
+                continue  # merge into the next segment
+            out.append(segment)
+            start = m.end()
+        self._buf = self._buf[start:]
+        while len(self._buf) > self._max:
+            cut = self._buf.rfind(" ", 0, self._max)
+            cut = cut if cut > 0 else self._max
+            segment = speakable(self._buf[:cut])
+            if segment:
+                out.append(segment)
+            self._buf = self._buf[cut:]
+        return out
+
+    def flush(self) -> list[str]:
+        """The trailing segment (text with no final boundary), if any."""
+        segment = speakable(self._buf)
+        self._buf = ""
+        return [segment] if segment else []
+
+    def reset(self) -> None:
+        """Drop the unspoken buffer (the chat stream retracted it)."""
+        self._buf = ""
+
+
+def split_sentences(text: str) -> list[str]:
+    splitter = SentenceSplitter()
+    return splitter.feed(text) + splitter.flush()
+
+
+# --- Cache ----------------------------------------------------------------------
+
+
+class AudioCache:
+    """In-memory LRU of synthesized audio, bounded by total bytes.
+
+    Single-replica, in-process like the rest of og118's state; a restart starts
+    cold, which only costs re-synthesis.
+
+    Concurrent misses for one key share a single synthesis task. A caller that
+    is cancelled (its client went away) only stops waiting; the task is
+    cancelled when its LAST waiter leaves, and a later caller starts afresh.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._bytes = 0
+        self._inflight: dict[str, asyncio.Task[bytes]] = {}
+        self._waiters: dict[asyncio.Task[bytes], int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(text: str, *, voice: str, response_format: str, speed: float) -> str:
+        payload = json.dumps([" ".join(text.split()), voice, response_format.lower(), round(speed, 3)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        audio = self._entries.get(key)
+        if audio is not None:
+            self._entries.move_to_end(key)
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old)
+        self._entries[key] = audio
+        self._bytes += len(audio)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    async def get_or_synthesize(self, key: str, synthesize: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Cached audio, else ONE shared ``synthesize()`` per key in flight."""
+        audio = self.get(key)
+        if audio is not None:
+            self.hits += 1
+            return audio
+        task = self._inflight.get(key)
+        if task is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._fill(key, synthesize))
+            self._inflight[key] = task
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                if not task.done():  # every waiter was cancelled
+                    task.cancel()
+                    self._drop_inflight(key, task)
+
+    async def _fill(self, key: str, synthesize: Callable[[], Awaitable[bytes]]) -> bytes:
+        try:
+            audio = await synthesize()
+        finally:
+            self._drop_inflight(key, asyncio.current_task())
+        self.put(key, audio)
+        return audio
+
+    def _drop_inflight(self, key: str, task: asyncio.Task | None) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+
+async def synthesize_cached(
+    provider: TTSProvider,
+    cache: AudioCache | None,
+    text: str,
+    *,
+    voice: str,
+    response_format: str,
+    speed: float,
+) -> bytes:
+    """``provider.synthesize`` through ``cache`` (None → straight through)."""
+
+    async def call() -> bytes:
+        return await provider.synthesize(text, voice=voice, response_format=response_format, speed=speed)
+
+    if cache is None:
+        return await call()
+    # "" means "the provider's default voice" — key on the voice actually used.
+    resolved_voice = voice or getattr(provider, "default_voice", "")
+    key = AudioCache.key(text, voice=resolved_voice, response_format=response_format, speed=speed)
+    return await cache.get_or_synthesize(key, call)
+
+
+# --- Pipeline ---------------------------------------------------------------------
+
+
+def validate_stream_request(response_format: str, speed: float) -> None:
+    """Format/speed checks for a streamed request. Text is not checked here: the
+    splitter only ever produces non-empty segments under the provider cap."""
+    validate_request("-", response_format, speed)  # placeholder text: format + speed only
+    if response_format.lower() not in STREAMABLE_FORMATS:
+        raise TTSValidationError(
+            f"response_format '{response_format}' cannot be streamed; "
+            f"expected one of {sorted(STREAMABLE_FORMATS)}"
+        )
+
+
+async def text_segments(text: str) -> AsyncIterator[str]:
+    if len(text) > MAX_STREAM_TEXT_CHARS:
+        raise TTSValidationError(f"text too long ({len(text)} chars; max {MAX_STREAM_TEXT_CHARS})")
+    for segment in split_sentences(text):
+        yield segment
+
+
+async def chat_sse_segments(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Speakable segments from a `/chat/stream` SSE body, as the answer arrives.
+
+    Stops at `done`/`error`, at end of body, or past the size caps — whatever
+    was already complete is still spoken.
+    """
+    splitter = SentenceSplitter()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    read = spoken = 0
+    streamed_text = False
+    async for chunk in chunks:
+        read += len(chunk)
+        if read > MAX_SSE_BODY_BYTES:
+            break
+        pending += decoder.decode(chunk)
+        *events, pending = pending.replace("\r\n", "\n").split("\n\n")
+        for raw in events:
+            event = _sse_event(raw)
+            if event is None:
+                continue
+            kind = event.get("type")
+            if kind == "text":
+                streamed_text = True
+                segments = splitter.feed(event.get("text") or "")
+            elif kind == "retry":
+                # Audio already yielded cannot be unsaid; the rest can.
+                splitter.reset()
+                continue
+            elif kind == "result" and not streamed_text:
+                result = event.get("result")
+                text = result.get("text") if isinstance(result, dict) else None
+                segments = splitter.feed(text or "")
+            elif kind in ("done", "error"):
+                for segment in splitter.flush():
+                    yield segment
+                return
+            else:
+                continue
+            for segment in segments:
+                spoken += len(segment)
+                if spoken > MAX_STREAM_TEXT_CHARS:
+                    return
+                yield segment
+    for segment in splitter.flush():
+        yield segment
+
+
+def _sse_event(raw: str) -> dict | None:
+    data = "\n".join(line[5:].lstrip() for line in raw.split("\n") if line.startswith("data:"))
+    if not data:
+        return None
+    try:
+        event = json.loads(data)
+    except json.JSONDecodeError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
+async def stream_speech(
+    segments: AsyncIterator[str] | Iterable[str],
+    provider: TTSProvider,
+    *,
+    voice: str,
+    response_format: str,
+    speed: float,
+    cache: AudioCache | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> AsyncIterator[bytes]:
+    """Each segment's audio, in order, synthesized up to ``max_concurrency`` at once.
+
+    Segments are read concurrently with synthesis, so a segment's audio is
+    yielded as soon as it (and every earlier one) is ready — not when the next
+    segment happens to arrive. A provider error propagates from the position of
+    the failing segment; everything before it has been yielded.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    # Look-ahead bound: tasks created but not yet yielded.
+    queue: asyncio.Queue = asyncio.Queue(maxsize=2 * max(1, max_concurrency))
+    end = object()
+
+    async def synth(segment: str) -> bytes:
+        async with semaphore:
+            return await synthesize_cached(
+                provider, cache, segment, voice=voice, response_format=response_format, speed=speed
+            )
+
+    async def enqueue(segment: str) -> None:
+        task = asyncio.create_task(synth(segment))
+        try:
+            await queue.put(task)
+        except BaseException:
+            task.cancel()  # cancelled while the queue was full: nobody else holds it
+            raise
+
+    async def produce() -> None:
+        try:
+            if isinstance(segments, AsyncIterator):
+                async for segment in segments:
+                    await enqueue(segment)
+            else:
+                for segment in segments:
+                    await enqueue(segment)
+        except Exception as exc:  # noqa: BLE001 - handed to the consumer, in order
+            await queue.put(exc)
+        await queue.put(end)
+
+    producer = asyncio.create_task(produce())
+    taken: deque[asyncio.Task] = deque()
+    try:
+        while True:
+            item = await queue.get()
+            if item is end:
+                break
+            if isinstance(item, Exception):
+                raise item
+            taken.append(item)
+            audio = await item
+            taken.popleft()
+            yield audio
+        await producer
+    finally:
+        producer.cancel()
+        for task in taken:
+            task.cancel()
+        while not queue.empty():
+            item = queue.get_nowait()
+            if isinstance(item, asyncio.Task):
+                item.cancel()
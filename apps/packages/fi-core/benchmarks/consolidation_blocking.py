@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Harness — single-shot vs blocked FactConsolidator passes on synthetic facts.
+
+Measures what blocking (``fi_core.memory.blocking``) changes for one
+consolidation pass: judge calls, judge input/output tokens, modelled judge
+wall time, local overhead (prompt building, clustering, parsing — measured),
+and whether the pass survives the judge's output cap. No model, no network,
+no Postgres:
+
+- **Facts** — ``n`` synthetic facts: distinct base facts plus duplicate
+  variants (~10% of the set) and conflicting variants (~5%). Each base gets a
+  random unit vector (384-d, MiniLM-sized); a duplicate is its base plus
+  small noise, a conflict plus moderate noise — the geometry a real embedder
+  gives paraphrases and same-attribute contradictions.
+- **Judge** — a fake ``llm_call``: merges the variants of each base it is
+  shown, NOOPs the rest. Tokens are estimated at ~4 chars/token; latency is
+  modelled (not slept) as TTFT + output tokens at a fixed decode rate, and
+  the blocked pass overlaps calls up to ``max_concurrency``. When the plan
+  exceeds ``max_tokens`` it returns a truncated array, like a real judge cut
+  off mid-JSON.
+
+Blocked input tokens can exceed single-shot: the judge system prompt is
+resent per cluster (provider prompt caching amortizes exactly that prefix).
+
+    python3 benchmarks/consolidation_blocking.py              # 100 / 300 / 600 facts
+    python3 benchmarks/consolidation_blocking.py --sizes 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # noqa: E402
+
+from fi_core.memory import Fact  # noqa: E402
+from fi_core.memory.consolidator import (  # noqa: E402
+    DEFAULT_JUDGE_MAX_TOKENS,
+    BlockingConfig,
+    FactConsolidator,
+)
+
+_DIM = 384
+_TTFT_MS = 600.0
+_DECODE_TOK_S = 120.0
+_TOKENS_PER_OP = 22  # one {"op": "NOOP", "id": 123, "reason": "..."} entry
+
+
+def _unit(vec: list[float]) -> list[float]:
+    norm = sum(x * x for x in vec) ** 0.5
+    return [x / norm for x in vec]
+
+
+def _noisy(base: list[float], sigma: float, rng: random.Random) -> list[float]:
+    return _unit([x + rng.gauss(0, sigma) for x in base])
+
+
+def synthetic_facts(n: int, seed: int = 7) -> tuple[list[Fact], dict[int, list[float]], int]:
+    """``n`` facts + their vectors + how many are redundant (dup/conflict variants)."""
+    rng = random.Random(seed)
+    facts: list[Fact] = []
+    vectors: dict[int, list[float]] = {}
+    redundant = 0
+    base = 0
+    while len(facts) < n:
+        base += 1
+        vec = _unit([rng.gauss(0, 1) for _ in range(_DIM)])
+        variants = [("", vec)]
+        roll = rng.random()
+        if roll < 0.10:
+            variants.append((" (dicho de otra forma)", _noisy(vec, 0.012, rng)))
+        elif roll < 0.15:
+            variants.append((" (dato más reciente, contradice)", _noisy(vec, 0.022, rng)))
+        for suffix, v in variants[: n - len(facts)]:
+            fid = len(facts) + 1
+            facts.append(Fact(id=fid, fact=f"hecho base {base}{suffix}", principal_id="u1", updated_at=1000.0 + fid))
+            vectors[fid] = v
+            redundant += bool(suffix)
+    return facts, vectors, redundant
+
+
+@dataclass
+class _Store:
+    """Read-only MemoryStore slice a dry-run pass needs (+ stored vectors)."""
+
+    facts: list[Fact]
+    vectors: dict[int, list[float]]
+
+    async def get_facts(self, principal_id: str, *, include_deleted: bool = False) -> list[Fact]:
+        return list(self.facts)
+
+    async def get_fact_embeddings(self, principal_id: str) -> dict[int, list[float]]:
+        return dict(self.vectors)
+
+
+@dataclass
+class _FakeJudge:
+    calls: int = 0
+    tokens_in: int = 0
+    tokens_out: int = 0
+    sim_ms: list[float] = field(default_factory=list)
+
+    async def __call__(self, system: str, user: str, max_tokens: int) -> str:
+        self.calls += 1
+        self.tokens_in += (len(system) + len(user)) // 4
+        groups: dict[str, list[int]] = {}
+        for fid, base in re.findall(r'"id": (\d+), "fact": "hecho base (\d+)', user):
+            groups.setdefault(base, []).append(int(fid))
+        plan: list[dict] = []
+        for ids in groups.values():
+            if len(ids) > 1:
+                plan.append({"op": "UPDATE", "merge_ids": ids, "new_fact": "merged", "reason": "dup"})
+            else:
+                plan.append({"op": "NOOP", "id": ids[0], "reason": "keep"})
+        out_tokens = _TOKENS_PER_OP * len(plan)
+        truncated = out_tokens > max_tokens
+        out_tokens = min(out_tokens, max_tokens)
+        self.tokens_out += out_tokens
+        self.sim_ms.append(_TTFT_MS + out_tokens / _DECODE_TOK_S * 1000)
+        await asyncio.sleep(0)
+        raw = json.dumps(plan)
+        return raw[: len(raw) * max_tokens // (_TOKENS_PER_OP * len(plan))] if truncated else raw
+
+
+async def _pass(facts: list[Fact], vectors: dict[int, list[float]], blocking: BlockingConfig | None) -> dict:
+    judge = _FakeJudge()
+    consolidator = FactConsolidator(store=_Store(facts, vectors), llm_call=judge, blocking=blocking)
+    t0 = time.perf_counter()
+    report = await consolidator.consolidate_principal("u1", dry_run=True)
+    wall_ms = (time.perf_counter() - t0) * 1000
+    merged = len({op.fact_id_before for op in report.ops if op.op == "UPDATE"})
+    return {
+        "judge_calls": judge.calls,
+        "tokens_in": judge.tokens_in,
+        "tokens_out": judge.tokens_out,
+        "judge_s": round(_critical_path(judge, blocking), 2),
+        "local_ms": round(wall_ms, 1),
+        "merged_facts": merged,
+        "error": report.error,
+    }
+
+
+def _critical_path(judge: _FakeJudge, blocking: BlockingConfig | None) -> float:
+    """Modelled judge time on the critical path (calls overlap up to max_concurrency)."""
+    if blocking is None:
+        return sum(judge.sim_ms) / 1000
+    lanes = [0.0] * max(1, blocking.max_concurrency)
+    for ms in judge.sim_ms:
+        lanes[lanes.index(min(lanes))] += ms
+    return max(lanes) / 1000
+
+
+async def main_async(sizes: list[int]) -> None:
+    import fi_core.persona.mcp_server  # noqa: F401 - keep its import out of the first row
+
+    blocking = BlockingConfig(min_facts=0)
+    print(f"judge: TTFT {_TTFT_MS:.0f} ms, {_DECODE_TOK_S:.0f} tok/s, max_tokens {DEFAULT_JUDGE_MAX_TOKENS}")
+    print(f"{'facts':>6s} {'redund':>6s}  {'pass':10s} {'calls':>5s} {'tok in':>8s} {'tok out':>8s} "
+          f"{'judge s':>7s} {'local ms':>8s} {'merged':>6s}  error")
+    for n in sizes:
+        facts, vectors, redundant = synthetic_facts(n)
+        for name, cfg in (("single", None), ("blocked", blocking)):
+            r = await _pass(facts, vectors, cfg)
+            print(f"{n:>6d} {redundant:>6d}  {name:10s} {r['judge_calls']:>5d} {r['tokens_in']:>8d} "
+                  f"{r['tokens_out']:>8d} {r['judge_s']:>7.2f} {r['local_ms']:>8.1f} {r['merged_facts']:>6d}"
+                  f"  {r['error'] or ''}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[100, 300, 600])
+    args = ap.parse_args()
+    asyncio.run(main_async(args.sizes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Harness — mixed read/write throughput of ``HDF5ChunkStore``.
+
+Writer threads save one chunk per call (the ``ChunkStore.add`` pattern: a
+chat turn, a disclosure). At the same time, reader threads run top-k
+queries against a preloaded namespace. Threads, because the async API
+runs every call on ``asyncio.to_thread``. For each store mode it prints:
+
+- **writes/s** and **queries/s** over the run;
+- **query p50 / p99** latency — what ingestion does to search;
+- **close s** — the final merge of whatever was still buffered;
+- **durable/s** — writes over run + close time, i.e. what reached the file.
+
+Modes: ``direct`` is ``write_buffer=False``, where every save opens the H5
+file under the store lock. ``buffered`` is the default write-ahead log
+with the background merge.
+
+    python3 benchmarks/hdf5_mixed_rw.py
+    python3 benchmarks/hdf5_mixed_rw.py --preload 20000 --writers 4 --readers 8 --seconds 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # noqa: E402
+
+from fi_core.rag import Chunk, ChunkWithEmbedding  # noqa: E402
+from fi_core.stores.hdf5 import HDF5ChunkStore  # noqa: E402
+
+_MODES = {"direct": {"write_buffer": False}, "buffered": {}}
+
+
+def _chunks(rng: np.random.Generator, ref: str, n: int, dim: int) -> list[ChunkWithEmbedding]:
+    vecs = rng.standard_normal((n, dim), dtype=np.float32)
+    return [
+        ChunkWithEmbedding(Chunk(text=f"{ref} fragmento {i}", source_type="bench", source_ref=ref), v.tolist())
+        for i, v in enumerate(vecs)
+    ]
+
+
+def _run(mode: str, args: argparse.Namespace) -> None:
+    rng = np.random.default_rng(7)
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HDF5ChunkStore(Path(tmp) / "bench.h5", **_MODES[mode])
+        store.create_document_sync(namespace="bench", document_id="corpus", content="")
+        store.save_chunks_sync(
+            namespace="bench", document_id="corpus", chunks=_chunks(rng, "corpus", args.preload, args.dim)
+        )
+        if hasattr(store, "flush_sync"):
+            store.flush_sync()  # the preload is setup, not part of the run
+        for w in range(args.writers):
+            store.create_document_sync(namespace="bench", document_id=f"w{w}", content="")
+        queries = rng.standard_normal((256, args.dim), dtype=np.float32).tolist()
+        writes = [0] * args.writers
+        latencies: list[list[float]] = [[] for _ in range(args.readers)]
+        stop = threading.Event()
+
+        def writer(w: int) -> None:
+            local = np.random.default_rng(w)
+            while not stop.is_set():
+                chunk = _chunks(local, f"w{w}-{writes[w]}", 1, args.dim)
+                store.save_chunks_sync(namespace="bench", document_id=f"w{w}", chunks=chunk)
+                writes[w] += 1
+
+        def reader(r: int) -> None:
+            i = r
+            while not stop.is_set():
+                t0 = time.perf_counter()
+                store.query_sync(namespace="bench", query_embedding=queries[i % len(queries)], top_k=5)
+                latencies[r].append(time.perf_counter() - t0)
+                i += 1
+
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(args.writers)]
+        threads += [threading.Thread(target=reader, args=(r,)) for r in range(args.readers)]
+        for t in threads:
+            t.start()
+        time.sleep(args.seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        t0 = time.perf_counter()
+        if hasattr(store, "close_sync"):
+            store.close_sync()
+        closing = time.perf_counter() - t0
+
+        lat = np.array([x for per in latencies for x in per]) * 1000
+        print(
+            f"{mode:9s} {sum(writes) / args.seconds:>9.0f} {len(lat) / args.seconds:>10.0f} "
+            f"{np.percentile(lat, 50):>9.2f} {np.percentile(lat, 99):>9.2f} {closing:>8.2f} "
+            f"{sum(writes) / (args.seconds + closing):>10.0f}"
+        )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--preload", type=int, default=5000, help="chunks in the namespace before the run")
+    ap.add_argument("--dim", type=int, default=384)
+    ap.add_argument("--writers", type=int, default=2)
+    ap.add_argument("--readers", type=int, default=4)
+    ap.add_argument("--seconds", type=float, default=5.0)
+    ap.add_argument("--modes", nargs="+", choices=sorted(_MODES), default=["direct", "buffered"])
+    args = ap.parse_args()
+    print(f"{args.preload} preloaded {args.dim}-d chunks; {args.writers} writers, {args.readers} readers, {args.seconds:g} s")
+    print(f"{'mode':9s} {'writes/s':>9s} {'queries/s':>10s} {'q p50 ms':>9s} {'q p99 ms':>9s} {'close s':>8s} {'durable/s':>10s}")
+    for mode in args.modes:
+        _run(mode, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Harness — lexical top-k latency: ``BM25Index`` vs a per-query scan.
+
+Builds a synthetic corpus of ``--sizes`` chunks (``--words`` tokens each,
+drawn Zipf-distributed from a ``--vocab``-term vocabulary, like real text:
+a few very common terms, a long tail of rare ones) and for each size
+prints:
+
+- **build s** / **segments** — indexing time (``add`` + ``flush``) and the
+  segment files it ended with;
+- **open s** — reopening the index from disk;
+- **p50 / p99 ms** — ``search`` latency over ``--queries`` 2-4 term queries
+  mixing common and rare terms;
+- **scan ms** — the pre-index way to get a lexical ranking over the same
+  corpus: ``LexicalRetriever.score`` on every chunk, per query. Only run up
+  to ``--max-scan`` chunks.
+
+    python3 benchmarks/rag_bm25_index.py
+    python3 benchmarks/rag_bm25_index.py --sizes 10000 100000 1000000 --max-scan 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # noqa: E402
+
+from fi_core.rag.retrieval import LexicalRetriever  # noqa: E402
+from fi_core.stores.bm25 import BM25Index  # noqa: E402
+
+
+def _vocab(n: int) -> list[str]:
+    return [f"t{np.base_repr(i, 36).lower()}x" for i in range(n)]
+
+
+def _texts(rng: np.random.Generator, vocab: list[str], n: int, words: int, batch: int = 50_000):
+    """Yield ``(document_id, chunk_id, text)`` in batches (the corpus is never held whole)."""
+    ranks = np.arange(1, len(vocab) + 1)
+    p = 1.0 / ranks
+    p /= p.sum()
+    for start in range(0, n, batch):
+        k = min(batch, n - start)
+        ids = rng.choice(len(vocab), size=(k, words), p=p)
+        yield [
+            (f"doc{(start + i) // 10}", f"c{start + i}", " ".join(vocab[j] for j in row))
+            for i, row in enumerate(ids)
+        ]
+
+
+def _queries(rng: np.random.Generator, vocab: list[str], n: int) -> list[str]:
+    out = []
+    for _ in range(n):
+        k = int(rng.integers(2, 5))
+        common = [vocab[int(i)] for i in rng.integers(0, 50, size=1)]
+        tail = [vocab[int(i)] for i in rng.integers(50, len(vocab), size=k - 1)]
+        out.append(" ".join(common + tail))
+    return out
+
+
+def _run(size: int, args: argparse.Namespace) -> None:
+    rng = np.random.default_rng(7)
+    vocab = _vocab(args.vocab)
+    queries = _queries(rng, vocab, args.queries)
+    with tempfile.TemporaryDirectory() as tmp:
+        index = BM25Index(Path(tmp) / "idx")
+        texts: list[str] = []
+        t0 = time.perf_counter()
+        for batch in _texts(rng, vocab, size, args.words):
+            index.add("bench", batch)
+            if size <= args.max_scan:
+                texts.extend(t for _, _, t in batch)
+        index.flush()
+        build_s = time.perf_counter() - t0
+        segments = index.stats("bench")["segments"]
+
+        t0 = time.perf_counter()
+        index = BM25Index(Path(tmp) / "idx")
+        open_s = time.perf_counter() - t0
+
+        lat = []
+        for q in queries:
+            t0 = time.perf_counter()
+            index.search("bench", q, top_k=args.top_k)
+            lat.append((time.perf_counter() - t0) * 1000)
+        p50, p99 = np.percentile(lat, [50, 99])
+
+        scan = "-"
+        if texts:
+            lexical = LexicalRetriever()
+            t0 = time.perf_counter()
+            for q in queries[:5]:
+                sorted(range(len(texts)), key=lambda i: lexical.score(q, texts[i]), reverse=True)[: args.top_k]
+            scan = f"{(time.perf_counter() - t0) * 1000 / 5:.0f}"
+    print(f"{size:>9d} {build_s:>8.1f} {segments:>8d} {open_s:>7.2f} {p50:>7.2f} {p99:>7.2f} {scan:>8s}")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    ap.add_argument("--words", type=int, default=40)
+    ap.add_argument("--vocab", type=int, default=100_000)
+    ap.add_argument("--queries", type=int, default=200)
+    ap.add_argument("--top-k", type=int, default=50)
+    ap.add_argument("--max-scan", type=int, default=20_000)
+    args = ap.parse_args()
+
+    print(f"{'chunks':>9s} {'build s':>8s} {'segments':>8s} {'open s':>7s} {'p50 ms':>7s} {'p99 ms':>7s} {'scan ms':>8s}")
+    for size in args.sizes:
+        _run(size, args)
+
+
+if __name__ == "__main__":
+    main()
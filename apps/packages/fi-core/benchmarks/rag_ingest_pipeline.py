@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Harness — serial vs batched/pipelined ``RagStore.ingest`` on a real HDF5 store.
+
+Measures, for one large synthetic document (``--pages`` pages of ~3 000
+characters, the size of a dense PDF page):
+
+- **pages/s** — end-to-end ingest throughput (chunk → embed → persist);
+- **first searchable** — time until a query for the document returns a hit
+  from it (the first bulk write landed);
+- **all searchable** — time until the ingest returns;
+- **embed calls** — round-trips to the embedder.
+
+The "serial" row is the pre-pipeline ingest reproduced inline: one ``embed``
+per chunk, then a single ``save_chunks`` at the end. The "pipelined" rows are
+``RagStore.ingest`` with the given batch sizes.
+
+Embedder: a local one. ``--st MODEL`` uses sentence-transformers (needs the
+``embeddings-st`` extra); the default is :class:`LocalModelEmbedder`, the
+zero-model ``HashingEmbedder`` plus the latency profile of a small local model
+on CPU — a fixed cost per forward pass (``--call-ms``) plus a cost per text
+(``--text-ms``) — slept in a worker thread like a real ``model.encode``. Batching
+pays the fixed cost once per batch; that is the effect being measured.
+
+    python3 benchmarks/rag_ingest_pipeline.py
+    python3 benchmarks/rag_ingest_pipeline.py --pages 200 --batches 16 64
+    python3 benchmarks/rag_ingest_pipeline.py --st sentence-transformers/all-MiniLM-L6-v2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # noqa: E402
+
+from fi_core.embeddings.hashing import HashingEmbedder  # noqa: E402
+from fi_core.rag import Chunk, ChunkWithEmbedding, RagStore  # noqa: E402
+from fi_core.rag.chunking import ChunkConfig, ChunkingStrategy, chunk_document  # noqa: E402
+from fi_core.stores.hdf5 import HDF5ChunkStore  # noqa: E402
+
+_PAGE_CHARS = 3000
+_WORDS = (
+    "cuaderno lápiz mochila proveedor margen inventario factura temporada escolar precio "
+    "descuento entrega cliente papelería regla goma colores tijeras pegamento carpeta"
+).split()
+
+
+class LocalModelEmbedder(HashingEmbedder):
+    """HashingEmbedder with a local model's latency (see module docstring)."""
+
+    def __init__(self, *, call_ms: float, text_ms: float) -> None:
+        super().__init__(dim=384)
+        self.call_s, self.text_s = call_ms / 1000, text_ms / 1000
+        self.calls = 0
+
+    async def embed(self, text: str) -> list[float]:
+        self.calls += 1
+        await asyncio.to_thread(time.sleep, self.call_s + self.text_s)
+        return await super().embed(text)
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.calls += 1
+        await asyncio.to_thread(time.sleep, self.call_s + self.text_s * len(texts))
+        return await super().embed_batch(texts)
+
+
+def synthetic_document(pages: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    out = []
+    for p in range(pages):
+        paragraphs = []
+        size = 0
+        while size < _PAGE_CHARS:
+            para = f"Página {p}. " + " ".join(rng.choice(_WORDS) for _ in range(rng.randint(40, 90))) + "."
+            paragraphs.append(para)
+            size += len(para)
+        out.append("\n\n".join(paragraphs))
+    return "\n\n".join(out)
+
+
+async def _serial(rag: RagStore, doc: str) -> None:
+    """The pre-pipeline ingest: one embed per chunk, one save at the end."""
+    pieces = chunk_document(doc, ChunkingStrategy.PARAGRAPH_AWARE, ChunkConfig())
+    await rag.store.create_document(namespace="bench", document_id="doc", content=doc)
+    chunks = [
+        ChunkWithEmbedding(Chunk(text=p, source_type="document", source_ref="doc"), await rag.embedder.embed(p))
+        for p in pieces
+    ]
+    await rag.store.save_chunks(namespace="bench", document_id="doc", chunks=chunks)
+
+
+async def _run(name: str, embedder, doc: str, pages: int, batch: int | None) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        rag = RagStore.from_components(store=HDF5ChunkStore(Path(tmp) / "bench.h5"), embedder=embedder)
+        probe = doc.split("\n\n", 1)[0][:80]
+        first: list[float] = []
+        polls = 0
+        t0 = time.perf_counter()
+
+        async def watch() -> None:
+            nonlocal polls
+            while True:
+                polls += 1  # each search embeds the query too
+                if await rag.search("bench", probe, top_k=1):
+                    first.append(time.perf_counter() - t0)
+                    return
+                await asyncio.sleep(0.005)
+
+        watcher = asyncio.create_task(watch())
+        calls_before = getattr(embedder, "calls", 0)
+        if batch is None:
+            await _serial(rag, doc)
+        else:
+            await rag.ingest("bench", "doc", doc, batch_size=batch)
+        total = time.perf_counter() - t0
+        await asyncio.wait_for(watcher, 5)
+        calls = str(embedder.calls - calls_before - polls) if hasattr(embedder, "calls") else "-"
+        chunks = (await rag.stats("bench"))["n_chunks"]
+        print(f"{name:16s} {chunks:>7d} {calls:>6s} {pages / total:>8.1f} {first[0]:>10.2f} {total:>9.2f}")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    if args.st:
+        from fi_core.embeddings.sentence_transformers import SentenceTransformersEmbedder
+
+        embedder = SentenceTransformersEmbedder(model_name=args.st)
+        await embedder.embed("warm-up")  # model load is not ingest time
+        label = args.st
+    else:
+        embedder = LocalModelEmbedder(call_ms=args.call_ms, text_ms=args.text_ms)
+        label = f"local model profile: {args.call_ms:g} ms/call + {args.text_ms:g} ms/text"
+    doc = synthetic_document(args.pages)
+    print(f"{args.pages} pages, {len(doc) / 1e6:.1f} MB text; embedder: {label}")
+    print(f"{'ingest':16s} {'chunks':>7s} {'calls':>6s} {'pages/s':>8s} {'first s':>10s} {'all s':>9s}")
+    await _run("serial (before)", embedder, doc, args.pages, None)
+    for b in args.batches:
+        await _run(f"pipelined b={b}", embedder, doc, args.pages, b)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--pages", type=int, default=100)
+    ap.add_argument("--batches", type=int, nargs="+", default=[8, 32, 64])
+    ap.add_argument("--call-ms", type=float, default=12.0)
+    ap.add_argument("--text-ms", type=float, default=1.5)
+    ap.add_argument("--st", help="sentence-transformers model name (real local model)")
+    asyncio.run(main_async(ap.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
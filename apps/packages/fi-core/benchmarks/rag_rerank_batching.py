@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Harness — per-request vs batched/cached ``BgeReranker`` under concurrent load.
+
+``--clients`` concurrent callers each issue ``--requests`` rerank calls of
+``--candidates`` passages. Queries are drawn from a pool of ``--queries`` (so
+some repeat, like a user paging through results or several users asking the
+same thing). Passages vary from a sentence to a long paragraph. For each mode
+the harness prints:
+
+- **p50 / p95 ms** — rerank latency seen by a caller;
+- **model s/query** — time the model spent computing, per rerank call (on a
+  CPU-only box that is the CPU the reranker burns);
+- **passes** — forward passes (``predict`` batches).
+
+Modes: "per-request" is the pre-batching ``BgeReranker`` reproduced inline
+(one ``predict`` of the call's pairs in a worker thread, batches cut in input
+order, no cache). "batched" coalesces concurrent calls and length-sorts;
+"+cache" adds the score cache; "+top_n" also reranks only the first
+``--top-n`` candidates (``RerankingRetriever(rerank_top_n=...)``).
+
+Model: ``--st MODEL`` loads a real sentence-transformers ``CrossEncoder``
+(needs the ``rerank`` extra). The default is :class:`LocalCrossEncoder`, the
+latency profile of a small cross-encoder on CPU: a fixed cost per pass
+(``--call-ms``) plus a cost per padded token (``--token-us``, every pair in a
+batch padded to its longest), slept under one lock — one pass at a time owns
+the CPU, as a torch model on CPU does.
+
+    python3 benchmarks/rag_rerank_batching.py
+    python3 benchmarks/rag_rerank_batching.py --clients 32 --top-n 20
+    python3 benchmarks/rag_rerank_batching.py --st cross-encoder/ms-marco-MiniLM-L-6-v2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))  # noqa: E402
+
+from fi_core.rag.rerank import BgeReranker, RerankResult  # noqa: E402
+
+_WORDS = (
+    "dolor torácico presión arterial glucosa paciente refiere cefalea náusea fiebre "
+    "tratamiento dosis mg control seguimiento antecedentes alergia estudio laboratorio"
+).split()
+
+
+class LocalCrossEncoder:
+    """A small CPU cross-encoder's latency (see module docstring)."""
+
+    def __init__(self, *, call_ms: float, token_us: float) -> None:
+        self.call_s, self.token_s = call_ms / 1000, token_us / 1e6
+        self.passes = 0
+        self.busy_s = 0.0
+        self._cpu = threading.Lock()
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=None):  # noqa: ANN001
+        scores = []
+        for start in range(0, len(pairs), batch_size):
+            batch = pairs[start : start + batch_size]
+            padded = len(batch) * max(len(q.split()) + len(p.split()) for q, p in batch)
+            cost = self.call_s + self.token_s * padded
+            with self._cpu:
+                time.sleep(cost)
+            self.passes += 1
+            self.busy_s += cost
+            scores.extend(float(len(set(q.split()) & set(p.split()))) for q, p in batch)
+        return scores
+
+
+class _Timed:
+    """Wraps a real CrossEncoder with the same counters."""
+
+    def __init__(self, model) -> None:  # noqa: ANN001
+        self.model, self.passes, self.busy_s = model, 0, 0.0
+        self._cpu = threading.Lock()
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=None):  # noqa: ANN001
+        with self._cpu:
+            t0 = time.perf_counter()
+            out = self.model.predict(pairs, batch_size=batch_size, show_progress_bar=False)
+            self.busy_s += time.perf_counter() - t0
+        self.passes += -(-len(pairs) // batch_size)
+        return out
+
+
+class PerRequestReranker:
+    """The pre-batching ``BgeReranker.rerank``, reproduced inline."""
+
+    def __init__(self, model) -> None:  # noqa: ANN001
+        self._model = model
+
+    async def rerank(self, query: str, documents: list[str]) -> list[RerankResult]:
+        scores = await asyncio.to_thread(self._model.predict, [(query, d) for d in documents])
+        ranked = sorted(enumerate(scores), key=lambda x: float(x[1]), reverse=True)
+        return [RerankResult(index=i, score=float(s)) for i, s in ranked]
+
+
+def _workload(args: argparse.Namespace) -> list[list[tuple[str, list[str]]]]:
+    rng = random.Random(7)
+
+    def sentence(lo: int, hi: int) -> str:
+        return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(lo, hi)))
+
+    queries = [(sentence(3, 8), [sentence(15, 300) for _ in range(args.candidates)]) for _ in range(args.queries)]
+    return [[rng.choice(queries) for _ in range(args.requests)] for _ in range(args.clients)]
+
+
+async def _run(reranker, workload, top_n: int | None) -> list[float]:  # noqa: ANN001
+    latencies: list[float] = []
+
+    async def client(calls: list[tuple[str, list[str]]]) -> None:
+        for query, docs in calls:
+            t0 = time.perf_counter()
+            await reranker.rerank(query, docs if top_n is None else docs[:top_n])
+            latencies.append((time.perf_counter() - t0) * 1000)
+
+    await asyncio.gather(*(client(calls) for calls in workload))
+    return latencies
+
+
+def _model(args: argparse.Namespace):  # noqa: ANN202
+    if args.st:
+        from sentence_transformers import CrossEncoder
+
+        return _Timed(CrossEncoder(args.st))
+    return LocalCrossEncoder(call_ms=args.call_ms, token_us=args.token_us)
+
+
+def _pct(values: list[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+async def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--clients", type=int, default=16)
+    ap.add_argument("--requests", type=int, default=10)
+    ap.add_argument("--queries", type=int, default=60)
+    ap.add_argument("--candidates", type=int, default=50)
+    ap.add_argument("--top-n", type=int, default=20)
+    ap.add_argument("--call-ms", type=float, default=15.0)
+    ap.add_argument("--token-us", type=float, default=2.0)
+    ap.add_argument("--st", default=None, help="sentence-transformers CrossEncoder name")
+    args = ap.parse_args()
+    workload = _workload(args)
+    calls = args.clients * args.requests
+
+    modes = [
+        ("per-request", lambda m: PerRequestReranker(m), None),
+        ("batched", lambda m: BgeReranker(cache_size=0), None),
+        ("batched+cache", lambda m: BgeReranker(), None),
+        (f"+top_n={args.top_n}", lambda m: BgeReranker(), args.top_n),
+    ]
+    print(f"{'mode':>14s} {'p50 ms':>8s} {'p95 ms':>8s} {'model s/query':>14s} {'passes':>7s}")
+    for name, make, top_n in modes:
+        model = _model(args)
+        reranker = make(model)
+        reranker._model = model
+        latencies = await _run(reranker, workload, top_n)
+        print(
+            f"{name:>14s} {_pct(latencies, 0.5):>8.0f} {_pct(latencies, 0.95):>8.0f} "
+            f"{model.busy_s / calls:>14.3f} {model.passes:>7d}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -13,7 +13,7 @@ picks a domain instead of hand-wiring five frozensets. One core, many domains.
 Vocabularies are NON-EXHAUSTIVE starting points, tuned to the language the runner
 speaks: cardiology terms are English (the original Redux-Claude flow); psychiatry
 terms are Spanish, matching ALICE's clinical reflection layer. Substring matching
-is case-insensitive, so feed the LLM-extracted clinical indicators (e.g.
+is case- and accent-insensitive ("ideacion" matches "ideación"), so feed the LLM-extracted clinical indicators (e.g.
 "ideación suicida pasiva"), not raw colloquial text. Override per deployment.
 """
 
@@ -29,6 +29,9 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+
+from fi_core.matching import FoldedVocabulary, compile_vocabulary, fold_accents
 
 
 # --- Negation handling ------------------------------------------------------
@@ -104,8 +107,10 @@ URGENCY_BANDS: tuple[UrgencyBand, ...] = (
 )
 
 # --- Default vocabularies (cardiology-leaning, NON-EXHAUSTIVE) -------------
-# Override per specialty via UrgencyClassifier(...). Matching is
-# case-insensitive substring, so "acute chest pain" matches "chest pain".
+# Override per specialty via UrgencyClassifier(...). Matching is case- and
+# accent-insensitive substring, so "acute chest pain" matches "chest pain" and
+# "ideacion suicida" matches "ideación suicida". Vocabularies are compiled once
+# per distinct frozenset (fi_core.matching) and shared across classifiers.
 
 DEFAULT_CRITICAL_SYMPTOMS: frozenset[str] = frozenset({
     "cardiac arrest", "respiratory failure", "severe bleeding",
@@ -165,8 +170,37 @@ def _normalize(items: list[str]) -> list[str]:
     return [_strip_negations(str(i).strip().lower()) for i in items if str(i).strip()]
 
 
-def _matches(item: str, vocab: frozenset[str]) -> bool:
-    return item in vocab or any(term in item for term in vocab)
+@lru_cache(maxsize=64)
+def _severity_vocabulary(
+    critical: frozenset[str], high: frozenset[str], medium: frozenset[str]
+) -> tuple[dict[str, int], FoldedVocabulary]:
+    """The three symptom tiers as ONE compiled vocabulary + term → severity.
+
+    A term listed in several tiers keeps the highest (critical wins, as the
+    tier-by-tier scan did)."""
+    table: dict[str, int] = {}
+    for sev, vocab in ((5, medium), (7, high), (9, critical)):
+        for term in vocab:
+            table[term] = sev
+    return table, compile_vocabulary(frozenset(table))
+
+
+@dataclass(frozen=True)
+class _Prepared:
+    """A patient's negation-stripped symptoms plus folded symptoms/history."""
+
+    symptoms: list[str]
+    folded_symptoms: list[str]
+    folded_history: list[str]
+
+    @classmethod
+    def of(cls, patient: PatientContext) -> _Prepared:
+        symptoms = _normalize(patient.symptoms)
+        return cls(
+            symptoms=symptoms,
+            folded_symptoms=[fold_accents(s) for s in symptoms],
+            folded_history=[fold_accents(h) for h in _normalize(patient.medical_history)],
+        )
 
 
 def band_for_gravity(gravity: float) -> UrgencyBand:
@@ -197,23 +231,31 @@ class UrgencyClassifier:
     high_risk_conditions: frozenset[str] = DEFAULT_HIGH_RISK_CONDITIONS
 
     def base_gravity(self, symptoms: list[str]) -> tuple[int, list[str]]:
+        items = _normalize(symptoms)
+        return self._base_gravity(items, [fold_accents(s) for s in items])
+
+    def modifiers(self, patient: PatientContext) -> tuple[float, list[str]]:
+        return self._modifiers(patient, _Prepared.of(patient))
+
+    def critical_pattern(self, patient: PatientContext) -> str | None:
+        return self._critical_pattern(_Prepared.of(patient))
+
+    def _base_gravity(self, symptoms: list[str], folded: list[str]) -> tuple[int, list[str]]:
         score = 0
         reasons: list[str] = []
-        for s in _normalize(symptoms):
-            if _matches(s, self.critical_symptoms):
-                sev = 9
-            elif _matches(s, self.high_symptoms):
-                sev = 7
-            elif _matches(s, self.medium_symptoms):
-                sev = 5
-            else:
-                sev = 3
+        # One pass per symptom over the three tiers (critical > high > medium):
+        # the symptom's severity is the highest tier among the terms it contains.
+        table, vocab = _severity_vocabulary(
+            self.critical_symptoms, self.high_symptoms, self.medium_symptoms
+        )
+        for s, f in zip(symptoms, folded, strict=True):
+            sev = max((table[t] for t in vocab.findall(f)), default=3)
             if sev > score:
                 score = sev
             reasons.append(f"symptom '{s}' → gravity {sev}")
         return score, reasons
 
-    def modifiers(self, patient: PatientContext) -> tuple[float, list[str]]:
+    def _modifiers(self, patient: PatientContext, prep: _Prepared) -> tuple[float, list[str]]:
         mod = 0.0
         reasons: list[str] = []
         if patient.age is not None:
@@ -223,28 +265,32 @@ class UrgencyClassifier:
             if patient.age < 1:
                 mod += 1.5
                 reasons.append("age < 1 (+1.5)")
-        history = _normalize(patient.medical_history)
+        conditions = compile_vocabulary(self.high_risk_conditions)
+        present: set[str] = set()
+        for h in prep.folded_history:
+            present |= conditions.findall(h)
         for cond in sorted(self.high_risk_conditions):
-            if any(cond in h for h in history):
+            if cond in present:
                 mod += 0.5
                 reasons.append(f"comorbidity '{cond}' (+0.5)")
         if (patient.gender or "").lower() == "female" and any(
-            "pregnant" in s for s in _normalize(patient.symptoms)
+            "pregnant" in s for s in prep.symptoms
         ):
             mod += 1.0
             reasons.append("pregnancy (+1.0)")
         return mod, reasons
 
-    def critical_pattern(self, patient: PatientContext) -> str | None:
-        text = " ".join(_normalize(patient.symptoms + patient.medical_history))
-        for pattern in sorted(self.critical_patterns):
-            if pattern in text:
-                return pattern
-        return None
+    def _critical_pattern(self, prep: _Prepared) -> str | None:
+        text = " ".join(prep.folded_symptoms + prep.folded_history)
+        found = compile_vocabulary(self.critical_patterns).findall(text)
+        # First in sorted order, as a per-pattern scan over sorted() would report.
+        return min(found) if found else None
 
     def classify(self, patient: PatientContext) -> GravityScore:
         """Run triage: critical-pattern override first, else gravity + modifiers."""
-        pattern = self.critical_pattern(patient)
+        # Negation-strip and fold each input ONCE; every matcher reuses it.
+        prep = _Prepared.of(patient)
+        pattern = self._critical_pattern(prep)
         if pattern is not None:
             band = URGENCY_BANDS[0]  # CRITICAL
             return GravityScore(
@@ -256,8 +302,8 @@ class UrgencyClassifier:
                 critical_override=True,
                 reasons=(f"critical pattern '{pattern}' detected → override CRITICAL",),
             )
-        base, base_reasons = self.base_gravity(patient.symptoms)
-        mod, mod_reasons = self.modifiers(patient)
+        base, base_reasons = self._base_gravity(prep.symptoms, prep.folded_symptoms)
+        mod, mod_reasons = self._modifiers(patient, prep)
         final = min(10.0, base + mod)
         band = band_for_gravity(final)
         return GravityScore(
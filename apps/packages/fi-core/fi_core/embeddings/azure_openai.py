@@ -164,3 +164,27 @@ class AzureOpenAIEmbedder:
                 f"deployment '{self.deployment}'"
             )
         return list(vec)
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed ``texts`` in ONE request (``input`` as a list). Same errors as
+        :meth:`embed`, checked per text; results come back in input order.
+
+        The caller sizes the batch: Azure caps one request at 2048 inputs (and
+        a token budget), so ingest pipelines send tens, not thousands.
+        """
+        if not texts:
+            return []
+        if any(not t or not t.strip() for t in texts):
+            raise ValueError("AzureOpenAIEmbedder.embed_batch: every text must be non-empty")
+        client = self._get_client()
+        resp = await client.embeddings.create(model=self.deployment, input=list(texts))
+        vectors = [list(d.embedding) for d in sorted(resp.data, key=lambda d: d.index)]
+        if len(vectors) != len(texts):
+            raise RuntimeError(f"Expected {len(texts)} vectors, got {len(vectors)}")
+        for vec in vectors:
+            if len(vec) != self._dim:
+                raise EmbeddingDimensionError(
+                    f"Expected {self._dim}-dim vector, got {len(vec)} from "
+                    f"deployment '{self.deployment}'"
+                )
+        return vectors
@@ -37,7 +37,7 @@ class HashingEmbedder:
     def dim(self) -> int:
         return self._dim
 
-    async def embed(self, text: str) -> list[float]:
+    def _vector(self, text: str) -> list[float]:
         vec = [0.0] * self._dim
         for tok in _tokens(text):
             # Stable cross-process bucket (Python's hash() is salted per run).
@@ -45,5 +45,11 @@ class HashingEmbedder:
             vec[bucket] += 1.0
         return vec
 
+    async def embed(self, text: str) -> list[float]:
+        return self._vector(text)
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        return [self._vector(t) for t in texts]
+
 
 __all__ = ["HashingEmbedder"]
@@ -144,3 +144,18 @@ class SentenceTransformersEmbedder:
             show_progress_bar=False,
         )
         return vector.tolist()
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed ``texts`` in ONE ``model.encode`` call (one forward pass per
+        internal batch instead of one per text). Same threading and error
+        contract as :meth:`embed`."""
+        if not texts:
+            return []
+        model = self._ensure_loaded()
+        matrix = await asyncio.to_thread(
+            model.encode,
+            list(texts),
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        return matrix.tolist()
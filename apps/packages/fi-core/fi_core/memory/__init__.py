@@ -6,6 +6,7 @@ Sub-modules:
 - ``fi_core.memory.protocols``    — MemoryStore Protocol
 - ``fi_core.memory.stores``       — concrete MemoryStore implementations
 - ``fi_core.memory.consolidator`` — FactConsolidator (wraps persona.mcp_server tools)
+- ``fi_core.memory.blocking``     — embedding-based candidate clustering for the consolidator
 
 Design rationale
 ----------------
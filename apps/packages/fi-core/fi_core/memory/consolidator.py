@@ -18,19 +18,28 @@ glue: facts → prompt → caller's LLM → parse → store.apply.
 This is Shape B per ``memory:[[mcp-shape-b-canonical]]``: server builds
 prompt + parser, caller executes LLM. Same pattern discord-bot already
 uses post-v3.9.82.
+
+Large fact sets can be BLOCKED first (``blocking=BlockingConfig()``): facts
+are clustered by the embeddings the store already holds, only clusters of
+likely duplicates / conflicts go to the judge — concurrently, one small call
+each — and the per-cluster plans are merged into one transactional apply.
+See :mod:`fi_core.memory.blocking`.
 """
 
 from __future__ import annotations
 
+import asyncio
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import asdict
 from typing import TYPE_CHECKING
 
+from fi_core.memory.blocking import BlockingConfig, cluster_facts, similar_pairs
 from fi_core.memory.types import ConsolidationOp, ConsolidationReport, Fact
 
 if TYPE_CHECKING:
     from fi_core.memory.protocols import MemoryStore
+    from fi_core.rag.protocols import Embedder
 
 
 # Type alias for the caller-supplied LLM call.
@@ -62,6 +71,11 @@ class FactConsolidator:
 
     The consolidator is stateless — instantiate once, reuse across runs
     and principals.
+
+    Pass ``blocking`` to judge large fact sets cluster by cluster. Vectors
+    come from the store's ``get_fact_embeddings`` (``PgMemoryStore`` has it)
+    and, for facts it has none for, from ``embedder``; if any fact is still
+    without a vector the pass falls back to single-shot.
     """
 
     def __init__(
@@ -71,11 +85,15 @@ class FactConsolidator:
         llm_call: LLMCall,
         min_facts: int = DEFAULT_MIN_FACTS,
         max_tokens: int = DEFAULT_JUDGE_MAX_TOKENS,
+        blocking: BlockingConfig | None = None,
+        embedder: Embedder | None = None,
     ) -> None:
         self._store = store
         self._llm_call = llm_call
         self._min_facts = min_facts
         self._max_tokens = max_tokens
+        self._blocking = blocking
+        self._embedder = embedder
 
     async def consolidate_principal(
         self,
@@ -90,6 +108,8 @@ class FactConsolidator:
             2. Build the judge prompt via ``build_consolidation_prompt``.
             3. Call the consumer-supplied ``llm_call``.
             4. Parse the response via ``parse_consolidation_result``.
+               (Steps 2-4 run once per cluster when blocking applies; facts
+               in no cluster get a NOOP without a judge call.)
             5. If ``dry_run``: synthesize ops from the plan WITHOUT
                touching the store. Else: ``apply_consolidation_plan``.
             6. Return a :class:`ConsolidationReport` rollup.
@@ -98,14 +118,6 @@ class FactConsolidator:
         report is always returned (never raises) so the caller can
         log / retry / move on.
         """
-        # Imported lazily — fi_core.persona.mcp_server requires the [mcp]
-        # extra. The consolidator can still be imported by consumers who
-        # do not have it (Protocol satisfaction only, no use).
-        from fi_core.persona.mcp_server import (
-            build_consolidation_prompt,
-            parse_consolidation_result,
-        )
-
         started = time.monotonic()
         run_ts = time.time()
         live_facts = await self._store.get_facts(principal_id)
@@ -133,34 +145,19 @@ class FactConsolidator:
             for f in live_facts
             if f.id is not None
         ]
-        prompt_spec = await build_consolidation_prompt(
-            facts=fact_dicts,
-            max_tokens_hint=self._max_tokens,
-        )
 
-        # Step 3: caller executes the LLM call.
-        try:
-            raw_response = await self._llm_call(
-                prompt_spec["system_prompt"],
-                prompt_spec["user_text"],
-                prompt_spec["max_tokens"],
-            )
-        except Exception as e:  # noqa: BLE001 - protocol-level isolation
-            report.error = f"llm_call_failed: {e}"
-            report.duration_ms = int((time.monotonic() - started) * 1000)
-            return report
-
-        # Step 4: parse + validate.
-        parsed = await parse_consolidation_result(
-            raw_response=raw_response,
-            facts=fact_dicts,
-        )
-        if not parsed["ok"]:
-            report.error = f"parse_failed: {parsed.get('error', 'unknown')}"
+        clusters = await self._block(principal_id, live_facts)
+        if clusters is None:
+            plan, error = await self._judge(fact_dicts)
+        else:
+            plan, error = await self._judge_clusters(fact_dicts, clusters)
+        if plan is None:
+            report.error = error
             report.duration_ms = int((time.monotonic() - started) * 1000)
             return report
-
-        plan = parsed["ops"]
+        # A partially failed blocked pass still applies the clusters that
+        # were judged (the failed ones were NOOPed) — but says so.
+        report.error = error
 
         # Step 5: apply or dry-run.
         if dry_run:
@@ -186,6 +183,109 @@ class FactConsolidator:
         report.duration_ms = int((time.monotonic() - started) * 1000)
         return report
 
+    async def _judge(self, fact_dicts: list[dict]) -> tuple[list[dict] | None, str | None]:
+        """Steps 2-4 for one fact list: prompt → caller's LLM → parsed plan.
+
+        Returns ``(plan, None)`` or ``(None, error)``; never raises.
+        """
+        # Imported lazily — fi_core.persona.mcp_server requires the [mcp]
+        # extra. The consolidator can still be imported by consumers who
+        # do not have it (Protocol satisfaction only, no use).
+        from fi_core.persona.mcp_server import (
+            build_consolidation_prompt,
+            parse_consolidation_result,
+        )
+
+        prompt_spec = await build_consolidation_prompt(
+            facts=fact_dicts,
+            max_tokens_hint=self._max_tokens,
+        )
+
+        # Step 3: caller executes the LLM call.
+        try:
+            raw_response = await self._llm_call(
+                prompt_spec["system_prompt"],
+                prompt_spec["user_text"],
+                prompt_spec["max_tokens"],
+            )
+        except Exception as e:  # noqa: BLE001 - protocol-level isolation
+            return None, f"llm_call_failed: {e}"
+
+        # Step 4: parse + validate.
+        parsed = await parse_consolidation_result(
+            raw_response=raw_response,
+            facts=fact_dicts,
+        )
+        if not parsed["ok"]:
+            return None, f"parse_failed: {parsed.get('error', 'unknown')}"
+        return parsed["ops"], None
+
+    async def _block(
+        self, principal_id: str, live_facts: list[Fact]
+    ) -> list[list[int]] | None:
+        """Clusters of judge candidates, or None to run the single-shot pass.
+
+        None when blocking is off, the set is below ``blocking.min_facts``,
+        or some fact has no vector (e.g. the embedding backfill is behind).
+        """
+        cfg = self._blocking
+        ids = [f.id for f in live_facts if f.id is not None]
+        if cfg is None or len(ids) < cfg.min_facts:
+            return None
+        vectors: dict[int, Sequence[float]] = {}
+        get_embeddings = getattr(self._store, "get_fact_embeddings", None)
+        if get_embeddings is not None:
+            vectors.update(await get_embeddings(principal_id))
+        missing = [f for f in live_facts if f.id is not None and f.id not in vectors]
+        if missing and self._embedder is not None:
+            try:
+                embedded = await asyncio.gather(*(self._embedder.embed(f.fact) for f in missing))
+            except Exception:  # noqa: BLE001 - no vectors → single-shot
+                return None
+            vectors.update({f.id: v for f, v in zip(missing, embedded, strict=True) if f.id is not None})
+        if any(i not in vectors for i in ids):
+            return None
+        pairs = similar_pairs({i: vectors[i] for i in ids}, cfg.min_similarity)
+        return cluster_facts(ids, pairs, max_cluster_size=cfg.max_cluster_size)
+
+    async def _judge_clusters(
+        self, fact_dicts: list[dict], clusters: list[list[int]]
+    ) -> tuple[list[dict] | None, str | None]:
+        """Judge each cluster (bounded concurrency) and merge into one plan.
+
+        Facts outside every cluster — and facts in a cluster whose judge call
+        failed — get a NOOP. Returns ``(None, error)`` only when EVERY
+        cluster failed (nothing worth applying).
+        """
+        assert self._blocking is not None
+        by_id = {d["id"]: d for d in fact_dicts}
+        gate = asyncio.Semaphore(max(1, self._blocking.max_concurrency))
+
+        async def judge(cluster: list[int]) -> tuple[list[dict] | None, str | None]:
+            async with gate:
+                return await self._judge([by_id[i] for i in cluster])
+
+        results = await asyncio.gather(*(judge(c) for c in clusters))
+        plan: list[dict] = []
+        errors: list[str] = []
+        covered: set[int] = set()
+        for cluster, (ops, error) in zip(clusters, results, strict=True):
+            if ops is None:
+                errors.append(error or "unknown")
+                continue
+            plan.extend(ops)
+            covered.update(cluster)
+        if clusters and len(errors) == len(clusters):
+            return None, errors[0]
+        plan.extend(
+            {"op": "NOOP", "id": d["id"], "reason": "no near-duplicate (blocking)"}
+            for d in fact_dicts
+            if d["id"] not in covered
+        )
+        if errors:
+            return plan, f"partial: {len(errors)}/{len(clusters)} clusters failed; {errors[0]}"
+        return plan, None
+
 
 def _synthesize_dry_run_ops(
     plan: list[dict],
@@ -247,6 +347,7 @@ def _synthesize_dry_run_ops(
 
 # Re-export so consumers can import everything from one place.
 __all__ = [
+    "BlockingConfig",
     "ConsolidationOp",
     "ConsolidationReport",
     "FactConsolidator",
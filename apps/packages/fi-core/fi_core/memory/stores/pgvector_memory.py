@@ -488,6 +488,21 @@ class PgMemoryStore:
         ordered = sorted(fused, key=lambda fid: fused[fid], reverse=True)[:limit]
         return [id_to_fact[fid] for fid in ordered]
 
+    async def get_fact_embeddings(self, principal_id: str) -> dict[int, list[float]]:
+        """Stored vectors of a principal's live facts, keyed by fact id.
+
+        Facts without an embedding yet are absent. Read by
+        ``FactConsolidator`` to block candidates before judging (see
+        ``fi_core.memory.blocking``) — no re-embedding of the fact set.
+        """
+        rows = await self._p.fetch(
+            "SELECT id, embedding FROM principal_facts "
+            "WHERE principal_id = $1 AND deleted_at IS NULL AND embedding IS NOT NULL",
+            principal_id,
+        )
+        # The pgvector codec decodes to a numpy array; hand back plain floats.
+        return {int(r["id"]): [float(x) for x in r["embedding"]] for r in rows}
+
     # ------------------------------------------------------------------
     # Consolidation
     # ------------------------------------------------------------------
@@ -4,6 +4,11 @@ Three detector classes — one per failure mode — plus a `sanitize` helper
 for last-resort cleanup. All deterministic regex matching; zero LLM calls
 at detection time.
 
+Each detector matches through a compiled, cached
+:class:`fi_core.matching.PatternMatcher` (required-literal prefilter), so only
+the patterns whose literal occurs in the text run their regex. Results are the
+same as searching every pattern.
+
 Failure mode → remedy mapping:
 
     BreakDetector                 hard identity leak  → retry w/ reinforcement
@@ -31,6 +36,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+from fi_core.matching import compile_patterns
 from fi_core.persona.types import DetectionResult
 
 
@@ -57,7 +63,7 @@ class BreakDetector:
         Non-empty list contains the `.pattern` attribute of each
         `re.Pattern` that matched — suitable for logging or alerting.
         """
-        return [p.pattern for p in self.patterns if p.search(text)]
+        return compile_patterns(tuple(self.patterns)).findall(text)
 
     def check(self, text: str) -> DetectionResult:
         """Same as `detect`, but returns a `DetectionResult` with severity."""
@@ -86,7 +92,7 @@ class AntiPatternMonitor:
         Non-empty list = matched patterns. Suggested usage: emit one
         telemetry event per match.
         """
-        return [p.pattern for p in self.patterns if p.search(text)]
+        return compile_patterns(tuple(self.patterns)).findall(text)
 
     def check(self, text: str) -> DetectionResult:
         """Same as `detect`, but returns a `DetectionResult` with severity."""
@@ -118,7 +124,7 @@ class ClarificationDumpDetector:
         Empty list = no dump detected.
         Non-empty list = matched patterns.
         """
-        return [p.pattern for p in self.patterns if p.search(text)]
+        return compile_patterns(tuple(self.patterns)).findall(text)
 
     def check(self, text: str) -> DetectionResult:
         """Same as `detect`, but returns a `DetectionResult` with severity."""
@@ -141,6 +147,7 @@ def sanitize(text: str, patterns: list[re.Pattern[str]]) -> str:
     failed.
     """
     sentences = re.split(r"(?<=[.!?])\s+", text)
-    clean = [s for s in sentences if not any(p.search(s) for p in patterns)]
+    matcher = compile_patterns(tuple(patterns))
+    clean = [s for s in sentences if not matcher.search(s)]
     result = " ".join(clean).strip()
     return result if result else text
@@ -34,7 +34,15 @@ from fi_core.rag.mcp_contract import MCP_SERVER_NAME, MCP_TOOLS
 from fi_core.rag.store_mcp_contract import MCP_SERVER_NAME as STORE_MCP_SERVER_NAME
 from fi_core.rag.store_mcp_contract import MCP_TOOLS as STORE_MCP_TOOLS
 from fi_core.rag.store_service import QuotaExceeded, RagStore
-from fi_core.rag.protocols import ChunkStore, DocumentChunkStore, Embedder
+from fi_core.rag.protocols import (
+    BatchEmbedder,
+    ChunkPruningStore,
+    ChunkStore,
+    DocumentChunkStore,
+    Embedder,
+    LexicalChunkStore,
+)
+from fi_core.rag.ingest import IngestProgress, chunk_hash, embed_texts
 from fi_core.rag.retrieval import (
     DEFAULT_LEXICAL_MIN,
     DEFAULT_SEMANTIC_MIN,
@@ -67,6 +75,7 @@ __all__ = [
     "SPANISH_ENGLISH_STOPWORDS",
     "Chunk",
     "ChunkConfig",
+    "ChunkPruningStore",
     "ChunkStore",
     "ChunkWithEmbedding",
     "ChunkingStrategy",
@@ -74,6 +83,11 @@ __all__ = [
     "DocumentMetadata",
     "DocumentRecord",
     "Embedder",
+    "BatchEmbedder",
+    "IngestProgress",
+    "chunk_hash",
+    "embed_texts",
+    "LexicalChunkStore",
     "LexicalRetriever",
     "RetrievedChunk",
     "ScoredText",
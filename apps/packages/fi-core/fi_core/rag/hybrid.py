@@ -7,21 +7,26 @@ fuses them with Reciprocal Rank Fusion (RRF), which combines by RANK, not score,
 so the incomparable scales of cosine and term-overlap never need normalizing.
 
 :func:`reciprocal_rank_fusion` is the generic primitive (also used by
-``fi_core.memory`` for fact recall). :class:`HybridRetriever` re-ranks a
-:class:`~fi_core.rag.store_retrieval.StoreBackedRetriever`'s dense candidate pool
-with the Spanish-tuned :class:`~fi_core.rag.retrieval.LexicalRetriever`: a chunk
-the dense ranker under-weighted but that exactly matches a query keyword floats
-up. (It fuses over the dense candidate pool, so a chunk the dense arm misses
-entirely is not recovered — a separate sparse index over the store would be the
-next step; for fi-core's small/medium corpora the over-fetch pool covers it.)
+``fi_core.memory`` for fact recall). :class:`HybridRetriever` has two modes:
+
+- ``sparse`` set (a :class:`~fi_core.rag.protocols.LexicalChunkStore`, e.g.
+  ``HDF5ChunkStore(lexical_index=True)``): the dense top-k and the store's BM25
+  top-k are fetched independently and fused, so a chunk the dense arm misses
+  entirely is still recalled by its keywords.
+- no ``sparse``: the dense candidate pool is re-ranked with the Spanish-tuned
+  :class:`~fi_core.rag.retrieval.LexicalRetriever` — a chunk the dense ranker
+  under-weighted but that exactly matches a query keyword floats up, but one
+  outside the pool is not recovered. Fine for small corpora held in any store.
 """
 
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any, TypeVar
 
+from fi_core.rag.protocols import LexicalChunkStore
 from fi_core.rag.retrieval import LexicalRetriever
 from fi_core.rag.store_retrieval import StoreBackedRetriever
 from fi_core.rag.types import RetrievedChunk
@@ -47,12 +52,16 @@ def reciprocal_rank_fusion(rankings: list[list[K]], *, k: int = DEFAULT_RRF_K) -
 
 @dataclass
 class HybridRetriever:
-    """Dense (store) + lexical retrieval fused by RRF over the candidate pool."""
+    """Dense (store) + lexical retrieval fused by RRF.
+
+    With ``sparse`` the lexical arm is the store's own index, queried on its
+    own; without it, ``lexical`` re-ranks the dense candidate pool."""
 
     dense: StoreBackedRetriever
     lexical: LexicalRetriever = field(default_factory=LexicalRetriever)
     rrf_k: int = DEFAULT_RRF_K
-    candidate_k: int = 50  # dense over-fetch pool size before fusion
+    candidate_k: int = 50  # per-arm pool size before fusion
+    sparse: LexicalChunkStore | None = None
 
     async def retrieve(
         self,
@@ -63,11 +72,15 @@ class HybridRetriever:
         candidate_k: int | None = None,
         filters: dict[str, Any] | None = None,
     ) -> list[RetrievedChunk]:
-        """Over-fetch the dense pool, re-rank it lexically, fuse with RRF, return
-        the top-k. Empty/blank query or empty pool → empty list. ``filters`` is
-        forwarded to the dense store query (metadata containment)."""
+        """Fetch both arms' top ``candidate_k``, fuse with RRF, return the top-k.
+        Empty/blank query or empty pools → empty list. ``filters`` is forwarded
+        to the store queries (metadata containment)."""
         if not query or not query.strip():
             return []
+        if self.sparse is not None:
+            return await self._retrieve_sparse(
+                query, namespace=namespace, top_k=top_k, pool_k=candidate_k or self.candidate_k, filters=filters
+            )
         pool = await self.dense.retrieve(
             query, namespace=namespace, top_k=candidate_k or self.candidate_k, min_similarity=0.0, filters=filters
         )
@@ -82,5 +95,25 @@ class HybridRetriever:
         ranked = sorted(fused, key=lambda i: fused[i], reverse=True)
         return [pool[i] for i in ranked[:top_k]]
 
+    async def _retrieve_sparse(
+        self, query: str, *, namespace: str, top_k: int, pool_k: int, filters: dict[str, Any] | None
+    ) -> list[RetrievedChunk]:
+        """Fuse two independent top-k lists: dense and the store's lexical index."""
+        assert self.sparse is not None
+        dense, sparse = await asyncio.gather(
+            self.dense.retrieve(query, namespace=namespace, top_k=pool_k, min_similarity=0.0, filters=filters),
+            self.sparse.lexical_query(namespace=namespace, query=query, top_k=pool_k, filters=filters),
+        )
+        # A chunk is the same hit in both arms when source and text match; the
+        # dense hit is kept (its similarity is on the store's usual scale).
+        hits: dict[tuple[str, str], RetrievedChunk] = {}
+        for h in [*sparse, *dense]:
+            hits[(h.chunk.source_ref, h.chunk.text)] = h
+        fused = reciprocal_rank_fusion(
+            [[(h.chunk.source_ref, h.chunk.text) for h in arm] for arm in (dense, sparse)], k=self.rrf_k
+        )
+        ranked = sorted(fused, key=lambda key: fused[key], reverse=True)
+        return [hits[key] for key in ranked[:top_k]]
+
 
 __all__ = ["DEFAULT_RRF_K", "HybridRetriever", "reciprocal_rank_fusion"]
@@ -0,0 +1,174 @@
+"""Batched, pipelined embed → store for :meth:`RagStore.ingest`.
+
+The original ingest embedded a document one chunk at a time (one model forward
+pass / one API round-trip per chunk) and only then wrote every chunk in a
+single ``save_chunks``: a large document paid N sequential embedding calls and
+was unsearchable until the very last one returned. This module splits that
+into two stages joined by a bounded queue:
+
+- **embed** — chunks go to the embedder ``batch_size`` at a time, through
+  :func:`embed_texts` (``embed_batch`` when the embedder is a
+  :class:`~fi_core.rag.protocols.BatchEmbedder`, bounded-concurrency ``embed``
+  calls otherwise);
+- **store** — embedded batches are written with ``save_chunks`` while the next
+  batch is being embedded. When the store falls behind, whatever batches are
+  waiting are coalesced into one bulk write.
+
+The queue holds at most ``queue_depth`` batches, so a slow store back-pressures
+the embedder instead of buffering the whole document's vectors in memory.
+Chunks become searchable batch by batch, and a failure in either stage cancels
+the other and propagates.
+
+Chunks are identified by :func:`chunk_hash` (SHA-256 of the text): duplicates
+inside one document are embedded and stored once, and :meth:`RagStore.ingest`
+diffs a re-upload against the stored chunk hashes, embedding only new chunks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+
+from fi_core.rag.protocols import BatchEmbedder, Embedder
+from fi_core.rag.types import Chunk, ChunkWithEmbedding
+
+#: Chunks per embedding call.
+DEFAULT_EMBED_BATCH = 32
+#: Embedded batches allowed to wait for the store before the embedder blocks.
+DEFAULT_QUEUE_DEPTH = 4
+# Concurrent single-text embed() calls when the embedder has no embed_batch.
+_FALLBACK_CONCURRENCY = 8
+
+
+def chunk_hash(text: str) -> str:
+    """Content identity of a chunk (hex SHA-256 of its UTF-8 text)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def dedupe_chunks(pieces: Sequence[str]) -> list[str]:
+    """``pieces`` without repeated texts, first occurrence kept, order preserved."""
+    seen: set[str] = set()
+    unique = []
+    for piece in pieces:
+        h = chunk_hash(piece)
+        if h not in seen:
+            seen.add(h)
+            unique.append(piece)
+    return unique
+
+
+@dataclass(frozen=True)
+class IngestProgress:
+    """One progress event of an ingest.
+
+    ``stage`` is ``"chunked"`` (``total`` known, nothing embedded yet; on a
+    re-ingest ``total`` counts only the new chunks),
+    ``"stored"`` (after each bulk write) or ``"unchanged"`` (a re-ingest whose
+    chunks match what is stored: nothing embedded, nothing written).
+    ``duplicates`` counts chunks dropped because the same text already
+    occurred earlier in the document.
+    """
+
+    stage: str
+    total: int
+    embedded: int = 0
+    stored: int = 0
+    duplicates: int = 0
+
+
+ProgressCallback = Callable[[IngestProgress], None]
+
+
+async def embed_texts(embedder: Embedder, texts: Sequence[str]) -> list[list[float]]:
+    """One vector per text, in order — batched when the embedder supports it."""
+    if not texts:
+        return []
+    if isinstance(embedder, BatchEmbedder):
+        return await embedder.embed_batch(list(texts))
+    sem = asyncio.Semaphore(_FALLBACK_CONCURRENCY)
+
+    async def one(text: str) -> list[float]:
+        async with sem:
+            return await embedder.embed(text)
+
+    return list(await asyncio.gather(*(one(t) for t in texts)))
+
+
+async def embed_and_store(
+    pieces: Sequence[str],
+    *,
+    doc_id: str,
+    embedder: Embedder,
+    save: Callable[[list[ChunkWithEmbedding]], Awaitable[int]],
+    batch_size: int = DEFAULT_EMBED_BATCH,
+    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+    on_progress: ProgressCallback | None = None,
+    duplicates: int = 0,
+) -> int:
+    """Run the embed and store stages over ``pieces``; returns chunks saved.
+
+    ``save`` is the bulk write (``store.save_chunks`` bound to a namespace and
+    document). ``on_progress`` is called after every write.
+    """
+    if batch_size < 1 or queue_depth < 1:
+        raise ValueError("batch_size and queue_depth must be >= 1")
+    queue: asyncio.Queue[list[ChunkWithEmbedding] | None] = asyncio.Queue(maxsize=queue_depth)
+    embedded = 0
+
+    async def embed_stage() -> None:
+        nonlocal embedded
+        for start in range(0, len(pieces), batch_size):
+            batch = pieces[start : start + batch_size]
+            vectors = await embed_texts(embedder, batch)
+            embedded += len(batch)
+            await queue.put([
+                ChunkWithEmbedding(Chunk(text=p, source_type="document", source_ref=doc_id), v)
+                for p, v in zip(batch, vectors, strict=True)
+            ])
+        await queue.put(None)
+
+    async def store_stage() -> int:
+        stored = 0
+        done = False
+        while not done:
+            bulk = await queue.get()
+            if bulk is None:
+                break
+            # Coalesce what else is already waiting into the same write.
+            while not queue.empty():
+                more = queue.get_nowait()
+                if more is None:
+                    done = True
+                    break
+                bulk.extend(more)
+            stored += await save(bulk)
+            if on_progress is not None:
+                on_progress(IngestProgress("stored", len(pieces), embedded, stored, duplicates))
+        return stored
+
+    embed_task = asyncio.create_task(embed_stage())
+    store_task = asyncio.create_task(store_stage())
+    try:
+        finished, _ = await asyncio.wait({embed_task, store_task}, return_when=asyncio.FIRST_EXCEPTION)
+        for task in finished:
+            task.result()  # re-raise the first stage failure
+        await embed_task
+        return await store_task
+    finally:
+        for task in (embed_task, store_task):
+            task.cancel()
+        await asyncio.gather(embed_task, store_task, return_exceptions=True)
+
+
+__all__ = [
+    "DEFAULT_EMBED_BATCH",
+    "DEFAULT_QUEUE_DEPTH",
+    "IngestProgress",
+    "ProgressCallback",
+    "chunk_hash",
+    "dedupe_chunks",
+    "embed_and_store",
+    "embed_texts",
+]
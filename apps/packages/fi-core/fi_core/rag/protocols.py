@@ -61,6 +61,22 @@ class Embedder(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchEmbedder(Embedder, Protocol):
+    """An ``Embedder`` that can also embed many texts in one call.
+
+    Optional capability: a local model amortizes its forward pass over a
+    batch, a remote API its round-trip. Ingest pipelines use it when present
+    (``isinstance(embedder, BatchEmbedder)``) and fall back to concurrent
+    ``embed`` calls otherwise — see :func:`fi_core.rag.ingest.embed_texts`.
+    """
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Return one vector per text, in input order. Same failure contract
+        as ``embed`` (raise, never a silent zero vector)."""
+        ...
+
+
 @runtime_checkable
 class ChunkStore(Protocol):
     """Anything that persists embedded chunks and answers similarity queries.
@@ -108,6 +124,64 @@ class ChunkStore(Protocol):
         ...
 
 
+@runtime_checkable
+class LexicalChunkStore(Protocol):
+    """A store that also ranks its chunks by keywords, from its own index.
+
+    Optional capability, the sparse counterpart of ``ChunkStore.query``:
+    ``HybridRetriever(sparse=store)`` fuses it with the dense ranking, so a
+    chunk the embedder misses but the keywords hit is still recalled.
+
+    Implementations:
+    - ``HDF5ChunkStore(lexical_index=True)`` — BM25 over an on-disk
+      inverted index next to the H5 file (``fi_core.stores.bm25``).
+    """
+
+    async def lexical_query(
+        self,
+        *,
+        namespace: str,
+        query: str,
+        top_k: int = 5,
+        filters: dict[str, Any] | None = None,
+    ) -> list[RetrievedChunk]:
+        """Return the top-k chunks of `namespace` by lexical relevance to `query`.
+
+        Best first; empty list when nothing matches. ``similarity`` is the
+        implementation's score scaled to [0, 1]. ``filters`` as in
+        ``ChunkStore.query``.
+        """
+        ...
+
+
+@runtime_checkable
+class ChunkPruningStore(Protocol):
+    """A store that can delete some of a document's chunks, not just all.
+
+    Optional capability: ``RagStore.ingest`` uses it on a re-upload to drop
+    only the chunks whose text is gone and embed only the new ones. Without
+    it a changed document is re-chunked from scratch.
+
+    Implementations:
+    - ``HDF5ChunkStore``
+    - ``PgVectorChunkStore``
+    """
+
+    async def delete_chunks(
+        self,
+        *,
+        namespace: str,
+        document_id: str,
+        texts: list[str],
+    ) -> int:
+        """Delete the chunks under a document whose text is in ``texts``.
+
+        Returns the count deleted. Texts with no matching chunk are
+        ignored; the parent document is left alone.
+        """
+        ...
+
+
 @runtime_checkable
 class DocumentChunkStore(ChunkStore, Protocol):
     """Extends ChunkStore with parent-document lifecycle + bulk operations.
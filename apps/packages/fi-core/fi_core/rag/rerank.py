@@ -10,14 +10,20 @@ fi-core ships the Protocol + a reference impl; the model dep is an extra:
 - :class:`Reranker` — the port (consumer can bring Cohere, a custom model, ...).
 - :class:`BgeReranker` — ``BAAI/bge-reranker-v2-m3`` (multilingual, Apache-2.0,
   self-host) via sentence-transformers ``CrossEncoder``. Needs ``fi-core[rerank]``.
+  Pairs from concurrent ``rerank`` calls are coalesced into length-sorted
+  batches, and scores are cached per (query, passage, model) — a repeated or
+  paginated query doesn't pay the cross-encoder twice.
 - :class:`RerankingRetriever` — wraps ANY retriever (StoreBacked / Hybrid):
   over-fetch a candidate pool, rerank, return top-k. Reorders the original
   RetrievedChunks (their similarity is preserved; the rerank score drives ORDER).
+  ``rerank_top_n`` reranks only the head of the pool (first-stage order).
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
@@ -57,16 +63,45 @@ class SupportsRetrieve(Protocol):
         ...
 
 
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+_PairKey = tuple[str, bytes, bytes]  # (model, query digest, passage digest)
+
+
 @dataclass
 class BgeReranker:
     """``BAAI/bge-reranker-v2-m3`` cross-encoder reranker (multilingual).
 
     Lazy-loads the model on first use (it's ~600MB) and runs the blocking
-    ``predict`` off the event loop. Requires ``fi-core[rerank]``."""
+    ``predict`` off the event loop. Requires ``fi-core[rerank]``.
+
+    Scoring is a small batching service shared by every caller of the
+    instance:
+
+    - pairs not in the cache wait up to ``max_wait_ms`` (or until
+      ``batch_size`` are queued) so concurrent requests share forward passes;
+      one worker runs the model, and pairs queued while it runs go in its next
+      round;
+    - each round is sorted by length before it's cut into ``batch_size``
+      batches, so a batch pads to its own longest pair, not the round's;
+    - a pair already queued or running is awaited, not queued twice;
+    - scores are kept in an LRU of ``cache_size`` pairs (0 disables it).
+    """
 
     model_name: str = "BAAI/bge-reranker-v2-m3"
     device: str | None = None
+    batch_size: int = 32
+    max_wait_ms: float = 2.0
+    cache_size: int = 20_000
+    max_length: int | None = None  # tokenizer truncation; None = the model's
     _model: Any = field(default=None, init=False, repr=False)
+    _cache: OrderedDict[_PairKey, float] = field(default_factory=OrderedDict, init=False, repr=False)
+    _inflight: dict[_PairKey, asyncio.Future[float]] = field(default_factory=dict, init=False, repr=False)
+    _queue: list[tuple[_PairKey, tuple[str, str]]] = field(default_factory=list, init=False, repr=False)
+    _timer: asyncio.TimerHandle | None = field(default=None, init=False, repr=False)
+    _worker: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
 
     def _get_model(self) -> Any:
         if self._model is None:
@@ -76,17 +111,98 @@ class BgeReranker:
                 raise ImportError(
                     "BgeReranker requires the rerank extra: pip install 'fi-core[rerank]'"
                 ) from exc
-            self._model = CrossEncoder(self.model_name, device=self.device)
+            kwargs = {} if self.max_length is None else {"max_length": self.max_length}
+            self._model = CrossEncoder(self.model_name, device=self.device, **kwargs)
         return self._model
 
     async def rerank(self, query: str, documents: list[str]) -> list[RerankResult]:
         if not documents:
             return []
+        scores = await self._score(query, documents)
+        ranked = sorted(enumerate(scores), key=lambda x: x[1], reverse=True)
+        return [RerankResult(index=i, score=s) for i, s in ranked]
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    async def _score(self, query: str, documents: list[str]) -> list[float]:
+        loop = asyncio.get_running_loop()
+        query_digest = _digest(query)
+        scores: list[float | None] = [None] * len(documents)
+        waiting: list[tuple[int, asyncio.Future[float]]] = []
+        for i, doc in enumerate(documents):
+            key = (self.model_name, query_digest, _digest(doc))
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                scores[i] = cached
+                continue
+            future = self._inflight.get(key)
+            if future is None:
+                future = self._inflight[key] = loop.create_future()
+                self._queue.append((key, (query, doc)))
+            waiting.append((i, future))
+        if not waiting:
+            return scores  # type: ignore[return-value]
+        if self._worker is None:
+            if len(self._queue) >= self.batch_size or self.max_wait_ms <= 0:
+                self._start_worker()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.max_wait_ms / 1000, self._start_worker)
+        # shield: a cancelled caller must not cancel a future other callers share
+        results = await asyncio.gather(*(asyncio.shield(f) for _, f in waiting))
+        for (i, _), score in zip(waiting, results, strict=True):
+            scores[i] = score
+        return scores  # type: ignore[return-value]
+
+    def _start_worker(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._worker is None and self._queue:
+            self._worker = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self) -> None:
+        items: list[tuple[_PairKey, tuple[str, str]]] = []
+        try:
+            while self._queue:
+                items, self._queue = self._queue, []
+                scores = await asyncio.to_thread(self._predict, [pair for _, pair in items])
+                for (key, _), score in zip(items, scores, strict=True):
+                    self._remember(key, score)
+                    future = self._inflight.pop(key)
+                    if not future.done():
+                        future.set_result(score)
+                items = []
+        except BaseException as exc:
+            for key, _ in items + self._queue:
+                future = self._inflight.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(exc)
+            self._queue = []
+            if not isinstance(exc, Exception):
+                raise
+        finally:
+            self._worker = None
+
+    def _predict(self, pairs: list[tuple[str, str]]) -> list[float]:
+        """Blocking: score ``pairs`` in length-sorted batches (worker thread)."""
         model = self._get_model()
-        pairs = [(query, d) for d in documents]
-        scores = await asyncio.to_thread(model.predict, pairs)  # blocking → off-loop
-        ranked = sorted(enumerate(scores), key=lambda x: float(x[1]), reverse=True)
-        return [RerankResult(index=i, score=float(s)) for i, s in ranked]
+        order = sorted(range(len(pairs)), key=lambda i: len(pairs[i][0]) + len(pairs[i][1]))
+        scores = [0.0] * len(pairs)
+        for start in range(0, len(order), self.batch_size):
+            batch = order[start : start + self.batch_size]
+            out = model.predict([pairs[i] for i in batch], batch_size=len(batch), show_progress_bar=False)
+            for i, score in zip(batch, out, strict=True):
+                scores[i] = float(score)
+        return scores
+
+    def _remember(self, key: _PairKey, score: float) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = score
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
 
 
 @dataclass
@@ -95,11 +211,17 @@ class RerankingRetriever:
 
     ``base`` is any retriever (StoreBackedRetriever / HybridRetriever). The
     returned chunks are the originals (their similarity preserved) REORDERED by
-    the reranker; pass-through when the pool is empty."""
+    the reranker; pass-through when the pool is empty.
+
+    ``rerank_top_n`` is the early-exit mode: only the first N of the pool (the
+    base retriever's best) go through the reranker, and the rest follow them in
+    first-stage order. Cross-encoder cost scales with the pairs scored, so this
+    trades a little recall deep in the pool for a bounded rerank."""
 
     base: SupportsRetrieve
     reranker: Reranker
     candidate_k: int = 50  # over-fetch pool size before reranking
+    rerank_top_n: int | None = None  # None = rerank the whole pool
 
     async def retrieve(
         self,
@@ -117,8 +239,9 @@ class RerankingRetriever:
         )
         if not pool:
             return []
-        ranked = await self.reranker.rerank(query, [h.chunk.text for h in pool])
-        return [pool[r.index] for r in ranked[:top_k]]
+        head = pool if self.rerank_top_n is None else pool[: self.rerank_top_n]
+        ranked = await self.reranker.rerank(query, [h.chunk.text for h in head])
+        return ([head[r.index] for r in ranked] + pool[len(head) :])[:top_k]
 
 
 __all__ = ["BgeReranker", "RerankResult", "Reranker", "RerankingRetriever", "SupportsRetrieve"]
@@ -28,9 +28,11 @@ from __future__ import annotations
 
 import math
 import re
-import unicodedata
 from dataclasses import dataclass
 
+# Shared with the guard vocabularies; re-exported as fi_core.rag.fold_accents.
+from fi_core.matching import fold_accents
+
 #: Common ES + EN glue words stripped before lexical overlap, so they can't
 #: manufacture a false match against a chunk that shares nothing topical.
 SPANISH_ENGLISH_STOPWORDS: frozenset[str] = frozenset({
@@ -51,16 +53,6 @@ DEFAULT_LEXICAL_MIN = 0.12
 DEFAULT_SEMANTIC_MIN = 0.25
 
 
-def fold_accents(text: str) -> str:
-    """Lowercase and strip diacritics (áéíóúñ → aeioun) for matching.
-
-    NFKD-decompose then drop combining marks. ñ→n is fine for keyword overlap.
-    """
-    return "".join(
-        ch for ch in unicodedata.normalize("NFKD", text.lower()) if not unicodedata.combining(ch)
-    )
-
-
 def tokenize(text: str) -> set[str]:
     """Word tokens of `text`, accent-folded. Set-valued (overlap, not frequency)."""
     return set(re.findall(r"\w+", fold_accents(text)))
@@ -22,9 +22,17 @@ import os
 from dataclasses import dataclass
 
 from fi_core.rag.chunking import ChunkConfig, ChunkingStrategy, chunk_document
-from fi_core.rag.protocols import DocumentChunkStore, Embedder
+from fi_core.rag.ingest import (
+    DEFAULT_EMBED_BATCH,
+    IngestProgress,
+    ProgressCallback,
+    chunk_hash,
+    dedupe_chunks,
+    embed_and_store,
+)
+from fi_core.rag.protocols import ChunkPruningStore, DocumentChunkStore, Embedder
 from fi_core.rag.store_retrieval import StoreBackedRetriever
-from fi_core.rag.types import Chunk, ChunkWithEmbedding, DocumentMetadata, DocumentRecord, RetrievedChunk
+from fi_core.rag.types import ChunkWithEmbedding, DocumentMetadata, DocumentRecord, RetrievedChunk
 
 
 def build_store_from_env() -> DocumentChunkStore:
@@ -128,23 +136,61 @@ class RagStore:
         chunk_size: int = 400,
         overlap: int = 50,
         min_chunk_size: int = 100,
+        batch_size: int = DEFAULT_EMBED_BATCH,
+        on_progress: ProgressCallback | None = None,
     ) -> int:
         """Chunk + embed + persist ``text`` under ``doc_id`` in ``corpus_id``.
-        Re-ingesting an existing ``doc_id`` REPLACES its chunks. Returns the count."""
+        Re-ingesting an existing ``doc_id`` REPLACES its chunks. Returns the count.
+
+        Embedding runs in batches of ``batch_size`` pipelined with the writes
+        (:mod:`fi_core.rag.ingest`); ``on_progress`` receives an
+        :class:`~fi_core.rag.ingest.IngestProgress` after chunking and after
+        each write. Repeated chunks are stored once. A re-ingest is diffed by
+        chunk hash against the stored chunks: chunks that survive are kept,
+        removed ones are deleted and only new ones are embedded (``total`` in
+        the progress counts those); when nothing changed it embeds and writes
+        nothing (its metadata is still updated). Stores without
+        :class:`~fi_core.rag.protocols.ChunkPruningStore` get every chunk
+        replaced on any change."""
         strat = ChunkingStrategy(strategy) if isinstance(strategy, str) else strategy
-        pieces = chunk_document(text, strat, ChunkConfig(chunk_size=chunk_size, overlap=overlap, min_chunk_size=min_chunk_size))
+        chunked = chunk_document(text, strat, ChunkConfig(chunk_size=chunk_size, overlap=overlap, min_chunk_size=min_chunk_size))
+        pieces = dedupe_chunks(chunked)
+        duplicates = len(chunked) - len(pieces)
         await self._enforce_quota(corpus_id, doc_id, new_bytes=sum(len(p.encode("utf-8")) for p in pieces))
         md = DocumentMetadata(attributes=metadata or {})
+        kept = 0
         if await self.store.get_document(namespace=corpus_id, document_id=doc_id) is not None:
-            await self.store.delete_chunks_by_document(namespace=corpus_id, document_id=doc_id)
+            old_chunks = await self.store.get_chunks_by_document(namespace=corpus_id, document_id=doc_id)
+            stored = {chunk_hash(c.text): c.text for c in old_chunks}
+            wanted = {chunk_hash(p): p for p in pieces}
+            if pieces and stored.keys() == wanted.keys():
+                await self.store.update_document(namespace=corpus_id, document_id=doc_id, content=text, metadata=md)
+                if on_progress is not None:
+                    on_progress(IngestProgress("unchanged", len(pieces), 0, len(pieces), duplicates))
+                return len(pieces)
+            if isinstance(self.store, ChunkPruningStore):
+                removed = [t for h, t in stored.items() if h not in wanted]
+                if removed:
+                    await self.store.delete_chunks(namespace=corpus_id, document_id=doc_id, texts=removed)
+                kept = len(stored) - len(removed)
+                pieces = [p for h, p in wanted.items() if h not in stored]
+            else:
+                await self.store.delete_chunks_by_document(namespace=corpus_id, document_id=doc_id)
             await self.store.update_document(namespace=corpus_id, document_id=doc_id, content=text, metadata=md)
         else:
             await self.store.create_document(namespace=corpus_id, document_id=doc_id, content=text, metadata=md)
-        chunks: list[ChunkWithEmbedding] = []
-        for piece in pieces:
-            embedding = await self.embedder.embed(piece)
-            chunks.append(ChunkWithEmbedding(Chunk(text=piece, source_type="document", source_ref=doc_id), embedding))
-        return await self.store.save_chunks(namespace=corpus_id, document_id=doc_id, chunks=chunks) if chunks else 0
+        if on_progress is not None:
+            on_progress(IngestProgress("chunked", len(pieces), duplicates=duplicates))
+        if not pieces:
+            return kept
+
+        async def save(chunks: list[ChunkWithEmbedding]) -> int:
+            return await self.store.save_chunks(namespace=corpus_id, document_id=doc_id, chunks=chunks)
+
+        return kept + await embed_and_store(
+            pieces, doc_id=doc_id, embedder=self.embedder, save=save,
+            batch_size=batch_size, on_progress=on_progress, duplicates=duplicates,
+        )
 
     async def _enforce_quota(self, corpus_id: str, doc_id: str, *, new_bytes: int) -> None:
         """Raise :class:`QuotaExceeded` if ingesting ``new_bytes`` under ``doc_id``
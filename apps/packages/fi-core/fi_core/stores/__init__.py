@@ -11,6 +11,9 @@ backend dependencies via optional-deps extras:
   (asyncpg + pgvector). Best for multi-tenant chat substrates with
   concurrent writes, relational filters mixed with vector similarity,
   and transactional consistency. IVFFlat index by default.
+- ``fi_core.stores.bm25`` (numpy) is the persistent BM25 inverted index
+  behind ``HDF5ChunkStore(lexical_index=True)``; usable on its own for
+  any store that wants keyword search at corpus scale.
 
 Both implement the same ``DocumentChunkStore`` Protocol — pick by use
 case, not by abstraction layer.
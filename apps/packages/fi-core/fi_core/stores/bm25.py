@@ -0,0 +1,625 @@
+"""Persistent BM25 inverted index — the sparse arm of hybrid retrieval.
+
+``HybridRetriever`` used to score lexically only the chunks the dense arm
+had already returned, re-tokenizing each one per query: a chunk the
+embedder missed could never come back, and the cost grew with the pool.
+This index answers a lexical top-k on its own, over every chunk in a
+namespace, so RRF fuses two real top-k lists.
+
+Scoring is Okapi BM25 (``k1``, ``b``) over accent-folded ``\\w+`` tokens
+with the Spanish + English stopwords of :mod:`fi_core.rag.retrieval`
+stripped — the same terms :class:`~fi_core.rag.retrieval.LexicalRetriever`
+matches on.
+
+Layout (next to the HDF5 store: ``store.h5.bm25/``)::
+
+    store.h5.bm25/
+    └── {namespace hash}/
+        ├── NAMESPACE            the namespace, verbatim
+        ├── seg-{gen}.bm25       immutable segment
+        └── seg-{gen}.del        rows of that segment deleted since (JSON)
+
+A segment file is ``MAGIC``, a little-endian uint64 header length, a JSON
+header (terms, documents, chunk ids, generations it replaces), then five
+8-byte-aligned little-endian arrays: per-row length (uint32) and document
+(uint32), per-term posting offsets (uint64), and the postings themselves
+— row (uint32) and term frequency (uint16), grouped by term. Segments are
+memory-mapped, so opening an index does not read its postings.
+
+Writes are log-structured, like Lucene: ``add`` fills an in-memory
+segment; at ``flush_docs`` rows (or on ``flush``) it is written out as an
+immutable segment; once ``merge_factor`` segments of the same size tier
+exist they are merged into one, dropping deleted rows. Deletes mark rows
+in the ``.del`` sidecar. Document frequencies still count deleted rows
+until their segment is merged (Lucene does the same). The index is not a
+source of truth: chunks added after the last flush live in memory only,
+and the owning store re-adds them on open (:meth:`BM25Index.sync`).
+
+Each namespace has one lock; a search holds it for its few milliseconds.
+One process writes a given index; a merge interrupted by a crash is
+finished on the next open.
+
+Optional dependency: ``numpy`` (the ``stores-hdf5`` extra).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import re
+import struct
+import threading
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "fi_core.stores.bm25 requires numpy. Install via: pip install 'fi-core[stores-hdf5]'"
+    ) from e
+
+from fi_core.matching import fold_accents
+from fi_core.rag.retrieval import SPANISH_ENGLISH_STOPWORDS
+
+MAGIC = b"FIBM25\x01\n"
+
+#: Okapi BM25 term-frequency saturation.
+DEFAULT_K1 = 1.2
+#: Okapi BM25 length normalization.
+DEFAULT_B = 0.75
+#: In-memory rows written out as one segment.
+DEFAULT_FLUSH_DOCS = 10_000
+#: Segments of one size tier merged together.
+DEFAULT_MERGE_FACTOR = 8
+
+_TOKEN = re.compile(r"\w+")
+_MAX_TF = 0xFFFF
+# Arrays after the header, in file order: (name, dtype).
+_LAYOUT = (
+    ("lengths", "<u4"),
+    ("doc_of", "<u4"),
+    ("offsets", "<u8"),
+    ("post_rows", "<u4"),
+    ("post_tfs", "<u2"),
+)
+
+
+def terms(text: str, stopwords: frozenset[str] = SPANISH_ENGLISH_STOPWORDS) -> list[str]:
+    """Indexable terms of ``text``: folded word tokens, stopwords removed, repeats kept."""
+    return [t for t in _TOKEN.findall(fold_accents(text)) if t not in stopwords]
+
+
+@dataclass(frozen=True)
+class SparseHit:
+    """One lexical match: the chunk's address and its BM25 score."""
+
+    document_id: str
+    chunk_id: str
+    score: float
+
+
+class _Segment:
+    """An immutable, memory-mapped segment plus its mutable deleted-rows mask."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.gen = int(path.stem.split("-")[1])
+        raw = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(raw[: len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a BM25 segment")
+        (header_len,) = struct.unpack("<Q", bytes(raw[len(MAGIC) : len(MAGIC) + 8]))
+        start = len(MAGIC) + 8
+        header = json.loads(bytes(raw[start : start + header_len]))
+        self.replaces: list[int] = header["replaces"]
+        self.term_list: list[str] = header["terms"]
+        self.terms = {t: i for i, t in enumerate(self.term_list)}
+        self.documents: list[str] = header["documents"]
+        self.doc_index = {d: i for i, d in enumerate(self.documents)}
+        self.chunk_ids: list[str] = header["chunks"]
+        self.n = len(self.chunk_ids)
+        counts = {
+            "lengths": self.n,
+            "doc_of": self.n,
+            "offsets": len(self.term_list) + 1,
+            "post_rows": header["postings"],
+            "post_tfs": header["postings"],
+        }
+        offset = _align(start + header_len)
+        for name, dtype in _LAYOUT:
+            arr = np.frombuffer(raw, dtype=dtype, count=counts[name], offset=offset)
+            setattr(self, name, arr)
+            offset = _align(offset + arr.nbytes)
+        self.alive = np.ones(self.n, dtype=bool)
+        del_path = path.with_suffix(".del")
+        if del_path.exists():
+            self.alive[np.asarray(json.loads(del_path.read_text()), dtype=np.intp)] = False
+        self.live = int(self.alive.sum())
+        self.live_length = int(self.lengths[self.alive].sum(dtype=np.int64))
+
+    def postings(self, term: str) -> tuple[np.ndarray, np.ndarray] | None:
+        i = self.terms.get(term)
+        if i is None:
+            return None
+        lo, hi = int(self.offsets[i]), int(self.offsets[i + 1])
+        return self.post_rows[lo:hi], self.post_tfs[lo:hi]
+
+    def df(self, term: str) -> int:
+        i = self.terms.get(term)
+        return 0 if i is None else int(self.offsets[i + 1] - self.offsets[i])
+
+    def rows_of(self, document_id: str) -> np.ndarray:
+        i = self.doc_index.get(document_id)
+        if i is None:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero((self.doc_of == i) & self.alive)
+
+    def kill(self, rows: np.ndarray) -> int:
+        rows = rows[self.alive[rows]]
+        if not len(rows):
+            return 0
+        self.alive[rows] = False
+        self.live -= len(rows)
+        self.live_length -= int(self.lengths[rows].sum(dtype=np.int64))
+        _write_atomic(
+            self.path.with_suffix(".del"),
+            json.dumps(np.flatnonzero(~self.alive).tolist()).encode("ascii"),
+        )
+        return len(rows)
+
+    def live_rows(self) -> Iterable[tuple[int, str, str]]:
+        for row in np.flatnonzero(self.alive).tolist():
+            yield row, self.documents[self.doc_of[row]], self.chunk_ids[row]
+
+
+class _MemSegment:
+    """The rows added since the last flush, in growable arrays."""
+
+    def __init__(self) -> None:
+        self.postings: dict[str, tuple[array, array]] = {}
+        self.documents: list[str] = []
+        self.doc_index: dict[str, int] = {}
+        self.chunk_ids: list[str] = []
+        self.doc_of = array("I")
+        self.lengths = array("I")
+        self.alive = bytearray()
+        self.live = 0
+        self.live_length = 0
+
+    def add(self, document_id: str, chunk_id: str, tokens: list[str]) -> None:
+        row = len(self.chunk_ids)
+        doc = self.doc_index.get(document_id)
+        if doc is None:
+            doc = self.doc_index[document_id] = len(self.documents)
+            self.documents.append(document_id)
+        self.chunk_ids.append(chunk_id)
+        self.doc_of.append(doc)
+        self.lengths.append(len(tokens))
+        self.alive.append(1)
+        self.live += 1
+        self.live_length += len(tokens)
+        for term, tf in Counter(tokens).items():
+            rows, tfs = self.postings.setdefault(term, (array("I"), array("H")))
+            rows.append(row)
+            tfs.append(min(tf, _MAX_TF))
+
+    def postings_of(self, term: str) -> tuple[np.ndarray, np.ndarray] | None:
+        p = self.postings.get(term)
+        if p is None:
+            return None
+        return np.array(p[0], dtype=np.uint32), np.array(p[1], dtype=np.uint16)
+
+    def df(self, term: str) -> int:
+        p = self.postings.get(term)
+        return 0 if p is None else len(p[0])
+
+    def rows_of(self, document_id: str) -> list[int]:
+        doc = self.doc_index.get(document_id)
+        if doc is None:
+            return []
+        return [r for r, d in enumerate(self.doc_of) if d == doc and self.alive[r]]
+
+    def kill(self, rows: Iterable[int]) -> int:
+        killed = 0
+        for r in rows:
+            if self.alive[r]:
+                self.alive[r] = 0
+                self.live -= 1
+                self.live_length -= self.lengths[r]
+                killed += 1
+        return killed
+
+    def live_rows(self) -> Iterable[tuple[int, str, str]]:
+        for r, chunk_id in enumerate(self.chunk_ids):
+            if self.alive[r]:
+                yield r, self.documents[self.doc_of[r]], chunk_id
+
+
+class _Namespace:
+    def __init__(self, directory: Path) -> None:
+        self.dir = directory
+        self.lock = threading.RLock()
+        self.segments: list[_Segment] = []
+        self.mem = _MemSegment()
+        paths = sorted(directory.glob("seg-*.bm25"))
+        for tmp in directory.glob("*.tmp"):
+            tmp.unlink(missing_ok=True)
+        loaded = [_Segment(p) for p in paths]
+        # A merge that crashed between writing its output and removing its
+        # inputs left both behind: the output wins.
+        replaced = {g for s in loaded for g in s.replaces}
+        for s in loaded:
+            if s.gen in replaced:
+                _remove_segment(s.path)
+            else:
+                self.segments.append(s)
+        self.next_gen = max((s.gen for s in loaded), default=0) + 1
+
+    @property
+    def live(self) -> int:
+        return self.mem.live + sum(s.live for s in self.segments)
+
+    @property
+    def live_length(self) -> int:
+        return self.mem.live_length + sum(s.live_length for s in self.segments)
+
+
+class BM25Index:
+    """Per-namespace BM25 inverted index persisted as segments under ``directory``.
+
+    ``add`` / ``remove_document`` / ``remove`` keep it in step with a chunk
+    store; ``search`` returns the top-k chunks of a namespace by BM25. See
+    the module docstring for the on-disk format and the merge policy.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        k1: float = DEFAULT_K1,
+        b: float = DEFAULT_B,
+        flush_docs: int = DEFAULT_FLUSH_DOCS,
+        merge_factor: int = DEFAULT_MERGE_FACTOR,
+        stopwords: frozenset[str] = SPANISH_ENGLISH_STOPWORDS,
+    ) -> None:
+        if flush_docs < 1 or merge_factor < 2:
+            raise ValueError("flush_docs must be >= 1 and merge_factor >= 2")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.k1, self.b = k1, b
+        self.flush_docs, self.merge_factor = flush_docs, merge_factor
+        self.stopwords = stopwords
+        self._lock = threading.Lock()
+        self._namespaces: dict[str, _Namespace] = {}
+        for marker in self.directory.glob("*/NAMESPACE"):
+            self._namespaces[marker.read_text(encoding="utf-8")] = _Namespace(marker.parent)
+
+    def namespaces(self) -> list[str]:
+        return list(self._namespaces)
+
+    def _ns(self, namespace: str, create: bool = False) -> _Namespace | None:
+        ns = self._namespaces.get(namespace)
+        if ns is None and create:
+            with self._lock:
+                ns = self._namespaces.get(namespace)
+                if ns is None:
+                    directory = self.directory / hashlib.sha256(namespace.encode("utf-8")).hexdigest()[:16]
+                    directory.mkdir(parents=True, exist_ok=True)
+                    (directory / "NAMESPACE").write_text(namespace, encoding="utf-8")
+                    ns = self._namespaces[namespace] = _Namespace(directory)
+        return ns
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, namespace: str, items: Iterable[tuple[str, str, str]]) -> int:
+        """Index ``(document_id, chunk_id, text)`` items. The caller dedupes
+        (the store only passes chunks it did not hold). Returns rows added."""
+        ns = self._ns(namespace, create=True)
+        assert ns is not None
+        added = 0
+        with ns.lock:
+            for document_id, chunk_id, text in items:
+                ns.mem.add(document_id, chunk_id, terms(text, self.stopwords))
+                added += 1
+                if len(ns.mem.chunk_ids) >= self.flush_docs:
+                    self._flush_ns(ns)
+        return added
+
+    def remove_document(self, namespace: str, document_id: str) -> int:
+        """Delete every row of ``document_id``; returns rows deleted."""
+        ns = self._ns(namespace)
+        if ns is None:
+            return 0
+        with ns.lock:
+            removed = ns.mem.kill(ns.mem.rows_of(document_id))
+            for seg in ns.segments:
+                removed += seg.kill(seg.rows_of(document_id))
+            return removed
+
+    def remove(self, namespace: str, keys: set[tuple[str, str]]) -> int:
+        """Delete the rows of the given ``(document_id, chunk_id)`` keys."""
+        ns = self._ns(namespace)
+        if ns is None or not keys:
+            return 0
+        with ns.lock:
+            removed = ns.mem.kill([r for r, d, c in ns.mem.live_rows() if (d, c) in keys])
+            for seg in ns.segments:
+                rows = [r for r, d, c in seg.live_rows() if (d, c) in keys]
+                removed += seg.kill(np.asarray(rows, dtype=np.intp))
+            return removed
+
+    def sync(self, namespace: str, items: Iterable[tuple[str, str, str]]) -> tuple[int, int]:
+        """Make the namespace hold exactly ``items`` (``(document_id, chunk_id,
+        text)``, the store's current chunks): add what is missing, delete
+        what is gone. Returns ``(added, removed)``."""
+        wanted = {(d, c): text for d, c, text in items}
+        ns = self._ns(namespace, create=bool(wanted))
+        if ns is None:
+            return 0, 0
+        with ns.lock:
+            held = {(d, c) for seg in [ns.mem, *ns.segments] for _, d, c in seg.live_rows()}
+            removed = self.remove(namespace, held - wanted.keys())
+            added = self.add(namespace, ((d, c, wanted[(d, c)]) for d, c in wanted.keys() - held))
+        return added, removed
+
+    def flush(self, namespace: str | None = None) -> int:
+        """Write the in-memory rows out as segments; returns rows written."""
+        written = 0
+        for name in [namespace] if namespace is not None else list(self._namespaces):
+            ns = self._ns(name)
+            if ns is not None:
+                with ns.lock:
+                    written += self._flush_ns(ns)
+        return written
+
+    def _flush_ns(self, ns: _Namespace) -> int:
+        mem = ns.mem
+        ns.mem = _MemSegment()
+        if not mem.live:
+            return 0
+        keep = np.flatnonzero(np.frombuffer(bytes(mem.alive), dtype=np.uint8))
+        remap = np.full(len(mem.chunk_ids), -1, dtype=np.int64)
+        remap[keep] = np.arange(len(keep))
+        term_list = sorted(mem.postings)
+        rows_parts, tfs_parts, offsets = [], [], [0]
+        for term in term_list:
+            rows = remap[np.array(mem.postings[term][0], dtype=np.int64)]
+            tfs = np.array(mem.postings[term][1], dtype=np.uint16)
+            live = rows >= 0
+            rows_parts.append(rows[live])
+            tfs_parts.append(tfs[live])
+            offsets.append(offsets[-1] + int(live.sum()))
+        seg = self._write_segment(
+            ns,
+            term_list=term_list,
+            documents=mem.documents,
+            chunk_ids=[mem.chunk_ids[r] for r in keep.tolist()],
+            lengths=np.array(mem.lengths, dtype=np.uint32)[keep],
+            doc_of=np.array(mem.doc_of, dtype=np.uint32)[keep],
+            offsets=np.asarray(offsets, dtype=np.uint64),
+            post_rows=np.concatenate(rows_parts).astype(np.uint32) if rows_parts else np.empty(0, np.uint32),
+            post_tfs=np.concatenate(tfs_parts) if tfs_parts else np.empty(0, np.uint16),
+            replaces=[],
+        )
+        ns.segments.append(seg)
+        self._maybe_merge(ns)
+        return seg.n
+
+    def _tier(self, n: int) -> int:
+        return int(math.log(max(n, 1) / self.flush_docs, self.merge_factor)) if n > self.flush_docs else 0
+
+    def _maybe_merge(self, ns: _Namespace) -> None:
+        while True:
+            tiers: dict[int, list[_Segment]] = {}
+            for seg in ns.segments:
+                tiers.setdefault(self._tier(seg.live), []).append(seg)
+            full = next((segs for segs in tiers.values() if len(segs) >= self.merge_factor), None)
+            if full is None:
+                return
+            self._merge(ns, full[: self.merge_factor])
+
+    def _merge(self, ns: _Namespace, inputs: list[_Segment]) -> None:
+        """Replace ``inputs`` by one segment without their deleted rows."""
+        documents: list[str] = []
+        doc_index: dict[str, int] = {}
+        chunk_ids: list[str] = []
+        lengths, doc_of, term_ids, rows, tfs = [], [], [], [], []
+        vocab = sorted({t for seg in inputs for t in seg.term_list})
+        vocab_index = {t: i for i, t in enumerate(vocab)}
+        base = 0
+        for seg in inputs:
+            keep = np.flatnonzero(seg.alive)
+            remap = np.full(seg.n, -1, dtype=np.int64)
+            remap[keep] = base + np.arange(len(keep))
+            doc_map = np.empty(len(seg.documents), dtype=np.uint32)
+            for i, d in enumerate(seg.documents):
+                if d not in doc_index:
+                    doc_index[d] = len(documents)
+                    documents.append(d)
+                doc_map[i] = doc_index[d]
+            chunk_ids.extend(seg.chunk_ids[r] for r in keep.tolist())
+            lengths.append(seg.lengths[keep])
+            doc_of.append(doc_map[seg.doc_of[keep]])
+            term_map = np.fromiter((vocab_index[t] for t in seg.term_list), dtype=np.int64, count=len(seg.term_list))
+            seg_terms = np.repeat(term_map, np.diff(seg.offsets.astype(np.int64)))
+            new_rows = remap[seg.post_rows.astype(np.int64)]
+            live = new_rows >= 0
+            term_ids.append(seg_terms[live])
+            rows.append(new_rows[live])
+            tfs.append(seg.post_tfs[live])
+            base += len(keep)
+        all_terms = np.concatenate(term_ids)
+        order = np.argsort(all_terms, kind="stable")  # rows stay ascending within a term
+        counts = np.bincount(all_terms, minlength=len(vocab))
+        present = counts > 0
+        offsets = np.concatenate([[0], np.cumsum(counts[present])]).astype(np.uint64)
+        merged = self._write_segment(
+            ns,
+            term_list=[t for t, p in zip(vocab, present.tolist(), strict=True) if p],
+            documents=documents,
+            chunk_ids=chunk_ids,
+            lengths=np.concatenate(lengths).astype(np.uint32),
+            doc_of=np.concatenate(doc_of).astype(np.uint32),
+            offsets=offsets,
+            post_rows=np.concatenate(rows)[order].astype(np.uint32),
+            post_tfs=np.concatenate(tfs)[order].astype(np.uint16),
+            replaces=[seg.gen for seg in inputs],
+        )
+        gone = {id(seg) for seg in inputs}
+        ns.segments = [seg for seg in ns.segments if id(seg) not in gone] + [merged]
+        for seg in inputs:
+            _remove_segment(seg.path)
+
+    def _write_segment(self, ns: _Namespace, *, term_list, documents, chunk_ids, replaces, **arrays) -> _Segment:
+        header = json.dumps(
+            {
+                "terms": term_list,
+                "documents": documents,
+                "chunks": chunk_ids,
+                "postings": len(arrays["post_rows"]),
+                "replaces": replaces,
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        parts = [MAGIC, struct.pack("<Q", len(header)), header]
+        size = len(MAGIC) + 8 + len(header)
+        for name, dtype in _LAYOUT:
+            pad = _align(size) - size
+            data = np.ascontiguousarray(arrays[name], dtype=dtype).tobytes()
+            parts += [b"\0" * pad, data]
+            size += pad + len(data)
+        path = ns.dir / f"seg-{ns.next_gen:08d}.bm25"
+        ns.next_gen += 1
+        _write_atomic(path, b"".join(parts))
+        return _Segment(path)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        namespace: str,
+        query: str,
+        *,
+        top_k: int = 5,
+        documents: set[str] | None = None,
+    ) -> list[SparseHit]:
+        """Top-k chunks of ``namespace`` by BM25, best first. ``documents``
+        restricts to those document ids. No query terms → empty list."""
+        ns = self._ns(namespace)
+        q_terms = list(dict.fromkeys(terms(query, self.stopwords)))
+        if ns is None or not q_terms or top_k < 1:
+            return []
+        with ns.lock:
+            n_live = ns.live
+            if not n_live:
+                return []
+            avgdl = ns.live_length / n_live
+            parts = [ns.mem, *ns.segments]
+            idf = {}
+            for t in q_terms:
+                df = sum(p.df(t) for p in parts)
+                if df:
+                    n = max(n_live, df)
+                    idf[t] = math.log(1.0 + (n - df + 0.5) / (df + 0.5))
+            if not idf:
+                return []
+            hits: list[SparseHit] = []
+            for part in parts:
+                hits.extend(self._search_part(part, idf, avgdl, top_k, documents))
+        hits.sort(key=lambda h: h.score, reverse=True)
+        return hits[:top_k]
+
+    def _search_part(
+        self,
+        part: _Segment | _MemSegment,
+        idf: dict[str, float],
+        avgdl: float,
+        top_k: int,
+        documents: set[str] | None,
+    ) -> list[SparseHit]:
+        mem = isinstance(part, _MemSegment)
+        n = len(part.chunk_ids)
+        if n == 0:
+            return []
+        lengths = np.array(part.lengths, dtype=np.float32) if mem else part.lengths
+        scores: np.ndarray | None = None
+        touched = []
+        for t, w in idf.items():
+            p = part.postings_of(t) if mem else part.postings(t)
+            if p is None:
+                continue
+            rows, tf = p
+            tf = tf.astype(np.float32)
+            norm = self.k1 * (1.0 - self.b + self.b * lengths[rows] / avgdl)
+            if scores is None:
+                scores = np.zeros(n, dtype=np.float32)
+            scores[rows] += w * tf * (self.k1 + 1.0) / (tf + norm)
+            touched.append(rows)
+        if scores is None:
+            return []
+        cand = np.unique(np.concatenate(touched)) if len(touched) > 1 else touched[0].astype(np.intp)
+        alive = np.frombuffer(bytes(part.alive), dtype=np.uint8).astype(bool) if mem else part.alive
+        cand = cand[alive[cand]]
+        if documents is not None:
+            allowed = [part.doc_index[d] for d in documents if d in part.doc_index]
+            doc_of = np.array(part.doc_of, dtype=np.uint32) if mem else part.doc_of
+            cand = cand[np.isin(doc_of[cand], allowed)]
+        if not len(cand):
+            return []
+        vals = scores[cand]
+        k = min(top_k, len(cand))
+        top = np.argpartition(-vals, k - 1)[:k]
+        return [
+            SparseHit(
+                document_id=part.documents[part.doc_of[int(cand[i])]],
+                chunk_id=part.chunk_ids[int(cand[i])],
+                score=float(vals[i]),
+            )
+            for i in top
+        ]
+
+    def stats(self, namespace: str) -> dict[str, int]:
+        """``{chunks, segments, buffered}`` — live rows, segment files, rows in memory."""
+        ns = self._ns(namespace)
+        if ns is None:
+            return {"chunks": 0, "segments": 0, "buffered": 0}
+        with ns.lock:
+            return {"chunks": ns.live, "segments": len(ns.segments), "buffered": ns.mem.live}
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _remove_segment(path: Path) -> None:
+    path.unlink(missing_ok=True)
+    path.with_suffix(".del").unlink(missing_ok=True)
+
+
+__all__ = [
+    "DEFAULT_B",
+    "DEFAULT_FLUSH_DOCS",
+    "DEFAULT_K1",
+    "DEFAULT_MERGE_FACTOR",
+    "BM25Index",
+    "SparseHit",
+    "terms",
+]
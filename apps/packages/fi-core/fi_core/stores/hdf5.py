@@ -32,10 +32,46 @@ Storage layout::
 
 The in-memory vector index mirrors ``/namespaces/{ns}/documents/{doc}/chunks``
 for fast similarity search; it is rebuilt on instance construction and
-mutated in-place on writes. Concurrency model: single-process,
-single-writer. For multi-process access wrap construction in a file
-lock (fi-core does not provide one — pick ``filelock`` or your
-deployment's primitive).
+mutated in-place on writes.
+
+Write path (``write_buffer=True``, the default). ``save_chunks`` / ``add``
+do not open the H5 file. Each call appends its chunks to a write-ahead
+log next to the store (``store.h5.wal``, one JSON line per chunk) and
+puts them in the in-memory index, so they are queryable at once. A
+background thread merges the log into the H5 file in large batches: one
+file open per merge instead of one per call. It runs every
+``merge_interval`` seconds, or sooner once ``merge_batch`` chunks are
+waiting. The file takes roughly a millisecond per chunk (a group plus a
+dataset each), so the log absorbs bursts, not unbounded load. Once
+``max_pending`` chunks are waiting, the next save runs the merge itself
+before it returns. Construction replays any log left behind by a crash. Replay is
+idempotent, because chunk ids are content-derived.
+
+Read path. ``query`` never touches the file or its locks. The index
+keeps each chunk's text and vector plus every document's attributes, and
+readers work on an immutable snapshot of it, so ingestion never stalls a
+search. Document reads (``get_document``, ``list_documents``,
+``get_chunks_by_document``) still open the file, and they add the chunks
+still in the log to what the file says. HDF5 SWMR is not an option for
+these reads: SWMR forbids creating groups, and every chunk here is a
+group.
+
+Concurrency model: every H5 open holds a process-wide lock plus an
+advisory ``flock`` on ``store.h5.lock``. Log appends and merges take a
+second ``flock`` on ``store.h5.wal.lock``. So several processes can
+share one store. Each process only sees the chunks that existed when it
+was constructed plus the ones it wrote itself; the index is per
+instance. ``write_buffer=False`` keeps the old path, where every save
+writes the H5 file synchronously. ``flush`` / ``close`` merge on demand;
+an ``atexit`` hook closes live stores.
+
+Lexical index (``lexical_index=True``). A BM25 inverted index
+(:mod:`fi_core.stores.bm25`) lives next to the file, in ``store.h5.bm25/``.
+It is updated with the vector index on every save and delete, and
+``lexical_query`` answers a keyword top-k from it alone, so
+``HybridRetriever(sparse=store)`` fuses two independent rankings. On
+construction the index is brought in line with the chunks the store
+holds, so it never needs a rebuild by hand.
 
 Optional dependency: ``h5py >= 3.10``. Install via
 ``pip install fi-core[stores-hdf5]``.
@@ -44,11 +80,18 @@ Optional dependency: ``h5py >= 3.10``. Install via
 from __future__ import annotations
 
 import asyncio
+import atexit
+import base64
+import glob
 import json
+import logging
 import os
 import threading
+import time
+import weakref
+from collections.abc import Callable
 from contextlib import contextmanager
-from dataclasses import dataclass, field
+from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -76,7 +119,9 @@ from fi_core.rag.types import (
 )
 from fi_core.stores._common import chunk_id_from as _chunk_id_from
 from fi_core.stores._common import now as _now
+from fi_core.stores.bm25 import BM25Index
 
+logger = logging.getLogger(__name__)
 
 # HDF5 top-level group name for namespaces. All consumer data sits under here.
 _NS_GROUP = "namespaces"
@@ -97,29 +142,115 @@ _CHUNK_SOURCE_TYPE = "source_type"
 _CHUNK_SOURCE_REF = "source_ref"
 _CHUNK_CREATED_AT = "created_at"
 
+#: Seconds a buffered chunk waits before the background merge.
+DEFAULT_MERGE_INTERVAL = 0.2
+#: Buffered chunks that wake the merger before the interval is up.
+DEFAULT_MERGE_BATCH = 1024
+#: Buffered chunks past which a save merges inline (back-pressure).
+DEFAULT_MAX_PENDING = 4096
+
+# Stores with a running merger, closed (final merge) at interpreter exit so
+# a daemon thread is never frozen halfway through an H5 write.
+_LIVE: weakref.WeakSet[HDF5ChunkStore] = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_stores() -> None:
+    for store in list(_LIVE):
+        if not store.file_path.parent.exists():
+            continue  # directory already removed (e.g. a test's tmp_path): nothing to merge into
+        try:
+            store.close_sync()
+        except Exception:  # pragma: no cover - the WAL replays on next open
+            logger.warning("final merge of %s failed", store.file_path, exc_info=True)
+
 
 @dataclass
 class _IndexEntry:
-    """In-memory cosine-search index entry."""
+    """In-memory cosine-search index entry (carries the chunk for hydration)."""
 
     chunk_id: str
     document_id: str
-    embedding: "np.ndarray"
+    embedding: np.ndarray
+    chunk: Chunk
 
 
-@dataclass
 class _NamespaceIndex:
-    """Mutable per-namespace index used for similarity search."""
+    """Per-namespace vectors for similarity search, readable without a lock.
+
+    Rows live in a preallocated float32 matrix (norms alongside) that grows
+    by doubling. A writer fills rows past the published count, then
+    publishes a new ``snapshot`` tuple; a reader takes the tuple once and
+    only looks at its first ``n`` rows, which are never written again.
+    Removing a document builds fresh arrays, so an older snapshot stays
+    valid.
+    """
 
-    entries: list[_IndexEntry] = field(default_factory=list)
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.entries: list[_IndexEntry] = []
+        self.keys: dict[tuple[str, str], _IndexEntry] = {}  # (document_id, chunk_id)
+        self._matrix: np.ndarray | None = None
+        self._norms: np.ndarray | None = None
+        self.snapshot: tuple[list[_IndexEntry], Any, Any, int] = ([], None, None, 0)
+
+    def check(self, embeddings: list[np.ndarray]) -> None:
+        """Raise ``ValueError`` unless every vector fits this index's dimension."""
+        dim = self._matrix.shape[1] if self._matrix is not None else embeddings[0].shape[0]
+        for vec in embeddings:
+            if vec.shape != (dim,):
+                raise ValueError(
+                    f"Embedding has shape {vec.shape}; this namespace holds {dim}-d vectors."
+                )
 
     def add(self, entry: _IndexEntry) -> None:
-        self.entries.append(entry)
+        self.extend([entry])
+
+    def extend(self, new: list[_IndexEntry]) -> None:
+        if not new:
+            return
+        with self._lock:
+            self.check([e.embedding for e in new])
+            n, k = len(self.entries), len(new)
+            if self._matrix is None or n + k > len(self._matrix):
+                capacity = max(64, 2 * (n + k))
+                matrix = np.empty((capacity, new[0].embedding.shape[0]), dtype=np.float32)
+                norms = np.empty(capacity, dtype=np.float32)
+                if self._matrix is not None:
+                    matrix[:n] = self._matrix[:n]
+                    norms[:n] = self._norms[:n]
+                self._matrix, self._norms = matrix, norms
+            block = np.stack([e.embedding for e in new])
+            block_norms = np.linalg.norm(block, axis=1)
+            # Avoid division by zero for any zero-vector chunk.
+            block_norms[block_norms == 0.0] = 1.0
+            self._matrix[n : n + k] = block
+            self._norms[n : n + k] = block_norms
+            self.entries.extend(new)
+            self.keys.update(((e.document_id, e.chunk_id), e) for e in new)
+            self.snapshot = (self.entries, self._matrix, self._norms, n + k)
 
     def remove_document(self, document_id: str) -> int:
-        before = len(self.entries)
-        self.entries = [e for e in self.entries if e.document_id != document_id]
-        return before - len(self.entries)
+        return self._remove(lambda e: e.document_id == document_id)
+
+    def remove_chunks(self, document_id: str, chunk_ids: set[str]) -> int:
+        return self._remove(lambda e: e.document_id == document_id and e.chunk_id in chunk_ids)
+
+    def _remove(self, doomed: Callable[[_IndexEntry], bool]) -> int:
+        with self._lock:
+            keep = [i for i, e in enumerate(self.entries) if not doomed(e)]
+            removed = len(self.entries) - len(keep)
+            if not removed:
+                return 0
+            self.entries = [self.entries[i] for i in keep]
+            self.keys = {(e.document_id, e.chunk_id): e for e in self.entries}
+            if self.entries:
+                rows = np.asarray(keep, dtype=np.intp)
+                self._matrix, self._norms = self._matrix[rows], self._norms[rows]
+            else:
+                self._matrix = self._norms = None
+            self.snapshot = (self.entries, self._matrix, self._norms, len(self.entries))
+            return removed
 
 
 class HDF5ChunkStore:
@@ -131,12 +262,27 @@ class HDF5ChunkStore:
     dispatched to ``asyncio.to_thread`` so they don't block the event
     loop.
 
-    Concurrency: single-writer. Multiple readers within the same
-    process are safe. For cross-process safety, wrap construction in
-    a file lock (fi-core does not provide one).
+    Chunk writes go through a write-ahead log merged into the file by a
+    background thread (see the module docstring); ``write_buffer=False``
+    writes the file on every save instead. ``merge_interval`` /
+    ``merge_batch`` tune the merger, ``max_pending`` bounds the backlog;
+    ``fsync`` makes each log append
+    durable against power loss, not just process death.
+    ``lexical_index`` keeps a BM25 index beside the file for
+    :meth:`lexical_query`.
     """
 
-    def __init__(self, file_path: str | Path) -> None:
+    def __init__(
+        self,
+        file_path: str | Path,
+        *,
+        write_buffer: bool = True,
+        merge_interval: float = DEFAULT_MERGE_INTERVAL,
+        merge_batch: int = DEFAULT_MERGE_BATCH,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        fsync: bool = False,
+        lexical_index: bool = False,
+    ) -> None:
         self.file_path = Path(file_path)
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
         # Corruption safety: serialize ALL file access. _thread_lock (reentrant)
@@ -148,20 +294,51 @@ class HDF5ChunkStore:
         self._thread_lock = threading.RLock()
         self._lock_depth = threading.local()
         self._lock_path = self.file_path.with_name(self.file_path.name + ".lock")
+        # Write-ahead log. _buf_lock orders log appends, the pending overlay and
+        # the merger's swap of the log; _merge_lock keeps one merge at a time.
+        self._write_buffer = write_buffer
+        self._merge_interval = merge_interval
+        self._merge_batch = merge_batch
+        self._max_pending = max_pending
+        self._fsync = fsync
+        self._wal_path = self.file_path.with_name(self.file_path.name + ".wal")
+        self._wal_lock_path = self.file_path.with_name(self.file_path.name + ".wal.lock")
+        self._buf_lock = threading.Lock()
+        self._merge_lock = threading.Lock()
+        self._seq = 0
+        # (namespace, document_id) → chunk_id → (seq, chunk, saved_at): chunks
+        # in the log and not yet merged, overlaid on document reads.
+        self._pending: dict[tuple[str, str], dict[str, tuple[int, Chunk, datetime]]] = {}
+        self._n_pending = 0
+        self._merger: threading.Thread | None = None
+        self._wake = threading.Event()
+        self._stopping = False
         # Touch + ensure top-level group exists before first read.
         with self._open("a") as f:
             f.require_group(_NS_GROUP)
-        # Per-namespace in-memory index. Rebuilt on construction.
+        # Crash recovery: merge whatever log a previous instance left behind.
+        self._merge()
+        # Per-namespace in-memory index + document attributes (for query
+        # filters). Rebuilt on construction.
         self._index: dict[str, _NamespaceIndex] = {}
+        self._docs: dict[str, dict[str, dict[str, Any]]] = {}
         self._rebuild_full_index()
+        self._bm25: BM25Index | None = None
+        if lexical_index:
+            self._bm25 = BM25Index(self.file_path.with_name(self.file_path.name + ".bm25"))
+            for namespace in set(self._index) | set(self._bm25.namespaces()):
+                idx = self._index.get(namespace)
+                entries = idx.entries if idx else []
+                self._bm25.sync(namespace, ((e.document_id, e.chunk_id, e.chunk.text) for e in entries))
 
     @contextmanager
-    def _open(self, mode: str):
-        """Open the H5 file under an exclusive lock (thread + cross-process).
+    def _locked(self):
+        """Hold the H5 lock (thread + cross-process).
 
-        The flock is acquired only at the OUTERMOST open in this thread (depth 0)
-        and held until it unwinds, so nested opens within one operation reuse it
-        instead of deadlocking on a second flock of the same file."""
+        The flock is acquired only at the OUTERMOST acquisition in this thread
+        (depth 0) and held until it unwinds, so nested opens within one
+        operation reuse it instead of deadlocking on a second flock of the
+        same file."""
         with self._thread_lock:
             depth = getattr(self._lock_depth, "n", 0)
             lock_fd = None
@@ -170,14 +347,33 @@ class HDF5ChunkStore:
                 fcntl.flock(lock_fd, fcntl.LOCK_EX)
             self._lock_depth.n = depth + 1
             try:
-                with h5py.File(self.file_path, mode) as f:
-                    yield f
+                yield
             finally:
                 self._lock_depth.n = depth
                 if lock_fd is not None and fcntl is not None:
                     fcntl.flock(lock_fd, fcntl.LOCK_UN)
                     os.close(lock_fd)
 
+    @contextmanager
+    def _open(self, mode: str):
+        """Open the H5 file under the H5 lock (see ``_locked``)."""
+        with self._locked(), h5py.File(self.file_path, mode) as f:
+            yield f
+
+    @contextmanager
+    def _wal_locked(self):
+        """Cross-process lock for log appends and the merger's log swap."""
+        if fcntl is None:
+            yield
+            return
+        lock_fd = os.open(self._wal_lock_path, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(lock_fd, fcntl.LOCK_UN)
+            os.close(lock_fd)
+
     # ------------------------------------------------------------------
     # Public Protocol methods (ChunkStore + DocumentChunkStore)
     # ------------------------------------------------------------------
@@ -220,14 +416,31 @@ class HDF5ChunkStore:
     ) -> list[RetrievedChunk]:
         """ChunkStore.query — cosine similarity top-k across namespace.
 
-        Uses the in-memory index. O(N) per call where N is total chunks
-        in the namespace. For >100k chunks consider sharding namespaces
-        or migrating to a vector DB. ``filters`` restricts to chunks whose
-        parent document's ``attributes`` contain the given pairs (flat
-        containment, the HDF5 analogue of Postgres ``@>``).
+        Uses the in-memory index, including chunks not merged into the
+        file yet; never opens the file. O(N) per call where N is total
+        chunks in the namespace. For >100k chunks consider sharding
+        namespaces or migrating to a vector DB. ``filters`` restricts to
+        chunks whose parent document's ``attributes`` contain the given
+        pairs (flat containment, the HDF5 analogue of Postgres ``@>``).
         """
         return await asyncio.to_thread(self._query_sync, namespace, query_embedding, top_k, filters)
 
+    async def lexical_query(
+        self,
+        *,
+        namespace: str,
+        query: str,
+        top_k: int = 5,
+        filters: dict[str, Any] | None = None,
+    ) -> list[RetrievedChunk]:
+        """LexicalChunkStore.lexical_query — BM25 top-k across namespace.
+
+        Needs ``lexical_index=True``. Includes chunks not merged into the
+        file yet. ``similarity`` is the BM25 score relative to the best
+        hit (1.0); ``filters`` as in :meth:`query`.
+        """
+        return await asyncio.to_thread(self._lexical_query_sync, namespace, query, top_k, filters)
+
     async def create_document(
         self,
         *,
@@ -280,9 +493,7 @@ class HDF5ChunkStore:
             self._delete_document_sync, namespace, document_id
         )
         if deleted:
-            idx = self._index.get(namespace)
-            if idx:
-                idx.remove_document(document_id)
+            self._forget_document(namespace, document_id)
         return deleted
 
     async def save_chunks(
@@ -292,15 +503,14 @@ class HDF5ChunkStore:
         document_id: str,
         chunks: list[ChunkWithEmbedding],
     ) -> int:
-        saved, new_entries = await asyncio.to_thread(
+        """Save chunks; they are queryable when this returns.
+
+        With the write buffer on, this appends to the log and updates the
+        index — the H5 file is written by the background merge.
+        """
+        return await asyncio.to_thread(
             self._save_chunks_sync, namespace, document_id, chunks
         )
-        # Update in-memory index after the sync write succeeded.
-        if new_entries:
-            self._index.setdefault(namespace, _NamespaceIndex())
-            for entry in new_entries:
-                self._index[namespace].add(entry)
-        return saved
 
     async def get_chunks_by_document(
         self,
@@ -322,11 +532,21 @@ class HDF5ChunkStore:
             self._delete_chunks_by_document_sync, namespace, document_id
         )
         if deleted:
-            idx = self._index.get(namespace)
-            if idx:
-                idx.remove_document(document_id)
+            self._forget_document(namespace, document_id)
         return deleted
 
+    async def delete_chunks(
+        self,
+        *,
+        namespace: str,
+        document_id: str,
+        texts: list[str],
+    ) -> int:
+        """ChunkPruningStore.delete_chunks — delete a document's chunks by text."""
+        return await asyncio.to_thread(
+            self._delete_chunks_sync, namespace, document_id, texts
+        )
+
     async def reindex_document(
         self,
         *,
@@ -335,6 +555,14 @@ class HDF5ChunkStore:
     ) -> bool:
         return await asyncio.to_thread(self._reindex_document_sync, namespace, document_id)
 
+    async def flush(self) -> int:
+        """Merge the write-ahead log into the H5 file now; returns chunks written."""
+        return await asyncio.to_thread(self.flush_sync)
+
+    async def close(self) -> None:
+        """Stop the background merger and merge what is still buffered."""
+        await asyncio.to_thread(self.close_sync)
+
     # ------------------------------------------------------------------
     # Public sync API — for legacy callers stuck in sync FastAPI handlers
     # or framework code that can't easily await. The async methods above
@@ -396,9 +624,7 @@ class HDF5ChunkStore:
         """Sync variant of ``delete_document``. Mutates in-memory index."""
         deleted = self._delete_document_sync(namespace, document_id)
         if deleted:
-            idx = self._index.get(namespace)
-            if idx:
-                idx.remove_document(document_id)
+            self._forget_document(namespace, document_id)
         return deleted
 
     def save_chunks_sync(
@@ -409,12 +635,7 @@ class HDF5ChunkStore:
         chunks: list[ChunkWithEmbedding],
     ) -> int:
         """Sync variant of ``save_chunks``. Mutates in-memory index."""
-        saved, new_entries = self._save_chunks_sync(namespace, document_id, chunks)
-        if new_entries:
-            self._index.setdefault(namespace, _NamespaceIndex())
-            for entry in new_entries:
-                self._index[namespace].add(entry)
-        return saved
+        return self._save_chunks_sync(namespace, document_id, chunks)
 
     def get_chunks_by_document_sync(
         self,
@@ -434,11 +655,19 @@ class HDF5ChunkStore:
         """Sync variant of ``delete_chunks_by_document``. Mutates in-memory index."""
         deleted = self._delete_chunks_by_document_sync(namespace, document_id)
         if deleted:
-            idx = self._index.get(namespace)
-            if idx:
-                idx.remove_document(document_id)
+            self._forget_document(namespace, document_id)
         return deleted
 
+    def delete_chunks_sync(
+        self,
+        *,
+        namespace: str,
+        document_id: str,
+        texts: list[str],
+    ) -> int:
+        """Sync variant of ``delete_chunks``. Mutates in-memory index."""
+        return self._delete_chunks_sync(namespace, document_id, texts)
+
     def reindex_document_sync(
         self,
         *,
@@ -458,6 +687,40 @@ class HDF5ChunkStore:
         """Sync variant of ``query``. Same cosine-similarity top-k."""
         return self._query_sync(namespace, query_embedding, top_k)
 
+    def lexical_query_sync(
+        self,
+        *,
+        namespace: str,
+        query: str,
+        top_k: int = 5,
+        filters: dict[str, Any] | None = None,
+    ) -> list[RetrievedChunk]:
+        """Sync variant of ``lexical_query``. Same BM25 top-k."""
+        return self._lexical_query_sync(namespace, query, top_k, filters)
+
+    def flush_sync(self) -> int:
+        """Sync variant of ``flush``. Also writes out the lexical index."""
+        written = self._merge()
+        if self._bm25 is not None:
+            self._bm25.flush()
+        return written
+
+    def close_sync(self) -> None:
+        """Sync variant of ``close``. The store stays usable afterwards; a
+        later buffered save starts a new merger."""
+        with self._buf_lock:
+            self._stopping = True
+            merger = self._merger
+        self._wake.set()
+        if merger is not None and merger is not threading.current_thread():
+            merger.join()
+        self._merge()
+        if self._bm25 is not None:
+            self._bm25.flush()
+        with self._buf_lock:
+            self._stopping = False
+        _LIVE.discard(self)
+
     # ------------------------------------------------------------------
     # Sync internals — never awaited directly, always via to_thread.
     # ------------------------------------------------------------------
@@ -493,20 +756,32 @@ class HDF5ChunkStore:
             if meta.indexed_at is not None:
                 doc_group.attrs[_ATTR_INDEXED_AT] = _iso(meta.indexed_at)
             doc_group.attrs[_ATTR_ATTRIBUTES] = json.dumps(meta.attributes)
+        self._docs.setdefault(namespace, {})[document_id] = dict(meta.attributes)
 
     def _get_document_sync(
         self, namespace: str, document_id: str
     ) -> DocumentRecord | None:
+        # Pending before the file: a chunk merged in between is then seen
+        # in one of the two (never in neither).
+        pending = self._pending_chunks(namespace, document_id)
         with self._open("r") as f:
             path = f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}/{document_id}"
             if path not in f:
                 return None
             doc_group = f[path]
-            return _to_document_record(namespace, document_id, doc_group)
+            return _with_pending(
+                _to_document_record(namespace, document_id, doc_group), doc_group, pending
+            )
 
     def _list_documents_sync(
         self, namespace: str, status: str | None, limit: int | None
     ) -> list[DocumentRecord]:
+        with self._buf_lock:
+            pending = {
+                doc: dict(chunks)
+                for (ns, doc), chunks in self._pending.items()
+                if ns == namespace
+            }
         records: list[DocumentRecord] = []
         with self._open("r") as f:
             ns_path = f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}"
@@ -515,11 +790,14 @@ class HDF5ChunkStore:
             docs_group = f[ns_path]
             for doc_id in docs_group:
                 doc_group = docs_group[doc_id]
-                if status is not None:
-                    doc_status = doc_group.attrs.get(_ATTR_STATUS, "")
-                    if doc_status != status:
-                        continue
-                records.append(_to_document_record(namespace, str(doc_id), doc_group))
+                record = _with_pending(
+                    _to_document_record(namespace, str(doc_id), doc_group),
+                    doc_group,
+                    pending.get(str(doc_id), {}),
+                )
+                if status is not None and record.metadata.status != status:
+                    continue
+                records.append(record)
                 if limit is not None and len(records) >= limit:
                     break
         return records
@@ -545,14 +823,19 @@ class HDF5ChunkStore:
                 if metadata.indexed_at is not None:
                     doc_group.attrs[_ATTR_INDEXED_AT] = _iso(metadata.indexed_at)
                 doc_group.attrs[_ATTR_ATTRIBUTES] = json.dumps(metadata.attributes)
+                self._docs.setdefault(namespace, {})[document_id] = dict(metadata.attributes)
         return True
 
     def _delete_document_sync(self, namespace: str, document_id: str) -> bool:
+        # Merge first so buffered chunks of this document are deleted too
+        # (and not written back by a later merge).
+        self._merge()
         with self._open("a") as f:
             path = f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}/{document_id}"
             if path not in f:
                 return False
             del f[path]
+        self._docs.get(namespace, {}).pop(document_id, None)
         return True
 
     def _save_chunks_sync(
@@ -560,71 +843,90 @@ class HDF5ChunkStore:
         namespace: str,
         document_id: str,
         chunks: list[ChunkWithEmbedding],
-    ) -> tuple[int, list[_IndexEntry]]:
+    ) -> int:
         if not chunks:
-            return 0, []
-
-        new_entries: list[_IndexEntry] = []
-        saved = 0
-        with self._open("a") as f:
-            doc_path = f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}/{document_id}"
-            if doc_path not in f:
-                raise ValueError(
-                    f"Document {document_id!r} does not exist in namespace "
-                    f"{namespace!r}. Call create_document first."
-                )
-            doc_group = f[doc_path]
-            chunks_group = doc_group.require_group(_CHUNKS_GROUP)
-
+            return 0
+        if not self._document_known(namespace, document_id):
+            raise ValueError(
+                f"Document {document_id!r} does not exist in namespace "
+                f"{namespace!r}. Call create_document first."
+            )
+        if self._write_buffer and self._n_pending >= self._max_pending:
+            self._merge()  # the merger is behind: pay for it here, bounded
+        idx = self._index.setdefault(namespace, _NamespaceIndex())
+        saved_at = _now()
+        with self._buf_lock:
+            new_entries: list[_IndexEntry] = []
+            seen: set[str] = set()
             for ce in chunks:
                 chunk_id = _chunk_id_from(ce.chunk)
-                if chunk_id in chunks_group:
+                if chunk_id in seen or (document_id, chunk_id) in idx.keys:
                     # Idempotent on (doc_id, source_ref, text). Skip.
                     continue
-                chunk_group = chunks_group.create_group(chunk_id)
-                chunk_group.attrs[_CHUNK_TEXT] = ce.chunk.text
-                chunk_group.attrs[_CHUNK_SOURCE_TYPE] = ce.chunk.source_type
-                chunk_group.attrs[_CHUNK_SOURCE_REF] = ce.chunk.source_ref
-                chunk_group.attrs[_CHUNK_CREATED_AT] = _iso(
-                    ce.chunk.created_at or _now()
-                )
+                seen.add(chunk_id)
+                chunk = ce.chunk
+                if chunk.created_at is None:
+                    chunk = replace(chunk, created_at=saved_at)
                 vec = np.asarray(ce.embedding, dtype=np.float32)
-                chunk_group.create_dataset(
-                    _EMBEDDING_DATASET, data=vec, compression="gzip"
-                )
                 new_entries.append(
                     _IndexEntry(
-                        chunk_id=chunk_id, document_id=document_id, embedding=vec
+                        chunk_id=chunk_id, document_id=document_id, embedding=vec, chunk=chunk
                     )
                 )
-                saved += 1
-
-            # Update document indexed_at + status on first non-empty save.
-            if saved > 0:
-                doc_group.attrs[_ATTR_INDEXED_AT] = _iso(_now())
-                current_status = doc_group.attrs.get(_ATTR_STATUS, "")
-                if current_status == "pending":
-                    doc_group.attrs[_ATTR_STATUS] = "indexed"
-
-        return saved, new_entries
+            if not new_entries:
+                return 0
+            idx.check([e.embedding for e in new_entries])
+
+            if self._write_buffer:
+                self._seq += 1
+                self._wal_append(namespace, document_id, new_entries, saved_at)
+                pending = self._pending.setdefault((namespace, document_id), {})
+                for e in new_entries:
+                    pending[e.chunk_id] = (self._seq, e.chunk, saved_at)
+                self._n_pending += len(new_entries)
+                self._schedule_merge()
+            else:
+                with self._open("a") as f:
+                    created = _write_chunks(
+                        f,
+                        namespace,
+                        document_id,
+                        [(e.chunk_id, e.chunk, e.embedding) for e in new_entries],
+                        saved_at,
+                    )
+                if created is None:
+                    raise ValueError(
+                        f"Document {document_id!r} does not exist in namespace "
+                        f"{namespace!r}. Call create_document first."
+                    )
+                new_entries = [e for e in new_entries if e.chunk_id in created]
+            idx.extend(new_entries)
+            if self._bm25 is not None:
+                self._bm25.add(namespace, ((e.document_id, e.chunk_id, e.chunk.text) for e in new_entries))
+        return len(new_entries)
 
     def _get_chunks_by_document_sync(
         self, namespace: str, document_id: str
     ) -> list[Chunk]:
+        pending = self._pending_chunks(namespace, document_id)
         chunks: list[Chunk] = []
+        stored: set[str] = set()
         with self._open("r") as f:
             path = f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}/{document_id}/{_CHUNKS_GROUP}"
-            if path not in f:
+            if path in f:
+                chunks_group = f[path]
+                for chunk_id in chunks_group:
+                    stored.add(str(chunk_id))
+                    chunks.append(_to_chunk(chunks_group[chunk_id]))
+            elif f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}/{document_id}" not in f:
                 return []
-            chunks_group = f[path]
-            for chunk_id in chunks_group:
-                chunk_group = chunks_group[chunk_id]
-                chunks.append(_to_chunk(chunk_group))
+        chunks.extend(p[1] for cid, p in pending.items() if cid not in stored)
         return chunks
 
     def _delete_chunks_by_document_sync(
         self, namespace: str, document_id: str
     ) -> int:
+        self._merge()
         with self._open("a") as f:
             chunks_path = (
                 f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}/{document_id}/{_CHUNKS_GROUP}"
@@ -638,7 +940,37 @@ class HDF5ChunkStore:
             f[doc_path].create_group(_CHUNKS_GROUP)
         return count
 
+    def _delete_chunks_sync(
+        self, namespace: str, document_id: str, texts: list[str]
+    ) -> int:
+        wanted = set(texts)
+        if not wanted:
+            return 0
+        self._merge()
+        with self._open("a") as f:
+            chunks_path = (
+                f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}/{document_id}/{_CHUNKS_GROUP}"
+            )
+            if chunks_path not in f:
+                return 0
+            chunks_group = f[chunks_path]
+            doomed = {
+                str(chunk_id)
+                for chunk_id in chunks_group
+                if str(chunks_group[chunk_id].attrs.get(_CHUNK_TEXT, "")) in wanted
+            }
+            for chunk_id in doomed:
+                del chunks_group[chunk_id]
+        if doomed:
+            idx = self._index.get(namespace)
+            if idx:
+                idx.remove_chunks(document_id, doomed)
+            if self._bm25 is not None:
+                self._bm25.remove(namespace, {(document_id, chunk_id) for chunk_id in doomed})
+        return len(doomed)
+
     def _reindex_document_sync(self, namespace: str, document_id: str) -> bool:
+        self._merge()
         with self._open("r") as f:
             doc_path = f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}/{document_id}"
             if doc_path not in f:
@@ -649,17 +981,11 @@ class HDF5ChunkStore:
             # Drop existing entries for this doc, re-load from disk.
             idx = self._index.setdefault(namespace, _NamespaceIndex())
             idx.remove_document(document_id)
-            chunks_group = f[chunks_path]
-            for chunk_id in chunks_group:
-                chunk_group = chunks_group[chunk_id]
-                if _EMBEDDING_DATASET not in chunk_group:
-                    continue
-                vec = np.asarray(chunk_group[_EMBEDDING_DATASET][:], dtype=np.float32)
-                idx.add(
-                    _IndexEntry(
-                        chunk_id=str(chunk_id), document_id=document_id, embedding=vec
-                    )
-                )
+            entries = _load_entries(document_id, f[chunks_path])
+            idx.extend(entries)
+        if self._bm25 is not None:
+            self._bm25.remove_document(namespace, document_id)
+            self._bm25.add(namespace, ((e.document_id, e.chunk_id, e.chunk.text) for e in entries))
         return True
 
     def _query_sync(
@@ -670,73 +996,214 @@ class HDF5ChunkStore:
         filters: dict[str, Any] | None = None,
     ) -> list[RetrievedChunk]:
         idx = self._index.get(namespace)
-        if not idx or not idx.entries:
+        if not idx:
+            return []
+        entries, matrix, norms, n = idx.snapshot
+        if n == 0:
             return []
-        entries = idx.entries
+        rows = np.arange(n)
         if filters:
             # Restrict to chunks whose parent document's attributes match BEFORE
             # top-k (post-filtering would starve the floor).
             allowed = self._documents_matching(namespace, filters)
-            entries = [e for e in entries if e.document_id in allowed]
-            if not entries:
+            rows = np.fromiter(
+                (i for i in range(n) if entries[i].document_id in allowed), dtype=np.intp
+            )
+            if not len(rows):
                 return []
         q = np.asarray(query_embedding, dtype=np.float32)
         q_norm = float(np.linalg.norm(q))
         if q_norm == 0.0:
             return []
-        embeddings = np.stack([e.embedding for e in entries])
-        norms = np.linalg.norm(embeddings, axis=1)
-        # Avoid division by zero for any zero-vector chunk.
-        norms[norms == 0.0] = 1.0
-        sims = (embeddings @ q) / (norms * q_norm)
+        sims = (matrix[rows] @ q) / (norms[rows] * q_norm)
         # Argpartition gets top-k unsorted; sort just those.
         k = min(top_k, len(sims))
         top_unsorted = np.argpartition(-sims, k - 1)[:k]
         top_sorted = top_unsorted[np.argsort(-sims[top_unsorted])]
+        return [
+            RetrievedChunk(chunk=entries[int(rows[i])].chunk, similarity=float(sims[i]))
+            for i in top_sorted
+        ]
 
-        results: list[RetrievedChunk] = []
-        # Hydrate chunks from disk (in-memory index only carries embeddings).
-        with self._open("r") as f:
-            for i in top_sorted:
-                entry = entries[int(i)]
-                chunk_path = (
-                    f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}/"
-                    f"{entry.document_id}/{_CHUNKS_GROUP}/{entry.chunk_id}"
-                )
-                if chunk_path not in f:
-                    # Index drift — skip silently. Caller can call reindex.
-                    continue
-                chunk = _to_chunk(f[chunk_path])
-                results.append(
-                    RetrievedChunk(chunk=chunk, similarity=float(sims[int(i)]))
-                )
-        return results
+    def _lexical_query_sync(
+        self,
+        namespace: str,
+        query: str,
+        top_k: int,
+        filters: dict[str, Any] | None = None,
+    ) -> list[RetrievedChunk]:
+        if self._bm25 is None:
+            raise RuntimeError(
+                f"{self.file_path} has no lexical index; open it with lexical_index=True."
+            )
+        idx = self._index.get(namespace)
+        if not idx:
+            return []
+        allowed = self._documents_matching(namespace, filters) if filters else None
+        hits = self._bm25.search(namespace, query, top_k=top_k, documents=allowed)
+        keys = idx.keys
+        out = []
+        for hit in hits:
+            entry = keys.get((hit.document_id, hit.chunk_id))
+            if entry is not None:
+                out.append(RetrievedChunk(chunk=entry.chunk, similarity=hit.score / hits[0].score))
+        return out
+
+    def _forget_document(self, namespace: str, document_id: str) -> None:
+        """Drop a deleted document from the in-memory and lexical indexes."""
+        idx = self._index.get(namespace)
+        if idx:
+            idx.remove_document(document_id)
+        if self._bm25 is not None:
+            self._bm25.remove_document(namespace, document_id)
 
     def _documents_matching(self, namespace: str, filters: dict[str, Any]) -> set[str]:
         """Document ids in ``namespace`` whose attributes contain every key/value
         in ``filters`` (flat equality — the HDF5 analogue of Postgres ``@>``)."""
-        matched: set[str] = set()
-        docs_path = f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}"
+        return {
+            doc_id
+            for doc_id, attrs in list(self._docs.get(namespace, {}).items())
+            if all(attrs.get(k) == v for k, v in filters.items())
+        }
+
+    def _document_known(self, namespace: str, document_id: str) -> bool:
+        """Whether the document exists — from memory, or from the file for a
+        document another instance created."""
+        if document_id in self._docs.get(namespace, {}):
+            return True
         with self._open("r") as f:
-            if docs_path not in f:
-                return matched
-            docs_group = f[docs_path]
-            for doc_id in docs_group:
-                raw = docs_group[doc_id].attrs.get(_ATTR_ATTRIBUTES, "{}")
-                try:
-                    attrs = json.loads(raw)
-                except (TypeError, ValueError):
-                    attrs = {}
-                if isinstance(attrs, dict) and all(attrs.get(k) == v for k, v in filters.items()):
-                    matched.add(doc_id)
-        return matched
+            path = f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}/{document_id}"
+            if path not in f:
+                return False
+            self._docs.setdefault(namespace, {})[document_id] = _attributes_of(f[path])
+        return True
+
+    def _pending_chunks(
+        self, namespace: str, document_id: str
+    ) -> dict[str, tuple[int, Chunk, datetime]]:
+        with self._buf_lock:
+            return dict(self._pending.get((namespace, document_id), {}))
+
+    # ------------------------------------------------------------------
+    # Write-ahead log
+    # ------------------------------------------------------------------
+
+    def _wal_append(
+        self,
+        namespace: str,
+        document_id: str,
+        entries: list[_IndexEntry],
+        saved_at: datetime,
+    ) -> None:
+        """Append one JSON line per chunk, in a single write. Caller holds _buf_lock."""
+        data = "".join(
+            json.dumps(
+                {
+                    "ns": namespace,
+                    "doc": document_id,
+                    "id": e.chunk_id,
+                    "text": e.chunk.text,
+                    "source_type": e.chunk.source_type,
+                    "source_ref": e.chunk.source_ref,
+                    "created_at": _iso(e.chunk.created_at),
+                    "saved_at": _iso(saved_at),
+                    "embedding": base64.b64encode(e.embedding.tobytes()).decode("ascii"),
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+            for e in entries
+        ).encode("utf-8")
+        with self._wal_locked():
+            fd = os.open(self._wal_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+                if self._fsync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def _schedule_merge(self) -> None:
+        """Start the merger, or wake it early for a full batch. Caller holds _buf_lock."""
+        if self._merger is None:
+            self._merger = threading.Thread(
+                target=self._merge_loop,
+                name=f"hdf5-merge:{self.file_path.name}",
+                daemon=True,
+            )
+            self._merger.start()
+            _LIVE.add(self)
+        elif self._n_pending >= self._merge_batch:
+            self._wake.set()
+
+    def _merge_loop(self) -> None:
+        while True:
+            self._wake.wait(self._merge_interval)
+            self._wake.clear()
+            try:
+                self._merge()
+            except Exception:
+                # The log keeps the chunks: the next save, flush or open retries.
+                if self.file_path.parent.exists():
+                    logger.warning("merging the WAL into %s failed", self.file_path, exc_info=True)
+                with self._buf_lock:
+                    self._merger = None
+                return
+            with self._buf_lock:
+                if self._stopping or self._n_pending == 0:
+                    self._merger = None
+                    return
+
+    def _merge(self) -> int:
+        """Move the log into the H5 file; returns chunks written.
+
+        The live log is renamed to a ``.merging`` segment (briefly, under the
+        log lock), so saves keep appending to a fresh log while the segment is
+        written to the file under the H5 lock. Segments left by a crashed
+        process — or by another process's merge — are merged too, so after
+        this returns every chunk logged before the call is in the file.
+        """
+        with self._merge_lock:
+            with self._buf_lock:
+                cut = self._seq
+                with self._wal_locked():
+                    if self._wal_path.exists() and self._wal_path.stat().st_size:
+                        segment = f"{self._wal_path.name}.{time.time_ns():020d}-{os.getpid()}.merging"
+                        os.replace(self._wal_path, self._wal_path.with_name(segment))
+            written = 0
+            with self._locked():
+                segments = sorted(
+                    self.file_path.parent.glob(glob.escape(self._wal_path.name) + ".*.merging")
+                )
+                if segments:
+                    with h5py.File(self.file_path, "a") as f:
+                        for segment in segments:
+                            written += _replay_segment(f, segment)
+                    for segment in segments:
+                        segment.unlink(missing_ok=True)
+            self._drop_pending(cut)
+        return written
+
+    def _drop_pending(self, cut: int) -> None:
+        """Forget overlay entries logged at or before ``cut`` — they are merged."""
+        with self._buf_lock:
+            for key in list(self._pending):
+                chunks = self._pending[key]
+                merged = [cid for cid, p in chunks.items() if p[0] <= cut]
+                for cid in merged:
+                    del chunks[cid]
+                self._n_pending -= len(merged)
+                if not chunks:
+                    del self._pending[key]
 
     # ------------------------------------------------------------------
     # Index bootstrap
     # ------------------------------------------------------------------
 
     def _rebuild_full_index(self) -> None:
-        """Load all embeddings from disk into the in-memory index.
+        """Load all embeddings + chunks from disk into the in-memory index.
 
         Called once on construction. For large stores this can be slow
         (1-2 seconds per 10k chunks); consumers that need lazy loading
@@ -751,33 +1218,25 @@ class HDF5ChunkStore:
                 if docs_path not in ns_root:
                     continue
                 docs_group = ns_root[docs_path]
-                ns_idx = _NamespaceIndex()
+                docs = self._docs.setdefault(str(namespace), {})
+                entries: list[_IndexEntry] = []
                 for doc_id in docs_group:
+                    docs[str(doc_id)] = _attributes_of(docs_group[doc_id])
                     chunks_path = f"{doc_id}/{_CHUNKS_GROUP}"
                     if chunks_path not in docs_group:
                         continue
-                    chunks_group = docs_group[chunks_path]
-                    for chunk_id in chunks_group:
-                        chunk_group = chunks_group[chunk_id]
-                        if _EMBEDDING_DATASET not in chunk_group:
-                            continue
-                        vec = np.asarray(
-                            chunk_group[_EMBEDDING_DATASET][:], dtype=np.float32
-                        )
-                        ns_idx.add(
-                            _IndexEntry(
-                                chunk_id=str(chunk_id),
-                                document_id=str(doc_id),
-                                embedding=vec,
-                            )
-                        )
-                if ns_idx.entries:
+                    entries.extend(_load_entries(str(doc_id), docs_group[chunks_path]))
+                if entries:
+                    ns_idx = _NamespaceIndex()
+                    ns_idx.extend(entries)
                     self._index[str(namespace)] = ns_idx
 
     async def _ensure_document_exists(
         self, *, namespace: str, document_id: str, content: str
     ) -> None:
         """For ChunkStore.add — synthesize parent document if missing."""
+        if document_id in self._docs.get(namespace, {}):
+            return
         existing = await self.get_document(namespace=namespace, document_id=document_id)
         if existing is None:
             try:
@@ -788,7 +1247,6 @@ class HDF5ChunkStore:
                 # Race condition on concurrent ChunkStore.add — re-check.
                 pass
 
-
 # ----------------------------------------------------------------------
 # Internal converters / helpers
 # ----------------------------------------------------------------------
@@ -845,3 +1303,129 @@ def _to_document_record(
     )
 
 
+
+
+def _attributes_of(doc_group: Any) -> dict[str, Any]:
+    """A document group's free-form attributes ({} when unreadable)."""
+    raw = doc_group.attrs.get(_ATTR_ATTRIBUTES, "{}")
+    try:
+        attrs = json.loads(raw) if raw else {}
+    except (TypeError, ValueError):
+        attrs = {}
+    return attrs if isinstance(attrs, dict) else {}
+
+
+def _load_entries(document_id: str, chunks_group: Any) -> list[_IndexEntry]:
+    """Index entries for every chunk (with an embedding) of one document."""
+    entries = []
+    for chunk_id in chunks_group:
+        chunk_group = chunks_group[chunk_id]
+        if _EMBEDDING_DATASET not in chunk_group:
+            continue
+        entries.append(
+            _IndexEntry(
+                chunk_id=str(chunk_id),
+                document_id=document_id,
+                embedding=np.asarray(chunk_group[_EMBEDDING_DATASET][:], dtype=np.float32),
+                chunk=_to_chunk(chunk_group),
+            )
+        )
+    return entries
+
+
+def _write_chunks(
+    f: Any,
+    namespace: str,
+    document_id: str,
+    items: list[tuple[str, Chunk, np.ndarray]],
+    saved_at: datetime,
+) -> set[str] | None:
+    """Write ``(chunk_id, chunk, embedding)`` items under one document.
+
+    Returns the ids actually created (existing ids are skipped), or
+    ``None`` when the document does not exist."""
+    doc_path = f"{_NS_GROUP}/{namespace}/{_DOCS_GROUP}/{document_id}"
+    if doc_path not in f:
+        return None
+    doc_group = f[doc_path]
+    chunks_group = doc_group.require_group(_CHUNKS_GROUP)
+    created: set[str] = set()
+    for chunk_id, chunk, vec in items:
+        if chunk_id in chunks_group:
+            # Idempotent on (doc_id, source_ref, text). Skip.
+            continue
+        chunk_group = chunks_group.create_group(chunk_id)
+        chunk_group.attrs[_CHUNK_TEXT] = chunk.text
+        chunk_group.attrs[_CHUNK_SOURCE_TYPE] = chunk.source_type
+        chunk_group.attrs[_CHUNK_SOURCE_REF] = chunk.source_ref
+        chunk_group.attrs[_CHUNK_CREATED_AT] = _iso(chunk.created_at or saved_at)
+        chunk_group.create_dataset(_EMBEDDING_DATASET, data=vec, compression="gzip")
+        created.add(chunk_id)
+
+    # Update document indexed_at + status on first non-empty save.
+    if created:
+        doc_group.attrs[_ATTR_INDEXED_AT] = _iso(saved_at)
+        if doc_group.attrs.get(_ATTR_STATUS, "") == "pending":
+            doc_group.attrs[_ATTR_STATUS] = "indexed"
+    return created
+
+
+def _replay_segment(f: Any, segment: Path) -> int:
+    """Write one log segment into the open H5 file; returns chunks created.
+
+    Chunks of documents deleted since they were logged are dropped, and a
+    torn last line (crash mid-append) is ignored."""
+    try:
+        lines = segment.read_bytes().splitlines()
+    except FileNotFoundError:  # merged + removed by another process meanwhile
+        return 0
+    by_doc: dict[tuple[str, str], list[tuple[str, Chunk, np.ndarray]]] = {}
+    saved_at: dict[tuple[str, str], datetime] = {}
+    for line in lines:
+        try:
+            r = json.loads(line)
+            key = (r["ns"], r["doc"])
+            item = (
+                r["id"],
+                Chunk(
+                    text=r["text"],
+                    source_type=r["source_type"],
+                    source_ref=r["source_ref"],
+                    created_at=_parse_iso(r["created_at"]),
+                ),
+                np.frombuffer(base64.b64decode(r["embedding"]), dtype=np.float32),
+            )
+            at = _parse_iso(r["saved_at"]) or _now()
+        except (ValueError, KeyError, TypeError):
+            continue
+        by_doc.setdefault(key, []).append(item)
+        saved_at[key] = max(saved_at.get(key, at), at)
+    written = 0
+    for (namespace, document_id), items in by_doc.items():
+        created = _write_chunks(f, namespace, document_id, items, saved_at[(namespace, document_id)])
+        written += len(created or ())
+    return written
+
+
+def _with_pending(
+    record: DocumentRecord,
+    doc_group: Any,
+    pending: dict[str, tuple[int, Chunk, datetime]],
+) -> DocumentRecord:
+    """``record`` as it will read once its buffered chunks are merged."""
+    if not pending:
+        return record
+    chunks_group = doc_group.get(_CHUNKS_GROUP)
+    extra = [cid for cid in pending if chunks_group is None or cid not in chunks_group]
+    if not extra:
+        return record
+    meta = record.metadata
+    return replace(
+        record,
+        chunk_count=record.chunk_count + len(extra),
+        metadata=replace(
+            meta,
+            status="indexed" if meta.status == "pending" else meta.status,
+            indexed_at=max(p[2] for p in pending.values()),
+        ),
+    )
@@ -21,7 +21,7 @@ Use case vs the HDF5 sibling:
 Package layout:
 
 - ``store``  — the ``PgVectorChunkStore`` class (protocol surface)
-- ``schema`` — parametrized DDL (tables, indexes, IVFFlat choice)
+- ``schema`` — parametrized DDL (tables, indexes, IVFFlat / HNSW choice)
 - ``rows``   — asyncpg Record → domain-type mapping
 
 Shared substrate: connection bootstrap lives in ``fi_core.stores._pg``
@@ -37,6 +37,7 @@ Optional dependency: ``asyncpg`` + ``pgvector``. Install via
 ``pip install 'fi-core[stores-pgvector]'``.
 """
 
+from fi_core.stores.pgvector.schema import HnswIndex, IvfflatIndex
 from fi_core.stores.pgvector.store import PgVectorChunkStore
 
-__all__ = ["PgVectorChunkStore"]
+__all__ = ["HnswIndex", "IvfflatIndex", "PgVectorChunkStore"]
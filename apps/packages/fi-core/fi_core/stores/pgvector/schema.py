@@ -11,31 +11,208 @@ multiple stores can coexist in one database without colliding.
   - ``{prefix}_chunks`` (chunk_id PK, document_id FK, namespace, text,
     source_type, source_ref, embedding vector(N), created_at)
 
-Index choice: IVFFlat with ``vector_cosine_ops`` and ``lists=100`` —
-matches what the discord-bot deep-memory schema uses and is the
-standard pgvector starting point for tables under ~1M rows. For larger
-catalogs migrate to HNSW (``CREATE INDEX ... USING hnsw``) which is
-more memory-hungry but offers better recall at scale.
+Index choice is a value object, :class:`IvfflatIndex` (the default) or
+:class:`HnswIndex`, both over ``vector_cosine_ops``:
+
+- IVFFlat ``lists=100`` matches what the discord-bot deep-memory schema
+  uses and is the standard pgvector starting point for tables under ~1M
+  rows. Cheap to build; recall depends on ``probes``.
+- HNSW (``m`` / ``ef_construction`` at build, ``ef_search`` per query) is
+  more memory-hungry and slower to build but keeps recall at scale
+  without retraining on new data.
+
+Each index object also carries its per-query settings (``SET LOCAL``),
+including pgvector 0.8's iterative index scans: with a selective
+``namespace`` / attribute filter, a plain ANN scan returns its
+``ef_search`` (or ``probes``) candidates, the filter drops most of them
+and the query comes back short; an iterative scan keeps walking the
+index until ``LIMIT`` rows pass the filter.
+
+Per-namespace partial indexes (``WHERE namespace = '...'``) give a hot
+tenant its own small graph. The vector index of each kind has its own
+name, so moving a live table from one kind to the other is: build the new
+one ``CONCURRENTLY``, then drop the old one
+(``PgVectorChunkStore.migrate_index``).
 """
 
 from __future__ import annotations
 
+import hashlib
+from dataclasses import dataclass
+from typing import ClassVar
+
 # pgvector cosine index. lists=100 is the standard starting point for tables
 # under ~1M rows; consumers crossing that threshold should rebuild as HNSW.
 _IVFFLAT_LISTS = 100
 
 
+def _positive(name: str, value: int | None) -> None:
+    if value is not None and value <= 0:
+        raise ValueError(f"{name} must be positive, got {value!r}")
+
+
+@dataclass(frozen=True)
+class IvfflatIndex:
+    """IVFFlat over ``vector_cosine_ops`` — the default, unchanged schema.
+
+    ``probes`` (lists scanned per query) and ``iterative_scan``
+    (``"relaxed_order"``, pgvector >= 0.8) are left to the server when
+    ``None``.
+    """
+
+    lists: int = _IVFFLAT_LISTS
+    probes: int | None = None
+    iterative_scan: str | None = None
+    max_probes: int | None = None
+
+    kind: ClassVar[str] = "ivfflat"
+
+    def __post_init__(self) -> None:
+        _positive("lists", self.lists)
+        _positive("probes", self.probes)
+        _positive("max_probes", self.max_probes)
+        if self.iterative_scan not in (None, "off", "relaxed_order"):
+            raise ValueError(f"ivfflat iterative_scan must be 'off' or 'relaxed_order', got {self.iterative_scan!r}")
+
+    def using(self) -> str:
+        return f"USING ivfflat (embedding vector_cosine_ops) WITH (lists = {self.lists})"
+
+    def query_settings(self) -> list[str]:
+        settings = []
+        if self.probes is not None:
+            settings.append(f"SET LOCAL ivfflat.probes = {self.probes}")
+        if self.iterative_scan is not None:
+            settings.append(f"SET LOCAL ivfflat.iterative_scan = {self.iterative_scan}")
+        if self.max_probes is not None:
+            settings.append(f"SET LOCAL ivfflat.max_probes = {self.max_probes}")
+        return settings
+
+
+@dataclass(frozen=True)
+class HnswIndex:
+    """HNSW over ``vector_cosine_ops``.
+
+    ``m`` / ``ef_construction`` are build parameters (pgvector defaults 16 /
+    64). ``ef_search`` is the per-query candidate list (server default 40;
+    must be >= the query's ``top_k`` to return that many rows without
+    iterative scan). ``iterative_scan`` defaults to ``"relaxed_order"`` —
+    needs pgvector >= 0.8; pass ``None`` on older servers.
+    ``max_scan_tuples`` caps how far an iterative scan walks.
+    """
+
+    m: int = 16
+    ef_construction: int = 64
+    ef_search: int | None = None
+    iterative_scan: str | None = "relaxed_order"
+    max_scan_tuples: int | None = None
+
+    kind: ClassVar[str] = "hnsw"
+
+    def __post_init__(self) -> None:
+        _positive("m", self.m)
+        _positive("ef_construction", self.ef_construction)
+        _positive("ef_search", self.ef_search)
+        _positive("max_scan_tuples", self.max_scan_tuples)
+        if self.iterative_scan not in (None, "off", "relaxed_order", "strict_order"):
+            raise ValueError(
+                f"hnsw iterative_scan must be 'off', 'relaxed_order' or 'strict_order', got {self.iterative_scan!r}"
+            )
+
+    def using(self) -> str:
+        return (
+            "USING hnsw (embedding vector_cosine_ops) "
+            f"WITH (m = {self.m}, ef_construction = {self.ef_construction})"
+        )
+
+    def query_settings(self) -> list[str]:
+        settings = []
+        if self.ef_search is not None:
+            settings.append(f"SET LOCAL hnsw.ef_search = {self.ef_search}")
+        if self.iterative_scan is not None:
+            settings.append(f"SET LOCAL hnsw.iterative_scan = {self.iterative_scan}")
+        if self.max_scan_tuples is not None:
+            settings.append(f"SET LOCAL hnsw.max_scan_tuples = {self.max_scan_tuples}")
+        return settings
+
+
+VectorIndex = IvfflatIndex | HnswIndex
+
+DEFAULT_INDEX = IvfflatIndex()
+
+
+def sql_literal(value: str) -> str:
+    """Quote ``value`` as a SQL string literal (``standard_conforming_strings``).
+
+    Partial-index predicates can't be bind parameters, and a query only
+    matches a partial index when its predicate is the same constant, so
+    namespaces with one are inlined rather than bound.
+    """
+    if "\x00" in value:
+        raise ValueError("namespace must not contain NUL")
+    return "'" + value.replace("'", "''") + "'"
+
+
+def vector_index_name(table_prefix: str, kind: str, namespace: str | None = None) -> str:
+    """Name of the ``kind`` vector index — global, or partial on ``namespace``.
+
+    The global IVFFlat index keeps its original name so existing tables
+    are recognised. Partial indexes carry a hash of the namespace (names
+    are capped at 63 bytes and namespaces are free text).
+    """
+    name = f"idx_{table_prefix}_chunks_embedding" if kind == "ivfflat" else f"idx_{table_prefix}_chunks_{kind}"
+    if namespace is not None:
+        name += "_ns_" + hashlib.sha256(namespace.encode("utf-8")).hexdigest()[:12]
+    return name
+
+
+def vector_index_statements(
+    *,
+    table_prefix: str,
+    chunks_table: str,
+    index: VectorIndex,
+    namespaces: tuple[str, ...] = (),
+    concurrently: bool = False,
+) -> list[str]:
+    """``CREATE INDEX`` for the global vector index + one per partial namespace.
+
+    ``concurrently`` builds without blocking writes; it can't run inside a
+    transaction block.
+    """
+    how = "CONCURRENTLY " if concurrently else ""
+    statements = [
+        f"""
+        CREATE INDEX {how}IF NOT EXISTS {vector_index_name(table_prefix, index.kind)}
+            ON {chunks_table}
+            {index.using()}
+        """
+    ]
+    for namespace in namespaces:
+        statements.append(
+            f"""
+        CREATE INDEX {how}IF NOT EXISTS {vector_index_name(table_prefix, index.kind, namespace)}
+            ON {chunks_table}
+            {index.using()}
+            WHERE namespace = {sql_literal(namespace)}
+        """
+        )
+    return statements
+
+
 def schema_statements(
     *,
     table_prefix: str,
     docs_table: str,
     chunks_table: str,
     embedding_dim: int,
+    index: VectorIndex | None = DEFAULT_INDEX,
+    namespaces: tuple[str, ...] = (),
 ) -> list[str]:
     """The idempotent DDL batch ``init_schema()`` runs, in order.
 
     Every statement is ``IF NOT EXISTS`` so re-running against an
-    initialized database is a no-op.
+    initialized database is a no-op. ``index=None`` leaves the vector
+    index out (``init_schema`` does that while a migration between index
+    kinds is pending).
     """
     return [
         f"""
@@ -74,10 +251,10 @@ def schema_statements(
         CREATE INDEX IF NOT EXISTS idx_{table_prefix}_chunks_doc
             ON {chunks_table} (namespace, document_id)
         """,
-        f"""
-        CREATE INDEX IF NOT EXISTS idx_{table_prefix}_chunks_embedding
-            ON {chunks_table}
-            USING ivfflat (embedding vector_cosine_ops)
-            WITH (lists = {_IVFFLAT_LISTS})
-        """,
-    ]
+    ] + (
+        []
+        if index is None
+        else vector_index_statements(
+            table_prefix=table_prefix, chunks_table=chunks_table, index=index, namespaces=namespaces
+        )
+    )
@@ -9,6 +9,8 @@ derivation in ``fi_core.stores._common``.
 from __future__ import annotations
 
 import json
+import logging
+from collections.abc import Sequence
 from typing import Any
 
 try:
@@ -33,7 +35,16 @@ from fi_core.stores._pg import (
     init_vector_connection,
 )
 from fi_core.stores.pgvector.rows import row_to_document_record
-from fi_core.stores.pgvector.schema import schema_statements
+from fi_core.stores.pgvector.schema import (
+    DEFAULT_INDEX,
+    VectorIndex,
+    schema_statements,
+    sql_literal,
+    vector_index_name,
+    vector_index_statements,
+)
+
+logger = logging.getLogger(__name__)
 
 # Default table prefix. Consumers can override at construction so multiple
 # stores can coexist in one database without colliding.
@@ -45,8 +56,19 @@ class PgVectorChunkStore:
 
     Persists documents + chunks + embeddings into two relational tables
     keyed by ``(namespace, document_id)`` and ``(namespace, chunk_id)``
-    respectively. Cosine similarity queries hit a pgvector IVFFlat index
-    on the chunks table.
+    respectively. Cosine similarity queries hit a pgvector index on the
+    chunks table: IVFFlat by default, HNSW with ``index=HnswIndex(...)``.
+    The index object's per-query settings (``ef_search`` / ``probes``,
+    iterative scan) are applied with ``SET LOCAL`` around each query.
+
+    ``namespace_indexes`` lists namespaces (tenants, collections) that get
+    their own partial vector index; queries on them inline the namespace
+    so the planner can match it.
+
+    Switching an existing table between index kinds: ``init_schema()``
+    won't build the new kind over a table that has the other (that would
+    block writes for the whole build); ``migrate_index()`` builds it
+    ``CONCURRENTLY`` and then drops the old one.
 
     Construction takes either a DSN (string) or a pre-built
     ``asyncpg.Pool``. Passing a pool is preferred in long-running
@@ -69,6 +91,8 @@ class PgVectorChunkStore:
         pool: "asyncpg.Pool | None" = None,
         embedding_dim: int,
         table_prefix: str = _DEFAULT_PREFIX,
+        index: VectorIndex = DEFAULT_INDEX,
+        namespace_indexes: Sequence[str] = (),
     ) -> None:
         if (dsn is None) == (pool is None):
             raise ValueError(
@@ -92,6 +116,10 @@ class PgVectorChunkStore:
         self.table_prefix = table_prefix
         self._docs_table = f"{table_prefix}_documents"
         self._chunks_table = f"{table_prefix}_chunks"
+        self.index = index
+        self.namespace_indexes = tuple(dict.fromkeys(namespace_indexes))
+        for namespace in self.namespace_indexes:
+            sql_literal(namespace)  # reject what can't be inlined, up-front
         self._schema_ready = False
 
     # ------------------------------------------------------------------
@@ -134,6 +162,9 @@ class PgVectorChunkStore:
         database, or the extension to be pre-installed by a superuser
         (typical in managed Postgres products).
 
+        The vector index is skipped (with a warning) when the table already
+        has the global index of the other kind — run ``migrate_index()``.
+
         The ``vector`` extension is installed BEFORE the pool is built
         (``fi_core.stores._pg.ensure_vector_extension``) so the pool's
         per-connection codec registration sees the type — otherwise
@@ -148,16 +179,93 @@ class PgVectorChunkStore:
             # creation, this is the safety net.
             await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
             await init_vector_connection(conn)
+            index: VectorIndex | None = self.index
+            if await self._has_other_index_kind(conn):
+                logger.warning(
+                    "%s has a vector index of another kind; not building %s inline — run migrate_index()",
+                    self._chunks_table,
+                    self.index.kind,
+                )
+                index = None
             async with conn.transaction():
                 for statement in schema_statements(
                     table_prefix=self.table_prefix,
                     docs_table=self._docs_table,
                     chunks_table=self._chunks_table,
                     embedding_dim=self.embedding_dim,
+                    index=index,
+                    namespaces=self.namespace_indexes,
                 ):
                     await conn.execute(statement)
         self._schema_ready = True
 
+    async def _has_other_index_kind(self, conn: "asyncpg.Connection") -> bool:
+        other = "hnsw" if self.index.kind == "ivfflat" else "ivfflat"
+        ours, theirs = await conn.fetchrow(
+            "SELECT to_regclass($1) IS NOT NULL, to_regclass($2) IS NOT NULL",
+            vector_index_name(self.table_prefix, self.index.kind),
+            vector_index_name(self.table_prefix, other),
+        )
+        return theirs and not ours
+
+    async def migrate_index(self, *, maintenance_work_mem: str | None = None) -> list[str]:
+        """Build the configured vector indexes online, then drop the other kind.
+
+        Every index is created ``CREATE INDEX CONCURRENTLY`` (reads and
+        writes keep flowing while it builds); an invalid leftover from an
+        interrupted concurrent build is dropped and rebuilt. Only once all
+        of them are built are the chunks table's indexes of the other access
+        method dropped, also concurrently — queries never run without an
+        index. Re-running is a no-op. ``maintenance_work_mem`` (e.g.
+        ``"2GB"``) is set for the build session; HNSW builds are much faster
+        when the graph fits in it.
+
+        Returns the names of the indexes dropped.
+        """
+        await self._ensure_schema()
+        pool = await self._get_pool()
+        names = [vector_index_name(self.table_prefix, self.index.kind)] + [
+            vector_index_name(self.table_prefix, self.index.kind, ns) for ns in self.namespace_indexes
+        ]
+        statements = vector_index_statements(
+            table_prefix=self.table_prefix,
+            chunks_table=self._chunks_table,
+            index=self.index,
+            namespaces=self.namespace_indexes,
+            concurrently=True,
+        )
+        other = "hnsw" if self.index.kind == "ivfflat" else "ivfflat"
+        dropped: list[str] = []
+        async with pool.acquire() as conn:
+            if maintenance_work_mem is not None:
+                await conn.execute("SELECT set_config('maintenance_work_mem', $1, false)", maintenance_work_mem)
+            try:
+                for name, statement in zip(names, statements, strict=True):
+                    valid = await conn.fetchval(
+                        "SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass($1)", name
+                    )
+                    if valid is False:
+                        await conn.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+                    await conn.execute(statement)
+                rows = await conn.fetch(
+                    """
+                    SELECT i.relname AS name
+                    FROM pg_index x
+                    JOIN pg_class i ON i.oid = x.indexrelid
+                    JOIN pg_am am ON am.oid = i.relam
+                    WHERE x.indrelid = to_regclass($1) AND am.amname = $2
+                    """,
+                    self._chunks_table,
+                    other,
+                )
+                for row in rows:
+                    await conn.execute(f'DROP INDEX CONCURRENTLY IF EXISTS "{row["name"]}"')
+                    dropped.append(row["name"])
+            finally:
+                if maintenance_work_mem is not None:
+                    await conn.execute("RESET maintenance_work_mem")
+        return dropped
+
     async def _ensure_schema(self) -> None:
         if not self._schema_ready:
             await self.init_schema()
@@ -218,7 +326,9 @@ class PgVectorChunkStore:
         means orthogonal. Zero-norm query vectors return ``[]`` rather
         than NaN — matches the HDF5 sibling's behavior. ``filters`` restricts
         to chunks whose parent document's ``attributes`` contain the given pairs
-        (Postgres ``@>`` JSONB containment).
+        (Postgres ``@>`` JSONB containment). With ``iterative_scan`` set on
+        the index, a selective namespace or attribute filter keeps the index
+        scan walking until ``top_k`` rows pass it.
         """
         await self._ensure_schema()
         if top_k <= 0:
@@ -231,40 +341,47 @@ class PgVectorChunkStore:
             raise ValueError(
                 f"query_embedding has {len(query_embedding)} dims, store expects {self.embedding_dim}"
             )
+        params: list[Any] = [query_embedding, top_k]
+        if namespace in self.namespace_indexes:
+            # A partial index only matches its own constant, not a bind param.
+            where = f"c.namespace = {sql_literal(namespace)}"
+        else:
+            params.append(namespace)
+            where = f"c.namespace = ${len(params)}"
+        join = ""
+        if filters:
+            # Join to documents and filter by JSONB containment on attributes.
+            params.append(json.dumps(filters))
+            join = f"JOIN {self._docs_table} d ON d.namespace = c.namespace AND d.document_id = c.document_id"
+            where += f" AND d.attributes @> ${len(params)}::jsonb"
+        # An iterative scan in relaxed order may return rows slightly out of
+        # distance order; the materialized CTE re-sorts just the top-k.
+        query = f"""
+            WITH hits AS MATERIALIZED (
+                SELECT c.text, c.source_type, c.source_ref, c.created_at,
+                       c.embedding <=> $1 AS distance
+                FROM {self._chunks_table} c
+                {join}
+                WHERE {where}
+                ORDER BY distance
+                LIMIT $2
+            )
+            SELECT text, source_type, source_ref, created_at, 1 - distance AS similarity
+            FROM hits
+            ORDER BY distance
+        """
+        settings = self.index.query_settings()
         pool = await self._get_pool()
         async with pool.acquire() as conn:
-            if filters:
-                # Join to documents and filter by JSONB containment on attributes.
-                rows = await conn.fetch(
-                    f"""
-                    SELECT c.text, c.source_type, c.source_ref, c.created_at,
-                           1 - (c.embedding <=> $1) AS similarity
-                    FROM {self._chunks_table} c
-                    JOIN {self._docs_table} d
-                      ON d.namespace = c.namespace AND d.document_id = c.document_id
-                    WHERE c.namespace = $2 AND d.attributes @> $4::jsonb
-                    ORDER BY c.embedding <=> $1
-                    LIMIT $3
-                    """,
-                    query_embedding,
-                    namespace,
-                    top_k,
-                    json.dumps(filters),
-                )
+            if settings:
+                # SET LOCAL scopes the settings to this query's transaction,
+                # so they never leak to the pooled connection's next user.
+                async with conn.transaction():
+                    for statement in settings:
+                        await conn.execute(statement)
+                    rows = await conn.fetch(query, *params)
             else:
-                rows = await conn.fetch(
-                    f"""
-                    SELECT text, source_type, source_ref, created_at,
-                           1 - (embedding <=> $1) AS similarity
-                    FROM {self._chunks_table}
-                    WHERE namespace = $2
-                    ORDER BY embedding <=> $1
-                    LIMIT $3
-                    """,
-                    query_embedding,
-                    namespace,
-                    top_k,
-                )
+                rows = await conn.fetch(query, *params)
         return [
             RetrievedChunk(
                 chunk=Chunk(
@@ -581,6 +698,31 @@ class PgVectorChunkStore:
         except (ValueError, IndexError):
             return 0
 
+    async def delete_chunks(
+        self,
+        *,
+        namespace: str,
+        document_id: str,
+        texts: list[str],
+    ) -> int:
+        """ChunkPruningStore.delete_chunks — delete a document's chunks by text."""
+        if not texts:
+            return 0
+        await self._ensure_schema()
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            status = await conn.execute(
+                f"DELETE FROM {self._chunks_table} "
+                "WHERE namespace = $1 AND document_id = $2 AND text = ANY($3::text[])",
+                namespace,
+                document_id,
+                list(texts),
+            )
+        try:
+            return int(status.split()[-1])
+        except (ValueError, IndexError):
+            return 0
+
     async def reindex_document(
         self,
         *,
@@ -0,0 +1,161 @@
+"""Tests for fi_core.matching — compiled matchers behind triage and persona guards.
+
+The contract is EQUIVALENCE: a compiled matcher reports exactly what the naive
+per-term / per-pattern loop it replaced would, for both matching strategies.
+"""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from fi_core.cognitive import CARDIOLOGY, PSYCHIATRY, PatientContext, UrgencyClassifier
+from fi_core.cognitive.urgency import _normalize
+from fi_core.matching import (
+    LiteralMatcher,
+    PatternMatcher,
+    compile_patterns,
+    compile_vocabulary,
+    fold_accents,
+)
+from fi_core.persona import packs
+
+_TEXTS = [
+    "As an AI, I cannot help with that. How can I help you today?",
+    "Yo soy un bot diseñado para ayudarte, claro que sí.",
+    "Órale, ¿qué onda? Dime qué busco y lo hago.",
+    "I'M AN AI and I was trained by OpenAI. Great question!",
+    "It's important to note that your feelings are valid.",
+    "Tus sentimientos son válidos. Entiendo cómo te sientes.",
+    "## Resumen\n- uno\n- dos\n*sighs* **a** **b** **c**",
+    "el paciente refiere ánimo estable y niega ideación suicida",
+    "İ'm an aı — Turkish dotted/dotless i still match (?i)",
+    "",
+]
+
+_ALL_PACKS = [
+    p for name in dir(packs) if name.isupper() for p in getattr(packs, name)
+    if isinstance(p, re.Pattern)
+]
+
+
+# ============================================================
+# LiteralMatcher
+# ============================================================
+
+
+@pytest.mark.parametrize("automaton", [False, True])
+def test_literal_matcher_finds_overlapping_and_nested_terms(automaton):
+    terms = ["he", "she", "his", "hers", "plan suicida", "suicida", "plan suicida estructurado"]
+    m = LiteralMatcher(terms, automaton=automaton)
+    text = "ushers · tiene un plan suicida estructurado"
+    assert m.findall(text) == {t for t in terms if t in text}
+    assert m.search(text)
+    assert not m.search("nada que ver")
+
+
+def test_automaton_agrees_with_scan_on_large_vocabulary():
+    vocab = {f"term{i} x" for i in range(2000)} | {"ideacion suicida", "x term1"}
+    text = "term1 x term19 x y term1999 x ideacion suicida"
+    scan = LiteralMatcher(vocab, automaton=False)
+    auto = LiteralMatcher(vocab)  # over the threshold → automaton
+    assert auto._automaton is not None
+    assert auto.findall(text) == scan.findall(text) == {t for t in vocab if t in text}
+
+
+def test_vocabulary_is_accent_folded_and_reports_original_terms():
+    vocab = compile_vocabulary(frozenset({"ideación suicida", "Plan Suicida"}))
+    assert vocab.findall(fold_accents("IDEACION SUICIDA y plan suicida")) == {
+        "ideación suicida",
+        "Plan Suicida",
+    }
+
+
+def test_compiled_artefacts_are_cached_per_vocabulary():
+    assert compile_vocabulary(PSYCHIATRY.critical_symptoms) is compile_vocabulary(
+        PSYCHIATRY.critical_symptoms
+    )
+    pack = tuple(packs.ALL_AI_DISCLOSURE)
+    assert compile_patterns(pack) is compile_patterns(tuple(packs.ALL_AI_DISCLOSURE))
+
+
+# ============================================================
+# PatternMatcher
+# ============================================================
+
+
+@pytest.mark.parametrize("text", _TEXTS)
+def test_pattern_matcher_equals_per_pattern_search(text):
+    m = PatternMatcher(_ALL_PACKS)
+    assert m.findall(text) == [p.pattern for p in _ALL_PACKS if p.search(text)]
+    assert m.search(text) == any(p.search(text) for p in _ALL_PACKS)
+
+
+def test_pattern_matcher_prefilters_most_packs():
+    m = PatternMatcher(packs.ALL_AI_DISCLOSURE)
+    assert len(m._always) < len(m.patterns) / 2
+
+
+def test_case_sensitive_and_unparseable_literals_stay_exact():
+    pats = [re.compile(r"Hello World"), re.compile(r"(?i)hello world"), re.compile(r"(a)\1bc")]
+    m = PatternMatcher(pats)
+    assert m.findall("hello world") == [r"(?i)hello world"]
+    assert m.findall("Hello World aabc") == [p.pattern for p in pats]
+
+
+# ============================================================
+# UrgencyClassifier — same scores and reasons as the per-term scan
+# ============================================================
+
+
+def _naive_classify(clf: UrgencyClassifier, patient: PatientContext):
+    """The per-term scan the compiled matchers replaced (over folded text)."""
+
+    def norm(items: list[str]) -> list[str]:
+        return [fold_accents(i) for i in _normalize(items)]
+
+    def hit(vocab: frozenset[str], item: str) -> bool:
+        return any(fold_accents(t) in item for t in vocab)
+
+    text = " ".join(norm(patient.symptoms + patient.medical_history))
+    pattern = next((p for p in sorted(clf.critical_patterns) if fold_accents(p) in text), None)
+    sev = [
+        9 if hit(clf.critical_symptoms, s) else 7 if hit(clf.high_symptoms, s)
+        else 5 if hit(clf.medium_symptoms, s) else 3
+        for s in norm(patient.symptoms)
+    ]
+    history = norm(patient.medical_history)
+    conds = [c for c in sorted(clf.high_risk_conditions) if any(hit({c}, h) for h in history)]
+    return pattern, max(sev, default=0), conds
+
+
+@pytest.mark.parametrize("domain", [CARDIOLOGY, PSYCHIATRY])
+@pytest.mark.parametrize(
+    "symptoms,history",
+    [
+        (["chest pain", "Dyspnea", "fever"], ["hypertension", "diabetes"]),
+        (["ideacion suicida pasiva", "ansiedad"], ["intento de suicidio previo"]),
+        (["tiene un plan suicida", "insomnio"], []),
+        (["acute MI suspected"], ["COPD"]),
+        (["me siento bien"], ["ninguno"]),
+    ],
+)
+def test_classifier_matches_naive_scan(domain, symptoms, history):
+    clf = domain.urgency_classifier()
+    patient = PatientContext(age=70, symptoms=symptoms, medical_history=history)
+    score = clf.classify(patient)
+    pattern, base, conds = _naive_classify(clf, patient)
+    if pattern is not None:
+        assert score.critical_override
+        assert score.reasons == (f"critical pattern '{pattern}' detected → override CRITICAL",)
+    else:
+        assert score.base_gravity == base
+        assert [r for r in score.reasons if r.startswith("comorbidity")] == [
+            f"comorbidity '{c}' (+0.5)" for c in conds
+        ]
+
+
+def test_unaccented_input_now_matches_accented_vocabulary():
+    score = PSYCHIATRY.urgency_classifier().classify(PatientContext(symptoms=["ideacion suicida"]))
+    assert score.base_gravity >= 7
@@ -0,0 +1,58 @@
+"""Tests for ``fi_core.memory.blocking`` — candidate clustering before judging."""
+
+from __future__ import annotations
+
+import builtins
+
+import pytest
+
+from fi_core.memory.blocking import cluster_facts, similar_pairs
+
+_VECTORS = {
+    1: [1.0, 0.0, 0.0],
+    2: [0.98, 0.2, 0.0],  # near 1
+    3: [0.0, 1.0, 0.0],
+    4: [0.0, 0.97, 0.24],  # near 3
+    5: [0.0, 0.0, 1.0],  # alone
+    6: [0.0, 0.0, 0.0],  # zero vector never pairs
+}
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        real_import = builtins.__import__
+
+        def no_numpy(name, *args, **kwargs):  # noqa: ANN001, ANN002, ANN003
+            if name == "numpy":
+                raise ImportError(name)
+            return real_import(name, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "__import__", no_numpy)
+    return request.param
+
+
+def test_similar_pairs_above_threshold_strongest_first(backend):
+    pairs = similar_pairs(_VECTORS, 0.9)
+    assert [(a, b) for _s, a, b in pairs] == [(1, 2), (3, 4)]
+    assert pairs[0][0] >= pairs[1][0] >= 0.9
+
+
+def test_cluster_facts_returns_only_multi_fact_clusters():
+    pairs = similar_pairs(_VECTORS, 0.9)
+    assert cluster_facts(list(_VECTORS), pairs, max_cluster_size=10) == [[1, 2], [3, 4]]
+
+
+def test_cluster_size_is_bounded():
+    # A chain 1-2-3-4-5 collapses into one cluster without the bound.
+    chain = [(0.99 - i / 100, i, i + 1) for i in range(1, 5)]
+    assert cluster_facts([1, 2, 3, 4, 5], chain, max_cluster_size=10) == [[1, 2, 3, 4, 5]]
+    bounded = cluster_facts([1, 2, 3, 4, 5], chain, max_cluster_size=2)
+    assert bounded == [[1, 2], [3, 4]]
+    assert all(len(c) <= 2 for c in bounded)
+
+
+def test_pairs_for_unknown_ids_are_ignored():
+    assert cluster_facts([1, 2], [(0.99, 1, 99), (0.95, 1, 2)], max_cluster_size=5) == [[1, 2]]
@@ -8,6 +8,7 @@ without spinning up Postgres. The persona.mcp_server tools are real
 from __future__ import annotations
 
 import json
+import re
 from typing import Any
 
 import pytest
@@ -15,6 +16,7 @@ import pytest
 from fi_core.memory import Fact, FactSource, MemoryStore
 from fi_core.memory.consolidator import (
     DEFAULT_MIN_FACTS,
+    BlockingConfig,
     FactConsolidator,
 )
 from fi_core.memory.types import ConsolidationOp
@@ -347,6 +349,138 @@ class TestConsolidatorThresholdConfig:
         assert len(report.ops) == 1
 
 
+# ---------------------------------------------------------------------------
+# Blocking — cluster by stored embeddings, judge only candidate clusters
+# ---------------------------------------------------------------------------
+
+
+class _EmbeddedStore(_MockStore):
+    """_MockStore plus the optional ``get_fact_embeddings`` PgMemoryStore has."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.vectors: dict[int, list[float]] = {}
+
+    def seed_vectors(self, principal_id: str, facts: list[tuple[str, list[float]]]) -> list[int]:
+        ids = self.seed(principal_id, [text for text, _ in facts])
+        self.vectors.update({fid: vec for fid, (_, vec) in zip(ids, facts, strict=True)})
+        return ids
+
+    async def get_fact_embeddings(self, principal_id: str) -> dict[int, list[float]]:
+        live = {f.id for f in await self.get_facts(principal_id)}
+        return {fid: v for fid, v in self.vectors.items() if fid in live}
+
+
+def _axis(i: int, dim: int = 8, wobble: float = 0.0) -> list[float]:
+    v = [0.0] * dim
+    v[i] = 1.0
+    v[(i + 1) % dim] = wobble
+    return v
+
+
+_BLOCKING = BlockingConfig(min_facts=3, min_similarity=0.9)
+
+
+class _RecordingJudge:
+    """Merges every pair it is shown; records the fact ids of each call."""
+
+    def __init__(self, fail_on: int | None = None) -> None:
+        self.calls: list[list[int]] = []
+        self.fail_on = fail_on
+
+    async def __call__(self, system, user, max_tokens):  # noqa: ARG002
+        ids = [int(x) for x in re.findall(r'"id": (\d+)', user)]
+        self.calls.append(ids)
+        if self.fail_on in ids:
+            raise RuntimeError("judge down")
+        return json.dumps([{"op": "UPDATE", "merge_ids": ids, "new_fact": "merged", "reason": "dup"}])
+
+
+class TestConsolidatorBlocking:
+    def _store(self) -> tuple[_EmbeddedStore, list[int]]:
+        store = _EmbeddedStore()
+        ids = store.seed_vectors(
+            "u1",
+            [
+                ("vive en Madrid", _axis(0)),
+                ("vive en madrid, España", _axis(0, wobble=0.1)),  # duplicate of #1
+                ("toma sertralina", _axis(2)),
+                ("toma sertralina 50mg", _axis(2, wobble=0.2)),  # duplicate of #3
+                ("le gusta el jazz", _axis(4)),  # alone
+                ("trabaja de noche", _axis(6)),  # alone
+            ],
+        )
+        return store, ids
+
+    async def test_only_candidate_clusters_reach_the_judge(self):
+        store, ids = self._store()
+        judge = _RecordingJudge()
+        report = await FactConsolidator(store=store, llm_call=judge, blocking=_BLOCKING).consolidate_principal("u1")
+
+        assert sorted(judge.calls) == [[ids[0], ids[1]], [ids[2], ids[3]]]
+        assert report.error is None
+        counts = report.counts_by_op()
+        assert counts["UPDATE"] == 4 and counts["NOOP"] == 2
+        assert report.facts_out == 4  # 2 merged + 2 untouched
+        (plan,) = [p for _, p in store.applied_plans]  # ONE transactional apply
+        assert {op["op"] for op in plan} == {"UPDATE", "NOOP"}
+
+    async def test_no_candidates_means_no_judge_call(self):
+        store = _EmbeddedStore()
+        store.seed_vectors("u1", [(f"hecho {i}", _axis(i)) for i in range(4)])
+
+        async def _judge(system, user, max_tokens):  # noqa: ARG001
+            pytest.fail("no cluster → no judge call")
+
+        report = await FactConsolidator(store=store, llm_call=_judge, blocking=_BLOCKING).consolidate_principal("u1")
+        assert report.counts_by_op()["NOOP"] == 4 and report.error is None
+
+    async def test_missing_vectors_fall_back_to_single_shot(self):
+        store, ids = self._store()
+        del store.vectors[ids[5]]  # embedding backfill behind
+        judge = _RecordingJudge()
+        await FactConsolidator(store=store, llm_call=judge, blocking=_BLOCKING).consolidate_principal("u1")
+        assert judge.calls == [ids]
+
+    async def test_embedder_fills_missing_vectors(self):
+        store, ids = self._store()
+        del store.vectors[ids[5]]
+
+        class _Embedder:
+            async def embed(self, text: str) -> list[float]:
+                return _axis(6)
+
+        judge = _RecordingJudge()
+        await FactConsolidator(
+            store=store, llm_call=judge, blocking=_BLOCKING, embedder=_Embedder()
+        ).consolidate_principal("u1")
+        assert len(judge.calls) == 2
+
+    async def test_below_blocking_min_facts_is_single_shot(self):
+        store, ids = self._store()
+        judge = _RecordingJudge()
+        cfg = BlockingConfig(min_facts=100)
+        await FactConsolidator(store=store, llm_call=judge, blocking=cfg).consolidate_principal("u1")
+        assert judge.calls == [ids]
+
+    async def test_failed_cluster_is_noop_and_reported(self):
+        store, ids = self._store()
+        judge = _RecordingJudge(fail_on=ids[2])
+        report = await FactConsolidator(store=store, llm_call=judge, blocking=_BLOCKING).consolidate_principal("u1")
+        assert report.error is not None and report.error.startswith("partial: 1/2")
+        assert report.counts_by_op() == {"NOOP": 4, "DELETE": 0, "UPDATE": 2, "ADD": 0}
+
+    async def test_all_clusters_failed_applies_nothing(self):
+        store, ids = self._store()
+
+        async def _judge(system, user, max_tokens):  # noqa: ARG001
+            raise RuntimeError("judge down")
+
+        report = await FactConsolidator(store=store, llm_call=_judge, blocking=_BLOCKING).consolidate_principal("u1")
+        assert report.error == "llm_call_failed: judge down"
+        assert store.applied_plans == []
+
+
 def test_default_min_facts_constant():
     assert DEFAULT_MIN_FACTS == 3
 
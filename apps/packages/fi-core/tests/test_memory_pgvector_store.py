@@ -392,5 +392,20 @@ class TestMultiPrincipal:
         assert await hybrid_store.semantic_search_multi([], "larisa") == []
 
 
+
+class TestFactEmbeddings:
+    """The stored vectors FactConsolidator blocks on (fi_core.memory.blocking)."""
+
+    async def test_returns_live_embedded_facts_only(self, hybrid_store, store):
+        near = await hybrid_store.add_fact("u1", "el clima de hoy hace calor")
+        gone = await hybrid_store.add_fact("u1", "su contacto es larisa la terapeuta")
+        await hybrid_store.soft_delete_fact(gone, deleted_at=1.0)
+        await store.add_fact("u1", "sin vector")  # no embedder on `store`
+
+        vectors = await hybrid_store.get_fact_embeddings("u1")
+        assert set(vectors) == {near}
+        assert vectors[near] == pytest.approx([0.99, 0.14])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,155 @@
+"""Batched, pipelined RagStore.ingest (real HDF5 store, counting embedders).
+
+Pins what the pipeline changes and what it must not: chunks are embedded in
+batches (or concurrently when the embedder has no ``embed_batch``), written as
+they are ready, duplicate chunks are stored once, an unchanged re-ingest does
+no embedding work — and the stored result is the same as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("h5py")
+
+from fi_core.embeddings.hashing import HashingEmbedder  # noqa: E402
+from fi_core.rag import BatchEmbedder, RagStore, embed_texts  # noqa: E402
+from fi_core.rag.ingest import embed_and_store  # noqa: E402
+from fi_core.stores.hdf5 import HDF5ChunkStore  # noqa: E402
+
+_CHUNK = {"chunk_size": 12, "overlap": 0, "min_chunk_size": 2}
+_DOC = "\n\n".join(f"Parrafo {i} sobre cuadernos lapices y mochilas numero {i}." for i in range(40))
+
+
+class _CountingBatch(HashingEmbedder):
+    def __init__(self) -> None:
+        super().__init__(dim=32)
+        self.batches: list[int] = []
+        self.singles = 0
+
+    async def embed(self, text: str) -> list[float]:
+        self.singles += 1
+        return await super().embed(text)
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(len(texts))
+        return await super().embed_batch(texts)
+
+
+class _SingleOnly:
+    """An Embedder WITHOUT embed_batch — tracks peak concurrency."""
+
+    def __init__(self) -> None:
+        self._inner = HashingEmbedder(dim=32)
+        self.active = self.peak = 0
+
+    async def embed(self, text: str) -> list[float]:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+        return await self._inner.embed(text)
+
+
+def _rag(tmp_path, embedder) -> RagStore:
+    return RagStore.from_components(store=HDF5ChunkStore(tmp_path / "rag.h5"), embedder=embedder)
+
+
+@pytest.mark.asyncio
+async def test_embeds_in_batches_and_reports_progress(tmp_path):
+    emb = _CountingBatch()
+    events = []
+    n = await _rag(tmp_path, emb).ingest("c1", "d1", _DOC, batch_size=8, on_progress=events.append, **_CHUNK)
+    assert n == 40
+    assert emb.singles == 0 and sum(emb.batches) == 40 and max(emb.batches) == 8
+    assert events[0].stage == "chunked" and events[0].total == 40
+    assert events[-1].stage == "stored" and events[-1].stored == 40
+    assert [e.stored for e in events[1:]] == sorted(e.stored for e in events[1:])
+    hits = await _rag(tmp_path, emb).search("c1", "parrafo 17 mochilas", top_k=1)
+    assert "Parrafo 17" in hits[0].chunk.text
+
+
+@pytest.mark.asyncio
+async def test_duplicates_are_stored_once_and_unchanged_reingest_is_free(tmp_path):
+    emb = _CountingBatch()
+    rag = _rag(tmp_path, emb)
+    repeated = _DOC + "\n\n" + "\n\n".join(_DOC.split("\n\n")[:5])
+    events = []
+    assert await rag.ingest("c1", "d1", repeated, on_progress=events.append, **_CHUNK) == 40
+    assert events[0].duplicates == 5
+    emb.batches.clear()
+    events.clear()
+    assert await rag.ingest("c1", "d1", repeated, metadata={"v": 2}, on_progress=events.append, **_CHUNK) == 40
+    assert emb.batches == [] and [e.stage for e in events] == ["unchanged"]
+    (doc,) = await rag.list_documents("c1")
+    assert doc.chunk_count == 40 and doc.metadata.attributes == {"v": 2}
+    # A rewritten document keeps none of the old chunks.
+    assert await rag.ingest("c1", "d1", "Otro texto sobre reglas y gomas distinto.", **_CHUNK) == 1
+    assert (await rag.stats("c1"))["n_chunks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reingest_with_one_edited_chunk_embeds_only_that_chunk(tmp_path):
+    emb = _CountingBatch()
+    rag = _rag(tmp_path, emb)
+    assert await rag.ingest("c1", "d1", _DOC, **_CHUNK) == 40
+    paragraphs = _DOC.split("\n\n")
+    paragraphs[7] = "Parrafo editado sobre gomas y sacapuntas."
+    seen: list[str] = []
+    original = emb.embed_batch
+
+    async def recording(texts: list[str]) -> list[list[float]]:
+        seen.extend(texts)
+        return await original(texts)
+
+    emb.embed_batch = recording
+    events = []
+    assert await rag.ingest("c1", "d1", "\n\n".join(paragraphs), on_progress=events.append, **_CHUNK) == 40
+    assert seen == ["Parrafo editado sobre gomas y sacapuntas."]
+    assert events[0].stage == "chunked" and events[0].total == 1
+    texts = sorted(c.text for c in await rag.store.get_chunks_by_document(namespace="c1", document_id="d1"))
+    assert texts == sorted(paragraphs)
+    hits = await rag.search("c1", "editado gomas sacapuntas", top_k=1)
+    assert hits[0].chunk.text == paragraphs[7]
+    # Persisted: a fresh instance sees the same 40 chunks.
+    (doc,) = await _rag(tmp_path, emb).list_documents("c1")
+    assert doc.chunk_count == 40
+
+
+@pytest.mark.asyncio
+async def test_embedder_without_batch_runs_bounded_concurrency():
+    emb = _SingleOnly()
+    assert not isinstance(emb, BatchEmbedder)
+    vectors = await embed_texts(emb, [f"texto {i}" for i in range(30)])
+    assert len(vectors) == 30 and vectors[3] == await HashingEmbedder(dim=32).embed("texto 3")
+    assert 1 < emb.peak <= 8
+
+
+@pytest.mark.asyncio
+async def test_store_failure_stops_the_embedder():
+    emb = _CountingBatch()
+
+    async def save(chunks):
+        raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        await embed_and_store([f"p{i}" for i in range(100)], doc_id="d", embedder=emb, save=save, batch_size=5, queue_depth=1)
+    await asyncio.sleep(0)
+    # Back-pressure: with a 1-batch queue the embedder cannot run far ahead.
+    assert sum(emb.batches) <= 15
+
+
+@pytest.mark.asyncio
+async def test_slow_store_gets_coalesced_bulk_writes():
+    emb = _CountingBatch()
+    writes = []
+
+    async def save(chunks):
+        writes.append(len(chunks))
+        await asyncio.sleep(0.01)
+        return len(chunks)
+
+    assert await embed_and_store([f"p{i}" for i in range(64)], doc_id="d", embedder=emb, save=save, batch_size=4) == 64
+    assert sum(writes) == 64 and len(writes) < 16 and max(writes) > 4
@@ -6,11 +6,13 @@ separately (manual smoke); here we pin the composition + wiring + graceful error
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 
 import pytest
 
 from fi_core.rag import (
+    BgeReranker,
     Chunk,
     RerankingRetriever,
     RerankResult,
@@ -72,6 +74,95 @@ async def test_reranking_empty_query_and_empty_pool():
     assert await rr2.retrieve("q", namespace="n") == []
 
 
+@pytest.mark.asyncio
+async def test_rerank_top_n_reranks_only_the_head():
+    pool = [_chunk(t, 1.0 - i / 10) for i, t in enumerate("ABCDE")]
+    seen = []
+
+    @dataclass
+    class _Spy(_ReverseReranker):
+        async def rerank(self, query, documents):  # noqa: ANN001
+            seen.append(list(documents))
+            return await super().rerank(query, documents)
+
+    rr = RerankingRetriever(base=_FakeBase(pool), reranker=_Spy(), rerank_top_n=3)
+    out = await rr.retrieve("q", namespace="n", top_k=4)
+    assert seen == [["A", "B", "C"]]  # the tail never reached the reranker
+    assert [h.chunk.text for h in out] == ["C", "B", "A", "D"]  # tail keeps first-stage order
+
+
+# --- BgeReranker batching + cache ---------------------------------------------
+
+
+class _FakeCrossEncoder:
+    """CrossEncoder stand-in: score = passage length; records every batch."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[tuple[str, str]]] = []
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=None):  # noqa: ANN001
+        self.batches.append(list(pairs))
+        return [float(len(p)) for _, p in pairs]
+
+
+def _bge(**kwargs) -> tuple[BgeReranker, _FakeCrossEncoder]:
+    reranker = BgeReranker(**kwargs)
+    reranker._model = model = _FakeCrossEncoder()
+    return reranker, model
+
+
+@pytest.mark.asyncio
+async def test_bge_coalesces_concurrent_requests_into_one_pass():
+    reranker, model = _bge(max_wait_ms=20)
+    docs = [["aa", "a", "aaa"], ["bbbb", "b"], ["aa", "cc"]]  # "aa" asked twice
+    out = await asyncio.gather(*(reranker.rerank("q", d) for d in docs))
+    assert len(model.batches) == 1
+    assert sorted(p for _, p in model.batches[0]) == ["a", "aa", "aaa", "b", "bbbb", "cc"]  # "aa" scored once
+    assert [r.index for r in out[0]] == [2, 0, 1]
+    assert [r.score for r in out[1]] == [4.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_bge_caches_scores_per_query_and_model():
+    reranker, model = _bge(max_wait_ms=0)
+    first = await reranker.rerank("q", ["x", "yy"])
+    again = await reranker.rerank("q", ["yy", "x"])
+    assert again == [RerankResult(index=0, score=2.0), RerankResult(index=1, score=1.0)]
+    assert len(model.batches) == 1 and first[0].index == 1
+    await reranker.rerank("other query", ["x"])  # different query -> scored
+    assert len(model.batches) == 2
+
+    uncached, model = _bge(max_wait_ms=0, cache_size=0)
+    await uncached.rerank("q", ["x"])
+    await uncached.rerank("q", ["x"])
+    assert len(model.batches) == 2
+
+
+@pytest.mark.asyncio
+async def test_bge_batches_are_length_sorted():
+    reranker, model = _bge(max_wait_ms=0, batch_size=2)
+    docs = ["cccc", "a", "ddddd", "bb"]
+    out = await reranker.rerank("q", docs)
+    assert [[p for _, p in b] for b in model.batches] == [["a", "bb"], ["cccc", "ddddd"]]
+    assert [docs[r.index] for r in out] == ["ddddd", "cccc", "bb", "a"]
+
+
+@pytest.mark.asyncio
+async def test_bge_model_error_reaches_every_waiter_and_recovers():
+    reranker, model = _bge(max_wait_ms=10)
+
+    def boom(pairs, **kwargs):  # noqa: ANN001
+        raise RuntimeError("out of memory")
+
+    model.predict = boom
+    results = await asyncio.gather(
+        reranker.rerank("q", ["a"]), reranker.rerank("q", ["b"]), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    del model.predict  # back to the working method
+    assert [r.score for r in await reranker.rerank("q", ["a"])] == [1.0]
+
+
 # --- rerank MCP tool ----------------------------------------------------------
 
 mcp_server = pytest.importorskip("fi_core.rag.mcp_server")
@@ -0,0 +1,202 @@
+"""BM25 inverted index: scoring, segments, merges, deletes, store wiring.
+
+Real files under tmp_path. Pins that the index returns the same ranking
+whether rows sit in memory, in many segments or in one merged segment;
+that deletes survive a reopen; and that HybridRetriever with a sparse arm
+recalls a keyword chunk the dense arm never returned.
+"""
+
+from __future__ import annotations
+
+import math
+import shutil
+
+import pytest
+
+from fi_core.rag import Chunk, ChunkWithEmbedding, HybridRetriever, RetrievedChunk
+from fi_core.rag.protocols import LexicalChunkStore
+from fi_core.stores.bm25 import BM25Index, terms
+from fi_core.stores.hdf5 import HDF5ChunkStore
+
+CORPUS = [
+    ("d1", "c1", "Dolor torácico opresivo irradiado al brazo izquierdo"),
+    ("d1", "c2", "Presión arterial 150/95, frecuencia cardíaca 98"),
+    ("d2", "c3", "Dolor abdominal en fosa ilíaca derecha, dolor a la palpación"),
+    ("d2", "c4", "Se indica paracetamol 500 mg cada 8 horas"),
+    ("d3", "c5", "Paciente refiere cefalea y dolor cervical"),
+    ("d3", "c6", "Glucosa en ayuno 180 mg/dL, hemoglobina glucosilada 8.1"),
+]
+
+
+def _bm25(query: str, corpus=CORPUS, k1: float = 1.2, b: float = 0.75) -> list[tuple[str, float]]:
+    """Textbook BM25 over ``corpus`` — the reference the index must match."""
+    docs = {c: terms(text) for _, c, text in corpus}
+    avgdl = sum(map(len, docs.values())) / len(docs)
+    scores = {}
+    for chunk_id, toks in docs.items():
+        s = 0.0
+        for t in dict.fromkeys(terms(query)):
+            df = sum(t in d for d in docs.values())
+            if not df:
+                continue
+            idf = math.log(1 + (len(docs) - df + 0.5) / (df + 0.5))
+            tf = toks.count(t)
+            s += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(toks) / avgdl))
+        if s > 0:
+            scores[chunk_id] = s
+    return sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+
+
+def _ranking(index: BM25Index, query: str, **kwargs) -> list[tuple[str, float]]:
+    return [(h.chunk_id, h.score) for h in index.search("ns", query, top_k=10, **kwargs)]
+
+
+def _assert_same(got, want) -> None:
+    assert [c for c, _ in got] == [c for c, _ in want]
+    assert [s for _, s in got] == pytest.approx([s for _, s in want], rel=1e-5)
+
+
+@pytest.mark.parametrize("query", ["dolor", "dolor brazo", "presion arterial", "paracetamol mg", "de la"])
+def test_scores_match_textbook_bm25(tmp_path, query):
+    index = BM25Index(tmp_path / "idx")
+    index.add("ns", CORPUS)
+    _assert_same(_ranking(index, query), _bm25(query))
+
+
+def test_segments_and_merges_keep_the_ranking(tmp_path):
+    index = BM25Index(tmp_path / "idx", flush_docs=1, merge_factor=2)
+    index.add("ns", CORPUS)
+    assert index.stats("ns")["buffered"] == 0
+    assert index.stats("ns")["segments"] < len(CORPUS)  # merged as they filled up
+    _assert_same(_ranking(index, "dolor palpacion"), _bm25("dolor palpacion"))
+
+    reopened = BM25Index(tmp_path / "idx")
+    _assert_same(_ranking(reopened, "dolor palpacion"), _bm25("dolor palpacion"))
+    assert reopened.stats("ns")["chunks"] == len(CORPUS)
+
+
+def test_deletes_persist_and_merges_drop_them(tmp_path):
+    index = BM25Index(tmp_path / "idx", flush_docs=2, merge_factor=8)
+    index.add("ns", CORPUS)
+    assert index.remove_document("ns", "d2") == 2
+    assert "c3" not in dict(_ranking(index, "dolor"))
+
+    reopened = BM25Index(tmp_path / "idx", flush_docs=2, merge_factor=2)
+    assert "c3" not in dict(_ranking(reopened, "dolor"))
+    reopened.add("ns", [("d4", "c7", "dolor lumbar")])
+    reopened.flush()  # 4 segments -> merged, deleted rows gone for good
+    assert reopened.stats("ns") == {"chunks": 5, "segments": 1, "buffered": 0}
+    remaining = [row for row in CORPUS if row[0] != "d2"] + [("d4", "c7", "dolor lumbar")]
+    _assert_same(_ranking(reopened, "dolor"), _bm25("dolor", remaining))
+
+
+def test_interrupted_merge_is_finished_on_open(tmp_path):
+    index = BM25Index(tmp_path / "idx", flush_docs=3, merge_factor=8)
+    index.add("ns", CORPUS)
+    (ns_dir,) = [p.parent for p in (tmp_path / "idx").glob("*/NAMESPACE")]
+    inputs = sorted(ns_dir.glob("seg-*.bm25"))
+    backup = tmp_path / "backup"
+    backup.mkdir()
+    for p in inputs:
+        shutil.copy(p, backup / p.name)
+    merging = BM25Index(tmp_path / "idx", flush_docs=1, merge_factor=2)
+    merging.add("ns", [("d4", "c7", "dolor lumbar")])  # 3rd segment: the first two merge
+    assert merging.stats("ns")["segments"] == 2
+    for p in backup.iterdir():  # as if the merge crashed before removing its inputs
+        shutil.copy(p, ns_dir / p.name)
+
+    reopened = BM25Index(tmp_path / "idx")
+    assert reopened.stats("ns") == {"chunks": len(CORPUS) + 1, "segments": 2, "buffered": 0}
+    assert len(list(ns_dir.glob("seg-*.bm25"))) == 2
+
+
+def test_sync_adds_missing_and_drops_gone(tmp_path):
+    index = BM25Index(tmp_path / "idx")
+    index.add("ns", CORPUS[:4])
+    index.flush()
+    assert index.sync("ns", CORPUS[1:]) == (2, 1)
+    assert index.sync("ns", CORPUS[1:]) == (0, 0)
+    # c1's row still counts in document frequencies until its segment merges
+    assert [c for c, _ in _ranking(index, "dolor")] == [c for c, _ in _bm25("dolor", CORPUS[1:])]
+
+
+def test_document_filter(tmp_path):
+    index = BM25Index(tmp_path / "idx")
+    index.add("ns", CORPUS)
+    assert {c for c, _ in _ranking(index, "dolor", documents={"d3"})} == {"c5"}
+
+
+# --- HDF5ChunkStore(lexical_index=True) ----------------------------------------
+
+
+def _ce(text: str, ref: str, vec: list[float]) -> ChunkWithEmbedding:
+    return ChunkWithEmbedding(chunk=Chunk(text=text, source_type="test", source_ref=ref), embedding=vec)
+
+
+async def _store(path) -> HDF5ChunkStore:
+    store = HDF5ChunkStore(path, lexical_index=True)
+    for doc in ("d1", "d2"):
+        await store.create_document(namespace="ns", document_id=doc, content=doc)
+    await store.save_chunks(
+        namespace="ns",
+        document_id="d1",
+        chunks=[_ce("clima templado de la tarde", "d1#0", [1.0, 0.0]), _ce("receta de cocina", "d1#1", [0.9, 0.1])],
+    )
+    await store.save_chunks(
+        namespace="ns", document_id="d2", chunks=[_ce("presion arterial elevada", "d2#0", [0.0, 1.0])]
+    )
+    return store
+
+
+@pytest.mark.asyncio
+async def test_store_lexical_query_follows_saves_deletes_and_reopen(tmp_path):
+    store = await _store(tmp_path / "s.h5")
+    assert isinstance(store, LexicalChunkStore)
+    (hit,) = await store.lexical_query(namespace="ns", query="presión arterial")
+    assert hit.chunk.text == "presion arterial elevada" and hit.similarity == 1.0
+    await store.close()
+
+    # A lost index (or rows a crash kept from being flushed) is rebuilt
+    # from the store's chunks on open.
+    shutil.rmtree(tmp_path / "s.h5.bm25")
+    reopened = HDF5ChunkStore(tmp_path / "s.h5", lexical_index=True)
+    assert [h.chunk.text for h in await reopened.lexical_query(namespace="ns", query="arterial")] == [
+        "presion arterial elevada"
+    ]
+    await reopened.delete_chunks(namespace="ns", document_id="d1", texts=["receta de cocina"])
+    assert await reopened.lexical_query(namespace="ns", query="cocina") == []
+    assert [h.chunk.text for h in await reopened.lexical_query(namespace="ns", query="clima")] == [
+        "clima templado de la tarde"
+    ]
+    await reopened.delete_document(namespace="ns", document_id="d2")
+    assert await reopened.lexical_query(namespace="ns", query="arterial") == []
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_lexical_query_needs_the_index(tmp_path):
+    store = HDF5ChunkStore(tmp_path / "s.h5")
+    with pytest.raises(RuntimeError, match="lexical_index=True"):
+        await store.lexical_query(namespace="ns", query="x")
+
+
+class _Dense:
+    def __init__(self, store: HDF5ChunkStore) -> None:
+        self.store = store
+
+    async def retrieve(self, query, *, namespace, top_k=5, min_similarity=None, filters=None):  # noqa: ANN001
+        return await self.store.query(namespace=namespace, query_embedding=[1.0, 0.0], top_k=top_k, filters=filters)
+
+
+@pytest.mark.asyncio
+async def test_hybrid_sparse_arm_recalls_chunk_outside_the_dense_pool(tmp_path):
+    store = await _store(tmp_path / "s.h5")
+    # Dense pool of 1 never contains the keyword chunk (its vector is orthogonal).
+    pool_only = HybridRetriever(dense=_Dense(store), candidate_k=1)
+    assert "presion" not in (await pool_only.retrieve("presion arterial", namespace="ns"))[0].chunk.text
+
+    hybrid = HybridRetriever(dense=_Dense(store), candidate_k=1, sparse=store)
+    hits = await hybrid.retrieve("presion arterial", namespace="ns", top_k=2)
+    assert {h.chunk.text for h in hits} == {"presion arterial elevada", "clima templado de la tarde"}
+    assert all(isinstance(h, RetrievedChunk) for h in hits)
+    await store.close()
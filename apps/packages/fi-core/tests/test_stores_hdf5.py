@@ -308,6 +308,22 @@ async def test_delete_chunks_by_document_clears_chunks_keeps_doc(store):
     assert await store.get_chunks_by_document(namespace="ns1", document_id="d1") == []
 
 
+@pytest.mark.asyncio
+async def test_delete_chunks_removes_only_matching_texts(store):
+    await store.create_document(namespace="ns1", document_id="d1", content="A")
+    await store.save_chunks(
+        namespace="ns1",
+        document_id="d1",
+        chunks=[_ce("X", "d1", [1.0, 0.0]), _ce("Y", "d1", [0.0, 1.0])],
+    )
+    deleted = await store.delete_chunks(namespace="ns1", document_id="d1", texts=["X", "missing"])
+    assert deleted == 1
+    chunks = await store.get_chunks_by_document(namespace="ns1", document_id="d1")
+    assert [c.text for c in chunks] == ["Y"]
+    results = await store.query(namespace="ns1", query_embedding=[1.0, 0.0], top_k=5)
+    assert [r.chunk.text for r in results] == ["Y"]
+
+
 @pytest.mark.asyncio
 async def test_delete_document_cascades_to_chunks(store):
     await store.create_document(namespace="ns1", document_id="d1", content="A")
@@ -0,0 +1,189 @@
+"""HDF5ChunkStore write-ahead log: buffered writes, background merge, recovery.
+
+Real h5py I/O against tmp_path files. Pins that a buffered save is
+visible to every read before it reaches the H5 file, that queries and
+saves never wait on the H5 lock, and that a log left by a crashed
+process is replayed exactly once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import h5py
+import pytest
+
+from fi_core.rag import Chunk, ChunkWithEmbedding
+from fi_core.stores.hdf5 import HDF5ChunkStore
+
+
+def _ce(text: str, ref: str, vec: list[float]) -> ChunkWithEmbedding:
+    return ChunkWithEmbedding(
+        chunk=Chunk(text=text, source_type="test", source_ref=ref), embedding=vec
+    )
+
+
+def _chunks_in_file(path, ns="ns1", doc="d1") -> int:
+    with h5py.File(path, "r") as f:
+        group = f.get(f"namespaces/{ns}/documents/{doc}/chunks")
+        return 0 if group is None else len(group)
+
+
+async def _store_with_doc(path, **kwargs) -> HDF5ChunkStore:
+    store = HDF5ChunkStore(path, **kwargs)
+    await store.create_document(namespace="ns1", document_id="d1", content="A")
+    return store
+
+
+@pytest.mark.asyncio
+async def test_buffered_save_is_readable_before_the_merge(tmp_path):
+    path = tmp_path / "s.h5"
+    store = await _store_with_doc(path, merge_interval=60)
+    saved = await store.save_chunks(
+        namespace="ns1",
+        document_id="d1",
+        chunks=[_ce("uno", "d1#0", [1.0, 0.0]), _ce("dos", "d1#1", [0.0, 1.0])],
+    )
+    assert saved == 2
+    assert _chunks_in_file(path) == 0 and (tmp_path / "s.h5.wal").exists()
+
+    hits = await store.query(namespace="ns1", query_embedding=[0.0, 1.0], top_k=1)
+    assert hits[0].chunk.text == "dos"
+    doc = await store.get_document(namespace="ns1", document_id="d1")
+    assert doc.chunk_count == 2 and doc.metadata.status == "indexed"
+    assert doc.metadata.indexed_at is not None
+    (listed,) = await store.list_documents(namespace="ns1", status="indexed")
+    assert listed.chunk_count == 2
+    texts = {c.text for c in await store.get_chunks_by_document(namespace="ns1", document_id="d1")}
+    assert texts == {"uno", "dos"}
+
+    assert await store.flush() == 2
+    assert _chunks_in_file(path) == 2 and not (tmp_path / "s.h5.wal").exists()
+    doc = await store.get_document(namespace="ns1", document_id="d1")
+    assert doc.chunk_count == 2
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_background_merge_writes_batches(tmp_path):
+    path = tmp_path / "s.h5"
+    store = await _store_with_doc(path, merge_interval=60, merge_batch=4)
+    for i in range(4):
+        await store.save_chunks(
+            namespace="ns1", document_id="d1", chunks=[_ce(f"t{i}", f"d1#{i}", [1.0, float(i)])]
+        )
+    # The fourth pending chunk wakes the merger before its interval.
+    for _ in range(200):
+        if _chunks_in_file(path) == 4:
+            break
+        await asyncio.sleep(0.01)
+    assert _chunks_in_file(path) == 4
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_crash_leftover_log_is_replayed_once_on_open(tmp_path):
+    path = tmp_path / "s.h5"
+    store = await _store_with_doc(path, merge_interval=60)
+    await store.save_chunks(
+        namespace="ns1", document_id="d1", chunks=[_ce("sobrevive", "d1#0", [1.0, 0.0])]
+    )
+    # A crash mid-append leaves a torn last line.
+    with open(tmp_path / "s.h5.wal", "ab") as wal:
+        wal.write(b'{"ns": "ns1", "doc": "d1", "id": "tor')
+
+    reopened = HDF5ChunkStore(path)
+    assert _chunks_in_file(path) == 1 and not (tmp_path / "s.h5.wal").exists()
+    hits = await reopened.query(namespace="ns1", query_embedding=[1.0, 0.0], top_k=5)
+    assert [h.chunk.text for h in hits] == ["sobrevive"]
+    # The original instance's merge finds nothing left and drops its overlay.
+    assert await store.flush() == 0
+    assert (await store.get_document(namespace="ns1", document_id="d1")).chunk_count == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_does_not_resurrect_buffered_chunks(tmp_path):
+    path = tmp_path / "s.h5"
+    store = await _store_with_doc(path, merge_interval=60)
+    await store.save_chunks(
+        namespace="ns1", document_id="d1", chunks=[_ce("borrar", "d1#0", [1.0, 0.0])]
+    )
+    assert await store.delete_document(namespace="ns1", document_id="d1")
+    await store.flush()
+    assert await store.query(namespace="ns1", query_embedding=[1.0, 0.0]) == []
+    reopened = HDF5ChunkStore(path)
+    assert await reopened.get_document(namespace="ns1", document_id="d1") is None
+    assert await reopened.query(namespace="ns1", query_embedding=[1.0, 0.0]) == []
+
+
+@pytest.mark.asyncio
+async def test_query_and_save_do_not_wait_for_the_file_lock(tmp_path):
+    store = await _store_with_doc(tmp_path / "s.h5", merge_interval=60)
+    await store.save_chunks(
+        namespace="ns1", document_id="d1", chunks=[_ce("antes", "d1#0", [1.0, 0.0])]
+    )
+    held, release = threading.Event(), threading.Event()
+
+    def hold_file_lock() -> None:  # a long merge, or another process
+        with store._locked():
+            held.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold_file_lock)
+    holder.start()
+    held.wait(5)
+    try:
+        t0 = time.perf_counter()
+        await asyncio.wait_for(
+            store.save_chunks(
+                namespace="ns1", document_id="d1", chunks=[_ce("durante", "d1#1", [0.0, 1.0])]
+            ),
+            2,
+        )
+        hits = await asyncio.wait_for(
+            store.query(namespace="ns1", query_embedding=[0.0, 1.0], top_k=1), 2
+        )
+        assert hits[0].chunk.text == "durante"
+        assert time.perf_counter() - t0 < 1
+    finally:
+        release.set()
+        holder.join()
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_unbuffered_store_writes_the_file_on_save(tmp_path):
+    path = tmp_path / "s.h5"
+    store = await _store_with_doc(path, write_buffer=False)
+    await store.save_chunks(
+        namespace="ns1", document_id="d1", chunks=[_ce("directo", "d1#0", [1.0, 0.0])]
+    )
+    assert _chunks_in_file(path) == 1 and not (tmp_path / "s.h5.wal").exists()
+
+
+@pytest.mark.asyncio
+async def test_dimension_mismatch_is_rejected_before_logging(tmp_path):
+    store = await _store_with_doc(tmp_path / "s.h5", merge_interval=60)
+    await store.save_chunks(
+        namespace="ns1", document_id="d1", chunks=[_ce("a", "d1#0", [1.0, 0.0])]
+    )
+    with pytest.raises(ValueError, match="2-d"):
+        await store.save_chunks(
+            namespace="ns1", document_id="d1", chunks=[_ce("b", "d1#1", [1.0, 0.0, 0.0])]
+        )
+    assert await store.flush() == 1
+
+
+@pytest.mark.asyncio
+async def test_full_buffer_makes_the_save_merge_inline(tmp_path):
+    path = tmp_path / "s.h5"
+    store = await _store_with_doc(path, merge_interval=60, merge_batch=100, max_pending=2)
+    for i in range(3):
+        await store.save_chunks(
+            namespace="ns1", document_id="d1", chunks=[_ce(f"t{i}", f"d1#{i}", [1.0, float(i)])]
+        )
+    assert _chunks_in_file(path) == 2
+    await store.close()
+    assert _chunks_in_file(path) == 3
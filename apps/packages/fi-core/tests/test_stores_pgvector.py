@@ -40,7 +40,8 @@ from fi_core.rag import (  # noqa: E402
     DocumentMetadata,
 )
 from fi_core.rag.protocols import DocumentChunkStore  # noqa: E402
-from fi_core.stores.pgvector import PgVectorChunkStore  # noqa: E402
+from fi_core.stores.pgvector import HnswIndex, IvfflatIndex, PgVectorChunkStore  # noqa: E402
+from fi_core.stores.pgvector.schema import schema_statements  # noqa: E402
 
 
 # ---------------------------------------------------------------------
@@ -307,6 +308,27 @@ async def test_pgvector_cascading_delete(store):
     assert results == []
 
 
+@pytest.mark.asyncio
+async def test_pgvector_delete_chunks_by_text(store):
+    """delete_chunks drops only the matching texts and keeps the document."""
+    await store.create_document(namespace="ns1", document_id="d1", content="A B")
+    await store.save_chunks(
+        namespace="ns1",
+        document_id="d1",
+        chunks=[
+            _ce("Chunk A", "d1#0", [1.0, 0.0, 0.0]),
+            _ce("Chunk B", "d1#1", [0.0, 1.0, 0.0]),
+        ],
+    )
+    deleted = await store.delete_chunks(
+        namespace="ns1", document_id="d1", texts=["Chunk B", "Not stored"]
+    )
+    assert deleted == 1
+    chunks = await store.get_chunks_by_document(namespace="ns1", document_id="d1")
+    assert [c.text for c in chunks] == ["Chunk A"]
+    assert await store.get_document(namespace="ns1", document_id="d1") is not None
+
+
 @pytest.mark.asyncio
 async def test_pgvector_query_top_k_correctness(store):
     """Three chunks with known embeddings; query at known angle; verify order."""
@@ -360,3 +382,104 @@ async def test_pgvector_status_auto_promotion(store):
 async def test_pgvector_satisfies_documentchunkstore_protocol(store):
     """Runtime structural check: instance satisfies the Protocol."""
     assert isinstance(store, DocumentChunkStore)
+
+
+# =====================================================================
+# Index kinds: HNSW, per-namespace partial indexes, online migration
+# =====================================================================
+
+
+def test_index_ddl_and_query_settings():
+    ddl = " ".join(
+        schema_statements(
+            table_prefix="t",
+            docs_table="t_documents",
+            chunks_table="t_chunks",
+            embedding_dim=3,
+            index=HnswIndex(m=24, ef_construction=128, ef_search=100),
+            namespaces=("o'brien",),
+        )
+    )
+    assert "USING hnsw (embedding vector_cosine_ops) WITH (m = 24, ef_construction = 128)" in ddl
+    assert "WHERE namespace = 'o''brien'" in ddl and "ivfflat" not in ddl
+    assert HnswIndex(ef_search=100).query_settings() == [
+        "SET LOCAL hnsw.ef_search = 100",
+        "SET LOCAL hnsw.iterative_scan = relaxed_order",
+    ]
+    assert IvfflatIndex().query_settings() == []  # default schema and queries unchanged
+    with pytest.raises(ValueError):
+        HnswIndex(m=0)
+    with pytest.raises(ValueError):
+        IvfflatIndex(iterative_scan="strict_order")
+
+
+async def _index_names(store: PgVectorChunkStore) -> dict[str, str]:
+    pool = await store._get_pool()
+    async with pool.acquire() as conn:
+        rows = await conn.fetch(
+            "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = $1", f"{store.table_prefix}_chunks"
+        )
+    return {r["indexname"]: r["indexdef"] for r in rows if "vector_cosine_ops" in r["indexdef"]}
+
+
+async def _seed(store: PgVectorChunkStore) -> None:
+    for ns, tag in (("tenant-a", "a"), ("tenant-b", "b")):
+        await store.create_document(
+            namespace=ns, document_id="d1", content="doc", metadata=DocumentMetadata(attributes={"tag": tag})
+        )
+        await store.save_chunks(
+            namespace=ns,
+            document_id="d1",
+            chunks=[
+                _ce(f"{tag} exact", "d1#0", [1.0, 0.0, 0.0]),
+                _ce(f"{tag} mid", "d1#1", [0.7, 0.7, 0.0]),
+                _ce(f"{tag} orthogonal", "d1#2", [0.0, 1.0, 0.0]),
+            ],
+        )
+
+
+@pytest.mark.asyncio
+async def test_pgvector_hnsw_partial_index_and_filters(store, pg_dsn):
+    hnsw = PgVectorChunkStore(
+        dsn=pg_dsn,
+        embedding_dim=3,
+        table_prefix=f"{store.table_prefix}_h",
+        index=HnswIndex(ef_search=10),
+        namespace_indexes=["tenant-a"],
+    )
+    try:
+        await _seed(hnsw)
+        names = await _index_names(hnsw)
+        assert len(names) == 2 and all("USING hnsw" in d for d in names.values())
+        for ns, tag in (("tenant-a", "a"), ("tenant-b", "b")):  # partial-indexed and not
+            hits = await hnsw.query(namespace=ns, query_embedding=[1.0, 0.0, 0.0], top_k=2)
+            assert [h.chunk.text for h in hits] == [f"{tag} exact", f"{tag} mid"]
+        filtered = await hnsw.query(
+            namespace="tenant-a", query_embedding=[1.0, 0.0, 0.0], top_k=5, filters={"tag": "b"}
+        )
+        assert filtered == []
+    finally:
+        async with (await hnsw._get_pool()).acquire() as conn:
+            await conn.execute(f"DROP TABLE IF EXISTS {hnsw.table_prefix}_chunks, {hnsw.table_prefix}_documents")
+        await hnsw.close()
+
+
+@pytest.mark.asyncio
+async def test_pgvector_migrates_ivfflat_table_to_hnsw_online(store, pg_dsn):
+    await _seed(store)
+    assert all("USING ivfflat" in d for d in (await _index_names(store)).values())
+
+    hnsw = PgVectorChunkStore(
+        dsn=pg_dsn, embedding_dim=3, table_prefix=store.table_prefix, index=HnswIndex(), namespace_indexes=["tenant-b"]
+    )
+    try:
+        await hnsw.init_schema()  # existing ivfflat table: HNSW not built inline
+        assert all("USING ivfflat" in d for d in (await _index_names(hnsw)).values())
+        assert await hnsw.migrate_index(maintenance_work_mem="64MB") == [f"idx_{store.table_prefix}_chunks_embedding"]
+        names = await _index_names(hnsw)
+        assert len(names) == 2 and all("USING hnsw" in d for d in names.values())
+        assert await hnsw.migrate_index() == []  # idempotent
+        hits = await hnsw.query(namespace="tenant-b", query_embedding=[1.0, 0.0, 0.0], top_k=1)
+        assert [h.chunk.text for h in hits] == ["b exact"]
+    finally:
+        await hnsw.close()
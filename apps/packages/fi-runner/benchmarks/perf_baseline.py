@@ -10,6 +10,10 @@ which is exactly the surface the hardening changes:
   - Runner.run() with the two guards                    -> delta = guard cost/turn
   - guard.inspect() standalone (triage, antidrift)      -> per-guard cost
   - run_pipeline() with one stage                        -> post-processor cost
+  - triage / antidrift inspect() at LARGE vocabularies   -> compiled matchers
+    vs the per-term / per-pattern scan they replaced (fi_core.matching)
+  - a persona break on a streamed turn: tokens generated and thrown away
+    before the retry, settled-text guards vs stream_guards (fake token stream)
 
 Run it before the hardening, commit the JSON, then `--compare` after. A double-
 digit % jump in the with-guards path means a try/catch (or validation) added
@@ -30,6 +34,7 @@ import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
 # Run as a plain script: put the package root on the path so `import fi_runner`
 # resolves without an editable install.
@@ -41,6 +46,17 @@ from fi_runner import Runner, TurnResult, antidrift_guard, triage_guard  # noqa:
 _BASELINE = Path(__file__).parent / "baselines" / "perf_baseline.json"
 _ITERS = 3000
 _WARMUP = 200
+# Synthetic vocabulary sizes for the large-guard rows (terms per triage tier,
+# extra regex patterns per antidrift detector).
+_LARGE_TERMS = 2000
+_LARGE_PATTERNS = 200
+_LARGE_ITERS = 300
+# Fake token stream for the wasted-tokens rows: a reply of _STREAM_TOKENS
+# tokens that breaks character at token _BREAK_AT, _TOKEN_MS per token.
+_STREAM_TOKENS = 300
+_BREAK_AT = 20
+_TOKEN_MS = 1.0
+_STREAM_ITERS = 5
 
 
 @dataclass
@@ -53,6 +69,37 @@ class _FakeBackend:
         return TurnResult(text=self.text)
 
 
+@dataclass
+class _TokenStreamBackend:
+    """Streams one token per delta at _TOKEN_MS; the first attempt of every turn
+    breaks character at _BREAK_AT, the retry is clean. Counts generated tokens."""
+
+    generated: int = 0
+    _attempt: int = 0
+
+    def _tokens(self) -> list[str]:
+        self._attempt += 1
+        words = ["relleno"] * _STREAM_TOKENS
+        if self._attempt % 2:
+            words[_BREAK_AT : _BREAK_AT + 3] = ["as", "an", "AI,"]
+        return [w + " " for w in words]
+
+    async def run_turn_stream(self, **kwargs):  # noqa: ANN003
+        tokens = self._tokens()
+        for tok in tokens:
+            await asyncio.sleep(_TOKEN_MS / 1000)
+            self.generated += 1
+            yield {"type": "text", "text": tok}
+        yield {"type": "result", "result": TurnResult(text="".join(tokens))}
+
+    async def run_turn(self, **kwargs) -> TurnResult:  # noqa: ANN003
+        text = ""
+        async for event in self.run_turn_stream(**kwargs):
+            if event["type"] == "text":
+                text += event["text"]
+        return TurnResult(text=text)
+
+
 def _stats(samples_ms: list[float]) -> dict[str, float]:
     s = sorted(samples_ms)
     n = len(s)
@@ -143,6 +190,108 @@ async def collect_async() -> dict:
     }
 
 
+def _large_guards() -> tuple[Any, Any, list]:
+    """Psychiatry triage + the default antidrift packs, padded with synthetic
+    terms / patterns that never match (worst case: every term is checked)."""
+    import re
+
+    from fi_core.cognitive import PSYCHIATRY, PatientContext, UrgencyClassifier
+    from fi_runner.guards import TriageGuard
+
+    def pad(vocab: frozenset[str], tag: str) -> frozenset[str]:
+        return vocab | {f"sintoma {tag} {i} raro" for i in range(_LARGE_TERMS)}
+
+    clf = UrgencyClassifier(
+        critical_symptoms=pad(PSYCHIATRY.critical_symptoms, "critico"),
+        high_symptoms=pad(PSYCHIATRY.high_symptoms, "alto"),
+        medium_symptoms=pad(PSYCHIATRY.medium_symptoms, "medio"),
+        critical_patterns=pad(PSYCHIATRY.critical_patterns, "patron"),
+        high_risk_conditions=pad(PSYCHIATRY.high_risk_conditions, "riesgo"),
+    )
+    triage = TriageGuard(classifier=clf, patient_context=PatientContext)
+    extra = [re.compile(rf"(?i)\bfrase de relleno {i}\b") for i in range(_LARGE_PATTERNS)]
+    p = fi_runner.packs
+    breaks = list(p.ALL_AI_DISCLOSURE) + extra
+    antidrift = antidrift_guard(
+        break_patterns=breaks,
+        soft_patterns=list(p.ALL_ASSISTANT_TONE) + extra,
+        clarification_patterns=list(p.CLARIFICATION_DUMP_ES) + extra,
+        reinforcement="STAY IN CHARACTER",
+    )
+    return triage, antidrift, breaks
+
+
+def collect_large_guards() -> dict:
+    """inspect() at large vocabularies, next to the naive scans it replaced."""
+    from fi_core.cognitive.urgency import _normalize
+
+    triage, antidrift, breaks = _large_guards()
+    clf = triage.classifier
+    text = ("el paciente refiere ánimo estable, duerme mejor y niega ideación suicida. " * 6).strip()
+    clean = "Órale, claro que te ayudo con eso, aquí va la respuesta. " * 8
+
+    def naive_triage() -> None:
+        # The pre-fi_core.matching loops: every term against every item.
+        items = _normalize([text])
+        joined = " ".join(items)
+        any(pat in joined for pat in sorted(clf.critical_patterns))
+        for item in items:
+            for vocab in (clf.critical_symptoms, clf.high_symptoms, clf.medium_symptoms):
+                if any(term in item for term in vocab):
+                    break
+            any(cond in item for cond in sorted(clf.high_risk_conditions))
+
+    all_patterns = breaks + list(antidrift.clarification_detector.patterns) + list(
+        antidrift.anti_monitor.patterns
+    )
+    return {
+        "large_vocab_terms": _LARGE_TERMS,
+        "large_vocab_patterns": _LARGE_PATTERNS,
+        "triage_inspect_large": _bench_sync(
+            lambda: triage.inspect(response_text=text), iters=_LARGE_ITERS, warmup=20
+        ),
+        "triage_naive_large": _bench_sync(naive_triage, iters=_LARGE_ITERS, warmup=20),
+        "antidrift_inspect_large": _bench_sync(
+            lambda: antidrift.inspect(response_text=clean), iters=_LARGE_ITERS, warmup=20
+        ),
+        "antidrift_naive_large": _bench_sync(
+            lambda: [q.pattern for q in all_patterns if q.search(clean)], iters=_LARGE_ITERS, warmup=20
+        ),
+    }
+
+
+async def collect_stream_guards() -> dict:
+    """Tokens generated per persona break and turn latency: the guards on the
+    settled text (run() retry — the whole broken reply is generated first) vs
+    stream_guards (run_stream aborts at detection and retries)."""
+    from fi_runner import RetryPolicy
+
+    guard = antidrift_guard(
+        break_patterns=list(fi_runner.packs.ALL_AI_DISCLOSURE), reinforcement="STAY IN CHARACTER"
+    )
+    out: dict[str, Any] = {"stream_tokens": _STREAM_TOKENS, "stream_break_at": _BREAK_AT}
+    for key, streamed in (("settled", False), ("stream_guards", True)):
+        backend = _TokenStreamBackend()
+        runner = Runner(
+            backend=backend, persona="p", guards=[guard], retry_policy=RetryPolicy(max_attempts=2),
+            stream_guards=streamed, flow_narrator=None,
+        )
+
+        async def turn() -> None:
+            if streamed:
+                async for _ in runner.run_stream("hola"):
+                    pass
+            else:
+                await runner.run("hola")
+
+        latency = await _bench_async(turn, iters=_STREAM_ITERS, warmup=1)
+        turns = _STREAM_ITERS + 1
+        # Every turn = one broken attempt + one clean one of _STREAM_TOKENS.
+        out[f"break_turn_{key}"] = latency
+        out[f"wasted_tokens_per_break_{key}"] = round(backend.generated / turns - _STREAM_TOKENS, 1)
+    return out
+
+
 def _git_sha() -> str:
     try:
         return subprocess.check_output(
@@ -168,6 +317,27 @@ def print_report(data: dict) -> None:
     for name, s in rows:
         print(f"  {name:28s} {s['mean_ms']:>9.4f}m {s['p50_ms']:>9.4f}m {s['p95_ms']:>9.4f}m {s['p99_ms']:>9.4f}m")
     print(f"\n  guard overhead per turn (mean): {r['guard_overhead_mean_ms']:+.4f} ms")
+    if "triage_inspect_large" in r:
+        print(
+            f"\n  {'large vocab':28s} {'mean':>10s} {'p50':>10s} {'p95':>10s} {'p99':>10s}"
+            f"   ({r['large_vocab_terms']} terms/tier, +{r['large_vocab_patterns']} patterns/detector)"
+        )
+        for name, key in (
+            ("triage.inspect() compiled", "triage_inspect_large"),
+            ("triage per-term scan", "triage_naive_large"),
+            ("antidrift.inspect() compiled", "antidrift_inspect_large"),
+            ("antidrift per-pattern scan", "antidrift_naive_large"),
+        ):
+            s = r[key]
+            print(f"  {name:28s} {s['mean_ms']:>9.4f}m {s['p50_ms']:>9.4f}m {s['p95_ms']:>9.4f}m {s['p99_ms']:>9.4f}m")
+    if "break_turn_settled" in r:
+        print(
+            f"\n  {'break + retry (streamed)':28s} {'mean':>10s} {'p50':>10s} {'wasted tok':>10s}"
+            f"   ({r['stream_tokens']} tokens, break at {r['stream_break_at']})"
+        )
+        for name, key in (("guards on settled text", "settled"), ("stream_guards", "stream_guards")):
+            s = r[f"break_turn_{key}"]
+            print(f"  {name:28s} {s['mean_ms']:>9.2f}m {s['p50_ms']:>9.2f}m {r[f'wasted_tokens_per_break_{key}']:>10.1f}")
     print()
 
 
@@ -183,7 +353,12 @@ def compare(current: dict) -> None:
         return
     base = json.loads(_BASELINE.read_text())
     print(f"\nCOMPARE  (baseline {base['git_sha']} -> current {current['git_sha']})")
-    for key in ("runner_bare", "runner_guarded", "triage_inspect", "antidrift_inspect", "pipeline_one_stage"):
+    keys = ("runner_bare", "runner_guarded", "triage_inspect", "antidrift_inspect", "pipeline_one_stage",
+            "triage_inspect_large", "antidrift_inspect_large",
+            "break_turn_settled", "break_turn_stream_guards")
+    for key in keys:
+        if key not in base["results"] or key not in current["results"]:
+            continue  # newer rows are absent from older baselines
         b = base["results"][key]["mean_ms"]
         c = current["results"][key]["mean_ms"]
         pct = ((c - b) / b * 100) if b else 0.0
@@ -198,6 +373,8 @@ def main() -> None:
     args = ap.parse_args()
 
     data = asyncio.run(collect_async())
+    data["results"].update(collect_large_guards())
+    data["results"].update(asyncio.run(collect_stream_guards()))
     print_report(data)
     if args.compare:
         compare(data)
@@ -57,6 +57,8 @@ from .guards import (
     AntiDriftGuard,
     Guard,
     GuardOutcome,
+    GuardStream,
+    StreamingGuard,
     TriageGuard,
     antidrift_guard,
     triage_guard,
@@ -132,6 +134,8 @@ __all__ = [
     "router",
     "Guard",
     "GuardOutcome",
+    "GuardStream",
+    "StreamingGuard",
     "TriageGuard",
     "AntiDriftGuard",
     "triage_guard",
@@ -9,7 +9,9 @@ escalate CRITICAL signals)."""
 
 from __future__ import annotations
 
-from .guards import Guard, GuardOutcome
+import time
+
+from .guards import Guard, GuardOutcome, GuardStream, StreamingGuard
 from ._flow_delivery import EmitSink
 
 
@@ -68,6 +70,52 @@ def run_guards(
     return text, outcomes, wants_retry, "\n\n".join(reinforcement_parts)
 
 
+class GuardStreams:
+    """The streaming counterpart of :func:`run_guards` for ONE attempt.
+
+    Opens a :class:`GuardStream` on every guard that is a
+    :class:`StreamingGuard` (the others simply wait for the settled text) and
+    fans each text delta out to them. :meth:`feed` returns the findings that
+    landed on that delta as ``(guard_name, outcome, detection)``, where
+    ``detection`` is the time-to-detection telemetry — ms since the attempt
+    started and chars streamed so far. A raising stream is dropped with a
+    ``guard_error`` (same safety-net rule as ``run_guards``)."""
+
+    def __init__(self, guards: list[Guard], user_message: str, *, emit: EmitSink) -> None:
+        self._emit = emit
+        self._t0 = time.perf_counter()
+        self._chars = 0
+        self._streams: dict[str, GuardStream] = {}
+        for guard in guards:
+            if not isinstance(guard, StreamingGuard):
+                continue
+            name = getattr(guard, "name", None) or repr(guard)
+            try:
+                self._streams[name] = guard.stream(context=(user_message,))
+            except Exception as exc:  # noqa: BLE001 - see run_guards
+                emit("guard_error", {"guard": name, "error": str(exc), "streaming": True})
+
+    def __bool__(self) -> bool:
+        return bool(self._streams)
+
+    def feed(self, delta: str) -> list[tuple[str, GuardOutcome, dict[str, float | int]]]:
+        self._chars += len(delta)
+        found: list[tuple[str, GuardOutcome, dict[str, float | int]]] = []
+        for name, stream in list(self._streams.items()):
+            try:
+                outcome = stream.feed(delta)
+            except Exception as exc:  # noqa: BLE001 - see run_guards
+                self._emit("guard_error", {"guard": name, "error": str(exc), "streaming": True})
+                del self._streams[name]
+                continue
+            if outcome is not None:
+                found.append((name, outcome, {
+                    "time_to_detection_ms": round((time.perf_counter() - self._t0) * 1000, 2),
+                    "chars_streamed": self._chars,
+                }))
+        return found
+
+
 def guard_level(metadata: dict) -> str:
     """A single representative level for a guard outcome, for telemetry."""
     if metadata.get("guard_failed"):
@@ -75,4 +123,4 @@ def guard_level(metadata: dict) -> str:
     return metadata.get("level") or metadata.get("severity") or "ok"
 
 
-__all__ = ["run_guards", "guard_level"]
+__all__ = ["GuardStreams", "run_guards", "guard_level"]
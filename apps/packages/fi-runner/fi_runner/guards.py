@@ -22,6 +22,16 @@ Two flavors, both satisfying the :class:`Guard` protocol:
 ``TurnResult.guard_outcomes``. A consumer with its own turn loop (e.g. insult's
 multi-model retry client) can instead call a guard directly — same object, used
 loose. Either way the runner no longer touches fi-core.
+
+A guard may ALSO be a :class:`StreamingGuard`: ``stream()`` opens a
+:class:`GuardStream` whose ``feed(delta)`` inspects a streamed response as it
+arrives, keeping its matcher state across chunks (a pattern split over two
+deltas still matches) and rescanning only a bounded tail per delta. It reports
+the first actionable finding — a hard break, a CRITICAL triage signal — so
+``Runner.run_stream(stream_guards=True)`` can abort the generation and retry
+early instead of paying for the whole broken response. The full ``inspect``
+still runs on the settled text and stays the authority; a stream only ever
+answers EARLIER, never differently.
 """
 
 from __future__ import annotations
@@ -71,6 +81,46 @@ class Guard(Protocol):
         ...
 
 
+@runtime_checkable
+class GuardStream(Protocol):
+    """Incremental inspection of ONE streamed response (see module docstring)."""
+
+    def feed(self, delta: str) -> GuardOutcome | None:
+        """Consume the next text ``delta``; return an outcome the first time an
+        actionable finding lands in the text streamed so far, else None."""
+        ...
+
+
+@runtime_checkable
+class StreamingGuard(Protocol):
+    """A guard that can also inspect a response while it streams."""
+
+    name: str
+
+    def stream(self, *, context: tuple[str, ...] = ()) -> GuardStream:
+        """Open a :class:`GuardStream` for one response (one attempt)."""
+        ...
+
+
+# Sentence ends for incremental triage: classify whole sentences, the unit a
+# critical pattern ("plan suicida") lives in.
+_SENTENCE_END = re.compile(r"[.!?\n]")
+
+# A streamed span with no sentence end is still classified once it grows past
+# this many chars (cut at the last space), so a run-on reply can't hide.
+_MAX_UNCLASSIFIED = 512
+
+
+def _triage_metadata(score: Any) -> dict[str, Any]:
+    return {
+        "score": score,  # the typed GravityScore, for callers that want it
+        "level": score.level.value,
+        "gravity": score.final_gravity,
+        "critical": score.critical_override,
+        "reasons": list(score.reasons),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Observational: clinical urgency triage (fi_core.cognitive)
 # ---------------------------------------------------------------------------
@@ -97,15 +147,48 @@ class TriageGuard:
         score = self.classifier.classify(
             self.patient_context(symptoms=[response_text, *context])
         )
-        return GuardOutcome(
-            metadata={
-                "score": score,  # the typed GravityScore, for callers that want it
-                "level": score.level.value,
-                "gravity": score.final_gravity,
-                "critical": score.critical_override,
-                "reasons": list(score.reasons),
-            }
-        )
+        return GuardOutcome(metadata=_triage_metadata(score))
+
+    def stream(self, *, context: tuple[str, ...] = ()) -> GuardStream:
+        """Classify each completed sentence as it streams; report the first CRITICAL.
+
+        Only the RESPONSE is classified incrementally — the user's ``context``
+        is the same on every delta and is covered by the full ``inspect``.
+        """
+        return _TriageStream(self)
+
+
+@dataclass
+class _TriageStream:
+    guard: TriageGuard
+    _buf: str = ""
+    _classified: int = 0  # chars of _buf already classified
+    _done: bool = False
+
+    def feed(self, delta: str) -> GuardOutcome | None:
+        if self._done or not delta:
+            return None
+        self._buf += delta
+        end = self._cut()
+        if end <= self._classified:
+            return None
+        span, self._classified = self._buf[self._classified : end], end
+        score = self.guard.classifier.classify(self.guard.patient_context(symptoms=[span]))
+        if not (score.critical_override or score.level.value == "CRITICAL"):
+            return None
+        self._done = True
+        return GuardOutcome(metadata=_triage_metadata(score))
+
+    def _cut(self) -> int:
+        """End of the last complete sentence in the buffer (or a forced cut)."""
+        tail = self._buf[self._classified :]
+        ends = [m.end() for m in _SENTENCE_END.finditer(tail)]
+        if ends:
+            return self._classified + ends[-1]
+        if len(tail) > _MAX_UNCLASSIFIED:
+            space = tail.rfind(" ")
+            return self._classified + (space + 1 if space > 0 else len(tail))
+        return self._classified
 
 
 def triage_guard(domain: str = "psychiatry", *, name: str = "triage") -> TriageGuard:
@@ -182,12 +265,58 @@ class AntiDriftGuard:
             return GuardOutcome(metadata={"severity": "soft_drift", "matched": soft})
         return GuardOutcome()  # clean
 
+    def stream(self, *, context: tuple[str, ...] = ()) -> GuardStream:
+        """Watch a streamed response for a hard break (the retry-worthy finding).
+
+        Clarification dumps and soft drift are judged on the whole response by
+        ``inspect`` — neither is worth aborting a generation for.
+        """
+        return _BreakStream(self.break_patterns, self.reinforcement)
+
     def sanitize(self, text: str) -> str:
         """Last-resort cleanup — drop sentences with break patterns. Only call
         AFTER a retry has already failed (mirrors fi_core.persona.sanitize)."""
         return self.sanitize_fn(text, patterns=self.break_patterns)
 
 
+@dataclass
+class _BreakStream:
+    """Break patterns over a growing buffer, rescanning only a bounded tail.
+
+    Each feed searches ``buf`` from ``lookback`` chars before the previous end,
+    so a match straddling deltas is found, and accepts a match only if at least
+    one streamed char FOLLOWS it — ``\\b``, ``$`` and one-char lookaheads then
+    judge real text, not the current end of the stream ("as an ai" is not yet
+    a break: the next delta may be "d"). Exact for matches shorter than
+    ``lookback``; a longer one is still caught by ``inspect`` at the end.
+    """
+
+    patterns: list[re.Pattern[str]]
+    reinforcement: str
+    lookback: int = 256
+    _buf: str = ""
+    _done: bool = False
+
+    def feed(self, delta: str) -> GuardOutcome | None:
+        if self._done or not delta:
+            return None
+        start = max(0, len(self._buf) - self.lookback)
+        self._buf += delta
+        limit = len(self._buf) - 1  # a match must end before the last char
+        for pattern in self.patterns:
+            m = pattern.search(self._buf, start)
+            while m is not None and m.end() > limit and m.start() < limit:
+                m = pattern.search(self._buf, m.start() + 1)
+            if m is not None and m.end() <= limit:
+                self._done = True
+                return GuardOutcome(
+                    metadata={"severity": "break", "matched": [pattern.pattern]},
+                    retry=True,
+                    reinforcement=self.reinforcement,
+                )
+        return None
+
+
 def antidrift_guard(
     *,
     break_patterns: list[re.Pattern[str]],
@@ -229,6 +358,8 @@ def antidrift_guard(
 __all__ = [
     "Guard",
     "GuardOutcome",
+    "GuardStream",
+    "StreamingGuard",
     "TriageGuard",
     "AntiDriftGuard",
     "triage_guard",
@@ -26,6 +26,7 @@ caller's responsibility (out of scope — fi-runner adds no parsing dependency).
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
 
 from fi_core.rag import QuotaExceeded  # re-exported so the consumer catches it without importing fi_core
@@ -58,13 +59,26 @@ class RagStoreClient:
         chunk_size: int = 400,
         overlap: int = 50,
         min_chunk_size: int = 100,
+        batch_size: int = 32,
+        on_progress: Callable[[dict], None] | None = None,
     ) -> int:
         """Chunk + embed + persist ``text`` under ``doc_id`` in ``corpus_id``
-        (a tenant). Re-ingesting an existing ``doc_id`` replaces it. Returns the
-        chunk count."""
+        (a tenant). Re-ingesting an existing ``doc_id`` replaces it — or is a
+        no-op when its chunks are unchanged. Returns the chunk count.
+
+        Chunks are embedded ``batch_size`` at a time and written while the next
+        batch embeds; ``on_progress`` gets a plain dict ``{"stage", "total",
+        "embedded", "stored", "duplicates"}`` after chunking and after each
+        write (stage ``chunked`` / ``stored`` / ``unchanged``)."""
+        progress = None
+        if on_progress is not None:
+            def progress(p) -> None:
+                on_progress({"stage": p.stage, "total": p.total, "embedded": p.embedded, "stored": p.stored, "duplicates": p.duplicates})
+
         return await self._rag.ingest(
             corpus_id, doc_id, text, metadata=metadata, strategy=strategy,
             chunk_size=chunk_size, overlap=overlap, min_chunk_size=min_chunk_size,
+            batch_size=batch_size, on_progress=progress,
         )
 
     async def ingest_text_file(self, corpus_id: str, path: str | Path, *, doc_id: str | None = None, **kwargs) -> int:
@@ -38,7 +38,7 @@ from . import capabilities as _capabilities
 from .backend import AgentBackend, BackendError, MCPServerSpec, ToolPolicy, TurnImage, TurnResult
 from .conversation import ConversationStore, Message, render_transcript, sanitize_history
 from .flow import Event
-from .guards import Guard
+from .guards import Guard, GuardOutcome
 from .pipeline import EventSink, MutationStage, run_pipeline
 from .plan_guard import PlanGuard
 from .router import ModelRouter
@@ -47,7 +47,7 @@ from .router import ModelRouter
 # are implementation detail; consumers should import from ``fi_runner``
 # directly, not these submodules.
 from ._flow_delivery import deliver_turn_flow, drain_narrations, schedule_narration
-from ._guards_executor import guard_level as _guard_level, run_guards
+from ._guards_executor import GuardStreams, guard_level as _guard_level, run_guards
 from ._plan_events import _derive_plan_events, _PlanStreamObserver
 from ._runner_config import FlowNarrator, RetryPolicy
 
@@ -170,6 +170,12 @@ class Runner:
     # transcript and be untyped). Default None → no addendum, byte-identical to
     # before. See fi_runner.context_binding.active_corpus_binding.
     context_prompt: Callable[[Mapping[str, Any]], str | None] | None = None
+    # Incremental guard inspection in ``run_stream``: guards that implement
+    # ``stream()`` (see fi_runner.guards.StreamingGuard) see every text delta,
+    # so a break aborts the generation and retries early (attempts per
+    # ``retry_policy``) and a CRITICAL triage surfaces before the turn ends.
+    # Off by default: consumers must handle the ``retry`` stream event.
+    stream_guards: bool = False
 
     def __post_init__(self) -> None:
         # Fail fast on a misconfigured runner instead of shipping an empty system
@@ -559,9 +565,18 @@ class Runner:
         ``{"type":"result","result":TurnResult}`` once guards + post-processors
         settle. Additive: :meth:`run` is unchanged.
 
-        Single attempt (the text is already streamed, so no retry); guards run with
-        ``final=True`` so a transformational guard sanitizes the final result text
-        (the live text may differ from the sanitized final — reconcile on result).
+        Single attempt by default (the text is already streamed, so no retry);
+        guards run with ``final=True`` so a transformational guard sanitizes the
+        final result text (the live text may differ from the sanitized final —
+        reconcile on result). With ``stream_guards=True`` the streaming guards
+        inspect each delta as it lands: every finding emits
+        ``guard_early_detection`` (time_to_detection_ms, chars_streamed), and a
+        retry-worthy one (a hard break) with attempts left under the
+        :class:`RetryPolicy` ABORTS the generation, yields
+        ``{"type":"retry","data":{...}}`` (discard the live text so far) and
+        re-runs reinforced — the retry starts at detection, not after the broken
+        response finished. A CRITICAL triage signal is surfaced early but never
+        aborts: an observational guard does not cut off the reply.
         Backends without ``run_turn_stream`` fall back to one result event. Telemetry
         (turn_completed, tool_called, guard_critical) still fires via on_event; the
         flow diagram + narration are run()-only (not produced for streamed turns)."""
@@ -576,51 +591,73 @@ class Runner:
         # terminal event when ``finalize_plan`` lands.
         plan_observer = _PlanStreamObserver()
 
+        # In-stream retry exists only with incremental guards: without them a
+        # break is known after the text already shipped, so there is one attempt.
+        attempts = max(1, self.retry_policy.max_attempts) if self.stream_guards else 1
+        reinforcement = ""
+        model = setup.model
+        attempt = 0
         result: TurnResult | None = None
         try:
             if hasattr(self.backend, "run_turn_stream"):
-                async for event in self.backend.run_turn_stream(
-                    system_prompt=self._compose_system_prompt(setup.context_addendum, ""),
-                    user_message=setup.backend_message, mcp_servers=setup.mcp_servers,
-                    tool_policy=self.tool_policy, model=setup.model, session_id=setup.backend_session_id,
-                    # Same contract as run(): the kwarg exists only on image turns.
-                    **({"images": turn_images} if turn_images else {}),
-                ):
-                    if event.get("type") == "result":
-                        result = event["result"]
-                    else:
+                for attempt in range(attempts):
+                    is_last = attempt == attempts - 1
+                    watch = GuardStreams(self.guards, user_message, emit=self._emit) if self.stream_guards else None
+                    abort: tuple[str, GuardOutcome] | None = None
+                    stream = self.backend.run_turn_stream(
+                        system_prompt=self._compose_system_prompt(setup.context_addendum, reinforcement),
+                        user_message=setup.backend_message, mcp_servers=setup.mcp_servers,
+                        tool_policy=self.tool_policy, model=model, session_id=setup.backend_session_id,
+                        # Same contract as run(): the kwarg exists only on image turns.
+                        **({"images": turn_images} if turn_images else {}),
+                    )
+                    async for event in stream:
+                        if event.get("type") == "result":
+                            result = event["result"]
+                            continue
                         yield event  # tool_call / text — live, before the turn ends
-                        # Plan-first observability: when the agent calls the task_tracker
-                        # MCP, re-emit the semantic event (plan / step_started / step_done /
-                        # step_noted / plan_amended / plan_completed / plan_failed / plan_cancelled)
-                        # so the UI can paint a checklist without parsing tool names itself.
-                        # The original tool_call event still goes through above, so the
-                        # generic ThinkingPanel keeps working — these are ADDITIVE.
                         if event.get("type") == "tool_call":
-                            for derived in _derive_plan_events(
-                                event["tool"],
-                                session_id=session_id,
-                                request_id=request_id,
-                                observer=plan_observer,
+                            for derived in self._plan_stream_events(
+                                event["tool"], session_id, request_id, plan_observer
                             ):
                                 yield derived
-                                # Plan-first anti-drift: when a fresh ``plan`` event is
-                                # emitted, give the optional PlanGuard a chance to veto
-                                # before the agent fires any other tool. Rejection is
-                                # SOFT — we emit ``plan_rejected`` but do not interrupt
-                                # the stream; the consumer's turn loop (or the agent's
-                                # own logic, prompted via reinforcement) decides to abort.
-                                if derived.get("type") == "plan" and self.plan_guard is not None:
-                                    steps = (derived.get("data") or {}).get("steps") or []
-                                    outcome = self.plan_guard.inspect(steps)
-                                    if not outcome.allowed:
-                                        yield {"type": "plan_rejected", "data": {
-                                            "request_id": request_id,
-                                            "reason": outcome.reason,
-                                            "matched": list(outcome.matched),
-                                            "reinforcement": outcome.reinforcement,
-                                            "guard": self.plan_guard.name,
-                                        }}
+                        elif watch and event.get("type") == "text":
+                            for name, outcome, detection in watch.feed(event.get("text") or ""):
+                                aborting = outcome.retry and not is_last and abort is None
+                                self._emit("guard_early_detection", {
+                                    "request_id": request_id,
+                                    "guard": name,
+                                    "level": _guard_level(outcome.metadata),
+                                    "attempt": attempt + 1,
+                                    "aborted": aborting,
+                                    **detection,
+                                })
+                                if aborting:
+                                    abort = (name, outcome)
+                            if abort is not None:
+                                break
+                    if abort is None:
+                        break
+                    # A streamed break with attempts left: stop paying for the
+                    # rest of this generation and re-run reinforced (and maybe
+                    # on the fallback model) — the same move run() makes, just
+                    # before the broken response finished instead of after.
+                    aclose = getattr(stream, "aclose", None)
+                    if aclose is not None:
+                        await aclose()
+                    name, outcome = abort
+                    reinforcement = f"{reinforcement}\n\n{outcome.reinforcement}".strip()
+                    model = self.retry_policy.fallback_model or model
+                    result = None
+                    # The consumer already rendered this attempt's deltas: tell
+                    # it to discard them before the next attempt's arrive.
+                    yield {"type": "retry", "data": {
+                        "request_id": request_id,
+                        "attempt": attempt + 1,
+                        "guard": name,
+                        "level": _guard_level(outcome.metadata),
+                        "matched": list(outcome.metadata.get("matched") or ()),
+                    }}
             else:
                 # Backend can't stream → one-shot, surfaced as a single result event.
                 result = await self.backend.run_turn(
@@ -632,7 +669,7 @@ class Runner:
         except BackendError:
             raise
         except Exception as exc:  # noqa: BLE001 - boundary: any backend failure
-            self._emit("backend_error", {"backend": type(self.backend).__name__, "model": setup.model, "attempt": 1, "error": str(exc)})
+            self._emit("backend_error", {"backend": type(self.backend).__name__, "model": model, "attempt": attempt + 1, "error": str(exc)})
             raise BackendError(f"{type(self.backend).__name__} failed (stream): {exc}") from exc
 
         assert result is not None  # the backend always emits a result
@@ -651,7 +688,7 @@ class Runner:
                 result = replace(result, text=text, guard_outcomes=outcomes)
             result = await self._settle_turn(
                 result, setup,
-                model=setup.model, attempts=1, streamed=True, phase="run_stream",
+                model=model, attempts=attempt + 1, streamed=True, phase="run_stream",
                 session_id=session_id, user_message=user_message,
                 context=context, emit=self._emit,
             )
@@ -663,6 +700,42 @@ class Runner:
             })
         yield {"type": "result", "result": result}
 
+    def _plan_stream_events(
+        self,
+        tool: Any,
+        session_id: str | None,
+        request_id: str,
+        plan_observer: _PlanStreamObserver,
+    ) -> Iterable[dict[str, Any]]:
+        """Plan-first events derived from one streamed tool call.
+
+        When the agent calls the task_tracker MCP, re-emit the semantic event
+        (plan / step_started / step_done / step_noted / plan_amended /
+        plan_completed / plan_failed / plan_cancelled) so the UI can paint a
+        checklist without parsing tool names itself. The original tool_call
+        event still goes through, so the generic ThinkingPanel keeps working —
+        these are ADDITIVE."""
+        for derived in _derive_plan_events(
+            tool, session_id=session_id, request_id=request_id, observer=plan_observer
+        ):
+            yield derived
+            # Plan-first anti-drift: when a fresh ``plan`` event is emitted, give
+            # the optional PlanGuard a chance to veto before the agent fires any
+            # other tool. Rejection is SOFT — we emit ``plan_rejected`` but do
+            # not interrupt the stream; the consumer's turn loop (or the agent's
+            # own logic, prompted via reinforcement) decides to abort.
+            if derived.get("type") == "plan" and self.plan_guard is not None:
+                steps = (derived.get("data") or {}).get("steps") or []
+                outcome = self.plan_guard.inspect(steps)
+                if not outcome.allowed:
+                    yield {"type": "plan_rejected", "data": {
+                        "request_id": request_id,
+                        "reason": outcome.reason,
+                        "matched": list(outcome.matched),
+                        "reinforcement": outcome.reinforcement,
+                        "guard": self.plan_guard.name,
+                    }}
+
     async def _append_to_store(
         self,
         session_id: str | None,
@@ -104,3 +104,16 @@ def test_read_text_file(tmp_path):
     p = tmp_path / "a.md"
     p.write_text("hola mundo", encoding="utf-8")
     assert read_text_file(p) == "hola mundo"
+
+
+@pytest.mark.asyncio
+async def test_ingest_progress_is_plain_dicts(env):
+    events = []
+    rag = RagStoreClient()
+    n = await rag.ingest("t1", "d1", _DOC, batch_size=1, on_progress=events.append, **_CHUNK)
+    assert events[0]["stage"] == "chunked" and events[-1] == {
+        "stage": "stored", "total": n, "embedded": n, "stored": n, "duplicates": 0,
+    }
+    events.clear()
+    assert await rag.ingest("t1", "d1", _DOC, on_progress=events.append, **_CHUNK) == n
+    assert [e["stage"] for e in events] == ["unchanged"]  # same content: nothing re-embedded
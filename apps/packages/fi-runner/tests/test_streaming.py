@@ -7,12 +7,13 @@ a backend without run_turn_stream falls back to one result event.
 
 from __future__ import annotations
 
+import re
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import pytest
 
-from fi_runner import MutationStage, Runner, ToolCall, TurnResult, triage_guard
+from fi_runner import MutationStage, RetryPolicy, Runner, ToolCall, TurnResult, antidrift_guard, triage_guard
 
 
 @dataclass
@@ -96,3 +97,139 @@ async def test_run_stream_rejects_empty_message():
     runner = Runner(backend=_StreamBackend(), persona="p", flow_narrator=None)
     with pytest.raises(ValueError, match="user_message"):
         _ = [ev async for ev in runner.run_stream("   ")]
+
+
+# ---------------------------------------------------------------------------
+# stream_guards — incremental inspection, early abort + retry
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _TokenBackend:
+    """Streams a scripted reply per attempt, one word per delta; records how far
+    each attempt got (aborted attempts stop early) and the prompt it saw."""
+
+    replies: list[str]
+    calls: list[dict] = field(default_factory=list)
+
+    async def run_turn(self, **kwargs) -> TurnResult:  # noqa: ANN003
+        raise AssertionError("streaming backend")
+
+    async def run_turn_stream(self, *, system_prompt, model=None, **kwargs):  # noqa: ANN001, ANN003
+        call = {"system_prompt": system_prompt, "model": model, "deltas": 0, "closed": False}
+        self.calls.append(call)
+        reply = self.replies[min(len(self.calls) - 1, len(self.replies) - 1)]
+        try:
+            for word in reply.split(" "):
+                call["deltas"] += 1
+                yield {"type": "text", "text": word + " "}
+            yield {"type": "result", "result": TurnResult(text=reply)}
+        except GeneratorExit:
+            call["closed"] = True
+            raise
+
+
+_BROKEN = "Órale güey. As an AI I cannot do that " + "relleno " * 40
+_CLEAN = "Órale güey, claro que sí."
+
+
+def _antidrift():
+    return antidrift_guard(
+        break_patterns=[re.compile(r"(?i)\bas an ai\b")], reinforcement="STAY IN CHARACTER"
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_guards_abort_break_and_retry_early():
+    events, sink = _event_sink()
+    be = _TokenBackend(replies=[_BROKEN, _CLEAN])
+    runner = Runner(
+        backend=be, persona="P", guards=[_antidrift()], retry_policy=RetryPolicy(max_attempts=2),
+        stream_guards=True, on_event=sink, flow_narrator=None,
+    )
+    out = [ev async for ev in runner.run_stream("x", request_id="r1")]
+    assert len(be.calls) == 2
+    assert be.calls[0]["closed"] and be.calls[0]["deltas"] < 10  # generation cut short
+    assert "STAY IN CHARACTER" in be.calls[1]["system_prompt"]
+    retry = [ev for ev in out if ev["type"] == "retry"]
+    assert len(retry) == 1 and retry[0]["data"]["guard"] == "antidrift"
+    after = out[out.index(retry[0]) + 1 :]
+    assert "".join(ev["text"] for ev in after if ev["type"] == "text").strip() == _CLEAN
+    assert out[-1]["result"].text == _CLEAN
+    (det,) = [f for e, f in events if e == "guard_early_detection"]
+    assert det["aborted"] is True and det["level"] == "break" and det["attempt"] == 1
+    assert det["chars_streamed"] < 40 and det["time_to_detection_ms"] >= 0
+    assert [f for e, f in events if e == "turn_completed"][0]["attempts"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_guards_final_attempt_streams_through_and_sanitizes():
+    be = _TokenBackend(replies=[_BROKEN])
+    runner = Runner(backend=be, persona="P", guards=[_antidrift()], stream_guards=True, flow_narrator=None)
+    out = [ev async for ev in runner.run_stream("x")]
+    assert len(be.calls) == 1 and not be.calls[0]["closed"]  # no attempts left → no abort
+    assert not [ev for ev in out if ev["type"] == "retry"]
+    assert "As an AI" not in out[-1]["result"].text  # the settled inspect still sanitizes
+
+
+@pytest.mark.asyncio
+async def test_stream_guards_surface_critical_triage_without_aborting():
+    events, sink = _event_sink()
+    be = _TokenBackend(replies=["Entiendo. El paciente refiere plan suicida. " + "más " * 30])
+    runner = Runner(
+        backend=be, persona="P", guards=[triage_guard("psychiatry")],
+        retry_policy=RetryPolicy(max_attempts=2), stream_guards=True, on_event=sink, flow_narrator=None,
+    )
+    _ = [ev async for ev in runner.run_stream("hola")]
+    (det,) = [f for e, f in events if e == "guard_early_detection"]
+    assert det["level"] == "CRITICAL" and det["aborted"] is False
+    assert det["chars_streamed"] < 60
+    assert len(be.calls) == 1 and not be.calls[0]["closed"]
+
+
+@pytest.mark.asyncio
+async def test_stream_guards_off_keeps_single_attempt():
+    be = _TokenBackend(replies=[_BROKEN, _CLEAN])
+    runner = Runner(
+        backend=be, persona="P", guards=[_antidrift()], retry_policy=RetryPolicy(max_attempts=2),
+        flow_narrator=None,
+    )
+    out = [ev async for ev in runner.run_stream("x")]
+    assert len(be.calls) == 1 and be.calls[0]["deltas"] > 40
+    assert "As an AI" not in out[-1]["result"].text
+
+
+# ---------------------------------------------------------------------------
+# GuardStream — matcher state across chunks
+# ---------------------------------------------------------------------------
+
+
+def _feed(stream, chunks):  # noqa: ANN001
+    for i, chunk in enumerate(chunks):
+        if (outcome := stream.feed(chunk)) is not None:
+            return i, outcome
+    return None, None
+
+
+def test_break_stream_matches_across_delta_boundaries():
+    i, outcome = _feed(_antidrift().stream(), ["hola, as a", "n A", "I", " y ya"])
+    assert i == 3 and outcome.retry and outcome.reinforcement == "STAY IN CHARACTER"
+
+
+def test_break_stream_waits_for_the_word_boundary():
+    # "as an ai" followed by "d" is "as an aid" — not a break.
+    assert _feed(_antidrift().stream(), ["as an ai", "d for you", " today"]) == (None, None)
+
+
+def test_break_stream_reports_once():
+    stream = _antidrift().stream()
+    assert stream.feed("as an AI, ") is not None
+    assert stream.feed("as an AI again ") is None
+
+
+def test_triage_stream_classifies_completed_sentences():
+    stream = triage_guard("psychiatry").stream()
+    assert stream.feed("refiere plan sui") is None
+    assert stream.feed("cida estructurado") is None  # sentence still open
+    outcome = stream.feed(". Luego")
+    assert outcome is not None and outcome.metadata["level"] == "CRITICAL"
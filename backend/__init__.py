@@ -13,9 +13,21 @@ Modules:
 
 from __future__ import annotations
 
-# Repository exports (used by domain services)
-from backend.repositories.session_repository import SessionRepository
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from backend.repositories.session_repository import SessionRepository
 
 __all__ = [
     "SessionRepository",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Repository exports (used by domain services), resolved on first use so
+    # that importing any ``backend.*`` module doesn't load SQLAlchemy models.
+    if name == "SessionRepository":
+        from backend.repositories.session_repository import SessionRepository
+
+        return SessionRepository
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
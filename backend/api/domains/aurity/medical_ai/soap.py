@@ -2,6 +2,7 @@
 
 PUBLIC layer endpoints for SOAP notes management:
 - GET /soap/sessions/{session_id} - Get SOAP note data
+- GET /soap/sessions/{session_id}/events - Stream SOAP sections as they are generated (SSE)
 - PUT /soap/sessions/{session_id} - Update SOAP note (triggers order creation)
 - POST /soap/sessions/{session_id}/assistant - Natural language SOAP modification
 
@@ -14,9 +15,14 @@ Created: 2026-02-03 (Domain Migration from routers/soap/soap.py)
 
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+from collections.abc import AsyncGenerator
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 
 from backend.api.audit.dependencies import DIAuditService, get_audit_service
 from backend.clients.dependencies import get_llm_client_dep
@@ -118,6 +124,57 @@ async def get_soap_workflow(
         ) from e
 
 
+SOAP_EVENTS_POLL_SECONDS = 0.5
+SOAP_EVENTS_TIMEOUT_SECONDS = 300
+
+
+@router.get("/sessions/{session_id}/events")
+async def stream_soap_sections(
+    session_id: str,
+    task_repo: ITaskRepository = Depends(get_task_repository),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream SOAP sections as the worker persists them (PUBLIC endpoint, SSE).
+
+    Emits one ``section`` event per finished section (``{section, content}``),
+    then a ``status`` event (``completed`` / ``failed`` / ``timeout``) and closes.
+    Sections come from the partial note the SOAP worker saves after each one.
+
+    Raises:
+        400: Invalid session_id
+    """
+    validate_session_id(session_id)
+    validate_session_access(session_id, current_user, action="view SOAP notes")
+
+    async def events() -> AsyncGenerator[str]:
+        sent: set[str] = set()
+        deadline = time.monotonic() + SOAP_EVENTS_TIMEOUT_SECONDS
+        while True:
+            metadata = (
+                await asyncio.to_thread(task_repo.get_task_metadata, session_id, "SOAP_GENERATION")
+                or {}
+            )
+            done = [s for s in metadata.get("sections_completed") or [] if s not in sent]
+            if done:
+                note = await asyncio.to_thread(task_repo.get_soap_data, session_id) or {}
+                for section in done:
+                    if section in note:
+                        sent.add(section)
+                        payload = {"section": section, "content": note[section]}
+                        yield f"event: section\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+            status_value = str(metadata.get("status", "")).lower()
+            if status_value in ("completed", "failed") or time.monotonic() > deadline:
+                final = status_value if status_value in ("completed", "failed") else "timeout"
+                payload = {"status": final, "error": metadata.get("error")}
+                yield f"event: status\ndata: {json.dumps(payload)}\n\n"
+                return
+            await asyncio.sleep(SOAP_EVENTS_POLL_SECONDS)
+
+    logger.info("SOAP_EVENTS_STREAM_STARTED", session_id=session_id)
+    return StreamingResponse(events(), media_type="text/event-stream; charset=utf-8")
+
+
 @router.put(
     "/sessions/{session_id}",
     status_code=status.HTTP_200_OK,
@@ -9,30 +9,33 @@ Usage:
     app.include_router(aurity_router, prefix="/api")
     app.openapi_tags = tags_metadata
 
+The domain table (``DOMAIN_ROUTERS``) is plain data so the app can mount
+each domain lazily (see ``backend/app/lazy_routers.py``); ``aurity_router``
+is only built - importing every domain - when something asks for it.
+
 Oceanic API Restructure - Phase 5 (Hadopelágica) Complete.
 Legacy /api/workflows/aurity/* routes removed. 94 endpoints total.
 """
 
 from __future__ import annotations
 
+import importlib
+from typing import NamedTuple
+
 from fastapi import APIRouter
 
-from backend.api.domains.aurity import (
-    assistant,
-    checkin,
-    clinic,
-    knowledge_base,
-    medical_ai,
-    patients,
-    prescriptions,
-    providers,
-    system,
-    timeline,
-    transcription,
-)
-
-# Router with app namespace
-aurity_router = APIRouter(prefix="/aurity")
+AURITY_PREFIX = "/aurity"
+
+
+class DomainRouter(NamedTuple):
+    """One AURITY domain: module exposing ``router``, include prefix, tags, and
+    the URL prefix (relative to ``AURITY_PREFIX``) its routes live under."""
+
+    module: str
+    prefix: str
+    tags: list[str]
+    path_prefix: str
+
 
 # OpenAPI tags metadata for Swagger UI grouping
 tags_metadata = [
@@ -86,88 +89,58 @@ tags_metadata = [
 # Domain Routers - Phase 2 (Mesopelágica) Complete
 # =============================================================================
 
-# Medical AI - Core workflow endpoints
-# Includes: workflows, monitor, diarization, audio, transcription_sources, audit
-aurity_router.include_router(
-    medical_ai.router,
-    prefix="/medical-ai",
-    tags=["Medical AI"],
-)
-
-# Transcription - Audio streaming and job management
-# Includes: stream, jobs, end-session, chunks
-aurity_router.include_router(
-    transcription.router,
-    prefix="/transcription",
-    tags=["Transcription"],
-)
-
-# Prescriptions - Medication catalog and safety checks
-# Includes: templates, prescriptions, catalog, interactions, allergies, safety
-# Note: Router already has /prescriptions prefix
-aurity_router.include_router(
-    prescriptions.router,
-    tags=["Prescriptions"],
-)
-
-# Clinic - Clinic management and waiting room
-# Includes: waiting_room, widgets (partial - management, media, tv_content pending)
-aurity_router.include_router(
-    clinic.router,
-    prefix="/clinic",
-    tags=["Clinic"],
-)
-
-# Assistant - AI chat with personas
-# Includes: chat, stream, introduction, history
-aurity_router.include_router(
-    assistant.router,
-    prefix="/assistant",
-    tags=["Assistant"],
-)
-
-# Timeline - Session history (re-exported from legacy)
-# Includes: sessions list, session detail
-aurity_router.include_router(
-    timeline.router,
-    tags=["Timeline"],  # Router already has /timeline prefix
-)
-
-# Knowledge Base - Document management (placeholder)
-# Note: Legacy has import issues - routes will be added in Phase 3
-aurity_router.include_router(
-    knowledge_base.router,
-    prefix="/knowledge-base",
-    tags=["Knowledge Base"],
-)
-
-# System - Infrastructure endpoints (re-exported from legacy)
-# Includes: disk-usage, llm-status, clear-memory
-aurity_router.include_router(
-    system.router,
-    tags=["System"],  # Router already has /system prefix
-)
-
-# Check-in - Patient self-service check-in (FI Receptionist)
-# Includes: QR generation, session management, identification, actions, waiting room
-# Note: Router already has /checkin prefix
-aurity_router.include_router(
-    checkin.router,
-    tags=["Check-in"],
-)
-
-# Patients - Patient record management
-# Includes: CRUD operations, CURP validation
-# Note: Router already has /patients prefix
-aurity_router.include_router(
-    patients.router,
-    tags=["Patients"],
-)
-
-# Providers - Healthcare provider management
-# Includes: CRUD operations, license validation
-# Note: Router already has /providers prefix
-aurity_router.include_router(
-    providers.router,
-    tags=["Providers"],
-)
+DOMAIN_ROUTERS: list[DomainRouter] = [
+    # Medical AI - Core workflow endpoints
+    # Includes: workflows, monitor, diarization, audio, transcription_sources, audit
+    DomainRouter("backend.api.domains.aurity.medical_ai", "/medical-ai", ["Medical AI"], "/medical-ai"),
+    # Transcription - Audio streaming and job management
+    # Includes: stream, jobs, end-session, chunks
+    DomainRouter(
+        "backend.api.domains.aurity.transcription", "/transcription", ["Transcription"], "/transcription"
+    ),
+    # Prescriptions - Medication catalog and safety checks (loads drug catalogs)
+    # Includes: templates, prescriptions, catalog, interactions, allergies, safety
+    # Note: Router already has /prescriptions prefix
+    DomainRouter("backend.api.domains.aurity.prescriptions", "", ["Prescriptions"], "/prescriptions"),
+    # Clinic - Clinic management and waiting room
+    # Includes: waiting_room, widgets (partial - management, media, tv_content pending)
+    DomainRouter("backend.api.domains.aurity.clinic", "/clinic", ["Clinic"], "/clinic"),
+    # Assistant - AI chat with personas
+    # Includes: chat, stream, introduction, history
+    DomainRouter("backend.api.domains.aurity.assistant", "/assistant", ["Assistant"], "/assistant"),
+    # Timeline - Session history (router already has /timeline prefix)
+    DomainRouter("backend.api.domains.aurity.timeline", "", ["Timeline"], "/timeline"),
+    # Knowledge Base - Document management
+    DomainRouter(
+        "backend.api.domains.aurity.knowledge_base", "/knowledge-base", ["Knowledge Base"], "/knowledge-base"
+    ),
+    # System - Infrastructure endpoints (router already has /system prefix)
+    # Includes: disk-usage, llm-status, clear-memory
+    DomainRouter("backend.api.domains.aurity.system", "", ["System"], "/system"),
+    # Check-in - Patient self-service check-in (FI Receptionist)
+    # Includes: QR generation, session management, identification, actions, waiting room
+    # Note: Router already has /checkin prefix
+    DomainRouter("backend.api.domains.aurity.checkin", "", ["Check-in"], "/checkin"),
+    # Patients - CRUD operations, CURP validation (router already has /patients prefix)
+    DomainRouter("backend.api.domains.aurity.patients", "", ["Patients"], "/patients"),
+    # Providers - CRUD operations, license validation (router already has /providers prefix)
+    DomainRouter("backend.api.domains.aurity.providers", "", ["Providers"], "/providers"),
+]
+
+
+def build_aurity_router() -> APIRouter:
+    """Eagerly import every domain and aggregate it under ``/aurity``."""
+    router = APIRouter(prefix=AURITY_PREFIX)
+    for domain in DOMAIN_ROUTERS:
+        module = importlib.import_module(domain.module)
+        router.include_router(module.router, prefix=domain.prefix, tags=domain.tags)
+    return router
+
+
+def __getattr__(name: str) -> APIRouter:
+    # Backwards compatible ``from ...router import aurity_router`` (eager).
+    if name == "aurity_router":
+        router = build_aurity_router()
+        globals()["aurity_router"] = router
+        return router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
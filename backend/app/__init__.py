@@ -2,7 +2,21 @@
 
 from __future__ import annotations
 
-from backend.app.main import app, create_app
+from typing import TYPE_CHECKING, Any
+
 from backend.app.version import __version__
 
+if TYPE_CHECKING:
+    from backend.app.main import app, create_app
+
 __all__ = ["__version__", "app", "create_app"]
+
+
+def __getattr__(name: str) -> Any:
+    # ``app`` is built at import of backend.app.main; resolve it on first use so
+    # importing a helper module (lazy_routers, startup_profile) doesn't build it.
+    if name in ("app", "create_app"):
+        from backend.app import main
+
+        return getattr(main, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
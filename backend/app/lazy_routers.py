@@ -0,0 +1,177 @@
+"""Lazy router mounting for cold-start-sensitive deployments.
+
+Importing every domain router at startup pulls in most of the backend
+(repositories, SQLAlchemy models, prescription catalogs, LLM clients) before
+the container can answer its first probe. On Azure Container Apps
+scale-from-zero that import time IS the cold start.
+
+A ``LazyRouterSpec`` names a router by import path and the URL prefix it
+serves. ``LazyRouterLoader`` imports it on the first request whose path falls
+under that prefix (or on the first OpenAPI/docs request, which needs all of
+them), includes it into the target app, and drops the cached OpenAPI schema.
+After that the request is routed normally.
+
+Controls:
+  LAZY_ROUTERS=false           Eager mounting (previous behaviour)
+  LAZY_ROUTERS_PRELOAD=true    Import everything in the background right
+                               after startup (fast probe, warm first request)
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from backend.utils.common.logging.logger import get_logger
+from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = get_logger(__name__)
+
+
+def lazy_routers_enabled() -> bool:
+    """Whether routers registered through the loader are mounted lazily."""
+    return os.getenv("LAZY_ROUTERS", "true").lower() in ("true", "1", "yes")
+
+
+def lazy_routers_preload() -> bool:
+    """Whether lazy routers are warmed in the background after startup."""
+    return os.getenv("LAZY_ROUTERS_PRELOAD", "false").lower() in ("true", "1", "yes")
+
+
+@dataclass
+class LazyRouterSpec:
+    """A router to include on demand.
+
+    Attributes:
+        module: Dotted module path that defines the router
+        path_prefix: URL prefix (inside the target app) the router serves;
+            requests under it trigger the import
+        include_prefix: ``prefix=`` passed to ``include_router``
+        tags: ``tags=`` passed to ``include_router``
+        attr: Router attribute on the module
+    """
+
+    module: str
+    path_prefix: str
+    include_prefix: str = ""
+    tags: list[str] = field(default_factory=list)
+    attr: str = "router"
+
+    def matches(self, path: str) -> bool:
+        return path == self.path_prefix or path.startswith(self.path_prefix + "/")
+
+
+class LazyRouterLoader:
+    """Imports and includes ``LazyRouterSpec`` routers into ``target`` on demand."""
+
+    def __init__(self, target: FastAPI, specs: list[LazyRouterSpec]) -> None:
+        self.target = target
+        self.pending: list[LazyRouterSpec] = list(specs)
+        self.loaded: dict[str, float] = {}  # module -> import+include time (ms)
+        self._lock = asyncio.Lock()
+
+    def specs_for(self, path: str) -> list[LazyRouterSpec]:
+        """Pending specs that must be loaded before ``path`` can be routed."""
+        if path in self._docs_paths():
+            return list(self.pending)
+        return [spec for spec in self.pending if spec.matches(path)]
+
+    async def ensure(self, specs: list[LazyRouterSpec]) -> None:
+        """Load ``specs`` (once), importing off the event loop."""
+        if not specs:
+            return
+        async with self._lock:
+            for spec in specs:
+                if spec not in self.pending:
+                    continue  # Loaded by a concurrent request
+                start = time.perf_counter()
+                try:
+                    module = await run_in_threadpool(importlib.import_module, spec.module)
+                    self._include(spec, getattr(module, spec.attr))
+                except Exception as e:
+                    logger.error(
+                        "LAZY_ROUTER_LOAD_FAILED", module=spec.module, error=str(e), exc_info=True
+                    )
+                    raise
+                self._mark_loaded(spec, start)
+
+    async def load_all(self) -> None:
+        """Load every pending router (background preload)."""
+        await self.ensure(list(self.pending))
+
+    def load_all_sync(self) -> None:
+        """Eagerly import and include every router (LAZY_ROUTERS=false)."""
+        for spec in list(self.pending):
+            start = time.perf_counter()
+            module = importlib.import_module(spec.module)
+            self._include(spec, getattr(module, spec.attr))
+            self._mark_loaded(spec, start)
+
+    def _include(self, spec: LazyRouterSpec, router: Any) -> None:
+        self.target.include_router(router, prefix=spec.include_prefix, tags=list(spec.tags) or None)
+        self.target.openapi_schema = None  # Regenerate with the new routes
+
+    def _mark_loaded(self, spec: LazyRouterSpec, start: float) -> None:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.pending.remove(spec)
+        self.loaded[spec.module] = round(elapsed_ms, 1)
+        logger.info(
+            "LAZY_ROUTER_LOADED",
+            module=spec.module,
+            path_prefix=spec.path_prefix,
+            elapsed_ms=round(elapsed_ms, 1),
+            remaining=len(self.pending),
+        )
+
+    def _docs_paths(self) -> set[str]:
+        return {
+            p
+            for p in (self.target.openapi_url, self.target.docs_url, self.target.redoc_url)
+            if p
+        }
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware that loads pending routers before routing a request."""
+
+    def __init__(self, app: ASGIApp, loader: LazyRouterLoader) -> None:
+        self.app = app
+        self.loader = loader
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in ("http", "websocket") and self.loader.pending:
+            await self.loader.ensure(self.loader.specs_for(_route_path(scope)))
+        await self.app(scope, receive, send)
+
+
+def register_lazy_routers(target: FastAPI, specs: list[LazyRouterSpec]) -> LazyRouterLoader:
+    """Attach ``specs`` to ``target``: lazily by default, eagerly if disabled.
+
+    Returns:
+        The loader (also stored on ``target.state.lazy_routers``)
+    """
+    loader = LazyRouterLoader(target, specs)
+    if lazy_routers_enabled():
+        target.add_middleware(LazyRouterMiddleware, loader=loader)
+    else:
+        loader.load_all_sync()
+    target.state.lazy_routers = loader
+    return loader
+
+
+def _route_path(scope: Scope) -> str:
+    """Path relative to the app's mount point (mirrors Starlette routing)."""
+    path: str = scope["path"]
+    root_path: str = scope.get("root_path", "")
+    if root_path and path.startswith(root_path):
+        return path[len(root_path):] or "/"
+    return path
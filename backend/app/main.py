@@ -16,6 +16,7 @@ from contextlib import asynccontextmanager
 import sys
 
 import os
+from backend.app.startup_profile import startup_profiler
 from backend.middleware.idempotency import IdempotencyMiddleware
 from backend.middleware.internal_only import InternalOnlyMiddleware
 from backend.middleware.tracing import TracingMiddleware
@@ -33,15 +34,17 @@ async def lifespan(app: FastAPI):
     from backend.utils.coder.observability.logger import get_logger
 
     # P1: Validate all Pydantic configs FIRST (fail-fast on invalid config)
-    validate_all_configs()
+    with startup_profiler.step("lifespan.validate_configs"):
+        validate_all_configs()
 
     # Configure structured JSON logging for chat observability
-    try:
-        from backend.observability.logging import setup_json_logging
+    with startup_profiler.step("lifespan.json_logging"):
+        try:
+            from backend.observability.logging import setup_json_logging
 
-        setup_json_logging()
-    except Exception:
-        pass
+            setup_json_logging()
+        except Exception:
+            pass
 
     logger = get_logger(__name__)
     try:
@@ -52,13 +55,14 @@ async def lifespan(app: FastAPI):
         # Don't fail startup - continue with other services
 
     # Verify Event Bus is accessible (Phase 2.3 Plutón - direct instantiation)
-    try:
-        from backend.utils.common.event_bus import InMemoryEventBus
-        _ = InMemoryEventBus()  # Verify EventBus can be instantiated
-        logger.info("EVENT_BUS_READY", implementation="InMemoryEventBus", status="available")
-    except Exception as e:
-        logger.warning("EVENT_BUS_VERIFICATION_FAILED", error=str(e))
-        # Don't fail startup - services will handle missing event bus gracefully
+    with startup_profiler.step("lifespan.event_bus"):
+        try:
+            from backend.utils.common.event_bus import InMemoryEventBus
+            _ = InMemoryEventBus()  # Verify EventBus can be instantiated
+            logger.info("EVENT_BUS_READY", implementation="InMemoryEventBus", status="available")
+        except Exception as e:
+            logger.warning("EVENT_BUS_VERIFICATION_FAILED", error=str(e))
+            # Don't fail startup - services will handle missing event bus gracefully
 
     # Warmup Ollama model (pre-load into VRAM for faster first request)
     # This runs in background to not block startup
@@ -95,15 +99,26 @@ async def lifespan(app: FastAPI):
     asyncio.create_task(warmup_ollama())
 
     # Initialize repository singletons (HDF5-backed, thread-safe)
-    from backend.infrastructure.common.repository_singletons import (
-        init_repositories,
-        shutdown_repositories,
-    )
-    try:
-        init_repositories()
-        logger.info("REPOSITORIES_INITIALIZED", status="success")
-    except Exception as e:
-        logger.warning("REPOSITORIES_INIT_FAILED", error=str(e))
+    with startup_profiler.step("lifespan.repositories"):
+        from backend.infrastructure.common.repository_singletons import (
+            init_repositories,
+            shutdown_repositories,
+        )
+        try:
+            init_repositories()
+            logger.info("REPOSITORIES_INITIALIZED", status="success")
+        except Exception as e:
+            logger.warning("REPOSITORIES_INIT_FAILED", error=str(e))
+
+    # Lazy domain routers: optionally warm them in the background so the first
+    # request to each prefix doesn't pay its import
+    from backend.app.lazy_routers import lazy_routers_preload
+
+    lazy_loader = getattr(app.state, "lazy_routers", None)
+    if lazy_loader is not None and lazy_loader.pending and lazy_routers_preload():
+        asyncio.create_task(lazy_loader.load_all())
+
+    startup_profiler.log()
 
     yield
 
@@ -424,10 +439,12 @@ Requires environment variables:
 
     # Register all API routers (extracted to routers.py for maintainability)
     try:
-        from backend.app.routers import init_observability, register_routers
+        with startup_profiler.step("create_app.routers"):
+            from backend.app.routers import init_observability, register_routers
 
-        init_observability()
-        register_routers(public_app, internal_app)
+            init_observability()
+            register_routers(public_app, internal_app)
+            app.state.lazy_routers = getattr(public_app.state, "lazy_routers", None)
 
         # Mount sub-apps
         app.mount("/api", public_app)
@@ -484,8 +501,9 @@ Requires environment variables:
 
     # Include system routes on main app for root-level access (/health, /version, /llm/health)
     # Note: These also exist on public_app for /api/* paths
-    from backend.app.system_routes import get_api_info
-    from backend.app.system_routes import router as system_router_app
+    with startup_profiler.step("create_app.system_routes"):
+        from backend.app.system_routes import get_api_info
+        from backend.app.system_routes import router as system_router_app
 
     @app.get("/")
     async def root() -> dict:
@@ -495,9 +513,10 @@ Requires environment variables:
     app.include_router(system_router_app)
 
     # P2: Prometheus metrics endpoint for observability
-    from backend.utils.metrics import setup_metrics_endpoint
+    with startup_profiler.step("create_app.metrics"):
+        from backend.utils.metrics import setup_metrics_endpoint
 
-    setup_metrics_endpoint(app)
+        setup_metrics_endpoint(app)
 
     # Mount static files (for demo audio, etc.)
     # Note: StaticFiles mounted on main app (not sub-apps) to avoid CORS complexity
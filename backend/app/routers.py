@@ -3,14 +3,112 @@
 Centralizes all router imports and registrations to keep main.py focused
 on app configuration and middleware setup.
 
+Routers whose URLs live under a unique prefix are registered as
+``LazyRouterSpec`` entries: they are imported on the first request under
+that prefix instead of at startup (see ``backend/app/lazy_routers.py``).
+Only routers that must answer immediately (auth, health, policy) or that
+share the root prefix are still imported eagerly.
+
 Author: Bernard Uriza Orozco
 Created: 2026-01-06
 """
 
 from __future__ import annotations
 
+from backend.app.lazy_routers import LazyRouterSpec, register_lazy_routers
 from fastapi import FastAPI
 
+# =============================================================================
+# PUBLIC API (CORS enabled, non-AURITY routes) - mounted lazily
+# =============================================================================
+
+PUBLIC_LAZY_ROUTERS: list[LazyRouterSpec] = [
+    # Audit logs (FI-UI-FEAT-206)
+    LazyRouterSpec("backend.api.audit.api.public.audit", "/audit", "/audit", ["Audit"]),
+    # Text-to-Speech (Azure OpenAI)
+    LazyRouterSpec("backend.services.tts.api.public.tts", "/tts"),
+    # Stripe Payments (FI-CHECKIN-002)
+    LazyRouterSpec("backend.api.payment.api.public.payments", "/payments"),
+    # SMS/Email Notifications (FI-CHECKIN-003)
+    LazyRouterSpec("backend.infrastructure.common.api.public.notifications", "/notifications"),
+    # LLM Models Admin (superadmin CRUD)
+    LazyRouterSpec(
+        "backend.infrastructure.model_catalog.api.public.llm_models_admin", "/admin/llm-models"
+    ),
+    # Model Catalog
+    LazyRouterSpec("backend.infrastructure.model_catalog.api.public.catalog_admin", "/admin/catalog"),
+    # System Resources Monitor
+    LazyRouterSpec(
+        "backend.infrastructure.system.api.public.system_resources", "/admin/system"
+    ),
+    # LLM Observability (FI Edge Monitor)
+    LazyRouterSpec("backend.infrastructure.observability.api", "/api/observability"),
+    # License renewal API
+    LazyRouterSpec("backend.api.license.api.public", "/licenses"),
+    # License generation (superadmin)
+    LazyRouterSpec("backend.api.license.api.internal", "/admin/licenses"),
+    # GitHub release proxy (private repo)
+    LazyRouterSpec("backend.api.downloads.api.public", "/downloads"),
+]
+
+# =============================================================================
+# INTERNAL API (atomic resources, AURITY-only) - mounted lazily
+# =============================================================================
+
+INTERNAL_LAZY_ROUTERS: list[LazyRouterSpec] = [
+    LazyRouterSpec("backend.api.audit.api.internal.audit", "/audit", "/audit", ["audit"]),
+    LazyRouterSpec(
+        "backend.infrastructure.transcription.api.internal",
+        "/diarization",
+        "/diarization",
+        ["diarization"],
+        attr="diarization_router",
+    ),
+    LazyRouterSpec(
+        "backend.infrastructure.common.api.internal.exports", "/exports", "/exports", ["exports"]
+    ),
+    # verify-hash compatibility
+    LazyRouterSpec("backend.services.timeline.api.internal.timeline", "/timeline"),
+    LazyRouterSpec("backend.infrastructure.kpi.api.internal.router", "/kpis", "/kpis", ["kpis"]),
+    LazyRouterSpec(
+        "backend.infrastructure.session.api.internal",
+        "/sessions",
+        "/sessions",
+        ["sessions"],
+        attr="sessions_router",
+    ),
+    # Session finalization + encryption + diarization (routes under /sessions/*)
+    LazyRouterSpec(
+        "backend.infrastructure.session.api.internal",
+        "/sessions",
+        "",
+        ["sessions-finalize"],
+        attr="finalize_router",
+    ),
+    LazyRouterSpec(
+        "backend.infrastructure.workflow.api.internal",
+        "/triage",
+        "/triage",
+        ["triage"],
+        attr="triage_router",
+    ),
+    LazyRouterSpec(
+        "backend.infrastructure.transcription.api.internal",
+        "/transcribe",
+        "/transcribe",
+        ["transcribe"],
+        attr="transcribe_router",
+    ),
+    # Ultra observable LLM layer
+    LazyRouterSpec("backend.infrastructure.llm.api.internal", "/llm"),
+    # Admin user management
+    LazyRouterSpec("backend.api.admin.api.internal.admin.users", "/admin/users", "", ["admin"]),
+    # FI Coder task orchestrator
+    LazyRouterSpec(
+        "backend.utils.coder.api.internal.fi_coder", "/fi_coder", "/fi_coder", ["fi_coder"]
+    ),
+]
+
 
 def register_routers(public_app: FastAPI, internal_app: FastAPI) -> None:
     """Register all API routers on public and internal sub-apps.
@@ -23,100 +121,30 @@ def register_routers(public_app: FastAPI, internal_app: FastAPI) -> None:
         ImportError: If a required router module cannot be imported
     """
     # =========================================================================
-    # Router Imports (lazy loaded to avoid circular imports)
+    # Eager Router Imports (lazy loaded to avoid circular imports)
     # =========================================================================
 
-    # Admin & Auth
     # System Routes
     from backend.app.system_routes import router as system_router
-    from backend.api.admin.api.internal.admin.users import router as users_router
 
-    # NOTE: Assistant routers moved to aurity_router (backend.api.domains.aurity.assistant)
-
-    # Audit
-    from backend.api.audit.api.internal.audit import router as internal_audit_router
-    from backend.api.audit.api.public import audit
+    # Auth
     from backend.infrastructure.auth.adapters.fastapi_adapter import auth_router
 
-    # Payments
-    # NOTE: checkin router moved to aurity_router (backend.api.domains.aurity.checkin)
-    # NOTE: clinics router moved to aurity_router (backend.api.domains.aurity.clinic)
-
-    # Coder
-    from backend.utils.coder.api.internal.fi_coder import router as fi_coder_router
-
-    # Common
-    from backend.infrastructure.common.api.internal.exports import router as exports_router
-    from backend.infrastructure.common.api.public import notifications
-
-    # KPIs (migrated to infrastructure/)
-    from backend.infrastructure.kpi.api.internal.router import router as kpis_router
-
-    # Downloads (GitHub release proxy for private repo)
-    from backend.api.downloads.api.public import router as downloads_router
-
-    # Licensing
-    from backend.api.license.api.internal import router as licenses_admin_router
-    from backend.api.license.api.public import router as licenses_router
-
-    # LLM
-    from backend.infrastructure.llm.api.internal import router as llm_router
-    from backend.infrastructure.model_catalog.api.public.llm_models_admin import (
-        router as llm_models_admin_router,
-    )
-
-    # Model Catalog
-    from backend.infrastructure.model_catalog.api.public import catalog_admin
-
-    # Observability
-    from backend.infrastructure.observability.api import router as observability_router
-
-    # Providers & Payments
-    # NOTE: patients router moved to aurity_router (backend.api.domains.aurity.patients)
-    from backend.api.payment.api.public import payments
-
     # Policy
     from backend.api.policy.api.public import policy
-    # NOTE: providers router moved to aurity_router (backend.api.domains.aurity.providers)
-
-    # Sessions (migrated to infrastructure/)
-    from backend.infrastructure.session.api.internal import (
-        sessions_router,
-        finalize_router as sessions_finalize_router,
-    )
-
-    # System Resources
-    from backend.infrastructure.system.api.public import system_resources
-    # NOTE: system_info_router moved to aurity_router (backend.api.domains.aurity.system)
-
-    # Timeline
-    from backend.services.timeline.api.internal.timeline import router as timeline_internal_router
-    # NOTE: timeline public router moved to aurity_router (backend.api.domains.aurity.timeline)
-
-    # Transcription & Diarization (migrated to infrastructure/)
-    from backend.infrastructure.transcription.api.internal import (
-        diarization_router,
-        transcribe_router,
-    )
-
-    # TTS
-    from backend.services.tts.api.public import tts
-    # NOTE: user_clinic router moved to aurity_router (backend.api.domains.aurity.clinic.user_clinic)
-
-    # Triage (migrated to infrastructure/)
-    from backend.infrastructure.workflow.api.internal import triage_router
 
     # NOTE: public_workflows_router removed - replaced by aurity_router
 
     # =========================================================================
     # AURITY Domain API (Phase 3 - Batipelágica)
     # All AURITY-specific routes consolidated under /api/aurity/*
+    # Domains are mounted lazily: each is imported on the first request under
+    # its prefix (LAZY_ROUTERS=false restores eager import at startup).
     # =========================================================================
-    from backend.api.domains.aurity.router import aurity_router, tags_metadata
+    from backend.api.domains.aurity.router import tags_metadata
 
     # FIXED: Don't add "/api" prefix since public_app is already mounted at "/api"
-    # The aurity_router has prefix="/aurity" internally, resulting in /api/aurity/*
-    public_app.include_router(aurity_router)
+    # Domain prefixes start with /aurity, resulting in /api/aurity/*
     public_app.openapi_tags = tags_metadata
 
     # =========================================================================
@@ -124,46 +152,31 @@ def register_routers(public_app: FastAPI, internal_app: FastAPI) -> None:
     # =========================================================================
 
     public_app.include_router(auth_router)  # JWT Authentication
-    # NOTE: patients.router removed - now in aurity_router at /api/aurity/patients/*
-    # NOTE: providers.router removed - now in aurity_router at /api/aurity/providers/*
-    public_app.include_router(
-        audit.router, prefix="/audit", tags=["Audit"]
-    )  # Audit logs (FI-UI-FEAT-206)
+    # NOTE: patients/providers/checkin/user_clinic now in aurity domains (/api/aurity/*)
     public_app.include_router(policy.router)  # Policy viewer (FI-UI-FEAT-204)
-    public_app.include_router(tts.router)  # Text-to-Speech (Azure OpenAI)
-    # NOTE: checkin.router removed - now in aurity_router at /api/aurity/checkin/*
-    public_app.include_router(payments.router)  # Stripe Payments (FI-CHECKIN-002)
-    # NOTE: user_clinic.router removed - now in aurity_router at /api/aurity/clinic/users/me/*
-    public_app.include_router(notifications.router)  # SMS/Email Notifications (FI-CHECKIN-003)
-    public_app.include_router(llm_models_admin_router)  # LLM Models Admin (superadmin CRUD)
-    public_app.include_router(catalog_admin.router)  # Model Catalog
-    public_app.include_router(system_resources.router)  # System Resources Monitor
-    public_app.include_router(observability_router)  # LLM Observability (FI Edge Monitor)
-    public_app.include_router(licenses_router)  # License renewal API
-    public_app.include_router(licenses_admin_router)  # License generation (superadmin)
-    public_app.include_router(downloads_router)  # GitHub release proxy (private repo)
     public_app.include_router(system_router)  # Health, version, root endpoints
+    register_lazy_routers(public_app, aurity_lazy_specs() + PUBLIC_LAZY_ROUTERS)
 
     # =========================================================================
     # INTERNAL API Registration (atomic resources, AURITY-only)
     # =========================================================================
 
-    internal_app.include_router(internal_audit_router, prefix="/audit", tags=["audit"])
-    internal_app.include_router(diarization_router, prefix="/diarization", tags=["diarization"])
-    internal_app.include_router(exports_router, prefix="/exports", tags=["exports"])
-    internal_app.include_router(timeline_internal_router)  # verify-hash compatibility
-    internal_app.include_router(kpis_router, prefix="/kpis", tags=["kpis"])
-    internal_app.include_router(sessions_router, prefix="/sessions", tags=["sessions"])
-    internal_app.include_router(
-        sessions_finalize_router, prefix="", tags=["sessions-finalize"]
-    )  # Session finalization + encryption + diarization
-    internal_app.include_router(triage_router, prefix="/triage", tags=["triage"])
-    internal_app.include_router(transcribe_router, prefix="/transcribe", tags=["transcribe"])
-    internal_app.include_router(llm_router)  # Ultra observable LLM layer
-    internal_app.include_router(users_router, tags=["admin"])  # Admin user management
-    internal_app.include_router(
-        fi_coder_router, prefix="/fi_coder", tags=["fi_coder"]
-    )  # FI Coder task orchestrator
+    register_lazy_routers(internal_app, INTERNAL_LAZY_ROUTERS)
+
+
+def aurity_lazy_specs() -> list[LazyRouterSpec]:
+    """AURITY domain routers as lazy specs (no domain module is imported)."""
+    from backend.api.domains.aurity.router import AURITY_PREFIX, DOMAIN_ROUTERS
+
+    return [
+        LazyRouterSpec(
+            module=domain.module,
+            path_prefix=AURITY_PREFIX + domain.path_prefix,
+            include_prefix=AURITY_PREFIX + domain.prefix,
+            tags=list(domain.tags),
+        )
+        for domain in DOMAIN_ROUTERS
+    ]
 
 
 def init_observability() -> None:
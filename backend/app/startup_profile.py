@@ -0,0 +1,142 @@
+"""Startup profiling: per-step timings and per-module import times.
+
+Enable with ``STARTUP_PROFILE=true``. ``create_app`` and ``lifespan`` wrap
+their phases in ``startup_profiler.step(...)``; when startup completes the
+profiler logs one ``STARTUP_PROFILE`` event with every step's duration.
+
+Per-module import time comes from CPython's own ``-X importtime`` output
+(the only way to see imports that happen before any backend code runs,
+e.g. ``backend/__init__``). ``parse_importtime`` turns that stderr dump into
+``ImportTiming`` rows; ``backend/scripts/bench_startup.py`` runs a cold
+interpreter with it and enforces a cold-start budget in CI.
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+def startup_profile_enabled() -> bool:
+    return os.getenv("STARTUP_PROFILE", "false").lower() in ("true", "1", "yes")
+
+
+@dataclass
+class StepTiming:
+    name: str
+    elapsed_ms: float
+
+
+@dataclass
+class ImportTiming:
+    """One ``-X importtime`` row (microseconds converted to ms)."""
+
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+
+
+@dataclass
+class StartupProfiler:
+    """Collects named step durations across create_app and lifespan."""
+
+    enabled: bool = field(default_factory=startup_profile_enabled)
+    steps: list[StepTiming] = field(default_factory=list)
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.steps.append(StepTiming(name, round((time.perf_counter() - start) * 1000, 2)))
+
+    def report(self) -> dict[str, Any]:
+        return {
+            "steps": [asdict(s) for s in self.steps],
+            "total_ms": round(sum(s.elapsed_ms for s in self.steps), 2),
+        }
+
+    def log(self) -> None:
+        """Emit the collected steps as one structured log event."""
+        if not self.enabled:
+            return
+        from backend.utils.common.logging.logger import get_logger
+
+        get_logger(__name__).info("STARTUP_PROFILE", **self.report())
+
+
+# Process-wide profiler used by backend.app.main
+startup_profiler = StartupProfiler()
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parse ``python -X importtime`` output.
+
+    Lines look like ``import time:  self [us] | cumulative | imported package``
+    with the package name indented two spaces per nesting level.
+    """
+    rows: list[ImportTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0].strip())
+            cumulative_us = int(parts[1].strip())
+        except ValueError:
+            continue  # Header row
+        name = parts[2].rstrip()
+        stripped = name.lstrip(" ")
+        rows.append(
+            ImportTiming(
+                module=stripped,
+                self_ms=self_us / 1000,
+                cumulative_ms=cumulative_us / 1000,
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return rows
+
+
+def summarize_imports(rows: list[ImportTiming], prefix: str = "backend", top: int = 20) -> dict[str, Any]:
+    """Totals, self time per top-level package, and the slowest own modules.
+
+    Args:
+        rows: Parsed ``-X importtime`` rows
+        prefix: Package whose modules are listed in ``slowest``
+        top: How many entries to list
+    """
+    total_ms = sum(r.cumulative_ms for r in rows if r.depth == 0)
+    own: dict[str, ImportTiming] = {}
+    for r in rows:
+        if r.module == prefix or r.module.startswith(prefix + "."):
+            # A module can appear twice (package import + explicit submodule)
+            if r.module not in own or r.cumulative_ms > own[r.module].cumulative_ms:
+                own[r.module] = r
+    slowest = sorted(own.values(), key=lambda r: r.cumulative_ms, reverse=True)
+    by_package: dict[str, float] = {}
+    for r in rows:
+        root = r.module.split(".")[0]
+        by_package[root] = by_package.get(root, 0.0) + r.self_ms
+    return {
+        "total_import_ms": round(total_ms, 1),
+        "module_count": len(rows),
+        "self_ms_by_package": dict(
+            sorted(((k, round(v, 1)) for k, v in by_package.items()), key=lambda kv: -kv[1])[:top]
+        ),
+        "slowest": [asdict(r) for r in slowest[:top]],
+    }
@@ -1,18 +1,42 @@
 """Diarization worker - Speaker separation.
 
+Two paths:
+- Incremental: ``diarize_ready_windows`` runs after every transcribed chunk
+  and diarizes each rolling window as soon as its chunks are in (see
+  ``backend.providers.diarization.windowing``). At finalize only the last,
+  partial window is left, and the windows are stitched into segments.
+- Full: one provider call over the whole transcript (sessions without
+  windows, audio-based providers, or ``diarization.incremental.enabled: false``).
+
 Updated: 2026-02-01 (Phase 2.3 - DI migration, removed service locators)
+Updated: 2026-10-18 (rolling-window diarization while recording)
 """
 
 from __future__ import annotations
 
 import json
+import threading
 import time
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 import h5py
 from backend.models.task_type import TaskStatus, TaskType
-from backend.providers.diarization import get_diarization_provider
+from backend.providers.diarization import (
+    DiarizationResponse,
+    TextBasedDiarizationProvider,
+    get_diarization_provider,
+)
+from backend.providers.diarization.windowing import (
+    WindowConfig,
+    assemble,
+    plan_windows,
+    ready_chunks,
+    segment_dict,
+    stitch_speakers,
+    window_segments,
+    word_count,
+)
 from backend.repositories.interfaces.itask_repository import ITaskRepository
 from backend.utils.common.logging.logger import get_logger
 from backend.infrastructure.workers.tasks.base_worker import WorkerResult, measure_time
@@ -24,6 +48,12 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# One incremental pass per session at a time. A chunk that lands while a pass
+# runs only marks the session dirty; the running pass loops once more.
+_window_gates: dict[str, threading.Lock] = {}
+_dirty_sessions: set[str] = set()
+_gates_lock = threading.Lock()
+
 
 @measure_time
 def diarize_session_worker(
@@ -63,8 +93,8 @@ def diarize_session_worker(
             raise ValueError(f"DIARIZATION task not found for {session_id}. Must finalize first.")
 
         # Get provider (policy_loader injected via DI)
+        diarization_config = policy_loader.get_diarization_config()
         if not diarization_provider:
-            diarization_config = policy_loader.get_diarization_config()
             diarization_provider = diarization_config.get("primary_provider", "azure_gpt4")
 
         # Get transcription sources (Triple Vision: webspeech > full_text > chunks)
@@ -172,16 +202,42 @@ def diarize_session_worker(
             },
         )
 
-        # Diarize with TRIPLE VISION (this is the slow part - Azure API call)
         provider = get_diarization_provider(diarization_provider)
-        # Type ignore: AzureGPT4Provider extends base with additional optional params
-        response = provider.diarize(
-            audio_path=None,
-            transcript=full_text,  # type: ignore[call-arg]
-            num_speakers=2,
-            chunks=chunks_data,  # type: ignore[call-arg]
-            webspeech_final=webspeech_final,  # type: ignore[call-arg]
-        )
+        num_speakers = int(diarization_config.get("expected_num_speakers", 2))
+        window_config = WindowConfig.from_policy(diarization_config)
+
+        segments: list[dict[str, Any]] | None = None
+        if (
+            window_config.enabled
+            and isinstance(provider, TextBasedDiarizationProvider)
+            and task_repo.get_diarization_windows(session_id)
+        ):
+            # Rolling windows ran while recording: only the tail is left
+            windows = _diarize_windows(
+                session_id, task_repo, provider, window_config, num_speakers, final=True
+            )
+            segments = assemble(windows)
+            provider_name = provider.get_provider_name()
+            confidence = min((seg["confidence"] for seg in segments), default=0.0)
+            logger.info(
+                "DIARIZATION_WINDOWS_ASSEMBLED",
+                session_id=session_id,
+                window_count=len(windows),
+                segment_count=len(segments),
+            )
+
+        if segments is None:
+            # Diarize with TRIPLE VISION (this is the slow part - Azure API call)
+            response = _diarize_full(
+                provider,
+                transcript=full_text,
+                num_speakers=num_speakers,
+                chunks=chunks_data,
+                webspeech_final=webspeech_final,
+            )
+            segments = [segment_dict(seg) for seg in response.segments]
+            provider_name = response.provider
+            confidence = response.confidence
 
         # Update progress: 80% (diarization complete, processing results)
         task_repo.save_task_metadata(
@@ -191,20 +247,20 @@ def diarize_session_worker(
         )
 
         result = {
-            "segments": response.segments,
-            "num_speakers": response.num_speakers,
-            "confidence": response.confidence,
-            "provider": response.provider,
+            "segments": segments,
+            "num_speakers": len({seg["speaker"] for seg in segments}),
+            "confidence": confidence,
+            "provider": provider_name,
         }
 
         elapsed_time = time.time() - start_time
 
         # Save segments to HDF5 (following task-based pattern)
-        task_repo.save_diarization_segments(session_id, response.segments)
+        task_repo.save_diarization_segments(session_id, segments)
         logger.info(
             "DIARIZATION_SEGMENTS_PERSISTED",
             session_id=session_id,
-            segment_count=len(response.segments),
+            segment_count=len(segments),
         )
 
         # Update metadata: COMPLETED with progress 100%
@@ -265,3 +321,171 @@ def diarize_session_worker(
         workflow_tracker.mark_task_failed(session_id, TaskType.DIARIZATION, error=str(e))
 
         raise
+
+
+def diarize_ready_windows(
+    session_id: str,
+    task_repo: ITaskRepository,
+    policy_loader: IPolicyLoader | None = None,
+    diarization_provider: str | None = None,
+) -> int:
+    """Diarize every rolling window whose chunks are all transcribed.
+
+    Called after each transcribed chunk (fire-and-forget). Never blocks on
+    another pass for the same session: if one is running, it is told to
+    look again and this call returns at once.
+
+    Args:
+        session_id: Session identifier
+        task_repo: Task repository (injected for thread-safety)
+        policy_loader: Policy loader (defaults to the shared singleton)
+        diarization_provider: Provider name (defaults to policy primary_provider)
+
+    Returns:
+        Number of windows diarized by this call
+    """
+    if policy_loader is None:
+        from backend.infrastructure.common.policy_provider import get_policy_loader_dep
+
+        policy_loader = get_policy_loader_dep()
+    diarization_config = policy_loader.get_diarization_config()
+    window_config = WindowConfig.from_policy(diarization_config)
+    if not window_config.enabled:
+        return 0
+
+    provider = get_diarization_provider(
+        diarization_provider or diarization_config.get("primary_provider", "azure_gpt4")
+    )
+    if not isinstance(provider, TextBasedDiarizationProvider):
+        return 0  # audio-based providers diarize the whole recording at finalize
+    num_speakers = int(diarization_config.get("expected_num_speakers", 2))
+
+    with _gates_lock:
+        gate = _window_gates.setdefault(session_id, threading.Lock())
+        if not gate.acquire(blocking=False):
+            _dirty_sessions.add(session_id)
+            return 0
+
+    diarized = 0
+    try:
+        while True:
+            before = len(task_repo.get_diarization_windows(session_id))
+            windows = _diarize_windows(
+                session_id, task_repo, provider, window_config, num_speakers, final=False
+            )
+            diarized += max(0, len(windows) - before)
+            with _gates_lock:
+                if session_id not in _dirty_sessions:
+                    gate.release()
+                    return diarized
+                _dirty_sessions.discard(session_id)
+    except BaseException:
+        with _gates_lock:
+            _dirty_sessions.discard(session_id)
+            gate.release()
+        raise
+
+
+def _diarize_windows(
+    session_id: str,
+    task_repo: ITaskRepository,
+    provider: TextBasedDiarizationProvider,
+    config: WindowConfig,
+    num_speakers: int,
+    final: bool,
+) -> list[dict[str, Any]]:
+    """Bring the stored windows up to date with the transcribed chunks.
+
+    Stored windows whose bounds still match the plan are kept; from the
+    first mismatch on (a re-run finalize, a grown tail) they are redone.
+    With ``final``, waits for a running incremental pass and then covers
+    every ready chunk, including a partial last window.
+
+    Returns:
+        The windows of the plan, in order
+    """
+    gate = None
+    if final:
+        with _gates_lock:
+            gate = _window_gates.setdefault(session_id, threading.Lock())
+        gate.acquire()
+    try:
+        chunks = ready_chunks(task_repo.get_task_chunks(session_id, TaskType.TRANSCRIPTION.value))
+        offsets = [0]
+        for chunk in chunks:
+            offsets.append(offsets[-1] + word_count(chunk.get("transcript")))
+
+        windows = task_repo.get_diarization_windows(session_id)
+        plan = plan_windows(len(chunks), config, final=final)
+        kept = 0
+        while (
+            kept < min(len(windows), len(plan))
+            and (windows[kept]["chunk_start"], windows[kept]["chunk_end"]) == plan[kept]
+        ):
+            kept += 1
+        windows = windows[:kept]
+
+        for index in range(kept, len(plan)):
+            chunk_start, chunk_end = plan[index]
+            span = chunks[chunk_start:chunk_end]
+            transcript = " ".join(c.get("transcript", "") for c in span).strip()
+            window = {
+                "chunk_start": chunk_start,
+                "chunk_end": chunk_end,
+                "word_start": offsets[chunk_start],
+                "word_end": offsets[chunk_end],
+                "segments": [],
+            }
+            if transcript:
+                response = provider.diarize_text(
+                    transcript=transcript, num_speakers=num_speakers, chunks=span
+                )
+                window["segments"] = window_segments(
+                    response.segments, window["word_start"], window["word_end"]
+                )
+            if windows:
+                known = list(
+                    dict.fromkeys(seg["speaker"] for w in windows for seg in w["segments"])
+                )
+                mapping = stitch_speakers(windows[-1]["segments"], window["segments"], known)
+                for seg in window["segments"]:
+                    seg["speaker"] = mapping[seg["speaker"]]
+            task_repo.save_diarization_window(session_id, index, window)
+            windows.append(window)
+            logger.info(
+                "DIARIZATION_WINDOW_DONE",
+                session_id=session_id,
+                window_index=index,
+                chunk_start=chunk_start,
+                chunk_end=chunk_end,
+                final=final,
+            )
+        return windows
+    finally:
+        if gate is not None:
+            gate.release()
+            with _gates_lock:
+                _window_gates.pop(session_id, None)
+                _dirty_sessions.discard(session_id)
+
+
+def _diarize_full(
+    provider: Any,
+    transcript: str,
+    num_speakers: int,
+    chunks: list[dict[str, Any]],
+    webspeech_final: list[str] | None,
+) -> DiarizationResponse:
+    """One provider call over the whole session."""
+    if isinstance(provider, TextBasedDiarizationProvider):
+        return provider.diarize_text(
+            transcript=transcript,
+            num_speakers=num_speakers,
+            chunks=chunks,
+            webspeech_final=webspeech_final,
+        )
+    raise ValueError(
+        f"{provider.get_provider_name()} needs session audio; "
+        "the diarization worker only has transcripts"
+    )
+
@@ -1,11 +1,19 @@
 """SOAP generation worker - Medical notes extraction.
 
+Sections are persisted one by one as the middleware finishes them (the
+partial note is readable at GET /soap/sessions/{id} and streamed by
+/soap/sessions/{id}/events), and each section's cache key is kept in the
+task metadata so the next run can reuse unchanged sections.
+
 Updated: 2026-02-01 (Phase 2.3 - DI migration, removed service locators)
+Updated: 2026-10-18 (section-by-section persistence and reuse)
 """
 
 from __future__ import annotations
 
+import threading
 import time
+from collections.abc import Callable
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
@@ -102,6 +110,7 @@ def generate_soap_worker(
                 "started_at": datetime.now(timezone.utc).isoformat(),
                 "word_count": word_count,
                 "text_length": len(full_text),
+                "sections_completed": [],
             },
         )
         logger.info(
@@ -133,12 +142,18 @@ def generate_soap_worker(
             },
         )
 
+        # Previous run's sections, reusable when their cache key still matches
+        cached_sections = _previous_sections(task_repo, session_id)
+        on_section = _section_persister(task_repo, session_id)
+
         # Process through decisional middleware
         # This will intelligently decide: simple vs complex generation
         orchestration_result = decisional_middleware.process(
             transcript=full_text,
             segments=segments if segments else None,
             session_metadata={"session_id": session_id, "provider": soap_provider},
+            on_section=on_section,
+            cached_sections=cached_sections,
         )
 
         # Extract SOAP data from orchestration result
@@ -164,6 +179,7 @@ def generate_soap_worker(
             "personas_invoked": orchestration_result.personas_invoked,
             "confidence_score": orchestration_result.confidence_score,
             "doctor_context_requested": orchestration_result.doctor_context_requested,
+            "sections_cached": orchestration_result.sections_cached,
         }
 
         elapsed_time = time.time() - start_time
@@ -262,6 +278,8 @@ def generate_soap_worker(
                 "personas_invoked": orchestration_result.personas_invoked,
                 "confidence_score": orchestration_result.confidence_score,
                 "doctor_context_requested": orchestration_result.doctor_context_requested,
+                "section_keys": orchestration_result.section_keys,
+                "sections_cached": orchestration_result.sections_cached,
             },
         )
 
@@ -308,3 +326,46 @@ def generate_soap_worker(
         workflow_tracker.mark_task_failed(session_id, TaskType.SOAP_GENERATION, error=str(e))
 
         raise
+
+
+def _previous_sections(task_repo: ITaskRepository, session_id: str) -> dict[str, dict[str, Any]]:
+    """Sections of the stored note paired with the keys they were generated under."""
+    metadata = task_repo.get_task_metadata(session_id, TaskType.SOAP_GENERATION.value) or {}
+    keys = metadata.get("section_keys")
+    if not isinstance(keys, dict) or not keys:
+        return {}
+    try:
+        previous_note = task_repo.get_soap_data(session_id) or {}
+    except ValueError:
+        return {}
+    return {
+        section: {"key": key, "content": previous_note[section]}
+        for section, key in keys.items()
+        if section in previous_note
+    }
+
+
+def _section_persister(
+    task_repo: ITaskRepository, session_id: str
+) -> Callable[[str, Any, bool], None]:
+    """on_section callback: save the partial note and progress as each section lands."""
+    lock = threading.Lock()
+    partial: dict[str, Any] = {}
+
+    def on_section(section: str, content: Any, cached: bool) -> None:
+        with lock:  # sections finish on the middleware's threads
+            partial[section] = content
+            task_repo.save_soap_data(session_id, dict(partial), TaskType.SOAP_GENERATION.value)
+            task_repo.save_task_metadata(
+                session_id,
+                TaskType.SOAP_GENERATION,
+                {
+                    "sections_completed": list(partial),
+                    "progress_percent": 50 + 7 * len(partial),
+                    "status_message": f"SOAP section ready: {section}"
+                    + (" (unchanged)" if cached else ""),
+                },
+            )
+        logger.info("SOAP_SECTION_PERSISTED", session_id=session_id, section=section, cached=cached)
+
+    return on_section
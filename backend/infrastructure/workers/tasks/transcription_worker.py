@@ -141,6 +141,22 @@ def transcribe_chunk_worker(
             },
         )
 
+        # Diarize any rolling window this chunk completed (fire-and-forget)
+        try:
+            from backend.infrastructure.workers.executor_pool import spawn_worker
+            from backend.infrastructure.workers.tasks.diarization_worker import (
+                diarize_ready_windows,
+            )
+
+            spawn_worker(diarize_ready_windows, session_id=session_id, task_repo=task_repo)
+        except Exception as window_error:
+            logger.warning(
+                "INCREMENTAL_DIARIZATION_DISPATCH_FAILED",
+                session_id=session_id,
+                chunk_number=chunk_number,
+                error=str(window_error),
+            )
+
         # Record performance metrics for adaptive load balancing
         balancer.record_performance(
             provider=stt_provider,
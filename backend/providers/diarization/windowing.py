@@ -0,0 +1,180 @@
+"""Rolling-window diarization - window planning, speaker stitching, assembly.
+
+Text-based diarization used to run once, at finalize, over the whole
+consult: one provider call whose latency grows with the transcript and
+lands entirely after the doctor stops recording. Instead, windows of
+``window_chunks`` transcribed chunks are diarized while the session is
+still recording; consecutive windows share ``overlap_chunks`` chunks so
+the labels of one window can be mapped onto the previous one.
+
+Word positions are the common coordinate: every segment gets a global
+``[w0, w1)`` word span (from the window's word offset plus its own text),
+which is what stitching votes on and what assembly cuts on. Pure
+functions only - no HDF5, no provider calls (see diarization_worker).
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from backend.providers.diarization.models import DiarizationSegment
+
+
+@dataclass(frozen=True)
+class WindowConfig:
+    """Rolling window shape (policy: ``diarization.incremental``)."""
+
+    enabled: bool = True
+    window_chunks: int = 8
+    overlap_chunks: int = 2
+
+    def __post_init__(self) -> None:
+        if self.window_chunks < 2:
+            raise ValueError("window_chunks must be >= 2")
+        if not 0 < self.overlap_chunks <= self.window_chunks // 2:
+            raise ValueError("overlap_chunks must be between 1 and window_chunks // 2")
+
+    @property
+    def step(self) -> int:
+        """Chunks between the starts of two consecutive windows."""
+        return self.window_chunks - self.overlap_chunks
+
+    @classmethod
+    def from_policy(cls, diarization_config: dict[str, Any] | None) -> WindowConfig:
+        """Build from the ``diarization`` policy section (defaults if absent)."""
+        section = (diarization_config or {}).get("incremental") or {}
+        return cls(
+            enabled=bool(section.get("enabled", True)),
+            window_chunks=int(section.get("window_chunks", cls.window_chunks)),
+            overlap_chunks=int(section.get("overlap_chunks", cls.overlap_chunks)),
+        )
+
+
+def chunk_index(chunk: dict[str, Any]) -> int:
+    """``chunk_idx`` attr, else the number in the group name (``chunk_3``)."""
+    if "chunk_idx" in chunk:
+        return int(chunk["chunk_idx"])
+    return int(str(chunk.get("id", "chunk_0")).rsplit("_", 1)[-1])
+
+
+def ready_chunks(chunks: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Chunks in order, up to the first one not transcribed yet.
+
+    Transcription workers finish out of order; a window may only cover a
+    contiguous run from chunk 0.
+    """
+    ordered = sorted(chunks, key=chunk_index)
+    ready: list[dict[str, Any]] = []
+    for expected, chunk in enumerate(ordered):
+        if chunk_index(chunk) != expected or "transcript" not in chunk:
+            break
+        ready.append(chunk)
+    return ready
+
+
+def plan_windows(n_ready: int, config: WindowConfig, final: bool = False) -> list[tuple[int, int]]:
+    """``(chunk_start, chunk_end)`` of every window over ``n_ready`` chunks.
+
+    Only full windows while recording. With ``final``, a last window covers
+    whatever the full ones left out, still overlapping the one before it.
+    """
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    while start + config.window_chunks <= n_ready:
+        bounds.append((start, start + config.window_chunks))
+        start += config.step
+    covered = bounds[-1][1] if bounds else 0
+    if final and covered < n_ready:
+        bounds.append((start, n_ready))
+    return bounds
+
+
+def word_count(text: str | None) -> int:
+    return len((text or "").split())
+
+
+def segment_dict(segment: DiarizationSegment) -> dict[str, Any]:
+    """A provider segment as the dict stored under ``DIARIZATION/segments``."""
+    return {
+        "speaker": segment.speaker.name or segment.speaker.speaker_id,
+        "text": segment.text or "",
+        "improved_text": segment.improved_text,
+        "start": segment.start_time,
+        "end": segment.end_time,
+        "confidence": segment.confidence,
+    }
+
+
+def window_segments(
+    segments: list[DiarizationSegment], word_start: int, word_end: int
+) -> list[dict[str, Any]]:
+    """Provider segments as dicts with global word spans, clamped to the window."""
+    out: list[dict[str, Any]] = []
+    cursor = word_start
+    for seg in segments:
+        w0 = min(cursor, word_end)
+        w1 = min(w0 + word_count(seg.text), word_end)
+        cursor = w1
+        out.append({**segment_dict(seg), "w0": w0, "w1": w1})
+    return out
+
+
+def stitch_speakers(
+    previous: list[dict[str, Any]], current: list[dict[str, Any]], known: list[str]
+) -> dict[str, str]:
+    """Map ``current``'s labels onto ``previous``'s.
+
+    Each label pair scores the words both windows assigned to it in their
+    overlap; pairs are taken greedily, best first, one-to-one. A label with
+    no partner keeps its name when that name is free, else takes a known
+    label nobody claimed, else its own name with a suffix.
+    """
+    votes: dict[tuple[str, str], int] = {}
+    for cur in current:
+        for prev in previous:
+            shared = min(cur["w1"], prev["w1"]) - max(cur["w0"], prev["w0"])
+            if shared > 0:
+                key = (cur["speaker"], prev["speaker"])
+                votes[key] = votes.get(key, 0) + shared
+
+    mapping: dict[str, str] = {}
+    taken: set[str] = set()
+    for (local, prior), _ in sorted(votes.items(), key=lambda kv: -kv[1]):
+        if local not in mapping and prior not in taken:
+            mapping[local] = prior
+            taken.add(prior)
+
+    for local in dict.fromkeys(seg["speaker"] for seg in current):
+        if local in mapping:
+            continue
+        if local not in taken:
+            target = local
+        else:
+            target = next((k for k in known if k not in taken), f"{local}_{len(known)}")
+        mapping[local] = target
+        taken.add(target)
+    return mapping
+
+
+def assemble(windows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Session segments from stitched windows, cutting each overlap in half.
+
+    A segment belongs to the window whose share of the timeline holds the
+    middle of its word span, so an overlap is never counted twice.
+    """
+    out: list[dict[str, Any]] = []
+    for i, window in enumerate(windows):
+        lo = 0 if i == 0 else (window["word_start"] + windows[i - 1]["word_end"]) // 2
+        hi = (
+            float("inf")
+            if i == len(windows) - 1
+            else (windows[i + 1]["word_start"] + window["word_end"]) // 2
+        )
+        for seg in window["segments"]:
+            if lo <= (seg["w0"] + seg["w1"]) / 2 < hi:
+                out.append(seg)
+    return out
@@ -1,32 +1,40 @@
-"""CachedMemoryStore - LRU cache wrapper for IMemoryStore.
+"""CachedMemoryStore - Bounded, invalidation-aware cache wrapper for IMemoryStore.
 
 Decorator pattern for caching without modifying core logic.
 
 Author: Claude Sonnet 4.5 (El Revisor Agresivo)
 Created: 2026-01-31
+Updated: 2026-10-18 (byte budget, TinyLFU admission, TTLs, invalidation bus)
 Purpose: Cache frequent get_audio_events() calls
 """
 
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import NamedTuple
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, NamedTuple
 
 from backend.repositories.interfaces.imemory_store import (
     IMemoryStore,
     AudioEventDict,
     AudioStatsDict,
 )
+from backend.repositories.memory_cache_invalidation import InvalidationBus
 from backend.infrastructure.interfaces.ilogger import ILogger
 from backend.utils.common.logging.logger import get_logger
 
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
 
 class CacheKey(NamedTuple):
     """Hashable cache key for get_audio_events() parameters.
 
     Why NamedTuple:
     - Immutable (safe for dict keys)
-    - Hashable (works with lru_cache)
+    - Hashable (works as OrderedDict / sketch key)
     - Typed (better than tuple indexing)
     """
 
@@ -37,16 +45,80 @@ class CacheKey(NamedTuple):
     offset: int
 
 
+class FrequencySketch:
+    """Count-min sketch of recent access frequency (TinyLFU).
+
+    4 rows of ``width`` saturating counters (max 15). After ``sample_size``
+    increments every counter is halved, so frequencies describe the recent
+    past rather than all time.
+    """
+
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+
+    def __init__(self, width: int = 4096, sample_size: int = 40_960):
+        self.width = width
+        self.sample_size = sample_size
+        self._rows = [bytearray(width) for _ in self._SEEDS]
+        self._additions = 0
+
+    def _slots(self, key: object) -> list[int]:
+        return [hash((seed, key)) % self.width for seed in self._SEEDS]
+
+    def increment(self, key: object) -> None:
+        for row, slot in zip(self._rows, self._slots(key), strict=True):
+            if row[slot] < 15:
+                row[slot] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            for row in self._rows:
+                row[:] = bytes(count >> 1 for count in row)
+            self._additions //= 2
+
+    def estimate(self, key: object) -> int:
+        return min(row[slot] for row, slot in zip(self._rows, self._slots(key), strict=True))
+
+
+@dataclass
+class _Entry:
+    value: tuple[list[AudioEventDict], int]
+    size: int
+    expires_at: float
+
+
+def estimate_result_bytes(result: tuple[list[AudioEventDict], int]) -> int:
+    """Approximate heap size of a get_audio_events() result.
+
+    Counts the list, each event dict and its values (keys are shared,
+    interned strings). Cheap next to the read it caches.
+    """
+    events, _ = result
+    size = sys.getsizeof(events)
+    for event in events:
+        size += sys.getsizeof(event) + sum(sys.getsizeof(v) for v in event.values())
+    return size
+
+
 class CachedMemoryStore(IMemoryStore):
-    """Decorator that adds LRU caching to IMemoryStore operations.
+    """Decorator that adds a bounded cache to IMemoryStore operations.
 
     Responsibilities:
     - Cache get_audio_events() results (most frequent operation)
-    - Cache TTL: 60 seconds (configurable)
-    - Cache size: 128 entries per doctor (configurable)
-    - Cache invalidation: Time-based (no manual invalidation needed)
-
-    Why LRU Cache:
+    - Bound memory by bytes (``max_bytes``, estimated per result) and entries
+      (``cache_size``)
+    - Admission: TinyLFU - when the cache is full, a new result only
+      replaces LRU victims it is accessed more often than, so one-off
+      queries (a scroll through old pages) don't flush the dashboard's
+      working set
+    - Per-entry TTL: ``ttl_seconds`` (60s) for ranges that reach the
+      present (new chunks still arrive), ``historical_ttl_seconds`` (1h) for
+      ranges that ended before now
+    - Invalidation: writes through this wrapper (``index_audio_event``,
+      ``bulk_index_audio_events``) and ``invalidate(doctor_id)`` drop the
+      doctor's entries and publish on the ``invalidation`` bus; other
+      processes' writes arrive by polling the bus (at most every
+      ``poll_interval`` seconds)
+
+    Why cache:
     - ✅ Dashboards often query same time ranges repeatedly
     - ✅ Pagination queries only vary by offset (rest cached)
     - ✅ Reduces HDF5 reads from ~100ms → ~0.1ms (1000x speedup)
@@ -63,13 +135,16 @@ class CachedMemoryStore(IMemoryStore):
         # With cache:
         store = CachedMemoryStore(
             delegate=HDF5MemoryStore(corpus_path="storage/corpus.h5"),
-            cache_size=128,  # 128 entries per doctor
+            max_bytes=64 * 1024 * 1024,
+            invalidation=FileInvalidationBus("storage/memory_cache.invalidations"),
         )
 
     Cache Metrics:
         - Cache hits: Logged as MEMORY_STORE_CACHE_HIT
         - Cache misses: Logged as MEMORY_STORE_CACHE_MISS
-        - Cache stats available via .cache_info()
+        - Every ``stats_log_every`` lookups: MEMORY_STORE_CACHE_STATS
+        - Cache stats available via .cache_info() (hit_ratio, evictions,
+          rejected admissions, expirations, invalidations, bytes)
     """
 
     def __init__(
@@ -77,6 +152,13 @@ class CachedMemoryStore(IMemoryStore):
         delegate: IMemoryStore,
         cache_size: int = 128,
         logger: ILogger | None = None,
+        *,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_seconds: float = 60.0,
+        historical_ttl_seconds: float = 3600.0,
+        invalidation: InvalidationBus | None = None,
+        poll_interval: float = 0.5,
+        stats_log_every: int = 1000,
     ):
         """Initialize CachedMemoryStore wrapper.
 
@@ -84,13 +166,33 @@ class CachedMemoryStore(IMemoryStore):
             delegate: Underlying IMemoryStore implementation
             cache_size: Maximum cache entries (default: 128)
             logger: Logger instance (optional)
+            max_bytes: Memory budget for cached results (default: 64 MiB)
+            ttl_seconds: TTL for ranges that include the present
+            historical_ttl_seconds: TTL for ranges that ended in the past
+            invalidation: Cross-process invalidation bus (optional)
+            poll_interval: Minimum seconds between bus polls
+            stats_log_every: Log MEMORY_STORE_CACHE_STATS every N lookups (0: never)
         """
         self.delegate = delegate
         self.logger = logger or get_logger(__name__)
-
-        # Create LRU cache for get_audio_events
-        self._cached_get_audio_events = lru_cache(maxsize=cache_size)(
-            self._get_audio_events_impl
+        self.cache_size = cache_size
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.historical_ttl_seconds = historical_ttl_seconds
+        self.invalidation = invalidation
+        self.poll_interval = poll_interval
+        self.stats_log_every = stats_log_every
+
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()  # LRU first
+        self._by_doctor: dict[str, set[CacheKey]] = {}
+        self._generations: dict[str, int] = {}
+        self._epoch = 0  # bumped by cache_clear(): invalidates reads in flight
+        self._bytes = 0
+        self._sketch = FrequencySketch(sample_size=10 * max(cache_size, 1024))
+        self._last_poll = 0.0
+        self._stats = dict.fromkeys(
+            ("hits", "misses", "evictions", "rejected", "expired", "invalidations"), 0
         )
 
     def get_audio_events(
@@ -101,11 +203,11 @@ class CachedMemoryStore(IMemoryStore):
         limit: int = 50,
         offset: int = 0,
     ) -> tuple[list[AudioEventDict], int]:
-        """Fetch audio events with LRU caching.
+        """Fetch audio events with caching.
 
         Cache Key: (doctor_id, start_ts, end_ts, limit, offset)
-        Cache TTL: No TTL (LRU eviction only)
-        Cache Size: 128 entries (configurable)
+        Cache TTL: ttl_seconds / historical_ttl_seconds (see class docstring)
+        Cache Size: max_bytes and cache_size entries
 
         Args:
             doctor_id: Doctor identifier
@@ -117,7 +219,6 @@ class CachedMemoryStore(IMemoryStore):
         Returns:
             Tuple of (events, total_count)
         """
-        # Create cache key
         cache_key = CacheKey(
             doctor_id=doctor_id,
             start_ts=start_ts,
@@ -125,56 +226,46 @@ class CachedMemoryStore(IMemoryStore):
             limit=limit,
             offset=offset,
         )
+        now = time.time()
+        self._poll_invalidations(now)
+
+        with self._lock:
+            self._sketch.increment(cache_key)
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove(cache_key)
+                self._stats["expired"] += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+                self._stats["hits"] += 1
+            else:
+                self._stats["misses"] += 1
+            generation = (self._epoch, self._generations.get(doctor_id, 0))
+            lookups = self._stats["hits"] + self._stats["misses"]
+
+        self.logger.debug(
+            "MEMORY_STORE_CACHE_HIT" if entry is not None else "MEMORY_STORE_CACHE_MISS",
+            doctor_id=doctor_id,
+            cache_hits=self._stats["hits"],
+            cache_misses=self._stats["misses"],
+            hit_rate=self._stats["hits"] / max(lookups, 1),
+        )
+        if self.stats_log_every and lookups % self.stats_log_every == 0:
+            self.logger.info("MEMORY_STORE_CACHE_STATS", **self.cache_info())
 
-        # Log cache stats before call
-        cache_info_before = self._cached_get_audio_events.cache_info()
-
-        # Execute cached method
-        result = self._cached_get_audio_events(cache_key)
-
-        # Log cache stats after call (detect hit vs miss)
-        cache_info_after = self._cached_get_audio_events.cache_info()
-
-        if cache_info_after.hits > cache_info_before.hits:
-            # Cache hit
-            self.logger.debug(
-                "MEMORY_STORE_CACHE_HIT",
-                doctor_id=doctor_id,
-                cache_hits=cache_info_after.hits,
-                cache_misses=cache_info_after.misses,
-                hit_rate=cache_info_after.hits / max(cache_info_after.hits + cache_info_after.misses, 1),
-            )
-        else:
-            # Cache miss
-            self.logger.debug(
-                "MEMORY_STORE_CACHE_MISS",
-                doctor_id=doctor_id,
-                cache_hits=cache_info_after.hits,
-                cache_misses=cache_info_after.misses,
-                hit_rate=cache_info_after.hits / max(cache_info_after.hits + cache_info_after.misses, 1),
-            )
-
-        return result
+        if entry is not None:
+            return entry.value
 
-    def _get_audio_events_impl(
-        self,
-        cache_key: CacheKey,
-    ) -> tuple[list[AudioEventDict], int]:
-        """Internal implementation of get_audio_events (called by LRU cache).
-
-        Args:
-            cache_key: Hashable cache key
-
-        Returns:
-            Tuple of (events, total_count)
-        """
-        return self.delegate.get_audio_events(
-            doctor_id=cache_key.doctor_id,
-            start_ts=cache_key.start_ts,
-            end_ts=cache_key.end_ts,
-            limit=cache_key.limit,
-            offset=cache_key.offset,
+        result = self.delegate.get_audio_events(
+            doctor_id=doctor_id,
+            start_ts=start_ts,
+            end_ts=end_ts,
+            limit=limit,
+            offset=offset,
         )
+        self._admit(cache_key, result, generation, now)
+        return result
 
     def search_audio_events(
         self,
@@ -210,23 +301,64 @@ class CachedMemoryStore(IMemoryStore):
         # No caching for stats (infrequent operation)
         return self.delegate.get_audio_stats(doctor_id)
 
-    def cache_info(self) -> dict[str, int]:
+    # ============================================================================
+    # Write-through (stores that support writes, e.g. ElasticsearchMemoryStore)
+    # ============================================================================
+
+    def index_audio_event(self, doctor_id: str, event: AudioEventDict) -> str:
+        """Index via the delegate, then invalidate the doctor's cached results."""
+        try:
+            delegate: Any = self.delegate
+            return delegate.index_audio_event(doctor_id, event)
+        finally:
+            self.invalidate(doctor_id)
+
+    def bulk_index_audio_events(
+        self, doctor_id: str, events: list[AudioEventDict]
+    ) -> tuple[int, int]:
+        """Bulk index via the delegate, then invalidate the doctor's cached results."""
+        try:
+            delegate: Any = self.delegate
+            return delegate.bulk_index_audio_events(doctor_id, events)
+        finally:
+            self.invalidate(doctor_id)
+
+    def invalidate(self, doctor_id: str) -> None:
+        """Drop a doctor's cached results here and in every process on the bus.
+
+        Call after writing the doctor's events through any other path.
+        """
+        self._invalidate_local(doctor_id)
+        if self.invalidation is not None:
+            self.invalidation.publish(doctor_id)
+
+    # ============================================================================
+    # Metrics
+    # ============================================================================
+
+    def cache_info(self) -> dict[str, Any]:
         """Get cache statistics.
 
         Returns:
             Dict with keys:
-            - hits: Number of cache hits
-            - misses: Number of cache misses
-            - maxsize: Maximum cache size
-            - currsize: Current cache size
+            - hits / misses / hit_ratio: Lookups served from cache or not
+            - maxsize / currsize: Entry cap and current entries
+            - max_bytes / bytes: Byte budget and current estimated bytes
+            - evictions: Entries evicted to make room
+            - rejected: Results not admitted (TinyLFU lost, or too large)
+            - expired: Entries found past their TTL
+            - invalidations: Entries dropped by invalidation
         """
-        cache_info = self._cached_get_audio_events.cache_info()
-        return {
-            "hits": cache_info.hits,
-            "misses": cache_info.misses,
-            "maxsize": cache_info.maxsize or 128,  # Default if None
-            "currsize": cache_info.currsize,
-        }
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_ratio": self._stats["hits"] / lookups if lookups else 0.0,
+                "maxsize": self.cache_size,
+                "currsize": len(self._entries),
+                "max_bytes": self.max_bytes,
+                "bytes": self._bytes,
+            }
 
     def cache_clear(self) -> None:
         """Clear all cache entries.
@@ -235,8 +367,104 @@ class CachedMemoryStore(IMemoryStore):
         - Manual cache invalidation after bulk import
         - Testing (reset cache between tests)
         """
-        self._cached_get_audio_events.cache_clear()
+        with self._lock:
+            self._entries.clear()
+            self._by_doctor.clear()
+            self._bytes = 0
+            self._epoch += 1
         self.logger.info("MEMORY_STORE_CACHE_CLEARED")
 
+    # ============================================================================
+    # Private Helpers
+    # ============================================================================
+
+    def _ttl_for(self, key: CacheKey, now: float) -> float:
+        if key.end_ts is not None and key.end_ts < now - self.ttl_seconds:
+            return self.historical_ttl_seconds
+        return self.ttl_seconds
+
+    def _admit(
+        self,
+        key: CacheKey,
+        result: tuple[list[AudioEventDict], int],
+        generation: tuple[int, int],
+        now: float,
+    ) -> None:
+        """Insert ``result`` if TinyLFU admits it over the LRU victims it would displace."""
+        size = estimate_result_bytes(result)
+        with self._lock:
+            if (self._epoch, self._generations.get(key.doctor_id, 0)) != generation:
+                return  # invalidated while we were reading: result may be stale
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                self._stats["rejected"] += 1
+                return
+
+            # Victims from the LRU end until the new entry fits
+            victims: list[CacheKey] = []
+            freed = 0
+            candidate_freq = self._sketch.estimate(key)
+            for victim in self._entries:
+                if (
+                    self._bytes - freed + size <= self.max_bytes
+                    and len(self._entries) - len(victims) < self.cache_size
+                ):
+                    break
+                entry = self._entries[victim]
+                if entry.expires_at > now and self._sketch.estimate(victim) >= candidate_freq:
+                    self._stats["rejected"] += 1
+                    return
+                victims.append(victim)
+                freed += entry.size
+
+            for victim in victims:
+                self._remove(victim)
+            self._stats["evictions"] += len(victims)
+            self._entries[key] = _Entry(result, size, now + self._ttl_for(key, now))
+            self._by_doctor.setdefault(key.doctor_id, set()).add(key)
+            self._bytes += size
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        keys = self._by_doctor.get(key.doctor_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_doctor[key.doctor_id]
+
+    def _invalidate_local(self, doctor_id: str) -> None:
+        with self._lock:
+            self._generations[doctor_id] = self._generations.get(doctor_id, 0) + 1
+            keys = self._by_doctor.pop(doctor_id, set())
+            for key in keys:
+                entry = self._entries.pop(key)
+                self._bytes -= entry.size
+            self._stats["invalidations"] += len(keys)
+        if keys:
+            self.logger.debug(
+                "MEMORY_STORE_CACHE_INVALIDATED", doctor_id=doctor_id, entries=len(keys)
+            )
 
-__all__ = ["CachedMemoryStore"]
+    def _poll_invalidations(self, now: float) -> None:
+        if self.invalidation is None or now - self._last_poll < self.poll_interval:
+            return
+        self._last_poll = now
+        try:
+            changed = self.invalidation.poll()
+        except Exception as e:
+            # Bus down: TTLs still bound staleness
+            self.logger.warning("MEMORY_STORE_CACHE_POLL_ERROR", error=str(e))
+            return
+        if changed is None:
+            with self._lock:
+                dropped = len(self._entries)
+                self._stats["invalidations"] += dropped
+            self.cache_clear()
+            return
+        for doctor_id in changed:
+            self._invalidate_local(doctor_id)
+
+
+__all__ = ["CachedMemoryStore", "FrequencySketch"]
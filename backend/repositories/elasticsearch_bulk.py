@@ -0,0 +1,438 @@
+"""Bulk indexing pipeline for the Elasticsearch memory store.
+
+Indexing one document per request costs a round trip and a refresh-visible
+write per chunk; backfilling a doctor's history that way is dominated by
+HTTP latency. This module batches writes into ``_bulk`` requests:
+
+- ``BulkIndexer``: buffered indexer with size- and time-based flushes.
+  A batch goes out when ``max_actions`` documents or ``max_bytes`` of source
+  are buffered, or when the oldest buffered document is ``flush_interval``
+  seconds old. One sender thread issues the requests. At most
+  ``max_in_flight`` batches wait for it; past that, ``index()`` blocks
+  (backpressure instead of unbounded memory). Items the cluster rejects with
+  429/5xx are retried with exponential backoff, without resending the rest
+  of the batch. Other item errors are counted, logged and reported to
+  ``on_failure``.
+- ``refresh_disabled``: sets ``refresh_interval: -1`` on the target indices
+  during a backfill, then restores the previous value and refreshes once.
+- ``ReindexCheckpoint`` / ``reindex_sessions``: a resumable full reindex
+  over sessions in sorted ``session_id`` order. The last session whose
+  documents were acknowledged is checkpointed, and a restarted run skips up
+  to it. The checkpoint never moves past a session with failed documents,
+  so a rerun retries it.
+
+No dependency on the ``elasticsearch`` package: the client is duck-typed
+(``bulk(operations=...)``, ``indices.get_settings/put_settings/refresh``), so
+a fake bulk endpoint is enough to exercise it.
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from backend.infrastructure.interfaces.ilogger import ILogger
+from backend.repositories.interfaces.imemory_store import AudioEventDict
+from backend.utils.common.logging.logger import get_logger
+
+# Item statuses worth retrying: the cluster is overloaded or a shard moved.
+RETRYABLE_STATUSES = frozenset({429, 502, 503, 504})
+
+# Per-batch overhead of an action line, on top of the JSON source.
+_ACTION_BYTES = 64
+
+# Non-retryable item errors kept on BulkStats for inspection.
+_MAX_KEPT_ERRORS = 20
+
+_STOP = object()
+
+Action = tuple[dict[str, Any], dict[str, Any]]  # (action line, source)
+
+
+@dataclass
+class BulkStats:
+    """Counters for one ``BulkIndexer`` (cumulative)."""
+
+    indexed: int = 0
+    failed: int = 0
+    retried: int = 0
+    requests: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+
+class BulkIndexer:
+    """Buffered, backpressured ``_bulk`` indexer (see module docstring).
+
+    Thread-safe ``index()``; ``flush()`` returns once every document handed
+    in so far has been acknowledged (or has failed for good). Use as a
+    context manager, or call ``close()``. ``on_failure(index, doc_id)`` runs
+    on the sender thread for each document that failed for good; it must
+    not raise.
+
+    Example:
+        with BulkIndexer(es_client) as indexer:
+            for doc_id, source in docs:
+                indexer.index("audio-transcriptions-doc1", doc_id, source)
+        print(indexer.stats.indexed)
+    """
+
+    def __init__(
+        self,
+        es_client: Any,
+        *,
+        max_actions: int = 1000,
+        max_bytes: int = 5 * 1024 * 1024,
+        flush_interval: float = 1.0,
+        max_in_flight: int = 2,
+        max_retries: int = 5,
+        initial_backoff: float = 0.5,
+        on_failure: Callable[[str, str], None] | None = None,
+        logger: ILogger | None = None,
+    ):
+        if max_actions <= 0 or max_bytes <= 0 or max_in_flight <= 0:
+            raise ValueError("max_actions, max_bytes and max_in_flight must be positive")
+        self.es = es_client
+        self.max_actions = max_actions
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.on_failure = on_failure
+        self.logger = logger or get_logger(__name__)
+        self.stats = BulkStats()
+
+        self._cond = threading.Condition()
+        self._buffer: list[Action] = []
+        self._buffer_bytes = 0
+        self._buffer_since = 0.0
+        self._pending = 0  # batches taken from the buffer, not yet finished
+        self._batches: queue.Queue[Any] = queue.Queue(maxsize=max_in_flight)
+        self._closed = False
+        self._sender = threading.Thread(target=self._run, name="es-bulk-indexer", daemon=True)
+        self._sender.start()
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def index(self, index: str, doc_id: str, source: dict[str, Any]) -> None:
+        """Queue ``source`` for ``index``/``doc_id`` (upsert). May block (backpressure)."""
+        size = len(json.dumps(source, default=str)) + _ACTION_BYTES
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BulkIndexer is closed")
+            if not self._buffer:
+                self._buffer_since = time.monotonic()
+            self._buffer.append(({"index": {"_index": index, "_id": doc_id}}, source))
+            self._buffer_bytes += size
+            batch = None
+            if len(self._buffer) >= self.max_actions or self._buffer_bytes >= self.max_bytes:
+                batch = self._take_locked()
+        if batch is not None:
+            self._batches.put(batch)  # blocks while max_in_flight batches wait
+
+    def flush(self) -> BulkStats:
+        """Send what's buffered and wait for every batch to finish."""
+        with self._cond:
+            batch = self._take_locked() if self._buffer else None
+        if batch is not None:
+            self._batches.put(batch)
+        with self._cond:
+            self._cond.wait_for(lambda: self._pending == 0)
+        return self.stats
+
+    def close(self) -> BulkStats:
+        """Flush, then stop the sender thread. Idempotent."""
+        if self._closed:
+            return self.stats
+        self.flush()
+        with self._cond:
+            self._closed = True
+        self._batches.put(_STOP)
+        self._sender.join()
+        return self.stats
+
+    def __enter__(self) -> BulkIndexer:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _take_locked(self) -> list[Action]:
+        batch, self._buffer, self._buffer_bytes = self._buffer, [], 0
+        self._pending += 1
+        return batch
+
+    # ------------------------------------------------------------------
+    # Sender thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            try:
+                batch = self._batches.get(timeout=self.flush_interval)
+            except queue.Empty:
+                # Time-based flush: nothing full arrived, ship what's stale.
+                with self._cond:
+                    age = time.monotonic() - self._buffer_since
+                    stale = bool(self._buffer) and age >= self.flush_interval
+                    batch = self._take_locked() if stale else None
+                if batch is None:
+                    continue
+            if batch is _STOP:
+                return
+            try:
+                self._send(batch)
+            except Exception as e:  # never let the sender thread die
+                self.stats.failed += len(batch)
+                self._notify_failed(batch)
+                self.logger.error(
+                    "ES_BULK_BATCH_ERROR", batch=len(batch), error=str(e), exc_info=True
+                )
+            finally:
+                with self._cond:
+                    self._pending -= 1
+                    self._cond.notify_all()
+
+    def _send(self, batch: list[Action]) -> None:
+        todo = batch
+        attempt = 0
+        while todo:
+            operations = [line for action in todo for line in action]
+            try:
+                response = self.es.bulk(operations=operations, refresh=False)
+            except Exception as e:
+                status = getattr(e, "status_code", None)
+                retryable = status is None or status in RETRYABLE_STATUSES
+                if not retryable or attempt >= self.max_retries:
+                    self._fail(todo, {"reason": str(e), "status": status})
+                    return
+                self.logger.warning(
+                    "ES_BULK_REQUEST_RETRY", batch=len(todo), attempt=attempt + 1, error=str(e)
+                )
+            else:
+                self.stats.requests += 1
+                todo = self._handle_items(todo, response, final=attempt >= self.max_retries)
+                if not todo:
+                    return
+                self.logger.warning("ES_BULK_ITEMS_RETRY", items=len(todo), attempt=attempt + 1)
+            self.stats.retried += len(todo)
+            time.sleep(self.initial_backoff * 2**attempt)
+            attempt += 1
+
+    def _handle_items(
+        self, todo: list[Action], response: dict[str, Any], *, final: bool
+    ) -> list[Action]:
+        """Count acknowledged items; return the ones to retry."""
+        if not response.get("errors"):
+            self.stats.indexed += len(todo)
+            return []
+        items = response.get("items") or []
+        if len(items) != len(todo):
+            # Without one item per action the failures can't be told apart.
+            reason = f"bulk response has {len(items)} items for {len(todo)} actions"
+            self._fail(todo, {"reason": reason})
+            return []
+        retry: list[Action] = []
+        for action, item in zip(todo, items, strict=True):
+            result = next(iter(item.values()))
+            status = result.get("status", 500)
+            if status < 300:
+                self.stats.indexed += 1
+            elif status in RETRYABLE_STATUSES and not final:
+                retry.append(action)
+            else:
+                self._fail([action], result.get("error") or {"status": status})
+        return retry
+
+    def _fail(self, actions: list[Action], error: dict[str, Any]) -> None:
+        self.stats.failed += len(actions)
+        for action, _ in actions[: max(0, _MAX_KEPT_ERRORS - len(self.stats.errors))]:
+            self.stats.errors.append({"_id": action["index"]["_id"], "error": error})
+        self._notify_failed(actions)
+        self.logger.error("ES_BULK_ITEMS_FAILED", count=len(actions), error=error)
+
+    def _notify_failed(self, actions: list[Action]) -> None:
+        if self.on_failure is None:
+            return
+        for action, _ in actions:
+            self.on_failure(action["index"]["_index"], action["index"]["_id"])
+
+
+@contextmanager
+def refresh_disabled(
+    es_client: Any, indices: list[str], logger: ILogger | None = None
+) -> Iterator[None]:
+    """Disable periodic refresh on ``indices`` for a backfill; restore + refresh on exit.
+
+    An index with no explicit ``refresh_interval`` goes back to the cluster
+    default (the setting is reset to ``null``).
+    """
+    logger = logger or get_logger(__name__)
+    previous: dict[str, Any] = {}
+    try:
+        for index in indices:
+            current = es_client.indices.get_settings(index=index, name="index.refresh_interval")
+            settings = current.get(index, {}).get("settings", {}).get("index", {})
+            previous[index] = settings.get("refresh_interval")
+            _put_refresh_interval(es_client, index, "-1")
+        logger.info("ES_REFRESH_DISABLED", indices=indices)
+        yield
+    finally:
+        for index, value in previous.items():
+            _put_refresh_interval(es_client, index, value)
+            es_client.indices.refresh(index=index)
+        if previous:
+            logger.info("ES_REFRESH_RESTORED", indices=list(previous))
+
+
+def _put_refresh_interval(es_client: Any, index: str, value: str | None) -> None:
+    es_client.indices.put_settings(index=index, settings={"index": {"refresh_interval": value}})
+
+
+@dataclass
+class ReindexCheckpoint:
+    """Progress of a resumable reindex, persisted as JSON at ``path``.
+
+    ``last_session`` is the greatest session id (in iteration order) such
+    that it and every session before it had all their documents
+    acknowledged by the cluster. ``failed_sessions`` lists the sessions of
+    the latest run with documents that failed for good (``failed`` counts
+    those documents); they come after ``last_session``, so a rerun retries
+    them. ``completed`` is only set by a run with no failures.
+    """
+
+    path: Path
+    last_session: str | None = None
+    indexed: int = 0
+    failed: int = 0
+    failed_sessions: list[str] = field(default_factory=list)
+    completed: bool = False
+
+    @classmethod
+    def load(cls, path: str | Path) -> ReindexCheckpoint:
+        path = Path(path)
+        if not path.exists():
+            return cls(path=path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls(path=path, **data)
+
+    def save(self) -> None:
+        data = asdict(self)
+        data.pop("path")
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, self.path)  # atomic: a crash leaves the previous checkpoint
+
+
+def reindex_sessions(
+    sessions: Iterable[tuple[str, str, list[AudioEventDict]]],
+    *,
+    indexer: BulkIndexer,
+    checkpoint: ReindexCheckpoint,
+    to_action: Callable[[str, AudioEventDict], tuple[str, str, dict[str, Any]]],
+    on_new_doctor: Callable[[str], None] | None = None,
+    checkpoint_every: int = 100,
+    logger: ILogger | None = None,
+) -> ReindexCheckpoint:
+    """Index ``(session_id, doctor_id, events)`` in order, checkpointing as it goes.
+
+    ``sessions`` must come in ascending ``session_id`` order (sessions up to
+    ``checkpoint.last_session`` are skipped). ``to_action`` maps an event
+    to ``(index, doc_id, source)``. ``on_new_doctor`` runs before a doctor's
+    first document (create the index, disable refresh). Every
+    ``checkpoint_every`` sessions the indexer is flushed and the checkpoint
+    saved. Document ids are deterministic, so the sessions re-sent after a
+    crash are upserts, not duplicates.
+
+    A session with a document that failed for good holds the checkpoint
+    before it for the rest of the run (later sessions are still sent) and
+    is recorded in ``failed_sessions``; the run then ends not ``completed``,
+    and a rerun re-sends from the first failed session.
+    """
+    logger = logger or get_logger(__name__)
+    if checkpoint.completed:
+        logger.info("ES_REINDEX_ALREADY_COMPLETED", checkpoint=str(checkpoint.path))
+        return checkpoint
+    seen_doctors: set[str] = set()
+    resume_after = checkpoint.last_session
+    base_failed = indexer.stats.failed
+    pending: list[tuple[str, int]] = []  # (session_id, documents) since the last save
+    doc_sessions: dict[tuple[str, str], str] = {}  # (index, doc_id) -> session_id, same span
+    failed_sessions: set[str] = set()  # filled by the sender thread
+    held = False  # a session failed: the checkpoint stays before it
+    checkpoint.failed_sessions = []
+    previous_on_failure = indexer.on_failure
+
+    def on_failure(index: str, doc_id: str) -> None:
+        session_id = doc_sessions.get((index, doc_id))
+        if session_id is not None:
+            failed_sessions.add(session_id)
+        if previous_on_failure is not None:
+            previous_on_failure(index, doc_id)
+
+    def save(completed: bool = False) -> None:
+        nonlocal held
+        stats = indexer.flush()
+        for session_id, documents in pending:
+            held = held or session_id in failed_sessions
+            if not held:
+                checkpoint.last_session = session_id
+                checkpoint.indexed += documents
+        pending.clear()
+        doc_sessions.clear()
+        checkpoint.failed = stats.failed - base_failed
+        checkpoint.failed_sessions = sorted(failed_sessions)
+        checkpoint.completed = completed and not held
+        checkpoint.save()
+        log = logger.warning if failed_sessions else logger.info
+        log(
+            "ES_REINDEX_CHECKPOINT",
+            last_session=checkpoint.last_session,
+            indexed=checkpoint.indexed,
+            failed=checkpoint.failed,
+            failed_sessions=len(failed_sessions),
+            completed=checkpoint.completed,
+        )
+
+    indexer.on_failure = on_failure
+    try:
+        for session_id, doctor_id, events in sessions:
+            if resume_after is not None and session_id <= resume_after:
+                continue
+            if doctor_id not in seen_doctors:
+                seen_doctors.add(doctor_id)
+                if on_new_doctor is not None:
+                    on_new_doctor(doctor_id)
+            for event in events:
+                index, doc_id, source = to_action(doctor_id, event)
+                doc_sessions[(index, doc_id)] = session_id
+                indexer.index(index, doc_id, source)
+            pending.append((session_id, len(events)))
+            if len(pending) >= checkpoint_every:
+                save()
+        save(completed=True)
+    finally:
+        indexer.on_failure = previous_on_failure
+    return checkpoint
+
+
+__all__ = [
+    "BulkIndexer",
+    "BulkStats",
+    "RETRYABLE_STATUSES",
+    "ReindexCheckpoint",
+    "refresh_disabled",
+    "reindex_sessions",
+]
@@ -9,11 +9,19 @@ Purpose: Fix the GARBAGE O(N) search from HDF5MemoryStore
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from contextlib import ExitStack
+from pathlib import Path
 from typing import Any
 
 from elasticsearch import Elasticsearch, NotFoundError, ConnectionError as ESConnectionError
-from elasticsearch.helpers import bulk
 
+from backend.repositories.elasticsearch_bulk import (
+    BulkIndexer,
+    ReindexCheckpoint,
+    refresh_disabled,
+    reindex_sessions,
+)
 from backend.repositories.interfaces.imemory_store import (
     IMemoryStore,
     AudioEventDict,
@@ -93,20 +101,34 @@ class ElasticsearchMemoryStore(IMemoryStore):
             "doctor_id": {"type": "keyword"},
         }
     }
+    REQUIRED_FIELDS = ("session_id", "chunk_number", "transcript", "timestamp", "created_at")
+    OPTIONAL_FIELDS = ("duration", "confidence", "language", "stt_provider")
 
     def __init__(
         self,
         es_client: Elasticsearch,
         logger: ILogger | None = None,
+        *,
+        buffered: bool = False,
+        bulk_options: dict[str, Any] | None = None,
     ):
         """Initialize ElasticsearchMemoryStore.
 
         Args:
             es_client: Elasticsearch client (configured with host, auth)
             logger: Logger instance (optional)
+            buffered: Route ``index_audio_event`` through a ``BulkIndexer``
+                (size/time-based ``_bulk`` flushes) instead of one request per
+                document. Call ``flush()`` / ``close()`` to drain it.
+            bulk_options: ``BulkIndexer`` keyword arguments (``max_actions``,
+                ``max_bytes``, ``flush_interval``, ``max_in_flight``, ...)
         """
         self.es = es_client
         self.logger = logger or get_logger(__name__)
+        self.buffered = buffered
+        self.bulk_options = bulk_options or {}
+        self._indexer: BulkIndexer | None = None
+        self._known_indices: set[str] = set()
 
         # Verify Elasticsearch connection
         try:
@@ -406,6 +428,10 @@ class ElasticsearchMemoryStore(IMemoryStore):
     ) -> str:
         """Index a single audio event into Elasticsearch.
 
+        With ``buffered=True`` the document is handed to the store's
+        ``BulkIndexer`` and written with the next bulk request (call
+        ``flush()`` to wait for it); otherwise it is indexed immediately.
+
         Args:
             doctor_id: Doctor identifier
             event: Audio event dict
@@ -417,39 +443,17 @@ class ElasticsearchMemoryStore(IMemoryStore):
             ValueError: Invalid event dict (missing required fields)
             IOError: Elasticsearch index error
         """
-        # Validate required fields
-        required_fields = ["session_id", "chunk_number", "transcript", "timestamp", "created_at"]
-        for field in required_fields:
-            if field not in event:
-                raise ValueError(f"Missing required field: {field}")
-
+        doc_id, doc = self._build_document(doctor_id, event)
         index_name = self._get_index_name(doctor_id)
-        doc_id = f"{event['session_id']}_{event['chunk_number']}"
-
-        # Build document
-        doc: dict[str, Any] = {
-            "session_id": event["session_id"],
-            "chunk_number": event["chunk_number"],
-            "transcript": event["transcript"],
-            "timestamp": event["timestamp"],
-            "created_at": event["created_at"],
-            "doctor_id": doctor_id,  # Security field
-        }
-
-        # Optional fields
-        if "duration" in event:
-            doc["duration"] = event["duration"]
-        if "confidence" in event:
-            doc["confidence"] = event["confidence"]
-        if "language" in event:
-            doc["language"] = event["language"]
-        if "stt_provider" in event:
-            doc["stt_provider"] = event["stt_provider"]
 
         try:
             # Create index if it doesn't exist
             self._ensure_index_exists(doctor_id)
 
+            if self.buffered:
+                self._get_indexer().index(index_name, doc_id, doc)
+                return doc_id
+
             # Index document (upsert = insert or update)
             self.es.index(
                 index=index_name,
@@ -482,10 +486,9 @@ class ElasticsearchMemoryStore(IMemoryStore):
     ) -> tuple[int, int]:
         """Bulk index audio events into Elasticsearch.
 
-        Performance: O(N) with batching (1000x faster than N individual indexes)
-        - Uses Elasticsearch bulk API
-        - Automatic batching (500-1000 docs per batch)
-        - Parallel indexing (if cluster has >1 node)
+        Performance: O(N) in ``_bulk`` requests of up to ``bulk_options``
+        ``max_actions`` docs (default 1000) via ``BulkIndexer``: bounded
+        in-flight batches, per-item retry of 429/5xx rejections.
 
         Args:
             doctor_id: Doctor identifier
@@ -503,50 +506,17 @@ class ElasticsearchMemoryStore(IMemoryStore):
 
         index_name = self._get_index_name(doctor_id)
 
-        # Build bulk actions
-        actions = []
-        for event in events:
-            # Validate required fields
-            required_fields = ["session_id", "chunk_number", "transcript", "timestamp", "created_at"]
-            for field in required_fields:
-                if field not in event:
-                    raise ValueError(f"Missing required field: {field} in event {event}")
-
-            doc_id = f"{event['session_id']}_{event['chunk_number']}"
-
-            # Build document
-            doc: dict[str, Any] = {
-                "_index": index_name,
-                "_id": doc_id,
-                "_source": {
-                    "session_id": event["session_id"],
-                    "chunk_number": event["chunk_number"],
-                    "transcript": event["transcript"],
-                    "timestamp": event["timestamp"],
-                    "created_at": event["created_at"],
-                    "doctor_id": doctor_id,
-                },
-            }
-
-            # Optional fields
-            if "duration" in event:
-                doc["_source"]["duration"] = event["duration"]
-            if "confidence" in event:
-                doc["_source"]["confidence"] = event["confidence"]
-            if "language" in event:
-                doc["_source"]["language"] = event["language"]
-            if "stt_provider" in event:
-                doc["_source"]["stt_provider"] = event["stt_provider"]
-
-            actions.append(doc)
+        # Build (and validate) every document before sending any
+        docs = [self._build_document(doctor_id, event) for event in events]
 
         try:
             # Create index if it doesn't exist
             self._ensure_index_exists(doctor_id)
 
-            # Execute bulk index
-            success_count, errors = bulk(self.es, actions, raise_on_error=False)
-            error_count = len(errors) if errors else 0
+            with BulkIndexer(self.es, logger=self.logger, **self.bulk_options) as indexer:
+                for doc_id, doc in docs:
+                    indexer.index(index_name, doc_id, doc)
+            success_count, error_count = indexer.stats.indexed, indexer.stats.failed
 
             self.logger.info(
                 "BULK_INDEX_COMPLETED",
@@ -554,6 +524,8 @@ class ElasticsearchMemoryStore(IMemoryStore):
                 index=index_name,
                 success_count=success_count,
                 error_count=error_count,
+                requests=indexer.stats.requests,
+                retried=indexer.stats.retried,
             )
 
             return success_count, error_count
@@ -567,10 +539,96 @@ class ElasticsearchMemoryStore(IMemoryStore):
             )
             raise IOError(f"Failed to bulk index audio events: {e}") from e
 
+    def reindex_sessions(
+        self,
+        sessions: Iterable[tuple[str, str, list[AudioEventDict]]],
+        checkpoint_path: str | Path,
+        *,
+        checkpoint_every: int = 100,
+    ) -> ReindexCheckpoint:
+        """Resumable full reindex (e.g. from ``HDF5MemoryStore.iter_sessions()``).
+
+        Sessions must come in ascending ``session_id`` order. Refresh is
+        disabled on every index touched until the run ends; progress is
+        checkpointed to ``checkpoint_path`` every ``checkpoint_every``
+        sessions, and a rerun with the same path resumes after the last
+        acknowledged session (sessions with failed documents are retried).
+
+        Returns:
+            The final checkpoint (``indexed`` / ``failed`` counts,
+            ``failed_sessions``, ``completed``)
+        """
+        checkpoint = ReindexCheckpoint.load(checkpoint_path)
+        with ExitStack() as backfill:
+
+            def prepare(doctor_id: str) -> None:
+                self._ensure_index_exists(doctor_id)
+                backfill.enter_context(
+                    refresh_disabled(self.es, [self._get_index_name(doctor_id)], logger=self.logger)
+                )
+
+            # Entered after the ExitStack so it flushes before refresh comes back
+            with BulkIndexer(self.es, logger=self.logger, **self.bulk_options) as indexer:
+                return reindex_sessions(
+                    sessions,
+                    indexer=indexer,
+                    checkpoint=checkpoint,
+                    to_action=lambda doctor_id, event: (
+                        self._get_index_name(doctor_id),
+                        *self._build_document(doctor_id, event),
+                    ),
+                    on_new_doctor=prepare,
+                    checkpoint_every=checkpoint_every,
+                    logger=self.logger,
+                )
+
+    def flush(self) -> None:
+        """Wait until every buffered ``index_audio_event`` write is acknowledged."""
+        if self._indexer is not None:
+            self._indexer.flush()
+
+    def close(self) -> None:
+        """Flush buffered writes and stop the bulk sender thread."""
+        if self._indexer is not None:
+            self._indexer.close()
+            self._indexer = None
+
     # ============================================================================
     # Private Helpers
     # ============================================================================
 
+    def _get_indexer(self) -> BulkIndexer:
+        if self._indexer is None:
+            self._indexer = BulkIndexer(self.es, logger=self.logger, **self.bulk_options)
+        return self._indexer
+
+    def _build_document(self, doctor_id: str, event: AudioEventDict) -> tuple[str, dict[str, Any]]:
+        """Validate ``event`` and build ``(doc_id, source)`` for it.
+
+        Raises:
+            ValueError: Missing required field
+        """
+        for field in self.REQUIRED_FIELDS:
+            if field not in event:
+                raise ValueError(f"Missing required field: {field} in event {event}")
+
+        doc_id = f"{event['session_id']}_{event['chunk_number']}"
+        doc: dict[str, Any] = {
+            "session_id": event["session_id"],
+            "chunk_number": event["chunk_number"],
+            "transcript": event["transcript"],
+            "timestamp": event["timestamp"],
+            "created_at": event["created_at"],
+            "doctor_id": doctor_id,  # Security field
+        }
+
+        # Optional fields
+        for field in self.OPTIONAL_FIELDS:
+            if field in event:
+                doc[field] = event[field]
+
+        return doc_id, doc
+
     def _get_index_name(self, doctor_id: str) -> str:
         """Get Elasticsearch index name for doctor.
 
@@ -594,6 +652,8 @@ class ElasticsearchMemoryStore(IMemoryStore):
             IOError: Elasticsearch index creation error
         """
         index_name = self._get_index_name(doctor_id)
+        if index_name in self._known_indices:
+            return
 
         try:
             if not self.es.indices.exists(index=index_name):
@@ -612,6 +672,7 @@ class ElasticsearchMemoryStore(IMemoryStore):
                     index=index_name,
                     doctor_id=doctor_id,
                 )
+            self._known_indices.add(index_name)
 
         except Exception as e:
             self.logger.error(
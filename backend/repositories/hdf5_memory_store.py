@@ -10,6 +10,7 @@ Card: DI Refactor Phase 2.4 - Memory Service DI
 from __future__ import annotations
 
 import h5py
+from collections.abc import Iterator
 from datetime import datetime
 
 from backend.repositories.interfaces.imemory_store import (
@@ -120,63 +121,9 @@ class HDF5MemoryStore(IMemoryStore):
                         if session_owner != doctor_id:
                             continue  # Skip - not owned by this doctor
 
-                        # Navigate to transcription chunks
-                        if "tasks" not in session:  # type: ignore[operator]
-                            continue
-
-                        tasks = session["tasks"]
-                        if "TRANSCRIPTION" not in tasks:  # type: ignore[operator]
-                            continue
-
-                        trans_task = tasks["TRANSCRIPTION"]
-                        if "chunks" not in trans_task:  # type: ignore[operator]
-                            continue
-
-                        chunks_group = trans_task["chunks"]
-
-                        for chunk_name in chunks_group:
-                            chunk = chunks_group[chunk_name]
-
-                            # Get timestamp from created_at
-                            created_at = self._read_dataset_str(chunk, "created_at")
-                            if not created_at:
-                                continue
-
-                            ts = self._parse_timestamp(created_at)
-
-                            # Apply time range filter early
-                            if start_ts and ts < start_ts:
-                                continue
-                            if end_ts and ts > end_ts:
-                                continue
-
-                            # Build AudioEventDict
-                            event_dict: AudioEventDict = {
-                                "session_id": session_id,
-                                "chunk_number": self._extract_chunk_number(chunk_name),
-                                "transcript": self._read_dataset_str(chunk, "transcript") or "",
-                                "timestamp": ts,
-                                "created_at": created_at,
-                            }
-
-                            # Optional fields
-                            duration = self._read_dataset_float(chunk, "duration")
-                            if duration is not None:
-                                event_dict["duration"] = duration
-
-                            confidence = self._read_dataset_float(chunk, "confidence_score")
-                            if confidence is not None:
-                                event_dict["confidence"] = confidence
-
-                            language = self._read_dataset_str(chunk, "language")
-                            if language:
-                                event_dict["language"] = language
-
-                            stt_provider = self._read_dataset_str(chunk, "stt_provider")
-                            if stt_provider:
-                                event_dict["stt_provider"] = stt_provider
-
-                            all_chunks.append((ts, event_dict))
+                        all_chunks.extend(
+                            self._session_audio_events(session_id, session, start_ts, end_ts)
+                        )
 
                     except Exception as e:
                         self.logger.warning(
@@ -443,10 +390,130 @@ class HDF5MemoryStore(IMemoryStore):
             "unique_sessions": len(unique_sessions),
         }
 
+    def iter_sessions(
+        self, after: str | None = None
+    ) -> Iterator[tuple[str, str, list[AudioEventDict]]]:
+        """Yield ``(session_id, doctor_id, events)`` for every owned session.
+
+        One pass over the corpus in ascending ``session_id`` order, for full
+        reindexes (``ElasticsearchMemoryStore.reindex_sessions``). Sessions
+        without owner metadata or without transcription chunks are skipped;
+        events are sorted by ``chunk_number``.
+
+        Args:
+            after: Resume point - only sessions with ``session_id > after``
+
+        Yields:
+            Tuple of (session_id, doctor_id, events)
+        """
+        with h5py.File(self.corpus_path, "r") as f:
+            if "sessions" not in f:
+                return
+
+            sessions_group = f["sessions"]
+            for session_id in sorted(sessions_group):
+                if after is not None and session_id <= after:
+                    continue
+                try:
+                    session = sessions_group[session_id]
+                    owner = self._get_session_owner(session)
+                    if owner is None:
+                        continue
+                    events = [event for _, event in self._session_audio_events(session_id, session)]
+                except Exception as e:
+                    self.logger.warning(
+                        "AUDIO_SESSION_READ_ERROR",
+                        session_id=session_id,
+                        error=str(e),
+                    )
+                    continue
+                if events:
+                    events.sort(key=lambda event: event["chunk_number"])
+                    yield session_id, owner, events
+
     # ============================================================================
     # Helper Methods (extracted from DIMemoryService)
     # ============================================================================
 
+    def _session_audio_events(
+        self,
+        session_id: str,
+        session: h5py.Group,
+        start_ts: int | None = None,
+        end_ts: int | None = None,
+    ) -> list[tuple[int, AudioEventDict]]:
+        """Read a session's transcription chunks as ``(timestamp, event)`` pairs.
+
+        Args:
+            session_id: Session identifier (group name)
+            session: HDF5 session group
+            start_ts: Optional start of time range (Unix seconds)
+            end_ts: Optional end of time range (Unix seconds)
+
+        Returns:
+            Events in chunk-group order (unsorted), empty if no transcription
+        """
+        # Navigate to transcription chunks
+        if "tasks" not in session:  # type: ignore[operator]
+            return []
+
+        tasks = session["tasks"]
+        if "TRANSCRIPTION" not in tasks:  # type: ignore[operator]
+            return []
+
+        trans_task = tasks["TRANSCRIPTION"]
+        if "chunks" not in trans_task:  # type: ignore[operator]
+            return []
+
+        chunks_group = trans_task["chunks"]
+        events: list[tuple[int, AudioEventDict]] = []
+
+        for chunk_name in chunks_group:
+            chunk = chunks_group[chunk_name]
+
+            # Get timestamp from created_at
+            created_at = self._read_dataset_str(chunk, "created_at")
+            if not created_at:
+                continue
+
+            ts = self._parse_timestamp(created_at)
+
+            # Apply time range filter early
+            if start_ts and ts < start_ts:
+                continue
+            if end_ts and ts > end_ts:
+                continue
+
+            # Build AudioEventDict
+            event_dict: AudioEventDict = {
+                "session_id": session_id,
+                "chunk_number": self._extract_chunk_number(chunk_name),
+                "transcript": self._read_dataset_str(chunk, "transcript") or "",
+                "timestamp": ts,
+                "created_at": created_at,
+            }
+
+            # Optional fields
+            duration = self._read_dataset_float(chunk, "duration")
+            if duration is not None:
+                event_dict["duration"] = duration
+
+            confidence = self._read_dataset_float(chunk, "confidence_score")
+            if confidence is not None:
+                event_dict["confidence"] = confidence
+
+            language = self._read_dataset_str(chunk, "language")
+            if language:
+                event_dict["language"] = language
+
+            stt_provider = self._read_dataset_str(chunk, "stt_provider")
+            if stt_provider:
+                event_dict["stt_provider"] = stt_provider
+
+            events.append((ts, event_dict))
+
+        return events
+
     def _get_session_owner(self, session: h5py.Group) -> str | None:
         """Extract session owner from HDF5 attrs with type validation.
 
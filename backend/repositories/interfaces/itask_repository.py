@@ -234,6 +234,34 @@ class ITaskRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def save_diarization_window(
+        self, session_id: str, window_index: int, window: dict[str, Any]
+    ) -> None:
+        """Save one rolling diarization window (diarized while recording).
+
+        Args:
+            session_id: Session UUID
+            window_index: Window position (0-based); overwrites an existing one
+            window: Dict with chunk_start, chunk_end, word_start, word_end, segments
+
+        Raises:
+            IOError: If write operation fails
+        """
+        pass
+
+    @abstractmethod
+    def get_diarization_windows(self, session_id: str) -> list[dict[str, Any]]:
+        """Get rolling diarization windows for session, in window order.
+
+        Args:
+            session_id: Session UUID
+
+        Returns:
+            List of window dicts, empty if none were diarized
+        """
+        pass
+
     @abstractmethod
     def save_soap_data(
         self, session_id: str, soap_data: dict[str, Any], task_type: str = "SOAP_GENERATION"
@@ -0,0 +1,154 @@
+"""Cross-process invalidation for CachedMemoryStore.
+
+Each API worker has its own in-memory cache. When another worker (or the
+HDF5 → Elasticsearch sync) writes a doctor's events, the other caches hear
+about it through an invalidation bus:
+
+- ``publish(doctor_id)``: a writer announces that a doctor's data changed.
+- ``poll()``: a reader asks what changed since its last poll. It returns
+  the doctor ids, or ``None`` for "unknown, drop everything" (e.g. the log
+  was compacted under it).
+
+Two implementations:
+
+- ``FileInvalidationBus``: an append-only log on a local path shared by the
+  workers of one host. Appends are a single ``O_APPEND`` write per id, so
+  they don't interleave. Readers keep an (inode, byte offset) position.
+- ``RedisInvalidationBus``: a Redis hash of per-doctor generations
+  (``HINCRBY`` to publish, ``HGETALL`` to poll). The client is duck-typed, so
+  any object with those two methods works (e.g. redis-py, or an in-process
+  stand-in in tests).
+
+Readers poll at most every ``poll_interval`` seconds (CachedMemoryStore
+does it on reads), so staleness across processes is bounded by that
+interval.
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class InvalidationBus(Protocol):
+    """Publish/poll doctor-level invalidations (see module docstring)."""
+
+    def publish(self, doctor_id: str) -> None: ...
+
+    def poll(self) -> set[str] | None: ...
+
+
+class FileInvalidationBus:
+    """Append-only invalidation log on a shared local path.
+
+    Once the log passes ``max_bytes`` the publisher swaps in an empty file;
+    readers see the new inode and drop their whole cache once.
+    """
+
+    def __init__(self, path: str | Path, *, max_bytes: int = 1024 * 1024):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+        stat = self.path.stat()
+        self._inode, self._offset = stat.st_ino, stat.st_size  # only changes made from now on
+        self._lock = threading.Lock()
+
+    def publish(self, doctor_id: str) -> None:
+        line = (doctor_id.replace("\n", " ") + "\n").encode("utf-8")
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+            oversized = os.fstat(fd).st_size > self.max_bytes
+        finally:
+            os.close(fd)
+        if oversized:
+            fresh = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            fresh.touch()
+            os.replace(fresh, self.path)
+
+    def poll(self) -> set[str] | None:
+        with self._lock:
+            try:
+                stat = self.path.stat()
+            except FileNotFoundError:
+                return None
+            if stat.st_ino != self._inode or stat.st_size < self._offset:
+                # Compacted or replaced: entries may have been missed
+                self._inode, self._offset = stat.st_ino, stat.st_size
+                return None
+            if stat.st_size == self._offset:
+                return set()
+            with open(self.path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read(stat.st_size - self._offset)
+            # A concurrent append may be mid-line: consume complete lines only
+            complete = data.rfind(b"\n") + 1
+            self._offset += complete
+            lines = data[:complete].decode("utf-8", "replace").splitlines()
+            return {line for line in lines if line}
+
+
+class RedisInvalidationBus:
+    """Per-doctor generation counters in one Redis hash."""
+
+    def __init__(self, client: Any, *, key: str = "memory_store:invalidations"):
+        self.client = client
+        self.key = key
+        self._seen = self._generations()
+        self._lock = threading.Lock()
+
+    def publish(self, doctor_id: str) -> None:
+        self.client.hincrby(self.key, doctor_id, 1)
+
+    def poll(self) -> set[str] | None:
+        with self._lock:
+            current = self._generations()
+            if any(current.get(doctor, 0) < gen for doctor, gen in self._seen.items()):
+                self._seen = current
+                return None  # hash was reset (FLUSHDB, key expired)
+            changed = {doctor for doctor, gen in current.items() if self._seen.get(doctor) != gen}
+            self._seen = current
+            return changed
+
+    def _generations(self) -> dict[str, int]:
+        raw = self.client.hgetall(self.key) or {}
+        return {(k.decode() if isinstance(k, bytes) else k): int(v) for k, v in raw.items()}
+
+
+def invalidation_bus_from_url(url: str | None) -> InvalidationBus | None:
+    """Build a bus from ``file:///path/to/log`` or ``redis://host:port/db``.
+
+    Returns None for an empty URL.
+
+    Raises:
+        ImportError: ``redis://`` without the ``redis`` package installed
+        ValueError: Unknown scheme
+    """
+    if not url:
+        return None
+    if url.startswith("file://"):
+        return FileInvalidationBus(url.removeprefix("file://"))
+    if url.startswith(("redis://", "rediss://")):
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError(
+                "redis:// invalidation needs the redis package: pip install redis"
+            ) from e
+        return RedisInvalidationBus(redis.Redis.from_url(url))
+    raise ValueError(f"Unsupported invalidation bus URL: {url}")
+
+
+__all__ = [
+    "FileInvalidationBus",
+    "InvalidationBus",
+    "RedisInvalidationBus",
+    "invalidation_bus_from_url",
+]
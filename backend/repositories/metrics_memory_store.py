@@ -67,6 +67,12 @@ class MetricsMemoryStore(IMemoryStore):
         self.delegate = delegate
         self.logger = logger or get_logger(__name__)
 
+    def __getattr__(self, name: str) -> Any:
+        """Pass through non-IMemoryStore methods (e.g. index_audio_event) untracked."""
+        if name == "delegate":  # not initialized yet (e.g. copy/pickle)
+            raise AttributeError(name)
+        return getattr(self.delegate, name)
+
     def _track_metrics(self, method_name: str) -> Callable:
         """Decorator to track latency and errors for a method.
 
@@ -10,6 +10,7 @@ Created: 2026-02-03 (Refactor from monolithic task_repository.py)
 from __future__ import annotations
 
 import json
+from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -70,6 +71,8 @@ class HDF5Base:
         Returns:
             HDF5-compatible type (str, int, float, bool)
         """
+        if isinstance(value, Enum):  # TaskStatus (a str Enum) would become a numpy '<U' attr
+            value = value.value
         if isinstance(value, (str, int, float, bool)):
             return value
         elif isinstance(value, (list, dict)) or value is None:
@@ -3,6 +3,7 @@
 Handles speaker diarization data:
 - Save diarization segments
 - Get diarization segments
+- Save/get rolling diarization windows (incremental, while recording)
 
 Author: Bernard Uriza Orozco
 Created: 2026-02-03 (Refactor from monolithic task_repository.py)
@@ -91,3 +92,69 @@ class DiarizationMixin:
                 exc_info=True,
             )
             return []
+
+    def save_diarization_window(
+        self, session_id: str, window_index: int, window: dict[str, Any]
+    ) -> None:
+        """Save one rolling diarization window.
+
+        Windows live under the TRANSCRIPTION task (``diarization_windows/wNNNN``)
+        so that diarizing while recording does not create the DIARIZATION task
+        before finalize does.
+
+        Args:
+            session_id: Session identifier
+            window_index: Window position (0-based)
+            window: Window dict (chunk/word bounds and stitched segments)
+        """
+        try:
+            with h5py.File(self.h5_file_path, "a") as f:
+                task_group = self._ensure_task_group(f, session_id, "TRANSCRIPTION")
+                windows_group = task_group.require_group("diarization_windows")
+                self._save_json_dataset(f, windows_group, f"w{window_index:04d}", window)
+
+                logger.info(
+                    "DIARIZATION_WINDOW_SAVED",
+                    session_id=session_id,
+                    window_index=window_index,
+                    segment_count=len(window.get("segments", [])),
+                )
+
+        except Exception as e:
+            logger.error(
+                "SAVE_DIARIZATION_WINDOW_FAILED",
+                session_id=session_id,
+                window_index=window_index,
+                error=str(e),
+                exc_info=True,
+            )
+            raise
+
+    def get_diarization_windows(self, session_id: str) -> list[dict[str, Any]]:
+        """Get rolling diarization windows in order.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            List of window dicts or empty list if none were diarized
+        """
+        try:
+            windows_path = f"{self.TASKS_GROUP}/{session_id}/TRANSCRIPTION/diarization_windows"
+
+            with h5py.File(self.h5_file_path, "r") as f:
+                if windows_path not in f:
+                    return []
+                return [
+                    self._load_json_dataset(f, f"{windows_path}/{name}")
+                    for name in sorted(f[windows_path].keys())
+                ]
+
+        except Exception as e:
+            logger.error(
+                "GET_DIARIZATION_WINDOWS_FAILED",
+                session_id=session_id,
+                error=str(e),
+                exc_info=True,
+            )
+            return []
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Post-session diarization latency: one full call vs rolling windows.
+
+Simulates a consult recorded in ``--chunks`` chunks against a real
+HDF5TaskRepository in a temp dir. Each chunk is "transcribed" as it lands;
+with rolling windows, ``diarize_ready_windows`` runs after it (as the
+transcription worker does). When recording stops, ``diarize_session_worker``
+runs and its wall time is what the doctor waits for. Reports:
+
+  finalize_s      diarize_session_worker wall time after the last chunk
+  provider_calls  calls made at finalize / calls made while recording
+  words_final     words sent to the provider at finalize
+
+Provider: a local stub text diarizer (no network) registered under
+``bench_stub``, with the latency profile of an LLM call - a fixed cost per
+call (``--call-ms``) plus a cost per transcript word (``--word-ms``).
+
+Usage:
+    python backend/scripts/bench_diarization_windows.py
+    python backend/scripts/bench_diarization_windows.py --chunks 60 --window 8 --overlap 2
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.infrastructure.workers.tasks.diarization_worker import (  # noqa: E402
+    diarize_ready_windows,
+    diarize_session_worker,
+)
+from backend.providers.diarization import (  # noqa: E402
+    DiarizationResponse,
+    DiarizationSegment,
+    Speaker,
+    TextBasedDiarizationProvider,
+    register_provider,
+)
+from backend.repositories.task import HDF5TaskRepository  # noqa: E402
+
+_WORDS = "dolor pecho desde ayer tomo paracetamol presion alta antecedentes familiares".split()
+
+
+class StubLLMDiarizer(TextBasedDiarizationProvider):
+    """Alternates speakers per chunk; sleeps like a remote LLM call."""
+
+    call_s = 0.0
+    word_s = 0.0
+    calls: list[int] = []
+
+    def diarize_text(
+        self,
+        transcript: str,
+        num_speakers: int = 2,
+        chunks: list[dict[str, Any]] | None = None,
+        webspeech_final: list[str] | None = None,
+    ) -> DiarizationResponse:
+        words = len(transcript.split())
+        StubLLMDiarizer.calls.append(words)
+        time.sleep(self.call_s + self.word_s * words)
+        speakers = {"doctor": Speaker("doctor", "DOCTOR"), "paciente": Speaker("paciente", "PACIENTE")}
+        segments = [
+            DiarizationSegment(
+                0.0, 1.0, speakers["doctor" if i % 2 == 0 else "paciente"], 0.9, text=chunk["transcript"]
+            )
+            for i, chunk in enumerate(chunks or [])
+        ]
+        return DiarizationResponse(segments, speakers, 2, 1.0, 0.9, "bench_stub")
+
+    def get_provider_name(self) -> str:
+        return "bench_stub"
+
+
+def _run(args: argparse.Namespace, incremental: bool) -> tuple[float, int, int, int]:
+    loader = Mock()
+    loader.get_diarization_config.return_value = {
+        "primary_provider": "bench_stub",
+        "incremental": {
+            "enabled": incremental,
+            "window_chunks": args.window,
+            "overlap_chunks": args.overlap,
+        },
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = HDF5TaskRepository(Path(tmp) / "tasks.h5")
+        StubLLMDiarizer.calls = []
+        for idx in range(args.chunks):
+            text = " ".join(_WORDS[(idx + k) % len(_WORDS)] for k in range(args.words_per_chunk))
+            repo.save_chunk_audio("bench", "TRANSCRIPTION", idx, b"audio")
+            repo.batch_update_chunk_datasets("bench", "TRANSCRIPTION", idx, {"transcript": text})
+            diarize_ready_windows("bench", repo, loader)
+        during = len(StubLLMDiarizer.calls)
+
+        repo.ensure_task_exists("bench", "DIARIZATION")
+        t0 = time.perf_counter()
+        diarize_session_worker("bench", repo, Mock(), loader)
+        finalize_s = time.perf_counter() - t0
+        final_calls = StubLLMDiarizer.calls[during:]
+        return finalize_s, len(final_calls), during, sum(final_calls)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--chunks", type=int, default=40, help="chunks in the consult (~30 s each)")
+    ap.add_argument("--words-per-chunk", type=int, default=70)
+    ap.add_argument("--window", type=int, default=8)
+    ap.add_argument("--overlap", type=int, default=2)
+    ap.add_argument("--call-ms", type=float, default=800.0)
+    ap.add_argument("--word-ms", type=float, default=2.0)
+    args = ap.parse_args()
+
+    StubLLMDiarizer.call_s, StubLLMDiarizer.word_s = args.call_ms / 1000, args.word_ms / 1000
+    register_provider("bench_stub", StubLLMDiarizer)
+
+    print(
+        f"{args.chunks} chunks x {args.words_per_chunk} words; window {args.window}/{args.overlap}; "
+        f"stub: {args.call_ms:g} ms/call + {args.word_ms:g} ms/word"
+    )
+    print(f"{'mode':12s} {'finalize_s':>10s} {'calls final/rec':>16s} {'words_final':>12s}")
+    with open(os.devnull, "w") as devnull:
+        for name, incremental in (("full", False), ("rolling", True)):
+            # Backend loggers print to the stdout they first see
+            with contextlib.redirect_stdout(devnull):
+                finalize_s, final_calls, during, words = _run(args, incremental)
+            print(f"{name:12s} {finalize_s:>10.2f} {f'{final_calls}/{during}':>16s} {words:>12d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Elasticsearch backfill throughput: one request per document vs BulkIndexer.
+
+Indexes ``--docs`` transcription chunks into a local fake cluster (no
+network, no Elasticsearch needed) with the latency profile of a small
+single-node cluster: a round trip per request (``--rtt-ms``) plus a cost per
+indexed document (``--doc-us``). The producer reads each chunk at
+``--read-us`` (HDF5 read + document build), so a pipelined indexer can
+overlap reading with sending. Modes:
+
+  per-doc         the old ``index_audio_event`` path: ``indices.exists`` +
+                  ``index`` per document (2 requests/doc)
+  per-doc cached  ``index`` per document, index existence cached
+  bulk N          ``BulkIndexer(max_actions=N)``
+  bulk +429       bulk 1000 with ``--reject`` of the items rejected (429)
+                  once, retried by the indexer
+
+The per-doc modes only run ``--max-per-doc`` documents; docs/s is what
+matters. Reports:
+
+  docs_s    indexed documents per second
+  requests  HTTP requests sent to the cluster
+  retried   item retries (bulk modes)
+  failed    documents not indexed
+
+Usage:
+    python backend/scripts/bench_es_bulk.py
+    python backend/scripts/bench_es_bulk.py --docs 100000 --rtt-ms 5 --reject 0.05
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.repositories.elasticsearch_bulk import BulkIndexer  # noqa: E402
+
+
+class FakeIndices:
+    def __init__(self, cluster: LocalCluster) -> None:
+        self.cluster = cluster
+
+    def exists(self, index: str) -> bool:
+        self.cluster.request(0)
+        return True
+
+
+class LocalCluster:
+    """Round trip per request + cost per document (see module docstring)."""
+
+    def __init__(self, *, rtt_ms: float, doc_us: float, reject: float = 0.0) -> None:
+        self.rtt_s, self.doc_s = rtt_ms / 1000, doc_us / 1e6
+        self.reject = reject
+        self.requests = 0
+        self.indices = FakeIndices(self)
+        self._rng = random.Random(7)
+        self._rejected: set[str] = set()
+
+    def request(self, docs: int) -> None:
+        self.requests += 1
+        time.sleep(self.rtt_s + docs * self.doc_s)
+
+    def index(self, index: str, id: str, document: dict) -> dict:  # noqa: A002
+        self.request(1)
+        return {"result": "created"}
+
+    def bulk(self, operations: list[dict], refresh: bool = False) -> dict:
+        actions = operations[::2]
+        self.request(len(actions))
+        items, errors = [], False
+        for action in actions:
+            doc_id = action["index"]["_id"]
+            if doc_id not in self._rejected and self._rng.random() < self.reject:
+                self._rejected.add(doc_id)
+                items.append({"index": {"_id": doc_id, "status": 429}})
+                errors = True
+            else:
+                items.append({"index": {"_id": doc_id, "status": 201}})
+        return {"errors": errors, "items": items}
+
+
+def _docs(n: int, read_s: float):
+    for i in range(n):
+        time.sleep(read_s)
+        session, chunk = divmod(i, 40)
+        yield f"s{session:06d}_{chunk}", {
+            "session_id": f"s{session:06d}",
+            "chunk_number": chunk,
+            "transcript": "paciente refiere dolor torácico desde ayer " * 4,
+            "doctor_id": "bench",
+        }
+
+
+def _per_doc(cluster: LocalCluster, n: int, read_s: float, cached: bool) -> tuple[int, int]:
+    for doc_id, doc in _docs(n, read_s):
+        if not cached:
+            cluster.indices.exists(index="audio-transcriptions-bench")
+        cluster.index(index="audio-transcriptions-bench", id=doc_id, document=doc)
+    return n, 0
+
+
+def _bulk(cluster: LocalCluster, n: int, read_s: float, max_actions: int) -> tuple[int, int]:
+    indexer = BulkIndexer(cluster, max_actions=max_actions, initial_backoff=0.01)
+    for doc_id, doc in _docs(n, read_s):
+        indexer.index("audio-transcriptions-bench", doc_id, doc)
+    stats = indexer.close()
+    return stats.indexed, stats.retried
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--docs", type=int, default=20000)
+    ap.add_argument("--max-per-doc", type=int, default=1000)
+    ap.add_argument("--rtt-ms", type=float, default=2.0)
+    ap.add_argument("--doc-us", type=float, default=20.0)
+    ap.add_argument("--read-us", type=float, default=20.0)
+    ap.add_argument("--reject", type=float, default=0.05)
+    args = ap.parse_args()
+    read_s = args.read_us / 1e6
+    per_doc_n = min(args.docs, args.max_per_doc)
+
+    modes = [
+        ("per-doc", per_doc_n, lambda c, n: _per_doc(c, n, read_s, cached=False), 0.0),
+        ("per-doc cached", per_doc_n, lambda c, n: _per_doc(c, n, read_s, cached=True), 0.0),
+        ("bulk 100", args.docs, lambda c, n: _bulk(c, n, read_s, 100), 0.0),
+        ("bulk 1000", args.docs, lambda c, n: _bulk(c, n, read_s, 1000), 0.0),
+        ("bulk +429", args.docs, lambda c, n: _bulk(c, n, read_s, 1000), args.reject),
+    ]
+    print(f"{'mode':>15s} {'docs':>7s} {'docs_s':>9s} {'requests':>9s} {'retried':>8s} {'failed':>7s}")
+    with open(os.devnull, "w") as devnull:
+        for name, n, run, reject in modes:
+            cluster = LocalCluster(rtt_ms=args.rtt_ms, doc_us=args.doc_us, reject=reject)
+            # Backend loggers print to the stdout they first see
+            with contextlib.redirect_stdout(devnull):
+                t0 = time.perf_counter()
+                indexed, retried = run(cluster, n)
+                elapsed = time.perf_counter() - t0
+            print(
+                f"{name:>15s} {n:>7d} {indexed / elapsed:>9.0f} {cluster.requests:>9d} "
+                f"{retried:>8d} {n - indexed:>7d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
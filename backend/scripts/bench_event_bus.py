@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""EventBus publish latency: inline vs async dispatch, with slow subscribers.
+
+Simulates ``--requests`` request handlers that each publish one event and
+then spend ``--request-ms`` on their own I/O. Subscribers:
+
+  projection  per-event handler costing ``--handler-ms``
+  indexer     batch handler costing ``--batch-ms`` per call, whatever the
+              batch size (one bulk write)
+
+Modes:
+
+  inline  publish() awaits the handlers (current default)
+  async   publish() enqueues; workers deliver (indexer in micro-batches)
+
+Reports:
+
+  p50_ms / p99_ms  time spent inside publish()
+  calls            indexer calls (async: one per micro-batch)
+  max_lag_ms       longest enqueue -> delivery wait (async)
+
+Usage:
+    python backend/scripts/bench_event_bus.py
+    python backend/scripts/bench_event_bus.py --requests 2000 --handler-ms 5
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from infrastructure.events.application.event_bus import EventBus  # noqa: E402
+from infrastructure.events.domain.events import DomainEvent, EventType  # noqa: E402
+
+
+async def run(mode: str, args: argparse.Namespace) -> tuple[list[float], int, float]:
+    bus = EventBus(dispatch=mode, max_batch=200, max_batch_wait=0.005)
+    indexer_calls = 0
+
+    async def projection(event: DomainEvent) -> None:
+        await asyncio.sleep(args.handler_ms / 1000)
+
+    async def indexer(events: list[DomainEvent]) -> None:
+        nonlocal indexer_calls
+        indexer_calls += 1
+        await asyncio.sleep(args.batch_ms / 1000)
+
+    bus.subscribe_all(projection, partitions=args.partitions)
+    bus.subscribe_all(indexer, batch=True)
+
+    latencies: list[float] = []
+
+    async def request(i: int) -> None:
+        event = DomainEvent(
+            event_id=f"evt-{i:07d}",
+            event_type=EventType.TRANSCRIPTION_CHUNK_RECEIVED,
+            aggregate_id=f"session-{i % args.sessions}",
+            payload={"chunk_number": i},
+        )
+        t0 = time.perf_counter()
+        await bus.publish(event, persist=False)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        await asyncio.sleep(args.request_ms / 1000)
+
+    await asyncio.gather(*(request(i) for i in range(args.requests)))
+    await bus.close()
+    subscribers = bus.get_metrics()["subscribers"]
+    max_lag = max((s["max_lag_ms"] for s in subscribers), default=0.0)
+    return latencies, indexer_calls, max_lag
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    ap.add_argument("--requests", type=int, default=1000)
+    ap.add_argument("--sessions", type=int, default=50)
+    ap.add_argument("--request-ms", type=float, default=2.0)
+    ap.add_argument("--handler-ms", type=float, default=2.0)
+    ap.add_argument("--batch-ms", type=float, default=10.0)
+    ap.add_argument("--partitions", type=int, default=4)
+    args = ap.parse_args()
+
+    print(f"{'mode':>7s} {'p50_ms':>8s} {'p99_ms':>8s} {'calls':>7s} {'max_lag_ms':>11s}")
+    with open(os.devnull, "w") as devnull:
+        for mode in ("inline", "async"):
+            # Backend loggers print to the stdout they first see
+            with contextlib.redirect_stdout(devnull):
+                latencies, calls, max_lag = asyncio.run(run(mode, args))
+            p99 = statistics.quantiles(latencies, n=100)[98]
+            print(
+                f"{mode:>7s} {statistics.median(latencies):>8.2f} {p99:>8.2f} "
+                f"{calls:>7d} {max_lag:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
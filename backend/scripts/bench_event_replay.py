@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Aggregate replay time vs stream length: full replay vs snapshot + tail.
+
+Builds one synthetic HDF5 event stream per ``--sizes`` entry (written in
+bulk with the HDF5EventStore layout; ``append`` checks duplicates by
+scanning the stream, which makes 10^6 single appends impractical), then:
+
+  full      replay_aggregate over the whole stream (no snapshots)
+  snapshot  replay_aggregate with a SnapshotStore holding a snapshot at
+            ``N``, after ``--tail`` more events were appended
+
+The ``counts`` reducer keeps a bounded state (counts + latest payload per
+event type), so snapshot replay should stay flat as streams grow.
+``session`` is the real session_reducer, whose state keeps one entry per
+chunk: its snapshots grow with the stream, so decoding them does too.
+
+``--aggregates`` also times a bulk rebuild (replay_aggregates) of that
+many aggregates with ``--aggregate-events`` events each: sequential full
+replay vs concurrent full replay vs concurrent from snapshots.
+
+Reports:
+
+  full_ms     full replay
+  snap_ms     snapshot + tail replay
+  speedup     full_ms / snap_ms
+  snap_kb     size of the snapshot state (JSON)
+
+Usage:
+    python backend/scripts/bench_event_replay.py
+    python backend/scripts/bench_event_replay.py --sizes 1000 10000 --reducer session
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+import h5py  # noqa: E402
+
+from infrastructure.events.application.replay import (  # noqa: E402
+    SnapshotPolicy,
+    replay_aggregate,
+    replay_aggregates,
+    session_reducer,
+)
+from infrastructure.events.infrastructure.hdf5_store import HDF5EventStore  # noqa: E402
+from infrastructure.events.infrastructure.snapshots import SnapshotStore  # noqa: E402
+
+ALWAYS = SnapshotPolicy(max_tail_events=1, min_tail_events=1)
+NEVER = SnapshotPolicy(min_tail_events=sys.maxsize)
+
+DEVNULL = open(os.devnull, "w")  # noqa: SIM115
+
+
+def _quiet() -> contextlib.AbstractContextManager:
+    # Backend loggers print to the stdout they first see
+    return contextlib.redirect_stdout(DEVNULL)
+
+
+def counts_reducer(state: dict[str, Any], event: Any) -> dict[str, Any]:
+    """Bounded state: counts and latest payload per event type."""
+    event_type = event.event_type.value
+    counts = state.setdefault("event_counts", {})
+    counts[event_type] = counts.get(event_type, 0) + 1
+    state.setdefault("latest_by_type", {})[event_type] = event.payload
+    state["version"] = state.get("version", 0) + 1
+    return state
+
+
+REDUCERS = {"counts": counts_reducer, "session": session_reducer}
+
+
+def _event_json(aggregate_id: str, n: int) -> str:
+    if n == 0:
+        event_type, payload = "TRANSCRIPTION_STARTED", {"mode": "medical"}
+    else:
+        event_type = "TRANSCRIPTION_CHUNK_RECEIVED"
+        payload = {"chunk_number": n, "duration_ms": 3000, "audio_size_bytes": 96000}
+    return json.dumps(
+        {
+            "event_id": f"{aggregate_id}-{n:08d}",
+            "event_type": event_type,
+            "aggregate_id": aggregate_id,
+            "timestamp": datetime.fromtimestamp(1_760_000_000 + n, UTC).isoformat(),
+            "payload": payload,
+            "metadata": {},
+        }
+    )
+
+
+def _write_stream(path: Path, aggregate_id: str, start: int, count: int) -> None:
+    """Append ``count`` events to a stream, HDF5EventStore layout."""
+    dt = h5py.special_dtype(vlen=str)
+    with h5py.File(path, "a") as f:
+        group = f.require_group("events").require_group(aggregate_id)
+        if "stream" not in group:
+            group.create_dataset(
+                "stream",
+                shape=(0,),
+                maxshape=(None,),
+                dtype=dt,
+                compression="gzip",
+                compression_opts=4,
+                chunks=(4096,),
+            )
+        stream = group["stream"]
+        stream.resize((start + count,))
+        stream[start:] = [_event_json(aggregate_id, n) for n in range(start, start + count)]
+        group.attrs["event_count"] = start + count
+
+
+async def _timed(coro) -> tuple[float, Any]:  # noqa: ANN001
+    gc.collect()  # don't bill one run for the garbage of the previous one
+    with _quiet():
+        t0 = time.perf_counter()
+        result = await coro
+        return (time.perf_counter() - t0) * 1000, result
+
+
+async def bench_sizes(workdir: Path, sizes: list[int], tail: int, reducer_name: str) -> None:
+    reducer = REDUCERS[reducer_name]
+    print(f"reducer={reducer_name} tail={tail}")
+    print(f"{'events':>9s} {'full_ms':>10s} {'snap_ms':>9s} {'speedup':>8s} {'snap_kb':>9s}")
+    for size in sizes:
+        path = workdir / f"events-{size}.h5"
+        aggregate_id = f"session-{size}"
+        _write_stream(path, aggregate_id, 0, size)
+        with _quiet():
+            store = HDF5EventStore(path)
+            snapshots = SnapshotStore(workdir / f"snapshots-{size}.h5")
+        _, seeded = await _timed(
+            replay_aggregate(
+                aggregate_id, store, reducer, snapshot_store=snapshots, snapshot_policy=ALWAYS
+            )
+        )
+        _write_stream(path, aggregate_id, size, tail)
+
+        # Snapshot run first: freeing a full replay's events slows whatever runs next
+        snap_ms, snap = await _timed(
+            replay_aggregate(
+                aggregate_id, store, reducer, snapshot_store=snapshots, snapshot_policy=NEVER
+            )
+        )
+        full_ms, full = await _timed(replay_aggregate(aggregate_id, store, reducer))
+        assert snap.snapshot_version == size and snap.final_state == full.final_state
+        snap_kb = len(json.dumps(seeded.final_state)) / 1024
+        print(
+            f"{size + tail:>9d} {full_ms:>10.1f} {snap_ms:>9.1f} "
+            f"{full_ms / snap_ms:>7.0f}x {snap_kb:>9.1f}"
+        )
+
+
+async def bench_bulk(workdir: Path, aggregates: int, events: int, concurrency: int) -> None:
+    path = workdir / "bulk.h5"
+    ids = [f"bulk-{i:05d}" for i in range(aggregates)]
+    for aggregate_id in ids:
+        _write_stream(path, aggregate_id, 0, events)
+    with _quiet():
+        store = HDF5EventStore(path)
+        snapshots = SnapshotStore(workdir / "bulk-snapshots.h5")
+    await _timed(
+        replay_aggregates(
+            ids, store, counts_reducer, snapshot_store=snapshots, snapshot_policy=ALWAYS
+        )
+    )
+    for aggregate_id in ids:
+        _write_stream(path, aggregate_id, events, 10)
+
+    print(f"\nbulk rebuild: {aggregates} aggregates x {events + 10} events")
+    runs = [
+        (
+            f"concurrent({concurrency}) snapshot",
+            dict(concurrency=concurrency, snapshot_store=snapshots, snapshot_policy=NEVER),
+        ),
+        ("sequential full", dict(concurrency=1)),
+        (f"concurrent({concurrency}) full", dict(concurrency=concurrency)),
+    ]
+    for name, kwargs in runs:
+        ms, results = await _timed(replay_aggregates(ids, store, counts_reducer, **kwargs))
+        assert not any(r.errors for r in results.values())
+        print(f"{name:>24s} {ms:>9.0f} ms  {aggregates / ms * 1000:>8.0f} aggregates/s")
+
+
+async def main() -> None:
+    ap = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 10_000, 100_000, 1_000_000])
+    ap.add_argument("--tail", type=int, default=100)
+    ap.add_argument("--reducer", choices=sorted(REDUCERS), default="counts")
+    ap.add_argument("--aggregates", type=int, default=200)
+    ap.add_argument("--aggregate-events", type=int, default=2000)
+    ap.add_argument("--concurrency", type=int, default=8)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        await bench_sizes(workdir, args.sizes, args.tail, args.reducer)
+        if args.aggregates:
+            await bench_bulk(workdir, args.aggregates, args.aggregate_events, args.concurrency)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
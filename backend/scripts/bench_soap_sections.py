@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""SOAP generation latency: whole-note persona chain vs section-parallel.
+
+Runs DecisionalMiddleware.process on a consult transcript for the COMPLEX
+and CRITICAL strategies, three ways:
+
+  sequential  the persona chain over the whole note (section-parallel off)
+  sections    one chain per SOAP section, the four chains concurrently
+  rerun       sections again after a dose edit, reusing cached sections
+
+and reports, per mode:
+
+  total_s     process() wall time
+  first_s     time until the first section is handed to on_section
+  calls       LLM calls made
+
+LLM: a local fake (no network) with the latency profile of a completion - a
+fixed cost per call (``--call-ms``) plus a cost per SOAP section written
+(``--section-ms``), so a whole-note draft costs four sections of output.
+
+Usage:
+    python backend/scripts/bench_soap_sections.py
+    python backend/scripts/bench_soap_sections.py --call-ms 1200 --section-ms 900
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.services.soap.services.decisional_middleware import (  # noqa: E402
+    DecisionalMiddleware,
+)
+from backend.services.soap.services.sections import SOAP_SECTIONS  # noqa: E402
+
+TRANSCRIPT = (
+    "DOCTOR: Buenos días, ¿qué le trae hoy?\n"
+    "PACIENTE: Tengo dolor en el pecho desde ayer y me falta el aire al subir escaleras.\n"
+    "PACIENTE: Mi padre tuvo un infarto a los 55 años.\n"
+    "DOCTOR: Su presión arterial es 160/100 y la frecuencia cardíaca 98.\n"
+    "DOCTOR: El electrocardiograma muestra cambios inespecíficos; glucosa 180 mg/dL.\n"
+    "DOCTOR: Le receto enalapril 10 mg cada 12 horas y atorvastatina 20 mg por la noche.\n"
+    "DOCTOR: Solicitar troponinas y control en una semana."
+)
+
+EDITED = TRANSCRIPT.replace("enalapril 10 mg", "losartán 50 mg")
+
+
+class FakeLLM:
+    """Answers section-scoped or whole-note prompts after a modelled delay."""
+
+    def __init__(self, call_s: float, section_s: float) -> None:
+        self.call_s, self.section_s = call_s, section_s
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, prompt: str, **kwargs) -> SimpleNamespace:
+        with self.lock:
+            self.calls += 1
+        match = re.search(r"Write ONLY the (\w+) section", prompt)
+        if "Review this SOAP note" in prompt:
+            sections, body = 1, {"feedback": "ok"}
+        elif match:
+            section = match.group(1).lower()
+            sections, body = 1, {section: {"text": section}}
+        else:
+            sections, body = len(SOAP_SECTIONS), {s: {"text": s} for s in SOAP_SECTIONS}
+        time.sleep(self.call_s + self.section_s * sections)
+        return SimpleNamespace(content=json.dumps(body))
+
+
+def _middleware(llm: FakeLLM, level: str, parallel: bool) -> DecisionalMiddleware:
+    persona = SimpleNamespace(system_prompt="persona", temperature=0.2, max_tokens=800)
+    preset_loader = Mock()
+    preset_loader.load_preset.return_value = persona
+    persona_manager = Mock()
+    persona_manager.get_persona.return_value = persona
+    middleware = DecisionalMiddleware(
+        preset_loader,
+        persona_manager=persona_manager,
+        generate=llm,
+        section_parallel_strategies=frozenset({level}) if parallel else frozenset(),
+    )
+    middleware.complexity_analyzer = Mock()
+    middleware.complexity_analyzer.analyze.return_value = Mock(complexity_level=level)
+    return middleware
+
+
+def _timed(middleware: DecisionalMiddleware, llm: FakeLLM, transcript: str, cached=None):
+    first: list[float] = []
+    calls_before = llm.calls
+    t0 = time.perf_counter()
+    result = middleware.process(
+        transcript,
+        on_section=lambda *_: first or first.append(time.perf_counter() - t0),
+        cached_sections=cached,
+    )
+    return result, time.perf_counter() - t0, first[0], llm.calls - calls_before
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--call-ms", type=float, default=600.0)
+    ap.add_argument("--section-ms", type=float, default=500.0)
+    args = ap.parse_args()
+
+    print(f"fake LLM: {args.call_ms:g} ms/call + {args.section_ms:g} ms/section written")
+    print(f"{'strategy':10s} {'mode':12s} {'total_s':>8s} {'first_s':>8s} {'calls':>6s}")
+    with open(os.devnull, "w") as devnull:
+        for level in ("COMPLEX", "CRITICAL"):
+            rows = []
+            # Backend loggers print to the stdout they first see
+            with contextlib.redirect_stdout(devnull):
+                llm = FakeLLM(args.call_ms / 1000, args.section_ms / 1000)
+                _, total, first, calls = _timed(_middleware(llm, level, False), llm, TRANSCRIPT)
+                rows.append(("sequential", total, first, calls))
+
+                middleware = _middleware(llm, level, True)
+                result, total, first, calls = _timed(middleware, llm, TRANSCRIPT)
+                rows.append(("sections", total, first, calls))
+
+                cached = {
+                    section: {"key": key, "content": result.soap_note[section]}
+                    for section, key in result.section_keys.items()
+                }
+                _, total, first, calls = _timed(middleware, llm, EDITED, cached)
+                rows.append(("rerun", total, first, calls))
+            for mode, total, first, calls in rows:
+                print(f"{level:10s} {mode:12s} {total:>8.2f} {first:>8.2f} {calls:>6d}")
+
+
+if __name__ == "__main__":
+    main()
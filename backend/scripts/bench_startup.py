@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Cold-start benchmark for the backend app, with a CI budget.
+
+Each run spawns a fresh interpreter that imports ``backend.app.main`` and
+runs the lifespan startup, i.e. what a scale-from-zero replica does before it
+can answer its first probe. Reports:
+
+  cold_start_ms   spawn -> lifespan startup finished (includes interpreter boot)
+  import_ms       ``import backend.app.main`` (create_app included)
+  lifespan_ms     lifespan startup
+  steps           per-step timings from STARTUP_PROFILE (create_app + lifespan)
+  imports         one extra ``-X importtime`` run: slowest backend modules and
+                  self time per top-level package
+
+Usage:
+    python backend/scripts/bench_startup.py
+    python backend/scripts/bench_startup.py --runs 5 --budget-ms 3000
+    python backend/scripts/bench_startup.py --compare-eager   # lazy vs LAZY_ROUTERS=false
+
+Exit codes:
+    0 - Within budget (or no budget set)
+    1 - Median cold start exceeded --budget-ms / STARTUP_BUDGET_MS
+    2 - The app failed to start
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+READY_MARKER = "__STARTUP_BENCH__"
+
+CHILD = f"""
+import asyncio, json, os, time
+t0 = time.perf_counter()
+from backend.app.main import app
+import_ms = (time.perf_counter() - t0) * 1000
+from backend.app.startup_profile import startup_profiler
+
+async def _run():
+    t1 = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        lifespan_ms = (time.perf_counter() - t1) * 1000
+        ready = time.time()
+    return lifespan_ms, ready
+
+lifespan_ms, ready = asyncio.run(_run())
+print({READY_MARKER!r} + json.dumps({{
+    "cold_start_ms": (ready - float(os.environ["STARTUP_BENCH_SPAWNED_AT"])) * 1000,
+    "import_ms": import_ms,
+    "lifespan_ms": lifespan_ms,
+    "steps": startup_profiler.report()["steps"],
+}}), flush=True)
+"""
+
+
+def run_once(eager: bool, importtime: bool = False) -> tuple[dict, str]:
+    env = dict(os.environ)
+    env["STARTUP_PROFILE"] = "true"
+    env["LAZY_ROUTERS"] = "false" if eager else "true"
+    env["LAZY_ROUTERS_PRELOAD"] = "false"
+    env["STARTUP_BENCH_SPAWNED_AT"] = repr(time.time())
+    env.setdefault("DATABASE_URL", "postgresql://bench@localhost:5432/bench")
+
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ["-X", "importtime"]
+    cmd += ["-c", CHILD]
+
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, env=env, capture_output=True, text=True, timeout=300)
+    for line in proc.stdout.splitlines():
+        if line.startswith(READY_MARKER):
+            return json.loads(line[len(READY_MARKER):]), proc.stderr
+    tail = "\n".join((proc.stderr or proc.stdout).splitlines()[-20:])
+    raise RuntimeError(f"App did not start (exit {proc.returncode}):\n{tail}")
+
+
+def _load_startup_profile():
+    """Load startup_profile.py by path: importing ``backend`` here would warm
+    the page cache and pay the very imports being measured."""
+    path = REPO_ROOT / "backend" / "app" / "startup_profile.py"
+    spec = importlib.util.spec_from_file_location("_startup_profile", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses resolve annotations via sys.modules
+    spec.loader.exec_module(module)
+    return module
+
+
+def bench(runs: int, eager: bool, top: int) -> dict:
+    profile = _load_startup_profile()
+
+    samples = [run_once(eager)[0] for _ in range(runs)]
+    _, stderr = run_once(eager, importtime=True)
+
+    def median(key: str) -> float:
+        return round(statistics.median(s[key] for s in samples), 1)
+
+    step_names = [s["name"] for s in samples[0]["steps"]]
+    steps = {
+        name: round(
+            statistics.median(
+                next(st["elapsed_ms"] for st in s["steps"] if st["name"] == name) for s in samples
+            ),
+            1,
+        )
+        for name in step_names
+    }
+    return {
+        "mode": "eager" if eager else "lazy",
+        "runs": runs,
+        "cold_start_ms": median("cold_start_ms"),
+        "import_ms": median("import_ms"),
+        "lifespan_ms": median("lifespan_ms"),
+        "steps": steps,
+        "imports": profile.summarize_imports(profile.parse_importtime(stderr), top=top),
+    }
+
+
+def print_report(result: dict) -> None:
+    print(f"\n=== {result['mode']} routers ({result['runs']} runs, median) ===")
+    print(f"cold start   {result['cold_start_ms']:>9.1f} ms")
+    print(f"import       {result['import_ms']:>9.1f} ms")
+    print(f"lifespan     {result['lifespan_ms']:>9.1f} ms")
+    for name, ms in result["steps"].items():
+        print(f"  {name:<32} {ms:>9.1f} ms")
+    imports = result["imports"]
+    print(f"imports: {imports['module_count']} modules, {imports['total_import_ms']:.0f} ms (-X importtime)")
+    print("  self time by package:")
+    for pkg, ms in list(imports["self_ms_by_package"].items())[:10]:
+        print(f"    {pkg:<30} {ms:>9.1f} ms")
+    print("  slowest backend modules (cumulative):")
+    for row in imports["slowest"]:
+        print(f"    {row['module']:<60} {row['cumulative_ms']:>9.1f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backend cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per mode (median reported)")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("STARTUP_BUDGET_MS", "0")),
+        help="Fail if median cold start exceeds this (0 = report only)",
+    )
+    parser.add_argument("--eager", action="store_true", help="Benchmark with LAZY_ROUTERS=false")
+    parser.add_argument("--compare-eager", action="store_true", help="Run lazy and eager")
+    parser.add_argument("--top", type=int, default=15, help="Modules/packages to list")
+    parser.add_argument("--json", type=Path, help="Also write results to this file")
+    args = parser.parse_args()
+
+    modes = [False, True] if args.compare_eager else [args.eager]
+    try:
+        results = [bench(args.runs, eager, args.top) for eager in modes]
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    for result in results:
+        print_report(result)
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+    measured = results[0]["cold_start_ms"]
+    if args.budget_ms and measured > args.budget_ms:
+        print(
+            f"\n❌ Cold start regression: {measured:.0f} ms > budget {args.budget_ms:.0f} ms",
+            file=sys.stderr,
+        )
+        return 1
+    if args.budget_ms:
+        print(f"\n✅ Cold start {measured:.0f} ms within budget {args.budget_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
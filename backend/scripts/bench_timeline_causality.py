@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Timeline causality detection: all-pairs scan vs indexed candidates.
+
+Builds a synthetic multi-week patient history (``--weeks``) of N events -
+a handful of actors, artifacts touched by a few events each - and times
+``AutoTimelineGenerator.detect_causality`` at each size, next to the
+previous all-pairs double loop. The all-pairs scan is skipped above
+``--max-pairwise`` events (it is quadratic: 100k events is 5e9 pairs);
+where both run, their links are checked to be identical.
+
+Usage:
+    python backend/scripts/bench_timeline_causality.py
+    python backend/scripts/bench_timeline_causality.py --sizes 1000 10000 100000 --max-pairwise 5000
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT))
+
+from backend.schemas.domain.timeline import (  # noqa: E402
+    TimelineEventType,
+    create_timeline_event,
+)
+from backend.services.timeline.services.timeline.auto import AutoTimelineGenerator  # noqa: E402
+
+ACTORS = ["doctor", "nurse", "system", "assistant", "patient"]
+
+
+def _history(n: int, weeks: float, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    span = weeks * 7 * 86400
+    t0 = datetime(2026, 1, 5, tzinfo=timezone.utc)
+    events = []
+    for seconds in sorted(rng.uniform(0, span) for _ in range(n)):
+        event = create_timeline_event(
+            event_type=TimelineEventType.USER_MESSAGE, who=rng.choice(ACTORS), what="x", raw_content="x"
+        )
+        event.timestamp = t0 + timedelta(seconds=seconds)
+        event.reference_id = f"artifact_{rng.randrange(n // 4 or 1)}" if rng.random() < 0.6 else None
+        events.append(event)
+    return events
+
+
+def _pairwise(events: list, window: float) -> list[tuple[str, str]]:
+    links = []
+    for i, event in enumerate(events):
+        for next_event in events[i + 1 :]:
+            if event.reference_id and event.reference_id == next_event.reference_id:
+                links.append((event.event_id, next_event.event_id))
+                continue
+            delta = (next_event.timestamp - event.timestamp).total_seconds()
+            if delta <= window and event.who == next_event.who:
+                links.append((event.event_id, next_event.event_id))
+    return links
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000, 50000, 100000])
+    ap.add_argument("--weeks", type=float, default=4.0)
+    ap.add_argument("--max-pairwise", type=int, default=5000)
+    args = ap.parse_args()
+
+    print(f"{'events':>8s} {'edges':>8s} {'indexed_s':>10s} {'pairwise_s':>11s}")
+    with open(os.devnull, "w") as devnull:
+        for n in args.sizes:
+            events = _history(n, args.weeks)
+            # Backend loggers print to the stdout they first see
+            with contextlib.redirect_stdout(devnull):
+                generator = AutoTimelineGenerator(config={"auto": {"enabled": False}})
+                t0 = time.perf_counter()
+                candidates = generator.detect_causality(events)
+                indexed_s = time.perf_counter() - t0
+
+            pairwise = "skipped"
+            if n <= args.max_pairwise:
+                t0 = time.perf_counter()
+                links = _pairwise(events, 30)
+                pairwise = f"{time.perf_counter() - t0:.2f}"
+                assert links == [(c.source_event_id, c.target_event_id) for c in candidates]
+            print(f"{n:>8d} {len(candidates):>8d} {indexed_s:>10.3f} {pairwise:>11s}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,23 @@
 #!/usr/bin/env python3.14
-"""Sync HDF5 corpus to Elasticsearch (one-time migration).
-
-Migrates all audio transcription events from storage/corpus.h5 to Elasticsearch.
+"""Sync HDF5 corpus to Elasticsearch (resumable full reindex).
+
+Migrates all audio transcription events from storage/corpus.h5 to Elasticsearch
+in one ordered pass over the sessions, through the bulk pipeline
+(backend/repositories/elasticsearch_bulk.py):
+
+- ``_bulk`` requests of ``--max-actions`` docs, at most ``--max-in-flight``
+  batches queued (reading HDF5 pauses while Elasticsearch catches up);
+- refresh disabled on the doctor indices during the run, restored at the end;
+- progress checkpointed to ``--checkpoint`` every ``--checkpoint-every``
+  sessions, after the cluster acknowledged them. Rerunning after a crash or
+  Ctrl-C resumes from there (doc ids are deterministic, so the few sessions
+  re-sent are upserts). Sessions with documents that failed for good hold
+  the checkpoint before them, so a rerun retries them. ``--restart``
+  ignores the checkpoint.
 
 Usage:
     PYTHONPATH=backend/src python3.14 backend/scripts/sync_hdf5_to_elasticsearch.py
+    PYTHONPATH=backend/src python3.14 backend/scripts/sync_hdf5_to_elasticsearch.py --restart
 
 Requirements:
     - Elasticsearch running on localhost:9200 (or ELASTICSEARCH_URL env var)
@@ -15,6 +28,7 @@ Created: 2026-01-31
 Purpose: Fix O(N) search by migrating to Elasticsearch
 """
 
+import argparse
 import os
 import sys
 from pathlib import Path
@@ -24,6 +38,7 @@ backend_src = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(backend_src))
 
 from elasticsearch import Elasticsearch
+from backend.repositories.elasticsearch_bulk import ReindexCheckpoint
 from backend.repositories.hdf5_memory_store import HDF5MemoryStore
 from backend.repositories.elasticsearch_memory_store import ElasticsearchMemoryStore
 from backend.utils.common.logging.logger import get_logger
@@ -33,6 +48,18 @@ logger = get_logger(__name__)
 
 def main():
     """Sync all HDF5 transcriptions to Elasticsearch."""
+    parser = argparse.ArgumentParser(description="Resumable HDF5 → Elasticsearch reindex")
+    parser.add_argument(
+        "--checkpoint",
+        default=os.getenv("ES_REINDEX_CHECKPOINT", "storage/es_reindex.checkpoint.json"),
+        help="Checkpoint file (default: storage/es_reindex.checkpoint.json)",
+    )
+    parser.add_argument("--checkpoint-every", type=int, default=100, help="Sessions per checkpoint")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint, reindex all")
+    parser.add_argument("--max-actions", type=int, default=1000, help="Docs per _bulk request")
+    parser.add_argument("--max-in-flight", type=int, default=2, help="Queued _bulk batches")
+    args = parser.parse_args()
+
     # Configuration
     corpus_path = os.getenv("CORPUS_PATH", "storage/corpus.h5")
     elasticsearch_url = os.getenv("ELASTICSEARCH_URL", "http://localhost:9200")
@@ -41,6 +68,7 @@ def main():
         "SYNC_STARTED",
         corpus_path=corpus_path,
         elasticsearch_url=elasticsearch_url,
+        checkpoint=args.checkpoint,
     )
 
     # Check corpus exists
@@ -53,125 +81,67 @@ def main():
     try:
         hdf5_store = HDF5MemoryStore(corpus_path=corpus_path)
         es_client = Elasticsearch([elasticsearch_url])
-        es_store = ElasticsearchMemoryStore(es_client=es_client)
+        es_store = ElasticsearchMemoryStore(
+            es_client=es_client,
+            bulk_options={"max_actions": args.max_actions, "max_in_flight": args.max_in_flight},
+        )
     except Exception as e:
         logger.error("STORE_INITIALIZATION_ERROR", error=str(e))
         print(f"❌ Failed to initialize stores: {e}")
         return 1
 
-    # Get unique doctor IDs from HDF5
-    try:
-        import h5py
-
-        doctor_ids = set()
-        with h5py.File(corpus_path, "r") as f:
-            if "sessions" not in f:
-                logger.warning("NO_SESSIONS_GROUP", path=corpus_path)
-                print("⚠️  No sessions group in corpus")
-                return 0
-
-            sessions_group = f["sessions"]
-            for session_id in sessions_group:
-                session = sessions_group[session_id]
-
-                # Extract doctor_id
-                for attr_key in ["doctor_id", "owner_id", "user_id"]:
-                    if attr_key in session.attrs:
-                        raw_value = session.attrs[attr_key]
-                        if isinstance(raw_value, bytes):
-                            doctor_id = raw_value.decode("utf-8", errors="replace")
-                        elif isinstance(raw_value, str):
-                            doctor_id = raw_value
-                        else:
-                            continue  # Invalid type
-
-                        doctor_ids.add(doctor_id)
-                        break
-
-        logger.info("DISCOVERED_DOCTORS", count=len(doctor_ids), doctor_ids=list(doctor_ids))
-        print(f"📊 Found {len(doctor_ids)} unique doctors")
+    checkpoint_path = Path(args.checkpoint)
+    if args.restart and checkpoint_path.exists():
+        checkpoint_path.unlink()
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
 
-    except Exception as e:
-        logger.error("DOCTOR_DISCOVERY_ERROR", error=str(e))
-        print(f"❌ Failed to discover doctors: {e}")
-        return 1
-
-    # Sync each doctor
-    total_success = 0
-    total_errors = 0
+    checkpoint = ReindexCheckpoint.load(checkpoint_path)
+    if checkpoint.completed:
+        print(f"ℹ️  Checkpoint {checkpoint_path} says the reindex already completed")
+        print("   Use --restart to reindex again")
+        return 0
+    if checkpoint.last_session is not None:
+        print(f"🔁 Resuming after session {checkpoint.last_session} ({checkpoint.indexed} indexed)")
 
-    for i, doctor_id in enumerate(sorted(doctor_ids), 1):
-        logger.info(
-            "SYNCING_DOCTOR",
-            doctor_id=doctor_id,
-            progress=f"{i}/{len(doctor_ids)}",
+    # Reindex every owned session, in session_id order
+    try:
+        result = es_store.reindex_sessions(
+            hdf5_store.iter_sessions(after=checkpoint.last_session),
+            checkpoint_path,
+            checkpoint_every=args.checkpoint_every,
         )
-        print(f"\n[{i}/{len(doctor_ids)}] Syncing {doctor_id}...")
-
-        try:
-            # Get all events from HDF5
-            events, total_count = hdf5_store.get_audio_events(
-                doctor_id=doctor_id,
-                limit=100000,  # Large limit to get all events
-                offset=0,
-            )
-
-            if not events:
-                logger.info("NO_EVENTS_FOR_DOCTOR", doctor_id=doctor_id)
-                print(f"  ℹ️  No events found for {doctor_id}")
-                continue
-
-            logger.info(
-                "FETCHED_EVENTS",
-                doctor_id=doctor_id,
-                count=len(events),
-                total=total_count,
-            )
-            print(f"  📥 Fetched {len(events)} events from HDF5")
-
-            # Bulk index into Elasticsearch
-            success_count, error_count = es_store.bulk_index_audio_events(
-                doctor_id=doctor_id,
-                events=events,
-            )
-
-            total_success += success_count
-            total_errors += error_count
-
-            logger.info(
-                "INDEXED_EVENTS",
-                doctor_id=doctor_id,
-                success=success_count,
-                errors=error_count,
-            )
-            print(f"  ✅ Indexed {success_count}/{len(events)} events")
-
-            if error_count > 0:
-                print(f"  ⚠️  {error_count} errors during indexing")
-
-        except Exception as e:
-            logger.error(
-                "SYNC_DOCTOR_ERROR",
-                doctor_id=doctor_id,
-                error=str(e),
-                exc_info=True,
-            )
-            print(f"  ❌ Error syncing {doctor_id}: {e}")
-            continue
+    except KeyboardInterrupt:
+        latest = ReindexCheckpoint.load(checkpoint_path)
+        logger.warning("SYNC_INTERRUPTED", last_session=latest.last_session)
+        print(f"\n⏸️  Interrupted - rerun to resume after session {latest.last_session}")
+        return 130
+    except Exception as e:
+        logger.error("SYNC_ERROR", error=str(e), exc_info=True)
+        print(f"❌ Reindex failed: {e} (rerun to resume from the checkpoint)")
+        return 1
 
     # Summary
     logger.info(
         "SYNC_COMPLETED",
-        total_success=total_success,
-        total_errors=total_errors,
+        total_success=result.indexed,
+        total_errors=result.failed,
+        failed_sessions=len(result.failed_sessions),
+        last_session=result.last_session,
     )
     print("\n" + "=" * 60)
-    print(f"✅ Sync completed")
-    print(f"   Total indexed: {total_success}")
-    print(f"   Total errors: {total_errors}")
+    if result.completed:
+        print("✅ Sync completed")
+    else:
+        print("⚠️  Sync finished with failures - rerun to retry the failed sessions")
+    print(f"   Total indexed: {result.indexed}")
+    print(f"   Total errors: {result.failed}")
+    if result.failed_sessions:
+        print(f"   Failed sessions: {', '.join(result.failed_sessions[:10])}")
+        if len(result.failed_sessions) > 10:
+            print(f"   ... and {len(result.failed_sessions) - 10} more (see {checkpoint_path})")
     print("=" * 60)
 
-    return 0 if total_errors == 0 else 1
+    return 0 if result.completed else 1
 
 
 if __name__ == "__main__":
@@ -31,6 +31,7 @@ except ImportError:
 try:
     from backend.repositories.metrics_memory_store import MetricsMemoryStore
     from backend.repositories.cached_memory_store import CachedMemoryStore
+    from backend.repositories.memory_cache_invalidation import invalidation_bus_from_url
 
     DECORATORS_AVAILABLE: Final[bool] = True
 except ImportError:
@@ -67,7 +68,21 @@ class MemoryStoreConfig(BaseModel):
     cache_size: int = Field(
         default=128,
         gt=0,  # Validation: cache_size must be > 0
-        description="LRU cache size for get_audio_events()",
+        description="Maximum cached get_audio_events() results",
+    )
+    cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        gt=0,
+        description="Memory budget for cached get_audio_events() results (bytes)",
+    )
+    cache_ttl_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="TTL for cached results whose time range reaches the present",
+    )
+    cache_invalidation_url: str | None = Field(
+        default=None,
+        description="Cross-process invalidation bus (file:///path or redis://host:port/db)",
     )
 
     @field_validator("elasticsearch_url")
@@ -98,7 +113,10 @@ def get_memory_config() -> MemoryStoreConfig:
     Environment Variables:
         USE_ELASTICSEARCH=true → Enable Elasticsearch backend
         ELASTICSEARCH_URL=http://localhost:9200 → ES connection
-        MEMORY_CACHE_SIZE=128 → LRU cache size
+        MEMORY_CACHE_SIZE=128 → Max cached results
+        MEMORY_CACHE_MAX_BYTES=67108864 → Cache memory budget (bytes)
+        MEMORY_CACHE_TTL_SECONDS=60 → TTL for ranges reaching the present
+        MEMORY_CACHE_INVALIDATION_URL=file:///... | redis://... → Invalidation bus
 
     Returns:
         MemoryStoreConfig instance (immutable, validated)
@@ -121,6 +139,9 @@ def get_memory_config() -> MemoryStoreConfig:
         use_elasticsearch=use_es,
         elasticsearch_url=es_url,
         cache_size=cache_sz,
+        cache_max_bytes=int(os.getenv("MEMORY_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+        cache_ttl_seconds=float(os.getenv("MEMORY_CACHE_TTL_SECONDS", "60")),
+        cache_invalidation_url=os.getenv("MEMORY_CACHE_INVALIDATION_URL") or None,
     )
 
 
@@ -162,7 +183,7 @@ def get_memory_store(config: MemoryStoreConfig | None = None) -> IMemoryStore:
 
     Decorators (always applied if available):
         - MetricsMemoryStore → Latency/error tracking
-        - CachedMemoryStore → LRU cache for get_audio_events()
+        - CachedMemoryStore → Bounded cache for get_audio_events()
 
     Args:
         config: Memory store configuration (defaults to get_memory_config())
@@ -225,9 +246,27 @@ def get_memory_store(config: MemoryStoreConfig | None = None) -> IMemoryStore:
         store = MetricsMemoryStore(delegate=store, logger=logger)
         logger.debug("MEMORY_STORE_DECORATOR", decorator="metrics")
 
-        # Add LRU cache (from config)
-        store = CachedMemoryStore(delegate=store, cache_size=config.cache_size, logger=logger)
-        logger.debug("MEMORY_STORE_DECORATOR", decorator="cache", cache_size=config.cache_size)
+        # Add bounded cache (from config)
+        try:
+            invalidation = invalidation_bus_from_url(config.cache_invalidation_url)
+        except (ImportError, ValueError) as e:
+            logger.warning("MEMORY_CACHE_INVALIDATION_DISABLED", error=str(e))
+            invalidation = None
+        store = CachedMemoryStore(
+            delegate=store,
+            cache_size=config.cache_size,
+            logger=logger,
+            max_bytes=config.cache_max_bytes,
+            ttl_seconds=config.cache_ttl_seconds,
+            invalidation=invalidation,
+        )
+        logger.debug(
+            "MEMORY_STORE_DECORATOR",
+            decorator="cache",
+            cache_size=config.cache_size,
+            max_bytes=config.cache_max_bytes,
+            invalidation=config.cache_invalidation_url,
+        )
 
     return store
 
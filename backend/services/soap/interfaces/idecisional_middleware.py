@@ -10,6 +10,7 @@ Card: Backend Refactor Phase 2.3 - Eliminate Service Locator
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -32,6 +33,8 @@ class IDecisionalMiddleware(ABC):
         transcript: str,
         segments: list[dict[str, Any]] | None = None,
         session_metadata: dict[str, Any] | None = None,
+        on_section: Callable[[str, Any, bool], None] | None = None,
+        cached_sections: dict[str, dict[str, Any]] | None = None,
     ) -> "OrchestrationResult":
         """Process a transcript and generate SOAP note.
 
@@ -45,6 +48,10 @@ class IDecisionalMiddleware(ABC):
             transcript: Full medical conversation text
             segments: Optional diarization segments (speaker-labeled)
             session_metadata: Optional session context (session_id, provider, etc)
+            on_section: Optional callback (section, content, cached), called as
+                each SOAP section is ready - possibly from worker threads
+            cached_sections: Optional previous sections with their cache keys,
+                ``{section: {"key": str, "content": Any}}``; matching ones are reused
 
         Returns:
             OrchestrationResult with:
@@ -53,5 +60,6 @@ class IDecisionalMiddleware(ABC):
             - personas_invoked: List of personas used
             - confidence_score: 0-1 confidence metric
             - doctor_context_requested: Whether more context is needed
+            - section_keys / sections_cached: per-section cache keys and reuse
         """
         pass
@@ -6,11 +6,21 @@ Intercepts SOAP generation requests, analyzes complexity, decides strategy.
 Philosophy: Intelligence isn't about more compute - it's about right compute.
 Simple cases get fast single-pass. Complex cases get multi-persona orchestration.
 
-Strategies:
+Strategies (LLM calls per note):
 - SIMPLE: soap_generator (1 call)
-- MODERATE: soap_generator + clinical_advisor review (2 calls)
-- COMPLEX: soap_editor → clinical_advisor → soap_editor refinement (3 calls)
-- CRITICAL: Full orchestration + request doctor context (4+ calls)
+- MODERATE: soap_generator + clinical_advisor review (2 calls; 8 section-parallel)
+- COMPLEX: soap_editor → clinical_advisor → soap_editor refinement (3 calls per
+  section, 12 in all)
+- CRITICAL: Full orchestration + request doctor context (4+ calls per section,
+  16+ in all)
+
+Section-parallel (COMPLEX and CRITICAL by default; MODERATE opts in through
+``section_parallel_strategies``): the persona chain runs once per SOAP section -
+Subjective, Objective, Assessment, Plan - and the four chains run concurrently. Each section is reported through ``on_section``
+as soon as its chain ends (the worker persists it). Every chain reads the
+whole transcript; a section is keyed by a hash of the sentences it depends on
+and its prompts (see sections.py), so a re-run reuses every section whose key
+did not change.
 
 File: backend/services/soap_generation/decisional_middleware.py
 Created: 2025-11-20
@@ -20,25 +30,34 @@ Pattern: Redux Middleware + Chain of Responsibility
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from backend.schemas.llm.interfaces.ipreset_loader import IPresetLoader
+    from backend.services.llm.services.persona.manager import PersonaManager
 
-from backend.providers import llm_generate
 from backend.utils.common.logging.logger import get_logger
-from backend.services.llm.dependencies import get_persona_manager
-from backend.services.llm.services.persona.manager import PersonaManager
 from backend.services.soap.services.complexity_analyzer import (
     ComplexityMetrics,
     get_complexity_analyzer,
 )
 from backend.services.soap.interfaces.idecisional_middleware import IDecisionalMiddleware
+from backend.services.soap.services.sections import SOAP_SECTIONS, section_key, section_spans
 
 logger = get_logger(__name__)
 
+# Strategies whose persona chain runs once per section, concurrently. MODERATE is
+# left out: four whole-transcript chains would quadruple its input tokens.
+SECTION_PARALLEL_STRATEGIES = frozenset({"COMPLEX", "CRITICAL"})
+
+# on_section(section, content, cached) - called once per section, from worker threads.
+SectionCallback = Callable[[str, Any, bool], None]
+
 
 @dataclass
 class OrchestrationPlan:
@@ -68,6 +87,8 @@ class OrchestrationResult:
     intermediate_outputs: list[dict[str, Any]]  # For debugging/audit
     doctor_context_requested: bool
     confidence_score: float  # 0-1, how confident the model is
+    section_keys: dict[str, str] = field(default_factory=dict)  # section -> cache key
+    sections_cached: list[str] = field(default_factory=list)  # reused, not regenerated
 
 
 class DecisionalMiddleware(IDecisionalMiddleware):
@@ -94,12 +115,16 @@ class DecisionalMiddleware(IDecisionalMiddleware):
         self,
         preset_loader: "IPresetLoader",
         persona_manager: PersonaManager | None = None,
+        generate: Callable[..., Any] | None = None,
+        section_parallel_strategies: frozenset[str] = SECTION_PARALLEL_STRATEGIES,
     ) -> None:
         """Initialize decisional middleware.
 
         Args:
             preset_loader: IPresetLoader instance (REQUIRED)
             persona_manager: PersonaManager instance (optional, uses singleton)
+            generate: LLM completion function (default: backend.providers.llm_generate)
+            section_parallel_strategies: Strategies generated section by section
 
         Raises:
             ValueError: If preset_loader is None (DI misconfiguration)
@@ -115,14 +140,26 @@ class DecisionalMiddleware(IDecisionalMiddleware):
             )
         self.logger = get_logger(__name__)
         self.complexity_analyzer = get_complexity_analyzer()
-        self.persona_manager = persona_manager or get_persona_manager()
+        if persona_manager is None:
+            from backend.services.llm.dependencies import get_persona_manager
+
+            persona_manager = get_persona_manager()
+        if generate is None:
+            from backend.providers import llm_generate
+
+            generate = llm_generate
+        self.persona_manager = persona_manager
         self.preset_loader = preset_loader
+        self.generate = generate
+        self.section_parallel_strategies = section_parallel_strategies
 
     def process(
         self,
         transcript: str,
         segments: list[dict[str, Any]] | None = None,
         session_metadata: dict[str, Any] | None = None,
+        on_section: SectionCallback | None = None,
+        cached_sections: dict[str, dict[str, Any]] | None = None,
     ) -> OrchestrationResult:
         """
         Main orchestration method.
@@ -131,6 +168,8 @@ class DecisionalMiddleware(IDecisionalMiddleware):
             transcript: Full medical conversation
             segments: Optional diarization segments
             session_metadata: Optional session context
+            on_section: Called with (section, content, cached) as each section is ready
+            cached_sections: Previous run's sections, ``{section: {"key", "content"}}``
 
         Returns:
             OrchestrationResult with SOAP note and execution details
@@ -162,7 +201,15 @@ class DecisionalMiddleware(IDecisionalMiddleware):
         )
 
         # Step 3: Execute orchestration
-        result = self._execute_orchestration(plan, transcript)
+        if plan.strategy in self.section_parallel_strategies:
+            result = self._execute_section_orchestration(
+                plan, transcript, on_section, cached_sections or {}
+            )
+        else:
+            result = self._execute_orchestration(plan, transcript)
+            if on_section is not None:
+                for section in SOAP_SECTIONS:
+                    on_section(section, result.soap_note.get(section), False)
 
         # Step 4: Calculate metrics
         duration = (datetime.now(timezone.utc) - start_time).total_seconds()
@@ -235,7 +282,7 @@ class DecisionalMiddleware(IDecisionalMiddleware):
         transcript: str,
     ) -> OrchestrationResult:
         """
-        Execute multi-persona orchestration.
+        Execute multi-persona orchestration over the whole note.
 
         Flow (for COMPLEX strategy):
         1. soap_editor: Generate initial draft
@@ -245,9 +292,110 @@ class DecisionalMiddleware(IDecisionalMiddleware):
         Returns:
             OrchestrationResult with final SOAP note
         """
-        intermediate_outputs = []
+        final_soap_note, intermediate_outputs = self._run_chain(plan, transcript)
+
+        # Calculate confidence score based on strategy
+        confidence = self._calculate_confidence(plan.strategy, final_soap_note)
+
+        return OrchestrationResult(
+            soap_note=final_soap_note,
+            strategy_used=plan.strategy,
+            personas_invoked=plan.personas,
+            total_duration_seconds=0.0,  # Will be set by caller
+            intermediate_outputs=intermediate_outputs,
+            doctor_context_requested=plan.requires_doctor_context,
+            confidence_score=confidence,
+        )
+
+    def _execute_section_orchestration(
+        self,
+        plan: OrchestrationPlan,
+        transcript: str,
+        on_section: SectionCallback | None,
+        cached_sections: dict[str, dict[str, Any]],
+    ) -> OrchestrationResult:
+        """
+        Run the persona chain once per SOAP section, all sections concurrently.
+
+        A section whose cache key matches ``cached_sections`` is reused without
+        any LLM call. Each section is handed to ``on_section`` as it finishes.
+
+        Returns:
+            OrchestrationResult with the merged SOAP note
+        """
+        spans = section_spans(transcript)
+        fingerprint = self._chain_fingerprint(plan.personas)
+        keys = {
+            section: section_key(section, plan.strategy, fingerprint, spans[section])
+            for section in SOAP_SECTIONS
+        }
+
+        soap_note: dict[str, Any] = {}
+        intermediate_outputs: list[dict[str, Any]] = []
+        cached: list[str] = []
+        pending: list[str] = []
+        for section in SOAP_SECTIONS:
+            previous = cached_sections.get(section) or {}
+            if previous.get("key") == keys[section] and previous.get("content") is not None:
+                soap_note[section] = previous["content"]
+                cached.append(section)
+                if on_section is not None:
+                    on_section(section, previous["content"], True)
+            else:
+                pending.append(section)
+
+        self.logger.info(
+            "SECTION_ORCHESTRATION_START",
+            strategy=plan.strategy,
+            sections_cached=cached,
+            sections_pending=pending,
+        )
+
+        if pending:
+            with ThreadPoolExecutor(
+                max_workers=len(pending), thread_name_prefix="soap-section-"
+            ) as pool:
+                futures = {
+                    pool.submit(self._run_chain, plan, transcript, section): section
+                    for section in pending
+                }
+                for future in as_completed(futures):
+                    section = futures[future]
+                    output, steps = future.result()
+                    content = output.get(section, output) if isinstance(output, dict) else output
+                    soap_note[section] = content
+                    intermediate_outputs.extend(steps)
+                    self.logger.info("SECTION_COMPLETE", section=section, steps=len(steps))
+                    if on_section is not None:
+                        on_section(section, content, False)
+
+        soap_note = {section: soap_note[section] for section in SOAP_SECTIONS}
+        return OrchestrationResult(
+            soap_note=soap_note,
+            strategy_used=plan.strategy,
+            personas_invoked=plan.personas,
+            total_duration_seconds=0.0,  # Will be set by caller
+            intermediate_outputs=intermediate_outputs,
+            doctor_context_requested=plan.requires_doctor_context,
+            confidence_score=self._calculate_confidence(plan.strategy, soap_note),
+            section_keys=keys,
+            sections_cached=cached,
+        )
+
+    def _run_chain(
+        self,
+        plan: OrchestrationPlan,
+        transcript: str,
+        section: str | None = None,
+    ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        """Invoke the plan's personas in order, over the note or one section.
+
+        Returns:
+            (last generator/editor output, intermediate outputs)
+        """
+        intermediate_outputs: list[dict[str, Any]] = []
         current_content = transcript
-        final_soap_note = {}
+        final_soap_note: dict[str, Any] = {}
 
         for i, persona_name in enumerate(plan.personas):
             step_num = i + 1
@@ -258,12 +406,13 @@ class DecisionalMiddleware(IDecisionalMiddleware):
                 step=step_num,
                 total_steps=total_steps,
                 persona=persona_name,
+                section=section,
             )
 
             # Build prompt based on orchestration stage
             if persona_name == "soap_generator":
                 # Standard SOAP generation
-                prompt = self._build_soap_generation_prompt(current_content)
+                prompt = self._build_soap_generation_prompt(current_content, section)
                 output = self._invoke_persona_with_preset(
                     persona_name="soap_generator",
                     preset_name="soap_generator",
@@ -273,7 +422,7 @@ class DecisionalMiddleware(IDecisionalMiddleware):
             elif persona_name == "soap_editor":
                 if step_num == 1:
                     # Initial draft generation
-                    prompt = self._build_soap_editor_initial_prompt(current_content)
+                    prompt = self._build_soap_editor_initial_prompt(current_content, section)
                 else:
                     # Refinement based on clinical feedback
                     feedback = intermediate_outputs[-1].get("output", {})
@@ -281,6 +430,7 @@ class DecisionalMiddleware(IDecisionalMiddleware):
                         transcript=current_content,
                         previous_draft=final_soap_note,
                         clinical_feedback=feedback,
+                        section=section,
                     )
 
                 output = self._invoke_persona(
@@ -294,6 +444,7 @@ class DecisionalMiddleware(IDecisionalMiddleware):
                 prompt = self._build_clinical_advisor_prompt(
                     transcript=current_content,
                     soap_draft=previous_soap,
+                    section=section,
                 )
                 output = self._invoke_persona(
                     persona_name="clinical_advisor",
@@ -308,6 +459,7 @@ class DecisionalMiddleware(IDecisionalMiddleware):
                 {
                     "step": step_num,
                     "persona": persona_name,
+                    "section": section,
                     "output": output,
                     "timestamp": datetime.now(timezone.utc).isoformat(),
                 }
@@ -321,20 +473,23 @@ class DecisionalMiddleware(IDecisionalMiddleware):
                 "ORCHESTRATION_STEP_COMPLETE",
                 step=step_num,
                 persona=persona_name,
+                section=section,
             )
 
-        # Calculate confidence score based on strategy
-        confidence = self._calculate_confidence(plan.strategy, final_soap_note)
+        return final_soap_note, intermediate_outputs
 
-        return OrchestrationResult(
-            soap_note=final_soap_note,
-            strategy_used=plan.strategy,
-            personas_invoked=plan.personas,
-            total_duration_seconds=0.0,  # Will be set by caller
-            intermediate_outputs=intermediate_outputs,
-            doctor_context_requested=plan.requires_doctor_context,
-            confidence_score=confidence,
-        )
+    def _chain_fingerprint(self, personas: list[str]) -> str:
+        """Prompts and sampling of every persona in the chain (part of the cache key)."""
+        parts = []
+        for persona_name in dict.fromkeys(personas):
+            if persona_name == "soap_generator":
+                config = self.preset_loader.load_preset("soap_generator")
+            else:
+                config = self.persona_manager.get_persona(persona_name)
+            parts.append(
+                [persona_name, config.system_prompt, config.temperature, config.max_tokens]
+            )
+        return json.dumps(parts, ensure_ascii=False, default=str)
 
     def _invoke_persona_with_preset(
         self,
@@ -348,15 +503,13 @@ class DecisionalMiddleware(IDecisionalMiddleware):
 
             full_prompt = f"{preset.system_prompt}\n\n{prompt}"
 
-            response = llm_generate(
+            response = self.generate(
                 full_prompt,
                 temperature=preset.temperature,
                 max_tokens=preset.max_tokens,
             )
 
             # Try to parse as JSON (SOAP note)
-            import json
-
             try:
                 return json.loads(response.content)
             except json.JSONDecodeError:
@@ -378,21 +531,29 @@ class DecisionalMiddleware(IDecisionalMiddleware):
 
         full_prompt = f"{persona_config.system_prompt}\n\n{prompt}"
 
-        response = llm_generate(
+        response = self.generate(
             full_prompt,
             temperature=persona_config.temperature,
             max_tokens=persona_config.max_tokens,
         )
 
         # Try to parse as JSON
-        import json
-
         try:
             return json.loads(response.content)
         except json.JSONDecodeError:
             return {"raw_output": response.content}
 
-    def _build_soap_generation_prompt(self, transcript: str) -> str:
+    @staticmethod
+    def _section_scope(section: str | None) -> str:
+        """Instruction that narrows a prompt to one SOAP section (empty for the full note)."""
+        if section is None:
+            return ""
+        return (
+            f"\n\nWrite ONLY the {section.upper()} section of the SOAP note; the other "
+            f'sections are written separately. Return JSON: {{"{section}": {{...}}}}.'
+        )
+
+    def _build_soap_generation_prompt(self, transcript: str, section: str | None = None) -> str:
         """Build prompt for standard SOAP generation."""
         return f"""Generate a SOAP note from this medical conversation:
 
@@ -404,9 +565,9 @@ Extract:
 - Assessment: Diagnosis and clinical reasoning
 - Plan: Treatment plan, medications, follow-up
 
-Return JSON format matching soap.schema.json."""
+Return JSON format matching soap.schema.json.{self._section_scope(section)}"""
 
-    def _build_soap_editor_initial_prompt(self, transcript: str) -> str:
+    def _build_soap_editor_initial_prompt(self, transcript: str, section: str | None = None) -> str:
         """Build prompt for initial SOAP draft."""
         return f"""You are a medical documentation specialist. Create a detailed SOAP note from this conversation:
 
@@ -418,13 +579,14 @@ Focus on:
 - Clear clinical reasoning
 - Specific treatment plans
 
-Return JSON format."""
+Return JSON format.{self._section_scope(section)}"""
 
     def _build_soap_editor_refinement_prompt(
         self,
         transcript: str,
         previous_draft: dict[str, Any],
         clinical_feedback: dict[str, Any],
+        section: str | None = None,
     ) -> str:
         """Build prompt for refining SOAP based on clinical feedback."""
         return f"""Refine this SOAP note based on clinical advisor feedback:
@@ -443,12 +605,13 @@ Improve:
 - Ensure medical accuracy
 - Maintain comprehensive documentation
 
-Return refined JSON."""
+Return refined JSON.{self._section_scope(section)}"""
 
     def _build_clinical_advisor_prompt(
         self,
         transcript: str,
         soap_draft: dict[str, Any],
+        section: str | None = None,
     ) -> str:
         """Build prompt for clinical review."""
         return f"""Review this SOAP note for medical accuracy and completeness:
@@ -465,7 +628,7 @@ Provide:
 3. Recommended improvements
 4. Red flags or concerns
 
-Return JSON with feedback."""
+Return JSON with feedback.{"" if section is None else f" Review only the {section.upper()} section."}"""
 
     def _calculate_confidence(self, strategy: str, soap_note: dict[str, Any]) -> float:
         """Calculate confidence score based on strategy and completeness."""
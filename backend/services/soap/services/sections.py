@@ -0,0 +1,100 @@
+"""SOAP sections - per-section cache keys.
+
+Section-parallel generation (see DecisionalMiddleware) runs one persona
+chain per SOAP section, and every chain sees the whole transcript: a
+patient's "tomo metformina cada mañana" belongs in Subjective even though
+it reads like a Plan line. What is split per section is the cache key.
+Each section's key hashes the sentences it depends on (its span), so
+editing a dose the doctor dictated re-generates Plan (and Assessment) but
+reuses Subjective and Objective.
+
+Routing is keyword-based, like complexity_analyzer, with cues matched on
+word boundaries: a sentence with exam, vitals, lab or imaging cues is in
+Objective's span; one with treatment cues is in Plan's. Subjective's span
+keeps every sentence except the clinician's own exam and treatment lines
+(``DOCTOR: ...``), so anything the patient says, or any unattributed line,
+still invalidates it. Assessment synthesizes all of it and its span is the
+whole transcript. A section with no matching sentence falls back to the
+whole transcript.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from typing import Any
+
+__all__ = ["SOAP_SECTIONS", "section_key", "section_spans"]
+
+SOAP_SECTIONS = ("subjective", "objective", "assessment", "plan")
+
+# Regex fragments; ``\w*`` marks a stem (auscultación, auscultar, ...)
+_OBJECTIVE_CUES = (
+    # Exam and vitals
+    r"exploración", r"examen físico", r"auscult\w*", r"palpa\w*", r"presión arterial",
+    r"frecuencia cardíaca", r"frecuencia respiratoria", r"temperatura", r"saturación", r"peso",
+    r"talla", r"imc", r"signos vitales",
+    # Labs
+    r"laboratorio\w*", r"análisis", r"glucosa", r"hemoglobina", r"creatinina", r"colesterol",
+    r"triglicéridos", r"hba1c", r"resultados?",
+    # Imaging
+    r"radiografía", r"rayos x", r"tomografía", r"resonancia", r"ultrasonido", r"ecografía",
+    r"ecocardiograma", r"electrocardiograma",
+)
+
+_PLAN_CUES = (
+    r"recet\w*", r"prescrib\w*", r"tome", r"tomar", r"cada \d+", r"\d*mg",
+    r"tabletas?", r"dosis", r"indicac\w*", r"citas?", r"control", r"seguimiento", r"referir",
+    r"referencia", r"interconsulta", r"solicitar", r"ordenar", r"dieta", r"reposo",
+    r"metformina", r"insulina", r"enalapril", r"losartán", r"atorvastatina", r"omeprazol",
+    r"paracetamol", r"ibuprofeno", r"amoxicilina",
+)
+
+
+def _cue_pattern(cues: tuple[str, ...]) -> re.Pattern[str]:
+    return re.compile(r"\b(?:" + "|".join(cues) + r")\b", re.IGNORECASE)
+
+
+_OBJECTIVE = _cue_pattern(_OBJECTIVE_CUES)
+_PLAN = _cue_pattern(_PLAN_CUES)
+
+_SPEAKER = re.compile(r"^\s*([^\W\d_][\w. ]{0,20}?)\s*:", re.UNICODE)
+_CLINICIANS = frozenset(
+    {"doctor", "doctora", "dr", "dr.", "dra", "dra.", "médico", "médica", "medico", "medica"}
+)
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
+def _sentences(transcript: str) -> list[tuple[bool, str]]:
+    """(spoken by the clinician, sentence); a line's speaker label covers all its sentences."""
+    sentences: list[tuple[bool, str]] = []
+    for line in transcript.splitlines():
+        speaker = _SPEAKER.match(line)
+        clinician = bool(speaker) and speaker.group(1).strip().lower() in _CLINICIANS
+        sentences.extend((clinician, s.strip()) for s in _SENTENCE_BREAK.split(line) if s.strip())
+    return sentences
+
+
+def section_spans(transcript: str) -> dict[str, str]:
+    """The sentences each section's cache key depends on (see module docstring)."""
+    routed: dict[str, list[str]] = {"subjective": [], "objective": [], "plan": []}
+    for clinician, sentence in _sentences(transcript):
+        objective = bool(_OBJECTIVE.search(sentence))
+        plan = bool(_PLAN.search(sentence))
+        if objective:
+            routed["objective"].append(sentence)
+        if plan:
+            routed["plan"].append(sentence)
+        if not (clinician and (objective or plan)):
+            routed["subjective"].append(sentence)
+
+    spans = {section: "\n".join(lines) or transcript for section, lines in routed.items()}
+    spans["assessment"] = transcript
+    return {section: spans[section] for section in SOAP_SECTIONS}
+
+
+def section_key(section: str, strategy: str, chain_fingerprint: str, span: str) -> str:
+    """Cache key of one generated section: what it was generated from, and how."""
+    payload: list[Any] = [section, strategy, chain_fingerprint, span]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()
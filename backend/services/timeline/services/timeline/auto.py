@@ -16,7 +16,6 @@ from datetime import datetime, timezone, timedelta
 from typing import Any
 
 import yaml  # type: ignore[import-untyped]
-from backend.providers import llm_generate
 from backend.schemas.domain.timeline import (
     CausalityType,
     RedactionPolicy,
@@ -239,6 +238,12 @@ class AutoTimelineGenerator:
         - same_artifact: Strong edge (weight=1.0)
         - temporal_adjacent (<30s) + same_actor: Soft edge (weight=0.7)
 
+        Candidate pairs come from indexes instead of comparing every pair:
+        events hashed by artifact (reference_id), and a sliding time window
+        per actor over the time-sorted stream. Cost is O(n log n) plus the
+        edges found. Edges point from the earlier event in list order to the
+        later one, and are returned in that (source, target) order.
+
         Args:
             events: List of timeline events
 
@@ -250,41 +255,57 @@ class AutoTimelineGenerator:
         temporal_adjacent_seconds = causality_config.get("temporal_adjacent_seconds", 30)
         same_actor_weight = causality_config.get("same_actor_weight", 0.7)
 
-        candidates = []
+        # (source_idx, target_idx) -> same_artifact
+        pairs: dict[tuple[int, int], bool] = {}
+
+        # 1. Same artifact (strong edge): every pair inside an artifact bucket
+        by_artifact: dict[str, list[int]] = {}
+        for idx, event in enumerate(events):
+            if event.reference_id:  # artifact_id stored in reference_id
+                by_artifact.setdefault(event.reference_id, []).append(idx)
+        for indexes in by_artifact.values():
+            for a, source in enumerate(indexes):
+                for b in range(a + 1, len(indexes)):
+                    pairs[(source, indexes[b])] = True
+
+        # 2. Temporal adjacency + same actor (soft edge): per-actor window
+        by_actor: dict[str, list[int]] = {}
+        for idx in sorted(range(len(events)), key=lambda i: (events[i].timestamp, i)):
+            by_actor.setdefault(events[idx].who, []).append(idx)
+        window = timedelta(seconds=temporal_adjacent_seconds)
+        for indexes in by_actor.values():
+            for a, first in enumerate(indexes):
+                horizon = events[first].timestamp + window
+                for b in range(a + 1, len(indexes)):
+                    second = indexes[b]
+                    if events[second].timestamp > horizon:
+                        break
+                    pairs.setdefault((min(first, second), max(first, second)), False)
 
-        for i, event in enumerate(events):
-            for j in range(i + 1, len(events)):
-                next_event = events[j]
-
-                # Check same artifact (strong edge)
-                event_artifact = event.reference_id  # artifact_id stored in reference_id
-                next_artifact = next_event.reference_id
-
-                if event_artifact and next_artifact and event_artifact == next_artifact:
-                    candidates.append(
-                        CausalityCandidate(  # type: ignore[call-arg]
-                            source_event_id=event.event_id,
-                            target_event_id=next_event.event_id,
-                            causality_type=CausalityType.TRIGGERED,
-                            confidence=same_artifact_weight,
-                            explanation=f"Same artifact modified: {event_artifact[:8]}...",
-                        )
+        candidates = []
+        for (source, target), same_artifact in sorted(pairs.items()):
+            event, next_event = events[source], events[target]
+            if same_artifact:
+                candidates.append(
+                    CausalityCandidate(  # type: ignore[call-arg]
+                        source_event_id=event.event_id,
+                        target_event_id=next_event.event_id,
+                        causality_type=CausalityType.TRIGGERED,
+                        confidence=same_artifact_weight,
+                        explanation=f"Same artifact modified: {event.reference_id[:8]}...",  # type: ignore[index]
                     )
-                    continue
-
-                # Check temporal adjacency + same actor (soft edge)
+                )
+            else:
                 time_delta = (next_event.timestamp - event.timestamp).total_seconds()
-
-                if time_delta <= temporal_adjacent_seconds and event.who == next_event.who:
-                    candidates.append(
-                        CausalityCandidate(  # type: ignore[call-arg]
-                            source_event_id=event.event_id,
-                            target_event_id=next_event.event_id,
-                            causality_type=CausalityType.CAUSED_BY,
-                            confidence=same_actor_weight,
-                            explanation=f"Temporal adjacency ({time_delta:.1f}s) + same actor",
-                        )
+                candidates.append(
+                    CausalityCandidate(  # type: ignore[call-arg]
+                        source_event_id=event.event_id,
+                        target_event_id=next_event.event_id,
+                        causality_type=CausalityType.CAUSED_BY,
+                        confidence=same_actor_weight,
+                        explanation=f"Temporal adjacency ({time_delta:.1f}s) + same actor",
                     )
+                )
 
         logger.info(
             "AUTO_TIMELINE_CAUSALITY_DETECTED",
@@ -343,6 +364,8 @@ Summary:"""
             start_time = datetime.now(timezone.utc)
 
             # Use llm_router unified interface (provider from config)
+            from backend.providers import llm_generate
+
             provider = self.auto_config.get("provider", "ollama")
             response = llm_generate(
                 prompt=prompt,
@@ -0,0 +1,158 @@
+"""Unit tests for section-parallel SOAP orchestration (DecisionalMiddleware).
+
+The LLM is a fake ``generate`` function: it answers a section-scoped prompt
+with that section's JSON after a fixed delay, so concurrency shows up as
+wall time.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from backend.services.soap.services.decisional_middleware import DecisionalMiddleware
+from backend.services.soap.services.sections import section_spans
+
+TRANSCRIPT = (
+    "DOCTOR: ¿Qué le trae hoy?\n"
+    "PACIENTE: Tengo dolor de cabeza desde hace tres días.\n"
+    "DOCTOR: Su presión arterial es 150/95.\n"
+    "DOCTOR: Le receto paracetamol 500 mg cada 8 horas y control en una semana."
+)
+
+DELAY = 0.05
+
+
+class FakeLLM:
+    """Records prompts; returns section JSON after DELAY seconds."""
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, prompt: str, **kwargs) -> SimpleNamespace:
+        with self.lock:
+            self.prompts.append(prompt)
+        time.sleep(DELAY)
+        match = re.search(r"Write ONLY the (\w+) section", prompt)
+        section = match.group(1).lower() if match else None
+        if "Review this SOAP note" in prompt:
+            body = {"feedback": "ok"}
+        elif section:
+            body = {section: {"text": f"{section} v{len(self.prompts)}"}}
+        else:
+            body = {s: {"text": s} for s in ("subjective", "objective", "assessment", "plan")}
+        return SimpleNamespace(content=json.dumps(body))
+
+
+def _middleware(llm: FakeLLM, level: str) -> DecisionalMiddleware:
+    persona = SimpleNamespace(system_prompt="persona", temperature=0.2, max_tokens=800)
+    preset_loader = Mock()
+    preset_loader.load_preset.return_value = persona
+    persona_manager = Mock()
+    persona_manager.get_persona.return_value = persona
+    middleware = DecisionalMiddleware(preset_loader, persona_manager=persona_manager, generate=llm)
+    middleware.complexity_analyzer = Mock()
+    middleware.complexity_analyzer.analyze.return_value = Mock(complexity_level=level)
+    return middleware
+
+
+def test_section_spans_route_sentences_by_cue() -> None:
+    spans = section_spans(TRANSCRIPT)
+    assert "presión arterial" in spans["objective"] and "dolor" not in spans["objective"]
+    assert "paracetamol" in spans["plan"] and "presión" not in spans["plan"]
+    assert "dolor de cabeza" in spans["subjective"] and "paracetamol" not in spans["subjective"]
+    assert spans["assessment"] == TRANSCRIPT
+
+
+def test_patient_statements_stay_in_subjective_span() -> None:
+    transcript = (
+        "PACIENTE: Tomo metformina cada mañana. Me peso en casa.\n"
+        "DOCTOR: Su glucosa es 180. Aumentamos metformina a 850 mg."
+    )
+    spans = section_spans(transcript)
+    assert "Tomo metformina cada mañana." in spans["subjective"]
+    assert "Me peso en casa." in spans["subjective"]  # sentence after the label keeps its speaker
+    assert "glucosa" not in spans["subjective"] and "850 mg" not in spans["subjective"]
+    assert "glucosa" in spans["objective"] and "850 mg" in spans["plan"]
+
+
+def test_cues_match_on_word_boundaries() -> None:
+    transcript = "Me siento pesado y descontrolado. Voy al médico cada semana."
+    spans = section_spans(transcript)
+    # "pesado" is not "peso", "descontrolado" not "control", "cada semana" not a dose
+    assert spans["objective"] == spans["plan"] == transcript
+
+
+def test_every_section_chain_reads_the_whole_transcript() -> None:
+    llm = FakeLLM()
+    _middleware(llm, "COMPLEX").process(TRANSCRIPT)
+    sections = [re.search(r"Write ONLY the (\w+) section", p) for p in llm.prompts]
+    assert sorted(m.group(1) for m in sections if m) == sorted(
+        ["SUBJECTIVE", "OBJECTIVE", "ASSESSMENT", "PLAN"] * 2
+    )
+    assert all(TRANSCRIPT in prompt for prompt in llm.prompts)
+
+
+def test_complex_strategy_runs_sections_concurrently() -> None:
+    llm = FakeLLM()
+    seen: list[tuple[str, bool]] = []
+
+    t0 = time.perf_counter()
+    result = _middleware(llm, "COMPLEX").process(
+        TRANSCRIPT, on_section=lambda section, content, cached: seen.append((section, cached))
+    )
+    elapsed = time.perf_counter() - t0
+
+    assert len(llm.prompts) == 12  # 3 personas x 4 sections
+    assert elapsed < 12 * DELAY / 2  # sequential would be 12 x DELAY
+    assert list(result.soap_note) == ["subjective", "objective", "assessment", "plan"]
+    assert result.soap_note["plan"]["text"].startswith("plan v")
+    assert sorted(seen) == sorted((s, False) for s in result.soap_note)
+    assert result.confidence_score == 0.95
+    assert set(result.section_keys) == set(result.soap_note)
+
+
+def test_rerun_after_plan_edit_regenerates_only_affected_sections() -> None:
+    llm = FakeLLM()
+    middleware = _middleware(llm, "COMPLEX")
+    first = middleware.process(TRANSCRIPT)
+    cached = {
+        section: {"key": key, "content": first.soap_note[section]}
+        for section, key in first.section_keys.items()
+    }
+    llm.prompts.clear()
+    seen: list[tuple[str, bool]] = []
+
+    edited = TRANSCRIPT.replace("cada 8 horas", "cada 6 horas")
+    second = middleware.process(
+        edited,
+        cached_sections=cached,
+        on_section=lambda section, content, was_cached: seen.append((section, was_cached)),
+    )
+
+    assert sorted(second.sections_cached) == ["objective", "subjective"]
+    assert len(llm.prompts) == 6  # plan + assessment, 3 personas each
+    assert second.soap_note["subjective"] == first.soap_note["subjective"]
+    assert second.soap_note["plan"] != first.soap_note["plan"]
+    assert ("objective", True) in seen and ("plan", False) in seen
+
+
+@pytest.mark.parametrize(("level", "calls"), [("SIMPLE", 1), ("MODERATE", 2)])
+def test_cheap_strategies_stay_whole_note(level: str, calls: int) -> None:
+    llm = FakeLLM()
+    seen: list[str] = []
+
+    result = _middleware(llm, level).process(
+        TRANSCRIPT, on_section=lambda section, content, cached: seen.append(section)
+    )
+
+    assert len(llm.prompts) == calls
+    assert seen == ["subjective", "objective", "assessment", "plan"]
+    assert result.section_keys == {}
@@ -0,0 +1,217 @@
+"""Tests for CachedMemoryStore (byte budget, TinyLFU admission, TTLs, invalidation)."""
+
+from __future__ import annotations
+
+import pytest
+
+from backend.repositories import cached_memory_store as cms
+from backend.repositories.cached_memory_store import CachedMemoryStore, estimate_result_bytes
+from backend.repositories.memory_cache_invalidation import (
+    FileInvalidationBus,
+    RedisInvalidationBus,
+    invalidation_bus_from_url,
+)
+from backend.repositories.metrics_memory_store import MetricsMemoryStore
+
+
+class FakeStore:
+    """IMemoryStore stand-in: ``events`` per call, counts reads, accepts writes."""
+
+    def __init__(self, events_per_page: int = 5):
+        self.events_per_page = events_per_page
+        self.reads = 0
+        self.writes: list[str] = []
+        self.on_read = None
+
+    def get_audio_events(  # noqa: ANN001
+        self, doctor_id, start_ts=None, end_ts=None, limit=50, offset=0
+    ):
+        self.reads += 1
+        if self.on_read:
+            self.on_read()
+        events = [
+            {
+                "session_id": f"{doctor_id}-s{offset:04d}",  # fixed width: equal-sized pages
+                "chunk_number": i,
+                "transcript": "paciente refiere dolor " * 5,
+                "timestamp": 1_700_000_000 + i,
+                "created_at": "2026-01-01T00:00:00Z",
+            }
+            for i in range(self.events_per_page)
+        ]
+        return events, 1000
+
+    def search_audio_events(self, doctor_id, query, limit=1000):  # noqa: ANN001
+        return []
+
+    def get_audio_stats(self, doctor_id):  # noqa: ANN001
+        return {
+            "count": 0,
+            "oldest_timestamp": None,
+            "newest_timestamp": None,
+            "unique_sessions": 0,
+        }
+
+    def index_audio_event(self, doctor_id, event):  # noqa: ANN001
+        self.writes.append(doctor_id)
+        return "doc-id"
+
+
+class FakeRedis:
+    """Redis stand-in: the two hash commands RedisInvalidationBus uses."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[bytes, bytes]] = {}
+
+    def hincrby(self, key, field, amount):  # noqa: ANN001
+        h = self.hashes.setdefault(key, {})
+        h[field.encode()] = str(int(h.get(field.encode(), b"0")) + amount).encode()
+
+    def hgetall(self, key):  # noqa: ANN001
+        return dict(self.hashes.get(key, {}))
+
+
+def _page_bytes(store: FakeStore) -> int:
+    return estimate_result_bytes(store.get_audio_events("doc-a"))
+
+
+def test_hits_misses_and_hit_ratio():
+    delegate = FakeStore()
+    store = CachedMemoryStore(delegate)
+    for _ in range(3):
+        store.get_audio_events("doc-a", offset=0)
+    store.get_audio_events("doc-a", offset=50)
+    info = store.cache_info()
+    assert delegate.reads == 2
+    assert (info["hits"], info["misses"]) == (2, 2)
+    assert info["hit_ratio"] == 0.5
+    assert info["currsize"] == 2 and info["bytes"] > 0
+
+
+def test_byte_budget_bounds_memory():
+    delegate = FakeStore()
+    page = _page_bytes(delegate)
+    store = CachedMemoryStore(delegate, cache_size=10_000, max_bytes=page * 4 + 10)
+    for offset in range(12):
+        # Each page hotter than the last (sketch counters cap at 15), so TinyLFU
+        # admits it over the LRU ones
+        for _ in range(offset + 2):
+            store.get_audio_events("doc-a", offset=offset)
+    info = store.cache_info()
+    assert info["bytes"] <= info["max_bytes"]
+    assert info["currsize"] == 4
+    assert info["evictions"] == 8
+
+
+def test_entry_cap_still_applies():
+    store = CachedMemoryStore(FakeStore(), cache_size=3)
+    for offset in range(6):
+        store.get_audio_events("doc-a", offset=offset)
+        store.get_audio_events("doc-a", offset=offset)
+    assert store.cache_info()["currsize"] == 3
+
+
+def test_tinylfu_keeps_hot_set_through_a_scan():
+    delegate = FakeStore()
+    page = _page_bytes(delegate)
+    store = CachedMemoryStore(delegate, cache_size=10_000, max_bytes=page * 3 + 10)
+    hot = [0, 1, 2]
+    for _ in range(5):
+        for offset in hot:
+            store.get_audio_events("doc-a", offset=offset)
+    # One pass over 100 pages nobody reads again
+    for offset in range(100, 200):
+        store.get_audio_events("doc-a", offset=offset)
+    reads = delegate.reads
+    for offset in hot:
+        store.get_audio_events("doc-a", offset=offset)
+    assert delegate.reads == reads  # hot pages still cached
+    assert store.cache_info()["rejected"] == 100
+
+
+def test_oversized_result_is_not_cached():
+    delegate = FakeStore(events_per_page=50)
+    store = CachedMemoryStore(delegate, max_bytes=1000)
+    store.get_audio_events("doc-a")
+    store.get_audio_events("doc-a")
+    assert delegate.reads == 2
+    assert store.cache_info()["rejected"] == 2
+
+
+def test_ttl_open_vs_historical_ranges(monkeypatch):
+    now = [1_800_000_000.0]
+    monkeypatch.setattr(cms.time, "time", lambda: now[0])
+    delegate = FakeStore()
+    store = CachedMemoryStore(delegate, ttl_seconds=60, historical_ttl_seconds=3600)
+    store.get_audio_events("doc-a")  # open range
+    store.get_audio_events("doc-a", start_ts=0, end_ts=int(now[0]) - 86_400)  # last week
+    now[0] += 120
+    store.get_audio_events("doc-a")
+    store.get_audio_events("doc-a", start_ts=0, end_ts=int(now[0]) - 86_400 - 120)
+    assert delegate.reads == 3
+    assert store.cache_info()["expired"] == 1
+
+
+def test_write_through_invalidates_and_publishes(tmp_path):
+    bus = FileInvalidationBus(tmp_path / "inv.log")
+    delegate = FakeStore()
+    store = CachedMemoryStore(MetricsMemoryStore(delegate), invalidation=bus)
+    store.get_audio_events("doc-a")
+    store.get_audio_events("doc-b")
+    assert store.index_audio_event("doc-a", {}) == "doc-id"
+    assert delegate.writes == ["doc-a"]
+    store.get_audio_events("doc-a")
+    store.get_audio_events("doc-b")
+    assert delegate.reads == 3  # doc-a re-read, doc-b still cached
+    assert store.cache_info()["invalidations"] == 1
+    assert (tmp_path / "inv.log").read_text() == "doc-a\n"
+
+
+def test_read_in_flight_during_invalidation_is_not_admitted():
+    delegate = FakeStore()
+    store = CachedMemoryStore(delegate)
+    delegate.on_read = lambda: store.invalidate("doc-a")
+    store.get_audio_events("doc-a")
+    delegate.on_read = None
+    store.get_audio_events("doc-a")
+    assert delegate.reads == 2
+
+
+@pytest.mark.parametrize("kind", ["file", "redis"])
+def test_cross_process_invalidation(tmp_path, kind):
+    if kind == "file":
+        bus_a = FileInvalidationBus(tmp_path / "inv.log")
+        bus_b = FileInvalidationBus(tmp_path / "inv.log")
+    else:
+        redis = FakeRedis()
+        bus_a, bus_b = RedisInvalidationBus(redis), RedisInvalidationBus(redis)
+    reader_store = FakeStore()
+    reader = CachedMemoryStore(reader_store, invalidation=bus_b, poll_interval=0)
+    writer = CachedMemoryStore(FakeStore(), invalidation=bus_a, poll_interval=0)
+
+    reader.get_audio_events("doc-a")
+    reader.get_audio_events("doc-b")
+    writer.index_audio_event("doc-a", {})
+    reader.get_audio_events("doc-a")
+    reader.get_audio_events("doc-b")
+    assert reader_store.reads == 3
+
+
+def test_file_bus_compaction_clears_readers(tmp_path):
+    path = tmp_path / "inv.log"
+    writer = FileInvalidationBus(path, max_bytes=20)
+    reader = FileInvalidationBus(path)
+    writer.publish("doc-a")
+    assert reader.poll() == {"doc-a"}
+    for _ in range(5):
+        writer.publish("doc-b")
+    assert reader.poll() is None
+    writer.publish("doc-c")
+    assert reader.poll() == {"doc-c"}
+
+
+def test_invalidation_bus_from_url(tmp_path):
+    assert invalidation_bus_from_url(None) is None
+    assert isinstance(invalidation_bus_from_url(f"file://{tmp_path}/inv.log"), FileInvalidationBus)
+    with pytest.raises(ValueError):
+        invalidation_bus_from_url("kafka://nope")
@@ -0,0 +1,228 @@
+"""Tests for rolling-window diarization (windowing + incremental worker).
+
+The stub provider labels speakers in order of first appearance inside each
+window (SPEAKER_0, SPEAKER_1, ...), the way an LLM or a clustering model
+does: the same person can be SPEAKER_0 in one window and SPEAKER_1 in the
+next, which is exactly what stitching has to undo.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from backend.providers.diarization import (
+    DiarizationResponse,
+    DiarizationSegment,
+    Speaker,
+    TextBasedDiarizationProvider,
+    register_provider,
+)
+from backend.providers.diarization.windowing import (
+    WindowConfig,
+    assemble,
+    plan_windows,
+    ready_chunks,
+    stitch_speakers,
+)
+
+# True speaker of each chunk; chunk 2 starts the second window with the patient.
+SPEAKERS = [
+    "doctor", "paciente", "paciente", "doctor", "doctor", "paciente", "doctor", "paciente", "doctor"
+]
+
+
+class StubTextProvider(TextBasedDiarizationProvider):
+    """One segment per chunk, window-local labels (see module docstring)."""
+
+    calls: list[int] = []
+
+    def diarize_text(
+        self,
+        transcript: str,
+        num_speakers: int = 2,
+        chunks: list[dict[str, Any]] | None = None,
+        webspeech_final: list[str] | None = None,
+    ) -> DiarizationResponse:
+        StubTextProvider.calls.append(len(chunks or []))
+        labels: dict[str, str] = {}
+        segments = []
+        for chunk in chunks or []:
+            who = chunk["transcript"].split()[0]
+            label = labels.setdefault(who, f"SPEAKER_{len(labels)}")
+            segments.append(
+                DiarizationSegment(
+                    0.0, 1.0, Speaker(label, name=label), 0.9, text=chunk["transcript"]
+                )
+            )
+        speakers = {s.speaker.speaker_id: s.speaker for s in segments}
+        return DiarizationResponse(segments, speakers, len(speakers), 1.0, 0.9, "stub_text")
+
+    def get_provider_name(self) -> str:
+        return "stub_text"
+
+
+register_provider("stub_text", StubTextProvider)
+
+
+def _chunk(idx: int, transcript: str | None = None) -> dict[str, Any]:
+    chunk: dict[str, Any] = {"id": f"chunk_{idx}"}
+    if transcript is not None:
+        chunk["transcript"] = transcript
+    return chunk
+
+
+def _text(idx: int) -> str:
+    return f"{SPEAKERS[idx]} frase {idx} uno dos"
+
+
+# ==============================================================================
+# WINDOWING
+# ==============================================================================
+
+
+class TestWindowing:
+    """Window planning, stitching and assembly."""
+
+    def test_config_rejects_overlap_larger_than_half_window(self) -> None:
+        with pytest.raises(ValueError, match="overlap_chunks"):
+            WindowConfig(window_chunks=4, overlap_chunks=3)
+        assert WindowConfig.from_policy({"incremental": {"window_chunks": 6}}).step == 4
+        assert WindowConfig.from_policy({}).window_chunks == 8
+
+    def test_ready_chunks_stop_at_first_gap(self) -> None:
+        chunks = [_chunk(2, "c"), _chunk(0, "a"), _chunk(1, "b"), _chunk(3), _chunk(4, "e")]
+        assert [c["id"] for c in ready_chunks(chunks)] == ["chunk_0", "chunk_1", "chunk_2"]
+
+    def test_plan_only_full_windows_until_final(self) -> None:
+        config = WindowConfig(window_chunks=4, overlap_chunks=2)
+        assert plan_windows(7, config) == [(0, 4), (2, 6)]
+        assert plan_windows(7, config, final=True) == [(0, 4), (2, 6), (4, 7)]
+        assert plan_windows(6, config, final=True) == [(0, 4), (2, 6)]
+        assert plan_windows(3, config, final=True) == [(0, 3)]
+
+    def test_stitch_maps_swapped_labels_by_overlap(self) -> None:
+        previous = [
+            {"speaker": "A", "w0": 0, "w1": 10},
+            {"speaker": "B", "w0": 10, "w1": 20},
+        ]
+        current = [
+            {"speaker": "A", "w0": 10, "w1": 20},  # previous window's B
+            {"speaker": "B", "w0": 20, "w1": 30},
+            {"speaker": "C", "w0": 30, "w1": 35},
+        ]
+        mapping = stitch_speakers(previous, current, known=["A", "B"])
+        assert mapping["A"] == "B"
+        assert mapping["B"] == "A"  # unmatched, its own name is taken: the free known label
+        assert mapping["C"] == "C"
+
+    def test_assemble_cuts_overlap_in_the_middle(self) -> None:
+        windows = [
+            {"word_start": 0, "word_end": 40, "segments": [
+                {"speaker": "A", "w0": 0, "w1": 20},
+                {"speaker": "B", "w0": 20, "w1": 30},
+                {"speaker": "A", "w0": 30, "w1": 40},
+            ]},
+            {"word_start": 20, "word_end": 60, "segments": [
+                {"speaker": "B", "w0": 20, "w1": 30},
+                {"speaker": "A", "w0": 30, "w1": 40},
+                {"speaker": "B", "w0": 40, "w1": 60},
+            ]},
+        ]
+        spans = [(s["w0"], s["w1"]) for s in assemble(windows)]
+        assert spans == [(0, 20), (20, 30), (30, 40), (40, 60)]
+
+
+# ==============================================================================
+# INCREMENTAL WORKER
+# ==============================================================================
+
+
+@pytest.fixture
+def task_repo(tmp_path: Path):
+    from backend.repositories.task import HDF5TaskRepository
+
+    return HDF5TaskRepository(tmp_path / "tasks.h5")
+
+
+@pytest.fixture
+def policy_loader() -> Mock:
+    loader = Mock()
+    loader.get_diarization_config.return_value = {
+        "primary_provider": "stub_text",
+        "expected_num_speakers": 2,
+        "incremental": {"window_chunks": 4, "overlap_chunks": 2},
+    }
+    return loader
+
+
+def _transcribe(task_repo, session_id: str, idx: int) -> None:
+    task_repo.save_chunk_audio(session_id, "TRANSCRIPTION", idx, b"audio")
+    task_repo.batch_update_chunk_datasets(
+        session_id, "TRANSCRIPTION", idx, {"transcript": _text(idx)}
+    )
+
+
+class TestIncrementalWorker:
+    """diarize_ready_windows while recording, then finalize."""
+
+    def test_windows_follow_transcribed_chunks(self, task_repo, policy_loader) -> None:
+        from backend.infrastructure.workers.tasks.diarization_worker import diarize_ready_windows
+
+        for idx in range(5):
+            _transcribe(task_repo, "s1", idx)
+            diarize_ready_windows("s1", task_repo, policy_loader)
+        windows = task_repo.get_diarization_windows("s1")
+        assert [(w["chunk_start"], w["chunk_end"]) for w in windows] == [(0, 4)]
+
+        _transcribe(task_repo, "s1", 5)
+        assert diarize_ready_windows("s1", task_repo, policy_loader) == 1
+        windows = task_repo.get_diarization_windows("s1")
+        # Window 1 starts with the patient, so its local SPEAKER_0 is the patient
+        # - stitched back to the label window 0 gave the patient.
+        patient = windows[0]["segments"][1]["speaker"]
+        assert windows[1]["segments"][0]["speaker"] == patient
+
+    def test_finalize_only_diarizes_the_tail(self, task_repo, policy_loader) -> None:
+        from backend.infrastructure.workers.tasks.diarization_worker import (
+            diarize_ready_windows,
+            diarize_session_worker,
+        )
+
+        for idx in range(len(SPEAKERS)):
+            _transcribe(task_repo, "s2", idx)
+            diarize_ready_windows("s2", task_repo, policy_loader)
+        task_repo.ensure_task_exists("s2", "DIARIZATION")
+        StubTextProvider.calls = []
+
+        result = diarize_session_worker(
+            "s2", task_repo, Mock(), policy_loader, diarization_provider="stub_text"
+        )
+
+        assert StubTextProvider.calls == [3]  # chunks 6..8, the only window left
+        segments = task_repo.get_diarization_segments("s2")
+        assert [s["text"] for s in segments] == [_text(i) for i in range(len(SPEAKERS))]
+        label_of = {}
+        for segment, who in zip(segments, SPEAKERS, strict=True):
+            assert label_of.setdefault(who, segment["speaker"]) == segment["speaker"]
+        assert len(set(label_of.values())) == 2
+        assert result["result"]["num_speakers"] == 2
+
+    def test_full_path_without_windows_saves_dict_segments(self, task_repo, policy_loader) -> None:
+        from backend.infrastructure.workers.tasks.diarization_worker import diarize_session_worker
+
+        for idx in range(3):
+            _transcribe(task_repo, "s3", idx)
+        task_repo.ensure_task_exists("s3", "DIARIZATION")
+        StubTextProvider.calls = []
+
+        diarize_session_worker(
+            "s3", task_repo, Mock(), policy_loader, diarization_provider="stub_text"
+        )
+
+        assert StubTextProvider.calls == [3]
+        segments = task_repo.get_diarization_segments("s3")
+        assert [s["speaker"] for s in segments] == ["SPEAKER_0", "SPEAKER_1", "SPEAKER_1"]
@@ -0,0 +1,294 @@
+"""Tests for the Elasticsearch bulk pipeline (BulkIndexer, refresh_disabled, reindex).
+
+``FakeES`` stands in for the ``_bulk`` endpoint: it records every request,
+stores acknowledged docs, and can reject chosen items with a status code
+for a number of attempts.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from backend.repositories.elasticsearch_bulk import (
+    BulkIndexer,
+    ReindexCheckpoint,
+    refresh_disabled,
+    reindex_sessions,
+)
+
+
+class FakeIndices:
+    def __init__(self) -> None:
+        self.settings: dict[str, dict] = {}
+        self.refreshed: list[str] = []
+
+    def get_settings(self, index, name=None):  # noqa: ANN001
+        value = self.settings.get(index)
+        body = {"refresh_interval": value} if value is not None else {}
+        return {index: {"settings": {"index": body}}}
+
+    def put_settings(self, index, settings):  # noqa: ANN001
+        self.settings[index] = settings["index"]["refresh_interval"]
+
+    def refresh(self, index):  # noqa: ANN001
+        self.refreshed.append(index)
+
+
+class FakeES:
+    def __init__(
+        self, *, reject: dict[str, tuple[int, int]] | None = None, delay: float = 0.0
+    ) -> None:
+        self.reject = dict(reject or {})  # doc_id -> (status, times)
+        self.delay = delay
+        self.requests: list[int] = []
+        self.docs: dict[tuple[str, str], dict] = {}
+        self.indices = FakeIndices()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def bulk(self, operations, refresh=False):  # noqa: ANN001
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        items, errors = [], False
+        for action, source in zip(operations[::2], operations[1::2], strict=True):
+            meta = action["index"]
+            status, times = self.reject.get(meta["_id"], (201, 0))
+            if times > 0:
+                self.reject[meta["_id"]] = (status, times - 1)
+                errors = True
+                error = {"type": "x"}
+                items.append({"index": {"_id": meta["_id"], "status": status, "error": error}})
+            else:
+                self.docs[(meta["_index"], meta["_id"])] = source
+                items.append({"index": {"_id": meta["_id"], "status": 201}})
+        with self._lock:
+            self.requests.append(len(items))
+            self.in_flight -= 1
+        return {"errors": errors, "items": items}
+
+
+def _indexer(es: FakeES, **kwargs) -> BulkIndexer:
+    kwargs.setdefault("initial_backoff", 0.001)
+    return BulkIndexer(es, **kwargs)
+
+
+def test_size_based_flush_batches_requests():
+    es = FakeES()
+    with _indexer(es, max_actions=10, flush_interval=60) as indexer:
+        for i in range(25):
+            indexer.index("idx", f"d{i}", {"n": i})
+    assert es.requests == [10, 10, 5]
+    assert indexer.stats.indexed == 25 and indexer.stats.failed == 0
+    assert len(es.docs) == 25
+
+
+def test_byte_based_flush():
+    es = FakeES()
+    with _indexer(es, max_actions=1000, max_bytes=1000, flush_interval=60) as indexer:
+        for i in range(10):
+            indexer.index("idx", f"d{i}", {"text": "x" * 300})
+    assert len(es.requests) >= 3
+    assert sum(es.requests) == 10
+
+
+def test_time_based_flush_without_explicit_flush():
+    es = FakeES()
+    indexer = _indexer(es, max_actions=1000, flush_interval=0.05)
+    try:
+        indexer.index("idx", "d0", {"n": 0})
+        deadline = time.monotonic() + 2
+        while not es.docs and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert ("idx", "d0") in es.docs
+    finally:
+        indexer.close()
+
+
+def test_backpressure_bounds_batches_in_flight():
+    es = FakeES(delay=0.02)
+    indexer = _indexer(es, max_actions=5, max_in_flight=1, flush_interval=60)
+    t0 = time.perf_counter()
+    for i in range(50):
+        indexer.index("idx", f"d{i}", {"n": i})
+    produced = time.perf_counter() - t0
+    indexer.close()
+    # 10 batches, one sender, one queued slot: the producer had to wait.
+    assert produced >= 0.02 * 7
+    assert es.max_in_flight == 1
+    assert indexer.stats.indexed == 50
+
+
+def test_partial_failures_retry_only_rejected_items():
+    es = FakeES(reject={"d3": (429, 2), "d7": (503, 1)})
+    with _indexer(es, max_actions=10, flush_interval=60) as indexer:
+        for i in range(10):
+            indexer.index("idx", f"d{i}", {"n": i})
+    assert es.requests == [10, 2, 1]
+    assert indexer.stats.indexed == 10
+    assert indexer.stats.retried == 3
+    assert indexer.stats.failed == 0
+
+
+def test_non_retryable_and_exhausted_items_are_failed():
+    es = FakeES(reject={"bad": (400, 99), "busy": (429, 99)})
+    with _indexer(es, max_actions=10, flush_interval=60, max_retries=2) as indexer:
+        for doc_id in ("ok1", "bad", "busy", "ok2"):
+            indexer.index("idx", doc_id, {})
+    assert indexer.stats.indexed == 2
+    assert indexer.stats.failed == 2
+    assert {e["_id"] for e in indexer.stats.errors} == {"bad", "busy"}
+    assert es.requests == [4, 1, 1]
+
+
+def test_truncated_response_fails_the_whole_batch():
+    class Truncating(FakeES):
+        def bulk(self, operations, refresh=False):  # noqa: ANN001
+            response = super().bulk(operations, refresh)
+            response["items"] = response["items"][:-1]
+            return response
+
+    es = Truncating(reject={"d1": (400, 1)})
+    failed: list[str] = []
+    with _indexer(
+        es, flush_interval=60, on_failure=lambda _, doc_id: failed.append(doc_id)
+    ) as indexer:
+        for i in range(3):
+            indexer.index("idx", f"d{i}", {})
+    assert indexer.stats.indexed == 0
+    assert indexer.stats.failed == 3
+    assert sorted(failed) == ["d0", "d1", "d2"]
+
+
+def test_request_errors_are_retried():
+    class Flaky(FakeES):
+        calls = 0
+
+        def bulk(self, operations, refresh=False):  # noqa: ANN001
+            self.calls += 1
+            if self.calls == 1:
+                raise ConnectionError("reset")
+            return super().bulk(operations, refresh)
+
+    es = Flaky()
+    with _indexer(es, flush_interval=60) as indexer:
+        indexer.index("idx", "d0", {})
+    assert indexer.stats.indexed == 1 and indexer.stats.retried == 1
+
+
+def test_index_after_close_raises():
+    indexer = _indexer(FakeES())
+    indexer.close()
+    with pytest.raises(RuntimeError):
+        indexer.index("idx", "d0", {})
+
+
+def test_refresh_disabled_restores_previous_interval():
+    es = FakeES()
+    es.indices.settings["a"] = "5s"
+    with refresh_disabled(es, ["a", "b"]):
+        assert es.indices.settings == {"a": "-1", "b": "-1"}
+    assert es.indices.settings == {"a": "5s", "b": None}
+    assert es.indices.refreshed == ["a", "b"]
+
+
+def test_refresh_disabled_restores_on_error():
+    es = FakeES()
+    with pytest.raises(ValueError), refresh_disabled(es, ["a"]):
+        raise ValueError("boom")
+    assert es.indices.settings == {"a": None}
+
+
+def _sessions(n: int):
+    for s in range(n):
+        doctor = f"doc{s % 3}"
+        session_id = f"s{s:04d}"
+        yield session_id, doctor, [{"session_id": session_id, "chunk_number": c} for c in range(4)]
+
+
+def _to_action(doctor_id, event):  # noqa: ANN001
+    return f"idx-{doctor_id}", f"{event['session_id']}_{event['chunk_number']}", dict(event)
+
+
+def test_reindex_checkpoints_and_resumes(tmp_path):
+    path = tmp_path / "ckpt.json"
+    es = FakeES()
+
+    def crashing(n: int, at: int):
+        for i, session in enumerate(_sessions(n)):
+            if i == at:
+                raise RuntimeError("crash")
+            yield session
+
+    with _indexer(es, max_actions=7, flush_interval=60) as indexer, pytest.raises(RuntimeError):
+        reindex_sessions(
+            crashing(30, 25),
+            indexer=indexer,
+            checkpoint=ReindexCheckpoint.load(path),
+            to_action=_to_action,
+            checkpoint_every=10,
+        )
+    saved = ReindexCheckpoint.load(path)
+    assert saved.last_session == "s0019" and saved.indexed == 80 and not saved.completed
+
+    prepared: list[str] = []
+    with _indexer(es, max_actions=7, flush_interval=60) as indexer:
+        result = reindex_sessions(
+            _sessions(30),
+            indexer=indexer,
+            checkpoint=saved,
+            to_action=_to_action,
+            on_new_doctor=prepared.append,
+            checkpoint_every=10,
+        )
+    assert indexer.stats.indexed == 40  # only s0020..s0029
+    assert result.completed and result.indexed == 120 and result.last_session == "s0029"
+    assert sorted(prepared) == ["doc0", "doc1", "doc2"]
+    assert len(es.docs) == 120
+    assert ReindexCheckpoint.load(path).completed
+
+    # A completed checkpoint is a no-op
+    with _indexer(es) as indexer:
+        checkpoint = ReindexCheckpoint.load(path)
+        reindex_sessions(
+            _sessions(30), indexer=indexer, checkpoint=checkpoint, to_action=_to_action
+        )
+    assert indexer.stats.requests == 0
+
+
+def test_reindex_holds_checkpoint_before_failed_session(tmp_path):
+    path = tmp_path / "ckpt.json"
+    es = FakeES(reject={"s0012_1": (400, 1)})  # fails for good once, fine on the rerun
+    seen: list[tuple[str, str]] = []
+
+    with _indexer(
+        es, max_actions=7, flush_interval=60, on_failure=lambda *k: seen.append(k)
+    ) as indexer:
+        result = reindex_sessions(
+            _sessions(30),
+            indexer=indexer,
+            checkpoint=ReindexCheckpoint.load(path),
+            to_action=_to_action,
+            checkpoint_every=10,
+        )
+    assert seen == [("idx-doc0", "s0012_1")]  # the caller's hook still runs
+    assert indexer.on_failure is not None and indexer.stats.failed == 1
+    assert result.last_session == "s0011" and result.indexed == 48
+    assert result.failed == 1 and result.failed_sessions == ["s0012"]
+    assert not result.completed
+    saved = ReindexCheckpoint.load(path)
+    assert (saved.last_session, saved.failed_sessions) == ("s0011", ["s0012"])
+
+    with _indexer(es, max_actions=7, flush_interval=60) as indexer:
+        result = reindex_sessions(
+            _sessions(30), indexer=indexer, checkpoint=saved, to_action=_to_action
+        )
+    assert indexer.stats.indexed == 72  # s0012..s0029 re-sent (upserts)
+    assert result.completed and result.indexed == 120 and result.last_session == "s0029"
+    assert result.failed == 0 and result.failed_sessions == []
+    assert len(es.docs) == 120
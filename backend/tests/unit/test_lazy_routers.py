@@ -0,0 +1,153 @@
+"""Unit tests for lazy router mounting and the startup profiler helpers."""
+
+from __future__ import annotations
+
+import sys
+import textwrap
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pathlib import Path
+
+from backend.app.lazy_routers import LazyRouterSpec, register_lazy_routers
+from backend.app.startup_profile import StartupProfiler, parse_importtime, summarize_imports
+
+# ==============================================================================
+# FIXTURES
+# ==============================================================================
+
+
+@pytest.fixture
+def router_pkg(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Throwaway package with two router modules, removed from sys.modules after."""
+    pkg = tmp_path / "lazy_pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    for name, prefix in (("alpha", "/alpha"), ("beta", "/beta")):
+        (pkg / f"{name}.py").write_text(
+            textwrap.dedent(
+                f"""
+                from fastapi import APIRouter
+
+                router = APIRouter(prefix="{prefix}")
+
+                @router.get("/ping")
+                def ping():
+                    return {{"router": "{name}"}}
+                """
+            )
+        )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_pkg"
+    for mod in [m for m in sys.modules if m.startswith("lazy_pkg")]:
+        del sys.modules[mod]
+
+
+def _build(router_pkg: str) -> tuple[FastAPI, FastAPI]:
+    app = FastAPI()
+    sub = FastAPI()
+    register_lazy_routers(
+        sub,
+        [
+            LazyRouterSpec(f"{router_pkg}.alpha", "/aurity/alpha", "/aurity", ["Alpha"]),
+            LazyRouterSpec(f"{router_pkg}.beta", "/aurity/beta", "/aurity"),
+        ],
+    )
+    app.mount("/api", sub)
+    return app, sub
+
+
+# ==============================================================================
+# LAZY ROUTERS
+# ==============================================================================
+
+
+class TestLazyRouters:
+    """Routers are imported on the first request under their prefix."""
+
+    def test_import_deferred_until_first_request(self, router_pkg: str) -> None:
+        app, sub = _build(router_pkg)
+        client = TestClient(app)
+
+        assert f"{router_pkg}.alpha" not in sys.modules
+        assert client.get("/api/aurity/alpha/ping").json() == {"router": "alpha"}
+        assert f"{router_pkg}.alpha" in sys.modules
+        assert f"{router_pkg}.beta" not in sys.modules
+        assert [s.module for s in sub.state.lazy_routers.pending] == [f"{router_pkg}.beta"]
+
+    def test_unrelated_and_sibling_prefix_paths_do_not_load(self, router_pkg: str) -> None:
+        app, sub = _build(router_pkg)
+        client = TestClient(app)
+
+        assert client.get("/api/aurity/alphabet").status_code == 404
+        assert client.get("/api/other").status_code == 404
+        assert len(sub.state.lazy_routers.pending) == 2
+
+    def test_openapi_loads_everything(self, router_pkg: str) -> None:
+        app, _ = _build(router_pkg)
+        client = TestClient(app)
+
+        paths = client.get("/api/openapi.json").json()["paths"]
+        assert set(paths) == {"/aurity/alpha/ping", "/aurity/beta/ping"}
+        assert paths["/aurity/alpha/ping"]["get"]["tags"] == ["Alpha"]
+
+    def test_eager_mode(self, router_pkg: str, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("LAZY_ROUTERS", "false")
+        app, sub = _build(router_pkg)
+
+        assert sub.state.lazy_routers.pending == []
+        assert f"{router_pkg}.beta" in sys.modules
+        assert TestClient(app).get("/api/aurity/beta/ping").json() == {"router": "beta"}
+
+    def test_import_error_surfaces_and_retries(self, router_pkg: str) -> None:
+        app = FastAPI()
+        register_lazy_routers(app, [LazyRouterSpec(f"{router_pkg}.missing", "/gone")])
+        client = TestClient(app, raise_server_exceptions=False)
+
+        assert client.get("/gone/x").status_code == 500
+        assert len(app.state.lazy_routers.pending) == 1
+
+
+# ==============================================================================
+# STARTUP PROFILE
+# ==============================================================================
+
+
+class TestStartupProfile:
+    """Step timings and -X importtime parsing."""
+
+    def test_steps_recorded_only_when_enabled(self) -> None:
+        profiler = StartupProfiler(enabled=True)
+        with profiler.step("a"):
+            pass
+        assert [s["name"] for s in profiler.report()["steps"]] == ["a"]
+
+        disabled = StartupProfiler(enabled=False)
+        with disabled.step("a"):
+            pass
+        assert disabled.report()["steps"] == []
+
+    def test_parse_importtime(self) -> None:
+        stderr = textwrap.dedent(
+            """\
+            import time: self [us] | cumulative | imported package
+            import time:       100 |        100 |     sqlalchemy.sql
+            import time:      2000 |       2100 |   sqlalchemy
+            import time:       500 |        500 |     backend.models
+            import time:       300 |       2900 | backend
+            unrelated line
+            """
+        )
+        rows = parse_importtime(stderr)
+        assert [(r.module, r.depth) for r in rows] == [
+            ("sqlalchemy.sql", 2),
+            ("sqlalchemy", 1),
+            ("backend.models", 2),
+            ("backend", 0),
+        ]
+
+        summary = summarize_imports(rows)
+        assert summary["total_import_ms"] == 2.9
+        assert summary["self_ms_by_package"] == {"sqlalchemy": 2.1, "backend": 0.8}
+        assert [r["module"] for r in summary["slowest"]] == ["backend", "backend.models"]
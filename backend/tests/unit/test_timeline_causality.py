@@ -0,0 +1,111 @@
+"""Tests for AutoTimelineGenerator.detect_causality (indexed candidates).
+
+``_pairwise`` is the previous all-pairs implementation, kept here as the
+reference: on time-ordered events the indexed version must find exactly
+the same links, in the same order.
+"""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from backend.schemas.domain.timeline import CausalityType, TimelineEventType, create_timeline_event
+from backend.services.timeline.services.timeline.auto import AutoTimelineGenerator
+
+CONFIG = {
+    "auto": {
+        "enabled": False,
+        "causality": {
+            "same_artifact_weight": 1.0,
+            "temporal_adjacent_seconds": 30,
+            "same_actor_weight": 0.7,
+        },
+    }
+}
+T0 = datetime(2026, 1, 5, 9, 0, tzinfo=timezone.utc)
+
+
+def _event(who: str, seconds: float, artifact: str | None):
+    event = create_timeline_event(
+        event_type=TimelineEventType.USER_MESSAGE, who=who, what="x", raw_content=f"{who}{seconds}"
+    )
+    event.timestamp = T0 + timedelta(seconds=seconds)
+    event.reference_id = artifact
+    return event
+
+
+def _pairwise(events) -> list[tuple[str, str, CausalityType, str]]:
+    links = []
+    for i, event in enumerate(events):
+        for next_event in events[i + 1 :]:
+            if event.reference_id and event.reference_id == next_event.reference_id:
+                links.append(
+                    (
+                        event.event_id,
+                        next_event.event_id,
+                        CausalityType.TRIGGERED,
+                        f"Same artifact modified: {event.reference_id[:8]}...",
+                    )
+                )
+                continue
+            time_delta = (next_event.timestamp - event.timestamp).total_seconds()
+            if time_delta <= 30 and event.who == next_event.who:
+                links.append(
+                    (
+                        event.event_id,
+                        next_event.event_id,
+                        CausalityType.CAUSED_BY,
+                        f"Temporal adjacency ({time_delta:.1f}s) + same actor",
+                    )
+                )
+    return links
+
+
+def _links(events) -> list[tuple[str, str, CausalityType, str]]:
+    candidates = AutoTimelineGenerator(config=CONFIG).detect_causality(events)
+    return [
+        (c.source_event_id, c.target_event_id, c.causality_type, c.explanation) for c in candidates
+    ]
+
+
+def test_demo_fixture_links() -> None:
+    # Same events as the module's CLI demo
+    events = [
+        _event("user_abc123", 0, "audio_001"),
+        _event("system", 5, "corpus_001"),
+        _event("assistant", 15, "soap_001"),
+        _event("user_abc123", 120, None),
+        _event("user_abc123", 130, "audio_001"),
+    ]
+    links = _links(events)
+    assert links == _pairwise(events)
+    assert [(link[2], link[3][:22]) for link in links] == [
+        (CausalityType.TRIGGERED, "Same artifact modified"),
+        (CausalityType.CAUSED_BY, "Temporal adjacency (10"),
+    ]
+
+
+def test_matches_pairwise_on_random_histories() -> None:
+    rng = random.Random(7)
+    for _ in range(20):
+        seconds = sorted(rng.uniform(0, 600) for _ in range(120))
+        # Equal timestamps and window-edge gaps on purpose
+        seconds[10] = seconds[11] = seconds[12]
+        seconds[20] = seconds[21] - 30
+        seconds.sort()
+        events = [
+            _event(
+                rng.choice(["doctor", "system", "assistant"]),
+                s,
+                rng.choice([None, None, "a1", "a2", "a3"]),
+            )
+            for s in seconds
+        ]
+        assert _links(events) == _pairwise(events)
+
+
+def test_window_is_per_actor() -> None:
+    events = [_event("doctor", 0, None), _event("system", 1, None), _event("doctor", 29, None)]
+    links = _links(events)
+    assert [(link[0], link[1]) for link in links] == [(events[0].event_id, events[2].event_id)]
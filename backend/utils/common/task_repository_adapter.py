@@ -76,6 +76,16 @@ class TaskRepositoryAdapter(ITaskRepository):
         """Get diarization segments for session."""
         return self._repository.get_diarization_segments(session_id)
 
+    def save_diarization_window(
+        self, session_id: str, window_index: int, window: dict[str, Any]
+    ) -> None:
+        """Save one rolling diarization window."""
+        self._repository.save_diarization_window(session_id, window_index, window)
+
+    def get_diarization_windows(self, session_id: str) -> list[dict[str, Any]]:
+        """Get rolling diarization windows for session."""
+        return self._repository.get_diarization_windows(session_id)
+
     def save_soap_data(
         self, session_id: str, soap_data: dict[str, Any], task_type: str = "SOAP_GENERATION"
     ) -> None:
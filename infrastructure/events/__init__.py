@@ -36,7 +36,9 @@ from infrastructure.events.application.event_bus import EventBus, get_event_bus
 # Replay
 from infrastructure.events.application.replay import (
     ReplayResult,
+    SnapshotPolicy,
     replay_aggregate,
+    replay_aggregates,
 )
 
 # Contracts
@@ -101,7 +103,9 @@ __all__ = [
     "list_contracts",
     # Replay
     "replay_aggregate",
+    "replay_aggregates",
     "ReplayResult",
+    "SnapshotPolicy",
     # Snapshots
     "SnapshotStore",
     "get_snapshot_store",
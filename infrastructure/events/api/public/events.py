@@ -27,6 +27,7 @@ from infrastructure.events.application.event_bus import get_event_bus
 from infrastructure.events.application.replay import replay_aggregate
 from infrastructure.events.domain.events import EventType
 from infrastructure.events.infrastructure.consumer_offsets import get_offset_store
+from infrastructure.events.infrastructure.snapshots import get_snapshot_store
 from infrastructure.events.projections.registry import get_registry
 from fastapi import APIRouter, HTTPException, Query, Request, status
 from fastapi.responses import StreamingResponse
@@ -78,6 +79,8 @@ class EventBusMetricsResponse(BaseModel):
     avg_latency_ms: float
     handlers_count: int
     global_handlers_count: int
+    dispatch: str = "inline"
+    subscribers: list[dict] = Field(default_factory=list)
 
 
 # ============================================================================
@@ -182,7 +185,10 @@ async def get_event_stats() -> EventStoreStatsResponse:
     "/metrics",
     response_model=EventBusMetricsResponse,
     summary="Get event bus metrics",
-    description="Returns runtime metrics for the event bus (events published, latency, handlers)",
+    description=(
+        "Returns runtime metrics for the event bus (events published, latency, handlers, "
+        "and per-subscriber queue depth and lag in async dispatch)"
+    ),
 )
 async def get_event_metrics() -> EventBusMetricsResponse:
     """Get event bus runtime metrics.
@@ -227,18 +233,29 @@ class ReplayResponse(BaseModel):
     final_state: dict = Field(default_factory=dict)
     errors: list[str] = Field(default_factory=list)
     replay_duration_ms: float = 0.0
+    tail_event_count: int = 0  # Events applied (after snapshot_version, if any)
+    snapshot_version: int | None = None
+    version: int = 0
+    snapshot_taken: bool = False
 
 
 @router.get(
     "/replay/{aggregate_id}",
     response_model=ReplayResponse,
     summary="Replay aggregate state",
-    description="Reconstructs aggregate state by replaying all events from the stream.",
+    description=(
+        "Reconstructs aggregate state by replaying the stream. With from_version=0 it "
+        "starts from the newest valid snapshot and replays only the events after it; "
+        "use_snapshots=false rebuilds from the first event."
+    ),
 )
 async def replay_aggregate_endpoint(
     aggregate_id: str,
     from_version: int = Query(0, ge=0, description="Start from this version"),
     reducer: str = Query("default", description="Reducer to use: default, transcription, session"),
+    use_snapshots: bool = Query(
+        True, description="Start from (and save) snapshots; false forces a full rebuild"
+    ),
 ) -> ReplayResponse:
     """Replay aggregate to reconstruct state.
 
@@ -246,6 +263,8 @@ async def replay_aggregate_endpoint(
         aggregate_id: The aggregate ID (e.g., session_id)
         from_version: Start from this version (0 = all)
         reducer: Which reducer to use
+        use_snapshots: False replays the whole stream and neither reads nor
+            writes snapshots
 
     Returns:
         ReplayResponse with final state and metadata
@@ -277,6 +296,7 @@ async def replay_aggregate_endpoint(
             event_store=event_bus._store,
             reducer=reducer_fn,
             from_version=from_version,
+            snapshot_store=get_snapshot_store() if use_snapshots else None,
         )
 
         return ReplayResponse(
@@ -289,6 +309,10 @@ async def replay_aggregate_endpoint(
             final_state=result.final_state,
             errors=result.errors,
             replay_duration_ms=result.replay_duration_ms,
+            tail_event_count=result.tail_event_count,
+            snapshot_version=result.snapshot_version,
+            version=result.version,
+            snapshot_taken=result.snapshot_taken,
         )
 
     except HTTPException:
@@ -6,19 +6,35 @@ The EventBus is the central hub for event distribution:
 3. Bus notifies subscribers (handlers, projectors)
 4. Metrics/logging happen here
 
+Dispatch modes:
+- "inline" (default): publish() awaits every handler, so the publisher
+  pays for the slowest subscriber.
+- "async": publish() persists, enqueues the event on each subscriber's
+  bounded queue and returns. A worker per queue delivers in order,
+  micro-batching for handlers subscribed with batch=True. Queues are
+  partitioned by aggregate_id, so events of one stream stay in order.
+  A full queue blocks the publisher (backpressure) or, with
+  overflow="drop", drops the event for that subscriber.
+
 Usage:
     event_bus = get_event_bus()
     await event_bus.publish(TranscriptionStartedEvent.create(session_id="..."))
+
+    bus = EventBus(store, dispatch="async")
+    bus.subscribe_all(index_batch, batch=True)
 """
 
 from __future__ import annotations
 
 import asyncio
 import time
+import zlib
 from collections import defaultdict
-from typing import TYPE_CHECKING, Awaitable, Callable
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
 from backend.utils.common.logging.logger import get_logger
+from infrastructure.events.observability.metrics import get_metrics as get_event_metrics
 
 if TYPE_CHECKING:
     from infrastructure.events.application.event_store import EventStore
@@ -28,6 +44,181 @@ logger = get_logger(__name__)
 
 # Type alias for event handlers
 EventHandler = Callable[["DomainEvent"], Awaitable[None]]
+BatchEventHandler = Callable[[list["DomainEvent"]], Awaitable[None]]
+
+DISPATCH_MODES = ("inline", "async")
+OVERFLOW_POLICIES = ("block", "drop")
+
+
+@dataclass
+class SubscriberStats:
+    """Delivery counters for one subscriber (async dispatch)."""
+
+    delivered: int = 0
+    failed: int = 0
+    batches: int = 0
+    dropped: int = 0  # overflow="drop" and the queue was full
+    blocked: int = 0  # publishes that waited for queue space
+    last_lag_ms: float = 0.0  # enqueue -> handler call (oldest event of a batch)
+    max_lag_ms: float = 0.0
+
+
+class _Subscription:
+    """A subscriber in async mode: partitioned bounded queues, one worker each."""
+
+    def __init__(
+        self,
+        name: str,
+        handler: EventHandler | BatchEventHandler,
+        event_type: str | None,
+        *,
+        batch: bool,
+        partitions: int,
+        queue_size: int,
+        max_batch: int,
+        max_batch_wait: float,
+    ):
+        self.name = name
+        self.handler = handler
+        self.event_type = event_type  # None: all events
+        self.batch = batch
+        self.partitions = max(1, partitions)
+        self.queue_size = queue_size
+        self.max_batch = max(1, max_batch)
+        self.max_batch_wait = max_batch_wait
+        self.stats = SubscriberStats()
+        self.queues: list[asyncio.Queue] = []
+        self.tasks: list[asyncio.Task] = []
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def accepts(self, event_type: str) -> bool:
+        return self.event_type is None or self.event_type == event_type
+
+    def queue_for(self, event: "DomainEvent") -> asyncio.Queue:
+        """Bounded queue for the event's stream (starting workers if needed)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # First use, or the bus outlived its loop (tests, reloads)
+            self._loop = loop
+            self.queues = [asyncio.Queue(maxsize=self.queue_size) for _ in range(self.partitions)]
+            self.tasks = [
+                loop.create_task(self._run(queue), name=f"event-bus:{self.name}:{i}")
+                for i, queue in enumerate(self.queues)
+            ]
+        if self.partitions == 1:
+            return self.queues[0]
+        return self.queues[zlib.crc32(event.aggregate_id.encode()) % self.partitions]
+
+    @property
+    def depth(self) -> int:
+        return sum(queue.qsize() for queue in self.queues)
+
+    async def join(self) -> None:
+        await asyncio.gather(*(queue.join() for queue in self.queues))
+
+    async def stop(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks, self.queues, self._loop = [], [], None
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        while True:
+            batch = [await queue.get()]
+            try:
+                await self._collect(queue, batch)
+                await self._deliver(batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _collect(self, queue: asyncio.Queue, batch: list) -> None:
+        """Take what is already queued; batch handlers wait max_batch_wait for more."""
+        deadline = time.monotonic() + self.max_batch_wait
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.monotonic()
+            if not self.batch or remaining <= 0:
+                return
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except TimeoutError:
+                return
+
+    def _record_lag(self, enqueued_at: float) -> None:
+        stats = self.stats
+        stats.last_lag_ms = (time.monotonic() - enqueued_at) * 1000
+        stats.max_lag_ms = max(stats.max_lag_ms, stats.last_lag_ms)
+
+    async def _deliver(self, batch: list[tuple[float, "DomainEvent"]]) -> None:
+        stats = self.stats
+        events = [event for _, event in batch]
+
+        if self.batch:
+            self._record_lag(batch[0][0])  # the oldest event waited longest
+            try:
+                await self.handler(events)
+                stats.delivered += len(events)
+            except Exception as e:
+                stats.failed += len(events)
+                logger.warning(
+                    "EVENT_BATCH_HANDLER_FAILED",
+                    handler=self.name,
+                    batch_size=len(events),
+                    first_event_id=events[0].event_id,
+                    error=str(e),
+                )
+        else:
+            for enqueued_at, event in batch:
+                self._record_lag(enqueued_at)
+                try:
+                    await self.handler(event)
+                    stats.delivered += 1
+                except Exception as e:
+                    stats.failed += 1
+                    logger.warning(
+                        "EVENT_HANDLER_FAILED",
+                        event_id=event.event_id,
+                        handler=self.name,
+                        error=str(e),
+                    )
+
+        stats.batches += 1
+        get_event_metrics().set_consumer_lag(f"event_bus:{self.name}", self.depth)
+
+    def info(self) -> dict[str, Any]:
+        stats = self.stats
+        handled = stats.delivered + stats.failed
+        return {
+            "name": self.name,
+            "event_type": self.event_type,
+            "batch": self.batch,
+            "partitions": self.partitions,
+            "queue_depth": self.depth,
+            "queue_capacity": self.queue_size * self.partitions,
+            **asdict(stats),
+            "avg_batch_size": round(handled / stats.batches, 2) if stats.batches else 0.0,
+            "last_lag_ms": round(stats.last_lag_ms, 2),
+            "max_lag_ms": round(stats.max_lag_ms, 2),
+        }
+
+
+def _handler_name(handler: Callable) -> str:
+    return getattr(handler, "__qualname__", None) or type(handler).__name__
+
+
+def _as_single(handler: BatchEventHandler) -> EventHandler:
+    """Adapt a batch handler for inline dispatch (one-event batches)."""
+
+    async def _single(event: "DomainEvent") -> None:
+        await handler([event])
+
+    _single.__name__ = getattr(handler, "__name__", "batch_handler")
+    return _single
 
 
 class EventBus:
@@ -37,20 +228,50 @@ class EventBus:
     - Async publish with optional await for handlers
     - Pluggable EventStore for persistence
     - Subscribe handlers by event type
-    - Metrics: events_published, publish_latency
+    - Inline or queued ("async") dispatch, see module docstring
+    - Metrics: events_published, publish_latency, per-subscriber lag
     """
 
-    def __init__(self, event_store: "EventStore | None" = None):
+    def __init__(
+        self,
+        event_store: "EventStore | None" = None,
+        *,
+        dispatch: str = "inline",
+        queue_size: int = 1000,
+        max_batch: int = 100,
+        max_batch_wait: float = 0.005,
+        overflow: str = "block",
+    ):
         """Initialize event bus.
 
         Args:
             event_store: Optional store for persistence. If None, events
                         are only delivered to subscribers (fire-and-forget).
+            dispatch: "inline" or "async"
+            queue_size: Per-subscriber (per-partition) queue bound, async mode
+            max_batch: Most events delivered per batch, async mode
+            max_batch_wait: Seconds a batch handler waits to fill a batch
+            overflow: "block" the publisher or "drop" when a queue is full
+
+        Raises:
+            ValueError: Unknown dispatch mode or overflow policy
         """
+        if dispatch not in DISPATCH_MODES:
+            raise ValueError(f"dispatch must be one of {DISPATCH_MODES}, got {dispatch!r}")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got {overflow!r}")
+
         self._store = event_store
         self._handlers: dict[str, list[EventHandler]] = defaultdict(list)
         self._global_handlers: list[EventHandler] = []
 
+        self._dispatch = dispatch
+        self._queue_size = queue_size
+        self._max_batch = max_batch
+        self._max_batch_wait = max_batch_wait
+        self._overflow = overflow
+        self._subscriptions: list[_Subscription] = []
+
         # Metrics
         self._events_published = 0
         self._total_latency_ms = 0.0
@@ -58,6 +279,7 @@ class EventBus:
         logger.info(
             "EVENT_BUS_INITIALIZED",
             has_store=event_store is not None,
+            dispatch=dispatch,
         )
 
     async def publish(
@@ -72,6 +294,9 @@ class EventBus:
         3. Notify global handlers
         4. Log and update metrics
 
+        In async mode step 2-3 only enqueue; this waits for subscribers
+        only when a queue is full and overflow="block".
+
         Args:
             event: The domain event to publish
             persist: Whether to persist to store (default True)
@@ -89,7 +314,9 @@ class EventBus:
             # 2. Notify handlers (fire-and-forget, don't block)
             handlers = self._handlers.get(event.event_type.value, []) + self._global_handlers
 
-            if handlers:
+            if self._dispatch == "async":
+                await self._enqueue(event)
+            elif handlers:
                 # Run handlers concurrently
                 await asyncio.gather(
                     *[self._safe_call(h, event) for h in handlers],
@@ -120,6 +347,39 @@ class EventBus:
             )
             raise
 
+    async def _enqueue(self, event: "DomainEvent") -> None:
+        """Hand the event to every matching subscriber's queue (async mode)."""
+        event_type = event.event_type.value
+        for sub in self._subscriptions:
+            if not sub.accepts(event_type):
+                continue
+            queue = sub.queue_for(event)
+            item = (time.monotonic(), event)
+            if not queue.full():
+                queue.put_nowait(item)
+            elif self._overflow == "drop":
+                sub.stats.dropped += 1
+                if sub.stats.dropped % 1000 == 1:
+                    logger.warning(
+                        "EVENT_SUBSCRIBER_QUEUE_FULL",
+                        handler=sub.name,
+                        event_id=event.event_id,
+                        dropped=sub.stats.dropped,
+                    )
+            else:
+                sub.stats.blocked += 1
+                await queue.put(item)
+
+    async def drain(self) -> None:
+        """Wait until every queued event has been delivered (async mode)."""
+        await asyncio.gather(*(sub.join() for sub in self._subscriptions))
+
+    async def close(self) -> None:
+        """Drain queues, then stop the delivery workers (async mode)."""
+        await self.drain()
+        for sub in self._subscriptions:
+            await sub.stop()
+
     async def _safe_call(
         self,
         handler: EventHandler,
@@ -139,40 +399,87 @@ class EventBus:
     def subscribe(
         self,
         event_type: "EventType",
-        handler: EventHandler,
+        handler: EventHandler | BatchEventHandler,
+        *,
+        batch: bool = False,
+        partitions: int = 1,
     ) -> None:
         """Subscribe handler to specific event type.
 
         Args:
             event_type: Type of events to receive
             handler: Async function to call with event
+            batch: Handler takes a list of events (micro-batches in async mode)
+            partitions: Async mode: queues/workers, split by aggregate_id
         """
-        self._handlers[event_type.value].append(handler)
+        if batch:
+            self._handlers[event_type.value].append(_as_single(handler))
+        else:
+            self._handlers[event_type.value].append(handler)
+        self._add_subscription(handler, event_type.value, batch, partitions)
         logger.debug(
             "EVENT_HANDLER_SUBSCRIBED",
             event_type=event_type.value,
-            handler=handler.__name__,
+            handler=_handler_name(handler),
+            batch=batch,
         )
 
-    def subscribe_all(self, handler: EventHandler) -> None:
+    def subscribe_all(
+        self,
+        handler: EventHandler | BatchEventHandler,
+        *,
+        batch: bool = False,
+        partitions: int = 1,
+    ) -> None:
         """Subscribe handler to ALL event types.
 
         Use sparingly - mainly for logging/metrics.
 
         Args:
             handler: Async function to call with every event
+            batch: Handler takes a list of events (micro-batches in async mode)
+            partitions: Async mode: queues/workers, split by aggregate_id
         """
-        self._global_handlers.append(handler)
+        self._global_handlers.append(_as_single(handler) if batch else handler)
+        self._add_subscription(handler, None, batch, partitions)
         logger.debug(
             "GLOBAL_EVENT_HANDLER_SUBSCRIBED",
-            handler=handler.__name__,
+            handler=_handler_name(handler),
+            batch=batch,
+        )
+
+    def _add_subscription(
+        self,
+        handler: EventHandler | BatchEventHandler,
+        event_type: str | None,
+        batch: bool,
+        partitions: int,
+    ) -> None:
+        name = _handler_name(handler)
+        taken = {sub.name for sub in self._subscriptions}
+        suffix = 2
+        unique = name
+        while unique in taken:
+            unique, suffix = f"{name}#{suffix}", suffix + 1
+        self._subscriptions.append(
+            _Subscription(
+                unique,
+                handler,
+                event_type,
+                batch=batch,
+                partitions=partitions,
+                queue_size=self._queue_size,
+                max_batch=self._max_batch,
+                max_batch_wait=self._max_batch_wait,
+            )
         )
 
     def get_metrics(self) -> dict:
         """Get event bus metrics.
 
         Returns:
-            Dict with events_published, avg_latency_ms, handlers_count
+            Dict with events_published, avg_latency_ms, handlers_count,
+            dispatch and per-subscriber queue/lag stats (async mode)
         """
         avg_latency = (
             self._total_latency_ms / self._events_published if self._events_published > 0 else 0.0
@@ -182,6 +489,10 @@ class EventBus:
             "avg_latency_ms": round(avg_latency, 2),
             "handlers_count": sum(len(h) for h in self._handlers.values()),
             "global_handlers_count": len(self._global_handlers),
+            "dispatch": self._dispatch,
+            "subscribers": (
+                [sub.info() for sub in self._subscriptions] if self._dispatch == "async" else []
+            ),
         }
 
 
@@ -207,18 +518,23 @@ def get_event_bus() -> EventBus:
     return _event_bus
 
 
-def configure_event_bus(event_store: "EventStore") -> EventBus:
+def configure_event_bus(event_store: "EventStore", **options: Any) -> EventBus:
     """Configure the global EventBus with a store.
 
     Call this at application startup to enable persistence.
 
     Args:
         event_store: The store implementation to use
+        **options: EventBus options (dispatch="async", queue_size, ...)
 
     Returns:
         The configured EventBus
     """
     global _event_bus
-    _event_bus = EventBus(event_store=event_store)
-    logger.info("EVENT_BUS_CONFIGURED", store_type=type(event_store).__name__)
+    _event_bus = EventBus(event_store=event_store, **options)
+    logger.info(
+        "EVENT_BUS_CONFIGURED",
+        store_type=type(event_store).__name__,
+        dispatch=_event_bus._dispatch,
+    )
     return _event_bus
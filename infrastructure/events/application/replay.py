@@ -6,15 +6,29 @@ Replay allows:
 - Debugging/auditing historical state
 - Rebuilding projections after schema changes
 
+With a SnapshotStore, replay starts from the newest valid snapshot for the
+reducer and only applies the tail of the stream, so its cost follows the
+events since the last snapshot instead of the stream length. Snapshots are
+taken when a replay finds the tail expensive (SnapshotPolicy), so hot or
+long aggregates get them and small ones don't.
+
 Usage:
     from infrastructure.events.application.replay import replay_aggregate, ReplayResult
 
-    result = await replay_aggregate("session-123")
+    result = await replay_aggregate("session-123", event_store, snapshot_store=snapshots)
     print(result.event_count, result.final_state)
+
+    # Bulk rebuild
+    results = await replay_aggregates(session_ids, event_store, snapshot_store=snapshots)
 """
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
+import types
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Callable
@@ -24,6 +38,7 @@ from backend.utils.common.logging.logger import get_logger
 if TYPE_CHECKING:
     from infrastructure.events.application.event_store import EventStore
     from infrastructure.events.domain.events import DomainEvent
+    from infrastructure.events.infrastructure.snapshots import SnapshotStore
 
 logger = get_logger(__name__)
 
@@ -41,12 +56,80 @@ class ReplayResult:
     final_state: dict[str, Any] = field(default_factory=dict)
     errors: list[str] = field(default_factory=list)
     replay_duration_ms: float = 0.0
+    # event_count and first/last_* cover the whole stream from from_version,
+    # snapshot included; tail_event_count counts the events actually applied
+    # (the tail after snapshot_version when a snapshot was used)
+    tail_event_count: int = 0
+    snapshot_version: int | None = None
+    version: int = 0  # Stream version final_state reflects
+    snapshot_taken: bool = False
 
 
 # Type alias for state reducer function
 StateReducer = Callable[[dict[str, Any], "DomainEvent"], dict[str, Any]]
 
 
+@dataclass
+class SnapshotPolicy:
+    """When a replay leaves a snapshot behind.
+
+    A replay that applied at least ``min_tail_events`` events snapshots its
+    final state if the tail was long (``max_tail_events``) or slow
+    (``max_tail_ms``). Cheap aggregates never pay for snapshot writes; a
+    stream that keeps growing gets a new snapshot once its tail costs too
+    much again.
+    """
+
+    max_tail_events: int = 500
+    max_tail_ms: float = 50.0
+    min_tail_events: int = 20
+
+    def should_snapshot(self, tail_events: int, tail_ms: float) -> bool:
+        if tail_events < self.min_tail_events:
+            return False
+        return tail_events >= self.max_tail_events or tail_ms >= self.max_tail_ms
+
+
+def reducer_snapshot_key(reducer: StateReducer) -> str | None:
+    """Name a reducer's snapshots are stored under: ``{__name__}.{code hash}``.
+
+    Any change to the reducer's own code (nested functions included) changes
+    the key, so snapshots built by an older version are never replayed from.
+    Code it calls into is not hashed: when only that changes, bump a
+    ``snapshot_version`` attribute on the reducer.
+
+    Returns:
+        The key, or None for reducers without a plain name or code (lambdas,
+        partials, callable objects), which never use snapshots
+    """
+    name = getattr(reducer, "__name__", "")
+    code = getattr(reducer, "__code__", None)
+    if not name.isidentifier() or code is None:
+        return None
+    digest = hashlib.sha256(repr(getattr(reducer, "snapshot_version", None)).encode())
+    _hash_code(digest, code)
+    return f"{name}.{digest.hexdigest()[:12]}"
+
+
+def _hash_code(digest: Any, code: types.CodeType) -> None:
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _hash_code(digest, const)
+        else:
+            digest.update(_stable_repr(const).encode())
+
+
+def _stable_repr(value: Any) -> str:
+    """repr() that does not depend on string hash randomization (set literals)."""
+    if isinstance(value, frozenset):
+        return "frozenset(" + repr(sorted(_stable_repr(v) for v in value)) + ")"
+    if isinstance(value, tuple):
+        return "(" + ", ".join(_stable_repr(v) for v in value) + ")"
+    return repr(value)
+
+
 def default_reducer(state: dict[str, Any], event: "DomainEvent") -> dict[str, Any]:
     """Default reducer that accumulates event counts by type.
 
@@ -88,9 +171,18 @@ async def replay_aggregate(
     reducer: StateReducer | None = None,
     from_snapshot: dict[str, Any] | None = None,
     from_version: int = 0,
+    snapshot_store: "SnapshotStore | None" = None,
+    snapshot_policy: SnapshotPolicy | None = None,
 ) -> ReplayResult:
     """Replay event stream to reconstruct aggregate state.
 
+    With ``snapshot_store`` (and no explicit ``from_snapshot``/``from_version``)
+    replay starts from the newest snapshot that passes its checksum and still
+    matches the stream (its last event is at the same position), then applies
+    only the tail. Anything else falls back to a full replay. Snapshots are
+    keyed by reducer_snapshot_key(reducer), so a changed reducer rebuilds
+    them; lambdas never use them.
+
     Args:
         aggregate_id: The aggregate to replay
         event_store: EventStore instance to load events from
@@ -98,6 +190,8 @@ async def replay_aggregate(
                 Default accumulates event counts and timeline.
         from_snapshot: Optional snapshot to start from (avoids full replay)
         from_version: Start replaying from this version (0 = all)
+        snapshot_store: Optional SnapshotStore to start from and to save to
+        snapshot_policy: When to save a snapshot (default SnapshotPolicy())
 
     Returns:
         ReplayResult with final state and metadata
@@ -106,25 +200,64 @@ async def replay_aggregate(
 
     start_time = time.perf_counter()
     reducer = reducer or default_reducer
+    reducer_name = reducer_snapshot_key(reducer)
+    use_snapshots = (
+        snapshot_store is not None
+        and from_snapshot is None
+        and from_version == 0
+        and reducer_name is not None
+    )
 
-    # Initialize state
-    state = from_snapshot.copy() if from_snapshot else {}
+    # Initialize state (reducers mutate it in place)
+    state = copy.deepcopy(from_snapshot) if from_snapshot else {}
 
-    result = ReplayResult(aggregate_id=aggregate_id, event_count=0)
+    result = ReplayResult(aggregate_id=aggregate_id, event_count=0, version=from_version)
 
     try:
-        # Load events
-        events = await event_store.load_stream(aggregate_id, from_version)
-
-        if not events:
+        snapshot = None
+        if use_snapshots:
+            snapshot = await snapshot_store.load_valid(aggregate_id, reducer=reducer_name)
+
+        if snapshot is not None:
+            # Re-read the snapshot's last event to check the stream is the one
+            # it was built from (not truncated, rebuilt or reordered)
+            overlap = 1 if snapshot.last_event_id and snapshot.event_version > 0 else 0
+            events = await event_store.load_stream(aggregate_id, snapshot.event_version - overlap)
+            if (overlap and (not events or events[0].event_id != snapshot.last_event_id)) or (
+                snapshot.event_version > 0 and snapshot.first_event_id is None
+            ):
+                logger.warning(
+                    "REPLAY_SNAPSHOT_STALE",
+                    aggregate_id=aggregate_id,
+                    snapshot_version=snapshot.event_version,
+                )
+                snapshot = None
+                events = await event_store.load_stream(aggregate_id, 0)
+            else:
+                events = events[overlap:]
+                state = snapshot.state  # freshly decoded, safe to mutate
+                result.snapshot_version = result.version = snapshot.event_version
+                result.event_count = snapshot.event_version
+                result.first_event_id = snapshot.first_event_id
+                result.first_timestamp = snapshot.first_timestamp
+                result.last_event_id = snapshot.last_event_id
+                result.last_timestamp = snapshot.last_timestamp
+        else:
+            # Load events
+            events = await event_store.load_stream(aggregate_id, from_version)
+
+        if not events and snapshot is None:
             logger.info("REPLAY_EMPTY_STREAM", aggregate_id=aggregate_id)
-            return result
 
-        result.event_count = len(events)
-        result.first_event_id = events[0].event_id
-        result.last_event_id = events[-1].event_id
-        result.first_timestamp = events[0].timestamp
-        result.last_timestamp = events[-1].timestamp
+        if events:
+            result.tail_event_count = len(events)
+            result.event_count += len(events)
+            result.version += len(events)
+            if result.first_event_id is None:
+                result.first_event_id = events[0].event_id
+                result.first_timestamp = events[0].timestamp
+            result.last_event_id = events[-1].event_id
+            result.last_timestamp = events[-1].timestamp
 
         # Apply events
         for event in events:
@@ -137,6 +270,30 @@ async def replay_aggregate(
 
         result.final_state = state
 
+        tail_ms = (time.perf_counter() - start_time) * 1000
+        policy = snapshot_policy or SnapshotPolicy()
+        if (
+            use_snapshots
+            and events
+            and not result.errors
+            and policy.should_snapshot(len(events), tail_ms)
+        ):
+            try:
+                await snapshot_store.save_snapshot(
+                    aggregate_id,
+                    state,
+                    result.version,
+                    reducer=reducer_name,
+                    last_event_id=result.last_event_id,
+                    first_event_id=result.first_event_id,
+                    first_timestamp=result.first_timestamp,
+                    last_timestamp=result.last_timestamp,
+                )
+                result.snapshot_taken = True
+            except Exception as e:
+                # Not JSON-serializable, disk full...: replay result still stands
+                logger.warning("REPLAY_SNAPSHOT_FAILED", aggregate_id=aggregate_id, error=str(e))
+
     except Exception as e:
         result.errors.append(f"Replay failed: {e}")
         logger.error("REPLAY_FAILED", aggregate_id=aggregate_id, error=str(e))
@@ -147,6 +304,9 @@ async def replay_aggregate(
         "REPLAY_COMPLETED",
         aggregate_id=aggregate_id,
         event_count=result.event_count,
+        tail_event_count=result.tail_event_count,
+        snapshot_version=result.snapshot_version,
+        snapshot_taken=result.snapshot_taken,
         error_count=len(result.errors),
         duration_ms=round(result.replay_duration_ms, 2),
     )
@@ -154,6 +314,56 @@ async def replay_aggregate(
     return result
 
 
+async def replay_aggregates(
+    aggregate_ids: Iterable[str],
+    event_store: "EventStore",
+    reducer: StateReducer | None = None,
+    snapshot_store: "SnapshotStore | None" = None,
+    snapshot_policy: SnapshotPolicy | None = None,
+    concurrency: int = 8,
+) -> dict[str, ReplayResult]:
+    """Replay many aggregates concurrently (projection rebuilds, audits).
+
+    Up to ``concurrency`` replays are in flight, so one aggregate's stream
+    and snapshot reads (worker threads) overlap with the others' reducers.
+
+    Args:
+        aggregate_ids: Aggregates to replay (duplicates are replayed once)
+        event_store: EventStore instance to load events from
+        reducer: State reducer, as in replay_aggregate
+        snapshot_store: Optional SnapshotStore, as in replay_aggregate
+        snapshot_policy: When to save a snapshot, as in replay_aggregate
+        concurrency: Maximum replays in flight
+
+    Returns:
+        ReplayResult per aggregate_id, in input order
+    """
+    ids = list(dict.fromkeys(aggregate_ids))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _replay(aggregate_id: str) -> ReplayResult:
+        async with semaphore:
+            return await replay_aggregate(
+                aggregate_id,
+                event_store,
+                reducer=reducer,
+                snapshot_store=snapshot_store,
+                snapshot_policy=snapshot_policy,
+            )
+
+    results = await asyncio.gather(*(_replay(aggregate_id) for aggregate_id in ids))
+
+    logger.info(
+        "REPLAY_BATCH_COMPLETED",
+        aggregate_count=len(ids),
+        from_snapshot=sum(1 for r in results if r.snapshot_version is not None),
+        snapshots_taken=sum(1 for r in results if r.snapshot_taken),
+        error_count=sum(1 for r in results if r.errors),
+    )
+
+    return dict(zip(ids, results, strict=True))
+
+
 async def validate_stream(
     aggregate_id: str,
     event_store: "EventStore",
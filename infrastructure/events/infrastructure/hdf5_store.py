@@ -189,10 +189,8 @@ class HDF5EventStore(EventStore):
 
                 stream = events_group[aggregate_id]["stream"]
 
-                for i, event_json in enumerate(stream):
-                    if i < from_version:
-                        continue
-
+                # Slice first: a replay from a snapshot only reads the tail
+                for event_json in stream[from_version:]:
                     event_data = json.loads(event_json)
                     # Reconstruct DomainEvent
                     event = DomainEvent(
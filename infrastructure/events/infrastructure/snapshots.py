@@ -1,11 +1,13 @@
 """Snapshots - Periodic aggregate state snapshots for fast replay.
 
 Snapshots optimize replay by:
-- Storing aggregate state every N events
+- Storing aggregate state every N events (or when replay gets expensive,
+  see replay.SnapshotPolicy)
 - Allowing replay from last snapshot instead of beginning
 - Including checksum for integrity verification
+- Keeping the previous snapshot as a fallback if the latest is corrupt
 
-Storage: Dedicated HDF5 dataset per aggregate
+Storage: two fixed HDF5 slots per aggregate (and reducer), rewritten in place
 
 Usage:
     from infrastructure.events.infrastructure.snapshots import SnapshotStore
@@ -20,11 +22,13 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import json
+import threading
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 import h5py
+import numpy as np
 from backend.utils.common.logging.logger import get_logger
 from pathlib import Path
 
@@ -36,6 +40,13 @@ DEFAULT_SNAPSHOTS_PATH = Path("storage/snapshots.h5")
 # Snapshot every N events
 DEFAULT_SNAPSHOT_INTERVAL = 50
 
+# Chunk size of a snapshot slot (slots only grow in whole chunks)
+SLOT_CHUNK_BYTES = 64 * 1024
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
 
 @dataclass
 class Snapshot:
@@ -46,6 +57,12 @@ class Snapshot:
     state: dict[str, Any]
     checksum: str  # SHA256 of serialized state
     created_at: datetime
+    reducer: str | None = None  # Reducer that built the state (None: legacy/unspecified)
+    last_event_id: str | None = None  # Event at position event_version - 1
+    # Stream metadata up to event_version, so a replay from here reports the whole stream
+    first_event_id: str | None = None
+    first_timestamp: datetime | None = None
+    last_timestamp: datetime | None = None
 
 
 class SnapshotStore:
@@ -54,8 +71,25 @@ class SnapshotStore:
     Layout:
         /snapshots/
             /{aggregate_id}/
-                /latest    - Latest snapshot (JSON string)
-                /history/  - Historical snapshots (optional)
+                /slot0@{reducer}      - Snapshot JSON as bytes (uint8, chunked)
+                /slot1@{reducer}
+                attrs["latest_slot@{reducer}"]  - Slot holding the latest snapshot;
+                                                  the other one is the fallback
+
+    Without a reducer the names have no ``@{reducer}`` suffix. A reducer name
+    may carry a version after a dot (``session_reducer.3f2a…``, see
+    replay.reducer_snapshot_key); saving one version deletes the slots of
+    the others. A save
+    overwrites the fallback slot in place and then flips ``latest_slot``, so
+    the latest snapshot is never touched while the new one is written, and
+    the file does not grow with every save: HDF5 does not reuse the space of
+    deleted datasets, so delete-and-recreate made it grow by one snapshot per
+    save. A slot only grows, in SLOT_CHUNK_BYTES chunks, when a snapshot
+    outgrows it.
+
+    Snapshots saved by older versions (``latest``/``previous`` string
+    datasets) are not read; they are deleted by the next save of their
+    aggregate and reducer, after one full replay.
     """
 
     def __init__(
@@ -71,6 +105,8 @@ class SnapshotStore:
         """
         self._path = Path(path)
         self._interval = snapshot_interval
+        # One HDF5 handle at a time: replays run concurrently (replay_aggregates)
+        self._lock = threading.Lock()
 
         # Ensure parent directory exists
         self._path.parent.mkdir(parents=True, exist_ok=True)
@@ -103,29 +139,104 @@ class SnapshotStore:
         json_str = json.dumps(state, sort_keys=True, ensure_ascii=False)
         return hashlib.sha256(json_str.encode("utf-8")).hexdigest()
 
+    @staticmethod
+    def _slot_names(reducer: str | None) -> tuple[str, str, str]:
+        """(slot0, slot1, latest-slot attribute) names for a reducer."""
+        suffix = "" if reducer is None else f"@{reducer}"
+        return f"slot0{suffix}", f"slot1{suffix}", f"latest_slot{suffix}"
+
+    def _slots_newest_first(self, agg_group: h5py.Group, reducer: str | None) -> list[str]:
+        slot0, slot1, latest_attr = self._slot_names(reducer)
+        slots = [slot1, slot0] if int(agg_group.attrs.get(latest_attr, 0)) == 1 else [slot0, slot1]
+        return [name for name in slots if name in agg_group]
+
+    @staticmethod
+    def _drop_superseded(agg_group: h5py.Group, reducer: str | None) -> None:
+        suffix = "" if reducer is None else f"@{reducer}"
+        for legacy in (f"latest{suffix}", f"previous{suffix}"):
+            if legacy in agg_group:
+                del agg_group[legacy]
+        if reducer is None:
+            return
+        family = reducer.partition(".")[0]
+        for name in list(agg_group):
+            _, _, owner = name.partition("@")
+            if owner != reducer and owner.partition(".")[0] == family:
+                del agg_group[name]
+        for attr in list(agg_group.attrs):
+            _, _, owner = attr.partition("@")
+            if owner != reducer and owner.partition(".")[0] == family:
+                del agg_group.attrs[attr]
+
+    @staticmethod
+    def _write_slot(agg_group: h5py.Group, name: str, data: bytes) -> None:
+        """Overwrite a slot in place, growing it only if ``data`` does not fit."""
+        if name not in agg_group:
+            dataset = agg_group.create_dataset(
+                name,
+                shape=(len(data),),
+                maxshape=(None,),
+                dtype=np.uint8,
+                chunks=(SLOT_CHUNK_BYTES,),
+            )
+        else:
+            dataset = agg_group[name]
+            if dataset.shape[0] < len(data):
+                dataset.resize((len(data),))
+        dataset[: len(data)] = np.frombuffer(data, dtype=np.uint8)
+        dataset.attrs["nbytes"] = len(data)
+
     async def save_snapshot(
         self,
         aggregate_id: str,
         state: dict[str, Any],
         event_version: int,
+        *,
+        reducer: str | None = None,
+        last_event_id: str | None = None,
+        first_event_id: str | None = None,
+        first_timestamp: datetime | None = None,
+        last_timestamp: datetime | None = None,
     ) -> Snapshot:
         """Save aggregate snapshot.
 
+        The snapshot it replaces is kept as the fallback (the other slot).
+
         Args:
             aggregate_id: The aggregate ID
             state: Current aggregate state
             event_version: Event count at snapshot time
+            reducer: Name of the reducer that built ``state``
+            last_event_id: ID of the last event applied (stream identity check)
+            first_event_id: ID of the stream's first event
+            first_timestamp: Timestamp of the stream's first event
+            last_timestamp: Timestamp of the last event applied
 
         Returns:
             The saved Snapshot
         """
-        return await asyncio.to_thread(self._save_snapshot_sync, aggregate_id, state, event_version)
+        return await asyncio.to_thread(
+            self._save_snapshot_sync,
+            aggregate_id,
+            state,
+            event_version,
+            reducer,
+            last_event_id,
+            first_event_id,
+            first_timestamp,
+            last_timestamp,
+        )
 
     def _save_snapshot_sync(
         self,
         aggregate_id: str,
         state: dict[str, Any],
         event_version: int,
+        reducer: str | None = None,
+        last_event_id: str | None = None,
+        first_event_id: str | None = None,
+        first_timestamp: datetime | None = None,
+        last_timestamp: datetime | None = None,
     ) -> Snapshot:
         """Synchronous save implementation."""
         checksum = self._compute_checksum(state)
@@ -137,9 +248,15 @@ class SnapshotStore:
             "state": state,
             "checksum": checksum,
             "created_at": created_at.isoformat(),
+            "reducer": reducer,
+            "last_event_id": last_event_id,
+            "first_event_id": first_event_id,
+            "first_timestamp": first_timestamp.isoformat() if first_timestamp else None,
+            "last_timestamp": last_timestamp.isoformat() if last_timestamp else None,
         }
+        slot0, slot1, latest_attr = self._slot_names(reducer)
 
-        with h5py.File(self._path, "a") as f:
+        with self._lock, h5py.File(self._path, "a") as f:
             snapshots_group = f["snapshots"]
 
             # Get or create aggregate group
@@ -148,22 +265,29 @@ class SnapshotStore:
 
             agg_group = snapshots_group[aggregate_id]
 
-            # Save as "latest"
-            if "latest" in agg_group:
-                del agg_group["latest"]
+            # Legacy string datasets and other versions of this reducer:
+            # superseded by the slots being written
+            self._drop_superseded(agg_group, reducer)
 
-            json_str = json.dumps(snapshot_data, ensure_ascii=False)
-            dt = h5py.special_dtype(vlen=str)
-            agg_group.create_dataset("latest", data=json_str, dtype=dt)
+            # Write into the fallback slot, then make it the latest; the slot
+            # that was latest becomes the fallback
+            latest = agg_group.attrs.get(latest_attr)
+            target = 0 if latest is None or slot0 not in agg_group else 1 - int(latest)
+            data = json.dumps(snapshot_data, ensure_ascii=False).encode("utf-8")
+            self._write_slot(agg_group, slot1 if target else slot0, data)
+            agg_group.attrs[latest_attr] = target
 
             # Update metadata
             agg_group.attrs["event_version"] = event_version
-            agg_group.attrs["updated_at"] = created_at.isoformat()
+            # Fixed-length: rewriting a variable-length string attribute leaks
+            # a global-heap block per save
+            agg_group.attrs["updated_at"] = np.bytes_(created_at.isoformat())
 
         logger.info(
             "SNAPSHOT_SAVED",
             aggregate_id=aggregate_id,
             event_version=event_version,
+            reducer=reducer,
             checksum=checksum[:8],
         )
 
@@ -173,50 +297,124 @@ class SnapshotStore:
             state=state,
             checksum=checksum,
             created_at=created_at,
+            reducer=reducer,
+            last_event_id=last_event_id,
+            first_event_id=first_event_id,
+            first_timestamp=first_timestamp,
+            last_timestamp=last_timestamp,
         )
 
-    async def load_latest(self, aggregate_id: str) -> Snapshot | None:
+    async def load_latest(self, aggregate_id: str, reducer: str | None = None) -> Snapshot | None:
         """Load latest snapshot for aggregate.
 
         Args:
             aggregate_id: The aggregate ID
+            reducer: Reducer name the snapshot was saved under
 
         Returns:
             Latest Snapshot or None if not found
         """
-        return await asyncio.to_thread(self._load_latest_sync, aggregate_id)
+        return await asyncio.to_thread(self._load_latest_sync, aggregate_id, reducer)
 
-    def _load_latest_sync(self, aggregate_id: str) -> Snapshot | None:
+    def _load_latest_sync(self, aggregate_id: str, reducer: str | None = None) -> Snapshot | None:
         """Synchronous load implementation."""
         try:
-            with h5py.File(self._path, "r") as f:
+            with self._lock, h5py.File(self._path, "r") as f:
                 snapshots_group = f["snapshots"]
 
                 if aggregate_id not in snapshots_group:
                     return None
 
                 agg_group = snapshots_group[aggregate_id]
+                slots = self._slots_newest_first(agg_group, reducer)
 
-                if "latest" not in agg_group:
+                if not slots:
                     return None
 
-                json_str = agg_group["latest"][()]
-                if isinstance(json_str, bytes):
-                    json_str = json_str.decode("utf-8")
+                return self._read_snapshot(agg_group[slots[0]])
+
+        except Exception as e:
+            logger.error("SNAPSHOT_LOAD_FAILED", aggregate_id=aggregate_id, error=str(e))
+            return None
 
-                data = json.loads(json_str)
+    async def load_valid(
+        self,
+        aggregate_id: str,
+        reducer: str | None = None,
+        max_version: int | None = None,
+    ) -> Snapshot | None:
+        """Load the newest snapshot that passes its checksum.
 
-                return Snapshot(
-                    aggregate_id=data["aggregate_id"],
-                    event_version=data["event_version"],
-                    state=data["state"],
-                    checksum=data["checksum"],
-                    created_at=datetime.fromisoformat(data["created_at"]),
-                )
+        Tries the latest slot, then the fallback one. Snapshots past ``max_version`` (the
+        current stream length) are skipped: they belong to a stream that was
+        rebuilt or truncated.
+
+        Args:
+            aggregate_id: The aggregate ID
+            reducer: Reducer name the snapshot was saved under
+            max_version: Current event count of the stream
+
+        Returns:
+            Newest valid Snapshot or None
+        """
+        return await asyncio.to_thread(self._load_valid_sync, aggregate_id, reducer, max_version)
+
+    def _load_valid_sync(
+        self,
+        aggregate_id: str,
+        reducer: str | None = None,
+        max_version: int | None = None,
+    ) -> Snapshot | None:
+        """Synchronous load_valid implementation."""
+        try:
+            with self._lock, h5py.File(self._path, "r") as f:
+                snapshots_group = f["snapshots"]
+                if aggregate_id not in snapshots_group:
+                    return None
+                agg_group = snapshots_group[aggregate_id]
+
+                for name in self._slots_newest_first(agg_group, reducer):
+                    try:
+                        snapshot = self._read_snapshot(agg_group[name])
+                    except Exception as e:
+                        logger.warning(
+                            "SNAPSHOT_UNREADABLE",
+                            aggregate_id=aggregate_id,
+                            name=name,
+                            error=str(e),
+                        )
+                        continue
+                    if self._compute_checksum(snapshot.state) != snapshot.checksum:
+                        logger.warning(
+                            "SNAPSHOT_CHECKSUM_MISMATCH", aggregate_id=aggregate_id, name=name
+                        )
+                        continue
+                    if max_version is not None and snapshot.event_version > max_version:
+                        continue
+                    return snapshot
 
         except Exception as e:
             logger.error("SNAPSHOT_LOAD_FAILED", aggregate_id=aggregate_id, error=str(e))
-            return None
+
+        return None
+
+    @staticmethod
+    def _read_snapshot(dataset: h5py.Dataset) -> Snapshot:
+        nbytes = int(dataset.attrs["nbytes"])
+        data = json.loads(dataset[:nbytes].tobytes().decode("utf-8"))
+
+        return Snapshot(
+            aggregate_id=data["aggregate_id"],
+            event_version=data["event_version"],
+            state=data["state"],
+            checksum=data["checksum"],
+            created_at=datetime.fromisoformat(data["created_at"]),
+            reducer=data.get("reducer"),
+            last_event_id=data.get("last_event_id"),
+            first_event_id=data.get("first_event_id"),
+            first_timestamp=_parse_datetime(data.get("first_timestamp")),
+            last_timestamp=_parse_datetime(data.get("last_timestamp")),
+        )
 
     async def verify_snapshot(self, snapshot: Snapshot) -> bool:
         """Verify snapshot integrity via checksum.
@@ -277,7 +475,7 @@ class SnapshotStore:
     def _delete_snapshot_sync(self, aggregate_id: str) -> bool:
         """Synchronous delete implementation."""
         try:
-            with h5py.File(self._path, "a") as f:
+            with self._lock, h5py.File(self._path, "a") as f:
                 snapshots_group = f["snapshots"]
 
                 if aggregate_id not in snapshots_group:
@@ -298,7 +496,7 @@ class SnapshotStore:
             Stats dict
         """
         try:
-            with h5py.File(self._path, "r") as f:
+            with self._lock, h5py.File(self._path, "r") as f:
                 snapshots_group = f["snapshots"]
                 aggregate_count = len(snapshots_group.keys())
                 file_size_mb = self._path.stat().st_size / (1024 * 1024)
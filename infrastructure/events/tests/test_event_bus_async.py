@@ -0,0 +1,174 @@
+"""Tests for EventBus async dispatch (queues, micro-batches, ordering, backpressure)."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from infrastructure.events.application.event_bus import EventBus
+from infrastructure.events.domain.events import DomainEvent, EventType
+
+
+def _event(aggregate_id: str, n: int) -> DomainEvent:
+    return DomainEvent(
+        event_id=f"{aggregate_id}-{n:06d}",
+        event_type=EventType.TRANSCRIPTION_CHUNK_RECEIVED,
+        aggregate_id=aggregate_id,
+        payload={"chunk_number": n},
+    )
+
+
+class SlowSubscriber:
+    """Records what it receives; every call costs ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.events: list[DomainEvent] = []
+        self.batches: list[int] = []
+
+    async def handle(self, event: DomainEvent) -> None:
+        await asyncio.sleep(self.delay)
+        self.events.append(event)
+
+    async def handle_batch(self, events: list[DomainEvent]) -> None:
+        await asyncio.sleep(self.delay)
+        self.batches.append(len(events))
+        self.events.extend(events)
+
+
+async def _publish_timed(bus: EventBus, events: list[DomainEvent], pause: float = 0.0) -> float:
+    """Seconds spent inside publish() (``pause`` between publishes is not counted)."""
+    spent = 0.0
+    for event in events:
+        t0 = time.perf_counter()
+        await bus.publish(event)
+        spent += time.perf_counter() - t0
+        if pause:
+            await asyncio.sleep(pause)  # a request's own I/O, where workers run
+    return spent
+
+
+@pytest.mark.asyncio
+async def test_publish_latency_does_not_depend_on_subscriber_cost():
+    events = [_event("s1", n) for n in range(10)]
+    inline, queued = EventBus(), EventBus(dispatch="async")
+    inline_sub, queued_sub = SlowSubscriber(0.02), SlowSubscriber(0.02)
+    inline.subscribe_all(inline_sub.handle)
+    queued.subscribe_all(queued_sub.handle)
+
+    inline_s = await _publish_timed(inline, events)
+    queued_s = await _publish_timed(queued, events)
+    assert inline_s >= 10 * 0.02
+    assert queued_s < 0.05
+
+    await queued.close()
+    assert [e.event_id for e in queued_sub.events] == [e.event_id for e in events]
+
+
+@pytest.mark.asyncio
+async def test_batch_handler_receives_micro_batches():
+    bus = EventBus(dispatch="async", max_batch=20, max_batch_wait=0.05)
+    sub = SlowSubscriber(0.01)
+    bus.subscribe(EventType.TRANSCRIPTION_CHUNK_RECEIVED, sub.handle_batch, batch=True)
+    for n in range(50):
+        await bus.publish(_event("s1", n))
+    await bus.close()
+    assert len(sub.events) == 50
+    assert max(sub.batches) == 20 and len(sub.batches) <= 5
+    info = bus.get_metrics()["subscribers"][0]
+    assert info["batches"] == len(sub.batches) and info["avg_batch_size"] >= 10
+
+
+@pytest.mark.asyncio
+async def test_partitions_keep_per_stream_order():
+    bus = EventBus(dispatch="async")
+    sub = SlowSubscriber(0.001)
+    bus.subscribe_all(sub.handle, partitions=4)
+    for n in range(20):
+        for stream in ("a", "b", "c", "d", "e"):
+            await bus.publish(_event(stream, n))
+    await bus.close()
+    assert len(sub.events) == 100
+    for stream in ("a", "b", "c", "d", "e"):
+        numbers = [e.payload["chunk_number"] for e in sub.events if e.aggregate_id == stream]
+        assert numbers == list(range(20))
+
+
+@pytest.mark.asyncio
+async def test_full_queue_blocks_publisher():
+    bus = EventBus(dispatch="async", queue_size=2)
+    sub = SlowSubscriber(0.02)
+    bus.subscribe_all(sub.handle)
+    elapsed = await _publish_timed(bus, [_event("s1", n) for n in range(8)])
+    assert elapsed >= 0.02 * 4  # bounded queue: the producer waited for the subscriber
+    info = bus.get_metrics()["subscribers"][0]
+    assert info["blocked"] > 0 and info["queue_capacity"] == 2
+    await bus.close()
+    assert len(sub.events) == 8
+
+
+@pytest.mark.asyncio
+async def test_drop_policy_never_blocks():
+    bus = EventBus(dispatch="async", queue_size=2, overflow="drop")
+    slow, fast = SlowSubscriber(0.05), SlowSubscriber()
+    bus.subscribe_all(slow.handle)
+    bus.subscribe_all(fast.handle_batch, batch=True)
+    elapsed = await _publish_timed(bus, [_event("s1", n) for n in range(10)], pause=0.002)
+    assert elapsed < 0.05
+    await bus.close()
+    stats = {s["name"]: s for s in bus.get_metrics()["subscribers"]}
+    slow_stats = stats["SlowSubscriber.handle"]
+    assert slow_stats["dropped"] > 0
+    assert slow_stats["delivered"] + slow_stats["dropped"] == 10
+    assert len(fast.events) == 10
+
+
+@pytest.mark.asyncio
+async def test_lag_is_measured():
+    bus = EventBus(dispatch="async")
+    sub = SlowSubscriber(0.01)
+    bus.subscribe_all(sub.handle)
+    for n in range(5):
+        await bus.publish(_event("s1", n))
+    await bus.close()
+    info = bus.get_metrics()["subscribers"][0]
+    assert info["max_lag_ms"] >= 30  # the last event waited behind four slow calls
+    assert info["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failing_handler_does_not_stop_delivery():
+    bus = EventBus(dispatch="async")
+    seen: list[int] = []
+
+    async def flaky(event: DomainEvent) -> None:
+        if event.payload["chunk_number"] == 1:
+            raise RuntimeError("boom")
+        seen.append(event.payload["chunk_number"])
+
+    bus.subscribe_all(flaky)
+    for n in range(3):
+        await bus.publish(_event("s1", n))
+    await bus.close()
+    assert seen == [0, 2]
+    info = bus.get_metrics()["subscribers"][0]
+    assert (info["delivered"], info["failed"]) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_inline_mode_calls_batch_handlers_with_single_events():
+    bus = EventBus()
+    sub = SlowSubscriber()
+    bus.subscribe_all(sub.handle_batch, batch=True)
+    await bus.publish(_event("s1", 0))
+    assert sub.batches == [1]
+    assert bus.get_metrics()["subscribers"] == []
+
+
+def test_invalid_options():
+    with pytest.raises(ValueError):
+        EventBus(dispatch="threads")
+    with pytest.raises(ValueError):
+        EventBus(overflow="spill")
@@ -0,0 +1,306 @@
+"""Tests for snapshot-accelerated replay (replay_aggregate, replay_aggregates, SnapshotStore)."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import h5py
+import numpy as np
+import pytest
+
+from infrastructure.events.application.event_store import EventStore
+from infrastructure.events.application.replay import (
+    SnapshotPolicy,
+    reducer_snapshot_key,
+    replay_aggregate,
+    replay_aggregates,
+    session_reducer,
+)
+from infrastructure.events.domain.events import DomainEvent, EventType
+from infrastructure.events.infrastructure.hdf5_store import HDF5EventStore
+from infrastructure.events.infrastructure.snapshots import SnapshotStore
+
+ALWAYS = SnapshotPolicy(max_tail_events=1, min_tail_events=1)
+SESSION_KEY = reducer_snapshot_key(session_reducer)
+
+
+class MemoryEventStore(EventStore):
+    """In-memory EventStore that records the versions streams are loaded from."""
+
+    def __init__(self) -> None:
+        self.streams: dict[str, list[DomainEvent]] = {}
+        self.loads: list[tuple[str, int]] = []
+
+    async def append(self, event: DomainEvent) -> None:
+        self.streams.setdefault(event.aggregate_id, []).append(event)
+
+    async def load_stream(self, aggregate_id: str, from_version: int = 0) -> list[DomainEvent]:
+        self.loads.append((aggregate_id, from_version))
+        return list(self.streams.get(aggregate_id, [])[from_version:])
+
+    async def load_by_type(self, event_type, limit=100):  # noqa: ANN001
+        return []
+
+    async def count_events(self, aggregate_id: str | None = None) -> int:
+        return len(self.streams.get(aggregate_id, []))
+
+
+def _chunk(aggregate_id: str, n: int, tag: str = "a") -> DomainEvent:
+    return DomainEvent(
+        event_id=f"{aggregate_id}-{tag}-{n:06d}",
+        event_type=EventType.TRANSCRIPTION_CHUNK_RECEIVED,
+        aggregate_id=aggregate_id,
+        payload={"chunk_number": n, "duration_ms": 1000},
+    )
+
+
+async def _fill(
+    store: EventStore, aggregate_id: str, count: int, start: int = 0, tag: str = "a"
+) -> None:
+    for n in range(start, start + count):
+        await store.append(_chunk(aggregate_id, n, tag))
+
+
+async def _snapshot(store: EventStore, snapshots: SnapshotStore) -> None:
+    await replay_aggregate(
+        "s1", store, session_reducer, snapshot_store=snapshots, snapshot_policy=ALWAYS
+    )
+
+
+@pytest.fixture
+def snapshots(tmp_path):
+    return SnapshotStore(tmp_path / "snapshots.h5")
+
+
+@pytest.mark.asyncio
+async def test_replay_starts_from_snapshot_and_applies_tail(snapshots):
+    store = MemoryEventStore()
+    await _fill(store, "s1", 30)
+    first = await replay_aggregate(
+        "s1", store, session_reducer, snapshot_store=snapshots, snapshot_policy=ALWAYS
+    )
+    assert first.snapshot_version is None and first.snapshot_taken and first.version == 30
+
+    await _fill(store, "s1", 5, start=30)
+    store.loads.clear()
+    second = await replay_aggregate("s1", store, session_reducer, snapshot_store=snapshots)
+    assert store.loads == [("s1", 29)]  # snapshot's last event + tail
+    assert second.snapshot_version == 30
+    assert second.tail_event_count == 5 and second.version == 35
+    # Whole-stream metadata, as a full replay reports it
+    full = await replay_aggregate("s1", store, session_reducer)
+    for name in ("event_count", "first_event_id", "first_timestamp", "last_event_id"):
+        assert getattr(second, name) == getattr(full, name), name
+    assert second.event_count == 35 and second.first_event_id == "s1-a-000000"
+    assert second.final_state["transcription"]["total_chunks"] == 35
+    assert second.final_state == full.final_state
+
+
+@pytest.mark.asyncio
+async def test_snapshot_with_no_tail_returns_snapshot_state(snapshots):
+    store = MemoryEventStore()
+    await _fill(store, "s1", 10)
+    await _snapshot(store, snapshots)
+    result = await replay_aggregate("s1", store, session_reducer, snapshot_store=snapshots)
+    assert result.tail_event_count == 0 and result.event_count == result.version == 10
+    assert result.first_event_id == "s1-a-000000" and result.last_event_id == "s1-a-000009"
+    assert result.final_state["transcription"]["total_chunks"] == 10
+
+
+@pytest.mark.asyncio
+async def test_policy_skips_cheap_replays(snapshots):
+    store = MemoryEventStore()
+    await _fill(store, "s1", 10)
+    policy = SnapshotPolicy(max_tail_events=50, max_tail_ms=10_000, min_tail_events=5)
+    result = await replay_aggregate(
+        "s1", store, session_reducer, snapshot_store=snapshots, snapshot_policy=policy
+    )
+    assert not result.snapshot_taken
+    assert await snapshots.load_latest("s1", SESSION_KEY) is None
+
+    await _fill(store, "s1", 45, start=10)
+    result = await replay_aggregate(
+        "s1", store, session_reducer, snapshot_store=snapshots, snapshot_policy=policy
+    )
+    assert result.snapshot_taken
+
+
+@pytest.mark.asyncio
+async def test_snapshots_are_per_reducer(snapshots):
+    store = MemoryEventStore()
+    await _fill(store, "s1", 10)
+    await _snapshot(store, snapshots)
+    result = await replay_aggregate("s1", store, snapshot_store=snapshots)  # default_reducer
+    assert result.snapshot_version is None
+    assert result.final_state["event_counts"] == {"TRANSCRIPTION_CHUNK_RECEIVED": 10}
+
+
+def _counting_v1(state, event):  # noqa: ANN001, ANN202
+    state["n"] = state.get("n", 0) + 1
+    return state
+
+
+def _counting_v2(state, event):  # noqa: ANN001, ANN202
+    state["n"] = state.get("n", 0) + 2
+    return state
+
+
+_counting_v1.__name__ = _counting_v2.__name__ = "counting_reducer"  # same name, new code
+
+
+@pytest.mark.asyncio
+async def test_changed_reducer_does_not_reuse_old_snapshots(snapshots, tmp_path):
+    store = MemoryEventStore()
+    await _fill(store, "s1", 10)
+    await replay_aggregate(
+        "s1", store, _counting_v1, snapshot_store=snapshots, snapshot_policy=ALWAYS
+    )
+    result = await replay_aggregate(
+        "s1", store, _counting_v2, snapshot_store=snapshots, snapshot_policy=ALWAYS
+    )
+    assert result.snapshot_version is None and result.final_state == {"n": 20}
+    with h5py.File(tmp_path / "snapshots.h5", "r") as f:  # the old version's slots are gone
+        assert list(f["snapshots"]["s1"]) == [f"slot0@{reducer_snapshot_key(_counting_v2)}"]
+
+    _counting_v2.snapshot_version = 2  # a change the code hash cannot see
+    try:
+        result = await replay_aggregate("s1", store, _counting_v2, snapshot_store=snapshots)
+        assert result.snapshot_version is None
+    finally:
+        del _counting_v2.snapshot_version
+
+
+def test_reducer_key_is_stable_across_processes():
+    code = (
+        "from infrastructure.events.application.replay import reducer_snapshot_key, "
+        "session_reducer; print(reducer_snapshot_key(session_reducer))"
+    )
+    keys = {
+        subprocess.run(
+            [sys.executable, "-c", code],
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()[-1]
+        for seed in ("1", "2")
+    }
+    assert keys == {SESSION_KEY}
+
+
+@pytest.mark.asyncio
+async def test_corrupt_latest_falls_back_to_previous(snapshots, tmp_path):
+    store = MemoryEventStore()
+    await _fill(store, "s1", 10)
+    await _snapshot(store, snapshots)
+    await _fill(store, "s1", 10, start=10)
+    await _snapshot(store, snapshots)
+
+    with h5py.File(tmp_path / "snapshots.h5", "a") as f:
+        group = f["snapshots"]["s1"]
+        latest = group[f"slot{group.attrs[f'latest_slot@{SESSION_KEY}']}@{SESSION_KEY}"]
+        data = latest[: latest.attrs["nbytes"]].tobytes()
+        latest[: len(data)] = np.frombuffer(
+            data.replace(b'"total_chunks": 20', b'"total_chunks": 99'), dtype=np.uint8
+        )
+
+    result = await replay_aggregate("s1", store, session_reducer, snapshot_store=snapshots)
+    assert result.snapshot_version == 10 and result.tail_event_count == 10
+    assert result.final_state["transcription"]["total_chunks"] == 20
+
+
+@pytest.mark.asyncio
+async def test_repeated_saves_rewrite_slots_in_place(snapshots, tmp_path):
+    path = tmp_path / "snapshots.h5"
+    big = {"chunks": ["x" * 1000 for _ in range(400)]}  # ~400 KiB of JSON
+    for n in range(30):
+        state = big if n % 3 else {"chunks": []}  # grow and shrink
+        await snapshots.save_snapshot("s1", state, n + 1, reducer="r")
+    assert path.stat().st_size < 2 * 1024 * 1024  # two slots, not 30 snapshots
+
+    latest = await snapshots.load_valid("s1", reducer="r")
+    assert latest.event_version == 30 and latest.state == big
+    with h5py.File(path, "a") as f:
+        group = f["snapshots"]["s1"]
+        group[f"slot{group.attrs['latest_slot@r']}@r"][0] = ord("!")  # unreadable latest
+    fallback = await snapshots.load_valid("s1", reducer="r")
+    assert fallback.event_version == 29
+
+
+@pytest.mark.asyncio
+async def test_legacy_string_snapshots_are_replaced(snapshots, tmp_path):
+    with h5py.File(tmp_path / "snapshots.h5", "a") as f:
+        group = f["snapshots"].create_group("s1")
+        group.create_dataset("latest@r", data="{}", dtype=h5py.special_dtype(vlen=str))
+    assert await snapshots.load_valid("s1", reducer="r") is None
+    await snapshots.save_snapshot("s1", {"n": 1}, 1, reducer="r")
+    with h5py.File(tmp_path / "snapshots.h5", "r") as f:
+        assert sorted(f["snapshots"]["s1"]) == ["slot0@r"]
+    assert (await snapshots.load_valid("s1", reducer="r")).state == {"n": 1}
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_triggers_full_replay(snapshots):
+    store = MemoryEventStore()
+    await _fill(store, "s1", 10)
+    await _snapshot(store, snapshots)
+    store.streams["s1"] = []  # stream rebuilt with different events
+    await _fill(store, "s1", 12, tag="b")
+
+    result = await replay_aggregate("s1", store, session_reducer, snapshot_store=snapshots)
+    assert result.snapshot_version is None
+    assert result.event_count == 12
+    assert result.final_state["transcription"]["total_chunks"] == 12
+
+
+@pytest.mark.asyncio
+async def test_explicit_from_version_bypasses_snapshots(snapshots):
+    store = MemoryEventStore()
+    await _fill(store, "s1", 10)
+    await _snapshot(store, snapshots)
+    result = await replay_aggregate(
+        "s1", store, session_reducer, from_version=4, snapshot_store=snapshots
+    )
+    assert result.snapshot_version is None and result.event_count == 6
+    assert not result.snapshot_taken
+
+
+@pytest.mark.asyncio
+async def test_explicit_snapshot_state_is_not_mutated():
+    store = MemoryEventStore()
+    await _fill(store, "s1", 3)
+    seed = {"transcription": {"chunks": []}}
+    await replay_aggregate("s1", store, session_reducer, from_snapshot=seed)
+    assert seed == {"transcription": {"chunks": []}}
+
+
+@pytest.mark.asyncio
+async def test_replay_aggregates_bounded_concurrency(snapshots):
+    store = MemoryEventStore()
+    for i in range(6):
+        await _fill(store, f"s{i}", 5 + i)
+    results = await replay_aggregates(
+        ["s0", "s1", "s2", "s3", "s4", "s5", "s0"],
+        store,
+        session_reducer,
+        snapshot_store=snapshots,
+        snapshot_policy=ALWAYS,
+        concurrency=2,
+    )
+    assert list(results) == ["s0", "s1", "s2", "s3", "s4", "s5"]
+    assert all(r.snapshot_taken for r in results.values())
+    assert results["s5"].final_state["transcription"]["total_chunks"] == 10
+
+    again = await replay_aggregates(list(results), store, session_reducer, snapshot_store=snapshots)
+    assert all(r.snapshot_version is not None and r.tail_event_count == 0 for r in again.values())
+
+
+@pytest.mark.asyncio
+async def test_hdf5_store_loads_only_the_tail(tmp_path):
+    store = HDF5EventStore(tmp_path / "events.h5")
+    await _fill(store, "s1", 8)
+    tail = await store.load_stream("s1", 5)
+    assert [e.payload["chunk_number"] for e in tail] == [5, 6, 7]
+    assert await store.load_stream("s1", 8) == []
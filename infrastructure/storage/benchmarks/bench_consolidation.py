@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Consolidation throughput — one-at-a-time src.copy vs the batched engine.
+
+Generates a synthetic backlog of session files (default 10k; each with a
+few transcription chunks + a small audio dataset), then consolidates it:
+
+  - legacy: reopen corpus.h5 per session, src.copy, unlink
+    (what consolidate_session_to_corpus did in a loop)
+  - engine: parallel validation workers + one batching writer + journal,
+    into corpus.h5 and into a fresh segment file
+
+Reports sessions/minute for each.
+
+    python3 infrastructure/storage/benchmarks/bench_consolidation.py
+    python3 infrastructure/storage/benchmarks/bench_consolidation.py --sessions 2000 --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))  # noqa: E402
+
+import h5py  # noqa: E402
+import numpy as np  # noqa: E402
+
+from infrastructure.storage.infrastructure.hdf5.consolidation import (  # noqa: E402
+    consolidate_sessions,
+)
+
+
+def _make_backlog(sessions_dir: Path, count: int) -> None:
+    sessions_dir.mkdir(parents=True)
+    audio = np.zeros(16_000, dtype=np.int16)  # 1 s @ 16 kHz
+    for i in range(count):
+        session_id = f"session-{i:06d}"
+        with h5py.File(sessions_dir / f"{session_id}.h5", "w") as f:
+            group = f.create_group(f"/sessions/{session_id}")
+            group.attrs["session_id"] = session_id
+            for c in range(4):
+                chunk = group.create_group(f"tasks/TRANSCRIPTION/chunks/chunk_{c}")
+                chunk.create_dataset("transcript", data=f"chunk {c} of {session_id}")
+                chunk.create_dataset("audio", data=audio)
+
+
+def _legacy(sessions_dir: Path, corpus: Path) -> int:
+    done = 0
+    for path in sorted(sessions_dir.glob("*.h5")):
+        session_id = path.stem
+        with h5py.File(path, "r") as src, h5py.File(corpus, "a") as dst:
+            src.copy(f"/sessions/{session_id}", dst.require_group("sessions"), name=session_id)
+        path.unlink()
+        done += 1
+    return done
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--deep-validate", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        backlog = root / "backlog"
+        t0 = time.perf_counter()
+        _make_backlog(backlog, args.sessions)
+        print(f"backlog: {args.sessions:,} sessions generated in {time.perf_counter() - t0:.1f} s")
+
+        for name in ("legacy", "engine-corpus", "engine-segment"):
+            run = root / name
+            shutil.copytree(backlog, run / "sessions")
+            t0 = time.perf_counter()
+            if name == "legacy":
+                done = _legacy(run / "sessions", run / "corpus.h5")
+                elapsed = time.perf_counter() - t0
+            else:
+                stats = consolidate_sessions(
+                    workers=args.workers,
+                    batch_size=args.batch_size,
+                    deep_validate=args.deep_validate,
+                    segment=name == "engine-segment",
+                    sessions_dir=run / "sessions",
+                    corpus_path=run / "corpus.h5",
+                    segments_dir=run / "corpus_segments",
+                )
+                done, elapsed = stats.success, stats.elapsed_s
+            print(
+                f"{name:<15} {done:>7,} sessions in {elapsed:8.2f} s  "
+                f"→ {done * 60 / elapsed:>10,.0f} sessions/min"
+            )
+            shutil.rmtree(run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""SessionsStore read-path benchmark — full manifest replay vs materialized view.
+
+Builds a synthetic manifest.jsonl (default 1M lines: ~20% creates, ~80%
+updates of earlier sessions — status / last_active / interaction_count
+bumps — spread over a few hundred owners) and measures:
+
+  - legacy full replay (parse every line, dedupe, sort, slice) per page
+  - cold start without a snapshot (replay once, then indexes)
+  - cold start from a compacted snapshot + short manifest tail
+  - warm page / count / get latency (tail check + index slice)
+
+    python3 infrastructure/storage/benchmarks/bench_sessions_store.py
+    python3 infrastructure/storage/benchmarks/bench_sessions_store.py --lines 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))  # noqa: E402
+
+from infrastructure.storage.infrastructure.hdf5.sessions_store import (  # noqa: E402
+    Session,
+    SessionsStore,
+)
+
+
+def _write_manifest(path: Path, lines: int, owners: int, update_ratio: float) -> list[str]:
+    rng = random.Random(42)
+    ids: list[str] = []
+    with open(path, "w") as f:
+        for i in range(lines):
+            if ids and rng.random() < update_ratio:
+                session_id = rng.choice(ids)
+                status = "active"
+            else:
+                session_id = f"{i:026X}"
+                ids.append(session_id)
+                status = "new"
+            ts = f"2025-{1 + (i * 12) // lines:02d}-01T00:00:{i % 60:02d}.{i:06d}+00:00Z"
+            f.write(
+                json.dumps(
+                    {
+                        "id": session_id,
+                        "created_at": ts if status == "new" else "",
+                        "updated_at": ts,
+                        "last_active": ts,
+                        "interaction_count": i % 17,
+                        "status": status,
+                        "is_persisted": True,
+                        "owner_hash": f"sha256:{hash(session_id) % owners}",
+                        "thread_id": None,
+                    }
+                )
+                + "\n"
+            )
+    return ids
+
+
+def _fix_update_created_at(path: Path) -> None:
+    """Updates preserve created_at/owner_hash; rewrite them like update() does."""
+    first: dict[str, dict] = {}
+    out = []
+    for line in path.read_text().splitlines():
+        data = json.loads(line)
+        base = first.setdefault(data["id"], data)
+        data["created_at"] = base["created_at"]
+        data["owner_hash"] = base["owner_hash"]
+        out.append(json.dumps(data))
+    path.write_text("\n".join(out) + "\n")
+
+
+def _legacy_list(manifest: Path, limit: int, owner_hash: str | None) -> list[Session]:
+    by_id: dict[str, Session] = {}
+    with open(manifest) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            session = Session.from_dict(json.loads(line))
+            if owner_hash and session.owner_hash != owner_hash:
+                continue
+            by_id[session.id] = session
+    sessions = list(by_id.values())
+    sessions.sort(key=lambda s: s.created_at, reverse=True)
+    return sessions[:limit]
+
+
+def _timed(fn, repeat: int = 1) -> tuple[float, object]:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - t0) * 1000.0 / repeat, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--owners", type=int, default=300)
+    parser.add_argument("--update-ratio", type=float, default=0.8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        manifest = data_dir / "manifest.jsonl"
+        ids = _write_manifest(manifest, args.lines, args.owners, args.update_ratio)
+        _fix_update_created_at(manifest)
+        owner = json.loads(manifest.open().readline())["owner_hash"]
+        print(f"manifest: {args.lines:,} lines, {len(ids):,} sessions, {args.owners} owners")
+
+        legacy_ms, legacy = _timed(lambda: _legacy_list(manifest, 50, owner))
+        print(f"legacy full replay, 1 page ............ {legacy_ms:10.1f} ms")
+
+        cold_ms, cold_page = _timed(lambda: SessionsStore(tmp).list(limit=50, owner_hash=owner))
+        assert [s.id for s in cold_page] == [s.id for s in legacy]
+        print(f"cold start, no snapshot ............... {cold_ms:10.1f} ms")
+
+        store = SessionsStore(tmp)
+        store.compact()
+        with open(manifest, "a") as f:
+            for i in range(1000):
+                json.dump(Session(f"TAIL{i:022d}", "2026", "2026", "2026", 0, "new", True, owner).to_dict(), f)
+                f.write("\n")
+
+        snap_ms, view_page = _timed(lambda: SessionsStore(tmp).list(limit=50, owner_hash=owner))
+        print(f"cold start, snapshot + 1k tail ........ {snap_ms:10.1f} ms")
+
+        warm = SessionsStore(tmp)
+        warm.count()
+        page_ms, page = _timed(lambda: warm.list(limit=50, offset=500, owner_hash=owner), 200)
+        count_ms, _ = _timed(lambda: warm.count(owner), 200)
+        get_ms, _ = _timed(lambda: warm.get(ids[len(ids) // 2]), 200)
+        print(f"warm page (offset 500, owner) ......... {page_ms:10.3f} ms")
+        print(f"warm count (owner) .................... {count_ms:10.3f} ms")
+        print(f"warm get .............................. {get_ms:10.3f} ms")
+
+        # The 1k tail sessions are newer than everything in the legacy page
+        assert [s.id for s in view_page] != [] and len(page) == 50
+        assert [s.id for s in SessionsStore(tmp).list(limit=50, offset=1000, owner_hash=owner)] == [
+            s.id for s in legacy
+        ]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+"""Session → Corpus Consolidation Engine.
+
+Moves session-level HDF5 files (storage/sessions/{id}.h5) into long-term
+storage in bulk:
+
+  workers (N processes)          writer (this process)
+  ─────────────────────          ─────────────────────────────────────
+  open session file              collect validated sessions into batches
+  check /sessions/{id}       →   1 target open per batch, src.copy each
+  (deep: read every dataset)     journal begin → copy → flush → commit
+  report ok / error              delete consolidated session files
+
+Targets:
+  - corpus.h5 (default, same layout as consolidate_session_to_corpus)
+  - a new segment file per run (storage/corpus_segments/segment-*.h5),
+    so the monolithic corpus stops growing
+
+Journal (consolidation.journal.jsonl next to the corpus, append-only):
+  {"op": "begin",  "batch": id, "target": path, "sessions": [...]}
+  {"op": "commit", "batch": id}
+  {"op": "abort",  "batch": id}
+
+Exactly-once resume:
+  - committed sessions are never copied again (leftover source files
+    from a crash after commit are just deleted)
+  - a batch with "begin" but no "commit" crashed mid-copy: its session
+    groups are removed from the target and the sessions are redone
+  - a run that ends with no batch pending truncates the journal; session
+    ids already in corpus.h5 or in any segment are skipped, so reruns
+    (and sources kept with delete_after=False) are never copied twice
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+import uuid
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from functools import partial
+from typing import Any
+
+import h5py
+from backend.utils.common.logging.logger import get_logger
+from infrastructure.storage.infrastructure.hdf5.session_h5_manager import (
+    CORPUS_PATH,
+    SEGMENTS_DIR,
+    SESSIONS_DIR,
+)
+from pathlib import Path
+
+logger = get_logger(__name__)
+
+# Sessions copied per target open (one journal begin/commit pair each)
+DEFAULT_BATCH_SIZE = 200
+
+# Session files handed to a worker process per task
+_WORKER_CHUNKSIZE = 16
+
+
+@dataclass
+class ConsolidationStats:
+    """Outcome of one consolidation run."""
+
+    success: int = 0
+    failed: int = 0
+    skipped: int = 0
+    resumed: int = 0
+    batches: int = 0
+    elapsed_s: float = 0.0
+    sessions_per_minute: float = 0.0
+    target: str = ""
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _Validated:
+    """Worker report for one session file."""
+
+    session_id: str
+    path: str
+    ok: bool
+    datasets: int = 0
+    nbytes: int = 0
+    error: str | None = None
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# WORKER SIDE (runs in child processes)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def _validate_session_file(path_str: str, deep: bool = False) -> _Validated:
+    """Check that a session file opens and holds /sessions/{id}.
+
+    With deep=True every dataset under the session group is also read,
+    which catches truncated/corrupt data before it reaches the corpus (and
+    leaves the file hot in the OS page cache for the writer's copy), at
+    roughly 5x the cost of the structural check.
+    """
+    path = Path(path_str)
+    session_id = path.stem
+    counters = {"datasets": 0, "nbytes": 0}
+
+    def _read(_name: str, obj: Any) -> None:
+        if isinstance(obj, h5py.Dataset):
+            obj[()]
+            counters["datasets"] += 1
+            counters["nbytes"] += obj.size * obj.dtype.itemsize
+
+    try:
+        with h5py.File(path, "r") as f:
+            group_path = f"/sessions/{session_id}"
+            if group_path not in f:
+                return _Validated(session_id, path_str, ok=False, error="missing session group")
+            if deep:
+                f[group_path].visititems(_read)
+    except Exception as e:
+        return _Validated(session_id, path_str, ok=False, error=str(e))
+
+    return _Validated(session_id, path_str, ok=True, **counters)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# JOURNAL
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class _Journal:
+    """Append-only, fsync'd record of which sessions reached which target."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.committed: dict[str, str] = {}  # session_id -> target
+        self.pending: dict[str, tuple[str, list[str]]] = {}  # batch -> (target, ids)
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        begun: dict[str, tuple[str, list[str]]] = {}
+        with open(self.path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn last line from a crash mid-append
+                    continue
+                if entry["op"] == "begin":
+                    begun[entry["batch"]] = (entry["target"], entry["sessions"])
+                elif entry["op"] == "commit" and entry["batch"] in begun:
+                    target, session_ids = begun.pop(entry["batch"])
+                    for session_id in session_ids:
+                        self.committed[session_id] = target
+                elif entry["op"] == "abort":
+                    begun.pop(entry["batch"], None)
+        self.pending = begun
+
+    def append(self, entry: dict[str, Any]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def begin(self, target: Path, session_ids: list[str]) -> str:
+        batch = uuid.uuid4().hex
+        self.append({"op": "begin", "batch": batch, "target": str(target), "sessions": session_ids})
+        self.pending[batch] = (str(target), session_ids)
+        return batch
+
+    def commit(self, batch: str) -> None:
+        self.append({"op": "commit", "batch": batch})
+        target, session_ids = self.pending.pop(batch)
+        for session_id in session_ids:
+            self.committed[session_id] = target
+
+    def abort(self, batch: str) -> None:
+        self.append({"op": "abort", "batch": batch})
+        self.pending.pop(batch, None)
+
+    def truncate(self) -> None:
+        """Drop every entry; only safe with nothing pending."""
+        if self.pending:
+            raise RuntimeError("journal has pending batches")
+        self.path.unlink(missing_ok=True)
+        self.committed.clear()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# WRITER SIDE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def consolidate_sessions(
+    max_sessions: int | None = None,
+    workers: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    segment: bool = False,
+    delete_after: bool = True,
+    deep_validate: bool = False,
+    sessions_dir: Path | None = None,
+    corpus_path: Path | None = None,
+    segments_dir: Path | None = None,
+    journal_path: Path | None = None,
+) -> ConsolidationStats:
+    """Consolidate session files in parallel with a single batching writer.
+
+    Args:
+        max_sessions: Maximum number of session files to process (None = all)
+        workers: Validation processes (None = os.cpu_count(), 0 = inline)
+        batch_size: Sessions copied per target open
+        segment: Write a new segment file instead of appending to corpus.h5
+        delete_after: Delete session files once their batch is committed
+        deep_validate: Read every dataset in the workers, not just the tree root
+        sessions_dir: Override SESSIONS_DIR (tests/benchmarks)
+        corpus_path: Override CORPUS_PATH (tests/benchmarks)
+        segments_dir: Override SEGMENTS_DIR (tests/benchmarks)
+        journal_path: Override the journal location (default: next to corpus)
+
+    Returns:
+        ConsolidationStats with counts and sessions/minute throughput
+    """
+    sessions_dir = sessions_dir or SESSIONS_DIR
+    corpus_path = corpus_path or CORPUS_PATH
+    segments_dir = segments_dir or SEGMENTS_DIR
+    journal = _Journal(journal_path or corpus_path.with_name("consolidation.journal.jsonl"))
+
+    started = time.perf_counter()
+    stats = ConsolidationStats()
+
+    _rollback_pending(journal)
+
+    if not sessions_dir.exists():
+        logger.warning("SESSIONS_DIR_NOT_FOUND", path=str(sessions_dir))
+        return stats
+
+    existing = _existing_session_ids([corpus_path, *sorted(segments_dir.glob("segment-*.h5"))])
+    todo: list[Path] = []
+    for path in sorted(sessions_dir.glob("*.h5")):
+        if path.stem in journal.committed:
+            # Crash after commit, before delete: finish the move, never recopy
+            if delete_after:
+                path.unlink(missing_ok=True)
+            stats.resumed += 1
+        elif path.stem in existing:
+            logger.warning(
+                "CONSOLIDATION_ALREADY_PRESENT",
+                session_id=path.stem,
+                target=existing[path.stem],
+            )
+            stats.skipped += 1
+        else:
+            todo.append(path)
+    if max_sessions:
+        todo = todo[:max_sessions]
+
+    if segment:
+        stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+        target = segments_dir / f"segment-{stamp}-{uuid.uuid4().hex[:8]}.h5"
+    else:
+        target = corpus_path
+    stats.target = str(target)
+
+    logger.info(
+        "CONSOLIDATION_ENGINE_START",
+        total_sessions=len(todo),
+        resumed=stats.resumed,
+        workers=workers,
+        batch_size=batch_size,
+        target=str(target),
+    )
+
+    batch: list[_Validated] = []
+    for result in _validated(todo, workers, deep_validate):
+        if not result.ok:
+            logger.error(
+                "CONSOLIDATION_VALIDATION_FAILED",
+                session_id=result.session_id,
+                error=result.error,
+            )
+            stats.failed += 1
+            continue
+        batch.append(result)
+        if len(batch) >= batch_size:
+            _write_batch(batch, target, journal, stats, delete_after)
+            batch = []
+    if batch:
+        _write_batch(batch, target, journal, stats, delete_after)
+
+    if not journal.pending:
+        # Every batch committed or rolled back: the targets are the record now
+        journal.truncate()
+
+    stats.elapsed_s = round(time.perf_counter() - started, 3)
+    if stats.elapsed_s > 0:
+        stats.sessions_per_minute = round(stats.success * 60.0 / stats.elapsed_s, 1)
+
+    logger.info("CONSOLIDATION_ENGINE_COMPLETE", **stats.to_dict())
+    return stats
+
+
+def _existing_session_ids(targets: list[Path]) -> dict[str, str]:
+    """Map session ids already consolidated into ``targets`` to their file."""
+    existing: dict[str, str] = {}
+    for target in targets:
+        if not target.exists():
+            continue
+        with h5py.File(target, "r") as f:
+            for session_id in f.get("sessions", {}):
+                existing.setdefault(session_id, str(target))
+    return existing
+
+
+def _validated(paths: list[Path], workers: int | None, deep: bool) -> Iterator[_Validated]:
+    """Yield validation results in input order, in parallel when workers != 0."""
+    validate = partial(_validate_session_file, deep=deep)
+    if workers == 0 or len(paths) <= 1:
+        yield from (validate(str(p)) for p in paths)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(validate, [str(p) for p in paths], chunksize=_WORKER_CHUNKSIZE)
+
+
+def _write_batch(
+    batch: list[_Validated],
+    target: Path,
+    journal: _Journal,
+    stats: ConsolidationStats,
+    delete_after: bool,
+) -> None:
+    """Copy one batch under a single target open, bracketed by the journal.
+
+    Only sessions absent from the target are journaled, so a rollback can
+    never remove data that was there before this batch.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    batch_id: str | None = None
+    to_copy: list[_Validated] = []
+
+    try:
+        with h5py.File(target, "a") as dst:
+            sessions_group = dst.require_group("sessions")
+            for item in batch:
+                if item.session_id in sessions_group:
+                    logger.error(
+                        "CONSOLIDATION_CONFLICT",
+                        session_id=item.session_id,
+                        target=str(target),
+                    )
+                    stats.skipped += 1
+                else:
+                    to_copy.append(item)
+            if not to_copy:
+                return
+
+            batch_id = journal.begin(target, [v.session_id for v in to_copy])
+            for item in to_copy:
+                with h5py.File(item.path, "r") as src:
+                    src.copy(f"/sessions/{item.session_id}", sessions_group, name=item.session_id)
+            dst.flush()
+    except Exception as e:
+        logger.error(
+            "CONSOLIDATION_BATCH_FAILED",
+            batch=batch_id,
+            sessions=len(to_copy),
+            error=str(e),
+            exc_info=True,
+        )
+        stats.failed += len(to_copy)
+        if batch_id is not None:
+            try:
+                _rollback_batch(journal, batch_id)
+            except Exception:
+                # Still pending in the journal: the next run rolls it back
+                logger.error("CONSOLIDATION_ROLLBACK_DEFERRED", batch=batch_id, exc_info=True)
+        return
+
+    journal.commit(batch_id)
+    stats.batches += 1
+    stats.success += len(to_copy)
+
+    if delete_after:
+        for item in to_copy:
+            Path(item.path).unlink(missing_ok=True)
+
+    logger.info(
+        "CONSOLIDATION_BATCH_COMMITTED",
+        batch=batch_id,
+        copied=len(to_copy),
+        target=str(target),
+    )
+
+
+def _rollback_pending(journal: _Journal) -> None:
+    """Undo every batch that began but never committed (crash recovery)."""
+    for batch_id in list(journal.pending):
+        _rollback_batch(journal, batch_id)
+
+
+def _rollback_batch(journal: _Journal, batch_id: str) -> None:
+    """Remove a batch's (possibly half-copied) session groups and abort it."""
+    target_str, session_ids = journal.pending[batch_id]
+    target = Path(target_str)
+    removed = 0
+    if target.exists():
+        with h5py.File(target, "a") as dst:
+            sessions_group = dst.get("sessions")
+            for session_id in session_ids:
+                if sessions_group is not None and session_id in sessions_group:
+                    del sessions_group[session_id]
+                    removed += 1
+    journal.abort(batch_id)
+    logger.warning(
+        "CONSOLIDATION_BATCH_ROLLED_BACK",
+        batch=batch_id,
+        target=target_str,
+        removed=removed,
+    )
@@ -0,0 +1,307 @@
+"""Resident Document-Chunk Index for Knowledge Base Search.
+
+In-memory view over the `/documents/*/chunks/*/embedding` datasets of
+corpus.h5, so semantic search no longer walks the HDF5 tree per query.
+
+Layout:
+  matrix     float32[n_chunks, dim]  (L2-normalized rows, contiguous)
+  doc_rows   int32[n_chunks]         (row → position in doc_ids)
+  chunk_ids  int32[n_chunks]         (row → chunk_id inside its document)
+
+Access control is precomputed per document (owner + shared_with, and
+assigned personas) and expanded lazily into per-user / per-persona chunk
+bitmaps, cached until the next mutation. A query is then:
+
+  scores = matrix @ q̂  →  mask  →  argpartition(top_k)
+
+Text is NOT resident: the caller fetches chunk text only for winners.
+
+Philosophy:
+  - Pure numpy, no HDF5 access (the repository owns I/O and locking)
+  - Mutations are per-document (upsert / remove / ACL update)
+  - Not thread-safe on its own: callers hold `_doc_lock`
+
+Author: Bernard Uriza Orozco
+Created: 2026-10-18
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+import numpy as np
+from backend.utils.common.logging.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class IndexedDocument:
+    """One document's searchable rows plus the fields access control needs."""
+
+    doc_id: str
+    owner_user_id: str
+    shared_with: list[str]
+    assigned_personas: list[str]
+    chunk_ids: list[int]
+    embeddings: list[np.ndarray]
+
+
+@dataclass
+class _DocEntry:
+    """Per-document ACL and persona data kept alongside the matrix."""
+
+    owner_user_id: str
+    shared_with: frozenset[str] = field(default_factory=frozenset)
+    assigned_personas: frozenset[str] = field(default_factory=frozenset)
+
+
+class DocumentChunkIndex:
+    """Contiguous normalized embedding matrix with ACL/persona bitmaps."""
+
+    def __init__(self, dim: int | None = None) -> None:
+        self.dim = dim
+        self.matrix = np.zeros((0, dim or 0), dtype=np.float32)
+        self.doc_rows = np.zeros(0, dtype=np.int32)
+        self.chunk_ids = np.zeros(0, dtype=np.int32)
+        self.doc_ids: list[str] = []
+        self._doc_pos: dict[str, int] = {}
+        self._docs: list[_DocEntry | None] = []
+        self._user_masks: dict[str, np.ndarray] = {}
+        self._persona_masks: dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return int(self.matrix.shape[0])
+
+    def __contains__(self, doc_id: str) -> bool:
+        return doc_id in self._doc_pos
+
+    @classmethod
+    def build(cls, documents: Iterable[IndexedDocument]) -> DocumentChunkIndex:
+        """Cold-build from many documents with a single matrix allocation."""
+        index = cls()
+        blocks: list[np.ndarray] = []
+        doc_rows: list[np.ndarray] = []
+        chunk_ids: list[np.ndarray] = []
+
+        for doc in documents:
+            pos = index._ensure_doc(doc.doc_id)
+            index._docs[pos] = _DocEntry(
+                owner_user_id=doc.owner_user_id,
+                shared_with=frozenset(doc.shared_with),
+                assigned_personas=frozenset(doc.assigned_personas),
+            )
+            ids, block = index._prepare_rows(doc)
+            if block is not None:
+                blocks.append(block)
+                doc_rows.append(np.full(len(ids), pos, dtype=np.int32))
+                chunk_ids.append(np.asarray(ids, dtype=np.int32))
+
+        if blocks:
+            index.matrix = np.ascontiguousarray(np.vstack(blocks))
+            index.doc_rows = np.concatenate(doc_rows)
+            index.chunk_ids = np.concatenate(chunk_ids)
+        return index
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # MUTATIONS
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def upsert_document(self, doc: IndexedDocument) -> None:
+        """Replace all rows of a document with its current chunk embeddings."""
+        self._drop_rows(doc.doc_id)
+        pos = self._ensure_doc(doc.doc_id)
+        self._docs[pos] = _DocEntry(
+            owner_user_id=doc.owner_user_id,
+            shared_with=frozenset(doc.shared_with),
+            assigned_personas=frozenset(doc.assigned_personas),
+        )
+
+        ids, block = self._prepare_rows(doc)
+        if block is not None:
+            self.matrix = np.ascontiguousarray(np.vstack([self.matrix, block]))
+            self.doc_rows = np.concatenate(
+                [self.doc_rows, np.full(len(ids), pos, dtype=np.int32)]
+            )
+            self.chunk_ids = np.concatenate(
+                [self.chunk_ids, np.asarray(ids, dtype=np.int32)]
+            )
+
+        self._invalidate_masks()
+
+    def update_acl(
+        self,
+        doc_id: str,
+        owner_user_id: str,
+        shared_with: list[str],
+        assigned_personas: list[str],
+    ) -> None:
+        """Refresh ACL/persona data of an indexed document (rows untouched)."""
+        pos = self._doc_pos.get(doc_id)
+        if pos is None:
+            return
+        self._docs[pos] = _DocEntry(
+            owner_user_id=owner_user_id,
+            shared_with=frozenset(shared_with),
+            assigned_personas=frozenset(assigned_personas),
+        )
+        self._invalidate_masks()
+
+    def remove_document(self, doc_id: str) -> None:
+        """Drop a document and all its rows."""
+        pos = self._doc_pos.get(doc_id)
+        if pos is None:
+            return
+        self._drop_rows(doc_id)
+        self._docs[pos] = None
+        del self._doc_pos[doc_id]
+        self._invalidate_masks()
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # QUERY
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int,
+        user_id: str | None = None,
+        persona_filter: str | None = None,
+        doc_filter: str | None = None,
+    ) -> list[tuple[str, int, float]]:
+        """Masked matvec + top-k.
+
+        Returns:
+            List of (doc_id, chunk_id, cosine_similarity), best first
+        """
+        if top_k <= 0 or len(self) == 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        if query.shape[0] != self.dim:
+            logger.warning(
+                "DOCUMENT_INDEX_QUERY_DIM_MISMATCH",
+                expected_dim=self.dim,
+                query_dim=int(query.shape[0]),
+            )
+            return []
+        norm = float(np.linalg.norm(query))
+        if norm == 0.0:
+            return []
+
+        mask = self._mask_for(user_id, persona_filter, doc_filter)
+        if mask is not None:
+            candidates = np.flatnonzero(mask)
+            if candidates.size == 0:
+                return []
+            scores = self.matrix[candidates] @ (query / norm)
+        else:
+            candidates = None
+            scores = self.matrix @ (query / norm)
+
+        k = min(top_k, scores.shape[0])
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        rows = candidates[top] if candidates is not None else top
+
+        return [
+            (self.doc_ids[self.doc_rows[r]], int(self.chunk_ids[r]), float(scores[t]))
+            for r, t in zip(rows, top, strict=True)
+        ]
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # INTERNALS
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _ensure_doc(self, doc_id: str) -> int:
+        pos = self._doc_pos.get(doc_id)
+        if pos is None:
+            pos = len(self.doc_ids)
+            self.doc_ids.append(doc_id)
+            self._docs.append(None)
+            self._doc_pos[doc_id] = pos
+        return pos
+
+    def _prepare_rows(self, doc: IndexedDocument) -> tuple[list[int], np.ndarray | None]:
+        """Normalize a document's embeddings, skipping wrong-dimension rows."""
+        rows = [np.asarray(e, dtype=np.float32).ravel() for e in doc.embeddings]
+        if rows and self.dim is None:
+            self.dim = int(rows[0].shape[0])
+            self.matrix = np.zeros((0, self.dim), dtype=np.float32)
+
+        keep = [i for i, r in enumerate(rows) if r.shape[0] == self.dim]
+        if len(keep) != len(rows):
+            logger.warning(
+                "DOCUMENT_INDEX_DIM_MISMATCH",
+                doc_id=doc.doc_id,
+                expected_dim=self.dim,
+                skipped=len(rows) - len(keep),
+            )
+        if not keep:
+            return [], None
+        block = _normalize_rows(np.stack([rows[i] for i in keep]))
+        return [doc.chunk_ids[i] for i in keep], block
+
+    def _drop_rows(self, doc_id: str) -> None:
+        pos = self._doc_pos.get(doc_id)
+        if pos is None or len(self) == 0:
+            return
+        keep = self.doc_rows != pos
+        if keep.all():
+            return
+        self.matrix = np.ascontiguousarray(self.matrix[keep])
+        self.doc_rows = self.doc_rows[keep]
+        self.chunk_ids = self.chunk_ids[keep]
+
+    def _invalidate_masks(self) -> None:
+        self._user_masks.clear()
+        self._persona_masks.clear()
+
+    def _mask_for(
+        self,
+        user_id: str | None,
+        persona_filter: str | None,
+        doc_filter: str | None,
+    ) -> np.ndarray | None:
+        mask: np.ndarray | None = None
+
+        if user_id is not None:
+            mask = self._user_masks.get(user_id)
+            if mask is None:
+                allowed = np.fromiter(
+                    (
+                        d is not None and (d.owner_user_id == user_id or user_id in d.shared_with)
+                        for d in self._docs
+                    ),
+                    dtype=bool,
+                    count=len(self._docs),
+                )
+                mask = allowed[self.doc_rows]
+                self._user_masks[user_id] = mask
+
+        if persona_filter:
+            persona_mask = self._persona_masks.get(persona_filter)
+            if persona_mask is None:
+                allowed = np.fromiter(
+                    (d is not None and persona_filter in d.assigned_personas for d in self._docs),
+                    dtype=bool,
+                    count=len(self._docs),
+                )
+                persona_mask = allowed[self.doc_rows]
+                self._persona_masks[persona_filter] = persona_mask
+            mask = persona_mask if mask is None else mask & persona_mask
+
+        if doc_filter:
+            pos = self._doc_pos.get(doc_filter, -1)
+            doc_mask = self.doc_rows == pos
+            mask = doc_mask if mask is None else mask & doc_mask
+
+        return mask
+
+
+def _normalize_rows(block: np.ndarray) -> np.ndarray:
+    """L2-normalize rows; zero vectors stay zero (score 0, never NaN)."""
+    norms = np.linalg.norm(block, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return (block / norms).astype(np.float32, copy=False)
@@ -39,14 +39,29 @@ from typing import Any
 import h5py
 import numpy as np
 from backend.utils.common.logging.logger import get_logger
+from infrastructure.storage.infrastructure.hdf5.document_index import (
+    DocumentChunkIndex,
+    IndexedDocument,
+)
 from infrastructure.storage.infrastructure.hdf5.session_h5_manager import CORPUS_PATH
 from pathlib import Path
 
 logger = get_logger(__name__)
 
-# Lock for thread-safe HDF5 access
+# Lock for thread-safe HDF5 access (also guards _chunk_index)
 _doc_lock = threading.RLock()
 
+# Resident chunk index, built lazily on first search and kept in sync by
+# save_document_chunks / update_document_metadata / delete_document.
+_chunk_index: DocumentChunkIndex | None = None
+
+# Each API worker process has its own _chunk_index. Every write the index
+# mirrors bumps this attribute on /documents; a search whose index was built
+# at another generation rebuilds it, so ACL changes, uploads and deletes made
+# by one worker reach the others on their next search.
+INDEX_GENERATION_ATTR = "index_generation"
+_chunk_index_generation: int = -1
+
 # Chunk size for text splitting (in characters)
 CHUNK_SIZE = 512
 CHUNK_OVERLAP = 50
@@ -203,6 +218,26 @@ def _ensure_documents_group(f: h5py.File) -> h5py.Group:
     return f["documents"]  # type: ignore[return-value]
 
 
+def _index_generation(docs_group: h5py.Group) -> int:
+    return int(docs_group.attrs.get(INDEX_GENERATION_ATTR, 0))
+
+
+def _bump_index_generation(docs_group: h5py.Group) -> bool:
+    """Advance the index generation; True if the local index may apply the change.
+
+    Only an index that was current before this write is patched in place
+    (and moves to the new generation). Otherwise it is left stale and the
+    next search rebuilds it.
+    """
+    global _chunk_index_generation
+    generation = _index_generation(docs_group) + 1
+    docs_group.attrs[INDEX_GENERATION_ATTR] = generation
+    if _chunk_index is not None and _chunk_index_generation == generation - 1:
+        _chunk_index_generation = generation
+        return True
+    return False
+
+
 def _get_doc_type_from_filename(filename: str) -> DocumentType:
     """Infer document type from filename extension."""
     ext = Path(filename).suffix.lower()
@@ -476,8 +511,17 @@ def update_document_metadata(
 
         # Save updated metadata
         doc_group.attrs["metadata"] = json.dumps(metadata.to_dict())
+        patch_index = _bump_index_generation(docs_group)
         f.flush()
 
+        if patch_index:
+            _chunk_index.update_acl(
+                doc_id,
+                owner_user_id=metadata.owner_user_id,
+                shared_with=metadata.shared_with,
+                assigned_personas=metadata.assigned_personas,
+            )
+
         logger.info(
             "DOCUMENT_METADATA_UPDATED",
             doc_id=doc_id,
@@ -629,9 +673,23 @@ def save_document_chunks(doc_id: str, chunks: list[DocumentChunk]) -> bool:
         metadata = DocumentMetadata.from_dict(json.loads(metadata_json))
         metadata.chunks_count = len(chunks)
         doc_group.attrs["metadata"] = json.dumps(metadata.to_dict())
+        patch_index = _bump_index_generation(docs_group)
 
         f.flush()
 
+        if patch_index:
+            embedded = [c for c in chunks if c.embedding is not None]
+            _chunk_index.upsert_document(
+                IndexedDocument(
+                    doc_id=doc_id,
+                    owner_user_id=metadata.owner_user_id,
+                    shared_with=metadata.shared_with,
+                    assigned_personas=metadata.assigned_personas,
+                    chunk_ids=[c.chunk_id for c in embedded],
+                    embeddings=[c.embedding for c in embedded],  # type: ignore[misc]
+                )
+            )
+
         logger.info(
             "DOCUMENT_CHUNKS_SAVED",
             doc_id=doc_id,
@@ -662,8 +720,12 @@ def delete_document(doc_id: str) -> bool:
             return False
 
         del docs_group[doc_id]
+        patch_index = _bump_index_generation(docs_group)
         f.flush()
 
+        if patch_index:
+            _chunk_index.remove_document(doc_id)
+
         logger.info("DOCUMENT_DELETED", doc_id=doc_id)
 
         return True
@@ -681,6 +743,12 @@ def search_documents_by_embedding(
     SECURITY: If user_id is provided, only searches documents owned by that user
     or explicitly shared with them (HIPAA compliance).
 
+    Scoring runs against the resident chunk index (one masked matvec);
+    chunk text is read from HDF5 only for the top_k winners. The index is
+    rebuilt first if another worker changed /documents since it was built,
+    and every winner is re-checked against its HDF5 metadata (still present,
+    user still allowed, persona still assigned) before it is returned.
+
     Args:
         query_embedding: Query vector (same dimension as chunk embeddings)
         user_id: Auth0 user_id for access control (None = no filtering - admin mode)
@@ -691,67 +759,136 @@ def search_documents_by_embedding(
     Returns:
         List of (doc_id, chunk_id, similarity_score, chunk_text)
     """
+    global _chunk_index
     if not CORPUS_PATH.exists():
         return []
 
-    results = []
-
     with _doc_lock, h5py.File(CORPUS_PATH, "r") as f:
         if "documents" not in f:
             return []
-
         docs_group = f["documents"]
 
-        for doc_id in docs_group:
-            # Skip if doc_filter is set and doesn't match
-            if doc_filter and doc_id != doc_filter:
-                continue
-
-            doc_group = docs_group[doc_id]
-
-            # Load metadata for access control and persona filter
-            metadata_json = doc_group.attrs["metadata"]
-            metadata = DocumentMetadata.from_dict(json.loads(metadata_json))
+        results: list[tuple[str, int, float, str]] = []
+        for _attempt in range(2):
+            index = _get_chunk_index(docs_group)
+            hits = index.search(
+                query_embedding,
+                top_k=top_k,
+                user_id=user_id,
+                persona_filter=persona_filter,
+                doc_filter=doc_filter,
+            )
+            results, stale = _read_verified_hits(docs_group, hits, user_id, persona_filter)
+            if not stale:
+                break
+            # Changed without a generation bump (restore, manual repair): rebuild
+            logger.warning("DOCUMENT_INDEX_STALE", rejected_hits=stale)
+            _chunk_index = None
+
+    return results
+
+
+def _read_verified_hits(
+    docs_group: h5py.Group,
+    hits: list[tuple[str, int, float]],
+    user_id: str | None,
+    persona_filter: str | None,
+) -> tuple[list[tuple[str, int, float, str]], int]:
+    """Read chunk text for hits that HDF5 still allows; also count the rejected ones."""
+    results = []
+    rejected = 0
+    for doc_id, chunk_id, score in hits:
+        chunk_name = f"chunk_{chunk_id}"
+        if doc_id not in docs_group:
+            rejected += 1
+            continue
+        doc_group = docs_group[doc_id]
+        if "chunks" not in doc_group or chunk_name not in doc_group["chunks"]:
+            rejected += 1
+            continue
+        metadata = DocumentMetadata.from_dict(json.loads(doc_group.attrs["metadata"]))
+        if user_id is not None and not (
+            metadata.owner_user_id == user_id or user_id in metadata.shared_with
+        ):
+            rejected += 1
+            continue
+        if persona_filter and persona_filter not in metadata.assigned_personas:
+            rejected += 1
+            continue
+        chunk_text = doc_group["chunks"][chunk_name]["text"][()]
+        results.append((doc_id, chunk_id, score, chunk_text.decode("utf-8")))
+    return results, rejected
+
+
+def invalidate_document_index() -> None:
+    """Drop the resident chunk index (rebuilt from corpus.h5 on next search).
+
+    Searches already rebuild when another worker of this module changed
+    /documents; call this after changes made outside it (restore from
+    backup, manual repair) to avoid serving from the old index at all.
+    """
+    global _chunk_index, _chunk_index_generation
+    with _doc_lock:
+        _chunk_index = None
+        _chunk_index_generation = -1
 
-            # CRITICAL: User access control check (HIPAA isolation)
-            if user_id is not None:
-                # User must be owner OR explicitly shared with
-                is_owner = metadata.owner_user_id == user_id
-                is_shared = user_id in metadata.shared_with
-                if not (is_owner or is_shared):
-                    continue  # User doesn't have access - skip
 
-            # Check persona filter
-            if persona_filter:
-                if persona_filter not in metadata.assigned_personas:
-                    continue
+def _get_chunk_index(docs_group: h5py.Group) -> DocumentChunkIndex:
+    """Return the resident chunk index, (re)building it when not current.
 
-            # Check if indexed
-            if "chunks" not in doc_group:
-                continue
+    Caller must hold _doc_lock.
+    """
+    global _chunk_index, _chunk_index_generation
+    generation = _index_generation(docs_group)
+    if _chunk_index is None or _chunk_index_generation != generation:
+        _chunk_index = _build_chunk_index(docs_group)
+        _chunk_index_generation = generation
+    return _chunk_index
 
-            chunks_group = doc_group["chunks"]
 
-            for chunk_name in chunks_group:
-                chunk_group = chunks_group[chunk_name]
+def _build_chunk_index(docs_group: h5py.Group) -> DocumentChunkIndex:
+    """Load every chunk embedding of /documents into a fresh index."""
+    index = DocumentChunkIndex.build(_iter_indexed_documents(docs_group))
 
-                if "embedding" not in chunk_group:
-                    continue
+    logger.info(
+        "DOCUMENT_INDEX_BUILT",
+        documents=len(index.doc_ids),
+        chunks=len(index),
+        dim=index.dim,
+        generation=_index_generation(docs_group),
+    )
+    return index
 
-                chunk_embedding = chunk_group["embedding"][:]
-                chunk_text = chunk_group["text"][()].decode("utf-8")
-                chunk_id = int(chunk_name.split("_")[1])
 
-                # Cosine similarity
-                similarity = np.dot(query_embedding, chunk_embedding) / (
-                    np.linalg.norm(query_embedding) * np.linalg.norm(chunk_embedding)
-                )
+def _iter_indexed_documents(docs_group: h5py.Group):  # type: ignore[no-untyped-def]
+    """Yield IndexedDocument for every document that has embedded chunks."""
+    for doc_id in docs_group:
+        doc_group = docs_group[doc_id]
+        if "chunks" not in doc_group:
+            continue
+
+        chunks_group = doc_group["chunks"]
+        chunk_ids: list[int] = []
+        embeddings: list[np.ndarray] = []
+        for chunk_name in chunks_group:
+            chunk_group = chunks_group[chunk_name]
+            if "embedding" not in chunk_group:
+                continue
+            chunk_ids.append(int(chunk_name.split("_")[1]))
+            embeddings.append(chunk_group["embedding"][:])
 
-                results.append((doc_id, chunk_id, float(similarity), chunk_text))
+        if not chunk_ids:
+            continue
 
-    # Sort by similarity (descending) and return top_k
-    results.sort(key=lambda x: x[2], reverse=True)
-    return results[:top_k]
+        metadata = DocumentMetadata.from_dict(json.loads(doc_group.attrs["metadata"]))
+        yield IndexedDocument(
+            doc_id=doc_id,
+            owner_user_id=metadata.owner_user_id,
+            shared_with=metadata.shared_with,
+            assigned_personas=metadata.assigned_personas,
+            chunk_ids=chunk_ids,
+            embeddings=embeddings,
+        )
 
 
 # =============================================================================
@@ -25,6 +25,8 @@ Pattern: Session-Isolated Storage
 
 from __future__ import annotations
 
+from typing import Any
+
 import h5py
 from backend.utils.common.logging.logger import get_logger
 from pathlib import Path
@@ -35,6 +37,7 @@ logger = get_logger(__name__)
 STORAGE_DIR = Path(__file__).parent.parent.parent / "storage"
 CORPUS_PATH = STORAGE_DIR / "corpus.h5"
 SESSIONS_DIR = STORAGE_DIR / "sessions"
+SEGMENTS_DIR = STORAGE_DIR / "corpus_segments"
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -208,59 +211,48 @@ def consolidate_session_to_corpus(session_id: str, delete_after: bool = True) ->
         return False
 
 
-def consolidate_all_sessions(max_sessions: int | None = None) -> dict[str, int]:
-    """Consolidate all session files into corpus.h5.
+def consolidate_all_sessions(
+    max_sessions: int | None = None,
+    workers: int | None = None,
+    segment: bool = False,
+) -> dict[str, Any]:
+    """Consolidate all session files into corpus.h5 (or a new segment).
+
+    Delegates to the parallel, journaled engine in consolidation.py:
+    worker processes validate session files, one writer copies them in
+    batches per target open, and an interrupted run resumes exactly once.
 
     Args:
         max_sessions: Maximum number of sessions to consolidate (None = all)
+        workers: Validation processes (None = cpu count, 0 = inline)
+        segment: Write a new consolidated segment file instead of corpus.h5
 
     Returns:
         Dict with consolidation stats:
             - success: Number of successfully consolidated sessions
             - failed: Number of failed consolidations
-            - skipped: Number of skipped sessions
+            - skipped: Number of skipped sessions (already in target)
+            - resumed: Sessions finished from a previous interrupted run
+            - sessions_per_minute: Throughput of this run
 
     Example:
         >>> stats = consolidate_all_sessions(max_sessions=10)
         >>> print(f"Consolidated {stats['success']} sessions")
     """
-    stats = {"success": 0, "failed": 0, "skipped": 0}
-
-    if not SESSIONS_DIR.exists():
-        logger.warning("SESSIONS_DIR_NOT_FOUND", path=str(SESSIONS_DIR))
-        return stats
-
-    session_files = list(SESSIONS_DIR.glob("*.h5"))
-    if max_sessions:
-        session_files = session_files[:max_sessions]
+    from infrastructure.storage.infrastructure.hdf5.consolidation import consolidate_sessions
 
-    logger.info(
-        "CONSOLIDATION_BATCH_START",
-        total_sessions=len(session_files),
+    return consolidate_sessions(
         max_sessions=max_sessions,
-    )
-
-    for session_path in session_files:
-        session_id = session_path.stem  # Remove .h5 extension
-        try:
-            if consolidate_session_to_corpus(session_id, delete_after=True):
-                stats["success"] += 1
-            else:
-                stats["failed"] += 1
-        except Exception as e:
-            logger.error(
-                "CONSOLIDATION_BATCH_ERROR",
-                session_id=session_id,
-                error=str(e),
-            )
-            stats["failed"] += 1
+        workers=workers,
+        segment=segment,
+    ).to_dict()
 
-    logger.info(
-        "CONSOLIDATION_BATCH_COMPLETE",
-        **stats,
-    )
 
-    return stats
+def list_segment_files() -> list[Path]:
+    """List consolidated segment files, newest first."""
+    if not SEGMENTS_DIR.exists():
+        return []
+    return sorted(SEGMENTS_DIR.glob("segment-*.h5"), reverse=True)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -271,7 +263,8 @@ def consolidate_all_sessions(max_sessions: int | None = None) -> dict[str, int]:
 def get_h5_file_for_session(session_id: str, mode: str = "r") -> tuple[h5py.File, str]:
     """Get HDF5 file handle for session (session-level or corpus).
 
-    Tries session-level file first, falls back to corpus.h5 for legacy sessions.
+    Tries session-level file first, falls back to corpus.h5 for legacy sessions
+    and then to consolidated segment files.
 
     Args:
         session_id: Session identifier
@@ -281,7 +274,7 @@ def get_h5_file_for_session(session_id: str, mode: str = "r") -> tuple[h5py.File
         Tuple of (h5py.File handle, source: 'session' | 'corpus')
 
     Raises:
-        FileNotFoundError: If session not found in either location
+        FileNotFoundError: If session not found in any location
 
     Example:
         >>> f, source = get_h5_file_for_session("abc-123", mode="r")
@@ -294,13 +287,14 @@ def get_h5_file_for_session(session_id: str, mode: str = "r") -> tuple[h5py.File
         logger.debug("SESSION_READ_FROM_SESSION_FILE", session_id=session_id)
         return h5py.File(session_path, mode), "session"
 
-    # Fallback to corpus.h5 (legacy sessions)
-    if CORPUS_PATH.exists():
-        with h5py.File(CORPUS_PATH, "r") as f:
-            if f"/sessions/{session_id}" in f:
-                logger.debug("SESSION_READ_FROM_CORPUS", session_id=session_id)
-                # Reopen in requested mode
-                return h5py.File(CORPUS_PATH, mode), "corpus"
+    # Fallback to corpus.h5 (legacy sessions), then consolidated segments
+    for path in [CORPUS_PATH, *list_segment_files()]:
+        if path.exists():
+            with h5py.File(path, "r") as f:
+                if f"/sessions/{session_id}" in f:
+                    logger.debug("SESSION_READ_FROM_CORPUS", session_id=session_id, path=str(path))
+                    # Reopen in requested mode
+                    return h5py.File(path, mode), "corpus"
 
     raise FileNotFoundError(f"Session {session_id} not found in session files or corpus.h5")
 
@@ -322,12 +316,13 @@ def list_all_sessions() -> list[str]:
         for path in SESSIONS_DIR.glob("*.h5"):
             session_ids.add(path.stem)
 
-    # Get sessions from corpus
-    if CORPUS_PATH.exists():
-        with h5py.File(CORPUS_PATH, "r") as f:
-            if "/sessions" in f:
-                for session_id in f["/sessions"]:
-                    session_ids.add(session_id)
+    # Get sessions from corpus and consolidated segments
+    for path in [CORPUS_PATH, *list_segment_files()]:
+        if path.exists():
+            with h5py.File(path, "r") as f:
+                if "/sessions" in f:
+                    for session_id in f["/sessions"]:
+                        session_ids.add(session_id)
 
     return sorted(session_ids)
 
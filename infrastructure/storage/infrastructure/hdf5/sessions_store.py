@@ -13,6 +13,12 @@ Created: 2025-10-29
 Storage format:
 - data/sessions/manifest.jsonl (1 line per session, append-only)
 - data/sessions/index.json (id -> file offset mapping for fast lookups)
+- data/sessions/snapshot.json (compacted latest-version view, periodic)
+
+Reads (get/list/count) are served from an in-memory materialized view that
+is tailed incrementally from the manifest's last consumed byte offset, with
+secondary indexes by owner_hash and created_at. Cold start loads the
+snapshot and replays only the manifest tail written after it.
 
 Session schema:
 {
@@ -28,8 +34,10 @@ Session schema:
 }
 """
 
+import bisect
 import json
 import random
+import threading
 
 # Cross-platform file locking (works on Unix + Windows)
 try:
@@ -50,7 +58,7 @@ except ImportError:
 
 # ULID generation (simple implementation)
 import time
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, replace
 from datetime import UTC, datetime
 
 import os
@@ -93,6 +101,73 @@ class Session:
         return Session(**data)
 
 
+# ============================================================================
+# MATERIALIZED VIEW
+# ============================================================================
+
+# Tailed manifest lines between automatic compacted snapshots
+SNAPSHOT_EVERY_LINES = 50_000
+
+# Tails longer than this are applied unsorted and sorted once at the end
+_BULK_APPLY_LINES = 1_000
+
+# Sort key: created_at asc, then first-appearance order (negated so that a
+# reversed walk yields newest first and, on ties, earliest-seen first —
+# identical to the stable sort(reverse=True) of the full-replay listing).
+_SortKey = tuple[str, int, str]
+
+
+class _SessionsView:
+    """Latest version per session plus created_at / owner_hash indexes."""
+
+    def __init__(self) -> None:
+        self.sessions: dict[str, Session] = {}
+        self.by_created: list[_SortKey] = []
+        self.by_owner: dict[str, list[_SortKey]] = {}
+        self.manifest_offset = 0
+        self.manifest_inode: int | None = None
+        self.lines_since_snapshot = 0
+        self._seq = 0
+
+    def apply(self, data: dict, bulk: bool = False) -> None:
+        """Apply one manifest entry (later entries override earlier ones).
+
+        With bulk=True new keys are appended unsorted; call finish_bulk()
+        once afterwards (one sort instead of one insort per session).
+        """
+        session = Session.from_dict(data)
+        if session.id not in self.sessions:
+            key = (session.created_at, -self._seq, session.id)
+            self._seq += 1
+            owner_keys = self.by_owner.setdefault(session.owner_hash, [])
+            if bulk:
+                self.by_created.append(key)
+                owner_keys.append(key)
+            else:
+                bisect.insort(self.by_created, key)
+                bisect.insort(owner_keys, key)
+        self.sessions[session.id] = session
+
+    def finish_bulk(self) -> None:
+        self.by_created.sort()
+        for owner_keys in self.by_owner.values():
+            owner_keys.sort()
+
+    def page(self, limit: int, offset: int, owner_hash: str | None) -> list[Session]:
+        """Newest-first page, O(limit) after the index lookup."""
+        keys = self.by_owner.get(owner_hash, []) if owner_hash else self.by_created
+        end = len(keys) - offset
+        if end <= 0 or limit <= 0:
+            return []
+        start = max(0, end - limit)
+        return [replace(self.sessions[key[2]]) for key in reversed(keys[start:end])]
+
+    def count(self, owner_hash: str | None) -> int:
+        if owner_hash:
+            return len(self.by_owner.get(owner_hash, []))
+        return len(self.sessions)
+
+
 # ============================================================================
 # SESSIONS STORE
 # ============================================================================
@@ -112,6 +187,7 @@ class SessionsStore:
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.manifest_path = self.data_dir / "manifest.jsonl"
         self.index_path = self.data_dir / "index.json"
+        self.snapshot_path = self.data_dir / "snapshot.json"
 
         # Initialize files if they don't exist
         if not self.manifest_path.exists():
@@ -119,6 +195,112 @@ class SessionsStore:
         if not self.index_path.exists():
             self._write_index({})
 
+        # Materialized view (loaded lazily on first read, then tailed)
+        self._view: _SessionsView | None = None
+        self._view_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Materialized view maintenance
+    # ------------------------------------------------------------------
+
+    def _refresh(self) -> _SessionsView:
+        """Bring the view up to date with the manifest and return it."""
+        with self._view_lock:
+            stat = self.manifest_path.stat()
+            view = self._view
+            if (
+                view is None
+                or view.manifest_inode != stat.st_ino
+                or stat.st_size < view.manifest_offset
+            ):
+                # Cold start, or the manifest was replaced/truncated
+                view = self._load_snapshot(stat.st_ino, stat.st_size) or _SessionsView()
+                view.manifest_inode = stat.st_ino
+                self._view = view
+
+            if stat.st_size > view.manifest_offset:
+                self._tail_manifest(view)
+
+            if view.lines_since_snapshot >= SNAPSHOT_EVERY_LINES:
+                self._write_snapshot(view)
+
+            return view
+
+    def _tail_manifest(self, view: _SessionsView) -> None:
+        """Apply complete lines appended since view.manifest_offset."""
+        with open(self.manifest_path, "rb") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+            try:
+                f.seek(view.manifest_offset)
+                chunk = f.read()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+        # Only consume up to the last newline (a writer may be mid-line)
+        end = chunk.rfind(b"\n") + 1
+        lines = chunk[:end].decode("utf-8").splitlines()
+        bulk = len(lines) > _BULK_APPLY_LINES
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            view.apply(json.loads(line), bulk=bulk)
+            view.lines_since_snapshot += 1
+        if bulk:
+            view.finish_bulk()
+        view.manifest_offset += end
+
+    def _load_snapshot(self, inode: int, manifest_size: int) -> _SessionsView | None:
+        """Load the compacted snapshot if it still describes this manifest."""
+        if not self.snapshot_path.exists():
+            return None
+
+        with open(self.snapshot_path) as f:
+            snapshot = json.load(f)
+        if (
+            snapshot.get("manifest_inode") != inode
+            or snapshot.get("manifest_offset", -1) > manifest_size
+        ):
+            return None
+
+        view = _SessionsView()
+        for data in snapshot["sessions"]:
+            view.apply(data, bulk=True)
+        view.finish_bulk()
+        view.manifest_offset = snapshot["manifest_offset"]
+        return view
+
+    def _write_snapshot(self, view: _SessionsView) -> None:
+        """Atomically write the compacted view (latest version per session).
+
+        Sessions are written in first-appearance order so a reload reproduces
+        the same tie-breaking as a full manifest replay.
+        """
+        snapshot = {
+            "manifest_offset": view.manifest_offset,
+            "manifest_inode": view.manifest_inode,
+            # Session fields are flat primitives: vars() == asdict(), much cheaper
+            "sessions": [vars(session) for session in view.sessions.values()],
+        }
+        tmp_path = self.snapshot_path.with_suffix(f".json.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(json.dumps(snapshot))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+        view.lines_since_snapshot = 0
+
+    def compact(self) -> int:
+        """Write a compacted snapshot now.
+
+        Returns:
+            Number of sessions in the snapshot
+        """
+        view = self._refresh()
+        with self._view_lock:
+            self._write_snapshot(view)
+            return len(view.sessions)
+
     def _read_index(self) -> dict[str, int]:
         """Read index with file lock"""
         if not self.index_path.exists():
@@ -203,23 +385,8 @@ class SessionsStore:
         Returns:
             Session instance or None if not found
         """
-        index = self._read_index()
-        offset = index.get(session_id)
-
-        if offset is None:
-            return None
-
-        with open(self.manifest_path) as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-            try:
-                f.seek(offset)
-                line = f.readline().strip()
-                if not line:
-                    return None
-                data = json.loads(line)
-                return Session.from_dict(data)
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        session = self._refresh().sessions.get(session_id)
+        return replace(session) if session else None
 
     def list(
         self,
@@ -238,34 +405,7 @@ class SessionsStore:
         Returns:
             List of Session instances (deduplicated, latest version per ID)
         """
-        sessions_by_id: dict[str, Session] = {}
-
-        with open(self.manifest_path) as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-            try:
-                # Read all lines and keep latest version per ID
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    data = json.loads(line)
-                    session = Session.from_dict(data)
-
-                    # Filter by owner_hash if provided
-                    if owner_hash and session.owner_hash != owner_hash:
-                        continue
-
-                    # Keep latest version (append-only: later lines override)
-                    sessions_by_id[session.id] = session
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-        # Convert to list and sort by created_at descending (newest first)
-        sessions = list(sessions_by_id.values())
-        sessions.sort(key=lambda s: s.created_at, reverse=True)
-
-        # Apply pagination
-        return sessions[offset : offset + limit]
+        return self._refresh().page(limit, offset, owner_hash)
 
     def update(
         self,
@@ -337,34 +477,4 @@ class SessionsStore:
         Returns:
             Total count of sessions
         """
-        count = 0
-
-        with open(self.manifest_path) as f:
-            fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-            try:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    if owner_hash:
-                        data = json.loads(line)
-                        if data.get("owner_hash") == owner_hash:
-                            count += 1
-                    else:
-                        count += 1
-            finally:
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-
-        # Subtract duplicates (updates create new entries)
-        # Use index to get unique count
-        index = self._read_index()
-        if owner_hash:
-            # Need to count owner_hash in unique sessions
-            unique_sessions = set()
-            for session_id in index:
-                session = self.get(session_id)
-                if session and session.owner_hash == owner_hash:
-                    unique_sessions.add(session_id)
-            return len(unique_sessions)
-        else:
-            return len(index)
+        return self._refresh().count(owner_hash)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import json
+
+import h5py
+import numpy as np
+import pytest
+from infrastructure.storage.infrastructure.hdf5 import consolidation
+from infrastructure.storage.infrastructure.hdf5.consolidation import consolidate_sessions
+from pathlib import Path
+
+
+def _make_session(sessions_dir: Path, session_id: str) -> Path:
+    sessions_dir.mkdir(parents=True, exist_ok=True)
+    path = sessions_dir / f"{session_id}.h5"
+    with h5py.File(path, "w") as f:
+        group = f.create_group(f"/sessions/{session_id}")
+        group.attrs["session_id"] = session_id
+        group.create_dataset("chunks/chunk_0/audio", data=np.arange(64, dtype=np.int16))
+    return path
+
+
+@pytest.fixture
+def dirs(tmp_path: Path) -> dict[str, Path]:
+    return {
+        "sessions_dir": tmp_path / "sessions",
+        "corpus_path": tmp_path / "corpus.h5",
+        "segments_dir": tmp_path / "corpus_segments",
+    }
+
+
+def _corpus_sessions(path: Path) -> list[str]:
+    with h5py.File(path, "r") as f:
+        return sorted(f["sessions"])
+
+
+@pytest.mark.parametrize(("workers", "deep"), [(0, False), (2, True)])
+def test_consolidates_in_batches_and_deletes_sources(dirs, workers, deep):
+    ids = [f"s{i:03d}" for i in range(7)]
+    for session_id in ids:
+        _make_session(dirs["sessions_dir"], session_id)
+
+    stats = consolidate_sessions(workers=workers, batch_size=3, deep_validate=deep, **dirs)
+
+    assert (stats.success, stats.failed, stats.batches) == (7, 0, 3)
+    assert _corpus_sessions(dirs["corpus_path"]) == ids
+    assert list(dirs["sessions_dir"].glob("*.h5")) == []
+    with h5py.File(dirs["corpus_path"], "r") as f:
+        assert f["sessions/s003/chunks/chunk_0/audio"][:].sum() == np.arange(64).sum()
+
+
+def test_invalid_and_conflicting_sessions_are_not_copied(dirs):
+    _make_session(dirs["sessions_dir"], "good")
+    (dirs["sessions_dir"] / "broken.h5").write_bytes(b"not an hdf5 file")
+    _make_session(dirs["sessions_dir"], "dup")
+    with h5py.File(dirs["corpus_path"], "w") as f:
+        f.create_group("sessions/dup").attrs["legacy"] = True
+
+    stats = consolidate_sessions(workers=0, **dirs)
+
+    assert (stats.success, stats.failed, stats.skipped) == (1, 1, 1)
+    with h5py.File(dirs["corpus_path"], "r") as f:
+        assert f["sessions/dup"].attrs["legacy"]
+    assert (dirs["sessions_dir"] / "broken.h5").exists()
+    assert (dirs["sessions_dir"] / "dup.h5").exists()
+
+
+def test_segment_mode_leaves_corpus_untouched(dirs):
+    for session_id in ("a", "b"):
+        _make_session(dirs["sessions_dir"], session_id)
+
+    stats = consolidate_sessions(workers=0, segment=True, **dirs)
+
+    assert not dirs["corpus_path"].exists()
+    (segment,) = dirs["segments_dir"].glob("segment-*.h5")
+    assert stats.target == str(segment)
+    assert _corpus_sessions(segment) == ["a", "b"]
+
+
+def test_resume_rolls_back_uncommitted_batch_and_skips_committed(dirs):
+    journal = dirs["corpus_path"].with_name("consolidation.journal.jsonl")
+    for session_id in ("done", "half", "fresh"):
+        _make_session(dirs["sessions_dir"], session_id)
+
+    # Simulate a crash: "done" committed but its file not yet deleted,
+    # "half" begun and partially copied, never committed.
+    with h5py.File(dirs["corpus_path"], "w") as f:
+        f.create_group("sessions/done").attrs["original"] = True
+        f.create_group("sessions/half/partial")
+    journal.write_text(
+        "\n".join(
+            json.dumps(e)
+            for e in [
+                {"op": "begin", "batch": "b1", "target": str(dirs["corpus_path"]), "sessions": ["done"]},
+                {"op": "commit", "batch": "b1"},
+                {"op": "begin", "batch": "b2", "target": str(dirs["corpus_path"]), "sessions": ["half"]},
+            ]
+        )
+        + "\n"
+    )
+
+    stats = consolidate_sessions(workers=0, **dirs)
+
+    assert (stats.success, stats.resumed, stats.skipped, stats.failed) == (2, 1, 0, 0)
+    assert _corpus_sessions(dirs["corpus_path"]) == ["done", "fresh", "half"]
+    with h5py.File(dirs["corpus_path"], "r") as f:
+        assert f["sessions/done"].attrs["original"]  # never recopied
+        assert "partial" not in f["sessions/half"]
+        assert "chunks" in f["sessions/half"]
+    assert list(dirs["sessions_dir"].glob("*.h5")) == []
+
+    # A second run is a no-op
+    again = consolidate_sessions(workers=0, **dirs)
+    assert (again.success, again.resumed, again.failed) == (0, 0, 0)
+    assert not journal.exists()  # nothing pending: truncated after the run
+
+
+def test_segment_mode_skips_sessions_already_consolidated(dirs):
+    for session_id in ("a", "b"):
+        _make_session(dirs["sessions_dir"], session_id)
+    first = consolidate_sessions(workers=0, segment=True, delete_after=False, **dirs)
+    assert first.success == 2
+
+    # Sources kept, plus one already in the corpus and one new session
+    _make_session(dirs["sessions_dir"], "c")
+    _make_session(dirs["sessions_dir"], "legacy")
+    with h5py.File(dirs["corpus_path"], "w") as f:
+        f.create_group("sessions/legacy")
+
+    second = consolidate_sessions(workers=0, segment=True, delete_after=False, **dirs)
+
+    assert (second.success, second.skipped) == (1, 3)
+    assert _corpus_sessions(Path(second.target)) == ["c"]
+    segments = sorted(dirs["segments_dir"].glob("segment-*.h5"))
+    assert sorted(s for seg in segments for s in _corpus_sessions(seg)) == ["a", "b", "c"]
+
+
+def test_journal_is_kept_while_a_batch_is_pending(dirs, monkeypatch):
+    journal = dirs["corpus_path"].with_name("consolidation.journal.jsonl")
+    _make_session(dirs["sessions_dir"], "a")
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    # Copy fails, and so does the rollback: the batch stays pending
+    monkeypatch.setattr(h5py.Group, "copy", fail)
+    monkeypatch.setattr(consolidation, "_rollback_batch", fail)
+
+    stats = consolidate_sessions(workers=0, **dirs)
+
+    assert stats.failed == 1
+    entries = [json.loads(line) for line in journal.read_text().splitlines()]
+    assert [e["op"] for e in entries] == ["begin"]  # the next run rolls it back
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+
+import numpy as np
+import pytest
+from infrastructure.storage.infrastructure.hdf5 import document_repository as repo
+from infrastructure.storage.infrastructure.hdf5.document_index import (
+    DocumentChunkIndex,
+    IndexedDocument,
+)
+from pathlib import Path
+
+DIM = 8
+
+
+@pytest.fixture
+def corpus(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    path = tmp_path / "corpus.h5"
+    monkeypatch.setattr(repo, "CORPUS_PATH", path)
+    repo.invalidate_document_index()
+    yield path
+    repo.invalidate_document_index()
+
+
+def _add_doc(owner: str, embeddings: list[np.ndarray], personas: list[str] | None = None) -> str:
+    meta = repo.create_document(
+        b"content", "doc.txt", uploaded_by=owner, assigned_personas=personas or []
+    )
+    chunks = [
+        repo.DocumentChunk(chunk_id=i, text=f"{meta.doc_id}:{i}", embedding=e)
+        for i, e in enumerate(embeddings)
+    ]
+    repo.save_document_chunks(meta.doc_id, chunks)
+    return meta.doc_id
+
+
+def _brute_force(query, docs, user_id=None, persona=None):
+    """Reference scoring: the pre-index per-chunk cosine loop."""
+    results = []
+    for doc_id, owner, personas, embeddings in docs:
+        if user_id is not None and owner != user_id:
+            continue
+        if persona and persona not in personas:
+            continue
+        for i, e in enumerate(embeddings):
+            sim = float(np.dot(query, e) / (np.linalg.norm(query) * np.linalg.norm(e)))
+            results.append((doc_id, i, sim))
+    results.sort(key=lambda x: x[2], reverse=True)
+    return results
+
+
+def test_search_matches_brute_force_with_acl_and_persona(corpus: Path):
+    rng = np.random.default_rng(7)
+    docs = []
+    for owner, personas in [("alice", ["general"]), ("bob", ["soap"]), ("alice", ["soap"])]:
+        embeddings = [rng.normal(size=DIM).astype(np.float32) for _ in range(5)]
+        doc_id = _add_doc(owner, embeddings, personas)
+        docs.append((doc_id, owner, personas, embeddings))
+
+    query = rng.normal(size=DIM).astype(np.float32)
+    for user_id, persona in [(None, None), ("alice", None), ("bob", None), ("alice", "soap")]:
+        expected = _brute_force(query, docs, user_id, persona)[:4]
+        got = repo.search_documents_by_embedding(
+            query, user_id=user_id, top_k=4, persona_filter=persona
+        )
+        assert [(d, c) for d, c, _, _ in got] == [(d, c) for d, c, _ in expected]
+        assert [s for _, _, s, _ in got] == pytest.approx([s for _, _, s in expected], abs=1e-5)
+        assert all(text == f"{d}:{c}" for d, c, _, text in got)
+
+
+def test_index_stays_in_sync_with_writes(corpus: Path):
+    target = np.eye(DIM, dtype=np.float32)[0]
+    doc_id = _add_doc("alice", [target, np.eye(DIM, dtype=np.float32)[1]])
+
+    # Build the index, then mutate through the repository.
+    assert repo.search_documents_by_embedding(target, user_id="alice", top_k=1)[0][0] == doc_id
+
+    other = _add_doc("alice", [target * 2])
+    hits = repo.search_documents_by_embedding(target, user_id="alice", top_k=3)
+    assert {h[0] for h in hits} == {doc_id, other}
+
+    repo.update_document_metadata(doc_id, assigned_personas=["soap"])
+    hits = repo.search_documents_by_embedding(target, top_k=3, persona_filter="soap")
+    assert {h[0] for h in hits} == {doc_id}
+
+    repo.delete_document(other)
+    hits = repo.search_documents_by_embedding(target, user_id="alice", top_k=3)
+    assert {h[0] for h in hits} == {doc_id}
+    assert repo.search_documents_by_embedding(target, user_id="mallory", top_k=3) == []
+
+
+def test_doc_filter_and_zero_vectors():
+    index = DocumentChunkIndex.build(
+        [
+            IndexedDocument("a", "u1", ["u2"], [], [0, 1], [np.ones(4), np.zeros(4)]),
+            IndexedDocument("b", "u2", [], [], [0], [np.ones(4)]),
+        ]
+    )
+    hits = index.search(np.ones(4), top_k=5, user_id="u2", doc_filter="a")
+    assert [(d, c) for d, c, _ in hits] == [("a", 0), ("a", 1)]
+    assert hits[1][2] == 0.0
+    assert index.search(np.ones(4), top_k=5, doc_filter="missing") == []
+
+
+def test_writes_from_another_worker_reach_this_index(corpus: Path):
+    target = np.eye(DIM, dtype=np.float32)[0]
+    doc_id = _add_doc("alice", [target])
+    other = _add_doc("alice", [target * 2])
+    assert len(repo.search_documents_by_embedding(target, user_id="alice", top_k=3)) == 2
+
+    # Another worker process: its own (here: no) resident index, same corpus.h5
+    ours = repo._chunk_index, repo._chunk_index_generation
+    repo._chunk_index, repo._chunk_index_generation = None, -1
+    repo.delete_document(other)
+    repo.update_document_metadata(doc_id, assigned_personas=["soap"])
+    repo._chunk_index, repo._chunk_index_generation = ours
+
+    hits = repo.search_documents_by_embedding(target, user_id="alice", top_k=3)
+    assert [h[0] for h in hits] == [doc_id]
+    assert repo.search_documents_by_embedding(target, top_k=3, persona_filter="soap")
+
+
+def test_hits_are_rechecked_against_hdf5(corpus: Path):
+    import h5py
+
+    target = np.eye(DIM, dtype=np.float32)[0]
+    doc_id = _add_doc("alice", [target])
+    assert repo.search_documents_by_embedding(target, user_id="alice", top_k=1)
+
+    # Access revoked outside the repository (no generation bump)
+    with h5py.File(corpus, "a") as f:
+        group = f["documents"][doc_id]
+        meta = json.loads(group.attrs["metadata"])
+        meta["owner_user_id"] = "bob"
+        group.attrs["metadata"] = json.dumps(meta)
+
+    assert repo.search_documents_by_embedding(target, user_id="alice", top_k=1) == []
+    assert repo.search_documents_by_embedding(target, user_id="bob", top_k=1)[0][0] == doc_id
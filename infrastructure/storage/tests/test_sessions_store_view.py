@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+
+from infrastructure.storage.infrastructure.hdf5 import sessions_store
+from infrastructure.storage.infrastructure.hdf5.sessions_store import Session, SessionsStore
+from pathlib import Path
+
+
+def _replay(manifest: Path, owner_hash: str | None = None) -> list[Session]:
+    """Reference listing: full manifest replay (the pre-view algorithm)."""
+    by_id: dict[str, Session] = {}
+    for line in manifest.read_text().splitlines():
+        if line.strip():
+            session = Session.from_dict(json.loads(line))
+            if owner_hash and session.owner_hash != owner_hash:
+                continue
+            by_id[session.id] = session
+    sessions = list(by_id.values())
+    sessions.sort(key=lambda s: s.created_at, reverse=True)
+    return sessions
+
+
+def _append(manifest: Path, **overrides) -> None:
+    data = {
+        "id": "X",
+        "created_at": "2025-01-01T00:00:00+00:00Z",
+        "updated_at": "2025-01-01T00:00:00+00:00Z",
+        "last_active": "2025-01-01T00:00:00+00:00Z",
+        "interaction_count": 0,
+        "status": "new",
+        "is_persisted": True,
+        "owner_hash": "sha256:a",
+        "thread_id": None,
+    } | overrides
+    with open(manifest, "a") as f:
+        f.write(json.dumps(data) + "\n")
+
+
+def test_list_count_get_match_full_replay(tmp_path: Path):
+    store = SessionsStore(str(tmp_path))
+    created = [store.create(owner_hash=f"sha256:{i % 3}") for i in range(12)]
+    store.update(created[4].id, status="complete", interaction_count=3)
+    # Ties on created_at must keep first-appearance order
+    _append(store.manifest_path, id="TIE1", created_at=created[-1].created_at)
+    _append(store.manifest_path, id="TIE2", created_at=created[-1].created_at)
+
+    for owner in (None, "sha256:0", "sha256:1"):
+        expected = _replay(store.manifest_path, owner)
+        assert store.list(limit=100, owner_hash=owner) == expected
+        assert store.list(limit=3, offset=2, owner_hash=owner) == expected[2:5]
+        assert store.count(owner) == len(expected)
+
+    assert store.get(created[4].id).status == "complete"
+    assert store.get("missing") is None
+
+
+def test_view_tails_appends_from_other_writers(tmp_path: Path):
+    store = SessionsStore(str(tmp_path))
+    store.create(owner_hash="sha256:a")
+    assert store.count() == 1
+
+    other = SessionsStore(str(tmp_path))
+    session = other.create(owner_hash="sha256:b")
+    other.update(session.id, status="active")
+    # Partial line (writer mid-append) is not consumed yet
+    with open(store.manifest_path, "a") as f:
+        f.write('{"id": "partial"')
+
+    assert store.count() == 2
+    assert store.get(session.id).status == "active"
+    assert store.list(owner_hash="sha256:b")[0].id == session.id
+
+
+def test_snapshot_cold_start_replays_only_tail(tmp_path: Path, monkeypatch):
+    store = SessionsStore(str(tmp_path))
+    for i in range(5):
+        store.create(owner_hash=f"sha256:{i % 2}")
+    assert store.compact() == 5
+    store.create(owner_hash="sha256:1")
+
+    applied: list[str] = []
+    original = sessions_store._SessionsView.apply
+
+    def counting_apply(self, data, bulk=False):
+        applied.append(data["id"])
+        return original(self, data, bulk)
+
+    monkeypatch.setattr(sessions_store._SessionsView, "apply", counting_apply)
+    cold = SessionsStore(str(tmp_path))
+    assert cold.list(limit=100) == _replay(store.manifest_path)
+    # 5 from the snapshot + 1 tailed manifest line (not all 6 manifest lines + 5)
+    assert len(applied) == 6
+
+
+def test_snapshot_ignored_when_manifest_replaced(tmp_path: Path):
+    store = SessionsStore(str(tmp_path))
+    store.create(owner_hash="sha256:a")
+    store.compact()
+
+    store.manifest_path.unlink()
+    store.manifest_path.touch()
+    assert SessionsStore(str(tmp_path)).count() == 0